@@ -23,7 +23,6 @@ using namespace Dive::cli;  // NOLINT
 int main(int argc, char** argv)
 {
     Dive::cli::Init();
-    Pm4InfoInit();
 
     std::map<std::string, const Command*> commands;
     std::vector<const Command*> commandlist = {
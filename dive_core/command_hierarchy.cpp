@@ -36,6 +36,34 @@
 namespace Dive
 {
 
+namespace
+{
+
+// The gfxr nodes of a single vulkan command, which have an AuxInfo::GfxrCommandNode
+bool IsGfxrCommandNodeType(NodeType type)
+{
+    switch (type)
+    {
+        case NodeType::kGfxrVulkanBeginCommandBufferNode:
+        case NodeType::kGfxrVulkanEndCommandBufferNode:
+        case NodeType::kGfxrVulkanCommandNode:
+        case NodeType::kGfxrVulkanDrawCommandNode:
+        case NodeType::kGfxrVulkanBeginRenderPassCommandNode:
+        case NodeType::kGfxrVulkanEndRenderPassCommandNode:
+        case NodeType::kGfxrBeginDebugUtilsLabelCommandNode:
+        case NodeType::kGfxrVulkanCopyBufferCommandNode:
+        case NodeType::kGfxrVulkanClearAttachmentsCommandNode:
+        case NodeType::kGfxrVulkanClearColorImageCommandNode:
+        case NodeType::kGfxrVulkanClearDepthStencilImageCommandNode:
+        case NodeType::kGfxrVulkanResolveImageCommandNode:
+            return true;
+        default:
+            return false;
+    }
+}
+
+}  // namespace
+
 // =================================================================================================
 // Topology
 // =================================================================================================
@@ -128,6 +156,44 @@ void Topology::AddChildren(uint64_t node_index, const DiveVector<uint64_t>& chil
     }
 }
 
+//--------------------------------------------------------------------------------------------------
+void Topology::AppendChildren(uint64_t node_index, const DiveVector<uint64_t>& children)
+{
+    DIVE_ASSERT(node_index < m_node_children.size());
+
+    // The children of a node have to be contiguous in m_children_list, so unless they are already
+    // at the end of it, the existing children are copied to the end first. Their old range is left
+    // unused.
+    ChildrenInfo& children_info = m_node_children[node_index];
+    uint64_t num_prev_children = children_info.m_num_children;
+    if (num_prev_children == 0)
+    {
+        children_info.m_start_index = m_children_list.size();
+    }
+    else if (children_info.m_start_index + num_prev_children != m_children_list.size())
+    {
+        uint64_t start_index = m_children_list.size();
+        m_children_list.resize(start_index + num_prev_children);
+        auto prev_children = m_children_list.begin() + children_info.m_start_index;
+        std::copy(prev_children, prev_children + num_prev_children,
+                  m_children_list.begin() + start_index);
+        children_info.m_start_index = start_index;
+    }
+    uint64_t prev_size = m_children_list.size();
+    m_children_list.resize(prev_size + children.size());
+    std::copy(children.begin(), children.end(), m_children_list.begin() + prev_size);
+    children_info.m_num_children += children.size();
+
+    for (uint64_t i = 0; i < children.size(); ++i)
+    {
+        uint64_t child_node_index = children[i];
+        DIVE_ASSERT(child_node_index < m_node_children.size());
+        DIVE_ASSERT(m_node_parent[child_node_index] == UINT64_MAX);
+        m_node_parent[child_node_index] = node_index;
+        m_node_child_index[child_node_index] = num_prev_children + i;
+    }
+}
+
 // =================================================================================================
 // SharedNodeTopology
 // =================================================================================================
@@ -186,6 +252,14 @@ void SharedNodeTopology::SetNumNodes(uint64_t num_nodes)
     m_node_shared_children.resize(num_nodes);
     m_node_parent.resize(num_nodes, UINT64_MAX);
     m_node_child_index.resize(num_nodes, UINT64_MAX);
+
+    // Nodes added once the topology is complete have no shared children
+    if (!m_start_shared_child.empty())
+    {
+        m_start_shared_child.resize(num_nodes);
+        m_end_shared_child.resize(num_nodes);
+        m_root_node_index.resize(num_nodes);
+    }
 }
 
 //--------------------------------------------------------------------------------------------------
@@ -374,6 +448,27 @@ bool CommandHierarchy::GetRegFieldNodeIsCe(uint64_t node_index) const
     return info.reg_field_node.m_is_ce_packet;
 }
 
+//--------------------------------------------------------------------------------------------------
+uint32_t CommandHierarchy::GetGfxrCommandNodeIndex(uint64_t node_index) const
+{
+    DIVE_ASSERT(node_index < m_nodes.m_aux_info.size());
+    DIVE_ASSERT(IsGfxrCommandNodeType(m_nodes.m_node_type[node_index]));
+    const AuxInfo& info = m_nodes.m_aux_info[node_index];
+    return info.gfxr_command_node.m_command_index;
+}
+
+//--------------------------------------------------------------------------------------------------
+bool CommandHierarchy::GetGfxrCommandNodeArgsPending(uint64_t node_index) const
+{
+    DIVE_ASSERT(node_index < m_nodes.m_aux_info.size());
+    if (!IsGfxrCommandNodeType(m_nodes.m_node_type[node_index]))
+    {
+        return false;
+    }
+    const AuxInfo& info = m_nodes.m_aux_info[node_index];
+    return info.gfxr_command_node.m_args_pending;
+}
+
 //--------------------------------------------------------------------------------------------------
 bool CommandHierarchy::IsEventNodeIgnoredDuringCorrelation(uint64_t node_index) const
 {
@@ -389,9 +484,9 @@ uint64_t CommandHierarchy::AddNode(NodeType type, std::string&& desc, AuxInfo au
 }
 
 //--------------------------------------------------------------------------------------------------
-uint64_t CommandHierarchy::AddGfxrNode(NodeType type, std::string&& desc)
+uint64_t CommandHierarchy::AddGfxrNode(NodeType type, std::string&& desc, AuxInfo aux_info)
 {
-    return m_nodes.AddGfxrNode(type, std::move(desc));
+    return m_nodes.AddGfxrNode(type, std::move(desc), aux_info);
 }
 
 //--------------------------------------------------------------------------------------------------
@@ -421,15 +516,15 @@ uint64_t CommandHierarchy::Nodes::AddNode(NodeType type, std::string&& desc, Aux
 }
 
 //--------------------------------------------------------------------------------------------------
-uint64_t CommandHierarchy::Nodes::AddGfxrNode(NodeType type, std::string&& desc)
+uint64_t CommandHierarchy::Nodes::AddGfxrNode(NodeType type, std::string&& desc, AuxInfo aux_info)
 {
     DIVE_ASSERT(m_node_type.size() == m_description.size());
 
     m_node_type.push_back(type);
     m_description.push_back(std::move(desc));
-    // Adds a dummy AuxInfo object to ensure the m_node_type, m_description, and m_aux_info sizes
-    // stay the same.
-    m_aux_info.push_back(AuxInfo(0));
+    // Nodes other than the vulkan commands get a dummy AuxInfo object, to ensure the m_node_type,
+    // m_description, and m_aux_info sizes stay the same.
+    m_aux_info.push_back(aux_info);
     return m_node_type.size() - 1;
 }
 
@@ -505,6 +600,16 @@ CommandHierarchy::AuxInfo CommandHierarchy::AuxInfo::MarkerNode(MarkerType type,
     return info;
 }
 
+//--------------------------------------------------------------------------------------------------
+CommandHierarchy::AuxInfo CommandHierarchy::AuxInfo::GfxrCommandNode(uint32_t command_index,
+                                                                     bool args_pending)
+{
+    AuxInfo info(0);
+    info.gfxr_command_node.m_command_index = command_index;
+    info.gfxr_command_node.m_args_pending = args_pending;
+    return info;
+}
+
 // =================================================================================================
 // CommandHierarchyCreator
 // =================================================================================================
@@ -1472,6 +1577,7 @@ void CommandHierarchyCreator::AppendRegNodes(const IMemoryManager& mem_manager,
 {
     // This version of AppendRegNodes takes in a raw buffer consisting of register offset + value
     // pairs
+    const RegInfoTable& reg_table = GetRegInfoTable();
     uint32_t dword = 0;
     while (dword < dword_count)
     {
@@ -1486,7 +1592,7 @@ void CommandHierarchyCreator::AppendRegNodes(const IMemoryManager& mem_manager,
             mem_manager.RetrieveMemoryData(&reg_pair, submit_index, pair_addr, sizeof(reg_pair)));
         dword += 2;
 
-        const RegInfo* reg_info_ptr = GetRegInfo(reg_pair.m_reg_offset);
+        const RegInfo* reg_info_ptr = reg_table.GetRegInfo(reg_pair.m_reg_offset);
 
         RegInfo temp = {};
         temp.m_name = "Unknown";
@@ -1529,13 +1635,14 @@ void CommandHierarchyCreator::AppendRegNodes(const IMemoryManager& mem_manager,
     // sequence of register values
 
     // Go through each register set by this packet
+    const RegInfoTable& reg_table = GetRegInfoTable();
     uint32_t offset_in_bytes = 0;
     uint32_t dword = 0;
     while (dword < header.type4.count)
     {
         uint64_t reg_va_addr = va_addr + sizeof(header) + offset_in_bytes;
         uint32_t reg_offset = header.type4.offset + dword;
-        const RegInfo* reg_info_ptr = GetRegInfo(reg_offset);
+        const RegInfo* reg_info_ptr = reg_table.GetRegInfo(reg_offset);
 
         RegInfo temp = {};
         temp.m_name = "Unknown";
@@ -134,6 +134,10 @@ class Topology
     virtual void SetNumNodes(uint64_t num_nodes);
     void AddChildren(uint64_t node_index, const DiveVector<uint64_t>& children);
 
+    // Adds children after the existing ones of a node, once the topology has been built. The child
+    // indices of the existing children are unchanged.
+    void AppendChildren(uint64_t node_index, const DiveVector<uint64_t>& children);
+
  private:
     friend class CommandHierarchy;
     friend class GfxrVulkanCommandHierarchyCreator;
@@ -239,6 +243,10 @@ class CommandHierarchy
     uint8_t GetPacketNodeOpcode(uint64_t node_index) const;
     uint8_t GetPacketNodeIbLevel(uint64_t node_index) const;
     bool GetRegFieldNodeIsCe(uint64_t node_index) const;
+    // The arg nodes of a gfxr vulkan command are only created when they are first needed (see
+    // GfxrVulkanCommandHierarchyCreator::CreateArgNodes)
+    uint32_t GetGfxrCommandNodeIndex(uint64_t node_index) const;
+    bool GetGfxrCommandNodeArgsPending(uint64_t node_index) const;
     bool IsEventNodeIgnoredDuringCorrelation(uint64_t node_index) const;
 
     // GetEventIndex returns sequence number for Event/Sync Nodes, 0 if not exist.
@@ -327,6 +335,12 @@ class CommandHierarchy
             bool m_is_ce_packet;
         } reg_field_node;
 
+        struct
+        {
+            uint32_t m_command_index;  // VulkanCommandInfo::command_index in the GfxrCaptureData
+            bool m_args_pending;       // Whether the arg nodes are yet to be created
+        } gfxr_command_node;
+
         uint64_t m_u64All;
 
         AuxInfo(uint64_t val);
@@ -338,6 +352,7 @@ class CommandHierarchy
         static AuxInfo EventNode(uint32_t event_id, Util::EventType type,
                                  bool ignore_during_correlation);
         static AuxInfo MarkerNode(MarkerType type, uint32_t id = 0);
+        static AuxInfo GfxrCommandNode(uint32_t command_index, bool args_pending);
     };
     static_assert(sizeof(AuxInfo) == sizeof(uint64_t), "Unexpected size!");
 
@@ -351,13 +366,13 @@ class CommandHierarchy
         DiveVector<uint64_t> m_event_node_indices;
 
         uint64_t AddNode(NodeType type, std::string&& desc, AuxInfo aux_info);
-        uint64_t AddGfxrNode(NodeType type, std::string&& desc);
+        uint64_t AddGfxrNode(NodeType type, std::string&& desc, AuxInfo aux_info);
     };
 
     // Add a node and returns index of the added node
     uint64_t AddNode(NodeType type, std::string&& desc, AuxInfo aux_info);
     // Add a gfxr node and returns index of the added node
-    uint64_t AddGfxrNode(NodeType type, std::string&& desc);
+    uint64_t AddGfxrNode(NodeType type, std::string&& desc, AuxInfo aux_info = 0);
     void AddToFilterExcludeIndexList(uint64_t index, FilterListType filter_mode)
     {
         m_filter_exclude_indices_list[filter_mode].insert(index);
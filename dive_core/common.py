@@ -1,5 +1,11 @@
 import xml.etree.ElementTree as ET
+import contextlib
 import copy
+import hashlib
+import os
+import pickle
+import sys
+import time
 
 # Common functions
 import ctypes
@@ -112,3 +118,264 @@ def addMissingDomains(registers_et_root):
   cp_load_state_frag = copy.deepcopy(cp_load_state_geom)
   cp_load_state_frag.attrib["name"] = "CP_LOAD_STATE6_FRAG"
   registers_et_root.append(cp_load_state_frag)
+
+# ---------------------------------------------------------------------------------------
+# Parse the base register xml file and splice every "import"ed xml file into its root.
+# Returns the root element along with a dict of the top-level elements spliced in from each
+# imported file, keyed by file name.
+def parseRegisterXml(register_root, register_file):
+  tree = ET.parse(register_root+'/'+register_file)
+  registers_et_root = tree.getroot()
+
+  imported_files = {}
+  for child in registers_et_root:
+    if child.tag == '{http://nouveau.freedesktop.org/}import':
+      if 'file' in child.attrib:
+        sub_xml_file = child.attrib['file']
+
+        # Check if this file has already been parsed or not
+        if sub_xml_file not in imported_files:
+          sub_tree_children = list(ET.parse(register_root+'/'+sub_xml_file).getroot())
+          imported_files[sub_xml_file] = sub_tree_children
+          registers_et_root.extend(sub_tree_children)
+  return registers_et_root, imported_files
+
+# ---------------------------------------------------------------------------------------
+# Name-keyed index over the register element tree. It is built once, after all imports have
+# been spliced in and addMissingDomains() has run, so that the emit passes never have to
+# re-scan the tree with XPath queries.
+# Where a name is defined more than once, the first definition in document order wins, which
+# matches what ElementTree's find() would have returned.
+class RegisterSymbolTable():
+  def __init__(self, registers_et_root, imported_files=None):
+    self.root = registers_et_root
+    self.imported_files = imported_files if imported_files is not None else {}
+    self.loaded_from_model = False
+
+    # Top-level domains, bitsets and enums
+    self.domains = {}
+    self.bitsets = {}
+    self.enums = {}
+    for element in registers_et_root:
+      if 'name' not in element.attrib:
+        continue
+      name = element.attrib['name']
+      if element.tag == '{http://nouveau.freedesktop.org/}domain':
+        self.domains.setdefault(name, element)
+      elif element.tag == '{http://nouveau.freedesktop.org/}bitset':
+        self.bitsets.setdefault(name, element)
+      elif element.tag == '{http://nouveau.freedesktop.org/}enum':
+        self.enums.setdefault(name, element)
+
+    # Bitsets that are local to the A6XX register domain
+    self.a6xx_domain = self.domains.get('A6XX')
+    self.a6xx_bitsets = {}
+    if self.a6xx_domain is not None:
+      for element in self.a6xx_domain.findall('{http://nouveau.freedesktop.org/}bitset'):
+        self.a6xx_bitsets.setdefault(element.attrib['name'], element)
+
+    # GPU variants bitfields, keyed by "variants" attribute string
+    self.variants_bitfields = {}
+
+    # Bitsets local to other domains, indexed on first use
+    self.domain_bitsets = {}
+
+    # Enums anywhere in the tree (in document order), and their values keyed by name
+    self.all_enum_list = gatherAllEnums(registers_et_root)
+    self.all_enums = {}
+    self.enum_values = {}
+    for enum in self.all_enum_list:
+      enum_name = enum.attrib['name']
+      if enum_name in self.all_enums:
+        continue
+      self.all_enums[enum_name] = enum
+      values = {}
+      for value in enum.findall('{http://nouveau.freedesktop.org/}value'):
+        values.setdefault(value.attrib['name'], value)
+      self.enum_values[enum_name] = values
+
+  # Look up a bitset by name, preferring the one defined in the A6XX domain
+  def findBitset(self, name):
+    bitset = self.a6xx_bitsets.get(name)
+    if bitset is None:
+      bitset = self.bitsets.get(name)
+    return bitset
+
+  # Look up a bitset local to the given domain
+  def findDomainBitset(self, domain, name):
+    if domain is self.a6xx_domain:
+      return self.a6xx_bitsets.get(name)
+    key = id(domain)
+    if key not in self.domain_bitsets:
+      bitsets = {}
+      for element in domain.findall('{http://nouveau.freedesktop.org/}bitset'):
+        bitsets.setdefault(element.attrib['name'], element)
+      self.domain_bitsets[key] = bitsets
+    return self.domain_bitsets[key].get(name)
+
+  # Memoized GetGPUVariantsBitField()
+  def getVariantsBitField(self, variants):
+    if variants not in self.variants_bitfields:
+      self.variants_bitfields[variants] = GetGPUVariantsBitField(variants)
+    return self.variants_bitfields[variants]
+
+  # Look up a value element of an enum defined anywhere in the tree
+  def findEnumValue(self, enum_name, value_name):
+    if enum_name not in self.enum_values:
+      return None
+    return self.enum_values[enum_name].get(value_name)
+
+# ---------------------------------------------------------------------------------------
+# Accumulates wall-clock time per generation pass, for reporting where the time goes
+class PassTimer():
+  def __init__(self):
+    self.timings = []
+    self.start = time.perf_counter()
+
+  @contextlib.contextmanager
+  def measure(self, pass_name):
+    begin = time.perf_counter()
+    try:
+      yield
+    finally:
+      self.timings.append((pass_name, time.perf_counter() - begin))
+
+  def report(self, script_name):
+    total = time.perf_counter() - self.start
+    print('%s: generation time per pass' % script_name)
+    for pass_name, seconds in self.timings:
+      print('  %-28s %8.1f ms' % (pass_name, seconds * 1000.0))
+    print('  %-28s %8.1f ms' % ('total', total * 1000.0))
+
+# ---------------------------------------------------------------------------------------
+# Serialized register model
+#
+# Parsing adreno.xml and all of its imports is shared by generatePm4Info_adreno.py and
+# generateAdrenoHeader.py. The fully spliced tree (after addMissingDomains()) is stored on disk
+# as plain nested tuples, together with the GPU variants bitfields that were computed from it,
+# so that only the first generator to run needs to parse the xml. The model is keyed by the
+# content hash of every input xml file and of this file, and is rebuilt whenever any of them
+# changes.
+REGISTER_MODEL_VERSION = 1
+
+# ---------------------------------------------------------------------------------------
+def getRegisterModelPath(output_dir, register_file):
+  base_name = os.path.splitext(os.path.basename(register_file))[0]
+  return os.path.join(output_dir, base_name + '_register_model.pickle')
+
+# ---------------------------------------------------------------------------------------
+def hashFile(path):
+  with open(path, 'rb') as f:
+    return hashlib.sha256(f.read()).hexdigest()
+
+# ---------------------------------------------------------------------------------------
+def elementToModel(element):
+  return (element.tag, element.attrib, tuple(elementToModel(child) for child in element))
+
+# ---------------------------------------------------------------------------------------
+def modelToElement(node):
+  element = ET.Element(node[0], node[1])
+  element.extend([modelToElement(child) for child in node[2]])
+  return element
+
+# ---------------------------------------------------------------------------------------
+def getRegisterModelKey(register_root, register_file, imported_file_names):
+  inputs = [register_file] + list(imported_file_names)
+  return {
+    'version': REGISTER_MODEL_VERSION,
+    'builder': hashFile(os.path.abspath(__file__)),
+    'inputs': [(name, hashFile(register_root+'/'+name)) for name in inputs],
+  }
+
+# ---------------------------------------------------------------------------------------
+def readRegisterModel(register_root, register_file, model_path):
+  if not os.path.isfile(model_path):
+    return None
+  try:
+    with open(model_path, 'rb') as f:
+      key = pickle.load(f)
+      if key['inputs'][0][0] != register_file:
+        return None
+      imported_file_names = [name for name, _ in key['inputs'][1:]]
+      if key != getRegisterModelKey(register_root, register_file, imported_file_names):
+        return None
+      model = pickle.load(f)
+  except (OSError, EOFError, KeyError, IndexError, pickle.UnpicklingError):
+    return None
+
+  registers_et_root = modelToElement(model['tree'])
+  children = list(registers_et_root)
+  imported_files = {}
+  for name, (begin, end) in model['imported_files'].items():
+    imported_files[name] = children[begin:end]
+  symbols = RegisterSymbolTable(registers_et_root, imported_files)
+  symbols.variants_bitfields = model['variants_bitfields']
+  return symbols
+
+# ---------------------------------------------------------------------------------------
+def writeRegisterModel(register_root, register_file, model_path, symbols):
+  children = list(symbols.root)
+  index_of = {id(child): index for index, child in enumerate(children)}
+  imported_files = {}
+  for name, elements in symbols.imported_files.items():
+    if elements:
+      begin = index_of[id(elements[0])]
+      imported_files[name] = (begin, begin + len(elements))
+    else:
+      imported_files[name] = (0, 0)
+
+  # Pre-compute the variants bitfields for everything in the tree
+  for element in symbols.root.iter():
+    if 'variants' in element.attrib:
+      symbols.getVariantsBitField(element.attrib['variants'])
+
+  key = getRegisterModelKey(register_root, register_file, imported_files.keys())
+  model = {
+    'tree': elementToModel(symbols.root),
+    'imported_files': imported_files,
+    'variants_bitfields': symbols.variants_bitfields,
+  }
+
+  # Write to a temporary file first so a concurrent reader never sees a partial model
+  temp_path = model_path + '.%d.tmp' % os.getpid()
+  try:
+    with open(temp_path, 'wb') as f:
+      pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+      pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, model_path)
+  except OSError:
+    # The model is only a cache, so failing to write it is not fatal
+    if os.path.exists(temp_path):
+      os.remove(temp_path)
+
+# ---------------------------------------------------------------------------------------
+# Returns the RegisterSymbolTable for the given register file, loading it from model_path when
+# it is still valid and otherwise parsing the xml (and refreshing model_path, if given).
+# symbols.loaded_from_model records which of the two happened.
+def loadRegisterModel(register_root, register_file, model_path=None):
+  if model_path:
+    symbols = readRegisterModel(register_root, register_file, model_path)
+    if symbols is not None:
+      symbols.loaded_from_model = True
+      return symbols
+
+  registers_et_root, imported_files = parseRegisterXml(register_root, register_file)
+  addMissingDomains(registers_et_root)
+  symbols = RegisterSymbolTable(registers_et_root, imported_files)
+  if model_path:
+    writeRegisterModel(register_root, register_file, model_path, symbols)
+  return symbols
+
+# ---------------------------------------------------------------------------------------
+if __name__ == '__main__':
+  if len(sys.argv) != 4:
+    print(sys.argv[0] + ' <Path to registers directory> <Adreno register file, relative to the'
+          ' registers directory> <Path to output register model>')
+    sys.exit()
+  symbols = loadRegisterModel(sys.argv[1], sys.argv[2], sys.argv[3])
+  if symbols.loaded_from_model:
+    # Refresh the timestamp so build systems see the model as newer than its inputs
+    os.utime(sys.argv[3])
+    print('%s: %s is up to date' % (sys.argv[0], sys.argv[3]))
+  else:
+    print('%s: %s file generated' % (sys.argv[0], sys.argv[3]))
@@ -96,6 +96,8 @@ bool EmulateStateTracker::OnPacket(const IMemoryManager& mem_manager, uint32_t s
         }
     }
 
+    // The register table of the current GPU variant, with every offset already resolved
+    const RegInfoTable& reg_table = GetRegInfoTable();
     if (header.type == 7 && header.type7.opcode == CP_CONTEXT_REG_BUNCH)
     {
         uint32_t dword = 0;
@@ -113,7 +115,7 @@ bool EmulateStateTracker::OnPacket(const IMemoryManager& mem_manager, uint32_t s
             dword += 2;
             SetReg(reg_pair.m_reg_offset, reg_pair.m_reg_value);
 
-            const RegInfo* reg_info_ptr = GetRegInfo(reg_pair.m_reg_offset);
+            const RegInfo* reg_info_ptr = reg_table.GetRegInfo(reg_pair.m_reg_offset);
             if (reg_info_ptr && reg_info_ptr->m_is_64_bit)
             {
                 RegPair new_reg_pair{};
@@ -141,7 +143,7 @@ bool EmulateStateTracker::OnPacket(const IMemoryManager& mem_manager, uint32_t s
             uint64_t reg_va_addr = va_addr + sizeof(header) + offset_in_bytes;
             uint32_t reg_offset = header.type4.offset + dword;
             DIVE_ASSERT(reg_offset < kNumRegs);
-            const RegInfo* reg_info_ptr = GetRegInfo(reg_offset);
+            const RegInfo* reg_info_ptr = reg_table.GetRegInfo(reg_offset);
 
             constexpr size_t dword_in_bytes = sizeof(uint32_t);
             uint32_t size_in_dwords = 1;
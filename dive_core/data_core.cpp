@@ -40,6 +40,7 @@ CaptureData::LoadResult DataCore::LoadDiveCaptureData(const std::string& file_na
     std::filesystem::path rd_file_path(file_name);
     rd_file_path.replace_extension(".rd");
     m_capture_metadata = CaptureMetadata();
+    m_command_hierarchy_gfxr_capture_data = nullptr;
     return m_dive_capture_data.LoadFiles(rd_file_path.string(), file_name);
 }
 
@@ -48,6 +49,7 @@ CaptureData::LoadResult DataCore::LoadPm4CaptureData(const std::string& file_nam
 {
     m_pm4_capture_data = Pm4CaptureData(m_progress_tracker);  // Clear any previously loaded data
     m_capture_metadata = CaptureMetadata();
+    m_command_hierarchy_gfxr_capture_data = nullptr;
     return m_pm4_capture_data.LoadCaptureFile(file_name);
 }
 
@@ -55,6 +57,7 @@ CaptureData::LoadResult DataCore::LoadPm4CaptureData(const std::string& file_nam
 CaptureData::LoadResult DataCore::LoadGfxrCaptureData(const std::string& file_name)
 {
     m_gfxr_capture_data = GfxrCaptureData();
+    m_command_hierarchy_gfxr_capture_data = nullptr;
     return m_gfxr_capture_data.LoadCaptureFile(file_name);
 }
 
@@ -78,6 +81,7 @@ bool DataCore::CreateDiveCommandHierarchy()
     {
         return false;
     }
+    m_command_hierarchy_gfxr_capture_data = &m_dive_capture_data.GetGfxrCaptureData();
     return true;
 }
 
@@ -117,6 +121,7 @@ bool DataCore::CreateGfxrCommandHierarchy()
     {
         return false;
     }
+    m_command_hierarchy_gfxr_capture_data = &m_gfxr_capture_data;
     return true;
 }
 
@@ -229,6 +234,20 @@ const CommandHierarchy& DataCore::GetCommandHierarchy() const
     return m_capture_metadata.m_command_hierarchy;
 }
 
+//--------------------------------------------------------------------------------------------------
+uint64_t DataCore::CreateGfxrCommandArgNodes(
+    uint64_t node_index,
+    const std::function<void(uint64_t first_child_index, uint64_t num_children)>& before_insert)
+{
+    if (m_command_hierarchy_gfxr_capture_data == nullptr)
+    {
+        return 0;
+    }
+    GfxrVulkanCommandHierarchyCreator vk_cmd_creator(m_capture_metadata.m_command_hierarchy,
+                                                     *m_command_hierarchy_gfxr_capture_data);
+    return vk_cmd_creator.CreateArgNodes(node_index, before_insert);
+}
+
 //--------------------------------------------------------------------------------------------------
 const CaptureMetadata& DataCore::GetCaptureMetadata() const { return m_capture_metadata; }
 
@@ -993,8 +1012,9 @@ void CaptureMetadataCreator::FillHardwareSpecificStates(EventStateInfo::Iterator
         event_state_it->SetBinH(binh);
         event_state_it->SetRenderMode(render_mode);
 
-        // this is only available on a6xx
-        if (IsFieldEnabled(GetRegFieldByName("BUFFERS_LOCATION", reg_info)))
+        // this is only available on a6xx, and the register info of the current GPU only has the
+        // fields enabled for it
+        if (GetRegFieldByName("BUFFERS_LOCATION", reg_info) != nullptr)
         {
             const a6xx_buffers_location buffers_location = bitfields.BUFFERS_LOCATION;
             event_state_it->SetBuffersLocation(buffers_location);
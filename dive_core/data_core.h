@@ -17,6 +17,7 @@
 
 #pragma once
 #include <deque>
+#include <functional>
 #include <map>
 #include <memory>
 #include <vector>
@@ -95,6 +96,14 @@ class DataCore
     // Get the command-hierarchy, which is a tree view interpretation of the command buffer
     const CommandHierarchy& GetCommandHierarchy() const;
 
+    // Create the arg nodes of the gfxr vulkan command at node_index in the command-hierarchy, if
+    // they have not been created yet (see GfxrVulkanCommandHierarchyCreator::CreateArgNodes).
+    // Returns the number of arg nodes created.
+    uint64_t CreateGfxrCommandArgNodes(
+        uint64_t node_index,
+        const std::function<void(uint64_t first_child_index, uint64_t num_children)>&
+            before_insert = nullptr);
+
     // Get metadata describing the capture (info obtained by parsing the capture)
     const CaptureMetadata& GetCaptureMetadata() const;
 
@@ -112,6 +121,9 @@ class DataCore
 
     // Metadata for the capture data in m_capture_data
     CaptureMetadata m_capture_metadata;
+
+    // The gfxr capture data the gfxr nodes of the command-hierarchy were created from
+    const GfxrCaptureData* m_command_hierarchy_gfxr_capture_data = nullptr;
 };
 
 //--------------------------------------------------------------------------------------------------
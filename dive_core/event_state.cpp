@@ -24,7 +24,10 @@
 
 #include "event_state.h"
 
+#include <algorithm>
 #include <cstring>
+#include <limits>
+#include <string>
 
 namespace Dive
 {
@@ -458,6 +461,214 @@ EventStateInfo::Iterator EventStateInfoT<EventStateInfo_CONFIG>::Add()
     return find(id);
 }
 
+template <>
+EventStateInfo::Iterator EventStateInfoT<EventStateInfo_CONFIG>::AddN(typename Id::basic_type count)
+{
+    if (count > std::numeric_limits<typename Id::basic_type>::max() - m_size)
+    {
+        // size has overflowed the `Id` type.
+        DIVE_ASSERT(false);
+        return end();
+    }
+    if (count == 0) return end();
+    if (m_size + count > m_cap)
+    {
+        // Grow at least as much as `Add` would, so that repeated calls stay amortized
+        auto new_cap = m_size + count;
+        if (m_cap <= std::numeric_limits<typename Id::basic_type>::max() / 2)
+            new_cap = std::max(new_cap, static_cast<typename Id::basic_type>(m_cap * 2));
+        Reserve(new_cap);
+    }
+
+    std::fill_n(TopologyPtr(Id(m_size)), count, uint32_t());
+    std::fill_n(PrimRestartEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(PatchControlPointsPtr(Id(m_size)), count, uint32_t());
+    std::fill_n(ViewportPtr(Id(m_size)), count * kViewportArrayCount, VkViewport());
+    std::fill_n(ScissorPtr(Id(m_size)), count * kScissorArrayCount, VkRect2D());
+    std::fill_n(DepthClampEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(RasterizerDiscardEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(PolygonModePtr(Id(m_size)), count, VkPolygonMode());
+    std::fill_n(CullModePtr(Id(m_size)), count, VkCullModeFlags());
+    std::fill_n(FrontFacePtr(Id(m_size)), count, VkFrontFace());
+    std::fill_n(DepthBiasEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(DepthBiasConstantFactorPtr(Id(m_size)), count, float());
+    std::fill_n(DepthBiasClampPtr(Id(m_size)), count, float());
+    std::fill_n(DepthBiasSlopeFactorPtr(Id(m_size)), count, float());
+    std::fill_n(LineWidthPtr(Id(m_size)), count, float());
+    std::fill_n(RasterizationSamplesPtr(Id(m_size)), count, VkSampleCountFlagBits());
+    std::fill_n(SampleShadingEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(MinSampleShadingPtr(Id(m_size)), count, float());
+    std::fill_n(SampleMaskPtr(Id(m_size)), count, VkSampleMask());
+    std::fill_n(AlphaToCoverageEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(DepthTestEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(DepthWriteEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(DepthCompareOpPtr(Id(m_size)), count, VkCompareOp());
+    std::fill_n(DepthBoundsTestEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(MinDepthBoundsPtr(Id(m_size)), count, float());
+    std::fill_n(MaxDepthBoundsPtr(Id(m_size)), count, float());
+    std::fill_n(StencilTestEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(StencilOpStateFrontPtr(Id(m_size)), count, VkStencilOpState());
+    std::fill_n(StencilOpStateBackPtr(Id(m_size)), count, VkStencilOpState());
+    std::fill_n(LogicOpEnabledPtr(Id(m_size)), count * kLogicOpEnabledArrayCount, bool());
+    std::fill_n(LogicOpPtr(Id(m_size)), count * kLogicOpArrayCount, VkLogicOp());
+    std::fill_n(AttachmentPtr(Id(m_size)), count * kAttachmentArrayCount,
+                VkPipelineColorBlendAttachmentState());
+    std::fill_n(BlendConstantPtr(Id(m_size)), count * kBlendConstantArrayCount, float());
+    std::fill_n(LRZEnabledPtr(Id(m_size)), count, bool());
+    std::fill_n(LRZWritePtr(Id(m_size)), count, bool());
+    std::fill_n(LRZDirStatusPtr(Id(m_size)), count, a6xx_lrz_dir_status());
+    std::fill_n(LRZDirWritePtr(Id(m_size)), count, bool());
+    std::fill_n(ZTestModePtr(Id(m_size)), count, a6xx_ztest_mode());
+    std::fill_n(BinWPtr(Id(m_size)), count, uint32_t());
+    std::fill_n(BinHPtr(Id(m_size)), count, uint32_t());
+    std::fill_n(WindowScissorTLXPtr(Id(m_size)), count, uint16_t());
+    std::fill_n(WindowScissorTLYPtr(Id(m_size)), count, uint16_t());
+    std::fill_n(WindowScissorBRXPtr(Id(m_size)), count, uint16_t());
+    std::fill_n(WindowScissorBRYPtr(Id(m_size)), count, uint16_t());
+    std::fill_n(RenderModePtr(Id(m_size)), count, a6xx_render_mode());
+    std::fill_n(BuffersLocationPtr(Id(m_size)), count, a6xx_buffers_location());
+    std::fill_n(ThreadSizePtr(Id(m_size)), count, a6xx_threadsize());
+    std::fill_n(EnableAllHelperLanesPtr(Id(m_size)), count, bool());
+    std::fill_n(EnablePartialHelperLanesPtr(Id(m_size)), count, bool());
+    std::fill_n(UBWCEnabledPtr(Id(m_size)), count * kUBWCEnabledArrayCount, bool());
+    std::fill_n(UBWCLosslessEnabledPtr(Id(m_size)), count * kUBWCLosslessEnabledArrayCount, bool());
+    std::fill_n(UBWCEnabledOnDSPtr(Id(m_size)), count, bool());
+    std::fill_n(UBWCLosslessEnabledOnDSPtr(Id(m_size)), count, bool());
+    std::fill_n(ResolveScissorPtr(Id(m_size)), count, VkRect2D());
+    std::fill_n(ResolveBaseGmemPtr(Id(m_size)), count, uint32_t());
+    std::fill_n(ResolveBaseSysmemPtr(Id(m_size)), count, uint64_t());
+    std::fill_n(ResolveFormatPtr(Id(m_size)), count, a6xx_format());
+    std::fill_n(ResolveTileModePtr(Id(m_size)), count, a6xx_tile_mode());
+
+    // The new elements start with no fields set, even if the memory held elements before `Clear`
+    for (size_t bit = size_t{m_size} * kNumFields; bit < size_t{m_size + count} * kNumFields; ++bit)
+        m_is_set_buffer[bit / 8] &= ~(1 << (bit % 8));
+
+    Id id(m_size);
+    m_size += count;
+    return find(id);
+}
+
+template <>
+void EventStateInfoT<EventStateInfo_CONFIG>::CopyRange(Id dst, const EventStateInfo& other, Id src,
+                                                       typename Id::basic_type count)
+{
+    DIVE_ASSERT(static_cast<typename Id::basic_type>(dst) + count <= m_size);
+    DIVE_ASSERT(static_cast<typename Id::basic_type>(src) + count <= other.size());
+    if (count == 0) return;
+
+    // `other` may be this object, so the spans may overlap
+    memmove(TopologyPtr(dst), other.TopologyPtr(src), kTopologySize * count);
+    memmove(PrimRestartEnabledPtr(dst), other.PrimRestartEnabledPtr(src),
+            kPrimRestartEnabledSize * count);
+    memmove(PatchControlPointsPtr(dst), other.PatchControlPointsPtr(src),
+            kPatchControlPointsSize * count);
+    memmove(ViewportPtr(dst), other.ViewportPtr(src), kViewportSize * count);
+    memmove(ScissorPtr(dst), other.ScissorPtr(src), kScissorSize * count);
+    memmove(DepthClampEnabledPtr(dst), other.DepthClampEnabledPtr(src),
+            kDepthClampEnabledSize * count);
+    memmove(RasterizerDiscardEnabledPtr(dst), other.RasterizerDiscardEnabledPtr(src),
+            kRasterizerDiscardEnabledSize * count);
+    memmove(PolygonModePtr(dst), other.PolygonModePtr(src), kPolygonModeSize * count);
+    memmove(CullModePtr(dst), other.CullModePtr(src), kCullModeSize * count);
+    memmove(FrontFacePtr(dst), other.FrontFacePtr(src), kFrontFaceSize * count);
+    memmove(DepthBiasEnabledPtr(dst), other.DepthBiasEnabledPtr(src),
+            kDepthBiasEnabledSize * count);
+    memmove(DepthBiasConstantFactorPtr(dst), other.DepthBiasConstantFactorPtr(src),
+            kDepthBiasConstantFactorSize * count);
+    memmove(DepthBiasClampPtr(dst), other.DepthBiasClampPtr(src), kDepthBiasClampSize * count);
+    memmove(DepthBiasSlopeFactorPtr(dst), other.DepthBiasSlopeFactorPtr(src),
+            kDepthBiasSlopeFactorSize * count);
+    memmove(LineWidthPtr(dst), other.LineWidthPtr(src), kLineWidthSize * count);
+    memmove(RasterizationSamplesPtr(dst), other.RasterizationSamplesPtr(src),
+            kRasterizationSamplesSize * count);
+    memmove(SampleShadingEnabledPtr(dst), other.SampleShadingEnabledPtr(src),
+            kSampleShadingEnabledSize * count);
+    memmove(MinSampleShadingPtr(dst), other.MinSampleShadingPtr(src),
+            kMinSampleShadingSize * count);
+    memmove(SampleMaskPtr(dst), other.SampleMaskPtr(src), kSampleMaskSize * count);
+    memmove(AlphaToCoverageEnabledPtr(dst), other.AlphaToCoverageEnabledPtr(src),
+            kAlphaToCoverageEnabledSize * count);
+    memmove(DepthTestEnabledPtr(dst), other.DepthTestEnabledPtr(src),
+            kDepthTestEnabledSize * count);
+    memmove(DepthWriteEnabledPtr(dst), other.DepthWriteEnabledPtr(src),
+            kDepthWriteEnabledSize * count);
+    memmove(DepthCompareOpPtr(dst), other.DepthCompareOpPtr(src), kDepthCompareOpSize * count);
+    memmove(DepthBoundsTestEnabledPtr(dst), other.DepthBoundsTestEnabledPtr(src),
+            kDepthBoundsTestEnabledSize * count);
+    memmove(MinDepthBoundsPtr(dst), other.MinDepthBoundsPtr(src), kMinDepthBoundsSize * count);
+    memmove(MaxDepthBoundsPtr(dst), other.MaxDepthBoundsPtr(src), kMaxDepthBoundsSize * count);
+    memmove(StencilTestEnabledPtr(dst), other.StencilTestEnabledPtr(src),
+            kStencilTestEnabledSize * count);
+    memmove(StencilOpStateFrontPtr(dst), other.StencilOpStateFrontPtr(src),
+            kStencilOpStateFrontSize * count);
+    memmove(StencilOpStateBackPtr(dst), other.StencilOpStateBackPtr(src),
+            kStencilOpStateBackSize * count);
+    memmove(LogicOpEnabledPtr(dst), other.LogicOpEnabledPtr(src), kLogicOpEnabledSize * count);
+    memmove(LogicOpPtr(dst), other.LogicOpPtr(src), kLogicOpSize * count);
+    memmove(AttachmentPtr(dst), other.AttachmentPtr(src), kAttachmentSize * count);
+    memmove(BlendConstantPtr(dst), other.BlendConstantPtr(src), kBlendConstantSize * count);
+    memmove(LRZEnabledPtr(dst), other.LRZEnabledPtr(src), kLRZEnabledSize * count);
+    memmove(LRZWritePtr(dst), other.LRZWritePtr(src), kLRZWriteSize * count);
+    memmove(LRZDirStatusPtr(dst), other.LRZDirStatusPtr(src), kLRZDirStatusSize * count);
+    memmove(LRZDirWritePtr(dst), other.LRZDirWritePtr(src), kLRZDirWriteSize * count);
+    memmove(ZTestModePtr(dst), other.ZTestModePtr(src), kZTestModeSize * count);
+    memmove(BinWPtr(dst), other.BinWPtr(src), kBinWSize * count);
+    memmove(BinHPtr(dst), other.BinHPtr(src), kBinHSize * count);
+    memmove(WindowScissorTLXPtr(dst), other.WindowScissorTLXPtr(src),
+            kWindowScissorTLXSize * count);
+    memmove(WindowScissorTLYPtr(dst), other.WindowScissorTLYPtr(src),
+            kWindowScissorTLYSize * count);
+    memmove(WindowScissorBRXPtr(dst), other.WindowScissorBRXPtr(src),
+            kWindowScissorBRXSize * count);
+    memmove(WindowScissorBRYPtr(dst), other.WindowScissorBRYPtr(src),
+            kWindowScissorBRYSize * count);
+    memmove(RenderModePtr(dst), other.RenderModePtr(src), kRenderModeSize * count);
+    memmove(BuffersLocationPtr(dst), other.BuffersLocationPtr(src), kBuffersLocationSize * count);
+    memmove(ThreadSizePtr(dst), other.ThreadSizePtr(src), kThreadSizeSize * count);
+    memmove(EnableAllHelperLanesPtr(dst), other.EnableAllHelperLanesPtr(src),
+            kEnableAllHelperLanesSize * count);
+    memmove(EnablePartialHelperLanesPtr(dst), other.EnablePartialHelperLanesPtr(src),
+            kEnablePartialHelperLanesSize * count);
+    memmove(UBWCEnabledPtr(dst), other.UBWCEnabledPtr(src), kUBWCEnabledSize * count);
+    memmove(UBWCLosslessEnabledPtr(dst), other.UBWCLosslessEnabledPtr(src),
+            kUBWCLosslessEnabledSize * count);
+    memmove(UBWCEnabledOnDSPtr(dst), other.UBWCEnabledOnDSPtr(src), kUBWCEnabledOnDSSize * count);
+    memmove(UBWCLosslessEnabledOnDSPtr(dst), other.UBWCLosslessEnabledOnDSPtr(src),
+            kUBWCLosslessEnabledOnDSSize * count);
+    memmove(ResolveScissorPtr(dst), other.ResolveScissorPtr(src), kResolveScissorSize * count);
+    memmove(ResolveBaseGmemPtr(dst), other.ResolveBaseGmemPtr(src), kResolveBaseGmemSize * count);
+    memmove(ResolveBaseSysmemPtr(dst), other.ResolveBaseSysmemPtr(src),
+            kResolveBaseSysmemSize * count);
+    memmove(ResolveFormatPtr(dst), other.ResolveFormatPtr(src), kResolveFormatSize * count);
+    memmove(ResolveTileModePtr(dst), other.ResolveTileModePtr(src), kResolveTileModeSize * count);
+
+    size_t dst_bit = size_t{static_cast<typename Id::basic_type>(dst)} * kNumFields;
+    size_t src_bit = size_t{static_cast<typename Id::basic_type>(src)} * kNumFields;
+    size_t num_bits = size_t{count} * kNumFields;
+    // Byte aligned spans are copied as whole bytes, followed by the trailing bits
+    size_t num_bytes = (dst_bit % 8 == 0 && src_bit % 8 == 0) ? num_bits / 8 : 0;
+    auto copy_bit = [&](size_t i) {
+        size_t from = src_bit + i;
+        size_t to = dst_bit + i;
+        if (other.m_is_set_buffer[from / 8] & (1 << (from % 8)))
+            m_is_set_buffer[to / 8] |= (1 << (to % 8));
+        else
+            m_is_set_buffer[to / 8] &= ~(1 << (to % 8));
+    };
+    if (&other == this && dst_bit > src_bit)
+    {
+        // Copy backwards, so that overlapping source bits are read before they are overwritten
+        for (size_t i = num_bits; i > num_bytes * 8; --i) copy_bit(i - 1);
+        memmove(&m_is_set_buffer[dst_bit / 8], &other.m_is_set_buffer[src_bit / 8], num_bytes);
+    }
+    else
+    {
+        memmove(&m_is_set_buffer[dst_bit / 8], &other.m_is_set_buffer[src_bit / 8], num_bytes);
+        for (size_t i = num_bytes * 8; i < num_bits; ++i) copy_bit(i);
+    }
+}
+
 template <>
 void EventStateInfoRefT<EventStateInfo_CONFIG>::assign(
     const EventStateInfo& other_obj, EventStateInfoRefT<EventStateInfo_CONFIG>::Id other_id) const
@@ -855,4 +1066,311 @@ void EventStateInfoRefT<EventStateInfo_CONFIG>::swap(const EventStateInfoRef& ot
     }
 }
 
+template <>
+std::string EventStateInfoT<EventStateInfo_CONFIG>::ColumnsSchema()
+{
+    std::string schema;
+    schema += "Topology uint32_t 1 " + std::to_string(kTopologySize) + "\n";
+    schema += "PrimRestartEnabled bool 1 " + std::to_string(kPrimRestartEnabledSize) + "\n";
+    schema += "PatchControlPoints uint32_t 1 " + std::to_string(kPatchControlPointsSize) + "\n";
+    schema += "Viewport VkViewport 16 " + std::to_string(kViewportSize) + "\n";
+    schema += "Scissor VkRect2D 16 " + std::to_string(kScissorSize) + "\n";
+    schema += "DepthClampEnabled bool 1 " + std::to_string(kDepthClampEnabledSize) + "\n";
+    schema +=
+        "RasterizerDiscardEnabled bool 1 " + std::to_string(kRasterizerDiscardEnabledSize) + "\n";
+    schema += "PolygonMode VkPolygonMode 1 " + std::to_string(kPolygonModeSize) + "\n";
+    schema += "CullMode VkCullModeFlags 1 " + std::to_string(kCullModeSize) + "\n";
+    schema += "FrontFace VkFrontFace 1 " + std::to_string(kFrontFaceSize) + "\n";
+    schema += "DepthBiasEnabled bool 1 " + std::to_string(kDepthBiasEnabledSize) + "\n";
+    schema +=
+        "DepthBiasConstantFactor float 1 " + std::to_string(kDepthBiasConstantFactorSize) + "\n";
+    schema += "DepthBiasClamp float 1 " + std::to_string(kDepthBiasClampSize) + "\n";
+    schema += "DepthBiasSlopeFactor float 1 " + std::to_string(kDepthBiasSlopeFactorSize) + "\n";
+    schema += "LineWidth float 1 " + std::to_string(kLineWidthSize) + "\n";
+    schema += "RasterizationSamples VkSampleCountFlagBits 1 " +
+              std::to_string(kRasterizationSamplesSize) + "\n";
+    schema += "SampleShadingEnabled bool 1 " + std::to_string(kSampleShadingEnabledSize) + "\n";
+    schema += "MinSampleShading float 1 " + std::to_string(kMinSampleShadingSize) + "\n";
+    schema += "SampleMask VkSampleMask 1 " + std::to_string(kSampleMaskSize) + "\n";
+    schema += "AlphaToCoverageEnabled bool 1 " + std::to_string(kAlphaToCoverageEnabledSize) + "\n";
+    schema += "DepthTestEnabled bool 1 " + std::to_string(kDepthTestEnabledSize) + "\n";
+    schema += "DepthWriteEnabled bool 1 " + std::to_string(kDepthWriteEnabledSize) + "\n";
+    schema += "DepthCompareOp VkCompareOp 1 " + std::to_string(kDepthCompareOpSize) + "\n";
+    schema += "DepthBoundsTestEnabled bool 1 " + std::to_string(kDepthBoundsTestEnabledSize) + "\n";
+    schema += "MinDepthBounds float 1 " + std::to_string(kMinDepthBoundsSize) + "\n";
+    schema += "MaxDepthBounds float 1 " + std::to_string(kMaxDepthBoundsSize) + "\n";
+    schema += "StencilTestEnabled bool 1 " + std::to_string(kStencilTestEnabledSize) + "\n";
+    schema +=
+        "StencilOpStateFront VkStencilOpState 1 " + std::to_string(kStencilOpStateFrontSize) + "\n";
+    schema +=
+        "StencilOpStateBack VkStencilOpState 1 " + std::to_string(kStencilOpStateBackSize) + "\n";
+    schema += "LogicOpEnabled bool 8 " + std::to_string(kLogicOpEnabledSize) + "\n";
+    schema += "LogicOp VkLogicOp 8 " + std::to_string(kLogicOpSize) + "\n";
+    schema += "Attachment VkPipelineColorBlendAttachmentState 8 " +
+              std::to_string(kAttachmentSize) + "\n";
+    schema += "BlendConstant float 4 " + std::to_string(kBlendConstantSize) + "\n";
+    schema += "LRZEnabled bool 1 " + std::to_string(kLRZEnabledSize) + "\n";
+    schema += "LRZWrite bool 1 " + std::to_string(kLRZWriteSize) + "\n";
+    schema += "LRZDirStatus a6xx_lrz_dir_status 1 " + std::to_string(kLRZDirStatusSize) + "\n";
+    schema += "LRZDirWrite bool 1 " + std::to_string(kLRZDirWriteSize) + "\n";
+    schema += "ZTestMode a6xx_ztest_mode 1 " + std::to_string(kZTestModeSize) + "\n";
+    schema += "BinW uint32_t 1 " + std::to_string(kBinWSize) + "\n";
+    schema += "BinH uint32_t 1 " + std::to_string(kBinHSize) + "\n";
+    schema += "WindowScissorTLX uint16_t 1 " + std::to_string(kWindowScissorTLXSize) + "\n";
+    schema += "WindowScissorTLY uint16_t 1 " + std::to_string(kWindowScissorTLYSize) + "\n";
+    schema += "WindowScissorBRX uint16_t 1 " + std::to_string(kWindowScissorBRXSize) + "\n";
+    schema += "WindowScissorBRY uint16_t 1 " + std::to_string(kWindowScissorBRYSize) + "\n";
+    schema += "RenderMode a6xx_render_mode 1 " + std::to_string(kRenderModeSize) + "\n";
+    schema +=
+        "BuffersLocation a6xx_buffers_location 1 " + std::to_string(kBuffersLocationSize) + "\n";
+    schema += "ThreadSize a6xx_threadsize 1 " + std::to_string(kThreadSizeSize) + "\n";
+    schema += "EnableAllHelperLanes bool 1 " + std::to_string(kEnableAllHelperLanesSize) + "\n";
+    schema +=
+        "EnablePartialHelperLanes bool 1 " + std::to_string(kEnablePartialHelperLanesSize) + "\n";
+    schema += "UBWCEnabled bool 8 " + std::to_string(kUBWCEnabledSize) + "\n";
+    schema += "UBWCLosslessEnabled bool 8 " + std::to_string(kUBWCLosslessEnabledSize) + "\n";
+    schema += "UBWCEnabledOnDS bool 1 " + std::to_string(kUBWCEnabledOnDSSize) + "\n";
+    schema +=
+        "UBWCLosslessEnabledOnDS bool 1 " + std::to_string(kUBWCLosslessEnabledOnDSSize) + "\n";
+    schema += "ResolveScissor VkRect2D 1 " + std::to_string(kResolveScissorSize) + "\n";
+    schema += "ResolveBaseGmem uint32_t 1 " + std::to_string(kResolveBaseGmemSize) + "\n";
+    schema += "ResolveBaseSysmem uint64_t 1 " + std::to_string(kResolveBaseSysmemSize) + "\n";
+    schema += "ResolveFormat a6xx_format 1 " + std::to_string(kResolveFormatSize) + "\n";
+    schema += "ResolveTileMode a6xx_tile_mode 1 " + std::to_string(kResolveTileModeSize) + "\n";
+    schema += "isSet bits " + std::to_string(kNumFields) + " 0\n";
+    return schema;
+}
+
+template <>
+bool EventStateInfoT<EventStateInfo_CONFIG>::SaveColumns(const char* file_name) const
+{
+    SoaColumnsWriter writer;
+    if (!writer.Open(file_name, kColumnsSpecHash, m_size, ColumnsSchema())) return false;
+    if (!writer.WriteColumn(TopologyPtr(), kTopologySize * m_size)) return false;
+    if (!writer.WriteColumn(PrimRestartEnabledPtr(), kPrimRestartEnabledSize * m_size))
+        return false;
+    if (!writer.WriteColumn(PatchControlPointsPtr(), kPatchControlPointsSize * m_size))
+        return false;
+    if (!writer.WriteColumn(ViewportPtr(), kViewportSize * m_size)) return false;
+    if (!writer.WriteColumn(ScissorPtr(), kScissorSize * m_size)) return false;
+    if (!writer.WriteColumn(DepthClampEnabledPtr(), kDepthClampEnabledSize * m_size)) return false;
+    if (!writer.WriteColumn(RasterizerDiscardEnabledPtr(), kRasterizerDiscardEnabledSize * m_size))
+        return false;
+    if (!writer.WriteColumn(PolygonModePtr(), kPolygonModeSize * m_size)) return false;
+    if (!writer.WriteColumn(CullModePtr(), kCullModeSize * m_size)) return false;
+    if (!writer.WriteColumn(FrontFacePtr(), kFrontFaceSize * m_size)) return false;
+    if (!writer.WriteColumn(DepthBiasEnabledPtr(), kDepthBiasEnabledSize * m_size)) return false;
+    if (!writer.WriteColumn(DepthBiasConstantFactorPtr(), kDepthBiasConstantFactorSize * m_size))
+        return false;
+    if (!writer.WriteColumn(DepthBiasClampPtr(), kDepthBiasClampSize * m_size)) return false;
+    if (!writer.WriteColumn(DepthBiasSlopeFactorPtr(), kDepthBiasSlopeFactorSize * m_size))
+        return false;
+    if (!writer.WriteColumn(LineWidthPtr(), kLineWidthSize * m_size)) return false;
+    if (!writer.WriteColumn(RasterizationSamplesPtr(), kRasterizationSamplesSize * m_size))
+        return false;
+    if (!writer.WriteColumn(SampleShadingEnabledPtr(), kSampleShadingEnabledSize * m_size))
+        return false;
+    if (!writer.WriteColumn(MinSampleShadingPtr(), kMinSampleShadingSize * m_size)) return false;
+    if (!writer.WriteColumn(SampleMaskPtr(), kSampleMaskSize * m_size)) return false;
+    if (!writer.WriteColumn(AlphaToCoverageEnabledPtr(), kAlphaToCoverageEnabledSize * m_size))
+        return false;
+    if (!writer.WriteColumn(DepthTestEnabledPtr(), kDepthTestEnabledSize * m_size)) return false;
+    if (!writer.WriteColumn(DepthWriteEnabledPtr(), kDepthWriteEnabledSize * m_size)) return false;
+    if (!writer.WriteColumn(DepthCompareOpPtr(), kDepthCompareOpSize * m_size)) return false;
+    if (!writer.WriteColumn(DepthBoundsTestEnabledPtr(), kDepthBoundsTestEnabledSize * m_size))
+        return false;
+    if (!writer.WriteColumn(MinDepthBoundsPtr(), kMinDepthBoundsSize * m_size)) return false;
+    if (!writer.WriteColumn(MaxDepthBoundsPtr(), kMaxDepthBoundsSize * m_size)) return false;
+    if (!writer.WriteColumn(StencilTestEnabledPtr(), kStencilTestEnabledSize * m_size))
+        return false;
+    if (!writer.WriteColumn(StencilOpStateFrontPtr(), kStencilOpStateFrontSize * m_size))
+        return false;
+    if (!writer.WriteColumn(StencilOpStateBackPtr(), kStencilOpStateBackSize * m_size))
+        return false;
+    if (!writer.WriteColumn(LogicOpEnabledPtr(), kLogicOpEnabledSize * m_size)) return false;
+    if (!writer.WriteColumn(LogicOpPtr(), kLogicOpSize * m_size)) return false;
+    if (!writer.WriteColumn(AttachmentPtr(), kAttachmentSize * m_size)) return false;
+    if (!writer.WriteColumn(BlendConstantPtr(), kBlendConstantSize * m_size)) return false;
+    if (!writer.WriteColumn(LRZEnabledPtr(), kLRZEnabledSize * m_size)) return false;
+    if (!writer.WriteColumn(LRZWritePtr(), kLRZWriteSize * m_size)) return false;
+    if (!writer.WriteColumn(LRZDirStatusPtr(), kLRZDirStatusSize * m_size)) return false;
+    if (!writer.WriteColumn(LRZDirWritePtr(), kLRZDirWriteSize * m_size)) return false;
+    if (!writer.WriteColumn(ZTestModePtr(), kZTestModeSize * m_size)) return false;
+    if (!writer.WriteColumn(BinWPtr(), kBinWSize * m_size)) return false;
+    if (!writer.WriteColumn(BinHPtr(), kBinHSize * m_size)) return false;
+    if (!writer.WriteColumn(WindowScissorTLXPtr(), kWindowScissorTLXSize * m_size)) return false;
+    if (!writer.WriteColumn(WindowScissorTLYPtr(), kWindowScissorTLYSize * m_size)) return false;
+    if (!writer.WriteColumn(WindowScissorBRXPtr(), kWindowScissorBRXSize * m_size)) return false;
+    if (!writer.WriteColumn(WindowScissorBRYPtr(), kWindowScissorBRYSize * m_size)) return false;
+    if (!writer.WriteColumn(RenderModePtr(), kRenderModeSize * m_size)) return false;
+    if (!writer.WriteColumn(BuffersLocationPtr(), kBuffersLocationSize * m_size)) return false;
+    if (!writer.WriteColumn(ThreadSizePtr(), kThreadSizeSize * m_size)) return false;
+    if (!writer.WriteColumn(EnableAllHelperLanesPtr(), kEnableAllHelperLanesSize * m_size))
+        return false;
+    if (!writer.WriteColumn(EnablePartialHelperLanesPtr(), kEnablePartialHelperLanesSize * m_size))
+        return false;
+    if (!writer.WriteColumn(UBWCEnabledPtr(), kUBWCEnabledSize * m_size)) return false;
+    if (!writer.WriteColumn(UBWCLosslessEnabledPtr(), kUBWCLosslessEnabledSize * m_size))
+        return false;
+    if (!writer.WriteColumn(UBWCEnabledOnDSPtr(), kUBWCEnabledOnDSSize * m_size)) return false;
+    if (!writer.WriteColumn(UBWCLosslessEnabledOnDSPtr(), kUBWCLosslessEnabledOnDSSize * m_size))
+        return false;
+    if (!writer.WriteColumn(ResolveScissorPtr(), kResolveScissorSize * m_size)) return false;
+    if (!writer.WriteColumn(ResolveBaseGmemPtr(), kResolveBaseGmemSize * m_size)) return false;
+    if (!writer.WriteColumn(ResolveBaseSysmemPtr(), kResolveBaseSysmemSize * m_size)) return false;
+    if (!writer.WriteColumn(ResolveFormatPtr(), kResolveFormatSize * m_size)) return false;
+    if (!writer.WriteColumn(ResolveTileModePtr(), kResolveTileModeSize * m_size)) return false;
+    if (!writer.WriteColumn(m_is_set_buffer.data(), (m_size * kNumFields + 7) / 8)) return false;
+    return writer.Close();
+}
+
+template <>
+bool EventStateInfoT<EventStateInfo_CONFIG>::LoadColumns(const void* data, size_t size)
+{
+    Clear();
+    SoaColumnsReader reader(data, size);
+    if (!reader.ReadHeader(kColumnsSpecHash, ColumnsSchema()) ||
+        reader.Size() > std::numeric_limits<typename Id::basic_type>::max())
+        return false;
+    auto new_size = static_cast<typename Id::basic_type>(reader.Size());
+    Reserve(new_size);
+    const void* column = nullptr;
+    if ((column = reader.NextColumn(kTopologySize * new_size)) == nullptr) return false;
+    memcpy(TopologyPtr(), column, kTopologySize * new_size);
+    if ((column = reader.NextColumn(kPrimRestartEnabledSize * new_size)) == nullptr) return false;
+    memcpy(PrimRestartEnabledPtr(), column, kPrimRestartEnabledSize * new_size);
+    if ((column = reader.NextColumn(kPatchControlPointsSize * new_size)) == nullptr) return false;
+    memcpy(PatchControlPointsPtr(), column, kPatchControlPointsSize * new_size);
+    if ((column = reader.NextColumn(kViewportSize * new_size)) == nullptr) return false;
+    memcpy(ViewportPtr(), column, kViewportSize * new_size);
+    if ((column = reader.NextColumn(kScissorSize * new_size)) == nullptr) return false;
+    memcpy(ScissorPtr(), column, kScissorSize * new_size);
+    if ((column = reader.NextColumn(kDepthClampEnabledSize * new_size)) == nullptr) return false;
+    memcpy(DepthClampEnabledPtr(), column, kDepthClampEnabledSize * new_size);
+    if ((column = reader.NextColumn(kRasterizerDiscardEnabledSize * new_size)) == nullptr)
+        return false;
+    memcpy(RasterizerDiscardEnabledPtr(), column, kRasterizerDiscardEnabledSize * new_size);
+    if ((column = reader.NextColumn(kPolygonModeSize * new_size)) == nullptr) return false;
+    memcpy(PolygonModePtr(), column, kPolygonModeSize * new_size);
+    if ((column = reader.NextColumn(kCullModeSize * new_size)) == nullptr) return false;
+    memcpy(CullModePtr(), column, kCullModeSize * new_size);
+    if ((column = reader.NextColumn(kFrontFaceSize * new_size)) == nullptr) return false;
+    memcpy(FrontFacePtr(), column, kFrontFaceSize * new_size);
+    if ((column = reader.NextColumn(kDepthBiasEnabledSize * new_size)) == nullptr) return false;
+    memcpy(DepthBiasEnabledPtr(), column, kDepthBiasEnabledSize * new_size);
+    if ((column = reader.NextColumn(kDepthBiasConstantFactorSize * new_size)) == nullptr)
+        return false;
+    memcpy(DepthBiasConstantFactorPtr(), column, kDepthBiasConstantFactorSize * new_size);
+    if ((column = reader.NextColumn(kDepthBiasClampSize * new_size)) == nullptr) return false;
+    memcpy(DepthBiasClampPtr(), column, kDepthBiasClampSize * new_size);
+    if ((column = reader.NextColumn(kDepthBiasSlopeFactorSize * new_size)) == nullptr) return false;
+    memcpy(DepthBiasSlopeFactorPtr(), column, kDepthBiasSlopeFactorSize * new_size);
+    if ((column = reader.NextColumn(kLineWidthSize * new_size)) == nullptr) return false;
+    memcpy(LineWidthPtr(), column, kLineWidthSize * new_size);
+    if ((column = reader.NextColumn(kRasterizationSamplesSize * new_size)) == nullptr) return false;
+    memcpy(RasterizationSamplesPtr(), column, kRasterizationSamplesSize * new_size);
+    if ((column = reader.NextColumn(kSampleShadingEnabledSize * new_size)) == nullptr) return false;
+    memcpy(SampleShadingEnabledPtr(), column, kSampleShadingEnabledSize * new_size);
+    if ((column = reader.NextColumn(kMinSampleShadingSize * new_size)) == nullptr) return false;
+    memcpy(MinSampleShadingPtr(), column, kMinSampleShadingSize * new_size);
+    if ((column = reader.NextColumn(kSampleMaskSize * new_size)) == nullptr) return false;
+    memcpy(SampleMaskPtr(), column, kSampleMaskSize * new_size);
+    if ((column = reader.NextColumn(kAlphaToCoverageEnabledSize * new_size)) == nullptr)
+        return false;
+    memcpy(AlphaToCoverageEnabledPtr(), column, kAlphaToCoverageEnabledSize * new_size);
+    if ((column = reader.NextColumn(kDepthTestEnabledSize * new_size)) == nullptr) return false;
+    memcpy(DepthTestEnabledPtr(), column, kDepthTestEnabledSize * new_size);
+    if ((column = reader.NextColumn(kDepthWriteEnabledSize * new_size)) == nullptr) return false;
+    memcpy(DepthWriteEnabledPtr(), column, kDepthWriteEnabledSize * new_size);
+    if ((column = reader.NextColumn(kDepthCompareOpSize * new_size)) == nullptr) return false;
+    memcpy(DepthCompareOpPtr(), column, kDepthCompareOpSize * new_size);
+    if ((column = reader.NextColumn(kDepthBoundsTestEnabledSize * new_size)) == nullptr)
+        return false;
+    memcpy(DepthBoundsTestEnabledPtr(), column, kDepthBoundsTestEnabledSize * new_size);
+    if ((column = reader.NextColumn(kMinDepthBoundsSize * new_size)) == nullptr) return false;
+    memcpy(MinDepthBoundsPtr(), column, kMinDepthBoundsSize * new_size);
+    if ((column = reader.NextColumn(kMaxDepthBoundsSize * new_size)) == nullptr) return false;
+    memcpy(MaxDepthBoundsPtr(), column, kMaxDepthBoundsSize * new_size);
+    if ((column = reader.NextColumn(kStencilTestEnabledSize * new_size)) == nullptr) return false;
+    memcpy(StencilTestEnabledPtr(), column, kStencilTestEnabledSize * new_size);
+    if ((column = reader.NextColumn(kStencilOpStateFrontSize * new_size)) == nullptr) return false;
+    memcpy(StencilOpStateFrontPtr(), column, kStencilOpStateFrontSize * new_size);
+    if ((column = reader.NextColumn(kStencilOpStateBackSize * new_size)) == nullptr) return false;
+    memcpy(StencilOpStateBackPtr(), column, kStencilOpStateBackSize * new_size);
+    if ((column = reader.NextColumn(kLogicOpEnabledSize * new_size)) == nullptr) return false;
+    memcpy(LogicOpEnabledPtr(), column, kLogicOpEnabledSize * new_size);
+    if ((column = reader.NextColumn(kLogicOpSize * new_size)) == nullptr) return false;
+    memcpy(LogicOpPtr(), column, kLogicOpSize * new_size);
+    if ((column = reader.NextColumn(kAttachmentSize * new_size)) == nullptr) return false;
+    memcpy(AttachmentPtr(), column, kAttachmentSize * new_size);
+    if ((column = reader.NextColumn(kBlendConstantSize * new_size)) == nullptr) return false;
+    memcpy(BlendConstantPtr(), column, kBlendConstantSize * new_size);
+    if ((column = reader.NextColumn(kLRZEnabledSize * new_size)) == nullptr) return false;
+    memcpy(LRZEnabledPtr(), column, kLRZEnabledSize * new_size);
+    if ((column = reader.NextColumn(kLRZWriteSize * new_size)) == nullptr) return false;
+    memcpy(LRZWritePtr(), column, kLRZWriteSize * new_size);
+    if ((column = reader.NextColumn(kLRZDirStatusSize * new_size)) == nullptr) return false;
+    memcpy(LRZDirStatusPtr(), column, kLRZDirStatusSize * new_size);
+    if ((column = reader.NextColumn(kLRZDirWriteSize * new_size)) == nullptr) return false;
+    memcpy(LRZDirWritePtr(), column, kLRZDirWriteSize * new_size);
+    if ((column = reader.NextColumn(kZTestModeSize * new_size)) == nullptr) return false;
+    memcpy(ZTestModePtr(), column, kZTestModeSize * new_size);
+    if ((column = reader.NextColumn(kBinWSize * new_size)) == nullptr) return false;
+    memcpy(BinWPtr(), column, kBinWSize * new_size);
+    if ((column = reader.NextColumn(kBinHSize * new_size)) == nullptr) return false;
+    memcpy(BinHPtr(), column, kBinHSize * new_size);
+    if ((column = reader.NextColumn(kWindowScissorTLXSize * new_size)) == nullptr) return false;
+    memcpy(WindowScissorTLXPtr(), column, kWindowScissorTLXSize * new_size);
+    if ((column = reader.NextColumn(kWindowScissorTLYSize * new_size)) == nullptr) return false;
+    memcpy(WindowScissorTLYPtr(), column, kWindowScissorTLYSize * new_size);
+    if ((column = reader.NextColumn(kWindowScissorBRXSize * new_size)) == nullptr) return false;
+    memcpy(WindowScissorBRXPtr(), column, kWindowScissorBRXSize * new_size);
+    if ((column = reader.NextColumn(kWindowScissorBRYSize * new_size)) == nullptr) return false;
+    memcpy(WindowScissorBRYPtr(), column, kWindowScissorBRYSize * new_size);
+    if ((column = reader.NextColumn(kRenderModeSize * new_size)) == nullptr) return false;
+    memcpy(RenderModePtr(), column, kRenderModeSize * new_size);
+    if ((column = reader.NextColumn(kBuffersLocationSize * new_size)) == nullptr) return false;
+    memcpy(BuffersLocationPtr(), column, kBuffersLocationSize * new_size);
+    if ((column = reader.NextColumn(kThreadSizeSize * new_size)) == nullptr) return false;
+    memcpy(ThreadSizePtr(), column, kThreadSizeSize * new_size);
+    if ((column = reader.NextColumn(kEnableAllHelperLanesSize * new_size)) == nullptr) return false;
+    memcpy(EnableAllHelperLanesPtr(), column, kEnableAllHelperLanesSize * new_size);
+    if ((column = reader.NextColumn(kEnablePartialHelperLanesSize * new_size)) == nullptr)
+        return false;
+    memcpy(EnablePartialHelperLanesPtr(), column, kEnablePartialHelperLanesSize * new_size);
+    if ((column = reader.NextColumn(kUBWCEnabledSize * new_size)) == nullptr) return false;
+    memcpy(UBWCEnabledPtr(), column, kUBWCEnabledSize * new_size);
+    if ((column = reader.NextColumn(kUBWCLosslessEnabledSize * new_size)) == nullptr) return false;
+    memcpy(UBWCLosslessEnabledPtr(), column, kUBWCLosslessEnabledSize * new_size);
+    if ((column = reader.NextColumn(kUBWCEnabledOnDSSize * new_size)) == nullptr) return false;
+    memcpy(UBWCEnabledOnDSPtr(), column, kUBWCEnabledOnDSSize * new_size);
+    if ((column = reader.NextColumn(kUBWCLosslessEnabledOnDSSize * new_size)) == nullptr)
+        return false;
+    memcpy(UBWCLosslessEnabledOnDSPtr(), column, kUBWCLosslessEnabledOnDSSize * new_size);
+    if ((column = reader.NextColumn(kResolveScissorSize * new_size)) == nullptr) return false;
+    memcpy(ResolveScissorPtr(), column, kResolveScissorSize * new_size);
+    if ((column = reader.NextColumn(kResolveBaseGmemSize * new_size)) == nullptr) return false;
+    memcpy(ResolveBaseGmemPtr(), column, kResolveBaseGmemSize * new_size);
+    if ((column = reader.NextColumn(kResolveBaseSysmemSize * new_size)) == nullptr) return false;
+    memcpy(ResolveBaseSysmemPtr(), column, kResolveBaseSysmemSize * new_size);
+    if ((column = reader.NextColumn(kResolveFormatSize * new_size)) == nullptr) return false;
+    memcpy(ResolveFormatPtr(), column, kResolveFormatSize * new_size);
+    if ((column = reader.NextColumn(kResolveTileModeSize * new_size)) == nullptr) return false;
+    memcpy(ResolveTileModePtr(), column, kResolveTileModeSize * new_size);
+    if ((column = reader.NextColumn((new_size * kNumFields + 7) / 8)) == nullptr) return false;
+    std::fill(m_is_set_buffer.begin(), m_is_set_buffer.end(), 0);
+    memcpy(m_is_set_buffer.data(), column, (new_size * kNumFields + 7) / 8);
+    m_size = new_size;
+    return true;
+}
+
+template <>
+bool EventStateInfoT<EventStateInfo_CONFIG>::LoadColumns(const char* file_name)
+{
+    Clear();
+    ReadOnlyFileMapping mapping;
+    if (!mapping.Open(file_name)) return false;
+    return LoadColumns(mapping.Data(), mapping.Size());
+}
+
 }  // namespace Dive
@@ -29,6 +29,7 @@
 #include "common.h"
 #include "dive_core/common/gpudefs.h"
 #include "info_id.h"
+#include "soa_columns.h"
 #include "struct_of_arrays.h"
 #include "vulkan/vulkan_core.h"
 
@@ -5011,6 +5012,14 @@ class EventStateInfoT
         return (m_is_set_buffer[bit / 8] & (1 << (bit % 8))) != 0;
     }
 
+    // 'MarkFieldSetRange()' marks a field as set for the `count` elements starting at `first`
+    inline void MarkFieldSetRange(Id first, typename Id::basic_type count, uint32_t field_index)
+    {
+        uint32_t bit = static_cast<typename Id::basic_type>(first) * kNumFields + field_index;
+        for (typename Id::basic_type i = 0; i < count; ++i, bit += kNumFields)
+            m_is_set_buffer[bit / 8] |= (1 << (bit % 8));
+    }
+
     //-----------------------------------------------
     // FIELD Topology: The primitive topology for this event
 
@@ -5058,6 +5067,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillTopology(first,count,value)` sets the `Topology` element of the `count` objects starting
+    // at `first`
+    inline SOA& FillTopology(Id first, typename Id::basic_type count, VkPrimitiveTopology value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint32_t* dst = TopologyPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = static_cast<uint32_t>(value);
+        MarkFieldSetRange(first, count, kTopologyIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherTopology(ids,count,values)` reads the `Topology` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherTopology(const Id* ids, size_t count, VkPrimitiveTopology* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = static_cast<VkPrimitiveTopology>(*TopologyPtr(ids[i]));
+        }
+    }
+
+    // `ScatterTopology(ids,count,values)` sets the `Topology` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterTopology(const Id* ids, size_t count, const VkPrimitiveTopology* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *TopologyPtr(ids[i]) = static_cast<uint32_t>(values[i]);
+            MarkFieldSet(ids[i], kTopologyIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsTopologySet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5121,6 +5165,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillPrimRestartEnabled(first,count,value)` sets the `PrimRestartEnabled` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillPrimRestartEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = PrimRestartEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kPrimRestartEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherPrimRestartEnabled(ids,count,values)` reads the `PrimRestartEnabled` element of each
+    // of the `count` objects identified by `ids` into `values`
+    inline void GatherPrimRestartEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*PrimRestartEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterPrimRestartEnabled(ids,count,values)` sets the `PrimRestartEnabled` element of each
+    // of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterPrimRestartEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *PrimRestartEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kPrimRestartEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsPrimRestartEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5184,6 +5263,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillPatchControlPoints(first,count,value)` sets the `PatchControlPoints` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillPatchControlPoints(Id first, typename Id::basic_type count, uint32_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint32_t* dst = PatchControlPointsPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kPatchControlPointsIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherPatchControlPoints(ids,count,values)` reads the `PatchControlPoints` element of each
+    // of the `count` objects identified by `ids` into `values`
+    inline void GatherPatchControlPoints(const Id* ids, size_t count, uint32_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*PatchControlPointsPtr(ids[i]));
+        }
+    }
+
+    // `ScatterPatchControlPoints(ids,count,values)` sets the `PatchControlPoints` element of each
+    // of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterPatchControlPoints(const Id* ids, size_t count, const uint32_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *PatchControlPointsPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kPatchControlPointsIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsPatchControlPointsSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5252,6 +5366,44 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillViewport(first,count,value)` sets the `Viewport` element of the `count` objects starting
+    // at `first`
+    inline SOA& FillViewport(Id first, typename Id::basic_type count, uint32_t viewport,
+                             VkViewport value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkViewport* dst = ViewportPtr(first, viewport);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i * kViewportArrayCount] = (value);
+        MarkFieldSetRange(first, count, kViewportIndex + viewport);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherViewport(ids,count,values)` reads the `Viewport` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherViewport(const Id* ids, size_t count, uint32_t viewport,
+                               VkViewport* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ViewportPtr(ids[i], viewport));
+        }
+    }
+
+    // `ScatterViewport(ids,count,values)` sets the `Viewport` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterViewport(const Id* ids, size_t count, uint32_t viewport,
+                                const VkViewport* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ViewportPtr(ids[i], viewport) = (values[i]);
+            MarkFieldSet(ids[i], kViewportIndex + viewport);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsViewportSet(Id id, uint32_t viewport) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5317,6 +5469,43 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillScissor(first,count,value)` sets the `Scissor` element of the `count` objects starting
+    // at `first`
+    inline SOA& FillScissor(Id first, typename Id::basic_type count, uint32_t scissor,
+                            VkRect2D value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkRect2D* dst = ScissorPtr(first, scissor);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i * kScissorArrayCount] = (value);
+        MarkFieldSetRange(first, count, kScissorIndex + scissor);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherScissor(ids,count,values)` reads the `Scissor` element of each of the `count` objects
+    // identified by `ids` into `values`
+    inline void GatherScissor(const Id* ids, size_t count, uint32_t scissor, VkRect2D* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ScissorPtr(ids[i], scissor));
+        }
+    }
+
+    // `ScatterScissor(ids,count,values)` sets the `Scissor` element of each of the `count` objects
+    // identified by `ids` from `values`
+    inline SOA& ScatterScissor(const Id* ids, size_t count, uint32_t scissor,
+                               const VkRect2D* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ScissorPtr(ids[i], scissor) = (values[i]);
+            MarkFieldSet(ids[i], kScissorIndex + scissor);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsScissorSet(Id id, uint32_t scissor) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5379,6 +5568,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthClampEnabled(first,count,value)` sets the `DepthClampEnabled` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillDepthClampEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = DepthClampEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthClampEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthClampEnabled(ids,count,values)` reads the `DepthClampEnabled` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherDepthClampEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthClampEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthClampEnabled(ids,count,values)` sets the `DepthClampEnabled` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthClampEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthClampEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthClampEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthClampEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5442,6 +5666,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillRasterizerDiscardEnabled(first,count,value)` sets the `RasterizerDiscardEnabled` element
+    // of the `count` objects starting at `first`
+    inline SOA& FillRasterizerDiscardEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = RasterizerDiscardEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kRasterizerDiscardEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherRasterizerDiscardEnabled(ids,count,values)` reads the `RasterizerDiscardEnabled`
+    // element of each of the `count` objects identified by `ids` into `values`
+    inline void GatherRasterizerDiscardEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*RasterizerDiscardEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterRasterizerDiscardEnabled(ids,count,values)` sets the `RasterizerDiscardEnabled`
+    // element of each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterRasterizerDiscardEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *RasterizerDiscardEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kRasterizerDiscardEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsRasterizerDiscardEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5506,6 +5765,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillPolygonMode(first,count,value)` sets the `PolygonMode` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillPolygonMode(Id first, typename Id::basic_type count, VkPolygonMode value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkPolygonMode* dst = PolygonModePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kPolygonModeIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherPolygonMode(ids,count,values)` reads the `PolygonMode` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherPolygonMode(const Id* ids, size_t count, VkPolygonMode* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*PolygonModePtr(ids[i]));
+        }
+    }
+
+    // `ScatterPolygonMode(ids,count,values)` sets the `PolygonMode` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterPolygonMode(const Id* ids, size_t count, const VkPolygonMode* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *PolygonModePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kPolygonModeIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsPolygonModeSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5563,6 +5857,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillCullMode(first,count,value)` sets the `CullMode` element of the `count` objects starting
+    // at `first`
+    inline SOA& FillCullMode(Id first, typename Id::basic_type count, VkCullModeFlags value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkCullModeFlags* dst = CullModePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kCullModeIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherCullMode(ids,count,values)` reads the `CullMode` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherCullMode(const Id* ids, size_t count, VkCullModeFlags* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*CullModePtr(ids[i]));
+        }
+    }
+
+    // `ScatterCullMode(ids,count,values)` sets the `CullMode` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterCullMode(const Id* ids, size_t count, const VkCullModeFlags* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *CullModePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kCullModeIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsCullModeSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5624,6 +5953,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillFrontFace(first,count,value)` sets the `FrontFace` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillFrontFace(Id first, typename Id::basic_type count, VkFrontFace value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkFrontFace* dst = FrontFacePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kFrontFaceIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherFrontFace(ids,count,values)` reads the `FrontFace` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherFrontFace(const Id* ids, size_t count, VkFrontFace* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*FrontFacePtr(ids[i]));
+        }
+    }
+
+    // `ScatterFrontFace(ids,count,values)` sets the `FrontFace` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterFrontFace(const Id* ids, size_t count, const VkFrontFace* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *FrontFacePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kFrontFaceIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsFrontFaceSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5686,6 +6050,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthBiasEnabled(first,count,value)` sets the `DepthBiasEnabled` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillDepthBiasEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = DepthBiasEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthBiasEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthBiasEnabled(ids,count,values)` reads the `DepthBiasEnabled` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherDepthBiasEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthBiasEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthBiasEnabled(ids,count,values)` sets the `DepthBiasEnabled` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthBiasEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthBiasEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthBiasEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthBiasEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5749,6 +6148,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthBiasConstantFactor(first,count,value)` sets the `DepthBiasConstantFactor` element
+    // of the `count` objects starting at `first`
+    inline SOA& FillDepthBiasConstantFactor(Id first, typename Id::basic_type count, float value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        float* dst = DepthBiasConstantFactorPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthBiasConstantFactorIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthBiasConstantFactor(ids,count,values)` reads the `DepthBiasConstantFactor` element
+    // of each of the `count` objects identified by `ids` into `values`
+    inline void GatherDepthBiasConstantFactor(const Id* ids, size_t count, float* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthBiasConstantFactorPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthBiasConstantFactor(ids,count,values)` sets the `DepthBiasConstantFactor` element
+    // of each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthBiasConstantFactor(const Id* ids, size_t count, const float* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthBiasConstantFactorPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthBiasConstantFactorIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthBiasConstantFactorSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5810,6 +6244,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthBiasClamp(first,count,value)` sets the `DepthBiasClamp` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillDepthBiasClamp(Id first, typename Id::basic_type count, float value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        float* dst = DepthBiasClampPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthBiasClampIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthBiasClamp(ids,count,values)` reads the `DepthBiasClamp` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherDepthBiasClamp(const Id* ids, size_t count, float* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthBiasClampPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthBiasClamp(ids,count,values)` sets the `DepthBiasClamp` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthBiasClamp(const Id* ids, size_t count, const float* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthBiasClampPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthBiasClampIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthBiasClampSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5873,6 +6342,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthBiasSlopeFactor(first,count,value)` sets the `DepthBiasSlopeFactor` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillDepthBiasSlopeFactor(Id first, typename Id::basic_type count, float value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        float* dst = DepthBiasSlopeFactorPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthBiasSlopeFactorIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthBiasSlopeFactor(ids,count,values)` reads the `DepthBiasSlopeFactor` element of
+    // each of the `count` objects identified by `ids` into `values`
+    inline void GatherDepthBiasSlopeFactor(const Id* ids, size_t count, float* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthBiasSlopeFactorPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthBiasSlopeFactor(ids,count,values)` sets the `DepthBiasSlopeFactor` element of
+    // each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthBiasSlopeFactor(const Id* ids, size_t count, const float* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthBiasSlopeFactorPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthBiasSlopeFactorIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthBiasSlopeFactorSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5933,6 +6437,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillLineWidth(first,count,value)` sets the `LineWidth` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillLineWidth(Id first, typename Id::basic_type count, float value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        float* dst = LineWidthPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kLineWidthIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherLineWidth(ids,count,values)` reads the `LineWidth` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherLineWidth(const Id* ids, size_t count, float* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*LineWidthPtr(ids[i]));
+        }
+    }
+
+    // `ScatterLineWidth(ids,count,values)` sets the `LineWidth` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterLineWidth(const Id* ids, size_t count, const float* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *LineWidthPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kLineWidthIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsLineWidthSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -5996,6 +6535,44 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillRasterizationSamples(first,count,value)` sets the `RasterizationSamples` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillRasterizationSamples(Id first, typename Id::basic_type count,
+                                         VkSampleCountFlagBits value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkSampleCountFlagBits* dst = RasterizationSamplesPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kRasterizationSamplesIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherRasterizationSamples(ids,count,values)` reads the `RasterizationSamples` element of
+    // each of the `count` objects identified by `ids` into `values`
+    inline void GatherRasterizationSamples(const Id* ids, size_t count,
+                                           VkSampleCountFlagBits* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*RasterizationSamplesPtr(ids[i]));
+        }
+    }
+
+    // `ScatterRasterizationSamples(ids,count,values)` sets the `RasterizationSamples` element of
+    // each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterRasterizationSamples(const Id* ids, size_t count,
+                                            const VkSampleCountFlagBits* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *RasterizationSamplesPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kRasterizationSamplesIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsRasterizationSamplesSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6059,6 +6636,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillSampleShadingEnabled(first,count,value)` sets the `SampleShadingEnabled` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillSampleShadingEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = SampleShadingEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kSampleShadingEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherSampleShadingEnabled(ids,count,values)` reads the `SampleShadingEnabled` element of
+    // each of the `count` objects identified by `ids` into `values`
+    inline void GatherSampleShadingEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*SampleShadingEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterSampleShadingEnabled(ids,count,values)` sets the `SampleShadingEnabled` element of
+    // each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterSampleShadingEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *SampleShadingEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kSampleShadingEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsSampleShadingEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6121,6 +6733,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillMinSampleShading(first,count,value)` sets the `MinSampleShading` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillMinSampleShading(Id first, typename Id::basic_type count, float value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        float* dst = MinSampleShadingPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kMinSampleShadingIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherMinSampleShading(ids,count,values)` reads the `MinSampleShading` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherMinSampleShading(const Id* ids, size_t count, float* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*MinSampleShadingPtr(ids[i]));
+        }
+    }
+
+    // `ScatterMinSampleShading(ids,count,values)` sets the `MinSampleShading` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterMinSampleShading(const Id* ids, size_t count, const float* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *MinSampleShadingPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kMinSampleShadingIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsMinSampleShadingSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6183,6 +6830,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillSampleMask(first,count,value)` sets the `SampleMask` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillSampleMask(Id first, typename Id::basic_type count, VkSampleMask value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkSampleMask* dst = SampleMaskPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kSampleMaskIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherSampleMask(ids,count,values)` reads the `SampleMask` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherSampleMask(const Id* ids, size_t count, VkSampleMask* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*SampleMaskPtr(ids[i]));
+        }
+    }
+
+    // `ScatterSampleMask(ids,count,values)` sets the `SampleMask` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterSampleMask(const Id* ids, size_t count, const VkSampleMask* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *SampleMaskPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kSampleMaskIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsSampleMaskSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6247,6 +6929,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillAlphaToCoverageEnabled(first,count,value)` sets the `AlphaToCoverageEnabled` element of
+    // the `count` objects starting at `first`
+    inline SOA& FillAlphaToCoverageEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = AlphaToCoverageEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kAlphaToCoverageEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherAlphaToCoverageEnabled(ids,count,values)` reads the `AlphaToCoverageEnabled` element
+    // of each of the `count` objects identified by `ids` into `values`
+    inline void GatherAlphaToCoverageEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*AlphaToCoverageEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterAlphaToCoverageEnabled(ids,count,values)` sets the `AlphaToCoverageEnabled` element
+    // of each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterAlphaToCoverageEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *AlphaToCoverageEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kAlphaToCoverageEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsAlphaToCoverageEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6309,6 +7026,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthTestEnabled(first,count,value)` sets the `DepthTestEnabled` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillDepthTestEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = DepthTestEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthTestEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthTestEnabled(ids,count,values)` reads the `DepthTestEnabled` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherDepthTestEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthTestEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthTestEnabled(ids,count,values)` sets the `DepthTestEnabled` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthTestEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthTestEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthTestEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthTestEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6372,6 +7124,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthWriteEnabled(first,count,value)` sets the `DepthWriteEnabled` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillDepthWriteEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = DepthWriteEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthWriteEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthWriteEnabled(ids,count,values)` reads the `DepthWriteEnabled` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherDepthWriteEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthWriteEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthWriteEnabled(ids,count,values)` sets the `DepthWriteEnabled` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthWriteEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthWriteEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthWriteEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthWriteEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6434,6 +7221,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthCompareOp(first,count,value)` sets the `DepthCompareOp` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillDepthCompareOp(Id first, typename Id::basic_type count, VkCompareOp value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkCompareOp* dst = DepthCompareOpPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthCompareOpIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthCompareOp(ids,count,values)` reads the `DepthCompareOp` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherDepthCompareOp(const Id* ids, size_t count, VkCompareOp* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthCompareOpPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthCompareOp(ids,count,values)` sets the `DepthCompareOp` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthCompareOp(const Id* ids, size_t count, const VkCompareOp* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthCompareOpPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthCompareOpIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthCompareOpSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6496,6 +7318,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillDepthBoundsTestEnabled(first,count,value)` sets the `DepthBoundsTestEnabled` element of
+    // the `count` objects starting at `first`
+    inline SOA& FillDepthBoundsTestEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = DepthBoundsTestEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kDepthBoundsTestEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherDepthBoundsTestEnabled(ids,count,values)` reads the `DepthBoundsTestEnabled` element
+    // of each of the `count` objects identified by `ids` into `values`
+    inline void GatherDepthBoundsTestEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*DepthBoundsTestEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterDepthBoundsTestEnabled(ids,count,values)` sets the `DepthBoundsTestEnabled` element
+    // of each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterDepthBoundsTestEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *DepthBoundsTestEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kDepthBoundsTestEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsDepthBoundsTestEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6557,6 +7414,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillMinDepthBounds(first,count,value)` sets the `MinDepthBounds` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillMinDepthBounds(Id first, typename Id::basic_type count, float value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        float* dst = MinDepthBoundsPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kMinDepthBoundsIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherMinDepthBounds(ids,count,values)` reads the `MinDepthBounds` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherMinDepthBounds(const Id* ids, size_t count, float* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*MinDepthBoundsPtr(ids[i]));
+        }
+    }
+
+    // `ScatterMinDepthBounds(ids,count,values)` sets the `MinDepthBounds` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterMinDepthBounds(const Id* ids, size_t count, const float* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *MinDepthBoundsPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kMinDepthBoundsIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsMinDepthBoundsSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6618,6 +7510,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillMaxDepthBounds(first,count,value)` sets the `MaxDepthBounds` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillMaxDepthBounds(Id first, typename Id::basic_type count, float value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        float* dst = MaxDepthBoundsPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kMaxDepthBoundsIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherMaxDepthBounds(ids,count,values)` reads the `MaxDepthBounds` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherMaxDepthBounds(const Id* ids, size_t count, float* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*MaxDepthBoundsPtr(ids[i]));
+        }
+    }
+
+    // `ScatterMaxDepthBounds(ids,count,values)` sets the `MaxDepthBounds` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterMaxDepthBounds(const Id* ids, size_t count, const float* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *MaxDepthBoundsPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kMaxDepthBoundsIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsMaxDepthBoundsSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6680,6 +7607,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillStencilTestEnabled(first,count,value)` sets the `StencilTestEnabled` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillStencilTestEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = StencilTestEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kStencilTestEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherStencilTestEnabled(ids,count,values)` reads the `StencilTestEnabled` element of each
+    // of the `count` objects identified by `ids` into `values`
+    inline void GatherStencilTestEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*StencilTestEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterStencilTestEnabled(ids,count,values)` sets the `StencilTestEnabled` element of each
+    // of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterStencilTestEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *StencilTestEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kStencilTestEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsStencilTestEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6742,6 +7704,44 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillStencilOpStateFront(first,count,value)` sets the `StencilOpStateFront` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillStencilOpStateFront(Id first, typename Id::basic_type count,
+                                        VkStencilOpState value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkStencilOpState* dst = StencilOpStateFrontPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kStencilOpStateFrontIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherStencilOpStateFront(ids,count,values)` reads the `StencilOpStateFront` element of each
+    // of the `count` objects identified by `ids` into `values`
+    inline void GatherStencilOpStateFront(const Id* ids, size_t count,
+                                          VkStencilOpState* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*StencilOpStateFrontPtr(ids[i]));
+        }
+    }
+
+    // `ScatterStencilOpStateFront(ids,count,values)` sets the `StencilOpStateFront` element of each
+    // of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterStencilOpStateFront(const Id* ids, size_t count,
+                                           const VkStencilOpState* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *StencilOpStateFrontPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kStencilOpStateFrontIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsStencilOpStateFrontSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6804,6 +7804,44 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillStencilOpStateBack(first,count,value)` sets the `StencilOpStateBack` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillStencilOpStateBack(Id first, typename Id::basic_type count,
+                                       VkStencilOpState value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkStencilOpState* dst = StencilOpStateBackPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kStencilOpStateBackIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherStencilOpStateBack(ids,count,values)` reads the `StencilOpStateBack` element of each
+    // of the `count` objects identified by `ids` into `values`
+    inline void GatherStencilOpStateBack(const Id* ids, size_t count,
+                                         VkStencilOpState* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*StencilOpStateBackPtr(ids[i]));
+        }
+    }
+
+    // `ScatterStencilOpStateBack(ids,count,values)` sets the `StencilOpStateBack` element of each
+    // of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterStencilOpStateBack(const Id* ids, size_t count,
+                                          const VkStencilOpState* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *StencilOpStateBackPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kStencilOpStateBackIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsStencilOpStateBackSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6876,6 +7914,45 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillLogicOpEnabled(first,count,value)` sets the `LogicOpEnabled` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillLogicOpEnabled(Id first, typename Id::basic_type count, uint32_t attachment,
+                                   bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = LogicOpEnabledPtr(first, attachment);
+        for (typename Id::basic_type i = 0; i < count; ++i)
+            dst[i * kLogicOpEnabledArrayCount] = (value);
+        MarkFieldSetRange(first, count, kLogicOpEnabledIndex + attachment);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherLogicOpEnabled(ids,count,values)` reads the `LogicOpEnabled` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherLogicOpEnabled(const Id* ids, size_t count, uint32_t attachment,
+                                     bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*LogicOpEnabledPtr(ids[i], attachment));
+        }
+    }
+
+    // `ScatterLogicOpEnabled(ids,count,values)` sets the `LogicOpEnabled` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterLogicOpEnabled(const Id* ids, size_t count, uint32_t attachment,
+                                      const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *LogicOpEnabledPtr(ids[i], attachment) = (values[i]);
+            MarkFieldSet(ids[i], kLogicOpEnabledIndex + attachment);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsLogicOpEnabledSet(Id id, uint32_t attachment) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -6944,6 +8021,44 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillLogicOp(first,count,value)` sets the `LogicOp` element of the `count` objects starting
+    // at `first`
+    inline SOA& FillLogicOp(Id first, typename Id::basic_type count, uint32_t attachment,
+                            VkLogicOp value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkLogicOp* dst = LogicOpPtr(first, attachment);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i * kLogicOpArrayCount] = (value);
+        MarkFieldSetRange(first, count, kLogicOpIndex + attachment);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherLogicOp(ids,count,values)` reads the `LogicOp` element of each of the `count` objects
+    // identified by `ids` into `values`
+    inline void GatherLogicOp(const Id* ids, size_t count, uint32_t attachment,
+                              VkLogicOp* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*LogicOpPtr(ids[i], attachment));
+        }
+    }
+
+    // `ScatterLogicOp(ids,count,values)` sets the `LogicOp` element of each of the `count` objects
+    // identified by `ids` from `values`
+    inline SOA& ScatterLogicOp(const Id* ids, size_t count, uint32_t attachment,
+                               const VkLogicOp* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *LogicOpPtr(ids[i], attachment) = (values[i]);
+            MarkFieldSet(ids[i], kLogicOpIndex + attachment);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsLogicOpSet(Id id, uint32_t attachment) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7013,6 +8128,45 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillAttachment(first,count,value)` sets the `Attachment` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillAttachment(Id first, typename Id::basic_type count, uint32_t attachment,
+                               VkPipelineColorBlendAttachmentState value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkPipelineColorBlendAttachmentState* dst = AttachmentPtr(first, attachment);
+        for (typename Id::basic_type i = 0; i < count; ++i)
+            dst[i * kAttachmentArrayCount] = (value);
+        MarkFieldSetRange(first, count, kAttachmentIndex + attachment);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherAttachment(ids,count,values)` reads the `Attachment` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherAttachment(const Id* ids, size_t count, uint32_t attachment,
+                                 VkPipelineColorBlendAttachmentState* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*AttachmentPtr(ids[i], attachment));
+        }
+    }
+
+    // `ScatterAttachment(ids,count,values)` sets the `Attachment` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterAttachment(const Id* ids, size_t count, uint32_t attachment,
+                                  const VkPipelineColorBlendAttachmentState* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *AttachmentPtr(ids[i], attachment) = (values[i]);
+            MarkFieldSet(ids[i], kAttachmentIndex + attachment);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsAttachmentSet(Id id, uint32_t attachment) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7085,6 +8239,45 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillBlendConstant(first,count,value)` sets the `BlendConstant` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillBlendConstant(Id first, typename Id::basic_type count, uint32_t channel,
+                                  float value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        float* dst = BlendConstantPtr(first, channel);
+        for (typename Id::basic_type i = 0; i < count; ++i)
+            dst[i * kBlendConstantArrayCount] = (value);
+        MarkFieldSetRange(first, count, kBlendConstantIndex + channel);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherBlendConstant(ids,count,values)` reads the `BlendConstant` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherBlendConstant(const Id* ids, size_t count, uint32_t channel,
+                                    float* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*BlendConstantPtr(ids[i], channel));
+        }
+    }
+
+    // `ScatterBlendConstant(ids,count,values)` sets the `BlendConstant` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterBlendConstant(const Id* ids, size_t count, uint32_t channel,
+                                     const float* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *BlendConstantPtr(ids[i], channel) = (values[i]);
+            MarkFieldSet(ids[i], kBlendConstantIndex + channel);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsBlendConstantSet(Id id, uint32_t channel) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7145,6 +8338,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillLRZEnabled(first,count,value)` sets the `LRZEnabled` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillLRZEnabled(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = LRZEnabledPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kLRZEnabledIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherLRZEnabled(ids,count,values)` reads the `LRZEnabled` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherLRZEnabled(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*LRZEnabledPtr(ids[i]));
+        }
+    }
+
+    // `ScatterLRZEnabled(ids,count,values)` sets the `LRZEnabled` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterLRZEnabled(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *LRZEnabledPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kLRZEnabledIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsLRZEnabledSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7205,6 +8433,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillLRZWrite(first,count,value)` sets the `LRZWrite` element of the `count` objects starting
+    // at `first`
+    inline SOA& FillLRZWrite(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = LRZWritePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kLRZWriteIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherLRZWrite(ids,count,values)` reads the `LRZWrite` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherLRZWrite(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*LRZWritePtr(ids[i]));
+        }
+    }
+
+    // `ScatterLRZWrite(ids,count,values)` sets the `LRZWrite` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterLRZWrite(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *LRZWritePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kLRZWriteIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsLRZWriteSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7262,6 +8525,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillLRZDirStatus(first,count,value)` sets the `LRZDirStatus` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillLRZDirStatus(Id first, typename Id::basic_type count, a6xx_lrz_dir_status value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        a6xx_lrz_dir_status* dst = LRZDirStatusPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kLRZDirStatusIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherLRZDirStatus(ids,count,values)` reads the `LRZDirStatus` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherLRZDirStatus(const Id* ids, size_t count, a6xx_lrz_dir_status* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*LRZDirStatusPtr(ids[i]));
+        }
+    }
+
+    // `ScatterLRZDirStatus(ids,count,values)` sets the `LRZDirStatus` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterLRZDirStatus(const Id* ids, size_t count, const a6xx_lrz_dir_status* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *LRZDirStatusPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kLRZDirStatusIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsLRZDirStatusSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7319,6 +8617,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillLRZDirWrite(first,count,value)` sets the `LRZDirWrite` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillLRZDirWrite(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = LRZDirWritePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kLRZDirWriteIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherLRZDirWrite(ids,count,values)` reads the `LRZDirWrite` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherLRZDirWrite(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*LRZDirWritePtr(ids[i]));
+        }
+    }
+
+    // `ScatterLRZDirWrite(ids,count,values)` sets the `LRZDirWrite` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterLRZDirWrite(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *LRZDirWritePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kLRZDirWriteIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsLRZDirWriteSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7379,6 +8712,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillZTestMode(first,count,value)` sets the `ZTestMode` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillZTestMode(Id first, typename Id::basic_type count, a6xx_ztest_mode value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        a6xx_ztest_mode* dst = ZTestModePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kZTestModeIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherZTestMode(ids,count,values)` reads the `ZTestMode` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherZTestMode(const Id* ids, size_t count, a6xx_ztest_mode* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ZTestModePtr(ids[i]));
+        }
+    }
+
+    // `ScatterZTestMode(ids,count,values)` sets the `ZTestMode` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterZTestMode(const Id* ids, size_t count, const a6xx_ztest_mode* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ZTestModePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kZTestModeIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsZTestModeSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7436,6 +8804,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillBinW(first,count,value)` sets the `BinW` element of the `count` objects starting at
+    // `first`
+    inline SOA& FillBinW(Id first, typename Id::basic_type count, uint32_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint32_t* dst = BinWPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kBinWIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherBinW(ids,count,values)` reads the `BinW` element of each of the `count` objects
+    // identified by `ids` into `values`
+    inline void GatherBinW(const Id* ids, size_t count, uint32_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*BinWPtr(ids[i]));
+        }
+    }
+
+    // `ScatterBinW(ids,count,values)` sets the `BinW` element of each of the `count` objects
+    // identified by `ids` from `values`
+    inline SOA& ScatterBinW(const Id* ids, size_t count, const uint32_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *BinWPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kBinWIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsBinWSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7493,6 +8896,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillBinH(first,count,value)` sets the `BinH` element of the `count` objects starting at
+    // `first`
+    inline SOA& FillBinH(Id first, typename Id::basic_type count, uint32_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint32_t* dst = BinHPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kBinHIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherBinH(ids,count,values)` reads the `BinH` element of each of the `count` objects
+    // identified by `ids` into `values`
+    inline void GatherBinH(const Id* ids, size_t count, uint32_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*BinHPtr(ids[i]));
+        }
+    }
+
+    // `ScatterBinH(ids,count,values)` sets the `BinH` element of each of the `count` objects
+    // identified by `ids` from `values`
+    inline SOA& ScatterBinH(const Id* ids, size_t count, const uint32_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *BinHPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kBinHIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsBinHSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7551,6 +8989,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillWindowScissorTLX(first,count,value)` sets the `WindowScissorTLX` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillWindowScissorTLX(Id first, typename Id::basic_type count, uint16_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint16_t* dst = WindowScissorTLXPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kWindowScissorTLXIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherWindowScissorTLX(ids,count,values)` reads the `WindowScissorTLX` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherWindowScissorTLX(const Id* ids, size_t count, uint16_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*WindowScissorTLXPtr(ids[i]));
+        }
+    }
+
+    // `ScatterWindowScissorTLX(ids,count,values)` sets the `WindowScissorTLX` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterWindowScissorTLX(const Id* ids, size_t count, const uint16_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *WindowScissorTLXPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kWindowScissorTLXIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsWindowScissorTLXSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7612,6 +9085,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillWindowScissorTLY(first,count,value)` sets the `WindowScissorTLY` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillWindowScissorTLY(Id first, typename Id::basic_type count, uint16_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint16_t* dst = WindowScissorTLYPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kWindowScissorTLYIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherWindowScissorTLY(ids,count,values)` reads the `WindowScissorTLY` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherWindowScissorTLY(const Id* ids, size_t count, uint16_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*WindowScissorTLYPtr(ids[i]));
+        }
+    }
+
+    // `ScatterWindowScissorTLY(ids,count,values)` sets the `WindowScissorTLY` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterWindowScissorTLY(const Id* ids, size_t count, const uint16_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *WindowScissorTLYPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kWindowScissorTLYIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsWindowScissorTLYSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7673,6 +9181,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillWindowScissorBRX(first,count,value)` sets the `WindowScissorBRX` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillWindowScissorBRX(Id first, typename Id::basic_type count, uint16_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint16_t* dst = WindowScissorBRXPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kWindowScissorBRXIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherWindowScissorBRX(ids,count,values)` reads the `WindowScissorBRX` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherWindowScissorBRX(const Id* ids, size_t count, uint16_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*WindowScissorBRXPtr(ids[i]));
+        }
+    }
+
+    // `ScatterWindowScissorBRX(ids,count,values)` sets the `WindowScissorBRX` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterWindowScissorBRX(const Id* ids, size_t count, const uint16_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *WindowScissorBRXPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kWindowScissorBRXIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsWindowScissorBRXSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7734,6 +9277,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillWindowScissorBRY(first,count,value)` sets the `WindowScissorBRY` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillWindowScissorBRY(Id first, typename Id::basic_type count, uint16_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint16_t* dst = WindowScissorBRYPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kWindowScissorBRYIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherWindowScissorBRY(ids,count,values)` reads the `WindowScissorBRY` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherWindowScissorBRY(const Id* ids, size_t count, uint16_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*WindowScissorBRYPtr(ids[i]));
+        }
+    }
+
+    // `ScatterWindowScissorBRY(ids,count,values)` sets the `WindowScissorBRY` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterWindowScissorBRY(const Id* ids, size_t count, const uint16_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *WindowScissorBRYPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kWindowScissorBRYIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsWindowScissorBRYSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7794,6 +9372,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillRenderMode(first,count,value)` sets the `RenderMode` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillRenderMode(Id first, typename Id::basic_type count, a6xx_render_mode value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        a6xx_render_mode* dst = RenderModePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kRenderModeIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherRenderMode(ids,count,values)` reads the `RenderMode` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherRenderMode(const Id* ids, size_t count, a6xx_render_mode* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*RenderModePtr(ids[i]));
+        }
+    }
+
+    // `ScatterRenderMode(ids,count,values)` sets the `RenderMode` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterRenderMode(const Id* ids, size_t count, const a6xx_render_mode* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *RenderModePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kRenderModeIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsRenderModeSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7855,6 +9468,44 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillBuffersLocation(first,count,value)` sets the `BuffersLocation` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillBuffersLocation(Id first, typename Id::basic_type count,
+                                    a6xx_buffers_location value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        a6xx_buffers_location* dst = BuffersLocationPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kBuffersLocationIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherBuffersLocation(ids,count,values)` reads the `BuffersLocation` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherBuffersLocation(const Id* ids, size_t count,
+                                      a6xx_buffers_location* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*BuffersLocationPtr(ids[i]));
+        }
+    }
+
+    // `ScatterBuffersLocation(ids,count,values)` sets the `BuffersLocation` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterBuffersLocation(const Id* ids, size_t count,
+                                       const a6xx_buffers_location* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *BuffersLocationPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kBuffersLocationIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsBuffersLocationSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7915,6 +9566,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillThreadSize(first,count,value)` sets the `ThreadSize` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillThreadSize(Id first, typename Id::basic_type count, a6xx_threadsize value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        a6xx_threadsize* dst = ThreadSizePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kThreadSizeIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherThreadSize(ids,count,values)` reads the `ThreadSize` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherThreadSize(const Id* ids, size_t count, a6xx_threadsize* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ThreadSizePtr(ids[i]));
+        }
+    }
+
+    // `ScatterThreadSize(ids,count,values)` sets the `ThreadSize` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterThreadSize(const Id* ids, size_t count, const a6xx_threadsize* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ThreadSizePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kThreadSizeIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsThreadSizeSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -7978,6 +9664,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillEnableAllHelperLanes(first,count,value)` sets the `EnableAllHelperLanes` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillEnableAllHelperLanes(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = EnableAllHelperLanesPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kEnableAllHelperLanesIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherEnableAllHelperLanes(ids,count,values)` reads the `EnableAllHelperLanes` element of
+    // each of the `count` objects identified by `ids` into `values`
+    inline void GatherEnableAllHelperLanes(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*EnableAllHelperLanesPtr(ids[i]));
+        }
+    }
+
+    // `ScatterEnableAllHelperLanes(ids,count,values)` sets the `EnableAllHelperLanes` element of
+    // each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterEnableAllHelperLanes(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *EnableAllHelperLanesPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kEnableAllHelperLanesIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsEnableAllHelperLanesSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8041,6 +9762,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillEnablePartialHelperLanes(first,count,value)` sets the `EnablePartialHelperLanes` element
+    // of the `count` objects starting at `first`
+    inline SOA& FillEnablePartialHelperLanes(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = EnablePartialHelperLanesPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kEnablePartialHelperLanesIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherEnablePartialHelperLanes(ids,count,values)` reads the `EnablePartialHelperLanes`
+    // element of each of the `count` objects identified by `ids` into `values`
+    inline void GatherEnablePartialHelperLanes(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*EnablePartialHelperLanesPtr(ids[i]));
+        }
+    }
+
+    // `ScatterEnablePartialHelperLanes(ids,count,values)` sets the `EnablePartialHelperLanes`
+    // element of each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterEnablePartialHelperLanes(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *EnablePartialHelperLanesPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kEnablePartialHelperLanesIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsEnablePartialHelperLanesSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8115,6 +9871,45 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillUBWCEnabled(first,count,value)` sets the `UBWCEnabled` element of the `count` objects
+    // starting at `first`
+    inline SOA& FillUBWCEnabled(Id first, typename Id::basic_type count, uint32_t attachment,
+                                bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = UBWCEnabledPtr(first, attachment);
+        for (typename Id::basic_type i = 0; i < count; ++i)
+            dst[i * kUBWCEnabledArrayCount] = (value);
+        MarkFieldSetRange(first, count, kUBWCEnabledIndex + attachment);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherUBWCEnabled(ids,count,values)` reads the `UBWCEnabled` element of each of the `count`
+    // objects identified by `ids` into `values`
+    inline void GatherUBWCEnabled(const Id* ids, size_t count, uint32_t attachment,
+                                  bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*UBWCEnabledPtr(ids[i], attachment));
+        }
+    }
+
+    // `ScatterUBWCEnabled(ids,count,values)` sets the `UBWCEnabled` element of each of the `count`
+    // objects identified by `ids` from `values`
+    inline SOA& ScatterUBWCEnabled(const Id* ids, size_t count, uint32_t attachment,
+                                   const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *UBWCEnabledPtr(ids[i], attachment) = (values[i]);
+            MarkFieldSet(ids[i], kUBWCEnabledIndex + attachment);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsUBWCEnabledSet(Id id, uint32_t attachment) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8189,6 +9984,45 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillUBWCLosslessEnabled(first,count,value)` sets the `UBWCLosslessEnabled` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillUBWCLosslessEnabled(Id first, typename Id::basic_type count,
+                                        uint32_t attachment, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = UBWCLosslessEnabledPtr(first, attachment);
+        for (typename Id::basic_type i = 0; i < count; ++i)
+            dst[i * kUBWCLosslessEnabledArrayCount] = (value);
+        MarkFieldSetRange(first, count, kUBWCLosslessEnabledIndex + attachment);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherUBWCLosslessEnabled(ids,count,values)` reads the `UBWCLosslessEnabled` element of each
+    // of the `count` objects identified by `ids` into `values`
+    inline void GatherUBWCLosslessEnabled(const Id* ids, size_t count, uint32_t attachment,
+                                          bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*UBWCLosslessEnabledPtr(ids[i], attachment));
+        }
+    }
+
+    // `ScatterUBWCLosslessEnabled(ids,count,values)` sets the `UBWCLosslessEnabled` element of each
+    // of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterUBWCLosslessEnabled(const Id* ids, size_t count, uint32_t attachment,
+                                           const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *UBWCLosslessEnabledPtr(ids[i], attachment) = (values[i]);
+            MarkFieldSet(ids[i], kUBWCLosslessEnabledIndex + attachment);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsUBWCLosslessEnabledSet(Id id, uint32_t attachment) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8250,6 +10084,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillUBWCEnabledOnDS(first,count,value)` sets the `UBWCEnabledOnDS` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillUBWCEnabledOnDS(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = UBWCEnabledOnDSPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kUBWCEnabledOnDSIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherUBWCEnabledOnDS(ids,count,values)` reads the `UBWCEnabledOnDS` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherUBWCEnabledOnDS(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*UBWCEnabledOnDSPtr(ids[i]));
+        }
+    }
+
+    // `ScatterUBWCEnabledOnDS(ids,count,values)` sets the `UBWCEnabledOnDS` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterUBWCEnabledOnDS(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *UBWCEnabledOnDSPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kUBWCEnabledOnDSIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsUBWCEnabledOnDSSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8313,6 +10182,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillUBWCLosslessEnabledOnDS(first,count,value)` sets the `UBWCLosslessEnabledOnDS` element
+    // of the `count` objects starting at `first`
+    inline SOA& FillUBWCLosslessEnabledOnDS(Id first, typename Id::basic_type count, bool value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        bool* dst = UBWCLosslessEnabledOnDSPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kUBWCLosslessEnabledOnDSIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherUBWCLosslessEnabledOnDS(ids,count,values)` reads the `UBWCLosslessEnabledOnDS` element
+    // of each of the `count` objects identified by `ids` into `values`
+    inline void GatherUBWCLosslessEnabledOnDS(const Id* ids, size_t count, bool* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*UBWCLosslessEnabledOnDSPtr(ids[i]));
+        }
+    }
+
+    // `ScatterUBWCLosslessEnabledOnDS(ids,count,values)` sets the `UBWCLosslessEnabledOnDS` element
+    // of each of the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterUBWCLosslessEnabledOnDS(const Id* ids, size_t count, const bool* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *UBWCLosslessEnabledOnDSPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kUBWCLosslessEnabledOnDSIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsUBWCLosslessEnabledOnDSSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8375,6 +10279,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillResolveScissor(first,count,value)` sets the `ResolveScissor` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillResolveScissor(Id first, typename Id::basic_type count, VkRect2D value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        VkRect2D* dst = ResolveScissorPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kResolveScissorIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherResolveScissor(ids,count,values)` reads the `ResolveScissor` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherResolveScissor(const Id* ids, size_t count, VkRect2D* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ResolveScissorPtr(ids[i]));
+        }
+    }
+
+    // `ScatterResolveScissor(ids,count,values)` sets the `ResolveScissor` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterResolveScissor(const Id* ids, size_t count, const VkRect2D* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ResolveScissorPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kResolveScissorIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsResolveScissorSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8436,6 +10375,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillResolveBaseGmem(first,count,value)` sets the `ResolveBaseGmem` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillResolveBaseGmem(Id first, typename Id::basic_type count, uint32_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint32_t* dst = ResolveBaseGmemPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kResolveBaseGmemIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherResolveBaseGmem(ids,count,values)` reads the `ResolveBaseGmem` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherResolveBaseGmem(const Id* ids, size_t count, uint32_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ResolveBaseGmemPtr(ids[i]));
+        }
+    }
+
+    // `ScatterResolveBaseGmem(ids,count,values)` sets the `ResolveBaseGmem` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterResolveBaseGmem(const Id* ids, size_t count, const uint32_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ResolveBaseGmemPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kResolveBaseGmemIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsResolveBaseGmemSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8498,6 +10472,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillResolveBaseSysmem(first,count,value)` sets the `ResolveBaseSysmem` element of the
+    // `count` objects starting at `first`
+    inline SOA& FillResolveBaseSysmem(Id first, typename Id::basic_type count, uint64_t value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        uint64_t* dst = ResolveBaseSysmemPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kResolveBaseSysmemIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherResolveBaseSysmem(ids,count,values)` reads the `ResolveBaseSysmem` element of each of
+    // the `count` objects identified by `ids` into `values`
+    inline void GatherResolveBaseSysmem(const Id* ids, size_t count, uint64_t* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ResolveBaseSysmemPtr(ids[i]));
+        }
+    }
+
+    // `ScatterResolveBaseSysmem(ids,count,values)` sets the `ResolveBaseSysmem` element of each of
+    // the `count` objects identified by `ids` from `values`
+    inline SOA& ScatterResolveBaseSysmem(const Id* ids, size_t count, const uint64_t* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ResolveBaseSysmemPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kResolveBaseSysmemIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsResolveBaseSysmemSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8559,6 +10568,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillResolveFormat(first,count,value)` sets the `ResolveFormat` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillResolveFormat(Id first, typename Id::basic_type count, a6xx_format value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        a6xx_format* dst = ResolveFormatPtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kResolveFormatIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherResolveFormat(ids,count,values)` reads the `ResolveFormat` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherResolveFormat(const Id* ids, size_t count, a6xx_format* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ResolveFormatPtr(ids[i]));
+        }
+    }
+
+    // `ScatterResolveFormat(ids,count,values)` sets the `ResolveFormat` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterResolveFormat(const Id* ids, size_t count, const a6xx_format* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ResolveFormatPtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kResolveFormatIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsResolveFormatSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8620,6 +10664,41 @@ class EventStateInfoT
         return static_cast<SOA&>(*this);
     }
 
+    // `FillResolveTileMode(first,count,value)` sets the `ResolveTileMode` element of the `count`
+    // objects starting at `first`
+    inline SOA& FillResolveTileMode(Id first, typename Id::basic_type count, a6xx_tile_mode value)
+    {
+        DIVE_ASSERT(static_cast<typename Id::basic_type>(first) + count <= size());
+        a6xx_tile_mode* dst = ResolveTileModePtr(first);
+        for (typename Id::basic_type i = 0; i < count; ++i) dst[i] = (value);
+        MarkFieldSetRange(first, count, kResolveTileModeIndex);
+        return static_cast<SOA&>(*this);
+    }
+
+    // `GatherResolveTileMode(ids,count,values)` reads the `ResolveTileMode` element of each of the
+    // `count` objects identified by `ids` into `values`
+    inline void GatherResolveTileMode(const Id* ids, size_t count, a6xx_tile_mode* values) const
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            values[i] = (*ResolveTileModePtr(ids[i]));
+        }
+    }
+
+    // `ScatterResolveTileMode(ids,count,values)` sets the `ResolveTileMode` element of each of the
+    // `count` objects identified by `ids` from `values`
+    inline SOA& ScatterResolveTileMode(const Id* ids, size_t count, const a6xx_tile_mode* values)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            DIVE_ASSERT(IsValidId(ids[i]));
+            *ResolveTileModePtr(ids[i]) = (values[i]);
+            MarkFieldSet(ids[i], kResolveTileModeIndex);
+        }
+        return static_cast<SOA&>(*this);
+    }
+
     inline bool IsResolveTileModeSet(Id id) const
     {
         DIVE_ASSERT(IsValidId(id));
@@ -8670,14 +10749,42 @@ class EventStateInfoT
     // element. This will re-allocate memory if necessary
     Iterator Add();
 
+    // `AddN` adds `count` elements, re-allocating at most once, and returns an
+    // iterator referring to the first new element. The new elements are
+    // initialized the same way as by `Add`
+    Iterator AddN(typename Id::basic_type count);
+
+    // `CopyRange` copies all fields of the `count` elements of `other` starting
+    // at `src` over the elements starting at `dst`, one span per field
+    void CopyRange(Id dst, const SOA& other, Id src, typename Id::basic_type count);
+
     // `Clear` resets size to 0, but keeps the allocated memory.
     inline void Clear() { m_size = 0; }
 
+    // Hash of the json spec this class was generated from. Snapshots written by `SaveColumns` for
+    // any other version of the spec are rejected by `LoadColumns`.
+    static constexpr uint64_t kColumnsSpecHash = 0x7dfff4ebff892a5dull;
+
+    // `SaveColumns` writes all elements to a columnar snapshot file: a schema header followed by
+    // the raw array of each field (see soa_columns.h).
+    bool SaveColumns(const char* file_name) const;
+
+    // `LoadColumns` replaces all elements with the contents of a snapshot written by
+    // `SaveColumns`. The file is mapped read-only and each column is copied with a single
+    // `memcpy`. Returns false and leaves the object empty if the snapshot cannot be read, or if it
+    // does not match the spec or layout of this class.
+    bool LoadColumns(const char* file_name);
+    bool LoadColumns(const void* data, size_t size);
+
  protected:
+    // One line per column, describing the layout that `LoadColumns` expects
+    static std::string ColumnsSchema();
+
     template <typename CONFIG_>
     friend class EventStateInfoRefT;
     template <typename CONFIG_>
     friend class EventStateInfoConstRefT;
+    friend struct EventStateInfoPy;
 
     // The start of the array for each field will be aligned to `kAlignment`
     static constexpr size_t kAlignment = alignof(std::max_align_t);
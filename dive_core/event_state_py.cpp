@@ -0,0 +1,853 @@
+/*
+ Copyright 2020 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the \"License\";
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an \"AS IS\" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+//
+// WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING! WARNING!
+//
+// This code has been generated automatically by generateSOAs.py. Do not hand-modify this code.
+//
+///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+#include "event_state.h"
+#include "py_common.h"
+
+namespace Dive
+{
+//--------------------------------------------------------------------------------------------------
+// Python bindings for `EventStateInfo`.
+// Each field is exposed as a read-only NumPy array of shape `(size(), <array dims>...)` that views
+// the field's array in `m_buffer` directly, and `Buffer` views `m_buffer` as a whole. The views
+// keep the object alive, but are invalidated when the buffer is re-allocated (e.g. by `AddN()` or
+// `Reserve()`), so they should be re-fetched after modifying the object.
+struct EventStateInfoPy
+{
+    using SOA = EventStateInfo;
+
+    static py::array ReadOnly(py::array array)
+    {
+        array.attr("setflags")(py::arg("write") = false);
+        return array;
+    }
+
+    static void Bind(py::module& m)
+    {
+        py::class_<SOA> soa_class(m, "EventStateInfo",
+                                  "State info for events (draw/dispatch/sync/dma)");
+        soa_class.def(py::init<>())
+            .def("__len__", [](const SOA& self) { return self.size(); })
+            .def("size", [](const SOA& self) { return self.size(); })
+            .def("capacity", [](const SOA& self) { return self.capacity(); })
+            .def("Reserve", [](SOA& self, uint32_t new_cap) { self.Reserve(new_cap); })
+            // Adds `count` default-initialized elements and returns the id of the first one
+            .def("AddN",
+                 [](SOA& self, uint32_t count) {
+                     uint32_t first = static_cast<uint32_t>(self.size());
+                     self.AddN(count);
+                     return first;
+                 })
+            .def("Clear", [](SOA& self) { self.Clear(); })
+            .def("SaveColumns",
+                 [](const SOA& self, const std::string& file_name) {
+                     return self.SaveColumns(file_name.c_str());
+                 })
+            .def("LoadColumns",
+                 [](SOA& self, const std::string& file_name) {
+                     return self.LoadColumns(file_name.c_str());
+                 })
+            .def_property_readonly(
+                "Buffer",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    py::ssize_t num_bytes =
+                        static_cast<py::ssize_t>(self.capacity()) * SOA::kElemSize;
+                    return ReadOnly(py::array_t<uint8_t>(
+                        {num_bytes}, {1}, reinterpret_cast<const uint8_t*>(self.m_buffer.get()),
+                        obj));
+                })
+            // Raw 'isSet' bit-array: bit `id * NumFields + FieldIndex[name] (+ array index)` is
+            // set if the field was set for element `id`. NumPy cannot view single bits, so the
+            // bits of one field are extracted with e.g.
+            // `np.unpackbits(IsSetBuffer, bitorder="little")[FieldIndex[name]::NumFields]`
+            .def_property_readonly(
+                "IsSetBuffer",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    py::ssize_t num_bytes =
+                        (static_cast<py::ssize_t>(self.size()) * SOA::kNumFields + 7) / 8;
+                    return ReadOnly(
+                        py::array_t<uint8_t>({num_bytes}, {1}, self.m_is_set_buffer.data(), obj));
+                })
+            .def_property_readonly(
+                "Topology",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint32_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint32_t>::type)},
+                        reinterpret_cast<const numpy_type<uint32_t>::type*>(self.TopologyPtr()),
+                        obj));
+                },
+                "The primitive topology for this event")
+            .def_property_readonly(
+                "PrimRestartEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.PrimRestartEnabledPtr()),
+                        obj));
+                },
+                "Controls whether a special vertex index value is treated as restarting the "
+                "assembly of primitives")
+            .def_property_readonly(
+                "PatchControlPoints",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint32_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint32_t>::type)},
+                        reinterpret_cast<const numpy_type<uint32_t>::type*>(
+                            self.PatchControlPointsPtr()),
+                        obj));
+                },
+                "Number of control points per patch")
+            .def_property_readonly(
+                "Viewport",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkViewport>::type>(
+                        std::vector<py::ssize_t>{self.size(), 16},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkViewport>::type) * 16,
+                                                 sizeof(numpy_type<VkViewport>::type)},
+                        reinterpret_cast<const numpy_type<VkViewport>::type*>(self.ViewportPtr()),
+                        obj));
+                },
+                "Defines the viewport transforms")
+            .def_property_readonly(
+                "Scissor",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkRect2D>::type>(
+                        std::vector<py::ssize_t>{self.size(), 16},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkRect2D>::type) * 16,
+                                                 sizeof(numpy_type<VkRect2D>::type)},
+                        reinterpret_cast<const numpy_type<VkRect2D>::type*>(self.ScissorPtr()),
+                        obj));
+                },
+                "Defines the rectangular bounds of the scissor for the corresponding viewport")
+            .def_property_readonly(
+                "DepthClampEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.DepthClampEnabledPtr()),
+                        obj));
+                },
+                "Controls whether to clamp the fragment’s depth values")
+            .def_property_readonly(
+                "RasterizerDiscardEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.RasterizerDiscardEnabledPtr()),
+                        obj));
+                },
+                "Controls whether primitives are discarded immediately before the rasterization "
+                "stage")
+            .def_property_readonly(
+                "PolygonMode",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkPolygonMode>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkPolygonMode>::type)},
+                        reinterpret_cast<const numpy_type<VkPolygonMode>::type*>(
+                            self.PolygonModePtr()),
+                        obj));
+                },
+                "The triangle rendering mode")
+            .def_property_readonly(
+                "CullMode",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkCullModeFlags>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkCullModeFlags>::type)},
+                        reinterpret_cast<const numpy_type<VkCullModeFlags>::type*>(
+                            self.CullModePtr()),
+                        obj));
+                },
+                "The triangle facing direction used for primitive culling")
+            .def_property_readonly(
+                "FrontFace",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkFrontFace>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkFrontFace>::type)},
+                        reinterpret_cast<const numpy_type<VkFrontFace>::type*>(self.FrontFacePtr()),
+                        obj));
+                },
+                "A VkFrontFace value specifying the front-facing triangle orientation to be used "
+                "for culling")
+            .def_property_readonly(
+                "DepthBiasEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(self.DepthBiasEnabledPtr()),
+                        obj));
+                },
+                "Whether to bias fragment depth values")
+            .def_property_readonly(
+                "DepthBiasConstantFactor",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<float>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<float>::type)},
+                        reinterpret_cast<const numpy_type<float>::type*>(
+                            self.DepthBiasConstantFactorPtr()),
+                        obj));
+                },
+                "A scalar factor controlling the constant depth value added to each fragment.")
+            .def_property_readonly(
+                "DepthBiasClamp",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<float>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<float>::type)},
+                        reinterpret_cast<const numpy_type<float>::type*>(self.DepthBiasClampPtr()),
+                        obj));
+                },
+                "The maximum (or minimum) depth bias of a fragment")
+            .def_property_readonly(
+                "DepthBiasSlopeFactor",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<float>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<float>::type)},
+                        reinterpret_cast<const numpy_type<float>::type*>(
+                            self.DepthBiasSlopeFactorPtr()),
+                        obj));
+                },
+                "A scalar factor applied to a fragment’s slope in depth bias calculations")
+            .def_property_readonly(
+                "LineWidth",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<float>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<float>::type)},
+                        reinterpret_cast<const numpy_type<float>::type*>(self.LineWidthPtr()),
+                        obj));
+                },
+                "The width of rasterized line segments")
+            .def_property_readonly(
+                "RasterizationSamples",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkSampleCountFlagBits>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkSampleCountFlagBits>::type)},
+                        reinterpret_cast<const numpy_type<VkSampleCountFlagBits>::type*>(
+                            self.RasterizationSamplesPtr()),
+                        obj));
+                },
+                "A VkSampleCountFlagBits value specifying the number of samples used in "
+                "rasterization")
+            .def_property_readonly(
+                "SampleShadingEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.SampleShadingEnabledPtr()),
+                        obj));
+                },
+                "Whether sample shading is enabled")
+            .def_property_readonly(
+                "MinSampleShading",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<float>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<float>::type)},
+                        reinterpret_cast<const numpy_type<float>::type*>(
+                            self.MinSampleShadingPtr()),
+                        obj));
+                },
+                "Specifies a minimum fraction of sample shading if SampleShadingEnable is set to "
+                "VK_TRUE")
+            .def_property_readonly(
+                "SampleMask",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkSampleMask>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkSampleMask>::type)},
+                        reinterpret_cast<const numpy_type<VkSampleMask>::type*>(
+                            self.SampleMaskPtr()),
+                        obj));
+                },
+                "Each bit in the sample mask is associated with a unique sample index as defined "
+                "for the coverage mask. If the bit is set to 0, the coverage mask bit is set to 0")
+            .def_property_readonly(
+                "AlphaToCoverageEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.AlphaToCoverageEnabledPtr()),
+                        obj));
+                },
+                "Whether a temporary coverage value is generated based on the alpha component of "
+                "the fragment’s first color output")
+            .def_property_readonly(
+                "DepthTestEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(self.DepthTestEnabledPtr()),
+                        obj));
+                },
+                "Whether depth testing is enabled")
+            .def_property_readonly(
+                "DepthWriteEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.DepthWriteEnabledPtr()),
+                        obj));
+                },
+                "Whether depth writes are enabled. Depth writes are always disabled when "
+                "DepthTestEnable is false.")
+            .def_property_readonly(
+                "DepthCompareOp",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkCompareOp>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkCompareOp>::type)},
+                        reinterpret_cast<const numpy_type<VkCompareOp>::type*>(
+                            self.DepthCompareOpPtr()),
+                        obj));
+                },
+                "Comparison operator used for the depth test")
+            .def_property_readonly(
+                "DepthBoundsTestEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.DepthBoundsTestEnabledPtr()),
+                        obj));
+                },
+                "Whether depth bounds testing is enabled")
+            .def_property_readonly(
+                "MinDepthBounds",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<float>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<float>::type)},
+                        reinterpret_cast<const numpy_type<float>::type*>(self.MinDepthBoundsPtr()),
+                        obj));
+                },
+                "Minimum depth bound used in the depth bounds test")
+            .def_property_readonly(
+                "MaxDepthBounds",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<float>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<float>::type)},
+                        reinterpret_cast<const numpy_type<float>::type*>(self.MaxDepthBoundsPtr()),
+                        obj));
+                },
+                "Maximum depth bound used in the depth bounds test")
+            .def_property_readonly(
+                "StencilTestEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.StencilTestEnabledPtr()),
+                        obj));
+                },
+                "Whether stencil testing is enabled")
+            .def_property_readonly(
+                "StencilOpStateFront",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkStencilOpState>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkStencilOpState>::type)},
+                        reinterpret_cast<const numpy_type<VkStencilOpState>::type*>(
+                            self.StencilOpStateFrontPtr()),
+                        obj));
+                },
+                "Front parameter of the stencil test")
+            .def_property_readonly(
+                "StencilOpStateBack",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkStencilOpState>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkStencilOpState>::type)},
+                        reinterpret_cast<const numpy_type<VkStencilOpState>::type*>(
+                            self.StencilOpStateBackPtr()),
+                        obj));
+                },
+                "Back parameter of the stencil test")
+            .def_property_readonly(
+                "LogicOpEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size(), 8},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type) * 8,
+                                                 sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(self.LogicOpEnabledPtr()),
+                        obj));
+                },
+                "Whether to apply Logical Operations")
+            .def_property_readonly(
+                "LogicOp",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkLogicOp>::type>(
+                        std::vector<py::ssize_t>{self.size(), 8},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkLogicOp>::type) * 8,
+                                                 sizeof(numpy_type<VkLogicOp>::type)},
+                        reinterpret_cast<const numpy_type<VkLogicOp>::type*>(self.LogicOpPtr()),
+                        obj));
+                },
+                "Which logical operation to apply")
+            .def_property_readonly(
+                "Attachment",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(
+                        py::array_t<numpy_type<VkPipelineColorBlendAttachmentState>::type>(
+                            std::vector<py::ssize_t>{self.size(), 8},
+                            std::vector<py::ssize_t>{
+                                sizeof(numpy_type<VkPipelineColorBlendAttachmentState>::type) * 8,
+                                sizeof(numpy_type<VkPipelineColorBlendAttachmentState>::type)},
+                            reinterpret_cast<
+                                const numpy_type<VkPipelineColorBlendAttachmentState>::type*>(
+                                self.AttachmentPtr()),
+                            obj));
+                },
+                "Per target attachment color blend states")
+            .def_property_readonly(
+                "BlendConstant",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<float>::type>(
+                        std::vector<py::ssize_t>{self.size(), 4},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<float>::type) * 4,
+                                                 sizeof(numpy_type<float>::type)},
+                        reinterpret_cast<const numpy_type<float>::type*>(self.BlendConstantPtr()),
+                        obj));
+                },
+                "A color constant used for blending")
+            .def_property_readonly(
+                "LRZEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(self.LRZEnabledPtr()),
+                        obj));
+                },
+                "Whether LRZ is enabled for depth")
+            .def_property_readonly(
+                "LRZWrite",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(self.LRZWritePtr()), obj));
+                },
+                "Whether LRZ write is enabled")
+            .def_property_readonly(
+                "LRZDirStatus",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<a6xx_lrz_dir_status>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<a6xx_lrz_dir_status>::type)},
+                        reinterpret_cast<const numpy_type<a6xx_lrz_dir_status>::type*>(
+                            self.LRZDirStatusPtr()),
+                        obj));
+                },
+                "LRZ direction")
+            .def_property_readonly(
+                "LRZDirWrite",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(self.LRZDirWritePtr()),
+                        obj));
+                },
+                "Whether LRZ direction write is enabled")
+            .def_property_readonly(
+                "ZTestMode",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<a6xx_ztest_mode>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<a6xx_ztest_mode>::type)},
+                        reinterpret_cast<const numpy_type<a6xx_ztest_mode>::type*>(
+                            self.ZTestModePtr()),
+                        obj));
+                },
+                "Depth test mode")
+            .def_property_readonly(
+                "BinW",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint32_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint32_t>::type)},
+                        reinterpret_cast<const numpy_type<uint32_t>::type*>(self.BinWPtr()), obj));
+                },
+                "Bin width")
+            .def_property_readonly(
+                "BinH",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint32_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint32_t>::type)},
+                        reinterpret_cast<const numpy_type<uint32_t>::type*>(self.BinHPtr()), obj));
+                },
+                "Bin Height")
+            .def_property_readonly(
+                "WindowScissorTLX",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint16_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint16_t>::type)},
+                        reinterpret_cast<const numpy_type<uint16_t>::type*>(
+                            self.WindowScissorTLXPtr()),
+                        obj));
+                },
+                "Window scissor Top Left X-coordinate")
+            .def_property_readonly(
+                "WindowScissorTLY",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint16_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint16_t>::type)},
+                        reinterpret_cast<const numpy_type<uint16_t>::type*>(
+                            self.WindowScissorTLYPtr()),
+                        obj));
+                },
+                "Window scissor Top Left Y-coordinate")
+            .def_property_readonly(
+                "WindowScissorBRX",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint16_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint16_t>::type)},
+                        reinterpret_cast<const numpy_type<uint16_t>::type*>(
+                            self.WindowScissorBRXPtr()),
+                        obj));
+                },
+                "Window scissor Bottom Right X-coordinate")
+            .def_property_readonly(
+                "WindowScissorBRY",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint16_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint16_t>::type)},
+                        reinterpret_cast<const numpy_type<uint16_t>::type*>(
+                            self.WindowScissorBRYPtr()),
+                        obj));
+                },
+                "Window scissor Bottom Right Y-coordinate")
+            .def_property_readonly(
+                "RenderMode",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<a6xx_render_mode>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<a6xx_render_mode>::type)},
+                        reinterpret_cast<const numpy_type<a6xx_render_mode>::type*>(
+                            self.RenderModePtr()),
+                        obj));
+                },
+                "Whether in binning pass or rendering pass")
+            .def_property_readonly(
+                "BuffersLocation",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<a6xx_buffers_location>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<a6xx_buffers_location>::type)},
+                        reinterpret_cast<const numpy_type<a6xx_buffers_location>::type*>(
+                            self.BuffersLocationPtr()),
+                        obj));
+                },
+                "Whether the target buffer is in GMEM or SYSMEM")
+            .def_property_readonly(
+                "ThreadSize",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<a6xx_threadsize>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<a6xx_threadsize>::type)},
+                        reinterpret_cast<const numpy_type<a6xx_threadsize>::type*>(
+                            self.ThreadSizePtr()),
+                        obj));
+                },
+                "Whether the thread size is 64 or 128")
+            .def_property_readonly(
+                "EnableAllHelperLanes",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.EnableAllHelperLanesPtr()),
+                        obj));
+                },
+                "Whether all helper lanes are enabled of the 2x2 quad for fine derivatives")
+            .def_property_readonly(
+                "EnablePartialHelperLanes",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.EnablePartialHelperLanesPtr()),
+                        obj));
+                },
+                "Whether 3 out of 4 helper lanes are enabled of the 2x2 quad for coarse "
+                "derivatives")
+            .def_property_readonly(
+                "UBWCEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size(), 8},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type) * 8,
+                                                 sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(self.UBWCEnabledPtr()),
+                        obj));
+                },
+                "Whether UBWC is enabled for this attachment")
+            .def_property_readonly(
+                "UBWCLosslessEnabled",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size(), 8},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type) * 8,
+                                                 sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.UBWCLosslessEnabledPtr()),
+                        obj));
+                },
+                "Whether UBWC Lossless compression (A7XX+) is enabled for this attachment")
+            .def_property_readonly(
+                "UBWCEnabledOnDS",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(self.UBWCEnabledOnDSPtr()),
+                        obj));
+                },
+                "Whether UBWC is enabled for this depth stencil attachment")
+            .def_property_readonly(
+                "UBWCLosslessEnabledOnDS",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<bool>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<bool>::type)},
+                        reinterpret_cast<const numpy_type<bool>::type*>(
+                            self.UBWCLosslessEnabledOnDSPtr()),
+                        obj));
+                },
+                "Whether UBWC Lossless compression (A7XX+) is enabled for this depth stencil "
+                "attachment")
+            .def_property_readonly(
+                "ResolveScissor",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<VkRect2D>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<VkRect2D>::type)},
+                        reinterpret_cast<const numpy_type<VkRect2D>::type*>(
+                            self.ResolveScissorPtr()),
+                        obj));
+                },
+                "Defines the rectangular bounds of the resolve operation")
+            .def_property_readonly(
+                "ResolveBaseGmem",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint32_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint32_t>::type)},
+                        reinterpret_cast<const numpy_type<uint32_t>::type*>(
+                            self.ResolveBaseGmemPtr()),
+                        obj));
+                },
+                "The base offset in Gmem for the resolve operation")
+            .def_property_readonly(
+                "ResolveBaseSysmem",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<uint64_t>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<uint64_t>::type)},
+                        reinterpret_cast<const numpy_type<uint64_t>::type*>(
+                            self.ResolveBaseSysmemPtr()),
+                        obj));
+                },
+                "The base address in system memory for the resolve operation")
+            .def_property_readonly(
+                "ResolveFormat",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<a6xx_format>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<a6xx_format>::type)},
+                        reinterpret_cast<const numpy_type<a6xx_format>::type*>(
+                            self.ResolveFormatPtr()),
+                        obj));
+                },
+                "The format of the buffer being resolved")
+            .def_property_readonly(
+                "ResolveTileMode",
+                [](py::object obj) {
+                    const SOA& self = obj.cast<const SOA&>();
+                    return ReadOnly(py::array_t<numpy_type<a6xx_tile_mode>::type>(
+                        std::vector<py::ssize_t>{self.size()},
+                        std::vector<py::ssize_t>{sizeof(numpy_type<a6xx_tile_mode>::type)},
+                        reinterpret_cast<const numpy_type<a6xx_tile_mode>::type*>(
+                            self.ResolveTileModePtr()),
+                        obj));
+                },
+                "The tile mode of the buffer being resolved");
+        soa_class.attr("NumFields") = SOA::kNumFields;
+        py::dict field_index;
+        field_index["Topology"] = SOA::kTopologyIndex;
+        field_index["PrimRestartEnabled"] = SOA::kPrimRestartEnabledIndex;
+        field_index["PatchControlPoints"] = SOA::kPatchControlPointsIndex;
+        field_index["Viewport"] = SOA::kViewportIndex;
+        field_index["Scissor"] = SOA::kScissorIndex;
+        field_index["DepthClampEnabled"] = SOA::kDepthClampEnabledIndex;
+        field_index["RasterizerDiscardEnabled"] = SOA::kRasterizerDiscardEnabledIndex;
+        field_index["PolygonMode"] = SOA::kPolygonModeIndex;
+        field_index["CullMode"] = SOA::kCullModeIndex;
+        field_index["FrontFace"] = SOA::kFrontFaceIndex;
+        field_index["DepthBiasEnabled"] = SOA::kDepthBiasEnabledIndex;
+        field_index["DepthBiasConstantFactor"] = SOA::kDepthBiasConstantFactorIndex;
+        field_index["DepthBiasClamp"] = SOA::kDepthBiasClampIndex;
+        field_index["DepthBiasSlopeFactor"] = SOA::kDepthBiasSlopeFactorIndex;
+        field_index["LineWidth"] = SOA::kLineWidthIndex;
+        field_index["RasterizationSamples"] = SOA::kRasterizationSamplesIndex;
+        field_index["SampleShadingEnabled"] = SOA::kSampleShadingEnabledIndex;
+        field_index["MinSampleShading"] = SOA::kMinSampleShadingIndex;
+        field_index["SampleMask"] = SOA::kSampleMaskIndex;
+        field_index["AlphaToCoverageEnabled"] = SOA::kAlphaToCoverageEnabledIndex;
+        field_index["DepthTestEnabled"] = SOA::kDepthTestEnabledIndex;
+        field_index["DepthWriteEnabled"] = SOA::kDepthWriteEnabledIndex;
+        field_index["DepthCompareOp"] = SOA::kDepthCompareOpIndex;
+        field_index["DepthBoundsTestEnabled"] = SOA::kDepthBoundsTestEnabledIndex;
+        field_index["MinDepthBounds"] = SOA::kMinDepthBoundsIndex;
+        field_index["MaxDepthBounds"] = SOA::kMaxDepthBoundsIndex;
+        field_index["StencilTestEnabled"] = SOA::kStencilTestEnabledIndex;
+        field_index["StencilOpStateFront"] = SOA::kStencilOpStateFrontIndex;
+        field_index["StencilOpStateBack"] = SOA::kStencilOpStateBackIndex;
+        field_index["LogicOpEnabled"] = SOA::kLogicOpEnabledIndex;
+        field_index["LogicOp"] = SOA::kLogicOpIndex;
+        field_index["Attachment"] = SOA::kAttachmentIndex;
+        field_index["BlendConstant"] = SOA::kBlendConstantIndex;
+        field_index["LRZEnabled"] = SOA::kLRZEnabledIndex;
+        field_index["LRZWrite"] = SOA::kLRZWriteIndex;
+        field_index["LRZDirStatus"] = SOA::kLRZDirStatusIndex;
+        field_index["LRZDirWrite"] = SOA::kLRZDirWriteIndex;
+        field_index["ZTestMode"] = SOA::kZTestModeIndex;
+        field_index["BinW"] = SOA::kBinWIndex;
+        field_index["BinH"] = SOA::kBinHIndex;
+        field_index["WindowScissorTLX"] = SOA::kWindowScissorTLXIndex;
+        field_index["WindowScissorTLY"] = SOA::kWindowScissorTLYIndex;
+        field_index["WindowScissorBRX"] = SOA::kWindowScissorBRXIndex;
+        field_index["WindowScissorBRY"] = SOA::kWindowScissorBRYIndex;
+        field_index["RenderMode"] = SOA::kRenderModeIndex;
+        field_index["BuffersLocation"] = SOA::kBuffersLocationIndex;
+        field_index["ThreadSize"] = SOA::kThreadSizeIndex;
+        field_index["EnableAllHelperLanes"] = SOA::kEnableAllHelperLanesIndex;
+        field_index["EnablePartialHelperLanes"] = SOA::kEnablePartialHelperLanesIndex;
+        field_index["UBWCEnabled"] = SOA::kUBWCEnabledIndex;
+        field_index["UBWCLosslessEnabled"] = SOA::kUBWCLosslessEnabledIndex;
+        field_index["UBWCEnabledOnDS"] = SOA::kUBWCEnabledOnDSIndex;
+        field_index["UBWCLosslessEnabledOnDS"] = SOA::kUBWCLosslessEnabledOnDSIndex;
+        field_index["ResolveScissor"] = SOA::kResolveScissorIndex;
+        field_index["ResolveBaseGmem"] = SOA::kResolveBaseGmemIndex;
+        field_index["ResolveBaseSysmem"] = SOA::kResolveBaseSysmemIndex;
+        field_index["ResolveFormat"] = SOA::kResolveFormatIndex;
+        field_index["ResolveTileMode"] = SOA::kResolveTileModeIndex;
+        soa_class.attr("FieldIndex") = field_index;
+    }
+};
+
+void BindEventState(py::module& m) { EventStateInfoPy::Bind(m); }
+}  // namespace Dive
@@ -5,8 +5,8 @@ import re
 import xml.etree.ElementTree as ET
 
 from common import isBuiltInType
-from common import gatherAllEnums
-from common import addMissingDomains
+from common import getRegisterModelPath
+from common import loadRegisterModel
 
 # ---------------------------------------------------------------------------------------
 def outputHeader(pm4_info_file):
@@ -167,7 +167,7 @@ def outputPacketRegs(pm4_info_file, reg_list, prefix, domain):
 
     bitset = None
     if type:
-      bitset = domain.find('./{http://nouveau.freedesktop.org/}bitset[@name="'+type+'"]')
+      bitset = symbols.findDomainBitset(domain, type)
     use_bitfield = len(bitfields) > 0 or bitset
 
     if is_reg_64 and use_bitfield:
@@ -236,17 +236,17 @@ def outputRegUnions(pm4_info_file, a6xx_domain, name, reg, for_pm4, postfix):
     if type:
       # if it isn't one of the standard types, then it must be a custom bitset or an enum
       if not isBuiltInType(type):
-        enum = registers_et_root.find('./{http://nouveau.freedesktop.org/}enum[@name="'+type+'"]')
+        enum = symbols.enums.get(type)
 
         if enum is not None:
           enum_name = enum.attrib['name']
           pm4_info_file.write(extra_front_tab_str + "\t%s bitfields;\n" % (enum_name))
         else:
           use_bitset_as_type = True
-          bitset = a6xx_domain.find('./{http://nouveau.freedesktop.org/}bitset[@name="'+type+'"]')
+          bitset = symbols.findDomainBitset(a6xx_domain, type)
           # Not found in the A6XX domain. Some of the bitsets are defined in the root.
           if bitset is None:
-            bitset = registers_et_root.find('./{http://nouveau.freedesktop.org/}bitset[@name="'+type+'"]')
+            bitset = symbols.bitsets.get(type)
             if bitset is None:
               raise Exception("Not able to find bitset/enum " + type + " for register " + name)
 
@@ -290,16 +290,19 @@ def addToRegHash(name, reg, regs):
 
 
 # ---------------------------------------------------------------------------------------
-def outputPackets(pm4_packet_file_h, registers_et_root, domains):
+def outputPackets(pm4_packet_file_h, symbols, domains):
 
   # Find all CP packet types so we can find out which domains are relevant
-  pm4_type_packets = registers_et_root.find('./{http://nouveau.freedesktop.org/}enum[@name="adreno_pm4_type3_packets"]')
+  pm4_type_packets = symbols.enums['adreno_pm4_type3_packets']
+  pm4_type_packet_values = {}
+  for pm4_type_packet in pm4_type_packets.findall('{http://nouveau.freedesktop.org/}value'):
+    pm4_type_packet_values.setdefault(pm4_type_packet.attrib['name'], pm4_type_packet)
 
   for domain in domains:
     domain_name = domain.attrib['name']
 
     # Check if it is a domain describing a PM4 packet, OR see if it a "A6XX_" packet (e.g. V#s/T#s/S#s)
-    pm4_type_packet = pm4_type_packets.find('./{http://nouveau.freedesktop.org/}value[@name="'+domain_name+'"]')
+    pm4_type_packet = pm4_type_packet_values.get(domain_name)
     if (pm4_type_packet is None) and (not domain_name.startswith("A6XX_")):
       continue
 
@@ -396,8 +399,7 @@ def outputPackets(pm4_packet_file_h, registers_et_root, domains):
       if stripe is not None:
         varset = stripe.attrib['varset']
         if varset != "chip":
-          enum = registers_et_root.find('.//{http://nouveau.freedesktop.org/}enum[@name="'+varset+'"]')
-          enum_value = enum.find('./{http://nouveau.freedesktop.org/}value[@name="'+variant[0]+'"]')
+          enum_value = symbols.findEnumValue(varset, variant[0])
           stripe_variant = enum_value.attrib['value']
 
       # Convert dict to list
@@ -434,25 +436,14 @@ try:
   register_root = sys.argv[1]
   register_file = sys.argv[2]
 
-  # create element tree object
-  tree = ET.parse(sys.argv[1]+"/"+sys.argv[2])
-
-  # get root element
-  registers_et_root = tree.getroot()
-
-  # import any additional xml files referenced in the base xml file via "import" tags
-  sub_xml_file_set = set()
-  for child in registers_et_root:
-    if child.tag == '{http://nouveau.freedesktop.org/}import':
-      if 'file' in child.attrib:
-        sub_xml_file = sys.argv[1]+"/"+child.attrib['file']
-
-        # Check if this file has already been parsed or not
-        if sub_xml_file not in sub_xml_file_set:
-          sub_xml_file_set.add(sub_xml_file)
-          sub_tree = ET.parse(sys.argv[1]+"/"+child.attrib['file'])
-          for sub_tree_child in sub_tree.getroot():
-            registers_et_root.append(sub_tree_child)
+  # Load the register model shared with generatePm4Info_adreno.py. The xml (including any
+  # additional xml files referenced via "import" tags) is only parsed if the model is missing
+  # or out of date.
+  model_path = getRegisterModelPath(os.path.dirname(os.path.abspath(sys.argv[3])), register_file)
+  symbols = loadRegisterModel(register_root, register_file, model_path)
+  if symbols.loaded_from_model:
+    print("%s: using register model %s" % (sys.argv[0], model_path))
+  registers_et_root = symbols.root
 
   pm4_packet_file_h = open(sys.argv[3], "w")
 
@@ -461,21 +452,20 @@ try:
 
 
   # Determine the "domains" (i.e. packets) to output
-  addMissingDomains(registers_et_root)
   domains = registers_et_root.findall('{http://nouveau.freedesktop.org/}domain')
 
 
   outputPrefix(pm4_packet_file_h)
 
-  enums  = gatherAllEnums(registers_et_root)
+  enums  = symbols.all_enum_list
   outputEnums(pm4_packet_file_h, enums)
 
-  outputPackets(pm4_packet_file_h, registers_et_root, domains)
+  outputPackets(pm4_packet_file_h, symbols, domains)
 
   # Define all unions
   # Use hashmap to avoid duplications
   regs = dict()
-  a6xx_domain = registers_et_root.find('./{http://nouveau.freedesktop.org/}domain[@name="A6XX"]')
+  a6xx_domain = symbols.a6xx_domain
   for element in a6xx_domain:
     is_reg_32 = (element.tag == '{http://nouveau.freedesktop.org/}reg32')
     if is_reg_32:
@@ -1,13 +1,17 @@
 from __future__ import print_function
+import base64
+import io
 import sys
 import os
 import re
+import struct
+import zlib
 import xml.etree.ElementTree as ET
 
 from common import isBuiltInType
-from common import gatherAllEnums
-from common import GetGPUVariantsBitField
-from common import addMissingDomains
+from common import getRegisterModelPath
+from common import loadRegisterModel
+from common import PassTimer
 
 # ---------------------------------------------------------------------------------------
 def outputHeader(pm4_info_file):
@@ -38,7 +42,7 @@ limitations under the License.
 ''')
 
 # ---------------------------------------------------------------------------------------
-def outputH(pm4_info_file):
+def outputH(pm4_info_file, tables):
   outputHeader(pm4_info_file)
   pm4_info_file.writelines('''
 #pragma once
@@ -47,6 +51,19 @@ def outputH(pm4_info_file):
 #include <string.h>
 #include "dive_core/stl_replacement.h"
 
+// Read-only view of one of the flattened, statically-initialized field arrays
+template<typename T> struct Pm4Span
+{
+    const T *m_data;
+    uint32_t m_size;
+
+    constexpr uint32_t size() const { return m_size; }
+    constexpr bool     empty() const { return m_size == 0; }
+    constexpr const T &operator[](uint64_t i) const { return m_data[i]; }
+    constexpr const T *begin() const { return m_data; }
+    constexpr const T *end() const { return m_data + m_size; }
+};
+
 enum ValueType
 {
     kBoolean,
@@ -78,8 +95,7 @@ constexpr uint32_t kInvalidRegOffset = UINT32_MAX;
 // be careful when increase this value
 // this is used in
 // - RegField::m_gpu_variants, so the unused bits needs to be adjusted
-// - key of g_sRegInfo, the register offset needs at least 16bits, so kGPUVariantsBits cannot be
-// larger than 16
+// - row size of the per-variant register and packet lookup tables
 constexpr uint32_t kGPUVariantsBits = 7;
 
 struct RegField
@@ -107,7 +123,7 @@ struct RegInfo
     uint32_t    m_bit_width : 6; // high - low, range [0, 63]
     uint32_t    m_radix : 5; // only used when the type is ufixed/fixed, range [0, 31]
     uint32_t : 3;
-    DiveVector<RegField> m_fields;
+    Pm4Span<RegField> m_fields;
 };
 
 struct PacketField
@@ -128,10 +144,9 @@ struct PacketInfo
     uint32_t    m_max_array_size : 8;
     uint32_t    m_stripe_variant : 8;  // Which variant of the packet this is
     uint32_t : 16;
-    DiveVector<PacketField> m_fields;
+    Pm4Span<PacketField> m_fields;
 };
 
-void              Pm4InfoInit();
 const char       *GetOpCodeString(uint32_t op_code);
 const RegInfo    *GetRegInfo(uint32_t reg);
 const RegInfo    *GetRegByName(const char *);
@@ -144,6 +159,33 @@ void              SetGPUID(uint32_t gpu_id);
 uint32_t          GetGPUID();
 GPUVariantType    GetGPUVariantType();
 bool              IsFieldEnabled(const RegField *field);
+''')
+  pm4_info_file.write('\n// Number of entries in the opcode and register offset lookup tables\n')
+  pm4_info_file.write('constexpr uint32_t kOpCodeCount = 0x%x;\n' % tables.getOpCodeCount())
+  pm4_info_file.write('constexpr uint32_t kRegOffsetCount = 0x%x;\n' % tables.getRegOffsetCount())
+  pm4_info_file.writelines('''
+constexpr uint16_t kNoRegInfo = 0xffff;
+
+// Dense register table of one GPU variant, as selected by SetGPUID(). Every offset is resolved to
+// the RegInfo of that variant, and the RegInfo only has the fields enabled for that variant, so
+// decoding loops can hold on to the table and index it without any variant checks.
+struct RegInfoTable
+{
+    const uint16_t *m_index;  // kRegOffsetCount entries, each an index into m_infos or kNoRegInfo
+    const RegInfo  *m_infos;
+
+    const RegInfo *GetRegInfo(uint32_t reg) const
+    {
+        if (reg >= kRegOffsetCount)
+            return nullptr;
+        uint16_t index = m_index[reg];
+        if (index == kNoRegInfo)
+            return nullptr;
+        return &m_infos[index];
+    }
+};
+
+const RegInfoTable &GetRegInfoTable();
 ''')
 
 # ---------------------------------------------------------------------------------------
@@ -154,21 +196,12 @@ def outputHeaderCpp(pm4_info_header_file_name, pm4_info_file):
 #include <assert.h>
 #include <algorithm>
 #include <cstring>
-#include <map>
 #include <string>
-#include <unordered_map>
-#include <vector>
 #include "dive_core/common/common.h"
 
-static DiveVector<const char*> g_sOpCodeToString;
-static std::unordered_map<uint32_t, RegInfo> g_sRegInfoVariant;
-static DiveVector<RegInfo> g_sRegInfo;
-static std::unordered_map<std::string, uint32_t> g_sRegNameToIndex;
-static DiveVector<DiveVector<const char*>> g_sEnumReflection;
-static DiveVector<PacketInfo> g_sPacketInfo;
-static std::unordered_map<uint32_t, PacketInfo> g_sPacketInfoVariant;
-static std::multimap<uint32_t, PacketInfo> g_sPacketInfoMultiple;
 static GPUVariantType g_sGPU_variant = kGPUVariantNone;
+// Bit index of g_sGPU_variant, used to index the per-variant lookup tables
+static uint32_t g_sGPU_variant_index = kGPUVariantsBits;
 static uint32_t g_sGPU_id = 0;
 
 std::string GetGPUStr(GPUVariantType variant)
@@ -195,45 +228,99 @@ std::string GetGPUStr(GPUVariantType variant)
   )
 
 # ---------------------------------------------------------------------------------------
-def outputPm4InfoInitFunc(pm4_info_file, registers_et_root, opcode_dict):
+# Pools every string referenced by the generated tables into a few large char arrays, so each
+# distinct name is stored exactly once. Each chunk is kept below the string literal size limit
+# of MSVC.
+class StringPool():
+  max_chunk_size = 60000
+
+  def __init__(self):
+    self.offsets = {}
+    self.chunks = [[]]
+    self.chunk_size = 0
+
+  # Returns the C++ expression pointing at the pooled copy of the string
+  def add(self, string):
+    if string not in self.offsets:
+      if self.chunk_size + len(string) + 1 > self.max_chunk_size:
+        self.chunks.append([])
+        self.chunk_size = 0
+      self.offsets[string] = (len(self.chunks) - 1, self.chunk_size)
+      self.chunks[-1].append(string)
+      self.chunk_size += len(string) + 1
+    chunk, offset = self.offsets[string]
+    return 'kStringPool%d + %d' % (chunk, offset)
+
+  def output(self, pm4_info_file):
+    for idx, chunk in enumerate(self.chunks):
+      pm4_info_file.write('static constexpr char kStringPool%d[] =\n' % idx)
+      for string in chunk:
+        pm4_info_file.write('    "%s\\0"\n' % string)
+      pm4_info_file.write('    "";\n\n')
 
-  # Get enum values from the XML element tree, being careful not to have duplicates
-  enum_index_dict = {}
-  enum_list = []
-  parseEnumInfo(enum_index_dict, enum_list, registers_et_root)
+# ---------------------------------------------------------------------------------------
+# Everything that ends up in the generated lookup tables. The gather passes fill this in,
+# with later definitions replacing earlier ones for the same key, and outputTablesCpp() then
+# writes it out as constexpr arrays.
+class Pm4Tables():
+  def __init__(self):
+    self.opcode_strings = {}          # opcode -> name
+    self.reg_infos = {}               # offset -> RegInfo
+    self.reg_infos_variant = {}       # (offset, variant bit) -> RegInfo
+    self.enums = []                   # [(enum name, {value: name})], indexed by enum handle
+    self.packet_infos = {}            # opcode -> PacketInfo
+    self.packet_infos_variant = {}    # (opcode, variant bit) -> PacketInfo
+    self.packet_infos_multiple = []   # [(opcode, PacketInfo)], for repeated packet opcodes
+
+  def getOpCodeCount(self):
+    max_opcode = max(list(self.opcode_strings) + list(self.packet_infos) +
+                     [opcode for opcode, _ in self.packet_infos_variant] +
+                     [opcode for opcode, _ in self.packet_infos_multiple])
+    return max_opcode + 1
+
+  def getRegOffsetCount(self):
+    max_offset = max(list(self.reg_infos) + [offset for offset, _ in self.reg_infos_variant])
+    return max_offset + 1
+
+# A RegInfo, RegField, PacketInfo or PacketField initializer, with the fields in declaration order
+class RegInfoEntry():
+  def __init__(self, name, is_64, type, enum_handle, shr, bit_width, radix, fields):
+    self.name = name
+    self.is_64 = is_64
+    self.type = type
+    self.enum_handle = enum_handle
+    self.shr = shr
+    self.bit_width = bit_width
+    self.radix = radix
+    self.fields = fields
+
+class PacketInfoEntry():
+  def __init__(self, name, array_size, stripe_variant, fields):
+    self.name = name
+    self.array_size = array_size
+    self.stripe_variant = stripe_variant
+    self.fields = fields
 
-  pm4_info_file.writelines('''
-static int Pm4InfoInitImpl()
-{
-''')
-  outputOpcodes(pm4_info_file, opcode_dict)
-  pm4_info_file.write('\n')
-  outputRegisterInfo(pm4_info_file, registers_et_root, enum_index_dict)
-  pm4_info_file.write('\n')
-  outputEnums(pm4_info_file, enum_list)
-  pm4_info_file.write('\n')
-  outputPacketInfo(pm4_info_file, registers_et_root, enum_index_dict, opcode_dict)
-  pm4_info_file.writelines('''
-    return 0;
-}
+# ---------------------------------------------------------------------------------------
+def gatherPm4Tables(symbols, opcode_dict, timer):
+  tables = Pm4Tables()
 
-void Pm4InfoInit()
-{
-    static int initialized = Pm4InfoInitImpl();
-    (void)initialized;
-}
-''')
-  return
+  # Get enum values from the XML element tree, being careful not to have duplicates
+  enum_index_dict = {}
+  with timer.measure('parseEnumInfo'):
+    parseEnumInfo(enum_index_dict, tables.enums, symbols)
+  with timer.measure('gatherOpcodes'):
+    gatherOpcodes(tables, opcode_dict)
+  with timer.measure('gatherRegisterInfo'):
+    gatherRegisterInfo(tables, symbols, enum_index_dict)
+  with timer.measure('gatherPacketInfo'):
+    gatherPacketInfo(tables, symbols, enum_index_dict, opcode_dict)
+  return tables
 
-valid_opcodes = {}
 # ---------------------------------------------------------------------------------------
-def outputOpcodes(pm4_info_file, opcode_dict):
-  # Find max opcode first
-  max_opcode = max(opcode_dict)
-
-  pm4_info_file.write('    g_sOpCodeToString.resize(0x%x);\n' % (max_opcode+1))
+def gatherOpcodes(tables, opcode_dict):
   for opcode in opcode_dict:
-    pm4_info_file.write('    g_sOpCodeToString[%s] = "%s";\n' % (hex(opcode), opcode_dict[opcode]))
+    tables.opcode_strings[opcode] = opcode_dict[opcode]
   return
 
 # ---------------------------------------------------------------------------------------
@@ -273,7 +360,7 @@ class RegAttributes():
   radix = 0
 
 # ---------------------------------------------------------------------------------------
-def GetBitfieldsOrEnumHandleFromBitset(input_type, input_bitfields, input_name, registers_et_root, enum_index_dict):
+def GetBitfieldsOrEnumHandleFromBitset(input_type, input_bitfields, input_name, symbols, enum_index_dict):
   if not isinstance(input_bitfields, list):
     raise TypeError("The 'bitfields' argument must be a list.")
   enum_handle = 'UINT8_MAX'
@@ -281,17 +368,13 @@ def GetBitfieldsOrEnumHandleFromBitset(input_type, input_bitfields, input_name,
   if input_type:
     # if it isn't one of the standard types, then it must be a custom bitset or an enum
     if not isBuiltInType(input_type):
-      a6xx_domain = registers_et_root.find('./{http://nouveau.freedesktop.org/}domain[@name="A6XX"]')
-      bitfields = a6xx_domain.find('./{http://nouveau.freedesktop.org/}bitset[@name="'+input_type+'"]')
-
-      # Not found in the A6XX domain. Some of the bitsets are defined in the root.
-      if bitfields is None:
-        bitfields = registers_et_root.find('./{http://nouveau.freedesktop.org/}bitset[@name="'+input_type+'"]')
+      # Prefer the A6XX domain. Some of the bitsets are defined in the root.
+      bitfields = symbols.findBitset(input_type)
 
       # It's not a bitset. Let's sanity check that it's a top-level enum!
       if bitfields is None:
         bitfields = []
-        enum = registers_et_root.find('./{http://nouveau.freedesktop.org/}enum[@name="'+input_type+'"]')
+        enum = symbols.enums.get(input_type)
         if enum is None:
           raise Exception('Not able to find bitset/enum ' + input_type + ' for register ' + input_name)
         # Now that we know it's an enum, let's get the enum_handle for it!
@@ -303,7 +386,7 @@ def GetBitfieldsOrEnumHandleFromBitset(input_type, input_bitfields, input_name,
   return bitfields, enum_handle
 
 # ---------------------------------------------------------------------------------------
-def AppendBitfield(pm4_info_file, enum_index_dict, bitfields, is_64):
+def AppendBitfield(fields, symbols, enum_index_dict, bitfields, is_64):
     # Iterate through optional bitfields
     for bitfield in bitfields:
       if bitfield.tag != '{http://nouveau.freedesktop.org/}bitfield':
@@ -345,11 +428,11 @@ def AppendBitfield(pm4_info_file, enum_index_dict, bitfields, is_64):
 
       variants_bitfield = 0
       if 'variants' in bitfield.attrib:
-        variants_bitfield = GetGPUVariantsBitField(bitfield.attrib['variants'])
+        variants_bitfield = symbols.getVariantsBitField(bitfield.attrib['variants'])
 
       radix = getIntAttributeValue(bitfield, 'radix')
 
-      pm4_info_file.write('    { %s, %s, %d, %d, %d, %d, %d, 0x%x, "%s" }, '  % (
+      fields.append((
           getTypeEnumString(bitfield_type),
           enum_handle,
           shift,
@@ -362,26 +445,26 @@ def AppendBitfield(pm4_info_file, enum_index_dict, bitfields, is_64):
         ))
 
 # ---------------------------------------------------------------------------------------
-def outputSingleRegister(pm4_info_file, registers_et_root, enum_index_dict, attributes: RegAttributes):
+def addSingleRegister(tables, symbols, enum_index_dict, attributes: RegAttributes):
   is_64_string = '0'
   if attributes.is_64 is True:
     is_64_string = '1'
 
-  bitfields, enum_handle = GetBitfieldsOrEnumHandleFromBitset(attributes.type, attributes.bitfields, attributes.name, registers_et_root, enum_index_dict)
+  bitfields, enum_handle = GetBitfieldsOrEnumHandleFromBitset(attributes.type, attributes.bitfields, attributes.name, symbols, enum_index_dict)
 
-  variants_bitfield = GetGPUVariantsBitField(attributes.variants)
+  fields = []
+  AppendBitfield(fields, symbols, enum_index_dict, bitfields, attributes.is_64)
+  reg_info = RegInfoEntry(attributes.name, is_64_string, getTypeEnumString(attributes.type), enum_handle, attributes.shr, attributes.bit_width, attributes.radix, fields)
+
+  variants_bitfield = symbols.getVariantsBitField(attributes.variants)
   if (variants_bitfield != 0):
       # kGPUVariantsBits has 7 bits
       for i in range(7):
           cur_variant_bitfield = (1<<i)
           if cur_variant_bitfield & variants_bitfield:
-              pm4_info_file.write('    g_sRegInfoVariant[(0x%x << kGPUVariantsBits) | 0x%x] = { "%s", %s, %s, %s, %d, %d, %d, {' % (attributes.offset, cur_variant_bitfield, attributes.name, is_64_string, getTypeEnumString(attributes.type), enum_handle, attributes.shr, attributes.bit_width, attributes.radix))
-              AppendBitfield(pm4_info_file, enum_index_dict, bitfields, attributes.is_64)
-              pm4_info_file.write('} };\n')
+              tables.reg_infos_variant[(attributes.offset, cur_variant_bitfield)] = reg_info
   else:
-      pm4_info_file.write('    g_sRegInfo[0x%x] = { "%s", %s, %s, %s, %d, %d, %d, {' % (attributes.offset, attributes.name, is_64_string, getTypeEnumString(attributes.type), enum_handle, attributes.shr, attributes.bit_width, attributes.radix))
-      AppendBitfield(pm4_info_file, enum_index_dict, bitfields, attributes.is_64)
-      pm4_info_file.write('} };\n')
+      tables.reg_infos[attributes.offset] = reg_info
 
 
 # ---------------------------------------------------------------------------------------
@@ -401,8 +484,8 @@ def getIntAttributeValue(reg, attribute_name):
   return value
 
 # ---------------------------------------------------------------------------------------
-def outputRegisterInfo(pm4_info_file, registers_et_root, enum_index_dict):
-  a6xx_domain = registers_et_root.find('./{http://nouveau.freedesktop.org/}domain[@name="A6XX"]')
+def gatherRegisterInfo(tables, symbols, enum_index_dict):
+  a6xx_domain = symbols.a6xx_domain
 
   # Create a list of 32-bit and 64-bit registers
   regs = []
@@ -412,13 +495,6 @@ def outputRegisterInfo(pm4_info_file, registers_et_root, enum_index_dict):
     if is_reg_32 or is_reg_64:
       regs.append(element)
 
-  # Determine highest register offset
-  max_offset = 0
-  for reg in regs:
-    offset = int(reg.attrib['offset'],0)
-    max_offset = max(max_offset, offset)
-  pm4_info_file.write('    g_sRegInfo.resize(0x%x);\n' % (max_offset+1))
-
   # Parse through registers
   for reg in regs:
     offset = int(reg.attrib['offset'],0)
@@ -449,7 +525,7 @@ def outputRegisterInfo(pm4_info_file, registers_et_root, enum_index_dict):
     reg_attributes.bit_width = bit_width
     reg_attributes.radix = radix
 
-    outputSingleRegister(pm4_info_file, registers_et_root, enum_index_dict, reg_attributes)
+    addSingleRegister(tables, symbols, enum_index_dict, reg_attributes)
 
   # Iterate and output the arrays as a sequence of reg32s with an index as a suffix
   arrays = a6xx_domain.findall('{http://nouveau.freedesktop.org/}array')
@@ -489,7 +565,7 @@ def outputRegisterInfo(pm4_info_file, registers_et_root, enum_index_dict):
         reg_attributes.shr = 0
         reg_attributes.bit_width = 0
         reg_attributes.radix = 0
-        outputSingleRegister(pm4_info_file, registers_et_root, enum_index_dict, reg_attributes)
+        addSingleRegister(tables, symbols, enum_index_dict, reg_attributes)
       elif stride == 2 and not array_regs:
         reg_attributes.name = array_name+str(i)+'_LO'
         reg_attributes.offset = offset+i*stride
@@ -500,7 +576,7 @@ def outputRegisterInfo(pm4_info_file, registers_et_root, enum_index_dict):
         reg_attributes.shr = 0
         reg_attributes.bit_width = 0
         reg_attributes.radix = 0
-        outputSingleRegister(pm4_info_file, registers_et_root, enum_index_dict, reg_attributes)
+        addSingleRegister(tables, symbols, enum_index_dict, reg_attributes)
       else:
         for reg_idx, reg in enumerate(array_regs):
           reg_name = reg.attrib['name']
@@ -530,12 +606,12 @@ def outputRegisterInfo(pm4_info_file, registers_et_root, enum_index_dict):
           # if no register variants, check if there are array-level variants (e.g. GRAS_CL_VIEWPORT)
           if (not reg_attributes.variants) and ('variants' in array.attrib):
             reg_attributes.variants = array.attrib['variants']
-          outputSingleRegister(pm4_info_file, registers_et_root, enum_index_dict, reg_attributes)
+          addSingleRegister(tables, symbols, enum_index_dict, reg_attributes)
   return
 
 # ---------------------------------------------------------------------------------------
-def parseEnumInfo(enum_index_dict, enum_list, registers_et_root):
-  enums = gatherAllEnums(registers_et_root)
+def parseEnumInfo(enum_index_dict, enum_list, symbols):
+  enums = symbols.all_enum_list
 
   for enum in enums:
     fields = enum.findall('{http://nouveau.freedesktop.org/}value')
@@ -579,12 +655,11 @@ class FieldAttributes():
   mask = 0
 
 # ---------------------------------------------------------------------------------------
-def outputField(pm4_info_file, field_attributes: FieldAttributes):
-  pm4_info_file.write('{ "%s", %d, %d, %s, %s, %d, %d, 0x%x },' %
-                       (field_attributes.name, field_attributes.is_variant_opcode, field_attributes.dword_count, getTypeEnumString(field_attributes.type), field_attributes.enum_handle, field_attributes.shift, field_attributes.shr, field_attributes.mask))
+def addField(fields, field_attributes: FieldAttributes):
+  fields.append((field_attributes.name, field_attributes.is_variant_opcode, field_attributes.dword_count, getTypeEnumString(field_attributes.type), field_attributes.enum_handle, field_attributes.shift, field_attributes.shr, field_attributes.mask))
 
 # ---------------------------------------------------------------------------------------
-def outputPacketFields(pm4_info_file, enum_index_dict, reg_list):
+def gatherPacketFields(fields, symbols, enum_index_dict, reg_list):
   dword_count = 0
   address_end_offset = sys.maxsize
   for element in reg_list:
@@ -610,7 +685,7 @@ def outputPacketFields(pm4_info_file, enum_index_dict, reg_list):
     if 'type' in element.attrib:
       type = element.attrib['type']
     field_name = element.attrib['name']
-    bitfields, enum_handle = GetBitfieldsOrEnumHandleFromBitset(type, input_bitfields, field_name, registers_et_root, enum_index_dict)
+    bitfields, enum_handle = GetBitfieldsOrEnumHandleFromBitset(type, input_bitfields, field_name, symbols, enum_index_dict)
 
     # Possible to have an ADDR register followed by ADDR_LO and ADDR_HI
     # In that case, the offsets will overlap
@@ -643,15 +718,15 @@ def outputPacketFields(pm4_info_file, enum_index_dict, reg_list):
         field_attributes.name = field_name
         field_attributes.dword_count = dword_count
 
-        outputField(pm4_info_file, field_attributes)
+        addField(fields, field_attributes)
       elif is_reg_64:
         field_attributes.name = field_name+'_LO'
         field_attributes.dword_count = dword_count - 1
-        outputField(pm4_info_file, field_attributes)
+        addField(fields, field_attributes)
 
         field_attributes.name = field_name+'_HI'
         field_attributes.dword_count = dword_count
-        outputField(pm4_info_file, field_attributes)
+        addField(fields, field_attributes)
 
     if is_reg_64 and len(bitfields) > 0:
       raise Exception('Found a reg64 with bitfields: ' + field_name)
@@ -701,57 +776,25 @@ def outputPacketFields(pm4_info_file, enum_index_dict, reg_list):
       field_attributes.shift = shift
       field_attributes.shr = shr
       field_attributes.mask = mask
-      outputField(pm4_info_file, field_attributes)
-
-# ---------------------------------------------------------------------------------------
-def outputEnums(pm4_info_file, enum_list):
-  pm4_info_file.write('    g_sEnumReflection.resize(%d);\n' % (len(enum_list)+1));
-  # Output enum_list to file
-  for idx, enum_info in enumerate(enum_list):
-    # enum_list is an array of {string, dict()}, where the key of the dict() is
-    # the integer enum_value
-    enum_sorted_items = sorted(enum_info[1].items())
-    max_enum_value = enum_sorted_items[-1][0]
-    pm4_info_file.write('    g_sEnumReflection[%d].resize(%d, nullptr); // %s\n' % (idx, max_enum_value+1, enum_info[0]));
-    for enum_value, enum_value_string in enum_sorted_items:
-      pm4_info_file.write('    g_sEnumReflection[%d][%d] = "%s";\n' % (idx, enum_value, enum_value_string));
+      addField(fields, field_attributes)
 
 # ---------------------------------------------------------------------------------------
 # This function adds info for PM4 packets as well as structs that have no opcodes (e.g. V#s/T#s/S#s)
-def outputPacketInfo(pm4_info_file, registers_et_root, enum_index_dict, opcode_dict):
-  domains = registers_et_root.findall('{http://nouveau.freedesktop.org/}domain')
+def gatherPacketInfo(tables, symbols, enum_index_dict, opcode_dict):
+  domains = symbols.root.findall('{http://nouveau.freedesktop.org/}domain')
 
   # Find all CP packet types so we can find out which domains are relevant
-  pm4_type_packets = registers_et_root.find('./{http://nouveau.freedesktop.org/}enum[@name="adreno_pm4_type3_packets"]')
-
-  # Get highest opcode value to properly resize() the vector
-  highest_opcode = 0
-  for domain in domains:
-    domain_name = domain.attrib['name']
-
-    # Check if it is a domain describing a PM4 packet
-    pm4_type_packet = pm4_type_packets.find('./{http://nouveau.freedesktop.org/}value[@name="'+domain_name+'"]')
-    if (pm4_type_packet is None) and (not domain_name.startswith('A6XX_')):
-      continue
+  pm4_type_packets = symbols.enums['adreno_pm4_type3_packets']
+  pm4_type_packet_values = {}
+  for pm4_type_packet in pm4_type_packets.findall('{http://nouveau.freedesktop.org/}value'):
+    pm4_type_packet_values.setdefault(pm4_type_packet.attrib['name'], pm4_type_packet)
 
-    opcode = 0
-    if pm4_type_packet is not None:
-      opcode = int(pm4_type_packet.attrib['value'],0)
-      if opcode_dict[opcode] != domain_name:
-        continue
-
-    if highest_opcode < opcode:
-      highest_opcode = opcode
-
-  pm4_info_file.write('    g_sPacketInfo.resize(0x%x);\n' % (highest_opcode+1))
-
-  ############################################################################
   packet_type_instances = {}
   for domain in domains:
     domain_name = domain.attrib['name']
 
     # Check if it is a domain describing a PM4 packet, OR see if it a 'A6XX_' packet (e.g. V#s/T#s/S#s)
-    pm4_type_packet = pm4_type_packets.find('./{http://nouveau.freedesktop.org/}value[@name="'+domain_name+'"]')
+    pm4_type_packet = pm4_type_packet_values.get(domain_name)
     if (pm4_type_packet is None) and (not domain_name.startswith('A6XX_')):
       continue
 
@@ -838,8 +881,7 @@ def outputPacketInfo(pm4_info_file, registers_et_root, enum_index_dict, opcode_d
       if stripe is not None:
         varset = stripe.attrib['varset']
         if varset != 'chip':
-          enum = registers_et_root.find('.//{http://nouveau.freedesktop.org/}enum[@name="'+varset+'"]')
-          enum_value = enum.find('./{http://nouveau.freedesktop.org/}value[@name="'+variant[0]+'"]')
+          enum_value = symbols.findEnumValue(varset, variant[0])
           stripe_variant = enum_value.attrib['value']
 
       # Convert dict to list
@@ -848,87 +890,340 @@ def outputPacketInfo(pm4_info_file, registers_et_root, enum_index_dict, opcode_d
       # Sort based on offset
       reg_list = sorted(reg_list, key=lambda x: int(x.attrib['offset'],0))
 
-      # Keep track of instance #. Only the 1st instance belongs in the vector. The rest are in the multimap.
+      fields = []
+      gatherPacketFields(fields, symbols, enum_index_dict, reg_list)
+      packet_info = PacketInfoEntry(packet_name, array_size, stripe_variant, fields)
+
+      # Keep track of instance #. Only the 1st instance belongs in the main table. The rest are in
+      # the "multiple" table.
+      # For descriptors, we purposefully try to include them as "packets" for easier parsing.
+      # They are not technically PM4 packets, hence the 0x0.
+      # Example: const PacketInfo *packet_info_ptr = GetPacketInfo(0, sharp_struct_name);
       if opcode not in packet_type_instances:
         packet_type_instances[opcode] = 1
-        if (opcode == 0):
-          pm4_info_file.write('''
-    // For descriptors, we purposefully try to include them as "packets" for easier parsing.
-    // They are not technically PM4 packets, hence the 0x0.
-    // Example: const PacketInfo *packet_info_ptr = GetPacketInfo(0, sharp_struct_name);
-''')
-
-        pm4_info_file.write('    g_sPacketInfo[0x%x] = { "%s", %d, %s, {' % (opcode, packet_name, array_size, stripe_variant))
-        outputPacketFields(pm4_info_file, enum_index_dict, reg_list)
-        pm4_info_file.write(' } };\n')
+        tables.packet_infos[opcode] = packet_info
       else:
         packet_type_instances[opcode] += 1
-        pm4_info_file.write('    g_sPacketInfoMultiple.insert(std::pair<uint32_t, PacketInfo>(')
-        pm4_info_file.write('0x%x, { "%s", %d, %s, {' % (opcode, packet_name, array_size, stripe_variant))
-        outputPacketFields(pm4_info_file, enum_index_dict, reg_list)
-        pm4_info_file.write(' } }));\n')
+        tables.packet_infos_multiple.append((opcode, packet_info))
 
   # Not all pm4 packets are described via a 'domain'. These are usually packets (such as CP_WAIT_FOR_IDLE) which
-  # have no fields. In that case, add a corresponding g_sPacketInfo entry with no fields
+  # have no fields. In that case, add a corresponding packet info entry with no fields
   pm4_type_packets_values = pm4_type_packets.findall('./{http://nouveau.freedesktop.org/}value')
   for pm4_type_packet_value in pm4_type_packets_values:
     # See if it shows up in the domains list
     packet_name = pm4_type_packet_value.attrib['name']
 
-    domain = registers_et_root.find('{http://nouveau.freedesktop.org/}domain[@name="'+packet_name+'"]')
+    domain = symbols.domains.get(packet_name)
     if domain is None:
       opcode = int(pm4_type_packet_value.attrib['value'],0)
 
-      # We need the g_sPacketInfoVariant because some PM4s share the same value
+      # We need the variant packet info because some PM4s share the same value
       # but with different variants (CP_THREAD_CONTROL (A7XX-) and IN_IB_PREFETCH_END (A2XX) both use 0x17)
       if 'variants' in pm4_type_packet_value.attrib:
         variants = pm4_type_packet_value.attrib['variants']
-        variants_bitfield = GetGPUVariantsBitField(variants)
+        variants_bitfield = symbols.getVariantsBitField(variants)
         if (variants_bitfield != 0):
           # kGPUVariantsBits has 7 bits
           # it seems that the variant is only used for the non-domain ones
           for i in range(6):
             cur_variant_bitfield = (1<<i)
             if cur_variant_bitfield & variants_bitfield:
-              pm4_info_file.write('    g_sPacketInfoVariant[(0x%x << kGPUVariantsBits) | 0x%x] = { "%s", 0, UINT8_MAX, {' % (opcode, cur_variant_bitfield, packet_name) + ' } };\n')
+              tables.packet_infos_variant[(opcode, cur_variant_bitfield)] = PacketInfoEntry(packet_name, 0, 'UINT8_MAX', [])
       else:
-        pm4_info_file.write('    g_sPacketInfo[0x%x] = { "%s", 0, UINT8_MAX, {' % (opcode, packet_name) + ' } };\n')
+        tables.packet_infos[opcode] = PacketInfoEntry(packet_name, 0, 'UINT8_MAX', [])
 
-  pm4_info_file.write('\n')
+# ---------------------------------------------------------------------------------------
+def getGPUStr(variant_bitfield):
+  return 'A%dXX' % (variant_bitfield.bit_length() + 1)
 
+# ---------------------------------------------------------------------------------------
+def outputIndexArray(pm4_info_file, indices):
+  for i in range(0, len(indices), 16):
+    pm4_info_file.write('    ' + ', '.join('0x%x' % index for index in indices[i:i+16]) + ',\n')
+
+# ---------------------------------------------------------------------------------------
+def outputRegFields(pm4_info_file, string_pool, fields):
+  for field in fields:
+    pm4_info_file.write('    { %s, %s, %d, %d, %d, %d, %d, 0x%x, %s },\n' % (field[:8] + (string_pool.add(field[8]),)))
+
+# ---------------------------------------------------------------------------------------
+def outputPacketFieldsCpp(pm4_info_file, string_pool, fields):
+  for field in fields:
+    pm4_info_file.write('    { %s, %d, %d, %s, %s, %d, %d, 0x%x },\n' % ((string_pool.add(field[0]),) + field[1:]))
+
+# ---------------------------------------------------------------------------------------
+def getSpanString(array_name, start, count):
+  if count == 0:
+    return '{ nullptr, 0 }'
+  return '{ %s + %d, %d }' % (array_name, start, count)
+
+# ---------------------------------------------------------------------------------------
+# The register lookup tables shared by the C++ and Python output
+class RegTables():
+  def __init__(self, reg_info_list, reg_tables, reg_table_of_variant):
+    self.reg_info_list = reg_info_list                # RegInfos, in output order
+    self.reg_tables = reg_tables                      # [table][offset] -> index into reg_info_list
+    self.reg_table_of_variant = reg_table_of_variant  # variant bit index -> table, last is no variant
+
+# ---------------------------------------------------------------------------------------
+def buildRegTables(tables, no_index):
+  reg_offset_count = tables.getRegOffsetCount()
+
+  # Registers, sorted by offset. A register that has a non-variant definition never has its
+  # variant definitions looked up, so those are left out. Definitions that are shared by several
+  # variants are only output once.
+  #
+  # Every GPU variant that has variant registers or variant fields gets a dense table that
+  # resolves each offset straight to the RegInfo of that variant, so SetGPUID() only has to pick
+  # a table and a lookup is a single index. The fields of those RegInfos are filtered down to the
+  # ones enabled for the variant. All other variants share the table of the non-variant
+  # registers, with all their fields.
+  reg_info_list = []
+  reg_info_index = {}
+  reg_variants_by_offset = {}
+  variant_bitfields = set()
+  for (offset, variant_bitfield), reg_info in sorted(tables.reg_infos_variant.items()):
+    reg_variants_by_offset.setdefault(offset, {})[variant_bitfield] = reg_info
+    variant_bitfields.add(variant_bitfield)
+  for reg_info in list(tables.reg_infos.values()) + list(tables.reg_infos_variant.values()):
+    for field in reg_info.fields:
+      for i in range(7):
+        if field[4] & (1 << i):
+          variant_bitfields.add(1 << i)
+  variant_bitfields = sorted(variant_bitfields)
+
+  def addRegInfo(reg_info):
+    if id(reg_info) not in reg_info_index:
+      reg_info_index[id(reg_info)] = len(reg_info_list)
+      reg_info_list.append(reg_info)
+    return reg_info_index[id(reg_info)]
+
+  variant_reg_infos = {}
+  def getVariantRegInfo(reg_info, variant_bitfield):
+    enabled = tuple(i for i, field in enumerate(reg_info.fields)
+                    if field[4] == 0 or (field[4] & variant_bitfield) != 0)
+    if len(enabled) == len(reg_info.fields):
+      return reg_info
+    key = (id(reg_info), enabled)
+    if key not in variant_reg_infos:
+      variant_reg_infos[key] = RegInfoEntry(reg_info.name, reg_info.is_64, reg_info.type,
+                                            reg_info.enum_handle, reg_info.shr,
+                                            reg_info.bit_width, reg_info.radix,
+                                            [reg_info.fields[i] for i in enabled])
+    return variant_reg_infos[key]
+
+  reg_tables = [[no_index] * reg_offset_count]
+  for offset in sorted(tables.reg_infos):
+    reg_tables[0][offset] = addRegInfo(tables.reg_infos[offset])
+  for variant_bitfield in variant_bitfields:
+    reg_table = [no_index] * reg_offset_count
+    for offset in range(reg_offset_count):
+      reg_info = tables.reg_infos.get(offset)
+      if reg_info is None:
+        reg_info = reg_variants_by_offset.get(offset, {}).get(variant_bitfield)
+      if reg_info is not None:
+        reg_table[offset] = addRegInfo(getVariantRegInfo(reg_info, variant_bitfield))
+    reg_tables.append(reg_table)
+
+  # Table of each variant by variant bit index, followed by the table used without a variant
+  reg_table_of_variant = [0] * 8
+  for i, variant_bitfield in enumerate(variant_bitfields):
+    reg_table_of_variant[variant_bitfield.bit_length() - 1] = i + 1
+
+  return RegTables(reg_info_list, reg_tables, reg_table_of_variant)
+
+# ---------------------------------------------------------------------------------------
+def buildRegNameOffsets(tables):
   # Append _A?XX to the name if there is any variant
   # This is to handle the cases where the regsiters have the same name
-  # but different offset for different variants, like PC_POLYGON_MODE
+  # but different offset for different variants, like PC_POLYGON_MODE. The plain name of a
+  # variant register is only added when it is at the same offset for every variant, so that
+  # lookups of the others always go through the name of the current variant.
+  reg_name_to_offset = {}
+  variant_name_offsets = {}
+  for offset in sorted(tables.reg_infos):
+    reg_name_to_offset[tables.reg_infos[offset].name] = offset
+  for (offset, variant_bitfield), reg_info in sorted(tables.reg_infos_variant.items()):
+    variant_name_offsets.setdefault(reg_info.name, set()).add(offset)
+    reg_name_to_offset[reg_info.name + '_' + getGPUStr(variant_bitfield)] = offset
+  for name, offsets in variant_name_offsets.items():
+    if len(offsets) == 1:
+      reg_name_to_offset[name] = next(iter(offsets))
+  return reg_name_to_offset
+
+# ---------------------------------------------------------------------------------------
+# Write out the gathered tables as constexpr arrays, so there is nothing to initialize at startup.
+# Each RegInfo/PacketInfo refers to its fields as a span of one flattened field array, and every
+# string lives in the string pool.
+def outputTablesCpp(pm4_info_file, tables):
+  no_index = 0xffff
+  opcode_count = tables.getOpCodeCount()
+  string_pool = StringPool()
+
+  # The tables refer to the string pool, so write them to a buffer and output the pool first
+  tables_file = io.StringIO()
+  tables_file.write('static constexpr uint16_t kNoIndex = kNoRegInfo;\n\n')
+
+  # Opcodes
+  tables_file.write('static constexpr const char *kOpCodeToString[kOpCodeCount] = {\n')
+  for opcode in range(opcode_count):
+    if opcode in tables.opcode_strings:
+      tables_file.write('    %s,\n' % string_pool.add(tables.opcode_strings[opcode]))
+    else:
+      tables_file.write('    nullptr,\n')
+  tables_file.write('};\n\n')
+
+  reg_lookup = buildRegTables(tables, no_index)
+  reg_info_list = reg_lookup.reg_info_list
+  if len(reg_info_list) >= no_index:
+    raise Exception('Too many registers for the 16-bit register index!')
+
+  tables_file.write('static constexpr RegField kRegFields[] = {\n')
+  reg_field_start = []
+  field_count = 0
+  for reg_info in reg_info_list:
+    reg_field_start.append(field_count)
+    outputRegFields(tables_file, string_pool, reg_info.fields)
+    field_count += len(reg_info.fields)
+  tables_file.write('};\n\n')
+
+  tables_file.write('static constexpr RegInfo kRegInfos[] = {\n')
+  for reg_info, field_start in zip(reg_info_list, reg_field_start):
+    tables_file.write('    { %s, %s, %s, %s, %d, %d, %d, %s },\n' % (
+        string_pool.add(reg_info.name),
+        reg_info.is_64,
+        reg_info.type,
+        reg_info.enum_handle,
+        reg_info.shr,
+        reg_info.bit_width,
+        reg_info.radix,
+        getSpanString('kRegFields', field_start, len(reg_info.fields))))
+  tables_file.write('};\n\n')
+
+  tables_file.write('static constexpr uint32_t kRegTableCount = %d;\n' % len(reg_lookup.reg_tables))
+  tables_file.write('// Index into kRegInfos for each offset, one dense table per GPU variant\n')
+  tables_file.write('static constexpr uint16_t kRegTables[kRegTableCount][kRegOffsetCount] = {\n')
+  for reg_table in reg_lookup.reg_tables:
+    tables_file.write('{\n')
+    outputIndexArray(tables_file, reg_table)
+    tables_file.write('},\n')
+  tables_file.write('};\n\n')
+
+  tables_file.write('// Index into kRegTables by variant bit index, the last entry is used without a variant\n')
+  tables_file.write('static constexpr uint8_t kRegTableOfVariant[kGPUVariantsBits + 1] = { ')
+  tables_file.write(', '.join('%d' % index for index in reg_lookup.reg_table_of_variant) + ' };\n\n')
+
+  # Register names, sorted by name for binary search
+  reg_name_to_offset = buildRegNameOffsets(tables)
+  tables_file.write('static constexpr uint32_t kRegNameCount = %d;\n' % len(reg_name_to_offset))
+  tables_file.write('static constexpr RegNameEntry kRegNames[kRegNameCount] = {\n')
+  for name in sorted(reg_name_to_offset):
+    tables_file.write('    { %s, 0x%x },\n' % (string_pool.add(name), reg_name_to_offset[name]))
+  tables_file.write('};\n\n')
+
+  # Enums
+  enum_strings = []
+  tables_file.write('static constexpr uint32_t kEnumCount = %d;\n' % len(tables.enums))
+  tables_file.write('static constexpr EnumReflection kEnumReflection[kEnumCount] = {\n')
+  for enum_name, enum_values in tables.enums:
+    # tables.enums is an array of {string, dict()}, where the key of the dict() is
+    # the integer enum_value
+    max_enum_value = max(enum_values)
+    tables_file.write('    { %d, %d },  // %s\n' % (len(enum_strings), max_enum_value + 1, enum_name))
+    for enum_value in range(max_enum_value + 1):
+      enum_strings.append(enum_values.get(enum_value))
+  tables_file.write('};\n\n')
+
+  tables_file.write('static constexpr const char *kEnumStrings[] = {\n')
+  for enum_string in enum_strings:
+    if enum_string is None:
+      tables_file.write('    nullptr,\n')
+    else:
+      tables_file.write('    %s,\n' % string_pool.add(enum_string))
+  tables_file.write('};\n\n')
+
+  # Packets
+  packet_info_list = []
+  packet_index = [no_index] * opcode_count
+  for opcode in sorted(tables.packet_infos):
+    packet_index[opcode] = len(packet_info_list)
+    packet_info_list.append(tables.packet_infos[opcode])
+
+  packet_variant_index = [[no_index] * opcode_count for i in range(7)]
+  for (opcode, variant_bitfield), packet_info in sorted(tables.packet_infos_variant.items()):
+    packet_variant_index[variant_bitfield.bit_length() - 1][opcode] = len(packet_info_list)
+    packet_info_list.append(packet_info)
+
+  # Repeated packet opcodes, grouped by opcode in the order they were encountered
+  packet_multiple = []
+  packet_multiple_begin = []
+  packet_infos_multiple = sorted(tables.packet_infos_multiple, key=lambda x: x[0])
+  for opcode in range(opcode_count + 1):
+    packet_multiple_begin.append(len(packet_multiple))
+    for multiple_opcode, packet_info in packet_infos_multiple:
+      if multiple_opcode == opcode:
+        packet_multiple.append(len(packet_info_list))
+        packet_info_list.append(packet_info)
+  if not packet_multiple:
+    packet_multiple.append(no_index)
+
+  tables_file.write('static constexpr PacketField kPacketFields[] = {\n')
+  packet_field_start = []
+  field_count = 0
+  for packet_info in packet_info_list:
+    packet_field_start.append(field_count)
+    outputPacketFieldsCpp(tables_file, string_pool, packet_info.fields)
+    field_count += len(packet_info.fields)
+  tables_file.write('};\n\n')
+
+  tables_file.write('static constexpr PacketInfo kPacketInfos[] = {\n')
+  for packet_info, field_start in zip(packet_info_list, packet_field_start):
+    tables_file.write('    { %s, %d, %s, %s },  // %s\n' % (
+        string_pool.add(packet_info.name),
+        packet_info.array_size,
+        packet_info.stripe_variant,
+        getSpanString('kPacketFields', field_start, len(packet_info.fields)),
+        packet_info.name))
+  tables_file.write('};\n\n')
+
+  tables_file.write('static constexpr uint16_t kPacketIndex[kOpCodeCount] = {\n')
+  outputIndexArray(tables_file, packet_index)
+  tables_file.write('};\n\n')
+
+  tables_file.write('static constexpr uint16_t kPacketVariantIndex[kGPUVariantsBits][kOpCodeCount] = {\n')
+  for row in packet_variant_index:
+    tables_file.write('{\n')
+    outputIndexArray(tables_file, row)
+    tables_file.write('},\n')
+  tables_file.write('};\n\n')
+
+  tables_file.write('static constexpr uint16_t kPacketMultipleBegin[kOpCodeCount + 1] = {\n')
+  outputIndexArray(tables_file, packet_multiple_begin)
+  tables_file.write('};\n\n')
+
+  tables_file.write('static constexpr uint16_t kPacketMultiple[] = {\n')
+  outputIndexArray(tables_file, packet_multiple)
+  tables_file.write('};\n\n')
+
+  if len(packet_info_list) >= no_index:
+    raise Exception('Too many packets for the 16-bit packet index!')
+
   pm4_info_file.writelines('''
-  for (uint64_t i = 0; i < g_sRegInfo.size(); ++i)
-  {
-    if (g_sRegInfo[i].m_name != nullptr)
-    {
-      g_sRegNameToIndex[g_sRegInfo[i].m_name] = (uint32_t)i;
-    }
-  }
-	for (auto &reg : g_sRegInfoVariant)
-	{
-		const std::string& name = reg.second.m_name;
-		const uint32_t shift_bits = 32 - kGPUVariantsBits;
-		uint32_t gpu_variants = reg.first << shift_bits >> shift_bits;
-		uint32_t reg_offset = reg.first >> kGPUVariantsBits;
-		g_sRegNameToIndex[name] = reg_offset;
-		if (gpu_variants != 0)
-		{
-			uint32_t bit_offset = 0;
-			while(gpu_variants != 0)
-			{
-				if ((gpu_variants & 0x1) != 0)
-				{
-					const std::string name_with_variant = name + "_" + GetGPUStr(static_cast<GPUVariantType>(1 << (bit_offset)));
-					g_sRegNameToIndex[name_with_variant] = reg_offset;
-				}
-				gpu_variants = gpu_variants>>1;
-				++bit_offset;
-			}
-		}
-	}\n''')
+struct RegNameEntry
+{
+    const char *m_name;
+    uint32_t    m_offset;
+};
+
+struct EnumReflection
+{
+    uint32_t m_offset;  // Index of the first string in kEnumStrings
+    uint32_t m_size;    // Highest enum value + 1
+};
+
+''')
+  string_pool.output(pm4_info_file)
+  pm4_info_file.write(tables_file.getvalue())
 
 # ---------------------------------------------------------------------------------------
 
@@ -936,27 +1231,21 @@ def outputFunctionsCpp(pm4_info_file):
   pm4_info_file.writelines('''
 const char *GetOpCodeString(uint32_t op_code)
 {
-    Pm4InfoInit();
-    return g_sOpCodeToString[op_code];
+    if (op_code >= kOpCodeCount)
+        return nullptr;
+    return kOpCodeToString[op_code];
 }
 
+static RegInfoTable g_sReg_table = { kRegTables[kRegTableOfVariant[kGPUVariantsBits]], kRegInfos };
+
 const RegInfo *GetRegInfo(uint32_t reg)
 {
-    Pm4InfoInit();
+    return g_sReg_table.GetRegInfo(reg);
+}
 
-    // check without variant as key
-    if (g_sRegInfo[reg].m_name == nullptr)
-    {
-        // check with variant as key
-        uint32_t key = (reg << kGPUVariantsBits) | g_sGPU_variant;
-        auto it = g_sRegInfoVariant.find(key);
-        if (it == g_sRegInfoVariant.end())
-        {
-            return nullptr;
-        }
-        return &it->second;
-    }
-    return &g_sRegInfo[reg];
+const RegInfoTable &GetRegInfoTable()
+{
+    return g_sReg_table;
 }
 
 const RegInfo *GetRegByName(const char *name)
@@ -974,7 +1263,7 @@ const RegField *GetRegFieldByName(const char *name, const RegInfo *info)
     if (info == nullptr)
         return nullptr;
 
-    const DiveVector<RegField> &field = info->m_fields;
+    const Pm4Span<RegField> &field = info->m_fields;
     auto i = std::find_if(field.begin(), field.end(), [&](const RegField& f) {
         return strcmp(name, f.m_name) == 0;
     });
@@ -984,66 +1273,76 @@ const RegField *GetRegFieldByName(const char *name, const RegInfo *info)
     return &(*i);
 }
 
-uint32_t GetRegOffsetByName(const char *name)
+static const RegNameEntry *FindRegName(const char *name)
 {
-    Pm4InfoInit();
+    const RegNameEntry *end = kRegNames + kRegNameCount;
+    const RegNameEntry *i = std::lower_bound(kRegNames, end, name, [](const RegNameEntry &entry, const char *n) {
+        return strcmp(entry.m_name, n) < 0;
+    });
+    if (i == end || strcmp(i->m_name, name) != 0)
+        return nullptr;
+    return i;
+}
 
+uint32_t GetRegOffsetByName(const char *name)
+{
     if (g_sGPU_variant == kGPUVariantNone) 
     {
         return kInvalidRegOffset;
     }
 
-    std::string str = std::string(name);
-    auto i = g_sRegNameToIndex.find(str);
-    if (i == g_sRegNameToIndex.end())
+    const RegNameEntry *i = FindRegName(name);
+    if (i == nullptr)
     {
-        std::string name_with_variant = str + "_" + GetGPUStr(g_sGPU_variant);
-        i = g_sRegNameToIndex.find(name_with_variant);
-        if (i == g_sRegNameToIndex.end())
+        std::string name_with_variant = std::string(name) + "_" + GetGPUStr(g_sGPU_variant);
+        i = FindRegName(name_with_variant.c_str());
+        if (i == nullptr)
         {
             return kInvalidRegOffset;
         }
     }
-    return i->second;
+    return i->m_offset;
 }
 
 const char *GetEnumString(uint32_t enum_handle, uint32_t val)
 {
-    if (g_sEnumReflection.size() <= enum_handle)
+    if (kEnumCount <= enum_handle)
         return nullptr;
-    if (g_sEnumReflection[enum_handle].size() <= val)
+    if (kEnumReflection[enum_handle].m_size <= val)
         return nullptr;
-    return g_sEnumReflection[enum_handle][val];
+    return kEnumStrings[kEnumReflection[enum_handle].m_offset + val];
 }
 
 const PacketInfo *GetPacketInfo(uint32_t op_code)
 {
+    if (op_code >= kOpCodeCount)
+        return nullptr;
+
     // check without variant as key
-    if (g_sPacketInfo[op_code].m_name == nullptr)
+    uint16_t index = kPacketIndex[op_code];
+    if (index == kNoIndex)
     {
         // check with variant as key
-        uint32_t key = (op_code << kGPUVariantsBits) | g_sGPU_variant;
-        auto it = g_sPacketInfoVariant.find(key);
-        if (it == g_sPacketInfoVariant.end())
-        {
+        if (g_sGPU_variant_index >= kGPUVariantsBits)
+            return nullptr;
+        index = kPacketVariantIndex[g_sGPU_variant_index][op_code];
+        if (index == kNoIndex)
             return nullptr;
-        }
-        return &it->second;
     }
-
-    return &g_sPacketInfo[op_code];
+    return &kPacketInfos[index];
 }
 
 const PacketInfo *GetPacketInfo(uint32_t op_code, const char *name)
 {
-    if (g_sPacketInfo[op_code].m_name == nullptr)
+    if (op_code >= kOpCodeCount || kPacketIndex[op_code] == kNoIndex)
         return nullptr;
-    if (strcmp(g_sPacketInfo[op_code].m_name, name) == 0)
-        return &g_sPacketInfo[op_code];
-    auto ret_pair = g_sPacketInfoMultiple.equal_range(op_code);
-    for (auto it  = ret_pair.first; it != ret_pair.second; ++it) {
-        if (strcmp(it->second.m_name, name) == 0)
-            return &it->second;
+    const PacketInfo *packet_info = &kPacketInfos[kPacketIndex[op_code]];
+    if (strcmp(packet_info->m_name, name) == 0)
+        return packet_info;
+    for (uint32_t i = kPacketMultipleBegin[op_code]; i < kPacketMultipleBegin[op_code + 1]; ++i) {
+        packet_info = &kPacketInfos[kPacketMultiple[i]];
+        if (strcmp(packet_info->m_name, name) == 0)
+            return packet_info;
     }
     return nullptr;
 }
@@ -1052,14 +1351,17 @@ void SetGPUID(uint32_t gpu_id)
 {
     g_sGPU_id = gpu_id;
     uint32_t gpu_series = gpu_id / 100;
-    if((gpu_series >= 2) && (gpu_series <= 7))
+    if((gpu_series >= 2) && (gpu_series <= 8))
     {
         g_sGPU_variant = static_cast<GPUVariantType>(1 << (gpu_series - 2));
+        g_sGPU_variant_index = gpu_series - 2;
     }
     else
     {
         g_sGPU_variant = kGPUVariantNone;
+        g_sGPU_variant_index = kGPUVariantsBits;
     }
+    g_sReg_table.m_index = kRegTables[kRegTableOfVariant[g_sGPU_variant_index]];
 }
 
 uint32_t GetGPUID()
@@ -1080,6 +1382,375 @@ bool IsFieldEnabled(const RegField* field)
 '''
   )
 
+# ---------------------------------------------------------------------------------------
+# Python output
+value_types = ['kBoolean', 'kUint', 'kInt', 'kFloat', 'kFixed', 'kUFixed', 'kAddress', 'kWaddress',
+               'kHex', 'kRegID', 'kOther']
+
+def getValueTypeIndex(type_string):
+  return value_types.index(type_string.split('::')[-1])
+
+def getEnumHandleValue(enum_handle):
+  if enum_handle == 'UINT8_MAX':
+    return -1
+  return int(enum_handle)
+
+# Arrays are stored as base64 of the zlib-compressed little-endian values, which keeps the
+# module small (most of the dense register tables is empty) and quick to import
+def outputNumpyArrayPy(pm4_info_file, name, format, values, shape=None, comment=None):
+  data = struct.pack('<%d%s' % (len(values), format), *values)
+  encoded = base64.b64encode(zlib.compress(data, 9)).decode('ascii')
+  if comment:
+    pm4_info_file.write('# %s\n' % comment)
+  pm4_info_file.write('%s = _array(\'<%s\', %s, (\n' % (name, format, repr(shape if shape else (len(values),))))
+  for i in range(0, len(encoded), 96):
+    pm4_info_file.write('    \'%s\'\n' % encoded[i:i+96])
+  pm4_info_file.write('))\n\n')
+
+def outputStringArrayPy(pm4_info_file, name, strings, comment=None):
+  if comment:
+    pm4_info_file.write('# %s\n' % comment)
+  pm4_info_file.write('%s = np.array([\n' % name)
+  for string in strings:
+    pm4_info_file.write('    %s,\n' % repr(string))
+  pm4_info_file.write('], dtype=object)\n\n')
+
+def outputPy(pm4_info_file, tables):
+  no_index = 0xffff
+  opcode_count = tables.getOpCodeCount()
+  reg_offset_count = tables.getRegOffsetCount()
+  reg_lookup = buildRegTables(tables, no_index)
+
+  pm4_info_file.writelines("""#
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#######################################################################################################################
+#
+# WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!  WARNING!
+#
+# This code has been generated automatically by generatePm4Info_adreno.py. Do not hand-modify this code.
+#
+#######################################################################################################################
+
+\"\"\"PM4 opcode, register and enum tables of pm4_info.h as NumPy arrays, with a batch decoder.
+
+decodeIb() takes the dwords of a whole indirect buffer as a uint32 array and returns the packets,
+the register writes and the register field values as columns, for scripted analysis of captures:
+
+    import numpy as np
+    import pm4_info
+
+    ib = pm4_info.decodeIb(np.fromfile('ib.bin', dtype='<u4'), gpu_id=740)
+    names = pm4_info.REG_NAMES[ib.reg_info]
+\"\"\"
+
+import base64
+import zlib
+
+import numpy as np
+
+
+def _array(dtype, shape, data):
+    return np.frombuffer(zlib.decompress(base64.b64decode(''.join(data))), dtype=dtype).reshape(shape)
+
+
+# GPUVariantType
+GPU_VARIANT_NONE = 0x0
+A2XX = 0x1
+A3XX = 0x2
+A4XX = 0x4
+A5XX = 0x8
+A6XX = 0x10
+A7XX = 0x20
+A8XX = 0x40
+GPU_VARIANTS_BITS = 7
+
+""")
+  pm4_info_file.write('# ValueType, indexed by REG_TYPE and FIELD_TYPE\n')
+  pm4_info_file.write('VALUE_TYPES = (%s)\n\n' % ', '.join(repr(value_type) for value_type in value_types))
+  pm4_info_file.write('NO_REG_INFO = 0x%x\n' % no_index)
+  pm4_info_file.write('OPCODE_COUNT = 0x%x\n' % opcode_count)
+  pm4_info_file.write('REG_OFFSET_COUNT = 0x%x\n\n' % reg_offset_count)
+
+  # Opcodes
+  pm4_info_file.write('OPCODES = {\n')
+  for opcode in sorted(tables.opcode_strings):
+    pm4_info_file.write('    %s: 0x%x,\n' % (repr(tables.opcode_strings[opcode]), opcode))
+  pm4_info_file.write('}\n\n')
+  outputStringArrayPy(pm4_info_file, 'OPCODE_NAMES',
+                      [tables.opcode_strings.get(opcode) for opcode in range(opcode_count)],
+                      'Opcode name by opcode, or None')
+
+  # Registers, indexed by RegInfo index
+  reg_info_list = reg_lookup.reg_info_list
+  reg_field_begin = []
+  fields = []
+  for reg_info in reg_info_list:
+    reg_field_begin.append(len(fields))
+    fields += reg_info.fields
+  outputStringArrayPy(pm4_info_file, 'REG_NAMES', [reg_info.name for reg_info in reg_info_list],
+                      'Registers, by RegInfo index')
+  outputNumpyArrayPy(pm4_info_file, 'REG_IS_64', 'B', [int(reg_info.is_64) for reg_info in reg_info_list])
+  outputNumpyArrayPy(pm4_info_file, 'REG_TYPE', 'B', [getValueTypeIndex(reg_info.type) for reg_info in reg_info_list])
+  outputNumpyArrayPy(pm4_info_file, 'REG_ENUM', 'h', [getEnumHandleValue(reg_info.enum_handle) for reg_info in reg_info_list],
+                     comment='Enum handle of the register, or -1')
+  outputNumpyArrayPy(pm4_info_file, 'REG_SHR', 'B', [reg_info.shr for reg_info in reg_info_list])
+  outputNumpyArrayPy(pm4_info_file, 'REG_FIELD_BEGIN', 'I', reg_field_begin,
+                     comment='Index of the first field of the register in the FIELD_* arrays')
+  outputNumpyArrayPy(pm4_info_file, 'REG_FIELD_COUNT', 'H', [len(reg_info.fields) for reg_info in reg_info_list])
+
+  reg_tables = reg_lookup.reg_tables
+  outputNumpyArrayPy(pm4_info_file, 'REG_TABLES', 'H', [index for reg_table in reg_tables for index in reg_table],
+                     (len(reg_tables), reg_offset_count),
+                     'RegInfo index for each offset, or NO_REG_INFO, one dense table per GPU variant')
+  pm4_info_file.write('# Index into REG_TABLES by variant bit index, the last entry is used without a variant\n')
+  pm4_info_file.write('REG_TABLE_OF_VARIANT = (%s)\n\n' % ', '.join('%d' % index for index in reg_lookup.reg_table_of_variant))
+
+  reg_name_to_offset = buildRegNameOffsets(tables)
+  pm4_info_file.write('# Register offset by name. Registers at a different offset for some GPU variants are\n')
+  pm4_info_file.write('# only listed with the _A?XX suffix of the variant\n')
+  pm4_info_file.write('REG_OFFSETS = {\n')
+  for name in sorted(reg_name_to_offset):
+    pm4_info_file.write('    %s: 0x%x,\n' % (repr(name), reg_name_to_offset[name]))
+  pm4_info_file.write('}\n\n')
+
+  # Fields
+  outputStringArrayPy(pm4_info_file, 'FIELD_NAMES', [field[8] for field in fields],
+                      'Register fields, in the order of REG_FIELD_BEGIN')
+  outputNumpyArrayPy(pm4_info_file, 'FIELD_TYPE', 'B', [getValueTypeIndex(field[0]) for field in fields])
+  outputNumpyArrayPy(pm4_info_file, 'FIELD_ENUM', 'h', [getEnumHandleValue(field[1]) for field in fields])
+  outputNumpyArrayPy(pm4_info_file, 'FIELD_SHIFT', 'B', [field[2] for field in fields])
+  outputNumpyArrayPy(pm4_info_file, 'FIELD_SHR', 'B', [field[3] for field in fields])
+  outputNumpyArrayPy(pm4_info_file, 'FIELD_VARIANTS', 'B', [field[4] for field in fields])
+  outputNumpyArrayPy(pm4_info_file, 'FIELD_MASK', 'Q', [field[7] for field in fields])
+
+  # Enums
+  enum_offset = []
+  enum_size = []
+  enum_strings = []
+  for enum_name, enum_values in tables.enums:
+    max_enum_value = max(enum_values)
+    enum_offset.append(len(enum_strings))
+    enum_size.append(max_enum_value + 1)
+    for enum_value in range(max_enum_value + 1):
+      enum_strings.append(enum_values.get(enum_value))
+  pm4_info_file.write('ENUM_NAMES = (\n')
+  for enum_name, enum_values in tables.enums:
+    pm4_info_file.write('    %s,\n' % repr(enum_name))
+  pm4_info_file.write(')\n\n')
+  outputNumpyArrayPy(pm4_info_file, 'ENUM_OFFSET', 'I', enum_offset,
+                     comment='Index of the first string of each enum handle in ENUM_STRINGS')
+  outputNumpyArrayPy(pm4_info_file, 'ENUM_SIZE', 'I', enum_size)
+  outputStringArrayPy(pm4_info_file, 'ENUM_STRINGS', enum_strings)
+
+  pm4_info_file.writelines(pm4_info_decoder_py)
+
+pm4_info_decoder_py = """
+def getVariantIndex(gpu_id):
+    \"\"\"Bit index of the GPU variant of gpu_id, as in SetGPUID(), or GPU_VARIANTS_BITS if none\"\"\"
+    gpu_series = gpu_id // 100
+    if 2 <= gpu_series <= 8:
+        return gpu_series - 2
+    return GPU_VARIANTS_BITS
+
+
+def getRegTable(gpu_id):
+    \"\"\"Dense RegInfo index table of the GPU variant of gpu_id, with REG_OFFSET_COUNT entries\"\"\"
+    return REG_TABLES[REG_TABLE_OF_VARIANT[getVariantIndex(gpu_id)]]
+
+
+def getEnumString(enum_handle, value):
+    if enum_handle < 0 or enum_handle >= len(ENUM_OFFSET) or value >= ENUM_SIZE[enum_handle]:
+        return None
+    return ENUM_STRINGS[ENUM_OFFSET[enum_handle] + value]
+
+
+def _parity(values):
+    # Odd parity, see EmulatePM4::CalcParity()
+    values = values ^ (values >> 16)
+    values ^= values >> 8
+    values ^= values >> 4
+    return (~0x6996 >> (values & 0xf).astype(np.int32)) & 1
+
+
+def getPacketSizes(dwords):
+    \"\"\"Size in dwords of the packet that would start at each dword, from the packet type and count
+    only, or 0 if the dword is not a type 2, 4 or 7 header\"\"\"
+    dwords = np.asarray(dwords, dtype=np.uint32)
+    packet_type = dwords >> 28
+    sizes = np.zeros(len(dwords), dtype=np.int64)
+    type4 = packet_type == 4
+    sizes[type4] = (dwords[type4] & 0x7f).astype(np.int64) + 1
+    type7 = packet_type == 7
+    sizes[type7] = (dwords[type7] & 0x7fff).astype(np.int64) + 1
+    sizes[packet_type == 2] = 1
+    return sizes
+
+
+def isValidHeader(header_dwords):
+    \"\"\"Parity and reserved bit checks of packet headers, as done by EmulatePM4::ExecuteSubmit()\"\"\"
+    header_dwords = np.asarray(header_dwords, dtype=np.uint32)
+    packet_type = header_dwords >> 28
+    count = header_dwords & 0x7f
+    offset = (header_dwords >> 8) & 0x7ffff
+    valid4 = ((((header_dwords >> 7) & 1) == _parity(count)) &
+              (((header_dwords >> 27) & 1) == _parity(offset)))
+    count = header_dwords & 0x7fff
+    opcode = (header_dwords >> 16) & 0x7f
+    valid7 = ((((header_dwords >> 15) & 1) == _parity(count)) &
+              (((header_dwords >> 23) & 1) == _parity(opcode)) &
+              (((header_dwords >> 24) & 0xf) == 0))
+    return np.select([packet_type == 4, packet_type == 7], [valid4, valid7], packet_type == 2)
+
+
+def findPacketHeaders(dwords):
+    \"\"\"Indices of the packet headers in dwords, following the packets from the first dword and
+    stopping at the first invalid header or at a packet that runs past the end\"\"\"
+    dwords = np.asarray(dwords, dtype=np.uint32)
+    sizes = getPacketSizes(dwords).tolist()
+    dword_count = len(sizes)
+
+    # Walking the packets is the only sequential part, so keep it to plain list indexing
+    headers = []
+    append = headers.append
+    index = 0
+    while index < dword_count:
+        size = sizes[index]
+        if size == 0:
+            break
+        append(index)
+        index += size
+    if index > dword_count:
+        headers.pop()
+    headers = np.array(headers, dtype=np.int64)
+
+    invalid = np.flatnonzero(~isValidHeader(dwords[headers]))
+    if len(invalid) > 0:
+        headers = headers[:invalid[0]]
+    return headers
+
+
+def _raggedRange(begin, count):
+    # Concatenation of np.arange(begin[i], begin[i] + count[i]) for every i, and the i of each
+    total = int(count.sum())
+    owner = np.repeat(np.arange(len(count)), count)
+    first = np.cumsum(count) - count
+    return np.arange(total) - np.repeat(first, count) + np.repeat(begin, count), owner
+
+
+class IbColumns():
+    \"\"\"Columns of a decoded indirect buffer
+
+    Packets (one row per packet):
+        packet_dword   index of the packet header in the dword array
+        packet_type    PM4 packet type: 2, 4 or 7
+        packet_opcode  opcode of type 7 packets, -1 otherwise
+        packet_count   number of payload dwords
+
+    Register writes of type 4 and CP_CONTEXT_REG_BUNCH packets (one row per written dword):
+        reg_packet     index of the packet
+        reg_dword      index of the value in the dword array
+        reg_offset     register offset
+        reg_value      value of the register. For a 64-bit register this includes the upper dword,
+                       if it is written by the next dword of the same packet
+        reg_info       RegInfo index (REG_NAMES, REG_FIELD_BEGIN, ...), or NO_REG_INFO
+
+    Register fields of the register writes (one row per field of a known register):
+        field_reg      index of the register write
+        field_index    index into the FIELD_* arrays
+        field_value    ((reg_value & FIELD_MASK) >> FIELD_SHIFT) << FIELD_SHR
+    \"\"\"
+    pass
+
+
+def decodeIb(dwords, gpu_id):
+    \"\"\"Decode the packets, register writes and register fields of an indirect buffer\"\"\"
+    dwords = np.asarray(dwords, dtype=np.uint32)
+    columns = IbColumns()
+
+    # Packets
+    headers = findPacketHeaders(dwords)
+    header_dwords = dwords[headers]
+    packet_type = (header_dwords >> 28).astype(np.uint8)
+    is_type7 = packet_type == 7
+    columns.packet_dword = headers
+    columns.packet_type = packet_type
+    columns.packet_opcode = np.where(is_type7, (header_dwords >> 16) & 0x7f, -1).astype(np.int16)
+    columns.packet_count = np.select([packet_type == 4, is_type7],
+                                     [header_dwords & 0x7f, header_dwords & 0x7fff], 0).astype(np.uint32)
+
+    # Type 4 packets write count consecutive registers starting at the header offset
+    type4 = np.flatnonzero(packet_type == 4)
+    type4_count = columns.packet_count[type4].astype(np.int64)
+    reg_dword, owner = _raggedRange(headers[type4] + 1, type4_count)
+    reg_packet = type4[owner]
+    reg_offset = ((header_dwords[type4] >> 8) & 0x7ffff)[owner] + (reg_dword - (headers[type4] + 1)[owner])
+    reg_value = dwords[reg_dword]
+
+    # CP_CONTEXT_REG_BUNCH packets are made of (offset, value) pairs
+    bunch = np.flatnonzero(columns.packet_opcode == OPCODES['CP_CONTEXT_REG_BUNCH'])
+    bunch_pairs = columns.packet_count[bunch].astype(np.int64) // 2
+    pair_dword, owner = _raggedRange(np.zeros(len(bunch), dtype=np.int64), bunch_pairs)
+    pair_dword = headers[bunch][owner] + 1 + pair_dword * 2
+    if len(pair_dword) > 0:
+        reg_dword = np.concatenate([reg_dword, pair_dword + 1])
+        reg_packet = np.concatenate([reg_packet, bunch[owner]])
+        reg_offset = np.concatenate([reg_offset, dwords[pair_dword]])
+        reg_value = np.concatenate([reg_value, dwords[pair_dword + 1]])
+        order = np.argsort(reg_dword, kind='stable')
+        reg_dword = reg_dword[order]
+        reg_packet = reg_packet[order]
+        reg_offset = reg_offset[order]
+        reg_value = reg_value[order]
+
+    reg_offset = reg_offset.astype(np.uint32)
+    reg_table = getRegTable(gpu_id)
+    in_range = reg_offset < REG_OFFSET_COUNT
+    reg_info = np.full(len(reg_offset), NO_REG_INFO, dtype=np.uint16)
+    reg_info[in_range] = reg_table[reg_offset[in_range]]
+    known = reg_info != NO_REG_INFO
+
+    # The upper dword of a 64-bit register is the next write of the same packet, if it is to the
+    # next offset
+    reg_value = reg_value.astype(np.uint64)
+    is_64 = np.zeros(len(reg_offset), dtype=bool)
+    is_64[known] = REG_IS_64[reg_info[known]] != 0
+    upper = np.flatnonzero(is_64[:-1] & (reg_offset[1:] == reg_offset[:-1] + 1) &
+                           (reg_packet[1:] == reg_packet[:-1]))
+    reg_value[upper] |= reg_value[upper + 1] << np.uint64(32)
+
+    columns.reg_packet = reg_packet
+    columns.reg_dword = reg_dword
+    columns.reg_offset = reg_offset
+    columns.reg_value = reg_value
+    columns.reg_info = reg_info
+
+    # Fields
+    written = np.flatnonzero(known)
+    written_info = reg_info[written]
+    field_index, owner = _raggedRange(REG_FIELD_BEGIN[written_info].astype(np.int64),
+                                      REG_FIELD_COUNT[written_info].astype(np.int64))
+    field_reg = written[owner]
+    field_value = (reg_value[field_reg] & FIELD_MASK[field_index]) >> FIELD_SHIFT[field_index].astype(np.uint64)
+    field_value <<= FIELD_SHR[field_index].astype(np.uint64)
+    columns.field_reg = field_reg
+    columns.field_index = field_index
+    columns.field_value = field_value
+    return columns
+"""
+
 # ---------------------------------------------------------------------------------------
 if len(sys.argv) != 4:
   print(sys.argv[0] + ' <Path to adreno register file> <Path to output file base-name>')
@@ -1087,37 +1758,27 @@ if len(sys.argv) != 4:
 
 try:
 
+  timer = PassTimer()
+
   register_root = sys.argv[1]
   register_file = sys.argv[2]
 
-  # create element tree object
-  tree = ET.parse(sys.argv[1]+'/'+sys.argv[2])
-
-  # get root element
-  registers_et_root = tree.getroot()
-
-  # import any additional xml files referenced in the base xml file via "import" tags
-  sub_xml_file_set = set()
-  for child in registers_et_root:
-    if child.tag == '{http://nouveau.freedesktop.org/}import':
-      if 'file' in child.attrib:
-        sub_xml_file = sys.argv[1]+'/'+child.attrib['file']
-
-        # Check if this file has already been parsed or not
-        if sub_xml_file not in sub_xml_file_set:
-          sub_xml_file_set.add(sub_xml_file)
-          sub_tree = ET.parse(sys.argv[1]+'/'+child.attrib['file'])
-          for sub_tree_child in sub_tree.getroot():
-            registers_et_root.append(sub_tree_child)
+  # Load the register model shared with generateAdrenoHeader.py. The xml (including any
+  # additional xml files referenced via "import" tags) is only parsed if the model is missing
+  # or out of date.
+  model_path = getRegisterModelPath(os.path.dirname(os.path.abspath(sys.argv[3])), register_file)
+  with timer.measure('loadRegisterModel'):
+    symbols = loadRegisterModel(register_root, register_file, model_path)
+  if symbols.loaded_from_model:
+    print('%s: using register model %s' % (sys.argv[0], model_path))
 
   pm4_info_file_h = open(sys.argv[3] + '.h', 'w')
   pm4_info_file_cpp = open(sys.argv[3] + '.cpp', 'w')
+  pm4_info_file_py = open(sys.argv[3] + '.py', 'w')
 
   head, tail = os.path.split(sys.argv[3] + '.h')
   pm4_info_filename_h = tail
 
-  addMissingDomains(registers_et_root)
-
   # Parse type3 opcodes
   # There can be multiple opcodes with the same value, to support different adreno versions
   # The opcodes are listed in hw revision order, with later entries of the same opcode used for later revisions
@@ -1125,7 +1786,7 @@ try:
 
   # Find the "adreno_pm4_type3_packets" enum (defined in the andreno_pm4.xml file)
   opcode_dict = {}
-  pm4_type_packets = registers_et_root.find('./{http://nouveau.freedesktop.org/}enum[@name="adreno_pm4_type3_packets"]')
+  pm4_type_packets = symbols.enums['adreno_pm4_type3_packets']
   for pm4_type_packet in pm4_type_packets:
     if 'name' in pm4_type_packet.attrib and 'value' in pm4_type_packet.attrib:
       pm4_name = pm4_type_packet.attrib['name']
@@ -1134,18 +1795,29 @@ try:
       if pm4_name.startswith('CP_') or pm4_name.startswith('A6XX_'):
         opcode_dict[int(pm4_value,0)] = pm4_name
 
+  tables = gatherPm4Tables(symbols, opcode_dict, timer)
+
   # .H file
-  outputH(pm4_info_file_h)
+  with timer.measure('outputH'):
+    outputH(pm4_info_file_h, tables)
 
   # .CPP file
-  outputHeaderCpp(pm4_info_filename_h, pm4_info_file_cpp)
-  outputPm4InfoInitFunc(pm4_info_file_cpp, registers_et_root, opcode_dict)
-  outputFunctionsCpp(pm4_info_file_cpp)
+  with timer.measure('outputCpp'):
+    outputHeaderCpp(pm4_info_filename_h, pm4_info_file_cpp)
+    outputTablesCpp(pm4_info_file_cpp, tables)
+    outputFunctionsCpp(pm4_info_file_cpp)
+
+  # .PY file
+  with timer.measure('outputPy'):
+    outputPy(pm4_info_file_py, tables)
 
   # close to flush
+  pm4_info_file_py.close();
   pm4_info_file_cpp.close();
   pm4_info_file_h.close();
 
+  timer.report(sys.argv[0])
+
   # lint
   format_cmd = 'clang-format -i -style=file ' + sys.argv[2]
   format_cmd_h = format_cmd + '.h'
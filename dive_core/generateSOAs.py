@@ -12,14 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader
 '''
@@ -84,12 +86,26 @@ EventmarkerInfo &events = marker_data.Events();
 auto it = events.Add();
 it->SetThreadY(7);
 ```
+
+# Incremental output
+
+Files are rendered into memory and only written if their content changed, so that re-running the
+script does not rebuild everything that includes the generated header. A manifest next to the spec
+(`.<spec>.soa_manifest`) records a hash of the spec, the template and this script; if none of them
+changed and the outputs still match the manifest, the script does nothing. Delete the manifest to
+force the files to be regenerated.
 '''
 
 
-def clang_format(path: str) -> None:
+TEMPLATE_NAME = 'struct_of_arrays.jinja'
+
+# Resolved before `main` changes the working directory
+GENERATOR_PATH = os.path.abspath(__file__)
+
+
+def clang_format(paths: List[str]) -> None:
     '''
-    Run clang-format on C++ source file given by the path
+    Run clang-format on the C++ source files given by the paths, in a single invocation
     '''
     if 'CLANG_FORMAT' in os.environ:
         clang_format_path = os.environ['CLANG_FORMAT']
@@ -103,7 +119,10 @@ def clang_format(path: str) -> None:
                          check=True)
     if 'clang-format version 18' not in res.stdout.decode('utf-8'):
         raise (Exception('Incorrect clang-format version'))
-    subprocess.run([clang_format_path, '-i', path], check=True)
+    # The files may be outside of the source tree, so point clang-format at the tree's style
+    style = 'file:' + os.path.abspath('.clang-format')
+    subprocess.run([clang_format_path, '-i', '--style=' + style, *paths],
+                   check=True)
 
 
 def snake_case(value: str) -> str:
@@ -120,9 +139,21 @@ def _is_numeric(ty: str) -> str:
     return ty in ['int32_t', 'uint32_t', 'int64_t', 'uint64_t']
 
 
-def generate(spec: Dict, gen_name: str) -> None:
+def spec_hash(soa: Dict, options: List[str]) -> str:
     '''
-    Generates the header and source files for a loaded spec
+    Hash of the spec of a single SOA type, as a C++ uint64_t literal. Columnar snapshots record
+    this hash, so that any change to the spec invalidates the snapshots written before it.
+
+    This is used by the template.
+    '''
+    text = json.dumps({'soa': soa, 'options': options}, sort_keys=True)
+    return '0x%sull' % hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def render(spec: Dict, gen_name: str) -> Dict[str, str]:
+    '''
+    Renders the header, source and natvis files for a loaded spec into memory, and formats the C++
+    files. Returns the content of each file, keyed by path.
     '''
     template_dir = os.path.abspath('dive_core')
     loader = FileSystemLoader(template_dir)
@@ -134,19 +165,18 @@ def generate(spec: Dict, gen_name: str) -> None:
     env.tests['numeric'] = _is_numeric
     env.filters['snake_case'] = snake_case
 
+    outputs = {}
+
     def gen_file(macro, path, **kwargs):
-        Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
-        with open(path, 'w') as f:
-            tmpl = ''.join(
-                ["{% import 'struct_of_arrays.jinja' as macros %}", macro])
-            env.from_string(tmpl).stream(**kwargs).dump(f)
-        if path.endswith('.h') or path.endswith('.cpp'):
-            clang_format(path)
+        tmpl = ''.join(
+            ["{% import '" + TEMPLATE_NAME + "' as macros %}", macro])
+        outputs[path] = env.from_string(tmpl).render(**kwargs)
 
     spec_options = []
     if 'options' in spec['header']:
         spec_options = spec['header']['options']
     env.globals['options'] = spec_options
+    env.filters['spec_hash'] = lambda soa: spec_hash(soa, spec_options)
 
     gen_file('{{macros.soa_h(soas, includes, namespace, gen_name)}}',
              spec['header']['path'],
@@ -169,6 +199,123 @@ def generate(spec: Dict, gen_name: str) -> None:
              soas=spec['soa_types'],
              gen_name=gen_name)
 
+    # Python bindings (pybind11), exposing each field as a NumPy array
+    if 'py' in spec:
+        gen_file(
+            '{{macros.soa_py_cpp(soas, bind_func_name, includes, namespace, gen_name)}}',
+            spec['py']['path'],
+            soas=spec['soa_types'],
+            bind_func_name=spec['py']['bind_func_name'],
+            includes=spec['py']['includes'],
+            namespace=spec['namespace'],
+            gen_name=gen_name)
+
+    # Format all of the C++ files with a single clang-format run, on copies in a temporary
+    # directory. The copies keep their file names, which clang-format uses to find the main include.
+    cpp_paths = [p for p in outputs if p.endswith('.h') or p.endswith('.cpp')]
+    if cpp_paths:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_paths = []
+            for i, path in enumerate(cpp_paths):
+                tmp_path = os.path.join(tmp_dir, str(i),
+                                        os.path.basename(path))
+                os.mkdir(os.path.dirname(tmp_path))
+                with open(tmp_path, 'w') as f:
+                    f.write(outputs[path])
+                tmp_paths.append(tmp_path)
+            clang_format(tmp_paths)
+            for path, tmp_path in zip(cpp_paths, tmp_paths):
+                with open(tmp_path) as f:
+                    outputs[path] = f.read()
+    return outputs
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def inputs_hash(spec_text: str, gen_name: str) -> str:
+    '''
+    Hash of everything the generated files depend on: the spec, the template and the generator
+    itself. The generator's source stands in for its version.
+    '''
+    h = hashlib.sha256()
+    for path in [GENERATOR_PATH, os.path.join('dive_core', TEMPLATE_NAME)]:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    h.update(gen_name.encode('utf-8'))
+    h.update(spec_text.encode('utf-8'))
+    return h.hexdigest()
+
+
+def manifest_path(json_path: str) -> str:
+    '''
+    Path of the manifest recording the inputs and outputs of the last run for a spec
+    '''
+    json_dir, json_name = os.path.split(json_path)
+    return os.path.join(json_dir, '.' + json_name + '.soa_manifest')
+
+
+def load_manifest(path: str) -> Dict:
+    text = _read_text(path)
+    if text is None:
+        return {}
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return {}
+
+
+def is_up_to_date(manifest: Dict, inputs: str) -> bool:
+    '''
+    Reports whether the outputs recorded in the manifest were generated from `inputs` and have not
+    been modified since
+    '''
+    if manifest.get('inputs') != inputs or not manifest.get('outputs'):
+        return False
+    for path, digest in manifest['outputs'].items():
+        content = _read_text(path)
+        if content is None or _sha256(content) != digest:
+            return False
+    return True
+
+
+def generate(spec_text: str, gen_name: str, json_path: str) -> None:
+    '''
+    Generates the header and source files for a spec. A file is only written when its content
+    changes, so that an unrelated edit does not rebuild everything that includes it.
+    '''
+    inputs = inputs_hash(spec_text, gen_name)
+    manifest_file = manifest_path(json_path)
+    if is_up_to_date(load_manifest(manifest_file), inputs):
+        print('Generated files are up to date')
+        return
+
+    outputs = render(json.loads(spec_text), gen_name)
+    for path, content in outputs.items():
+        if _read_text(path) == content:
+            continue
+        print('Writing ' + path)
+        Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    manifest = {
+        'inputs': inputs,
+        'outputs': {path: _sha256(content)
+                    for path, content in outputs.items()},
+    }
+    with open(manifest_file, 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+
 
 def main():
     if len(sys.argv) != 2:
@@ -192,8 +339,8 @@ def main():
     os.chdir(dive_src)
 
     with open(json_path) as f:
-        spec = json.load(f)
-        generate(spec, script_name)
+        spec_text = f.read()
+    generate(spec_text, script_name, json_path)
 
 
 if __name__ == '__main__':
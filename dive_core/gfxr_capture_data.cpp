@@ -18,6 +18,7 @@
 
 #include <filesystem>
 #include <iostream>
+#include <optional>
 
 #include "absl/cleanup/cleanup.h"
 #include "absl/status/status.h"
@@ -102,6 +103,7 @@ CaptureData::LoadResult GfxrCaptureData::LoadCaptureFile(const std::string& file
     DiveAnnotationProcessor dive_annotation_processor;
     file_processor.SetAnnotationProcessor(&dive_annotation_processor);
     dive_consumer.Initialize(&dive_annotation_processor);
+    dive_consumer.SetDeferDiveArgs(m_defer_vulkan_command_args);
 
     if (!file_processor.ProcessAllFrames())
     {
@@ -115,6 +117,23 @@ CaptureData::LoadResult GfxrCaptureData::LoadCaptureFile(const std::string& file
     DIVE_ASSERT(!m_gfxr_submits.empty());
     m_gfxr_command_buffers = dive_annotation_processor.TakeVkCommandsCache();
     m_gfxr_draw_call_counts = dive_annotation_processor.TakeDrawCallMap();
+    m_gfxr_args_arena = dive_annotation_processor.TakeArgsArena();
+
+    m_gfxr_commands.assign(dive_annotation_processor.GetCommandCount(), nullptr);
+    for (const auto& submit : m_gfxr_submits)
+    {
+        for (const auto& vk_cmd : submit->none_cmd_vk_commands)
+        {
+            m_gfxr_commands[vk_cmd.command_index] = &vk_cmd;
+        }
+    }
+    for (const auto& [cmd_handle, vk_cmds] : m_gfxr_command_buffers)
+    {
+        for (const auto& vk_cmd : vk_cmds)
+        {
+            m_gfxr_commands[vk_cmd.command_index] = &vk_cmd;
+        }
+    }
 
     absl::StatusOr<uint64_t> file_size = GetFileSize(file_name);
     if (!file_size.ok())
@@ -129,6 +148,23 @@ CaptureData::LoadResult GfxrCaptureData::LoadCaptureFile(const std::string& file
         return LoadResult::kFileIoError;
     }
 
+    if (m_defer_vulkan_command_args)
+    {
+        std::vector<DiveAnnotationProcessor::CommandIndexEntry> command_index =
+            dive_annotation_processor.TakeCommandIndex();
+        for (DiveAnnotationProcessor::CommandIndexEntry& entry : command_index)
+        {
+            entry.block_offset =
+                m_gfxr_capture_block_data->GetOriginalBlockOffset(entry.block_index);
+        }
+
+        m_gfxr_command_decoder = std::make_unique<DiveCommandDecoder>();
+        if (!m_gfxr_command_decoder->Initialize(file_name, std::move(command_index)))
+        {
+            return LoadResult::kFileIoError;
+        }
+    }
+
     m_cur_capture_file = file_name;
 
     return LoadResult::kSuccess;
@@ -174,4 +210,37 @@ const DiveAnnotationProcessor::DrawCallCounts& GfxrCaptureData::GetDrawCallCount
     return m_gfxr_draw_call_counts.at(cmd_handle);
 }
 
+//--------------------------------------------------------------------------------------------------
+const DiveAnnotationProcessor::VulkanCommandInfo* GfxrCaptureData::GetGfxrCommand(
+    uint32_t command_index) const
+{
+    if (command_index >= m_gfxr_commands.size())
+    {
+        return nullptr;
+    }
+    return m_gfxr_commands[command_index];
+}
+
+//--------------------------------------------------------------------------------------------------
+nlohmann::ordered_json GfxrCaptureData::GetVulkanCommandArgs(uint32_t command_index) const
+{
+    const DiveAnnotationProcessor::VulkanCommandInfo* vk_cmd_info = GetGfxrCommand(command_index);
+    if (vk_cmd_info == nullptr)
+    {
+        return nullptr;
+    }
+
+    if (m_gfxr_command_decoder != nullptr && vk_cmd_info->HasDeferredArgs())
+    {
+        std::optional<nlohmann::ordered_json> args = m_gfxr_command_decoder->GetArgs(command_index);
+        if (args.has_value())
+        {
+            return *std::move(args);
+        }
+    }
+
+    // Without the deferred args, at least return the ones that were kept
+    return vk_cmd_info->GetArgs();
+}
+
 }  // namespace Dive
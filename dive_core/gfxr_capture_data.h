@@ -15,9 +15,12 @@
 */
 
 #pragma once
+#include <memory>
+
 #include "dive_core/capture_data.h"
 #include "gfxr_ext/decode/dive_annotation_processor.h"
 #include "gfxr_ext/decode/dive_block_data.h"
+#include "gfxr_ext/decode/dive_command_decoder.h"
 
 namespace Dive
 {
@@ -36,6 +39,18 @@ class GfxrCaptureData : public CaptureData
     const std::vector<DiveAnnotationProcessor::VulkanCommandInfo>& GetGfxrCommandBuffers(
         uint64_t cmd_handle) const;
     const DiveAnnotationProcessor::DrawCallCounts& GetDrawCallCounts(uint64_t cmd_handle) const;
+    // Returns the command with the given VulkanCommandInfo::command_index, or nullptr if the
+    // command was dropped because its command buffer was recorded again
+    const DiveAnnotationProcessor::VulkanCommandInfo* GetGfxrCommand(uint32_t command_index) const;
+
+    // Unless cleared before LoadCaptureFile, the pointer and struct args of most vulkan commands
+    // are not kept while loading, which makes loading large captures faster and lighter. They are
+    // decoded again from the capture file by GetVulkanCommandArgs.
+    void SetDeferVulkanCommandArgs(bool defer) { m_defer_vulkan_command_args = defer; }
+
+    // Returns the full args of the command with the given command_index, decoding them from the
+    // capture file if they were deferred while loading, or null if there is no such command
+    nlohmann::ordered_json GetVulkanCommandArgs(uint32_t command_index) const;
 
     // Sets m_cur_capture_file and m_gfxr_capture_block_data with info from the original GFXR file
     LoadResult LoadCaptureFile(const std::string& file_name) override;
@@ -60,6 +75,15 @@ class GfxrCaptureData : public CaptureData
     std::unordered_map<uint64_t, std::vector<DiveAnnotationProcessor::VulkanCommandInfo>>
         m_gfxr_command_buffers;
     std::unordered_map<uint64_t, DiveAnnotationProcessor::DrawCallCounts> m_gfxr_draw_call_counts;
+    // Storage for the encoded args of the commands in m_gfxr_submits and m_gfxr_command_buffers
+    gfxrecon::util::DiveArgsArena m_gfxr_args_arena;
+    // The commands in m_gfxr_submits and m_gfxr_command_buffers, by command_index
+    std::vector<const DiveAnnotationProcessor::VulkanCommandInfo*> m_gfxr_commands;
+
+    bool m_defer_vulkan_command_args = true;
+    // Decodes the deferred args of single commands through the command index of the capture. Only
+    // set when loading with deferred args.
+    std::unique_ptr<DiveCommandDecoder> m_gfxr_command_decoder;
 };
 
 }  // namespace Dive
@@ -17,6 +17,7 @@
 #include <iostream>
 #include <string_view>
 #include <unordered_map>
+#include <vector>
 
 #include "absl/strings/numbers.h"
 #include "dive_core/dive_strings.h"
@@ -81,107 +82,133 @@ void AppendEnumSummary(std::ostringstream& s, const nlohmann::ordered_json& args
 
 // Creates a summary string containing key arguments
 // and their values for a given Vulkan command.
-std::string GetCommandSummary(const std::string& cmd_name, const nlohmann::ordered_json& args)
+std::string GetCommandSummary(const DiveAnnotationProcessor::VulkanCommandInfo& vk_cmd_info)
 {
     std::ostringstream s;
 
-    using SummaryHandler = std::function<void(std::ostringstream&, const nlohmann::ordered_json&)>;
+    // The handlers list the args they read, so that only those are decoded
+    struct SummaryHandler
+    {
+        std::vector<std::string> arg_names;
+        std::function<void(std::ostringstream&, const nlohmann::ordered_json&)> append;
+    };
 
     static const std::unordered_map<std::string_view, SummaryHandler> handlers = {
         {"vkCmdDrawIndexed",
-         [](auto& s, const auto& args) { AppendDrawCallSummary(s, args, "indexCount"); }},
+         {{"indexCount", "instanceCount"},
+          [](auto& s, const auto& args) { AppendDrawCallSummary(s, args, "indexCount"); }}},
         {"vkCmdDraw",
-         [](auto& s, const auto& args) { AppendDrawCallSummary(s, args, "vertexCount"); }},
+         {{"vertexCount", "instanceCount"},
+          [](auto& s, const auto& args) { AppendDrawCallSummary(s, args, "vertexCount"); }}},
         {"vkCmdSetViewport",
-         [](auto& s, const auto& args) {
-             if (args.contains("pViewports") && args["pViewports"].is_array() &&
-                 !args["pViewports"].empty())
-             {
-                 const auto& vp = args["pViewports"][0];
-                 s << "(x:" << GetValueStr(vp, "x") << ", y:" << GetValueStr(vp, "y")
-                   << ", width:" << GetValueStr(vp, "width")
-                   << ", height:" << GetValueStr(vp, "height") << ")";
-             }
-         }},
+         {{"pViewports"},
+          [](auto& s, const auto& args) {
+              if (args.contains("pViewports") && args["pViewports"].is_array() &&
+                  !args["pViewports"].empty())
+              {
+                  const auto& vp = args["pViewports"][0];
+                  s << "(x:" << GetValueStr(vp, "x") << ", y:" << GetValueStr(vp, "y")
+                    << ", width:" << GetValueStr(vp, "width")
+                    << ", height:" << GetValueStr(vp, "height") << ")";
+              }
+          }}},
         {"vkCmdSetScissor",
-         [](auto& s, const auto& args) {
-             if (args.contains("pScissors") && args["pScissors"].is_array() &&
-                 !args["pScissors"].empty())
-             {
-                 const auto& sc = args["pScissors"][0];
-                 if (sc.contains("offset") && sc.contains("extent"))
-                 {
-                     const auto& offset = sc["offset"];
-                     const auto& extent = sc["extent"];
-                     s << "(x:" << GetValueStr(offset, "x") << ", y:" << GetValueStr(offset, "y")
-                       << ", width:" << GetValueStr(extent, "width")
-                       << ", height:" << GetValueStr(extent, "height") << ")";
-                 }
-             }
-         }},
+         {{"pScissors"},
+          [](auto& s, const auto& args) {
+              if (args.contains("pScissors") && args["pScissors"].is_array() &&
+                  !args["pScissors"].empty())
+              {
+                  const auto& sc = args["pScissors"][0];
+                  if (sc.contains("offset") && sc.contains("extent"))
+                  {
+                      const auto& offset = sc["offset"];
+                      const auto& extent = sc["extent"];
+                      s << "(x:" << GetValueStr(offset, "x") << ", y:" << GetValueStr(offset, "y")
+                        << ", width:" << GetValueStr(extent, "width")
+                        << ", height:" << GetValueStr(extent, "height") << ")";
+                  }
+              }
+          }}},
         {"vkCmdDispatch",
-         [](auto& s, const auto& args) {
-             if (args.contains("groupCountX"))
-             {
-                 s << "(x:" << GetValueStr(args, "groupCountX")
-                   << ", y:" << GetValueStr(args, "groupCountY")
-                   << ", z:" << GetValueStr(args, "groupCountZ") << ")";
-             }
-         }},
+         {{"groupCountX", "groupCountY", "groupCountZ"},
+          [](auto& s, const auto& args) {
+              if (args.contains("groupCountX"))
+              {
+                  s << "(x:" << GetValueStr(args, "groupCountX")
+                    << ", y:" << GetValueStr(args, "groupCountY")
+                    << ", z:" << GetValueStr(args, "groupCountZ") << ")";
+              }
+          }}},
         {"vkCmdDrawMultiEXT",
-         [](auto& s, const auto& args) { AppendDrawCallSummary(s, args, "drawCount"); }},
+         {{"drawCount", "instanceCount"},
+          [](auto& s, const auto& args) { AppendDrawCallSummary(s, args, "drawCount"); }}},
         {"vkCmdDrawMultiIndexedEXT",
-         [](auto& s, const auto& args) { AppendDrawCallSummary(s, args, "drawCount"); }},
+         {{"drawCount", "instanceCount"},
+          [](auto& s, const auto& args) { AppendDrawCallSummary(s, args, "drawCount"); }}},
         {"vkCmdDrawIndirect",
-         [](auto& s, const auto& args) {
-             if (args.contains("drawCount"))
-             {
-                 std::string draw_count = GetValueStr(args, "drawCount");
-                 if (draw_count != "1")
-                 {
-                     s << "(drawCount: " << draw_count << ")";
-                 }
-             }
-         }},
+         {{"drawCount"},
+          [](auto& s, const auto& args) {
+              if (args.contains("drawCount"))
+              {
+                  std::string draw_count = GetValueStr(args, "drawCount");
+                  if (draw_count != "1")
+                  {
+                      s << "(drawCount: " << draw_count << ")";
+                  }
+              }
+          }}},
         {"vkCmdDrawIndexedIndirect",
-         [](auto& s, const auto& args) {
-             if (args.contains("drawCount"))
-             {
-                 std::string draw_count = GetValueStr(args, "drawCount");
-                 if (draw_count != "1")
-                 {
-                     s << "(drawCount: " << draw_count << ")";
-                 }
-             }
-         }},
+         {{"drawCount"},
+          [](auto& s, const auto& args) {
+              if (args.contains("drawCount"))
+              {
+                  std::string draw_count = GetValueStr(args, "drawCount");
+                  if (draw_count != "1")
+                  {
+                      s << "(drawCount: " << draw_count << ")";
+                  }
+              }
+          }}},
         {"vkCmdBindPipeline",
-         [](auto& s, const auto& args) {
-             AppendEnumSummary(s, args, "pipelineBindPoint", "VK_PIPELINE_BIND_POINT_");
-         }},
+         {{"pipelineBindPoint"},
+          [](auto& s, const auto& args) {
+              AppendEnumSummary(s, args, "pipelineBindPoint", "VK_PIPELINE_BIND_POINT_");
+          }}},
         {"vkCmdBindDescriptorSets",
-         [](auto& s, const auto& args) {
-             if (args.contains("firstSet") && args.contains("descriptorSetCount"))
-             {
-                 s << "(firstSet: " << GetValueStr(args, "firstSet")
-                   << ", setCount: " << GetValueStr(args, "descriptorSetCount") << ")";
-             }
-         }},
+         {{"firstSet", "descriptorSetCount"},
+          [](auto& s, const auto& args) {
+              if (args.contains("firstSet") && args.contains("descriptorSetCount"))
+              {
+                  s << "(firstSet: " << GetValueStr(args, "firstSet")
+                    << ", setCount: " << GetValueStr(args, "descriptorSetCount") << ")";
+              }
+          }}},
         {"vkCmdBindVertexBuffers",
-         [](auto& s, const auto& args) {
-             if (args.contains("firstBinding") && args.contains("bindingCount"))
-             {
-                 s << "(firstBinding: " << GetValueStr(args, "firstBinding")
-                   << ", bindingCount: " << GetValueStr(args, "bindingCount") << ")";
-             }
-         }},
-        {"vkCmdBindIndexBuffer", [](auto& s, const auto& args) {
-             AppendEnumSummary(s, args, "indexType", "VK_INDEX_TYPE_");
-         }}};
-
-    auto it = handlers.find(std::string_view(cmd_name));
+         {{"firstBinding", "bindingCount"},
+          [](auto& s, const auto& args) {
+              if (args.contains("firstBinding") && args.contains("bindingCount"))
+              {
+                  s << "(firstBinding: " << GetValueStr(args, "firstBinding")
+                    << ", bindingCount: " << GetValueStr(args, "bindingCount") << ")";
+              }
+          }}},
+        {"vkCmdBindIndexBuffer", {{"indexType"}, [](auto& s, const auto& args) {
+                                      AppendEnumSummary(s, args, "indexType", "VK_INDEX_TYPE_");
+                                  }}}};
+
+    auto it = handlers.find(std::string_view(vk_cmd_info.name));
     if (it != handlers.end())
     {
-        it->second(s, args);
+        nlohmann::ordered_json args = nlohmann::ordered_json::object();
+        for (const std::string& arg_name : it->second.arg_names)
+        {
+            nlohmann::ordered_json arg = vk_cmd_info.GetArg(arg_name);
+            if (!arg.is_null())
+            {
+                args[arg_name] = std::move(arg);
+            }
+        }
+        it->second.append(s, args);
     }
 
     return s.str();
@@ -223,37 +250,38 @@ void GfxrVulkanCommandHierarchyCreator::OnCommand(
     std::vector<uint64_t>& render_pass_draw_call_counts)
 {
     const std::string& vulkan_cmd_name = vk_cmd_info.name;
-    const nlohmann::ordered_json& vulkan_cmd_args = vk_cmd_info.args;
+    // Only the args used by the summary are decoded here, the arg nodes are created on demand by
+    // CreateArgNodes
+    const CommandHierarchy::AuxInfo aux_info =
+        CommandHierarchy::AuxInfo::GfxrCommandNode(vk_cmd_info.command_index, true);
     std::ostringstream vk_cmd_string_stream;
     vk_cmd_string_stream << vulkan_cmd_name;
-    vk_cmd_string_stream << GetCommandSummary(vulkan_cmd_name, vulkan_cmd_args);
+    vk_cmd_string_stream << GetCommandSummary(vk_cmd_info);
 
     if (vulkan_cmd_name == "vkBeginCommandBuffer")
     {
         vk_cmd_string_stream << ", Draw Call Count: " << draw_call_count;
-        uint64_t cmd_buffer_index =
-            AddNode(NodeType::kGfxrVulkanBeginCommandBufferNode, vk_cmd_string_stream.str());
+        uint64_t cmd_buffer_index = AddNode(NodeType::kGfxrVulkanBeginCommandBufferNode,
+                                            vk_cmd_string_stream.str(), aux_info);
         m_cur_command_buffer_node_index = cmd_buffer_index;
-        GetArgs(vulkan_cmd_args, m_cur_command_buffer_node_index);
         AddChild(CommandHierarchy::TopologyType::kAllEventTopology, m_cur_submit_node_index,
                  cmd_buffer_index);
     }
     else if (vulkan_cmd_name == "vkEndCommandBuffer")
     {
-        uint64_t cmd_buffer_index =
-            AddNode(NodeType::kGfxrVulkanEndCommandBufferNode, vk_cmd_string_stream.str());
+        uint64_t cmd_buffer_index = AddNode(NodeType::kGfxrVulkanEndCommandBufferNode,
+                                            vk_cmd_string_stream.str(), aux_info);
 
-        GetArgs(vulkan_cmd_args, cmd_buffer_index);
         AddChild(CommandHierarchy::TopologyType::kAllEventTopology, m_cur_command_buffer_node_index,
                  cmd_buffer_index);
     }
     else if (vulkan_cmd_name.find("BeginDebugUtilsLabelEXT") != std::string::npos)
     {
-        std::string label_name = vulkan_cmd_args["pLabelInfo"]["pLabelName"];
+        nlohmann::ordered_json label_info = vk_cmd_info.GetArg("pLabelInfo");
+        std::string label_name = label_info["pLabelName"];
 
         uint64_t begin_debug_utils_label_cmd_index =
-            AddNode(NodeType::kGfxrBeginDebugUtilsLabelCommandNode, label_name.c_str());
-        GetArgs(vulkan_cmd_args, begin_debug_utils_label_cmd_index);
+            AddNode(NodeType::kGfxrBeginDebugUtilsLabelCommandNode, label_name.c_str(), aux_info);
         ConditionallyAddChild(begin_debug_utils_label_cmd_index);
         m_cur_parent_node_index_stack.push(begin_debug_utils_label_cmd_index);
     }
@@ -271,8 +299,7 @@ void GfxrVulkanCommandHierarchyCreator::OnCommand(
              vulkan_cmd_name.find("vkCmdDispatch") != std::string::npos)
     {
         uint64_t vk_cmd_index =
-            AddNode(NodeType::kGfxrVulkanDrawCommandNode, vk_cmd_string_stream.str());
-        GetArgs(vulkan_cmd_args, vk_cmd_index);
+            AddNode(NodeType::kGfxrVulkanDrawCommandNode, vk_cmd_string_stream.str(), aux_info);
         ConditionallyAddChild(vk_cmd_index);
     }
     else if (vulkan_cmd_name.find("vkCmdBeginRenderPass") != std::string::npos)
@@ -283,17 +310,15 @@ void GfxrVulkanCommandHierarchyCreator::OnCommand(
             render_pass_draw_call_counts.erase(render_pass_draw_call_counts.begin());
         }
         vk_cmd_string_stream << ", Draw Call Count: " << draw_call_count;
-        uint64_t vk_cmd_index =
-            AddNode(NodeType::kGfxrVulkanBeginRenderPassCommandNode, vk_cmd_string_stream.str());
-        GetArgs(vulkan_cmd_args, vk_cmd_index);
+        uint64_t vk_cmd_index = AddNode(NodeType::kGfxrVulkanBeginRenderPassCommandNode,
+                                        vk_cmd_string_stream.str(), aux_info);
         ConditionallyAddChild(vk_cmd_index);
         m_cur_parent_node_index_stack.push(vk_cmd_index);
     }
     else if (vulkan_cmd_name.find("vkCmdEndRenderPass") != std::string::npos)
     {
-        uint64_t vk_cmd_index =
-            AddNode(NodeType::kGfxrVulkanEndRenderPassCommandNode, vk_cmd_string_stream.str());
-        GetArgs(vulkan_cmd_args, vk_cmd_index);
+        uint64_t vk_cmd_index = AddNode(NodeType::kGfxrVulkanEndRenderPassCommandNode,
+                                        vk_cmd_string_stream.str(), aux_info);
         ConditionallyAddChild(vk_cmd_index);
         if (!m_cur_parent_node_index_stack.empty())
         {
@@ -325,8 +350,7 @@ void GfxrVulkanCommandHierarchyCreator::OnCommand(
             node_type = NodeType::kGfxrVulkanResolveImageCommandNode;
         }
 
-        uint64_t vk_cmd_index = AddNode(node_type, vk_cmd_string_stream.str());
-        GetArgs(vulkan_cmd_args, vk_cmd_index);
+        uint64_t vk_cmd_index = AddNode(node_type, vk_cmd_string_stream.str(), aux_info);
         ConditionallyAddChild(vk_cmd_index);
     }
 }
@@ -340,7 +364,7 @@ bool GfxrVulkanCommandHierarchyCreator::ProcessVkCmds(
 
     for (uint32_t i = 0; i < vkCmds.size(); ++i)
     {
-        DiveAnnotationProcessor::VulkanCommandInfo vk_cmd_info = vkCmds[i];
+        const DiveAnnotationProcessor::VulkanCommandInfo& vk_cmd_info = vkCmds[i];
         OnCommand(vk_cmd_info, draw_call_count, mutable_render_pass_draw_call_counts);
     }
 
@@ -415,9 +439,10 @@ bool GfxrVulkanCommandHierarchyCreator::CreateTrees(bool used_in_mixed_command_h
 }
 
 //--------------------------------------------------------------------------------------------------
-uint64_t GfxrVulkanCommandHierarchyCreator::AddNode(NodeType type, std::string&& desc)
+uint64_t GfxrVulkanCommandHierarchyCreator::AddNode(NodeType type, std::string&& desc,
+                                                    CommandHierarchy::AuxInfo aux_info)
 {
-    uint64_t node_index = m_command_hierarchy.AddGfxrNode(type, std::move(desc));
+    uint64_t node_index = m_command_hierarchy.AddGfxrNode(type, std::move(desc), aux_info);
 
     if (m_used_in_mixed_command_hierarchy)
     {
@@ -456,6 +481,68 @@ void GfxrVulkanCommandHierarchyCreator::AddChild(CommandHierarchy::TopologyType
     }
 }
 
+//--------------------------------------------------------------------------------------------------
+uint64_t GfxrVulkanCommandHierarchyCreator::CreateArgNodes(
+    uint64_t node_index,
+    const std::function<void(uint64_t first_child_index, uint64_t num_children)>& before_insert)
+{
+    if (!m_command_hierarchy.GetGfxrCommandNodeArgsPending(node_index))
+    {
+        return 0;
+    }
+    m_command_hierarchy.m_nodes.m_aux_info[node_index].gfxr_command_node.m_args_pending = false;
+
+    // Decodes the deferred args of the command from the capture file if needed
+    nlohmann::ordered_json args = m_capture_data.GetVulkanCommandArgs(
+        m_command_hierarchy.GetGfxrCommandNodeIndex(node_index));
+    if (args.is_null())
+    {
+        return 0;
+    }
+
+    // The arg nodes are added after the complete hierarchy, so the children are collected with the
+    // same local indices as for the mixed command hierarchy, the command node being local node 0
+    m_used_in_mixed_command_hierarchy = true;
+    ClearCreatedDiveIndices();
+    auto& node_children = m_node_children[CommandHierarchy::kAllEventTopology];
+    node_children.clear();
+    node_children.resize(1);
+    m_dive_indices_to_local_indices_map[node_index] = 0;
+
+    uint64_t first_arg_node_index = m_command_hierarchy.size();
+    GetArgs(args, node_index);
+    uint64_t num_nodes = m_command_hierarchy.size();
+
+    Topology& topology = m_command_hierarchy.m_topology[CommandHierarchy::kAllEventTopology];
+    const DiveVector<uint64_t>& arg_nodes = node_children[0];
+    if (!arg_nodes.empty() && before_insert)
+    {
+        before_insert(topology.GetNumChildren(node_index), arg_nodes.size());
+    }
+
+    for (uint32_t type = 0; type < CommandHierarchy::kTopologyTypeCount; ++type)
+    {
+        Topology& cur_topology = m_command_hierarchy.m_topology[type];
+        if (!cur_topology.m_node_children.empty())
+        {
+            cur_topology.SetNumNodes(num_nodes);
+        }
+    }
+    topology.AppendChildren(node_index, arg_nodes);
+    for (uint64_t arg_node_index = first_arg_node_index; arg_node_index < num_nodes;
+         ++arg_node_index)
+    {
+        topology.AddChildren(arg_node_index,
+                             node_children[m_dive_indices_to_local_indices_map.at(arg_node_index)]);
+    }
+
+    uint64_t num_arg_nodes = arg_nodes.size();
+    ClearCreatedDiveIndices();
+    node_children.clear();
+    return num_arg_nodes;
+}
+
+//--------------------------------------------------------------------------------------------------
 void GfxrVulkanCommandHierarchyCreator::GetArgs(const nlohmann::ordered_json& json_args,
                                                 uint64_t curr_index)
 {
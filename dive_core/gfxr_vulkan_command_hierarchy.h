@@ -19,6 +19,7 @@
 // UI.
 // =====================================================================================================================
 
+#include <functional>
 #include <stack>
 
 #include "dive_core/command_hierarchy.h"
@@ -58,6 +59,17 @@ class GfxrVulkanCommandHierarchyCreator
 
     void ClearCreatedDiveIndices() { m_dive_indices_to_local_indices_map.clear(); }
 
+    // The arg nodes of the vulkan commands are not created with the trees, decoding the args of
+    // every command of a capture is too slow. This creates them under the command node at
+    // node_index, after its other children, the first time it is called for that node.
+    // before_insert is called with the child index of the first arg node and the number of arg
+    // nodes, right before they are added to the topology. Returns the number of arg nodes created.
+    // The args come from GfxrCaptureData::GetVulkanCommandArgs, so deferred args are decoded here.
+    uint64_t CreateArgNodes(
+        uint64_t node_index,
+        const std::function<void(uint64_t first_child_index, uint64_t num_children)>&
+            before_insert = nullptr);
+
  private:
     // Helper function to parse json representation of GFXR file into nodes and make calls to
     // AddNode() and AddChild() in hiearachical order.
@@ -70,7 +82,7 @@ class GfxrVulkanCommandHierarchyCreator
     //
     // Also may add node to m_dive_indices_to_local_indices_map and reserve space in m_node_children
     // for future appends
-    uint64_t AddNode(NodeType type, std::string&& desc);
+    uint64_t AddNode(NodeType type, std::string&& desc, CommandHierarchy::AuxInfo aux_info = 0);
 
     // Updates m_node_children
     void AddChild(CommandHierarchy::TopologyType type, uint64_t node_index,
@@ -0,0 +1,56 @@
+/*
+ Copyright 2026 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+#pragma once
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include <cstdint>
+#include <vector>
+
+#include "vulkan/vulkan_core.h"
+
+namespace py = pybind11;
+
+namespace Dive
+{
+//--------------------------------------------------------------------------------------------------
+// `numpy_type<T>::type` is the element type of the NumPy arrays that view fields stored as `T`.
+// Scalars and enums map to themselves (enums are viewed as their underlying type), and structs
+// map to themselves once registered with `RegisterNumpyDtypes()`.
+template <typename T>
+struct numpy_type
+{
+    using type = T;
+};
+
+//--------------------------------------------------------------------------------------------------
+// Registers the NumPy structured dtypes of the struct types used by the generated
+// structure-of-array classes. Must be called once, before any binding is used.
+inline void RegisterNumpyDtypes()
+{
+    PYBIND11_NUMPY_DTYPE(VkOffset2D, x, y);
+    PYBIND11_NUMPY_DTYPE(VkExtent2D, width, height);
+    PYBIND11_NUMPY_DTYPE(VkRect2D, offset, extent);
+    PYBIND11_NUMPY_DTYPE(VkViewport, x, y, width, height, minDepth, maxDepth);
+    PYBIND11_NUMPY_DTYPE(VkStencilOpState, failOp, passOp, depthFailOp, compareOp, compareMask,
+                         writeMask, reference);
+    PYBIND11_NUMPY_DTYPE(VkPipelineColorBlendAttachmentState, blendEnable, srcColorBlendFactor,
+                         dstColorBlendFactor, colorBlendOp, srcAlphaBlendFactor,
+                         dstAlphaBlendFactor, alphaBlendOp, colorWriteMask);
+}
+
+}  // namespace Dive
@@ -0,0 +1,30 @@
+/*
+ Copyright 2026 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#include "py_common.h"
+
+namespace Dive
+{
+// Generated by generateSOAs.py
+void BindEventState(py::module& m);
+}  // namespace Dive
+
+PYBIND11_MODULE(dive_core_py, m)
+{
+    m.doc() = "Dive structure-of-array types, with fields exposed as NumPy arrays";
+    Dive::RegisterNumpyDtypes();
+    Dive::BindEventState(m);
+}
@@ -0,0 +1,43 @@
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Readers for Dive (.dive) and freedreno (.rd) capture files, for scripted analysis.
+
+    import dive_capture
+
+    with dive_capture.openCapture("frame.dive") as capture:
+        for submit_index, ib_index, va_addr, dwords in capture.iterIbs():
+            ...
+
+The IB dwords can be fed to decodeIb() of the generated pm4_info.py module.
+"""
+
+import os
+from typing import Union
+
+from .dive_file import CaptureFormatError, DiveFile
+from .rd_file import RdFile, RdSubmit
+
+
+def openCapture(path: str) -> Union[DiveFile, RdFile]:
+    """Open a capture by file extension, as Pm4CaptureData::LoadCaptureFile() does"""
+    extension = os.path.splitext(path)[1]
+    if extension == ".dive":
+        return DiveFile(path)
+    if extension == ".rd":
+        return RdFile(path)
+    raise CaptureFormatError("%s: unknown capture file extension" % path)
+
+
+__all__ = ["CaptureFormatError", "DiveFile", "RdFile", "RdSubmit", "openCapture"]
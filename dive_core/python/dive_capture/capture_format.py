@@ -0,0 +1,285 @@
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""NumPy structured dtypes for the structs of dive_core/common/dive_capture_format.h.
+
+The header is parsed when this module is imported, so the dtypes always match the C++ layout.
+Each struct becomes a dtype with one field per member. Bitfields cannot be expressed in a dtype,
+so each run of bitfields sharing a storage unit becomes a single integer field named `_bits<n>`.
+The position of each bitfield is recorded in `Struct.bitfields` and can be read back with
+`Struct.getBitfield()`, which works on single records and on whole record arrays.
+"""
+
+import dataclasses
+import pathlib
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+CAPTURE_FORMAT_HEADER = (
+    pathlib.Path(__file__).resolve().parents[2] / "common" / "dive_capture_format.h"
+)
+
+_BUILTIN_TYPES = {
+    "uint8_t": "<u1",
+    "int8_t": "<i1",
+    "char": "<i1",
+    "uint16_t": "<u2",
+    "int16_t": "<i2",
+    "uint32_t": "<u4",
+    "int32_t": "<i4",
+    "int": "<i4",
+    "uint64_t": "<u8",
+    "int64_t": "<i8",
+}
+
+
+@dataclasses.dataclass
+class Bitfield:
+    storage: str  # Name of the dtype field holding the bitfield
+    shift: int
+    width: int
+
+
+@dataclasses.dataclass
+class Struct:
+    name: str
+    dtype: np.dtype
+    bitfields: Dict[str, Bitfield]
+
+    def getBitfield(self, records, name: str):
+        """Extract the bitfield `name` from a record, or from every record of an array"""
+        bitfield = self.bitfields[name]
+        storage = records[bitfield.storage]
+        return (storage >> bitfield.shift) & ((1 << bitfield.width) - 1)
+
+
+@dataclasses.dataclass
+class Enum:
+    name: str
+    dtype: np.dtype
+    values: Dict[str, int]
+
+    def getName(self, value: int) -> Optional[str]:
+        for name, enum_value in self.values.items():
+            if enum_value == value:
+                return name
+        return None
+
+
+def _make4cc(text: str) -> int:
+    value = 0
+    for i, char in enumerate(re.findall(r"'(.)'", text)):
+        value |= ord(char) << (8 * i)
+    return value
+
+
+def _stripComments(text: str) -> str:
+    text = re.sub(r"/\*.*?\*/", " ", text, flags=re.S)
+    return re.sub(r"//[^\n]*", " ", text)
+
+
+def _splitTopLevel(text: str, separator: str) -> List[str]:
+    parts = []
+    depth = 0
+    begin = 0
+    for i, char in enumerate(text):
+        if char in "({":
+            depth += 1
+        elif char in ")}":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[begin:i])
+            begin = i + 1
+    parts.append(text[begin:])
+    return parts
+
+
+def _findBlockEnd(text: str, open_brace: int) -> int:
+    depth = 0
+    for i in range(open_brace, len(text)):
+        if text[i] == "{":
+            depth += 1
+        elif text[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    raise ValueError("Unbalanced braces in %s" % CAPTURE_FORMAT_HEADER)
+
+
+class _HeaderParser:
+    """Parses the subset of C++ used by dive_capture_format.h: constants, enum classes with an
+    optional underlying type, and structs of scalars, enums, fixed-size arrays and bitfields"""
+
+    def __init__(self, text: str):
+        self.constants: Dict[str, int] = {}
+        self.enums: Dict[str, Enum] = {}
+        self.structs: Dict[str, Struct] = {}
+        self._text = _stripComments(text)
+
+        for match in re.finditer(
+            r"constexpr\s+\w+\s+(\w+)\s*=\s*(DIVE_MAKE4CC\([^)]*\)|\w+)\s*;", self._text
+        ):
+            self.constants[match.group(1)] = self._evaluate(match.group(2))
+        self._parseScope(self._text)
+
+    def _evaluate(self, expression: str, enum_values: Optional[Dict[str, int]] = None) -> int:
+        expression = expression.strip()
+        if expression.startswith("DIVE_MAKE4CC"):
+            return _make4cc(expression)
+        expression = re.sub(r"^\(\s*\w+\s*\)", "", expression).strip()  # C-style casts
+        if enum_values and expression in enum_values:
+            return enum_values[expression]
+        if expression in self.constants:
+            return self.constants[expression]
+        if "::" in expression:
+            enum_name, value_name = expression.rsplit("::", 1)
+            return self.enums[enum_name.split("::")[-1]].values[value_name]
+        return int(expression, 0)
+
+    def _parseScope(self, text: str):
+        pos = 0
+        pattern = re.compile(r"\b(enum\s+class|enum|struct)\s+(\w+)\s*(?::\s*(\w+))?\s*\{")
+        while True:
+            match = pattern.search(text, pos)
+            if match is None:
+                return
+            body_end = _findBlockEnd(text, match.end() - 1)
+            body = text[match.end() : body_end]
+            if match.group(1) == "struct":
+                self._parseStruct(match.group(2), body)
+            else:
+                self._parseEnum(match.group(2), match.group(3), body)
+            pos = body_end + 1
+
+    def _parseEnum(self, name: str, underlying_type: Optional[str], body: str):
+        values: Dict[str, int] = {}
+        next_value = 0
+        for entry in _splitTopLevel(body, ","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            if "=" in entry:
+                value_name, expression = entry.split("=", 1)
+                next_value = self._evaluate(expression, values)
+            else:
+                value_name = entry
+            values[value_name.strip()] = next_value
+            next_value += 1
+        self.enums[name] = Enum(name, np.dtype(_BUILTIN_TYPES[underlying_type or "int"]), values)
+
+    def _getMemberDtype(self, type_name: str) -> np.dtype:
+        type_name = type_name.split("::")[-1]
+        if type_name in _BUILTIN_TYPES:
+            return np.dtype(_BUILTIN_TYPES[type_name])
+        if type_name in self.enums:
+            return self.enums[type_name].dtype
+        return self.structs[type_name].dtype
+
+    def _parseStruct(self, name: str, body: str):
+        # Nested types first, then drop them (and any constructors) from the member list
+        self._parseScope(body)
+        members = re.sub(
+            r"\b(enum\s+class|enum|struct)\s+\w+\s*(?::\s*\w+)?\s*\{[^{}]*\}\s*;", " ", body
+        )
+        members = re.sub(r"\b%s\s*\([^)]*\)[^;{]*(\{[^{}]*\}|;)" % name, " ", members)
+
+        names: List[str] = []
+        formats: List[np.dtype] = []
+        offsets: List[int] = []
+        bitfields: Dict[str, Bitfield] = {}
+        offset = 0
+        alignment = 1
+        # Current bitfield storage unit: (dtype, byte offset, bits used, dtype field name)
+        storage: Optional[Tuple[np.dtype, int, int, str]] = None
+        member_pattern = re.compile(
+            r"^([\w:]+)\s+(\w+)?\s*(?:\[([^\]]+)\])?\s*(?::\s*(\d+))?\s*(?:\{[^}]*\}|=[^;]*)?$"
+        )
+        for declaration in members.split(";"):
+            declaration = " ".join(declaration.split())
+            if not declaration:
+                continue
+            match = member_pattern.match(declaration)
+            if match is None:
+                raise ValueError("Cannot parse member '%s' of %s" % (declaration, name))
+            type_name, member_name, array_size, bit_width = match.groups()
+            member_dtype = self._getMemberDtype(type_name)
+            alignment = max(alignment, member_dtype.alignment)
+
+            if bit_width is not None:
+                # Same-type bitfields share a storage unit until it is full, as with GCC, Clang
+                # and MSVC for the layouts used in the header
+                bit_width = int(bit_width)
+                unit_bits = member_dtype.itemsize * 8
+                if storage is None or storage[0] != member_dtype or storage[2] + bit_width > unit_bits:
+                    offset = (offset + member_dtype.alignment - 1) & ~(member_dtype.alignment - 1)
+                    storage = (member_dtype, offset, 0, "_bits%d" % len(offsets))
+                    names.append(storage[3])
+                    formats.append(member_dtype)
+                    offsets.append(offset)
+                    offset += member_dtype.itemsize
+                if member_name is not None:
+                    bitfields[member_name] = Bitfield(storage[3], storage[2], bit_width)
+                storage = (storage[0], storage[1], storage[2] + bit_width, storage[3])
+                continue
+
+            storage = None
+            offset = (offset + member_dtype.alignment - 1) & ~(member_dtype.alignment - 1)
+            if array_size is not None:
+                member_dtype = np.dtype((member_dtype, (self._evaluate(array_size),)))
+            names.append(member_name)
+            formats.append(member_dtype)
+            offsets.append(offset)
+            offset += member_dtype.itemsize
+
+        itemsize = (offset + alignment - 1) & ~(alignment - 1)
+        dtype = np.dtype(
+            {"names": names, "formats": formats, "offsets": offsets, "itemsize": itemsize},
+            align=True,
+        )
+        self.structs[name] = Struct(name, dtype, bitfields)
+
+
+def _load():
+    return _HeaderParser(CAPTURE_FORMAT_HEADER.read_text())
+
+
+_header = _load()
+
+CONSTANTS: Dict[str, int] = _header.constants
+ENUMS: Dict[str, Enum] = _header.enums
+STRUCTS: Dict[str, Struct] = _header.structs
+
+kDiveFileId = CONSTANTS["kDiveFileId"]
+kDiveFileVersion = CONSTANTS["kDiveFileVersion"]
+kCaptureMajorVersion = CONSTANTS["kCaptureMajorVersion"]
+kCaptureMinorVersion = CONSTANTS["kCaptureMinorVersion"]
+kCaptureRevision = CONSTANTS["kCaptureRevision"]
+
+BlockType = ENUMS["BlockType"]
+
+FileHeader = STRUCTS["FileHeader"]
+BlockInfo = STRUCTS["BlockInfo"]
+CaptureDataHeader = STRUCTS["CaptureDataHeader"]
+MemoryAllocationsDataHeader = STRUCTS["MemoryAllocationsDataHeader"]
+MemoryAllocationData = STRUCTS["MemoryAllocationData"]
+SubmitDataHeader = STRUCTS["SubmitDataHeader"]
+IndirectBufferData = STRUCTS["IndirectBufferData"]
+MemoryRawDataHeader = STRUCTS["MemoryRawDataHeader"]
+PresentData = STRUCTS["PresentData"]
+TextBlockHeader = STRUCTS["TextBlockHeader"]
+RegisterBlockHeader = STRUCTS["RegisterBlockHeader"]
+WaveStateBlockHeader = STRUCTS["WaveStateBlockHeader"]
+WaveState = STRUCTS["WaveState"]
@@ -0,0 +1,272 @@
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Zero-copy reader for .dive capture files.
+
+The file is memory-mapped and indexed in a single pass over the block headers, the same way
+Pm4CaptureData::LoadCaptureFileStream() walks it. Every record, memory block and IB is returned
+as a NumPy view into the mapping, so nothing is copied and only the pages that are actually
+touched are read from disk.
+"""
+
+import mmap
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from . import capture_format as fmt
+
+
+class CaptureFormatError(Exception):
+    pass
+
+
+# One row per block below the capture block, in file order
+BLOCK_INDEX_DTYPE = np.dtype(
+    [
+        ("type", "<u4"),  # BlockType
+        ("offset", "<u8"),  # File offset of the block data, just past its BlockInfo
+        ("size", "<u8"),  # BlockInfo::m_data_size
+        ("submit", "<i4"),  # Submit the block belongs to, -1 if it precedes all submits
+        ("va_addr", "<u8"),  # MemoryRawDataHeader::m_va_addr, for kMemoryRaw blocks
+        ("va_size", "<u8"),  # MemoryRawDataHeader::m_size_in_bytes, for kMemoryRaw blocks
+    ]
+)
+
+_BLOCK_INFO = struct.Struct("<I4xQ")
+_MEMORY_RAW_DATA_HEADER = struct.Struct("<QI")
+
+kCapture = fmt.BlockType.values["kCapture"]
+kMemoryAlloc = fmt.BlockType.values["kMemoryAlloc"]
+kSubmit = fmt.BlockType.values["kSubmit"]
+kMemoryRaw = fmt.BlockType.values["kMemoryRaw"]
+kPresent = fmt.BlockType.values["kPresent"]
+kText = fmt.BlockType.values["kText"]
+
+
+class DiveFile:
+    """A memory-mapped .dive file
+
+    Views returned by this class keep the mapping alive, so close() only unmaps the file once no
+    views remain.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise CaptureFormatError("%s: empty file" % path)
+        self.data = np.frombuffer(self._mmap, dtype=np.uint8)
+        self.capture_header: Optional[np.void] = None
+        try:
+            self._load()
+        except CaptureFormatError:
+            self.close()
+            raise
+
+    def _load(self):
+        path = self.path
+        if len(self.data) < fmt.FileHeader.dtype.itemsize:
+            raise CaptureFormatError("%s: missing file header" % path)
+        file_header = self.getRecord(fmt.FileHeader, 0)
+        if file_header["m_file_id"] != fmt.kDiveFileId:
+            raise CaptureFormatError("%s: not a .dive file" % path)
+        if file_header["m_file_version"] != fmt.kDiveFileVersion:
+            raise CaptureFormatError(
+                "%s: unsupported file version %d" % (path, file_header["m_file_version"])
+            )
+
+        self.blocks = self._buildIndex()
+        self._memory_rows = np.flatnonzero(self.blocks["type"] == kMemoryRaw)
+        self._submit_rows = np.flatnonzero(self.blocks["type"] == kSubmit)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.data = None
+        self.capture_header = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out are still alive; the mapping is released along with them
+            pass
+        self._file.close()
+
+    # ---------------------------------------------------------------------------------------------
+    def getRecords(self, record_struct: fmt.Struct, offset: int, count: int) -> np.ndarray:
+        """View `count` records of `record_struct` starting at file offset `offset`"""
+        end = offset + count * record_struct.dtype.itemsize
+        if end > len(self.data):
+            raise CaptureFormatError("%s: truncated %s" % (self.path, record_struct.name))
+        return self.data[offset:end].view(record_struct.dtype)
+
+    def getRecord(self, record_struct: fmt.Struct, offset: int) -> np.void:
+        return self.getRecords(record_struct, offset, 1)[0]
+
+    def _checkCaptureVersion(self, capture_header: np.void):
+        # Same checks as Pm4CaptureData::LoadCaptureFileStream()
+        major = int(capture_header["m_major_version"])
+        minor = int(capture_header["m_minor_version"])
+        incompatible = major != fmt.kCaptureMajorVersion or minor > fmt.kCaptureMinorVersion
+        # Cannot open version 0.1/0.2.x due to CaptureDataHeader change
+        incompatible |= major == 0 and minor in (1, 2)
+        if incompatible:
+            raise CaptureFormatError(
+                "%s: incompatible capture version %d.%d, supported version is %d.%d"
+                % (self.path, major, minor, fmt.kCaptureMajorVersion, fmt.kCaptureMinorVersion)
+            )
+
+    def _buildIndex(self) -> np.ndarray:
+        file_size = len(self.data)
+        rows: List[Tuple[int, int, int, int, int, int]] = []
+        submit_count = 0
+        offset = fmt.FileHeader.dtype.itemsize
+        while offset + _BLOCK_INFO.size <= file_size:
+            block_type, data_size = _BLOCK_INFO.unpack_from(self._mmap, offset)
+            data_offset = offset + _BLOCK_INFO.size
+
+            # The capture block starts with the CaptureDataHeader, and all other blocks follow it
+            if block_type == kCapture:
+                self.capture_header = self.getRecord(fmt.CaptureDataHeader, data_offset)
+                self._checkCaptureVersion(self.capture_header)
+                offset = data_offset + fmt.CaptureDataHeader.dtype.itemsize
+                continue
+            if self.capture_header is None:
+                raise CaptureFormatError(
+                    "%s: block 0x%x at offset %d precedes the capture block"
+                    % (self.path, block_type, offset)
+                )
+
+            if data_offset + data_size > file_size:
+                raise CaptureFormatError(
+                    "%s: block 0x%x at offset %d runs past the end of the file"
+                    % (self.path, block_type, offset)
+                )
+
+            # Same submit association as Pm4CaptureData: allocations belong to the next submit,
+            # memory blocks and presents to the last one
+            submit = submit_count - 1
+            va_addr = 0
+            va_size = 0
+            if block_type == kMemoryAlloc:
+                submit = submit_count
+            elif block_type == kSubmit:
+                submit = submit_count
+                submit_count += 1
+            elif block_type == kMemoryRaw:
+                va_addr, va_size = _MEMORY_RAW_DATA_HEADER.unpack_from(self._mmap, data_offset)
+            rows.append((block_type, data_offset, data_size, submit, va_addr, va_size))
+            offset = data_offset + data_size
+
+        if self.capture_header is None:
+            raise CaptureFormatError("%s: missing capture block" % self.path)
+        return np.array(rows, dtype=BLOCK_INDEX_DTYPE)
+
+    # ---------------------------------------------------------------------------------------------
+    def getBlockData(self, row: int) -> np.ndarray:
+        """View of the data of block `row` of the index, including its block-specific header"""
+        block = self.blocks[row]
+        return self.data[block["offset"] : block["offset"] + block["size"]]
+
+    def getNumSubmits(self) -> int:
+        return len(self._submit_rows)
+
+    def getSubmit(self, submit_index: int) -> Tuple[np.void, np.ndarray]:
+        """SubmitDataHeader record and IndirectBufferData records of a submit"""
+        offset = int(self.blocks["offset"][self._submit_rows[submit_index]])
+        header = self.getRecord(fmt.SubmitDataHeader, offset)
+        ibs = self.getRecords(
+            fmt.IndirectBufferData,
+            offset + fmt.SubmitDataHeader.dtype.itemsize,
+            int(header["m_num_ibs"]),
+        )
+        return header, ibs
+
+    def getMemoryBlocks(self) -> np.ndarray:
+        """Index rows of all kMemoryRaw blocks"""
+        return self.blocks[self._memory_rows]
+
+    def getMemoryBlock(self, row: int) -> Tuple[int, np.ndarray]:
+        """GPU address and contents of the kMemoryRaw block at index row `row`"""
+        block = self.blocks[row]
+        begin = int(block["offset"]) + fmt.MemoryRawDataHeader.dtype.itemsize
+        return int(block["va_addr"]), self.data[begin : begin + int(block["va_size"])]
+
+    def findMemory(self, submit_index: int, va_addr: int, size: int) -> Optional[np.ndarray]:
+        """View of [va_addr, va_addr + size) as seen by a submit: the contents of the most recent
+        memory block captured up to that submit that covers the whole range, or None"""
+        memory = self.blocks[self._memory_rows]
+        covers = (
+            (memory["submit"] <= submit_index)
+            & (memory["va_addr"] <= va_addr)
+            & (memory["va_addr"] + memory["va_size"] >= va_addr + size)
+        )
+        matches = np.flatnonzero(covers)
+        if len(matches) == 0:
+            return None
+        block_va_addr, contents = self.getMemoryBlock(int(self._memory_rows[matches[-1]]))
+        begin = va_addr - block_va_addr
+        return contents[begin : begin + size]
+
+    def getIbDwords(self, submit_index: int, ib_index: int) -> Optional[np.ndarray]:
+        """Dwords of an IB of a submit as a uint32 view, or None if the IB was not captured"""
+        _, ibs = self.getSubmit(submit_index)
+        ib = ibs[ib_index]
+        contents = self.findMemory(
+            submit_index, int(ib["m_va_addr"]), int(ib["m_size_in_dwords"]) * 4
+        )
+        if contents is None:
+            return None
+        return contents.view("<u4")
+
+    def iterIbs(self) -> Iterator[Tuple[int, int, int, Optional[np.ndarray]]]:
+        """Yields (submit index, IB index, GPU address, dwords) for every IB of the capture"""
+        for submit_index in range(self.getNumSubmits()):
+            _, ibs = self.getSubmit(submit_index)
+            for ib_index in range(len(ibs)):
+                yield (
+                    submit_index,
+                    ib_index,
+                    int(ibs[ib_index]["m_va_addr"]),
+                    self.getIbDwords(submit_index, ib_index),
+                )
+
+    def getPresents(self) -> np.ndarray:
+        """PresentData records of all kPresent blocks"""
+        rows = np.flatnonzero(self.blocks["type"] == kPresent)
+        if len(rows) == 0:
+            return np.zeros(0, dtype=fmt.PresentData.dtype)
+        return np.concatenate(
+            [self.getRecords(fmt.PresentData, int(self.blocks["offset"][row]), 1) for row in rows]
+        )
+
+    def getTextBlocks(self) -> Dict[str, np.ndarray]:
+        """Contents of the kText blocks by name"""
+        text_blocks = {}
+        for row in np.flatnonzero(self.blocks["type"] == kText):
+            offset = int(self.blocks["offset"][row])
+            header = self.getRecord(fmt.TextBlockHeader, offset)
+            name_begin = offset + fmt.TextBlockHeader.dtype.itemsize
+            name_end = name_begin + int(header["m_name_len"])
+            name = self.data[name_begin:name_end].tobytes().split(b"\0", 1)[0].decode()
+            text_blocks[name] = self.data[name_end : name_end + int(header["m_size_in_bytes"])]
+        return text_blocks
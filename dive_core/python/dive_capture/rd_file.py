@@ -0,0 +1,229 @@
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reader for freedreno .rd capture files, plain or gzip-compressed.
+
+Plain files are memory-mapped and sections are returned as views into the mapping. Compressed
+files are decompressed as they are read, one section at a time, so memory use stays bounded by
+the buffers of a single submit no matter how large the capture is. Submits are assembled the
+same way as Pm4CaptureData::LoadAdrenoRdFile().
+"""
+
+import dataclasses
+import gzip
+import mmap
+import struct
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .dive_file import CaptureFormatError
+
+# enum rd_sect_type
+RD_NONE = 0
+RD_TEST = 1
+RD_CMD = 2
+RD_GPUADDR = 3
+RD_CONTEXT = 4
+RD_CMDSTREAM = 5
+RD_CMDSTREAM_ADDR = 6
+RD_PARAM = 7
+RD_FLUSH = 8
+RD_PROGRAM = 9
+RD_VERT_SHADER = 10
+RD_FRAG_SHADER = 11
+RD_BUFFER_CONTENTS = 12
+RD_GPU_ID = 13
+RD_CHIP_ID = 14
+
+_SECTION_HEADER = struct.Struct("<II")
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Sizes below which a section cannot hold what Pm4CaptureData::LoadAdrenoRdFile() reads from it
+_MIN_SECTION_SIZES = {RD_GPUADDR: 8, RD_CMDSTREAM_ADDR: 8, RD_GPU_ID: 4, RD_CHIP_ID: 8}
+
+# Commands of these processes are skipped, as in Pm4CaptureData::LoadAdrenoRdFile()
+_SKIPPED_PROCESSES = ("fdperf", "chrome", "surfaceflinger")
+
+
+def _readGpuAddressAndSize(data: np.ndarray) -> Tuple[int, int]:
+    dwords = data[: len(data) // 4 * 4].view("<u4")
+    gpu_addr = int(dwords[0])
+    # It's possible that only the lower 32-bits are written to the file
+    if len(dwords) > 2:
+        gpu_addr |= int(dwords[2]) << 32
+    return gpu_addr, int(dwords[1])
+
+
+@dataclasses.dataclass
+class RdSubmit:
+    index: int
+    skip: bool  # Commands of a system process
+    ibs: List[Tuple[int, int]]  # (GPU address, size in dwords)
+    buffers: List[Tuple[int, np.ndarray]]  # (GPU address, contents) captured for this submit
+
+    def findMemory(self, va_addr: int, size: int) -> Optional[np.ndarray]:
+        """Contents of [va_addr, va_addr + size) from the last buffer of the submit covering it"""
+        for buffer_va_addr, contents in reversed(self.buffers):
+            if buffer_va_addr <= va_addr and va_addr + size <= buffer_va_addr + len(contents):
+                begin = va_addr - buffer_va_addr
+                return contents[begin : begin + size]
+        return None
+
+    def getIbDwords(self, ib_index: int) -> Optional[np.ndarray]:
+        va_addr, size_in_dwords = self.ibs[ib_index]
+        contents = self.findMemory(va_addr, size_in_dwords * 4)
+        if contents is None:
+            return None
+        return contents.view("<u4")
+
+
+class RdFile:
+    """A .rd file, read front to back"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.gpu_id = 0
+        self.chip_id = 0
+        self._file = open(path, "rb")
+        self._mmap: Optional[mmap.mmap] = None
+        self._stream: Optional[BinaryIO] = None
+        self.is_compressed = self._file.read(2) == _GZIP_MAGIC
+        self._file.seek(0)
+        if self.is_compressed:
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="rb")
+        else:
+            try:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                self._file.close()
+                raise CaptureFormatError("%s: empty file" % path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views handed out are still alive; the mapping is released along with them
+                pass
+        self._file.close()
+
+    # ---------------------------------------------------------------------------------------------
+    def _iterRawSections(self) -> Iterator[Tuple[int, np.ndarray]]:
+        if self._mmap is not None:
+            data = np.frombuffer(self._mmap, dtype=np.uint8)
+            offset = 0
+            while offset + _SECTION_HEADER.size <= len(data):
+                section_type, size = _SECTION_HEADER.unpack_from(self._mmap, offset)
+                offset += _SECTION_HEADER.size
+                if section_type == 0xFFFFFFFF and size == 0xFFFFFFFF:
+                    yield section_type, data[offset:offset]
+                    continue
+                if offset + size > len(data):
+                    raise CaptureFormatError(
+                        "%s: truncated section %d" % (self.path, section_type)
+                    )
+                yield section_type, data[offset : offset + size]
+                offset += size
+            return
+
+        stream = self._stream
+        while True:
+            header = stream.read(_SECTION_HEADER.size)
+            if len(header) < _SECTION_HEADER.size:
+                return
+            section_type, size = _SECTION_HEADER.unpack(header)
+            if section_type == 0xFFFFFFFF and size == 0xFFFFFFFF:
+                yield section_type, np.zeros(0, dtype=np.uint8)
+                continue
+            contents = stream.read(size)
+            if len(contents) < size:
+                raise CaptureFormatError("%s: truncated section %d" % (self.path, section_type))
+            yield section_type, np.frombuffer(contents, dtype=np.uint8)
+
+    def _iterCheckedSections(self) -> Iterator[Tuple[int, np.ndarray]]:
+        try:
+            yield from self._iterRawSections()
+        except (OSError, EOFError) as error:
+            # Not gzip data, or a truncated gzip stream
+            raise CaptureFormatError("%s: %s" % (self.path, error)) from error
+
+    def iterSections(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yields (section type, contents) for every section, skipping the 0xffffffff padding.
+        Raises CaptureFormatError on a section type or size that a .rd file cannot have, which is
+        how files that are not .rd files are detected, since the format has no magic number"""
+        for section_type, contents in self._iterCheckedSections():
+            if section_type == 0xFFFFFFFF:
+                continue
+            if section_type > RD_CHIP_ID:
+                raise CaptureFormatError(
+                    "%s: unknown section type %d, not a .rd file?" % (self.path, section_type)
+                )
+            min_size = _MIN_SECTION_SIZES.get(section_type, 0)
+            if len(contents) < min_size:
+                raise CaptureFormatError(
+                    "%s: section %d is %d bytes, expected at least %d"
+                    % (self.path, section_type, len(contents), min_size)
+                )
+            yield section_type, contents
+
+    def iterSubmits(self) -> Iterator[RdSubmit]:
+        """Yields each submit along with the buffers captured for it. Unlike with .dive files, all
+        the buffers of a submit come before it, and the buffers of earlier submits are not kept"""
+        submit: Optional[RdSubmit] = None
+        pending_buffers: List[Tuple[int, np.ndarray]] = []
+        cur_gpu_addr = None
+        cur_size = None
+        is_new_submit = False
+        skip_commands = False
+        submit_count = 0
+        for section_type, contents in self.iterSections():
+            if section_type == RD_GPUADDR:
+                cur_gpu_addr, cur_size = _readGpuAddressAndSize(contents)
+                is_new_submit = True
+            elif section_type == RD_BUFFER_CONTENTS:
+                # The size read from RD_GPUADDR should match block size exactly
+                if len(contents) != cur_size:
+                    raise CaptureFormatError(
+                        "%s: buffer size does not match RD_GPUADDR" % self.path
+                    )
+                pending_buffers.append((cur_gpu_addr, contents))
+            elif section_type == RD_CMDSTREAM_ADDR:
+                ib = _readGpuAddressAndSize(contents)
+                if is_new_submit or submit is None:
+                    if submit is not None:
+                        yield submit
+                    submit = RdSubmit(submit_count, skip_commands, [ib], pending_buffers)
+                    submit_count += 1
+                    pending_buffers = []
+                else:
+                    submit.ibs.append(ib)
+                is_new_submit = False
+            elif section_type == RD_CMD:
+                process_name = contents.tobytes().split(b"\0", 1)[0].decode(errors="replace")
+                skip_commands = process_name in _SKIPPED_PROCESSES or process_name.startswith("X")
+            elif section_type == RD_GPU_ID:
+                self.gpu_id = int(contents[:4].view("<u4")[0])
+            elif section_type == RD_CHIP_ID:
+                self.chip_id = int(contents[:8].view("<u8")[0])
+        if submit is not None:
+            yield submit
@@ -0,0 +1,189 @@
+/*
+ Copyright 2026 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#include "soa_columns.h"
+
+#include <algorithm>
+#include <cstring>
+
+#if defined(WIN32)
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+namespace Dive
+{
+
+// =================================================================================================
+// SoaColumnsWriter
+// =================================================================================================
+bool SoaColumnsWriter::Open(const char* file_name, uint64_t spec_hash, uint64_t size,
+                            const std::string& schema)
+{
+    m_file.open(file_name, std::ios::out | std::ios::binary | std::ios::trunc);
+    if (!m_file.is_open()) return false;
+
+    SoaColumnsHeader header = {};
+    header.m_file_id = kSoaColumnsFileId;
+    header.m_version = kSoaColumnsVersion;
+    header.m_spec_hash = spec_hash;
+    header.m_size = size;
+    header.m_num_columns = static_cast<uint32_t>(std::count(schema.begin(), schema.end(), '\n'));
+    header.m_schema_size = static_cast<uint32_t>(schema.size());
+    m_file.write(reinterpret_cast<const char*>(&header), sizeof(header));
+    m_file.write(schema.data(), schema.size());
+    m_offset = sizeof(header) + schema.size();
+    return m_file.good();
+}
+
+//--------------------------------------------------------------------------------------------------
+bool SoaColumnsWriter::Align()
+{
+    static const char kPadding[kSoaColumnsAlignment] = {};
+    size_t padding =
+        (kSoaColumnsAlignment - m_offset % kSoaColumnsAlignment) % kSoaColumnsAlignment;
+    m_file.write(kPadding, padding);
+    m_offset += padding;
+    return m_file.good();
+}
+
+//--------------------------------------------------------------------------------------------------
+bool SoaColumnsWriter::WriteColumn(const void* data, size_t num_bytes)
+{
+    if (!Align()) return false;
+    m_file.write(reinterpret_cast<const char*>(data), num_bytes);
+    m_offset += num_bytes;
+    return m_file.good();
+}
+
+//--------------------------------------------------------------------------------------------------
+bool SoaColumnsWriter::Close()
+{
+    m_file.close();
+    return !m_file.fail();
+}
+
+// =================================================================================================
+// SoaColumnsReader
+// =================================================================================================
+SoaColumnsReader::SoaColumnsReader(const void* data, size_t size)
+    : m_data(reinterpret_cast<const uint8_t*>(data)), m_size(size)
+{
+}
+
+//--------------------------------------------------------------------------------------------------
+bool SoaColumnsReader::ReadHeader(uint64_t spec_hash, const std::string& schema)
+{
+    SoaColumnsHeader header;
+    if (m_data == nullptr || m_size < sizeof(header)) return false;
+    memcpy(&header, m_data, sizeof(header));
+    if (header.m_file_id != kSoaColumnsFileId || header.m_version != kSoaColumnsVersion)
+        return false;
+
+    // A snapshot of a different spec, or with a different layout, cannot be loaded
+    if (header.m_spec_hash != spec_hash || header.m_schema_size != schema.size() ||
+        m_size - sizeof(header) < schema.size() ||
+        memcmp(m_data + sizeof(header), schema.data(), schema.size()) != 0)
+        return false;
+
+    m_offset = sizeof(header) + schema.size();
+    m_num_elements = header.m_size;
+    return true;
+}
+
+//--------------------------------------------------------------------------------------------------
+const void* SoaColumnsReader::NextColumn(size_t num_bytes)
+{
+    size_t offset = (m_offset + kSoaColumnsAlignment - 1) & ~(kSoaColumnsAlignment - 1);
+    if (offset > m_size || m_size - offset < num_bytes) return nullptr;
+    m_offset = offset + num_bytes;
+    return m_data + offset;
+}
+
+// =================================================================================================
+// ReadOnlyFileMapping
+// =================================================================================================
+ReadOnlyFileMapping::~ReadOnlyFileMapping() { Close(); }
+
+//--------------------------------------------------------------------------------------------------
+bool ReadOnlyFileMapping::Open(const char* file_name)
+{
+    Close();
+#if defined(WIN32)
+    HANDLE file = CreateFileA(file_name, GENERIC_READ, FILE_SHARE_READ, nullptr, OPEN_EXISTING,
+                              FILE_ATTRIBUTE_NORMAL, nullptr);
+    if (file == INVALID_HANDLE_VALUE) return false;
+    m_file_handle = file;
+
+    LARGE_INTEGER size;
+    if (!GetFileSizeEx(file, &size) || size.QuadPart == 0)
+    {
+        Close();
+        return false;
+    }
+    m_mapping_handle = CreateFileMappingA(file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+    if (m_mapping_handle == nullptr)
+    {
+        Close();
+        return false;
+    }
+    m_data = MapViewOfFile(m_mapping_handle, FILE_MAP_READ, 0, 0, 0);
+    if (m_data == nullptr)
+    {
+        Close();
+        return false;
+    }
+    m_size = static_cast<size_t>(size.QuadPart);
+#else
+    int fd = open(file_name, O_RDONLY);
+    if (fd < 0) return false;
+    struct stat file_stat;
+    if (fstat(fd, &file_stat) != 0 || file_stat.st_size == 0)
+    {
+        close(fd);
+        return false;
+    }
+    void* data = mmap(nullptr, file_stat.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    // The mapping stays valid after the file is closed
+    close(fd);
+    if (data == MAP_FAILED) return false;
+    m_data = data;
+    m_size = static_cast<size_t>(file_stat.st_size);
+#endif
+    return true;
+}
+
+//--------------------------------------------------------------------------------------------------
+void ReadOnlyFileMapping::Close()
+{
+#if defined(WIN32)
+    if (m_data != nullptr) UnmapViewOfFile(m_data);
+    if (m_mapping_handle != nullptr) CloseHandle(m_mapping_handle);
+    if (m_file_handle != nullptr) CloseHandle(m_file_handle);
+    m_mapping_handle = nullptr;
+    m_file_handle = nullptr;
+#else
+    if (m_data != nullptr) munmap(m_data, m_size);
+#endif
+    m_data = nullptr;
+    m_size = 0;
+}
+
+}  // namespace Dive
@@ -0,0 +1,108 @@
+/*
+ Copyright 2026 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <fstream>
+#include <string>
+
+namespace Dive
+{
+//--------------------------------------------------------------------------------------------------
+// Columnar snapshot files of the generated structure-of-array classes, written by `SaveColumns()`
+// and read by `LoadColumns()` (see struct_of_arrays.jinja). The file layout is:
+//   - SoaColumnsHeader
+//   - The schema: `m_schema_size` bytes of text, one "<name> <storage type> <array count>
+//     <bytes per element>" line per column
+//   - The columns, in schema order, each starting at a multiple of kSoaColumnsAlignment and holding
+//     `m_size` elements
+struct SoaColumnsHeader
+{
+    uint32_t m_file_id;
+    uint32_t m_version;
+    uint64_t m_spec_hash;    // Hash of the SOA's json spec, see generateSOAs.py
+    uint64_t m_size;         // Number of elements
+    uint32_t m_num_columns;  // Number of lines in the schema
+    uint32_t m_schema_size;
+};
+
+constexpr uint32_t kSoaColumnsFileId = 0x414F5344;  // "DSOA"
+constexpr uint32_t kSoaColumnsVersion = 1;
+constexpr size_t kSoaColumnsAlignment = 64;
+
+//--------------------------------------------------------------------------------------------------
+class SoaColumnsWriter
+{
+ public:
+    bool Open(const char* file_name, uint64_t spec_hash, uint64_t size, const std::string& schema);
+    bool WriteColumn(const void* data, size_t num_bytes);
+    bool Close();
+
+ private:
+    bool Align();
+
+    std::ofstream m_file;
+    uint64_t m_offset = 0;
+};
+
+//--------------------------------------------------------------------------------------------------
+// SoaColumnsReader reads a snapshot in memory, e.g. mapped with ReadOnlyFileMapping
+class SoaColumnsReader
+{
+ public:
+    SoaColumnsReader(const void* data, size_t size);
+
+    // Returns false if this is not a snapshot, or it was written with a different spec or schema
+    bool ReadHeader(uint64_t spec_hash, const std::string& schema);
+
+    // Number of elements, valid after ReadHeader()
+    uint64_t Size() const { return m_num_elements; }
+
+    // Returns the next column of `num_bytes`, or nullptr if the snapshot is truncated
+    const void* NextColumn(size_t num_bytes);
+
+ private:
+    const uint8_t* m_data;
+    size_t m_size;
+    size_t m_offset = 0;
+    uint64_t m_num_elements = 0;
+};
+
+//--------------------------------------------------------------------------------------------------
+class ReadOnlyFileMapping
+{
+ public:
+    ReadOnlyFileMapping() = default;
+    ~ReadOnlyFileMapping();
+    ReadOnlyFileMapping(const ReadOnlyFileMapping&) = delete;
+    ReadOnlyFileMapping& operator=(const ReadOnlyFileMapping&) = delete;
+
+    bool Open(const char* file_name);
+    void Close();
+    const void* Data() const { return m_data; }
+    size_t Size() const { return m_size; }
+
+ private:
+    void* m_data = nullptr;
+    size_t m_size = 0;
+#if defined(WIN32)
+    void* m_file_handle = nullptr;
+    void* m_mapping_handle = nullptr;
+#endif
+};
+
+}  // namespace Dive
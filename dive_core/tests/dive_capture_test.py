@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+
+#
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests of the dive_capture readers, on captures synthesized from the capture_format dtypes and
+on a checked-in .rd capture. Run by CTest, which sets:
+    DIVE_CAPTURE_PY_DIR  directory of the dive_capture package
+    DIVE_TEST_RD_FILE    gzip-compressed .rd capture
+"""
+
+import gzip
+import os
+import struct
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.environ["DIVE_CAPTURE_PY_DIR"])
+
+import dive_capture  # noqa: E402
+from dive_capture import capture_format as fmt  # noqa: E402
+from dive_capture import rd_file  # noqa: E402
+
+IB_VA_ADDR = 0x100001000
+RD_SECOND_IB_VA_ADDR = 0x2000
+IB_DWORDS = np.arange(0x70000000, 0x70000010, dtype="<u4")
+
+
+def _record(record_struct, **values):
+    record = np.zeros(1, dtype=record_struct.dtype)
+    for name, value in values.items():
+        record[name] = value
+    return record.tobytes()
+
+
+def _block(block_type, data):
+    return _record(fmt.BlockInfo, m_block_type=block_type, m_data_size=len(data)) + data
+
+
+def _makeDiveFile(major=fmt.kCaptureMajorVersion, minor=fmt.kCaptureMinorVersion,
+                  file_id=fmt.kDiveFileId):
+    """A capture with one submit of one IB, the memory holding that IB and a text block"""
+    memory = _record(
+        fmt.MemoryRawDataHeader, m_va_addr=IB_VA_ADDR, m_size_in_bytes=IB_DWORDS.nbytes
+    )
+    memory += IB_DWORDS.tobytes()
+    submit = _record(fmt.SubmitDataHeader, m_num_ibs=1)
+    submit += _record(
+        fmt.IndirectBufferData, m_va_addr=IB_VA_ADDR, m_size_in_dwords=len(IB_DWORDS)
+    )
+    text = _record(fmt.TextBlockHeader, m_name_len=6, m_size_in_bytes=5) + b"notes\0hello"
+    capture_header = _record(
+        fmt.CaptureDataHeader,
+        m_major_version=major,
+        m_minor_version=minor,
+        m_revision=fmt.kCaptureRevision,
+    )
+    return (
+        _record(fmt.FileHeader, m_file_id=file_id, m_file_version=fmt.kDiveFileVersion)
+        + _record(fmt.BlockInfo, m_block_type=dive_capture.dive_file.kCapture, m_data_size=0)
+        + capture_header
+        + _block(dive_capture.dive_file.kMemoryRaw, memory)
+        + _block(dive_capture.dive_file.kSubmit, submit)
+        + _block(dive_capture.dive_file.kText, text)
+    )
+
+
+def _section(section_type, data):
+    return struct.pack("<II", section_type, len(data)) + data
+
+
+def _makeRdFile():
+    """Two submits of one IB each. The second IB has a 32-bit address, so its RD_GPUADDR and
+    RD_CMDSTREAM_ADDR sections only hold the low dword of the address"""
+    second_ib = IB_DWORDS + 1
+    return (
+        _section(rd_file.RD_GPU_ID, struct.pack("<I", 640))
+        + _section(rd_file.RD_CMD, b"app\0")
+        + _section(rd_file.RD_GPUADDR, struct.pack("<III", IB_VA_ADDR & 0xFFFFFFFF,
+                                                   IB_DWORDS.nbytes, IB_VA_ADDR >> 32))
+        + _section(rd_file.RD_BUFFER_CONTENTS, IB_DWORDS.tobytes())
+        + _section(rd_file.RD_CMDSTREAM_ADDR, struct.pack("<III", IB_VA_ADDR & 0xFFFFFFFF,
+                                                          len(IB_DWORDS), IB_VA_ADDR >> 32))
+        + struct.pack("<II", 0xFFFFFFFF, 0xFFFFFFFF)
+        + _section(rd_file.RD_GPUADDR, struct.pack("<II", RD_SECOND_IB_VA_ADDR, second_ib.nbytes))
+        + _section(rd_file.RD_BUFFER_CONTENTS, second_ib.tobytes())
+        + _section(rd_file.RD_CMDSTREAM_ADDR, struct.pack("<II", RD_SECOND_IB_VA_ADDR,
+                                                          len(second_ib)))
+    )
+
+
+class DiveCaptureTest(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
+    def _writeFile(self, name, data):
+        path = os.path.join(self._temp_dir.name, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        return path
+
+    def testDiveFile(self):
+        path = self._writeFile("capture.dive", _makeDiveFile())
+        with dive_capture.openCapture(path) as capture:
+            self.assertIsInstance(capture, dive_capture.DiveFile)
+            self.assertEqual(capture.capture_header["m_minor_version"], fmt.kCaptureMinorVersion)
+            self.assertEqual(capture.getNumSubmits(), 1)
+            ibs = list(capture.iterIbs())
+            self.assertEqual(len(ibs), 1)
+            submit_index, ib_index, va_addr, dwords = ibs[0]
+            self.assertEqual((submit_index, ib_index, va_addr), (0, 0, IB_VA_ADDR))
+            np.testing.assert_array_equal(dwords, IB_DWORDS)
+            # The IB is a view into the mapping, not a copy
+            self.assertTrue(np.shares_memory(dwords, capture.data))
+            self.assertEqual(capture.getTextBlocks()["notes"].tobytes(), b"hello")
+            self.assertIsNone(capture.findMemory(0, IB_VA_ADDR, IB_DWORDS.nbytes + 4))
+
+    def testDiveFileIncompatibleVersion(self):
+        for major, minor in (
+            (fmt.kCaptureMajorVersion, fmt.kCaptureMinorVersion + 1),
+            (fmt.kCaptureMajorVersion + 1, 0),
+            (0, 2),
+        ):
+            path = self._writeFile("capture.dive", _makeDiveFile(major, minor))
+            message = "incompatible capture version %d.%d" % (major, minor)
+            with self.assertRaisesRegex(dive_capture.CaptureFormatError, message):
+                dive_capture.DiveFile(path)
+
+    def testNotADiveFile(self):
+        path = self._writeFile("capture.dive", _makeDiveFile(file_id=0x12345678))
+        with self.assertRaisesRegex(dive_capture.CaptureFormatError, "not a .dive file"):
+            dive_capture.DiveFile(path)
+        path = self._writeFile("empty.dive", b"")
+        with self.assertRaisesRegex(dive_capture.CaptureFormatError, "empty file"):
+            dive_capture.DiveFile(path)
+        # Blocks must be inside the capture block
+        data = _makeDiveFile()
+        header_size = fmt.FileHeader.dtype.itemsize
+        capture_size = fmt.BlockInfo.dtype.itemsize + fmt.CaptureDataHeader.dtype.itemsize
+        data = data[:header_size] + data[header_size + capture_size :]
+        path = self._writeFile("capture.dive", data)
+        with self.assertRaisesRegex(dive_capture.CaptureFormatError, "precedes the capture block"):
+            dive_capture.DiveFile(path)
+
+    def _checkRdFile(self, capture):
+        submits = [(submit.index, submit.ibs, submit.getIbDwords(0))
+                   for submit in capture.iterSubmits()]
+        self.assertEqual(capture.gpu_id, 640)
+        self.assertEqual(len(submits), 2)
+        self.assertEqual(submits[0][1], [(IB_VA_ADDR, len(IB_DWORDS))])
+        np.testing.assert_array_equal(submits[0][2], IB_DWORDS)
+        self.assertEqual(submits[1][1], [(RD_SECOND_IB_VA_ADDR, len(IB_DWORDS))])
+        np.testing.assert_array_equal(submits[1][2], IB_DWORDS + 1)
+
+    def testRdFile(self):
+        path = self._writeFile("capture.rd", _makeRdFile())
+        with dive_capture.openCapture(path) as capture:
+            self.assertIsInstance(capture, dive_capture.RdFile)
+            self.assertFalse(capture.is_compressed)
+            self._checkRdFile(capture)
+
+    def testCompressedRdFile(self):
+        path = self._writeFile("capture.rd", gzip.compress(_makeRdFile()))
+        with dive_capture.openCapture(path) as capture:
+            self.assertTrue(capture.is_compressed)
+            self._checkRdFile(capture)
+
+    def testCheckedInRdFile(self):
+        with dive_capture.RdFile(os.environ["DIVE_TEST_RD_FILE"]) as capture:
+            self.assertTrue(capture.is_compressed)
+            ib_count = 0
+            for submit in capture.iterSubmits():
+                for ib_index, (_, size_in_dwords) in enumerate(submit.ibs):
+                    dwords = submit.getIbDwords(ib_index)
+                    self.assertIsNotNone(dwords)
+                    self.assertEqual(len(dwords), size_in_dwords)
+                    ib_count += 1
+            self.assertGreater(ib_count, 0)
+            self.assertEqual(capture.gpu_id // 100, 6)
+
+    def testNotAnRdFile(self):
+        garbage = _makeDiveFile()
+        for name, data in (("plain.rd", garbage), ("compressed.rd", gzip.compress(garbage))):
+            path = self._writeFile(name, data)
+            with dive_capture.RdFile(path) as capture:
+                with self.assertRaisesRegex(
+                    dive_capture.CaptureFormatError, "unknown section type"
+                ):
+                    list(capture.iterSubmits())
+        path = self._writeFile("truncated.rd", gzip.compress(_makeRdFile())[:-16])
+        with dive_capture.RdFile(path) as capture:
+            with self.assertRaises(dive_capture.CaptureFormatError):
+                list(capture.iterSubmits())
+        path = self._writeFile("short_gpu_id.rd", _section(rd_file.RD_GPU_ID, b"\0\0"))
+        with dive_capture.RdFile(path) as capture:
+            with self.assertRaisesRegex(dive_capture.CaptureFormatError, "expected at least 4"):
+                list(capture.iterSubmits())
+
+    def testUnknownExtension(self):
+        with self.assertRaisesRegex(dive_capture.CaptureFormatError, "unknown capture file"):
+            dive_capture.openCapture("capture.gfxr")
+
+
+if __name__ == "__main__":
+    unittest.main()
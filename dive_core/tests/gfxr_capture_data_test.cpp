@@ -122,6 +122,68 @@ TEST(GfxrCaptureDataTest, LoadsAllBlocksIntoMemory)
               (DiveBlockDataCounts{.original_count = 231, .modified_count = 0}));
 }
 
+TEST(GfxrCaptureDataTest, AssetFileBlocksHaveNoOffset)
+{
+    GfxrCaptureData capture_data;
+    ASSERT_EQ(capture_data.LoadCaptureFile(TEST_DATA_DIR
+                                           "/com.google.bigwheels.project_sample_01_triangle.debug_"
+                                           "trim_trigger_20250718T132545.gfxr"),
+              CaptureData::LoadResult::kSuccess);
+
+    int asset_file_block_count = 0;
+    LambdaBlockVisitor count_asset_file_blocks(
+        [&asset_file_block_count](const DiveOriginalBlock& block) {
+            if (!block.offset_.has_value())
+            {
+                ++asset_file_block_count;
+            }
+            return true;
+        },
+        [](const DiveModificationBlock& /*block*/) {
+            ADD_FAILURE() << "Unexpected DiveModificationBlock";
+            return false;
+        });
+    ASSERT_TRUE(capture_data.GetMutableGfxrData()->TraverseBlocks(count_asset_file_blocks));
+
+    // The capture executes the blocks of its .gfxa asset file
+    EXPECT_GT(asset_file_block_count, 0);
+}
+
+TEST(GfxrCaptureDataTest, DeferredArgsAreDecodedOnRequest)
+{
+    constexpr const char* kTestFile = TEST_DATA_DIR
+        "/com.google.bigwheels.project_sample_01_triangle.debug_"
+        "trim_trigger_20250718T132545.gfxr";
+    GfxrCaptureData deferred_capture_data;
+    ASSERT_EQ(deferred_capture_data.LoadCaptureFile(kTestFile), CaptureData::LoadResult::kSuccess);
+    GfxrCaptureData eager_capture_data;
+    eager_capture_data.SetDeferVulkanCommandArgs(false);
+    ASSERT_EQ(eager_capture_data.LoadCaptureFile(kTestFile), CaptureData::LoadResult::kSuccess);
+
+    int deferred_count = 0;
+    for (const auto& submit : deferred_capture_data.GetGfxrSubmits())
+    {
+        for (uint64_t handle : submit->vk_command_buffer_handles)
+        {
+            for (const auto& vk_cmd : deferred_capture_data.GetGfxrCommandBuffers(handle))
+            {
+                const DiveAnnotationProcessor::VulkanCommandInfo* eager_vk_cmd =
+                    eager_capture_data.GetGfxrCommand(vk_cmd.command_index);
+                ASSERT_NE(eager_vk_cmd, nullptr);
+                EXPECT_FALSE(eager_vk_cmd->HasDeferredArgs());
+                if (vk_cmd.HasDeferredArgs())
+                {
+                    ++deferred_count;
+                }
+                EXPECT_EQ(deferred_capture_data.GetVulkanCommandArgs(vk_cmd.command_index),
+                          eager_vk_cmd->GetArgs())
+                    << vk_cmd.name;
+            }
+        }
+    }
+    EXPECT_GT(deferred_count, 0);
+}
+
 TEST(GfxrCaptureDataTest, LastBlockIsProperlySized)
 {
     GfxrCaptureData capture_data;
@@ -159,7 +221,13 @@ TEST(GfxrCaptureDataTest, AllLoadedBlocksAreValid)
 
     LambdaBlockVisitor block_validator(
         [&gfxr_file](const DiveOriginalBlock& block) {
-            gfxr_file.seekg(block.offset_, std::ios_base::beg);
+            if (!block.offset_.has_value())
+            {
+                // Blocks from the asset file are not in the .gfxr file
+                EXPECT_EQ(block.size_, 0);
+                return true;
+            }
+            gfxr_file.seekg(*block.offset_, std::ios_base::beg);
             absl::StatusOr<BlockHeader> header = ReadBlockHeader(gfxr_file);
             if (!header.ok())
             {
@@ -0,0 +1,121 @@
+/*
+Copyright 2026 Google Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+#include "dive_core/gfxr_vulkan_command_hierarchy.h"
+
+#include <string>
+
+#include "dive_core/command_hierarchy.h"
+#include "dive_core/gfxr_capture_data.h"
+#include "gmock/gmock.h"
+#include "gtest/gtest.h"
+
+namespace Dive
+{
+namespace
+{
+
+constexpr const char* kTestFile = TEST_DATA_DIR
+    "/com.google.bigwheels.project_sample_01_triangle.debug_"
+    "trim_trigger_20250718T132545.gfxr";
+
+// Returns the first node of the given type, or UINT64_MAX if there is none
+uint64_t FindNode(const CommandHierarchy& command_hierarchy, NodeType type)
+{
+    for (uint64_t node_index = 0; node_index < command_hierarchy.size(); ++node_index)
+    {
+        if (command_hierarchy.GetNodeType(node_index) == type)
+        {
+            return node_index;
+        }
+    }
+    return UINT64_MAX;
+}
+
+TEST(GfxrVulkanCommandHierarchyTest, CommandsHaveNoArgNodesUntilRequested)
+{
+    GfxrCaptureData capture_data;
+    ASSERT_EQ(capture_data.LoadCaptureFile(kTestFile), CaptureData::LoadResult::kSuccess);
+
+    CommandHierarchy command_hierarchy;
+    GfxrVulkanCommandHierarchyCreator creator(command_hierarchy, capture_data);
+    ASSERT_TRUE(creator.CreateTrees());
+
+    for (uint64_t node_index = 0; node_index < command_hierarchy.size(); ++node_index)
+    {
+        EXPECT_NE(command_hierarchy.GetNodeType(node_index), NodeType::kGfxrVulkanCommandArgNode);
+    }
+
+    uint64_t draw_node_index = FindNode(command_hierarchy, NodeType::kGfxrVulkanDrawCommandNode);
+    ASSERT_NE(draw_node_index, UINT64_MAX);
+    ASSERT_TRUE(command_hierarchy.GetGfxrCommandNodeArgsPending(draw_node_index));
+
+    const DiveAnnotationProcessor::VulkanCommandInfo* draw =
+        capture_data.GetGfxrCommand(command_hierarchy.GetGfxrCommandNodeIndex(draw_node_index));
+    ASSERT_NE(draw, nullptr);
+    EXPECT_THAT(command_hierarchy.GetNodeDesc(draw_node_index), testing::StartsWith(draw->name));
+}
+
+TEST(GfxrVulkanCommandHierarchyTest, ArgNodesAreAppendedOnce)
+{
+    GfxrCaptureData capture_data;
+    ASSERT_EQ(capture_data.LoadCaptureFile(kTestFile), CaptureData::LoadResult::kSuccess);
+
+    CommandHierarchy command_hierarchy;
+    GfxrVulkanCommandHierarchyCreator creator(command_hierarchy, capture_data);
+    ASSERT_TRUE(creator.CreateTrees());
+
+    const Topology& topology = command_hierarchy.GetAllEventHierarchyTopology();
+    uint64_t node_index =
+        FindNode(command_hierarchy, NodeType::kGfxrVulkanBeginRenderPassCommandNode);
+    ASSERT_NE(node_index, UINT64_MAX);
+    uint64_t num_commands = topology.GetNumChildren(node_index);
+    ASSERT_GT(num_commands, 0u);
+    uint64_t first_command = topology.GetChildNodeIndex(node_index, 0);
+
+    uint64_t first_child_index = UINT64_MAX;
+    uint64_t num_children = 0;
+    uint64_t num_arg_nodes =
+        creator.CreateArgNodes(node_index, [&](uint64_t first_child, uint64_t count) {
+            // Called before the topology changes
+            EXPECT_EQ(topology.GetNumChildren(node_index), num_commands);
+            first_child_index = first_child;
+            num_children = count;
+        });
+    ASSERT_GT(num_arg_nodes, 0u);
+    EXPECT_EQ(first_child_index, num_commands);
+    EXPECT_EQ(num_children, num_arg_nodes);
+    EXPECT_FALSE(command_hierarchy.GetGfxrCommandNodeArgsPending(node_index));
+
+    // The commands keep their place, the args follow them
+    ASSERT_EQ(topology.GetNumChildren(node_index), num_commands + num_arg_nodes);
+    EXPECT_EQ(topology.GetChildNodeIndex(node_index, 0), first_command);
+    for (uint64_t i = num_commands; i < num_commands + num_arg_nodes; ++i)
+    {
+        uint64_t arg_node_index = topology.GetChildNodeIndex(node_index, i);
+        EXPECT_EQ(command_hierarchy.GetNodeType(arg_node_index),
+                  NodeType::kGfxrVulkanCommandArgNode);
+        EXPECT_EQ(topology.GetParentNodeIndex(arg_node_index), node_index);
+        EXPECT_EQ(topology.GetChildIndex(arg_node_index), i);
+    }
+
+    uint64_t num_nodes = command_hierarchy.size();
+    EXPECT_EQ(creator.CreateArgNodes(node_index), 0u);
+    EXPECT_EQ(command_hierarchy.size(), num_nodes);
+}
+
+}  // namespace
+}  // namespace Dive
@@ -0,0 +1,297 @@
+/*
+ Copyright 2025 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+// Compares the static pm4_info tables against the tables that Pm4InfoInit() used to populate at
+// runtime. The runtime-initialized tables are generated in the test build by a snapshot of the
+// old generator (see legacy_pm4_info/), which parses the register xml on its own, so they are
+// also an independent reference for the contents of the static tables.
+
+#include <chrono>
+#include <cstring>
+#include <iostream>
+
+#include "gtest/gtest.h"
+#include "pm4_info.h"
+#include "pm4_info_legacy.h"
+
+namespace Dive
+{
+namespace
+{
+
+constexpr uint32_t kGpuIds[] = {200, 300, 400, 500, 600, 700, 800};
+// The old tables predate A8XX
+constexpr uint32_t kLegacyGpuIds[] = {200, 300, 400, 500, 600, 700};
+constexpr uint32_t kLookupIterations = 20;
+// RegField::m_enum_handle is 8-bit
+constexpr uint32_t kEnumHandleCount = 256;
+
+double ElapsedMs(std::chrono::steady_clock::time_point start)
+{
+    return std::chrono::duration<double, std::milli>(std::chrono::steady_clock::now() - start)
+        .count();
+}
+
+// The old tables hold every field of a register, the static tables only the fields that are
+// enabled for the current GPU, from A6XX on
+bool IsLegacyFieldEnabled(const Legacy::RegField &field)
+{
+    return Legacy::GetGPUVariantType() < Legacy::kA6XX || field.m_gpu_variants == 0 ||
+           Legacy::IsFieldEnabled(&field);
+}
+
+void ExpectSameFields(const RegInfo &info, const Legacy::RegInfo &legacy_info)
+{
+    size_t index = 0;
+    for (const Legacy::RegField &legacy_field : legacy_info.m_fields)
+    {
+        if (!IsLegacyFieldEnabled(legacy_field)) continue;
+        ASSERT_LT(index, info.m_fields.size()) << info.m_name << "." << legacy_field.m_name;
+        const RegField &field = info.m_fields[index++];
+        EXPECT_STREQ(field.m_name, legacy_field.m_name) << info.m_name;
+        EXPECT_EQ(field.m_mask, legacy_field.m_mask) << info.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_shift, legacy_field.m_shift) << info.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_type, legacy_field.m_type) << info.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_enum_handle, legacy_field.m_enum_handle)
+            << info.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_shr, legacy_field.m_shr) << info.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_bit_width, legacy_field.m_bit_width)
+            << info.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_radix, legacy_field.m_radix) << info.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_gpu_variants, legacy_field.m_gpu_variants)
+            << info.m_name << "." << field.m_name;
+    }
+    EXPECT_EQ(index, info.m_fields.size()) << info.m_name;
+}
+
+void ExpectSamePacket(const PacketInfo &packet, const Legacy::PacketInfo &legacy_packet)
+{
+    EXPECT_STREQ(packet.m_name, legacy_packet.m_name);
+    EXPECT_EQ(packet.m_max_array_size, legacy_packet.m_max_array_size) << packet.m_name;
+    EXPECT_EQ(packet.m_stripe_variant, legacy_packet.m_stripe_variant) << packet.m_name;
+    ASSERT_EQ(packet.m_fields.size(), legacy_packet.m_fields.size()) << packet.m_name;
+    for (size_t i = 0; i < packet.m_fields.size(); ++i)
+    {
+        const PacketField &field = packet.m_fields[i];
+        const Legacy::PacketField &legacy_field = legacy_packet.m_fields[i];
+        EXPECT_STREQ(field.m_name, legacy_field.m_name) << packet.m_name;
+        EXPECT_EQ(field.m_is_variant_opcode, legacy_field.m_is_variant_opcode)
+            << packet.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_dword, legacy_field.m_dword) << packet.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_type, legacy_field.m_type) << packet.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_enum_handle, legacy_field.m_enum_handle)
+            << packet.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_shift, legacy_field.m_shift) << packet.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_shr, legacy_field.m_shr) << packet.m_name << "." << field.m_name;
+        EXPECT_EQ(field.m_mask, legacy_field.m_mask) << packet.m_name << "." << field.m_name;
+    }
+}
+
+TEST(Pm4InfoBenchmark, StaticTablesVsRuntimeInit)
+{
+    // Startup: the static tables need no initialization, so the first lookup is the only cost
+    SetGPUID(600);
+    auto start = std::chrono::steady_clock::now();
+    const RegInfo *first_info = GetRegByName("RB_DEPTH_CNTL");
+    double static_init_ms = ElapsedMs(start);
+    EXPECT_NE(first_info, nullptr);
+
+    Legacy::SetGPUID(600);
+    start = std::chrono::steady_clock::now();
+    Legacy::Pm4InfoInit();
+    double legacy_init_ms = ElapsedMs(start);
+
+    // Lookups by offset, for every offset
+    uint64_t static_checksum = 0;
+    start = std::chrono::steady_clock::now();
+    for (uint32_t i = 0; i < kLookupIterations; ++i)
+    {
+        for (uint32_t reg = 0; reg < kRegOffsetCount; ++reg)
+        {
+            const RegInfo *info = GetRegInfo(reg);
+            if (info != nullptr) static_checksum += info->m_fields.size();
+        }
+    }
+    double static_lookup_ms = ElapsedMs(start);
+
+    const RegInfoTable &reg_table = GetRegInfoTable();
+    uint64_t table_checksum = 0;
+    start = std::chrono::steady_clock::now();
+    for (uint32_t i = 0; i < kLookupIterations; ++i)
+    {
+        for (uint32_t reg = 0; reg < kRegOffsetCount; ++reg)
+        {
+            const RegInfo *info = reg_table.GetRegInfo(reg);
+            if (info != nullptr) table_checksum += info->m_fields.size();
+        }
+    }
+    double table_lookup_ms = ElapsedMs(start);
+
+    uint64_t legacy_checksum = 0;
+    start = std::chrono::steady_clock::now();
+    for (uint32_t i = 0; i < kLookupIterations; ++i)
+    {
+        for (uint32_t reg = 0; reg < kRegOffsetCount; ++reg)
+        {
+            const Legacy::RegInfo *info = Legacy::GetRegInfo(reg);
+            if (info != nullptr) legacy_checksum += info->m_fields.size();
+        }
+    }
+    double legacy_lookup_ms = ElapsedMs(start);
+
+    // Lookups by name, for every register
+    DiveVector<const char *> names;
+    for (uint32_t reg = 0; reg < kRegOffsetCount; ++reg)
+    {
+        const RegInfo *info = GetRegInfo(reg);
+        if (info != nullptr) names.push_back(info->m_name);
+    }
+
+    uint64_t static_name_checksum = 0;
+    start = std::chrono::steady_clock::now();
+    for (uint32_t i = 0; i < kLookupIterations; ++i)
+    {
+        for (const char *name : names) static_name_checksum += GetRegOffsetByName(name);
+    }
+    double static_name_lookup_ms = ElapsedMs(start);
+
+    uint64_t legacy_name_checksum = 0;
+    start = std::chrono::steady_clock::now();
+    for (uint32_t i = 0; i < kLookupIterations; ++i)
+    {
+        for (const char *name : names) legacy_name_checksum += Legacy::GetRegOffsetByName(name);
+    }
+    double legacy_name_lookup_ms = ElapsedMs(start);
+
+    std::cout << "pm4_info startup: static " << static_init_ms << " ms, runtime init "
+              << legacy_init_ms << " ms" << std::endl;
+    std::cout << "pm4_info lookups (" << kLookupIterations << " x " << kRegOffsetCount
+              << " offsets): static " << static_lookup_ms << " ms, variant table "
+              << table_lookup_ms << " ms, runtime init " << legacy_lookup_ms << " ms" << std::endl;
+    std::cout << "pm4_info lookups by name (" << kLookupIterations << " x " << names.size()
+              << " registers): static " << static_name_lookup_ms << " ms, runtime init "
+              << legacy_name_lookup_ms << " ms" << std::endl;
+
+    // The old tables hold the disabled fields and resolve some names to another GPU's offset, so
+    // StaticTablesMatchRuntimeInit compares their contents instead of the checksums
+    EXPECT_EQ(table_checksum, static_checksum);
+    EXPECT_GT(legacy_checksum, 0u);
+    EXPECT_GT(static_name_checksum, 0u);
+    EXPECT_GT(legacy_name_checksum, 0u);
+
+    SetGPUID(0);
+    Legacy::SetGPUID(0);
+}
+
+TEST(Pm4InfoBenchmark, StaticTablesMatchRuntimeInit)
+{
+    Legacy::Pm4InfoInit();
+    for (uint32_t gpu_id : kLegacyGpuIds)
+    {
+        SetGPUID(gpu_id);
+        Legacy::SetGPUID(gpu_id);
+        ASSERT_EQ(static_cast<uint32_t>(GetGPUVariantType()),
+                  static_cast<uint32_t>(Legacy::GetGPUVariantType()));
+
+        for (uint32_t reg = 0; reg < kRegOffsetCount; ++reg)
+        {
+            const RegInfo *info = GetRegInfo(reg);
+            const Legacy::RegInfo *legacy_info = Legacy::GetRegInfo(reg);
+            ASSERT_EQ(info == nullptr, legacy_info == nullptr)
+                << "gpu " << gpu_id << ", offset " << reg;
+            if (info == nullptr) continue;
+            EXPECT_STREQ(info->m_name, legacy_info->m_name) << "offset " << reg;
+            EXPECT_EQ(info->m_is_64_bit, legacy_info->m_is_64_bit) << info->m_name;
+            EXPECT_EQ(info->m_type, legacy_info->m_type) << info->m_name;
+            EXPECT_EQ(info->m_enum_handle, legacy_info->m_enum_handle) << info->m_name;
+            EXPECT_EQ(info->m_shr, legacy_info->m_shr) << info->m_name;
+            EXPECT_EQ(info->m_bit_width, legacy_info->m_bit_width) << info->m_name;
+            EXPECT_EQ(info->m_radix, legacy_info->m_radix) << info->m_name;
+            ExpectSameFields(*info, *legacy_info);
+
+            // The old tables map a name to the same offset for every GPU, which is the offset of
+            // another register when the name moved between GPUs
+            uint32_t offset = GetRegOffsetByName(info->m_name);
+            uint32_t legacy_offset = Legacy::GetRegOffsetByName(info->m_name);
+            const Legacy::RegInfo *legacy_named_info = Legacy::GetRegInfo(legacy_offset);
+            if (legacy_named_info != nullptr &&
+                strcmp(legacy_named_info->m_name, info->m_name) == 0)
+                EXPECT_EQ(offset, legacy_offset) << info->m_name;
+            else
+                EXPECT_EQ(offset, reg) << info->m_name;
+        }
+
+        for (uint32_t op_code = 0; op_code < kOpCodeCount; ++op_code)
+        {
+            const PacketInfo *packet = GetPacketInfo(op_code);
+            const Legacy::PacketInfo *legacy_packet = Legacy::GetPacketInfo(op_code);
+            ASSERT_EQ(packet == nullptr, legacy_packet == nullptr)
+                << "gpu " << gpu_id << ", op code " << op_code;
+            if (packet != nullptr) ExpectSamePacket(*packet, *legacy_packet);
+        }
+    }
+
+    for (uint32_t op_code = 0; op_code < kOpCodeCount; ++op_code)
+    {
+        const char *str = GetOpCodeString(op_code);
+        const char *legacy_str = Legacy::GetOpCodeString(op_code);
+        ASSERT_EQ(str == nullptr, legacy_str == nullptr) << "op code " << op_code;
+        if (str != nullptr) EXPECT_STREQ(str, legacy_str) << "op code " << op_code;
+    }
+
+    for (uint32_t enum_handle = 0; enum_handle < kEnumHandleCount; ++enum_handle)
+    {
+        for (uint32_t val = 0; val < 256; ++val)
+        {
+            const char *str = GetEnumString(enum_handle, val);
+            const char *legacy_str = Legacy::GetEnumString(enum_handle, val);
+            ASSERT_EQ(str == nullptr, legacy_str == nullptr)
+                << "enum " << enum_handle << ", value " << val;
+            if (str != nullptr)
+                EXPECT_STREQ(str, legacy_str) << "enum " << enum_handle << ", value " << val;
+        }
+    }
+
+    SetGPUID(0);
+    Legacy::SetGPUID(0);
+}
+
+TEST(Pm4InfoBenchmark, VariantTablesOnlyHaveEnabledFields)
+{
+    for (uint32_t gpu_id : kGpuIds)
+    {
+        SetGPUID(gpu_id);
+        const RegInfoTable &reg_table = GetRegInfoTable();
+        bool has_variant_regs = false;
+        for (uint32_t reg = 0; reg < kRegOffsetCount; ++reg)
+        {
+            const RegInfo *info = reg_table.GetRegInfo(reg);
+            EXPECT_EQ(info, GetRegInfo(reg)) << "offset " << reg;
+            if (info == nullptr) continue;
+            for (const RegField &field : info->m_fields)
+            {
+                has_variant_regs |= (field.m_gpu_variants != 0);
+                if (GetGPUVariantType() >= kA6XX && field.m_gpu_variants != 0)
+                    EXPECT_TRUE(IsFieldEnabled(&field)) << info->m_name << "." << field.m_name;
+            }
+        }
+        if (GetGPUVariantType() >= kA6XX) EXPECT_TRUE(has_variant_regs) << "gpu " << gpu_id;
+    }
+    SetGPUID(0);
+}
+
+}  // namespace
+}  // namespace Dive
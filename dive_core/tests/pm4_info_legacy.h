@@ -0,0 +1,42 @@
+/*
+ Copyright 2025 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+// The runtime-initialized pm4_info tables, generated at build time by the snapshot of the
+// generator in legacy_pm4_info/. They are declared in the Legacy namespace, so that they can be
+// linked next to the static tables of dive_core.
+
+#pragma once
+
+// The headers that the generated files include, so that they are not declared in the Legacy
+// namespace
+#include <assert.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <algorithm>
+#include <cstring>
+#include <map>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#include "dive_core/common/common.h"
+#include "dive_core/stl_replacement.h"
+
+namespace Legacy
+{
+#include "pm4_info_legacy/pm4_info.h"
+}  // namespace Legacy
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+#
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Checks decodeIb() of the generated pm4_info.py against the C++ pm4_info tables.
+
+Each IB is decoded both by decodeIb() and by the pm4_info_reference tool, which walks the same IB
+with GetOpCodeString(), GetRegInfo() and GetEnumString(), and the two listings must match line for
+line. Run by CTest, which sets:
+    PM4_INFO_PY_DIR      directory of the generated pm4_info.py
+    PM4_INFO_REFERENCE   path of the pm4_info_reference tool
+    DIVE_CAPTURE_PY_DIR  directory of the dive_capture package
+    DIVE_TEST_RD_FILE    .rd capture whose IBs are decoded
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.environ['PM4_INFO_PY_DIR'])
+sys.path.insert(0, os.environ['DIVE_CAPTURE_PY_DIR'])
+
+import dive_capture  # noqa: E402
+import pm4_info  # noqa: E402
+
+
+def _oddParity(value):
+    return (0x9669 >> ((value ^ (value >> 4) ^ (value >> 8) ^ (value >> 12) ^ (value >> 16) ^
+                        (value >> 20) ^ (value >> 24) ^ (value >> 28)) & 0xf)) & 1
+
+
+def _pkt4(offset, values):
+    return [(4 << 28) | (_oddParity(offset) << 27) | (offset << 8) |
+            (_oddParity(len(values)) << 7) | len(values)] + list(values)
+
+
+def _pkt7(opcode, payload):
+    return [(7 << 28) | (_oddParity(opcode) << 23) | (opcode << 16) |
+            (_oddParity(len(payload)) << 15) | len(payload)] + list(payload)
+
+
+def _formatDecodedIb(dwords, gpu_id):
+    """decodeIb() columns in the line format of pm4_info_reference"""
+    columns = pm4_info.decodeIb(dwords, gpu_id)
+    lines = []
+    for dword, packet_type, opcode, count in zip(columns.packet_dword, columns.packet_type,
+                                                 columns.packet_opcode, columns.packet_count):
+        if opcode < 0:
+            name = '-'
+        else:
+            name = pm4_info.OPCODE_NAMES[opcode] or '?'
+        lines.append('P %d %d %s %d' % (dword, packet_type, name, count))
+
+    field_begin = np.searchsorted(columns.field_reg, np.arange(len(columns.reg_offset) + 1))
+    for reg in range(len(columns.reg_offset)):
+        info = columns.reg_info[reg]
+        name = '?' if info == pm4_info.NO_REG_INFO else pm4_info.REG_NAMES[info]
+        lines.append('R %d 0x%x %s 0x%x' % (columns.reg_dword[reg], columns.reg_offset[reg], name,
+                                            columns.reg_value[reg]))
+        for row in range(field_begin[reg], field_begin[reg + 1]):
+            field = columns.field_index[row]
+            value = int(columns.field_value[row])
+            enum_string = pm4_info.getEnumString(pm4_info.FIELD_ENUM[field], value)
+            lines.append('F %s 0x%x %s' % (pm4_info.FIELD_NAMES[field], value, enum_string or '-'))
+    return lines
+
+
+class Pm4InfoPyTest(unittest.TestCase):
+
+    def _checkAgainstReference(self, dwords, gpu_id):
+        dwords = np.asarray(dwords, dtype='<u4')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ib_path = os.path.join(temp_dir, 'ib.bin')
+            dwords.tofile(ib_path)
+            reference = subprocess.run([os.environ['PM4_INFO_REFERENCE'], str(gpu_id), ib_path],
+                                       check=True, capture_output=True, text=True).stdout
+        expected = reference.splitlines()
+        actual = _formatDecodedIb(dwords, gpu_id)
+        self.assertEqual(len(actual), len(expected))
+        for actual_line, expected_line in zip(actual, expected):
+            self.assertEqual(actual_line, expected_line)
+        return actual
+
+    def testCaptureIbs(self):
+        with dive_capture.RdFile(os.environ['DIVE_TEST_RD_FILE']) as capture:
+            submit = next(capture.iterSubmits())
+            gpu_id = capture.gpu_id
+            for ib_index in range(len(submit.ibs)):
+                dwords = submit.getIbDwords(ib_index)
+                self.assertIsNotNone(dwords)
+                lines = self._checkAgainstReference(dwords, gpu_id)
+                self.assertTrue(any(line.startswith('R ') for line in lines))
+                self.assertTrue(any(line.startswith('F ') for line in lines))
+
+    def testSyntheticIb(self):
+        depth_cntl = pm4_info.REG_OFFSETS['RB_DEPTH_CNTL']
+        depth_base = pm4_info.REG_OFFSETS['RB_DEPTH_BUFFER_BASE']
+        dwords = (_pkt4(depth_cntl, [0x1234]) +
+                  _pkt4(depth_base, [0x89abc000, 0x5]) +
+                  [2 << 28] +
+                  _pkt7(pm4_info.OPCODES['CP_CONTEXT_REG_BUNCH'],
+                        [depth_base, 0x1000, depth_base + 1, 0x7, 0xfbff, 0x42]) +
+                  _pkt7(pm4_info.OPCODES['CP_NOP'], [0, 0]))
+        for gpu_id in (640, 740):
+            lines = self._checkAgainstReference(dwords, gpu_id)
+            self.assertEqual(sum(line.startswith('P ') for line in lines), 5)
+            self.assertIn('R 3 0x%x RB_DEPTH_BUFFER_BASE 0x589abc000' % depth_base, lines)
+            self.assertIn('R 8 0x%x RB_DEPTH_BUFFER_BASE 0x700001000' % depth_base, lines)
+            self.assertIn('R 12 0xfbff ? 0x42', lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
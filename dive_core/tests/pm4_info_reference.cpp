@@ -0,0 +1,139 @@
+/*
+ Copyright 2025 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+// Reference decoder for pm4_info_py_test.py: decodes an IB with the C++ pm4_info tables, one
+// packet, register write or register field per line, in the same format the test prints the
+// columns of decodeIb() from the generated pm4_info.py.
+//
+// Usage: pm4_info_reference <gpu id> <file of little-endian IB dwords>
+
+#include <cinttypes>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <fstream>
+#include <iterator>
+#include <vector>
+
+#include "pm4_info.h"
+
+namespace
+{
+
+struct RegWrite
+{
+    uint32_t m_packet;
+    uint32_t m_dword;
+    uint32_t m_offset;
+    uint64_t m_value;
+};
+
+}  // namespace
+
+int main(int argc, char **argv)
+{
+    if (argc != 3)
+    {
+        fprintf(stderr, "%s <gpu id> <ib file>\n", argv[0]);
+        return 1;
+    }
+    SetGPUID(static_cast<uint32_t>(strtoul(argv[1], nullptr, 0)));
+
+    std::ifstream file(argv[2], std::ios::binary);
+    std::vector<char> bytes((std::istreambuf_iterator<char>(file)),
+                            std::istreambuf_iterator<char>());
+    if (!file.good() && !file.eof())
+    {
+        fprintf(stderr, "%s: cannot read %s\n", argv[0], argv[2]);
+        return 1;
+    }
+    std::vector<uint32_t> dwords(bytes.size() / sizeof(uint32_t));
+    memcpy(dwords.data(), bytes.data(), dwords.size() * sizeof(uint32_t));
+
+    // Packets. Unlike EmulatePM4, the header parity bits are not checked
+    std::vector<RegWrite> writes;
+    uint32_t packet = 0;
+    for (size_t index = 0; index < dwords.size(); ++packet)
+    {
+        uint32_t header = dwords[index];
+        uint32_t type = header >> 28;
+        uint32_t count;
+        if (type == 4)
+            count = header & 0x7f;
+        else if (type == 7)
+            count = header & 0x7fff;
+        else if (type == 2)
+            count = 0;
+        else
+            break;
+        if (index + 1 + count > dwords.size()) break;
+
+        if (type == 7)
+        {
+            uint32_t opcode = (header >> 16) & 0x7f;
+            const char *name = GetOpCodeString(opcode);
+            printf("P %zu %u %s %u\n", index, type, name ? name : "?", count);
+            if (name && strcmp(name, "CP_CONTEXT_REG_BUNCH") == 0)
+            {
+                for (uint32_t pair = 0; pair + 1 < count; pair += 2)
+                {
+                    uint32_t dword = static_cast<uint32_t>(index + 1 + pair);
+                    writes.push_back({packet, dword + 1, dwords[dword], dwords[dword + 1]});
+                }
+            }
+        }
+        else
+        {
+            printf("P %zu %u - %u\n", index, type, count);
+            uint32_t offset = (header >> 8) & 0x7ffff;
+            for (uint32_t i = 0; type == 4 && i < count; ++i)
+            {
+                uint32_t dword = static_cast<uint32_t>(index + 1 + i);
+                writes.push_back({packet, dword, offset + i, dwords[dword]});
+            }
+        }
+        index += 1 + count;
+    }
+
+    // Register writes. A 64-bit register takes its upper dword from the next write of the same
+    // packet, if that write is to the next offset
+    for (size_t i = 0; i < writes.size(); ++i)
+    {
+        const RegWrite &write = writes[i];
+        const RegInfo *info = GetRegInfo(write.m_offset);
+        uint64_t value = write.m_value;
+        if (info && info->m_is_64_bit && i + 1 < writes.size() &&
+            writes[i + 1].m_packet == write.m_packet &&
+            writes[i + 1].m_offset == write.m_offset + 1)
+        {
+            value |= writes[i + 1].m_value << 32;
+        }
+        printf("R %u 0x%x %s 0x%" PRIx64 "\n", write.m_dword, write.m_offset,
+               info ? info->m_name : "?", value);
+        if (!info) continue;
+        for (const RegField &field : info->m_fields)
+        {
+            uint64_t field_value = ((value & field.m_mask) >> field.m_shift) << field.m_shr;
+            const char *enum_string = nullptr;
+            if (field_value <= UINT32_MAX)
+                enum_string =
+                    GetEnumString(field.m_enum_handle, static_cast<uint32_t>(field_value));
+            printf("F %s 0x%" PRIx64 " %s\n", field.m_name, field_value,
+                   enum_string ? enum_string : "-");
+        }
+    }
+    return 0;
+}
@@ -0,0 +1,158 @@
+/*
+ Copyright 2026 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+// Compares populating an EventStateInfo one element and one field at a time (Add + Set) against
+// the bulk APIs (AddN + Fill/Scatter, CopyRange), and checks that both produce the same state.
+
+#include <chrono>
+#include <cstring>
+#include <iostream>
+#include <vector>
+
+#include "dive_core/event_state.h"
+#include "gtest/gtest.h"
+
+namespace Dive
+{
+namespace
+{
+
+constexpr uint32_t kNumEvents = 200000;
+
+double ElapsedMs(std::chrono::steady_clock::time_point start)
+{
+    return std::chrono::duration<double, std::milli>(std::chrono::steady_clock::now() - start)
+        .count();
+}
+
+VkViewport MakeViewport(uint32_t i)
+{
+    return {static_cast<float>(i % 64), 0.0f, 1920.0f, 1080.0f, 0.0f, 1.0f};
+}
+
+void PopulateElementWise(EventStateInfo& events)
+{
+    for (uint32_t i = 0; i < kNumEvents; ++i)
+    {
+        auto it = events.Add();
+        it->SetTopology(VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST);
+        it->SetDepthTestEnabled(true);
+        it->SetLineWidth(1.0f);
+        it->SetViewport(0, MakeViewport(i));
+        it->SetResolveBaseSysmem(0x100000000ull + i);
+    }
+}
+
+void PopulateBulk(EventStateInfo& events)
+{
+    std::vector<EventStateId> ids(kNumEvents);
+    std::vector<VkViewport> viewports(kNumEvents);
+    std::vector<uint64_t> resolve_bases(kNumEvents);
+    for (uint32_t i = 0; i < kNumEvents; ++i)
+    {
+        ids[i] = EventStateId(i);
+        viewports[i] = MakeViewport(i);
+        resolve_bases[i] = 0x100000000ull + i;
+    }
+
+    EventStateId first = events.AddN(kNumEvents)->id();
+    events.FillTopology(first, kNumEvents, VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST);
+    events.FillDepthTestEnabled(first, kNumEvents, true);
+    events.FillLineWidth(first, kNumEvents, 1.0f);
+    events.ScatterViewport(ids.data(), ids.size(), 0, viewports.data());
+    events.ScatterResolveBaseSysmem(ids.data(), ids.size(), resolve_bases.data());
+}
+
+void ExpectSameEvents(const EventStateInfo& a, const EventStateInfo& b)
+{
+    ASSERT_EQ(a.size(), b.size());
+    for (uint32_t i = 0; i < a.size(); ++i)
+    {
+        EventStateId id(i);
+        ASSERT_EQ(a.Topology(id), b.Topology(id));
+        ASSERT_EQ(a.DepthTestEnabled(id), b.DepthTestEnabled(id));
+        ASSERT_EQ(a.IsDepthTestEnabledSet(id), b.IsDepthTestEnabledSet(id));
+        ASSERT_EQ(a.IsDepthWriteEnabledSet(id), b.IsDepthWriteEnabledSet(id));
+        ASSERT_EQ(a.LineWidth(id), b.LineWidth(id));
+        ASSERT_EQ(memcmp(a.ViewportPtr(id), b.ViewportPtr(id), sizeof(VkViewport) * 16), 0);
+        ASSERT_EQ(a.IsViewportSet(id, 0), b.IsViewportSet(id, 0));
+        ASSERT_EQ(a.IsViewportSet(id, 1), b.IsViewportSet(id, 1));
+        ASSERT_EQ(a.ResolveBaseSysmem(id), b.ResolveBaseSysmem(id));
+    }
+}
+
+TEST(SoaBulkBenchmark, ElementWiseVsBulkPopulation)
+{
+    EventStateInfo element_wise;
+    auto start = std::chrono::steady_clock::now();
+    PopulateElementWise(element_wise);
+    double element_wise_ms = ElapsedMs(start);
+
+    EventStateInfo bulk;
+    start = std::chrono::steady_clock::now();
+    PopulateBulk(bulk);
+    double bulk_ms = ElapsedMs(start);
+
+    // Copying every element of one object into another
+    EventStateInfo element_wise_copy;
+    start = std::chrono::steady_clock::now();
+    for (uint32_t i = 0; i < kNumEvents; ++i) *element_wise_copy.Add() = bulk[EventStateId(i)];
+    double element_wise_copy_ms = ElapsedMs(start);
+
+    EventStateInfo bulk_copy;
+    start = std::chrono::steady_clock::now();
+    bulk_copy.AddN(kNumEvents);
+    bulk_copy.CopyRange(EventStateId(0), bulk, EventStateId(0), kNumEvents);
+    double bulk_copy_ms = ElapsedMs(start);
+
+    std::cout << "EventStateInfo population (" << kNumEvents << " events): element-wise "
+              << element_wise_ms << " ms, bulk " << bulk_ms << " ms" << std::endl;
+    std::cout << "EventStateInfo copy (" << kNumEvents << " events): element-wise "
+              << element_wise_copy_ms << " ms, CopyRange " << bulk_copy_ms << " ms" << std::endl;
+
+    ExpectSameEvents(element_wise, bulk);
+    ExpectSameEvents(bulk, bulk_copy);
+}
+
+TEST(SoaBulkBenchmark, GatherAndOverlappingCopy)
+{
+    EventStateInfo events;
+    PopulateElementWise(events);
+
+    std::vector<EventStateId> ids = {EventStateId(7), EventStateId(3), EventStateId(1000)};
+    std::vector<uint64_t> resolve_bases(ids.size());
+    events.GatherResolveBaseSysmem(ids.data(), ids.size(), resolve_bases.data());
+    for (size_t i = 0; i < ids.size(); ++i)
+        EXPECT_EQ(resolve_bases[i], events.ResolveBaseSysmem(ids[i]));
+
+    // Shift elements [0, 100) up by 3, overlapping the source range
+    events.SetDepthWriteEnabled(EventStateId(5), false);
+    events.CopyRange(EventStateId(3), events, EventStateId(0), 100);
+    EXPECT_EQ(events.ResolveBaseSysmem(EventStateId(3)), 0x100000000ull);
+    EXPECT_EQ(events.ResolveBaseSysmem(EventStateId(102)), 0x100000000ull + 99);
+    EXPECT_TRUE(events.IsDepthWriteEnabledSet(EventStateId(8)));
+    EXPECT_FALSE(events.IsDepthWriteEnabledSet(EventStateId(5)));
+
+    // Elements added after Clear start with no fields set
+    events.Clear();
+    auto it = events.AddN(10);
+    EXPECT_EQ(events.size(), 10u);
+    EXPECT_FALSE(it->IsDepthTestEnabledSet());
+    EXPECT_EQ(it->ResolveBaseSysmem(), 0u);
+}
+
+}  // namespace
+}  // namespace Dive
@@ -0,0 +1,132 @@
+/*
+ Copyright 2026 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#include "dive_core/soa_columns.h"
+
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <iterator>
+#include <vector>
+
+#include "dive_core/event_state.h"
+#include "gtest/gtest.h"
+
+namespace Dive
+{
+namespace
+{
+
+std::string SnapshotPath(const char* name)
+{
+    return (std::filesystem::temp_directory_path() / name).string();
+}
+
+void FillEvents(EventStateInfo& events, uint32_t count)
+{
+    for (uint32_t i = 0; i < count; ++i)
+    {
+        auto it = events.Add();
+        it->SetTopology(VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP);
+        if (i % 3 == 0) it->SetDepthTestEnabled(true);
+        VkViewport viewport = {static_cast<float>(i), 0.0f, 640.0f, 480.0f, 0.0f, 1.0f};
+        it->SetViewport(i % 16, viewport);
+        it->SetBlendConstant(i % 4, 0.5f);
+        it->SetResolveBaseSysmem(0x100000000ull + i);
+    }
+}
+
+TEST(SoaColumns, SaveLoadRoundTrip)
+{
+    EventStateInfo events;
+    FillEvents(events, 1000);
+    std::string path = SnapshotPath("soa_columns_round_trip.bin");
+    ASSERT_TRUE(events.SaveColumns(path.c_str()));
+
+    EventStateInfo loaded;
+    ASSERT_TRUE(loaded.LoadColumns(path.c_str()));
+    ASSERT_EQ(loaded.size(), events.size());
+    for (uint32_t i = 0; i < events.size(); ++i)
+    {
+        EventStateId id(i);
+        EXPECT_EQ(loaded.Topology(id), events.Topology(id));
+        EXPECT_EQ(loaded.DepthTestEnabled(id), events.DepthTestEnabled(id));
+        EXPECT_EQ(loaded.IsDepthTestEnabledSet(id), events.IsDepthTestEnabledSet(id));
+        EXPECT_EQ(loaded.IsDepthWriteEnabledSet(id), events.IsDepthWriteEnabledSet(id));
+        EXPECT_EQ(memcmp(loaded.ViewportPtr(id), events.ViewportPtr(id), sizeof(VkViewport) * 16),
+                  0);
+        EXPECT_EQ(loaded.IsViewportSet(id, i % 16), events.IsViewportSet(id, i % 16));
+        EXPECT_EQ(loaded.BlendConstant(id, i % 4), events.BlendConstant(id, i % 4));
+        EXPECT_EQ(loaded.ResolveBaseSysmem(id), events.ResolveBaseSysmem(id));
+    }
+
+    // The loaded object can keep growing
+    auto it = loaded.Add();
+    EXPECT_FALSE(it->IsDepthTestEnabledSet());
+    std::filesystem::remove(path);
+}
+
+TEST(SoaColumns, SaveLoadEmpty)
+{
+    EventStateInfo events;
+    std::string path = SnapshotPath("soa_columns_empty.bin");
+    ASSERT_TRUE(events.SaveColumns(path.c_str()));
+
+    EventStateInfo loaded;
+    FillEvents(loaded, 10);
+    ASSERT_TRUE(loaded.LoadColumns(path.c_str()));
+    EXPECT_TRUE(loaded.empty());
+    std::filesystem::remove(path);
+}
+
+TEST(SoaColumns, RejectsMismatchedSnapshots)
+{
+    EventStateInfo events;
+    FillEvents(events, 100);
+    std::string path = SnapshotPath("soa_columns_mismatch.bin");
+    ASSERT_TRUE(events.SaveColumns(path.c_str()));
+
+    std::vector<char> snapshot;
+    {
+        std::ifstream file(path, std::ios::binary);
+        snapshot.assign(std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>());
+    }
+    std::filesystem::remove(path);
+
+    EventStateInfo loaded;
+    ASSERT_TRUE(loaded.LoadColumns(snapshot.data(), snapshot.size()));
+    EXPECT_EQ(loaded.size(), 100u);
+
+    // Written for another version of event_state.json
+    std::vector<char> other_spec = snapshot;
+    reinterpret_cast<SoaColumnsHeader*>(other_spec.data())->m_spec_hash ^= 1;
+    EXPECT_FALSE(loaded.LoadColumns(other_spec.data(), other_spec.size()));
+    EXPECT_TRUE(loaded.empty());
+
+    // Different layout of a column
+    std::vector<char> other_schema = snapshot;
+    other_schema[sizeof(SoaColumnsHeader)] = 'X';
+    EXPECT_FALSE(loaded.LoadColumns(other_schema.data(), other_schema.size()));
+
+    // Truncated
+    EXPECT_FALSE(loaded.LoadColumns(snapshot.data(), snapshot.size() - 1));
+    EXPECT_FALSE(loaded.LoadColumns(snapshot.data(), sizeof(SoaColumnsHeader) - 1));
+
+    EXPECT_FALSE(loaded.LoadColumns(SnapshotPath("soa_columns_missing.bin").c_str()));
+}
+
+}  // namespace
+}  // namespace Dive
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+#
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Checks that the dive_core_py structure-of-array bindings expose columns as views of the
+object's buffer rather than copies. Run by CTest, which sets:
+    DIVE_CORE_PY_DIR  directory of the dive_core_py module
+"""
+
+import gc
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.environ['DIVE_CORE_PY_DIR'])
+
+import dive_core_py  # noqa: E402
+
+NUM_EVENTS = 1000
+COLUMNS = ('Topology', 'DepthTestEnabled', 'Viewport', 'Attachment')
+
+
+def _address(array):
+    return array.__array_interface__['data'][0]
+
+
+class SoaPyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.soa = dive_core_py.EventStateInfo()
+        self.assertEqual(self.soa.AddN(NUM_EVENTS), 0)
+
+    def testColumnsViewBuffer(self):
+        self.assertEqual(len(self.soa), NUM_EVENTS)
+        buffer = self.soa.Buffer
+        self.assertGreaterEqual(len(buffer), NUM_EVENTS)
+        for name in COLUMNS:
+            column = getattr(self.soa, name)
+            self.assertEqual(column.shape[0], NUM_EVENTS, name)
+            self.assertFalse(column.flags.owndata, name)
+            self.assertFalse(column.flags.writeable, name)
+            self.assertTrue(np.shares_memory(column, buffer), name)
+            offset = _address(column) - _address(buffer)
+            self.assertTrue(0 <= offset < buffer.nbytes, name)
+            # Reading a column twice gives two views of the same memory
+            self.assertEqual(_address(getattr(self.soa, name)), _address(column), name)
+
+    def testStructColumns(self):
+        viewport = self.soa.Viewport
+        self.assertEqual(viewport.ndim, 2)
+        self.assertIn('minDepth', viewport.dtype.names)
+        np.testing.assert_array_equal(viewport['width'], 0)
+        attachment = self.soa.Attachment
+        self.assertIn('colorWriteMask', attachment.dtype.names)
+        # Elements of an array field are contiguous, and elements of a column follow each other
+        self.assertEqual(attachment.strides, (attachment.shape[1] * attachment.itemsize,
+                                              attachment.itemsize))
+
+    def testIsSetBuffer(self):
+        is_set = self.soa.IsSetBuffer
+        self.assertFalse(is_set.flags.owndata)
+        self.assertEqual(len(is_set), (NUM_EVENTS * self.soa.NumFields + 7) // 8)
+        self.assertEqual(_address(self.soa.IsSetBuffer), _address(is_set))
+        bits = np.unpackbits(is_set, bitorder='little')
+        depth_test_set = bits[self.soa.FieldIndex['DepthTestEnabled']::self.soa.NumFields]
+        self.assertEqual(len(depth_test_set), NUM_EVENTS)
+        self.assertFalse(depth_test_set.any())
+
+    def testViewsKeepObjectAlive(self):
+        column = self.soa.Topology
+        owner = column
+        while isinstance(owner, np.ndarray):
+            owner = owner.base
+        self.assertIs(owner, self.soa)
+        del self.soa, owner
+        gc.collect()
+        np.testing.assert_array_equal(column, 0)
+
+    def testClear(self):
+        self.soa.Clear()
+        self.assertEqual(len(self.soa), 0)
+        self.assertEqual(len(self.soa.Topology), 0)
+        self.assertEqual(self.soa.AddN(3), 0)
+        self.assertEqual(len(self.soa.DepthTestEnabled), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -52,7 +52,7 @@ std::optional<std::vector<DumpEntry>> FindDumpableResources(const char* filename
     return complete_dump_entries;
 }
 
-bool SaveAsJsonFile(const std::vector<DumpEntry>& dumpables, const char* filename)
+bool SaveAsJsonFile(const std::vector<DumpEntry>& dumpables, const char* filename, int dump_threads)
 {
     std::ofstream out(filename);
     if (!out.good() || !out.is_open())
@@ -70,7 +70,14 @@ bool SaveAsJsonFile(const std::vector<DumpEntry>& dumpables, const char* filenam
     // default, only the left eye is dumped since it's the first image layer is dumped. To get both
     // left and right eyes we need to dump all layers; DumpAllImageSubresources instructs GFXR to do
     // so.
-    out << "    \"DumpAllImageSubresources\": true\n";
+    out << "    \"DumpAllImageSubresources\": true";
+    // Dumping every render target of every draw is bound by image encoding and file writes when
+    // they are done on the replay thread.
+    if (dump_threads > 0)
+    {
+        out << ",\n    \"DumpThreads\": " << dump_threads;
+    }
+    out << '\n';
     out << "  },\n";
 
     out << "  \"BeginCommandBuffer\": [";
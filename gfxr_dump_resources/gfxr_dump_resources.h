@@ -31,7 +31,11 @@ std::optional<std::vector<DumpEntry>> FindDumpableResources(const char* filename
 
 // Serialize a list of complete dumpable to a JSON file.
 //
+// If `dump_threads` is not 0, GFXR encodes and writes the dumped resources on that many worker
+// threads while replay continues, instead of on the replay thread.
+//
 // Returns false on error.
-bool SaveAsJsonFile(const std::vector<DumpEntry>& dumpables, const char* filename);
+bool SaveAsJsonFile(const std::vector<DumpEntry>& dumpables, const char* filename,
+                    int dump_threads = 0);
 
 }  // namespace Dive::gfxr
\ No newline at end of file
@@ -28,6 +28,9 @@
 ABSL_FLAG(bool, last_draw_only, false,
           "If specified, only dump the final draw call for a render pass. This should speed up "
           "dumping while still providing a useful result.");
+ABSL_FLAG(int, dump_threads, 0,
+          "If specified, the number of threads GFXR uses during replay to encode and write the "
+          "dumped resources, so that replay is not blocked on image encoding and file writes.");
 
 namespace
 {
@@ -81,7 +84,7 @@ int main(int argc, char** argv)
         }
     }
 
-    if (!SaveAsJsonFile(*dumpables, output_filename))
+    if (!SaveAsJsonFile(*dumpables, output_filename, absl::GetFlag(FLAGS_dump_threads)))
     {
         std::cerr << "Failed to serialize to " << output_filename << '\n';
         return 1;
@@ -23,15 +23,52 @@
 #include "util/logging.h"
 #include "util/output_stream.h"
 
+DiveAnnotationProcessor::VulkanCommandInfo::VulkanCommandInfo(
+    const gfxrecon::util::DiveFunctionData& data, gfxrecon::util::DiveArgsArena& arena)
+    : name(data.GetFunctionName()), index(data.GetCmdBufferIndex())
+{
+    if (data.HasEncodedArgs())
+    {
+        const gfxrecon::util::DiveEncodedArgs& args = data.GetEncodedArgs();
+        encoded_args = gfxrecon::util::DiveEncodedArgs(
+            args.GetSchema(), arena.Store(args.GetData(), args.GetSize()), args.GetSize());
+    }
+    else
+    {
+        json_args = data.GetArgs();
+    }
+}
+
+nlohmann::ordered_json DiveAnnotationProcessor::VulkanCommandInfo::GetArgs() const
+{
+    if (encoded_args.IsValid())
+    {
+        return encoded_args.ToJson();
+    }
+    return json_args;
+}
+
+nlohmann::ordered_json DiveAnnotationProcessor::VulkanCommandInfo::GetArg(
+    std::string_view arg_name) const
+{
+    if (encoded_args.IsValid())
+    {
+        return encoded_args.ArgToJson(arg_name);
+    }
+    auto it = json_args.find(arg_name);
+    return it != json_args.end() ? *it : nlohmann::ordered_json();
+}
+
 void DiveAnnotationProcessor::WriteBlockEnd(const gfxrecon::util::DiveFunctionData& function_data)
 {
-    std::string function_name = function_data.GetFunctionName();
-    const auto& args = function_data.GetArgs();
+    const std::string& function_name = function_data.GetFunctionName();
 
     if (function_name == "vkQueueSubmit" || function_name == "vkQueueSubmit2")
     {
         std::unique_ptr<SubmitInfo> submit_ptr = std::make_unique<SubmitInfo>(function_name);
 
+        // Submits are rare enough that decoding all their args is not a concern
+        const auto args = function_data.GetArgs();
         if (args.count("submitCount"))
         {
             const auto& submits = args["pSubmits"];
@@ -52,11 +89,13 @@ void DiveAnnotationProcessor::WriteBlockEnd(const gfxrecon::util::DiveFunctionDa
     }
     else
     {
-        VulkanCommandInfo vkCmd(function_data);
-        if (args.count("commandBuffer") != 0)
+        VulkanCommandInfo vkCmd(function_data, m_args_arena);
+        vkCmd.command_index = GetCommandCount();
+        m_command_index.push_back({std::nullopt, function_data.GetBlockIndex(),
+                                   function_data.GetCmdBufferIndex(), function_data.GetCallId()});
+        uint64_t cmd_handle = 0;
+        if (function_data.GetUInt64Arg("commandBuffer", &cmd_handle))
         {
-            uint64_t cmd_handle = args["commandBuffer"];
-
             if (vkCmd.name.find("vkBeginCommandBuffer") != std::string::npos)
             {
                 m_cmd_vk_commands_cache[cmd_handle].clear();
@@ -67,9 +106,10 @@ void DiveAnnotationProcessor::WriteBlockEnd(const gfxrecon::util::DiveFunctionDa
                 m_draw_call_counts_map[cmd_handle].render_pass_draw_call_counts.push_back(0);
             }
 
-            m_cmd_vk_commands_cache[cmd_handle].push_back(vkCmd);
+            const bool is_draw = vkCmd.name.find("vkCmdDraw") != std::string::npos;
+            m_cmd_vk_commands_cache[cmd_handle].push_back(std::move(vkCmd));
 
-            if (vkCmd.name.find("vkCmdDraw") != std::string::npos)
+            if (is_draw)
             {
                 m_draw_call_counts_map[cmd_handle].begin_command_buffer_draw_call_count++;
                 if (!m_draw_call_counts_map[cmd_handle].render_pass_draw_call_counts.empty())
@@ -80,7 +120,7 @@ void DiveAnnotationProcessor::WriteBlockEnd(const gfxrecon::util::DiveFunctionDa
         }
         else
         {
-            m_none_cmd_vk_commands_per_submit_cache.push_back(vkCmd);
+            m_none_cmd_vk_commands_per_submit_cache.push_back(std::move(vkCmd));
         }
     }
 }
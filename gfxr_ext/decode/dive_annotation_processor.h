@@ -16,9 +16,11 @@
 #include <cstdint>
 #include <optional>
 #include <string>
+#include <string_view>
 
 #include "decode/annotation_handler.h"
 #include "util/defines.h"
+#include "util/dive_args_encoding.h"
 #include "util/platform.h"
 
 // The DiveAnnotationProcessor is used by the VulkanExportDiveConsumer on each WriteBlockEnd call
@@ -26,19 +28,37 @@
 // (name, command buffer index, args) and then DiveAnnotationProcessor converts the data to
 // SubmitInfo for vkQueueSubmits or VulkanCommandInfo for vulkan commands. These structs are then
 // used to construct the command hierarchy displayed in the Dive UI.
+//
+// The args of commands recorded by the generated consumer arrive in a compact binary encoding. They
+// are copied into an arena owned by the processor and only decoded to JSON when GetArgs is called,
+// so the arena (see TakeArgsArena) must outlive the VulkanCommandInfos.
 class DiveAnnotationProcessor : public gfxrecon::decode::AnnotationHandler
 {
  public:
     struct VulkanCommandInfo
     {
-        explicit VulkanCommandInfo(const gfxrecon::util::DiveFunctionData& data)
-            : args(data.GetArgs()), name(data.GetFunctionName()), index(data.GetCmdBufferIndex())
-        {
-        }
+        VulkanCommandInfo(const gfxrecon::util::DiveFunctionData& data,
+                          gfxrecon::util::DiveArgsArena& arena);
+
+        // Returns the args as JSON. Encoded args are decoded on every call, so callers that need
+        // them more than once should keep the result.
+        nlohmann::ordered_json GetArgs() const;
+        // Returns a single arg as JSON, or null if the command has no arg of that name
+        nlohmann::ordered_json GetArg(std::string_view arg_name) const;
+
+        // Whether some args were deferred by the consumer and have to be decoded again from the
+        // block of the command (see DiveCommandDecoder)
+        bool HasDeferredArgs() const { return encoded_args.HasDeferredArgs(); }
 
-        nlohmann::ordered_json args;
         std::string name = "";
         uint32_t index = 0;
+        // Number of the command among all the commands seen by the processor, in capture order.
+        // Also its position in the command index (see TakeCommandIndex).
+        uint32_t command_index = 0;
+        // Args of commands from the generated consumer, stored in the processor's arena
+        gfxrecon::util::DiveEncodedArgs encoded_args;
+        // Args of the other commands
+        nlohmann::ordered_json json_args;
     };
 
     struct SubmitInfo
@@ -53,6 +73,22 @@ class DiveAnnotationProcessor : public gfxrecon::decode::AnnotationHandler
         std::string name = "";
     };
 
+    // Compact record of where a command is in the capture, enough to decode it again from the
+    // capture file without keeping its args
+    struct CommandIndexEntry
+    {
+        // Offset of the block of the command in the capture file. The processor does not know it,
+        // the owner of the block data fills it in. Stays unset for a block read from an asset file
+        // (.gfxa), which cannot be decoded again.
+        std::optional<uint64_t> block_offset;
+        // Index of the block of the command, i.e. of its call
+        uint64_t block_index = 0;
+        // Index of the command in its command buffer
+        uint32_t cmd_buffer_index = 0;
+        // Id of the command, or ApiCall_Unknown for commands without an args schema
+        gfxrecon::format::ApiCallId call_id = gfxrecon::format::ApiCallId::ApiCall_Unknown;
+    };
+
     struct DrawCallCounts
     {
         // Total draw count for a single command buffer
@@ -82,6 +118,12 @@ class DiveAnnotationProcessor : public gfxrecon::decode::AnnotationHandler
     {
         return std::move(m_draw_call_counts_map);
     }
+    gfxrecon::util::DiveArgsArena TakeArgsArena() { return std::move(m_args_arena); }
+    // One entry per VulkanCommandInfo created, by command_index, including the ones of command
+    // buffers that were recorded again and are no longer kept
+    std::vector<CommandIndexEntry> TakeCommandIndex() { return std::move(m_command_index); }
+    // Number of VulkanCommandInfos created so far
+    uint32_t GetCommandCount() const { return static_cast<uint32_t>(m_command_index.size()); }
 
  private:
     // This is a per submit cache that keeps all vk commands that are not in any command buffer
@@ -90,4 +132,7 @@ class DiveAnnotationProcessor : public gfxrecon::decode::AnnotationHandler
     std::unordered_map<uint64_t, std::vector<VulkanCommandInfo>> m_cmd_vk_commands_cache;
     std::unordered_map<uint64_t, DrawCallCounts> m_draw_call_counts_map;
     std::vector<std::unique_ptr<SubmitInfo>> m_submits;
+    // Backing storage for the encoded args of every VulkanCommandInfo
+    gfxrecon::util::DiveArgsArena m_args_arena;
+    std::vector<CommandIndexEntry> m_command_index;
 };
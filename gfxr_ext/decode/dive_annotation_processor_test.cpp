@@ -31,7 +31,7 @@ MATCHER_P3(VulkanCommandInfoEqual, expected_name, expected_index, expected_args,
 {
     EXPECT_EQ(arg.name, expected_name);
     EXPECT_EQ(arg.index, expected_index);
-    EXPECT_EQ(arg.args, expected_args);
+    EXPECT_EQ(arg.GetArgs(), expected_args);
     return true;
 }
 
@@ -164,6 +164,20 @@ TEST(WriteBlockEndTest, MultipleSubmitsWithCommandsCreatesSubmitsWithCorrectComm
                 VulkanCommandInfoEqual(cmd_data_6.GetFunctionName(), 1, args_cmd_6));
     EXPECT_THAT(vk_commands_cache[1002][2],
                 VulkanCommandInfoEqual(cmd_data_7.GetFunctionName(), 0, args_cmd_7));
+
+    // The commands are numbered in capture order, submits excluded
+    EXPECT_EQ(vk_commands_cache[1001][3].command_index, 3u);
+    EXPECT_EQ(vk_commands_cache[1002][0].command_index, 4u);
+    EXPECT_EQ(vk_commands_cache[1002][0].GetArg("commandBuffer"), 1002);
+    EXPECT_EQ(processor.GetCommandCount(), 7u);
+
+    // The command index locates every command, JSON args have no call id
+    auto command_index = processor.TakeCommandIndex();
+    ASSERT_THAT(command_index, SizeIs(7));
+    EXPECT_EQ(command_index[4].block_index, 6u);
+    EXPECT_EQ(command_index[4].cmd_buffer_index, 0u);
+    EXPECT_FALSE(command_index[4].block_offset.has_value());
+    EXPECT_EQ(command_index[4].call_id, gfxrecon::format::ApiCallId::ApiCall_Unknown);
 }
 
 TEST(WriteBlockEndTest,
@@ -351,5 +365,117 @@ TEST(WriteBlockEndTest, DrawCallsAreCorrectlyCountedInMultipleRenderPasses)
                 testing::ElementsAre(2, 3));
 }
 
+void HandleArgToJson(nlohmann::ordered_json& jdata, const uint8_t* data,
+                     const gfxrecon::util::JsonOptions& options)
+{
+    jdata = gfxrecon::util::ReadDiveArg<uint64_t>(data);
+}
+
+void UInt32ArgToJson(nlohmann::ordered_json& jdata, const uint8_t* data,
+                     const gfxrecon::util::JsonOptions& options)
+{
+    jdata = gfxrecon::util::ReadDiveArg<uint32_t>(data);
+}
+
+const gfxrecon::util::DiveArgSchema kDrawArgs[] = {
+    {"commandBuffer", sizeof(uint64_t), HandleArgToJson},
+    {"vertexCount", sizeof(uint32_t), UInt32ArgToJson},
+    {"pData", 0, nullptr},
+};
+const gfxrecon::util::DiveCommandSchema kDrawSchema = {
+    "vkCmdDraw", gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw, kDrawArgs, std::size(kDrawArgs)};
+
+const gfxrecon::util::DiveArgSchema kSubmitArgs[] = {
+    {"queue", sizeof(uint64_t), HandleArgToJson},
+    {"submitCount", sizeof(uint32_t), UInt32ArgToJson},
+    {"pSubmits", 0, nullptr},
+};
+const gfxrecon::util::DiveCommandSchema kSubmitSchema = {
+    "vkQueueSubmit", gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit, kSubmitArgs,
+    std::size(kSubmitArgs)};
+
+TEST(WriteBlockEndTest, EncodedArgsAreKeptAndDecodedOnRequest)
+{
+    DiveAnnotationProcessor processor;
+    gfxrecon::util::DiveArgsEncoder encoder;
+
+    encoder.Write(uint64_t{1001});
+    encoder.Write(uint32_t{3});
+    encoder.BeginJson() = {1, 2, 3};
+    encoder.EndJson();
+    processor.WriteBlockEnd(gfxrecon::util::DiveFunctionData(kDrawSchema, /*cmd_buffer_index=*/1,
+                                                             /*block_index=*/7, encoder));
+
+    // The encoder is reused for the next command, so the processor must have copied the args
+    encoder.Reset();
+    encoder.Write(uint64_t{5});
+    encoder.Write(uint32_t{1});
+    encoder.BeginJson() = {{{"commandBufferCount", 1}, {"pCommandBuffers", {1001}}}};
+    encoder.EndJson();
+    processor.WriteBlockEnd(gfxrecon::util::DiveFunctionData(kSubmitSchema, /*cmd_buffer_index=*/0,
+                                                             /*block_index=*/8, encoder));
+
+    auto submits = processor.TakeSubmits();
+    ASSERT_THAT(submits, SizeIs(1));
+    EXPECT_THAT(submits[0]->vk_command_buffer_handles, testing::ElementsAre(1001));
+
+    auto vk_commands_cache = processor.TakeVkCommandsCache();
+    auto args_arena = processor.TakeArgsArena();
+    ASSERT_TRUE(vk_commands_cache.count(1001));
+    ASSERT_THAT(vk_commands_cache[1001], SizeIs(1));
+    const DiveAnnotationProcessor::VulkanCommandInfo& draw = vk_commands_cache[1001][0];
+    EXPECT_TRUE(draw.encoded_args.IsValid());
+    EXPECT_FALSE(draw.HasDeferredArgs());
+    nlohmann::ordered_json expected_args = {
+        {"commandBuffer", 1001}, {"vertexCount", 3}, {"pData", {1, 2, 3}}};
+    EXPECT_THAT(draw, VulkanCommandInfoEqual("vkCmdDraw", 1, expected_args));
+    EXPECT_EQ(args_arena.GetStoredSize(), draw.encoded_args.GetSize());
+    EXPECT_EQ(draw.command_index, 0u);
+    EXPECT_EQ(processor.GetCommandCount(), 1u);
+
+    // Single args are decoded without the others
+    EXPECT_EQ(draw.GetArg("vertexCount"), 3);
+    EXPECT_EQ(draw.GetArg("pData"), nlohmann::ordered_json({1, 2, 3}));
+    EXPECT_TRUE(draw.GetArg("instanceCount").is_null());
+
+    auto draw_counts_map = processor.TakeDrawCallMap();
+    EXPECT_THAT(draw_counts_map.at(1001).begin_command_buffer_draw_call_count, 1);
+}
+
+TEST(WriteBlockEndTest, DeferredArgsAreLeftOut)
+{
+    DiveAnnotationProcessor processor;
+    gfxrecon::util::DiveArgsEncoder encoder;
+
+    encoder.Reset(/*defer_json=*/true);
+    encoder.Write(uint64_t{1001});
+    encoder.Write(uint32_t{3});
+    if (!encoder.DeferJson())
+    {
+        encoder.BeginJson() = {1, 2, 3};
+    }
+    encoder.EndJson();
+    processor.WriteBlockEnd(gfxrecon::util::DiveFunctionData(kDrawSchema, /*cmd_buffer_index=*/1,
+                                                             /*block_index=*/7, encoder));
+
+    auto vk_commands_cache = processor.TakeVkCommandsCache();
+    auto args_arena = processor.TakeArgsArena();
+    ASSERT_TRUE(vk_commands_cache.count(1001));
+    ASSERT_THAT(vk_commands_cache[1001], SizeIs(1));
+    const DiveAnnotationProcessor::VulkanCommandInfo& draw = vk_commands_cache[1001][0];
+    EXPECT_TRUE(draw.HasDeferredArgs());
+    nlohmann::ordered_json expected_args = {{"commandBuffer", 1001}, {"vertexCount", 3}};
+    EXPECT_THAT(draw, VulkanCommandInfoEqual("vkCmdDraw", 1, expected_args));
+    EXPECT_TRUE(draw.GetArg("pData").is_null());
+
+    // The command index has what is needed to decode the deferred args again
+    auto command_index = processor.TakeCommandIndex();
+    ASSERT_THAT(command_index, SizeIs(1));
+    EXPECT_EQ(command_index[draw.command_index].block_index, 7u);
+    EXPECT_EQ(command_index[draw.command_index].cmd_buffer_index, 1u);
+    EXPECT_EQ(command_index[draw.command_index].call_id,
+              gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw);
+}
+
 }  // namespace
 }  // namespace gfxrecon::decode
@@ -22,14 +22,63 @@ limitations under the License.
 #include <memory>
 
 #include "util/logging.h"
+#include "util/platform.h"
+
+#if defined(__linux__)
+#include <sys/sendfile.h>
+#include <unistd.h>
+#endif
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
+namespace
+{
+
+#if defined(__linux__)
+// Copies size bytes at offset in src_fd to the current position of dst_fd without going through
+// user space. Returns the number of bytes copied, which is less than size if the kernel can't copy
+// (e.g. across file systems on older kernels) so that the caller can copy the rest itself.
+uint64_t KernelCopyRange(int src_fd, int dst_fd, uint64_t offset, uint64_t size)
+{
+    // Largest count that sendfile and copy_file_range transfer in one call
+    constexpr uint64_t kMaxKernelCopySize = 0x7ffff000;
+
+    uint64_t copied = 0;
+#if !defined(__ANDROID__)
+    loff_t in_offset = static_cast<loff_t>(offset);
+    while (copied < size)
+    {
+        ssize_t result = copy_file_range(src_fd, &in_offset, dst_fd, nullptr,
+                                         std::min(size - copied, kMaxKernelCopySize), 0);
+        if (result <= 0)
+        {
+            break;
+        }
+        copied += static_cast<uint64_t>(result);
+    }
+#endif
+    off_t sendfile_offset = static_cast<off_t>(offset + copied);
+    while (copied < size)
+    {
+        ssize_t result =
+            sendfile(dst_fd, src_fd, &sendfile_offset, std::min(size - copied, kMaxKernelCopySize));
+        if (result <= 0)
+        {
+            break;
+        }
+        copied += static_cast<uint64_t>(result);
+    }
+    return copied;
+}
+#endif
+
+}  // namespace
+
 bool TestBlockVisitor::Visit(const DiveOriginalBlock& block)
 {
-    std::string descrip = "original, offset:" + std::to_string(block.offset_) +
-                          ", size:" + std::to_string(block.size_);
+    std::string offset = block.offset_.has_value() ? std::to_string(*block.offset_) : "none";
+    std::string descrip = "original, offset:" + offset + ", size:" + std::to_string(block.size_);
     traversed_.push_back(descrip);
     return true;
 }
@@ -50,29 +99,22 @@ std::vector<std::string> TestBlockVisitor::GetTraversedPathString() { return tra
 
 bool WriterBlockVisitor::Visit(const DiveOriginalBlock& block)
 {
-    if (block.size_ == 0)
+    if (!block.offset_.has_value())
     {
-        // Found empty block in original file, presumably a block in the asset file, no need to copy
+        // Block from an asset file, the original file only references it
         return true;
     }
-    if (!util::platform::FileSeek(original_file_ptr_, block.offset_, util::platform::FileSeekSet))
+    if (pending_size_ > 0 && pending_offset_ + pending_size_ == *block.offset_)
     {
-        GFXRECON_LOG_ERROR("Could not seek block at offset %d in original file", block.offset_);
-        return false;
+        pending_size_ += block.size_;
+        return true;
     }
-    uint64_t bytes_left_to_copy = block.size_;
-    while (bytes_left_to_copy > 0)
+    if (!Flush())
     {
-        uint64_t bytes_to_copy = bytes_left_to_copy;
-        if (bytes_left_to_copy > kDiveBlockBufferSize)
-        {
-            bytes_to_copy = kDiveBlockBufferSize;
-        }
-        bytes_left_to_copy -= bytes_to_copy;
-
-        util::platform::FileRead(copy_buffer_, bytes_to_copy, original_file_ptr_);
-        util::platform::FileWrite(copy_buffer_, bytes_to_copy, new_file_ptr_);
+        return false;
     }
+    pending_offset_ = *block.offset_;
+    pending_size_ = block.size_;
     return true;
 }
 
@@ -83,6 +125,10 @@ bool WriterBlockVisitor::Visit(const DiveModificationBlock& block)
         GFXRECON_LOG_ERROR("WriterBlockVisitor encountered empty modification block");
         return false;
     }
+    if (!Flush())
+    {
+        return false;
+    }
     if (!util::platform::FileWrite(block.blob_ptr_->data(), block.blob_ptr_->size(), new_file_ptr_))
     {
         GFXRECON_LOG_ERROR("Writing modified block, could not write to new file");
@@ -91,7 +137,82 @@ bool WriterBlockVisitor::Visit(const DiveModificationBlock& block)
     return true;
 }
 
-bool DiveBlockData::AddOriginalBlock(size_t index, uint64_t offset)
+bool WriterBlockVisitor::Flush()
+{
+    if (pending_size_ == 0)
+    {
+        return true;
+    }
+    bool success = CopyRange(pending_offset_, pending_size_);
+    pending_size_ = 0;
+    return success;
+}
+
+bool WriterBlockVisitor::CopyRange(uint64_t offset, uint64_t size)
+{
+#if defined(__linux__)
+    // Anything written through new_file_ptr_ must reach the file before the kernel appends to it
+    if (fflush(new_file_ptr_) != 0)
+    {
+        GFXRECON_LOG_ERROR("Could not flush new file");
+        return false;
+    }
+    int new_fd = fileno(new_file_ptr_);
+    uint64_t copied = KernelCopyRange(fileno(original_file_ptr_), new_fd, offset, size);
+    if (copied > 0)
+    {
+        // The kernel moved the position of the file descriptor, not the one of the FILE
+        off_t position = lseek(new_fd, 0, SEEK_CUR);
+        if (position < 0 ||
+            !util::platform::FileSeek(new_file_ptr_, position, util::platform::FileSeekSet))
+        {
+            GFXRECON_LOG_ERROR("Could not seek new file after copying %" PRIu64 " bytes", copied);
+            return false;
+        }
+    }
+    offset += copied;
+    size -= copied;
+#endif
+    return CopyRangeBuffered(offset, size);
+}
+
+bool WriterBlockVisitor::CopyRangeBuffered(uint64_t offset, uint64_t size)
+{
+    if (size == 0)
+    {
+        return true;
+    }
+    if (!util::platform::FileSeek(original_file_ptr_, offset, util::platform::FileSeekSet))
+    {
+        GFXRECON_LOG_ERROR("Could not seek block at offset %" PRIu64 " in original file", offset);
+        return false;
+    }
+    if (copy_buffer_.empty())
+    {
+        copy_buffer_.resize(kDiveBlockCopyBufferSize);
+    }
+    uint64_t bytes_left_to_copy = size;
+    while (bytes_left_to_copy > 0)
+    {
+        size_t bytes_to_copy =
+            static_cast<size_t>(std::min<uint64_t>(bytes_left_to_copy, copy_buffer_.size()));
+        bytes_left_to_copy -= bytes_to_copy;
+
+        if (!util::platform::FileRead(copy_buffer_.data(), bytes_to_copy, original_file_ptr_))
+        {
+            GFXRECON_LOG_ERROR("Could not read %zu bytes from original file", bytes_to_copy);
+            return false;
+        }
+        if (!util::platform::FileWrite(copy_buffer_.data(), bytes_to_copy, new_file_ptr_))
+        {
+            GFXRECON_LOG_ERROR("Could not write %zu bytes to new file", bytes_to_copy);
+            return false;
+        }
+    }
+    return true;
+}
+
+bool DiveBlockData::AddOriginalBlock(size_t index, std::optional<uint64_t> offset)
 {
     if (original_blocks_map_locked_)
     {
@@ -111,6 +232,15 @@ bool DiveBlockData::AddOriginalBlock(size_t index, uint64_t offset)
     return true;
 }
 
+std::optional<uint64_t> DiveBlockData::GetOriginalBlockOffset(size_t index) const
+{
+    if (index >= original_blocks_map_.size())
+    {
+        return std::nullopt;
+    }
+    return original_blocks_map_[index]->offset_;
+}
+
 bool DiveBlockData::FinalizeOriginalBlocksMapSizes(uint64_t file_size)
 {
     if (original_blocks_map_locked_)
@@ -124,48 +254,62 @@ bool DiveBlockData::FinalizeOriginalBlocksMapSizes(uint64_t file_size)
         return false;
     }
 
-    // Calculating block size for header (before block id 0)
+    // Calculating block size for header (before the first block stored in the original file)
+    auto first_block_in_file = std::find_if(
+        original_blocks_map_.begin(), original_blocks_map_.end(),
+        [](const std::shared_ptr<DiveOriginalBlock>& block) { return block->offset_.has_value(); });
+    if (first_block_in_file == original_blocks_map_.end())
+    {
+        GFXRECON_LOG_ERROR("Original block map has no block stored in the original file");
+        return false;
+    }
     original_header_block_.offset_ = 0;
-    original_header_block_.size_ = original_blocks_map_[0]->offset_;
+    original_header_block_.size_ = *(*first_block_in_file)->offset_;
 
-    // Calculating block sizes
+    // Calculating block sizes. A block in the original file ends where the next block in the file
+    // starts, or at the end of the file. Blocks from an asset file keep a size of 0.
     std::vector<uint64_t> block_sizes;
     block_sizes.reserve(original_blocks_map_.size());
     uint64_t n_blocks_exceeding_buffer_size = 0;
-    for (size_t i = 0; i < original_blocks_map_.size() - 1; i++)
-    {
-        uint64_t current_block_start = original_blocks_map_[i]->offset_;
-        uint64_t current_block_end = original_blocks_map_[i + 1]->offset_;
-        if (current_block_start > current_block_end)
+    auto set_block_size = [&](size_t id, uint64_t block_end) {
+        DiveOriginalBlock& block = *original_blocks_map_[id];
+        uint64_t block_start = *block.offset_;
+        if (block_start > block_end)
         {
-            GFXRECON_LOG_ERROR("Original block with id (%d) has invalid offsets (%d-%d)", i,
-                               current_block_start, current_block_end);
+            GFXRECON_LOG_ERROR("Original block with id (%d) has invalid offsets (%d-%d)", id,
+                               block_start, block_end);
             return false;
         }
-        uint64_t size = current_block_end - current_block_start;
+        block.size_ = block_end - block_start;
 
         // Gather block data for stats
-        block_sizes.push_back(size);
-        if (size > kDiveBlockBufferSize)
+        block_sizes.push_back(block.size_);
+        if (block.size_ > kDiveBlockBufferSize)
         {
             n_blocks_exceeding_buffer_size++;
         }
+        return true;
+    };
 
-        original_blocks_map_[i]->size_ = size;
+    size_t previous_id = first_block_in_file - original_blocks_map_.begin();
+    for (size_t i = previous_id + 1; i < original_blocks_map_.size(); i++)
+    {
+        if (!original_blocks_map_[i]->offset_.has_value())
+        {
+            continue;
+        }
+        if (!set_block_size(previous_id, *original_blocks_map_[i]->offset_))
+        {
+            return false;
+        }
+        previous_id = i;
     }
-
-    DiveOriginalBlock& last_block = *original_blocks_map_.back();
-    last_block.size_ = file_size - last_block.offset_;
-
-    // Gather last block data for stats
-    block_sizes.push_back(last_block.size_);
-    if (last_block.size_ > kDiveBlockBufferSize)
+    if (!set_block_size(previous_id, file_size))
     {
-        n_blocks_exceeding_buffer_size++;
+        return false;
     }
 
     // Report stats
-    assert(block_sizes.size() == original_blocks_map_.size());
     std::sort(block_sizes.begin(), block_sizes.end());
     uint64_t rough_median = block_sizes[block_sizes.size() / 2];
     GFXRECON_LOG_INFO(
@@ -254,13 +398,21 @@ bool DiveBlockData::TraverseBlocks(BlockVisitor& visitor) const
     // Go through block-by-block in order of primary_id
     for (uint32_t primary_id = 0; primary_id < original_blocks_map_.size(); primary_id++)
     {
-        std::map<int32_t, std::shared_ptr<IDiveBlock>> blocks_to_write = {};
-        if (modifications_map_.count(primary_id) > 0)
+        if (modifications_map_.count(primary_id) == 0)
         {
-            // Copy all the modifications relating to the original block with primary_id
-            blocks_to_write = modifications_map_.at(primary_id);
+            // Most blocks are unmodified, visit them directly
+            if (!original_blocks_map_[primary_id]->Accept(visitor))
+            {
+                GFXRECON_LOG_ERROR("Couldn't write block with ids (%d, %d)", primary_id, 0);
+                return false;
+            }
+            continue;
         }
 
+        // Copy all the modifications relating to the original block with primary_id
+        std::map<int32_t, std::shared_ptr<IDiveBlock>> blocks_to_write =
+            modifications_map_.at(primary_id);
+
         // If there is no modification of the original block, insert a pointer to the original block
         // into the map of blocks ordered by secondary_id
         if (blocks_to_write.count(0) == 0)
@@ -325,7 +477,7 @@ bool DiveBlockData::WriteGFXRFile(const std::string& original_file_path,
         return false;
     }
 
-    if (!TraverseBlocks(writer))
+    if (!TraverseBlocks(writer) || !writer.Flush())
     {
         GFXRECON_LOG_ERROR("Could not copy blocks in order");
         return false;
@@ -24,12 +24,16 @@ limitations under the License.
 
 #include <map>
 #include <memory>
+#include <optional>
 #include <string>
 #include <vector>
 
 #include "util/defines.h"
 
 static constexpr size_t kDiveBlockBufferSize = 4096;
+// Size of the buffer used to copy unmodified blocks, several of which are copied at once when they
+// are contiguous in the original file
+static constexpr size_t kDiveBlockCopyBufferSize = 1 << 20;
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
@@ -58,6 +62,12 @@ class TestBlockVisitor : public BlockVisitor
 };
 
 // A visitor that writes out a IDiveBlock into a provided file new_file_ptr_
+//
+// Original blocks that follow each other in the original file are not copied one at a time but
+// coalesced into a single range, which is copied when a modification block interrupts it or when
+// Flush() is called. Ranges are copied by the kernel where possible (copy_file_range, sendfile), so
+// an unmodified run of blocks never goes through user space, with a buffered copy as the fallback.
+// Flush() must be called after the last block has been visited.
 class WriterBlockVisitor : public BlockVisitor
 {
  public:
@@ -69,10 +79,20 @@ class WriterBlockVisitor : public BlockVisitor
     bool Visit(const DiveOriginalBlock& block) override;
     bool Visit(const DiveModificationBlock& block) override;
 
+    // Copies the pending range of original blocks to the new file
+    bool Flush();
+
  private:
+    bool CopyRange(uint64_t offset, uint64_t size);
+    bool CopyRangeBuffered(uint64_t offset, uint64_t size);
+
     FILE* original_file_ptr_ = nullptr;
     FILE* new_file_ptr_ = nullptr;
-    char copy_buffer_[kDiveBlockBufferSize] = {};
+    // Range of the original file still to be copied
+    uint64_t pending_offset_ = 0;
+    uint64_t pending_size_ = 0;
+    // Allocated on first use, since most copies don't go through it
+    std::vector<char> copy_buffer_;
 };
 
 // Abstract class representing a single binary block encoded in .gfxr format
@@ -85,15 +105,17 @@ class IDiveBlock
 };
 
 // Representing a gfxr-encoded block with data stored in the original file
+// Blocks that were read from an asset file (.gfxa) referenced by the original file have no offset
+// and a size of 0, since their data is not part of the original file
 class DiveOriginalBlock : public IDiveBlock
 {
  public:
     DiveOriginalBlock() {}
-    DiveOriginalBlock(uint64_t offset) : offset_(offset) {}
+    DiveOriginalBlock(std::optional<uint64_t> offset) : offset_(offset) {}
     ~DiveOriginalBlock() override {}
     bool Accept(BlockVisitor& visitor) const override { return visitor.Visit(*this); }
 
-    uint64_t offset_ = 0;
+    std::optional<uint64_t> offset_;
     uint64_t size_ = 0;
 };
 
@@ -114,13 +136,18 @@ class DiveModificationBlock : public IDiveBlock
 class DiveBlockData
 {
  public:
-    // Add info for the next block in the original GFXR file
-    bool AddOriginalBlock(size_t index, uint64_t offset);
+    // Add info for the next block in the original GFXR file, with no offset if the block was read
+    // from an asset file
+    bool AddOriginalBlock(size_t index, std::optional<uint64_t> offset);
 
     // Calculate block sizes, drop the file-end block and lock the map
     bool FinalizeOriginalBlocksMapSizes(uint64_t file_size);
     bool IsOriginalBlocksMapLocked() const { return original_blocks_map_locked_; }
 
+    // Offset of a block in the original GFXR file, if the block is known and was not read from an
+    // asset file
+    std::optional<uint64_t> GetOriginalBlockOffset(size_t index) const;
+
     // Add or edit modifications
     bool ModificationExists(uint32_t primary_id, int32_t secondary_id) const;
     bool AddModification(uint32_t primary_id, int32_t secondary_id,
@@ -18,6 +18,10 @@
 
 #include <gtest/gtest.h>
 
+#include <filesystem>
+#include <fstream>
+#include <iterator>
+
 namespace gfxrecon::decode
 {
 namespace
@@ -84,6 +88,24 @@ class DiveBlockDataTestFixture : public testing::Test
         return "modified, content length:" + std::to_string(m_element->size());
     }
 
+    // Writes a file of file_size bytes for the original blocks in o and returns its content
+    std::string WriteExampleOriginalFile(const std::filesystem::path& path)
+    {
+        std::string content;
+        for (uint32_t i = 0; i < file_size; i++)
+        {
+            content.push_back(static_cast<char>(i % 251));
+        }
+        std::ofstream(path, std::ios::binary) << content;
+        return content;
+    }
+
+    std::string ReadFile(const std::filesystem::path& path)
+    {
+        std::ifstream file(path, std::ios::binary);
+        return std::string(std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>());
+    }
+
     DiveBlockData d = {};
     TestBlockVisitor v = {};
     std::vector<std::pair<uint32_t, uint32_t>> o = {};  // offset & size
@@ -132,6 +154,56 @@ TEST_F(DiveBlockDataTestFixture, FinalizeOriginalBlocksMapSizes_NegativeSizeBloc
     EXPECT_FALSE(d.FinalizeOriginalBlocksMapSizes(file_size));
 }
 
+TEST_F(DiveBlockDataTestFixture, FinalizeOriginalBlocksMapSizes_NoBlockInFile_Fail)
+{
+    d.AddOriginalBlock(0, std::nullopt);
+    EXPECT_FALSE(d.FinalizeOriginalBlocksMapSizes(file_size));
+}
+
+TEST_F(DiveBlockDataTestFixture, GetOriginalBlockOffset_Success)
+{
+    LockExampleOriginals();
+    for (size_t i = 0; i < o.size(); i++)
+    {
+        EXPECT_EQ(d.GetOriginalBlockOffset(i), o[i].first);
+    }
+}
+
+TEST_F(DiveBlockDataTestFixture, GetOriginalBlockOffset_OOB_Fail)
+{
+    LockExampleOriginals();
+    EXPECT_FALSE(d.GetOriginalBlockOffset(o.size()).has_value());
+}
+
+TEST_F(DiveBlockDataTestFixture, GetOriginalBlockOffset_AssetFileBlock_Fail)
+{
+    d.AddOriginalBlock(0, o[0].first);
+    d.AddOriginalBlock(1, std::nullopt);
+    EXPECT_TRUE(d.FinalizeOriginalBlocksMapSizes(file_size));
+    EXPECT_EQ(d.GetOriginalBlockOffset(0), o[0].first);
+    EXPECT_FALSE(d.GetOriginalBlockOffset(1).has_value());
+}
+
+TEST_F(DiveBlockDataTestFixture, TraverseBlocks_AssetFileBlocks)
+{
+    // Blocks 1 and 2 are read from an asset file referenced by block 0
+    d.AddOriginalBlock(0, o[0].first);
+    d.AddOriginalBlock(1, std::nullopt);
+    d.AddOriginalBlock(2, std::nullopt);
+    d.AddOriginalBlock(3, o[1].first);
+    d.AddOriginalBlock(4, o[2].first);
+    EXPECT_TRUE(d.FinalizeOriginalBlocksMapSizes(file_size));
+
+    EXPECT_TRUE(d.TraverseBlocks(v));
+    std::vector<std::string> traversed_strings = v.GetTraversedPathString();
+    EXPECT_EQ(5, traversed_strings.size());
+    EXPECT_EQ(GetExampleString(o[0]), traversed_strings[0]);
+    EXPECT_EQ("original, offset:none, size:0", traversed_strings[1]);
+    EXPECT_EQ("original, offset:none, size:0", traversed_strings[2]);
+    EXPECT_EQ(GetExampleString(o[1]), traversed_strings[3]);
+    EXPECT_EQ(GetExampleString(o[2]), traversed_strings[4]);
+}
+
 TEST_F(DiveBlockDataTestFixture, AddModification_Unlocked_Fail)
 {
     EXPECT_FALSE(d.AddModification(1, 0, nullptr));
@@ -294,5 +366,90 @@ TEST_F(DiveBlockDataTestFixture, TraverseBlocks_OrderSecondary)
     EXPECT_EQ(GetExampleString(o[2]), traversed_strings[6]);
 }
 
+TEST_F(DiveBlockDataTestFixture, WriteGFXRFile_AllOriginal_Success)
+{
+    std::filesystem::path dir = std::filesystem::temp_directory_path();
+    std::filesystem::path original_path = dir / "dive_block_data_test_all_original.gfxr";
+    std::filesystem::path new_path = dir / "dive_block_data_test_all_original_new.gfxr";
+    std::string original = WriteExampleOriginalFile(original_path);
+    LockExampleOriginals();
+
+    EXPECT_TRUE(d.WriteGFXRFile(original_path.string(), new_path.string()));
+    EXPECT_EQ(original, ReadFile(new_path));
+
+    std::filesystem::remove(original_path);
+    std::filesystem::remove(new_path);
+}
+
+TEST_F(DiveBlockDataTestFixture, WriteGFXRFile_Modifications_Success)
+{
+    std::filesystem::path dir = std::filesystem::temp_directory_path();
+    std::filesystem::path original_path = dir / "dive_block_data_test_modifications.gfxr";
+    std::filesystem::path new_path = dir / "dive_block_data_test_modifications_new.gfxr";
+    std::string original = WriteExampleOriginalFile(original_path);
+    LockExampleOriginals();
+    PopulateExampleModifications();
+
+    // Replace the middle block, insert before the first and after the last block
+    EXPECT_TRUE(d.AddModification(1, 0, m[2]));
+    EXPECT_TRUE(d.AddModification(0, -1, m[3]));
+    EXPECT_TRUE(d.AddModification(2, 1, m[4]));
+
+    EXPECT_TRUE(d.WriteGFXRFile(original_path.string(), new_path.string()));
+    std::string expected = original.substr(0, o[0].first) + "123" +
+                           original.substr(o[0].first, o[0].second) + "12" +
+                           original.substr(o[2].first, o[2].second) + "1234";
+    EXPECT_EQ(expected, ReadFile(new_path));
+
+    std::filesystem::remove(original_path);
+    std::filesystem::remove(new_path);
+}
+
+TEST_F(DiveBlockDataTestFixture, WriteGFXRFile_DeleteOriginal_Success)
+{
+    std::filesystem::path dir = std::filesystem::temp_directory_path();
+    std::filesystem::path original_path = dir / "dive_block_data_test_delete.gfxr";
+    std::filesystem::path new_path = dir / "dive_block_data_test_delete_new.gfxr";
+    std::string original = WriteExampleOriginalFile(original_path);
+    LockExampleOriginals();
+
+    EXPECT_TRUE(d.AddModification(1, 0, nullptr));
+
+    EXPECT_TRUE(d.WriteGFXRFile(original_path.string(), new_path.string()));
+    std::string expected =
+        original.substr(0, o[1].first) + original.substr(o[2].first, o[2].second);
+    EXPECT_EQ(expected, ReadFile(new_path));
+
+    std::filesystem::remove(original_path);
+    std::filesystem::remove(new_path);
+}
+
+TEST_F(DiveBlockDataTestFixture, WriteGFXRFile_AssetFileBlocks_Success)
+{
+    std::filesystem::path dir = std::filesystem::temp_directory_path();
+    std::filesystem::path original_path = dir / "dive_block_data_test_asset_file.gfxr";
+    std::filesystem::path new_path = dir / "dive_block_data_test_asset_file_new.gfxr";
+    std::string original = WriteExampleOriginalFile(original_path);
+    d.AddOriginalBlock(0, o[0].first);
+    d.AddOriginalBlock(1, std::nullopt);
+    d.AddOriginalBlock(2, o[1].first);
+    d.AddOriginalBlock(3, o[2].first);
+    d.AddOriginalBlock(4, std::nullopt);
+    EXPECT_TRUE(d.FinalizeOriginalBlocksMapSizes(file_size));
+    PopulateExampleModifications();
+
+    // Modifications can still be anchored on blocks from the asset file
+    EXPECT_TRUE(d.AddModification(1, 1, m[3]));
+    EXPECT_TRUE(d.AddModification(2, 0, nullptr));
+
+    EXPECT_TRUE(d.WriteGFXRFile(original_path.string(), new_path.string()));
+    std::string expected =
+        original.substr(0, o[1].first) + "123" + original.substr(o[2].first, o[2].second);
+    EXPECT_EQ(expected, ReadFile(new_path));
+
+    std::filesystem::remove(original_path);
+    std::filesystem::remove(new_path);
+}
+
 }  // namespace
 }  // namespace gfxrecon::decode
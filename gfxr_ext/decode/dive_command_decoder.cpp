@@ -0,0 +1,101 @@
+/*
+ Copyright 2026 Google LLC
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+ http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#include "dive_command_decoder.h"
+
+#include "dive_file_processor.h"
+#include "generated/generated_vulkan_decoder.h"
+#include "generated/generated_vulkan_dive_consumer.h"
+#include "util/logging.h"
+
+DiveCommandDecoder::DiveCommandDecoder(size_t cache_size)
+    : m_cache_size(cache_size > 0 ? cache_size : 1)
+{
+}
+
+DiveCommandDecoder::~DiveCommandDecoder() = default;
+
+bool DiveCommandDecoder::Initialize(
+    const std::string& file_name,
+    std::vector<DiveAnnotationProcessor::CommandIndexEntry> command_index)
+{
+    auto file_processor = std::make_unique<gfxrecon::decode::DiveFileProcessor>();
+    if (!file_processor->Initialize(file_name))
+    {
+        GFXRECON_LOG_ERROR("Failed to open %s to decode commands", file_name.c_str());
+        return false;
+    }
+
+    m_consumer = std::make_unique<gfxrecon::decode::VulkanExportDiveConsumer>();
+    m_decoder = std::make_unique<gfxrecon::decode::VulkanDecoder>();
+    m_decoder->AddConsumer(m_consumer.get());
+    file_processor->AddDecoder(m_decoder.get());
+    file_processor->SetAnnotationProcessor(this);
+    m_consumer->Initialize(this);
+
+    m_file_processor = std::move(file_processor);
+    m_command_index = std::move(command_index);
+    m_cache.clear();
+    m_cache_index.clear();
+    return true;
+}
+
+const DiveAnnotationProcessor::CommandIndexEntry* DiveCommandDecoder::GetCommandIndexEntry(
+    uint32_t command_index) const
+{
+    if (command_index >= m_command_index.size())
+    {
+        return nullptr;
+    }
+    return &m_command_index[command_index];
+}
+
+std::optional<nlohmann::ordered_json> DiveCommandDecoder::GetArgs(uint32_t command_index)
+{
+    if (auto it = m_cache_index.find(command_index); it != m_cache_index.end())
+    {
+        m_cache.splice(m_cache.begin(), m_cache, it->second);
+        return it->second->second;
+    }
+
+    const DiveAnnotationProcessor::CommandIndexEntry* entry = GetCommandIndexEntry(command_index);
+    if (m_file_processor == nullptr || entry == nullptr || !entry->block_offset.has_value())
+    {
+        return std::nullopt;
+    }
+
+    m_decoded_call_id = gfxrecon::format::ApiCallId::ApiCall_Unknown;
+    m_decoded_args = nullptr;
+    if (!m_file_processor->DecodeBlockAt(*entry->block_offset, entry->block_index) ||
+        m_decoded_call_id != entry->call_id)
+    {
+        GFXRECON_LOG_WARNING("Failed to decode command %u from block %" PRIu64, command_index,
+                             entry->block_index);
+        return std::nullopt;
+    }
+
+    if (m_cache.size() >= m_cache_size)
+    {
+        m_cache_index.erase(m_cache.back().first);
+        m_cache.pop_back();
+    }
+    m_cache.emplace_front(command_index, std::move(m_decoded_args));
+    m_cache_index[command_index] = m_cache.begin();
+    return m_cache.front().second;
+}
+
+void DiveCommandDecoder::WriteBlockEnd(const gfxrecon::util::DiveFunctionData& function_data)
+{
+    m_decoded_call_id = function_data.GetCallId();
+    m_decoded_args = function_data.GetArgs();
+}
@@ -0,0 +1,90 @@
+/*
+ Copyright 2026 Google LLC
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+ http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#pragma once
+
+#include <cstdint>
+#include <list>
+#include <memory>
+#include <optional>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include "decode/annotation_handler.h"
+#include "dive_annotation_processor.h"
+#include "util/defines.h"
+#include "util/dive_function_data.h"
+
+namespace gfxrecon::decode
+{
+class DiveFileProcessor;
+class VulkanDecoder;
+class VulkanExportDiveConsumer;
+}  // namespace gfxrecon::decode
+
+// The DiveCommandDecoder decodes the full args of single vulkan commands on demand.
+//
+// When a capture is loaded with deferred args (see VulkanExportDiveConsumerBase::SetDeferDiveArgs),
+// the pointer and struct args of most commands are not kept. The DiveCommandDecoder reopens the
+// capture file and decodes only the block of the requested command, found through the command
+// index built by the DiveAnnotationProcessor. The most recently decoded args are kept in a small
+// LRU cache, since the UI tends to request the same few commands repeatedly.
+class DiveCommandDecoder : public gfxrecon::decode::AnnotationHandler
+{
+ public:
+    static constexpr size_t kDefaultCacheSize = 256;
+
+    explicit DiveCommandDecoder(size_t cache_size = kDefaultCacheSize);
+    ~DiveCommandDecoder();
+
+    // Opens the capture file to decode commands from. The block offsets of command_index must
+    // have been filled in.
+    bool Initialize(const std::string& file_name,
+                    std::vector<DiveAnnotationProcessor::CommandIndexEntry> command_index);
+
+    // Returns the entry of the command, or nullptr if command_index is out of range
+    const DiveAnnotationProcessor::CommandIndexEntry* GetCommandIndexEntry(
+        uint32_t command_index) const;
+
+    // Returns the args of the command, or nullopt if its block is not in the capture file or does
+    // not hold the expected command
+    std::optional<nlohmann::ordered_json> GetArgs(uint32_t command_index);
+
+    void WriteBlockEnd(const gfxrecon::util::DiveFunctionData& function_data) override;
+
+    void ProcessAnnotation(uint64_t block_index, gfxrecon::format::AnnotationType type,
+                           const std::string& label, const std::string& data) override
+    {
+    }
+
+ private:
+    // Args of a command, by command_index
+    using CacheEntry = std::pair<uint32_t, nlohmann::ordered_json>;
+
+    std::vector<DiveAnnotationProcessor::CommandIndexEntry> m_command_index;
+
+    size_t m_cache_size;
+    // Most recently used first
+    std::list<CacheEntry> m_cache;
+    std::unordered_map<uint32_t, std::list<CacheEntry>::iterator> m_cache_index;
+
+    std::unique_ptr<gfxrecon::decode::DiveFileProcessor> m_file_processor;
+    std::unique_ptr<gfxrecon::decode::VulkanDecoder> m_decoder;
+    std::unique_ptr<gfxrecon::decode::VulkanExportDiveConsumer> m_consumer;
+
+    // Set by WriteBlockEnd while a block is being decoded
+    gfxrecon::format::ApiCallId m_decoded_call_id = gfxrecon::format::ApiCallId::ApiCall_Unknown;
+    nlohmann::ordered_json m_decoded_args;
+};
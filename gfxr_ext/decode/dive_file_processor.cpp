@@ -216,6 +216,13 @@ void DiveFileProcessor::StoreBlockInfo()
         return;
     }
 
+    if (file_stack_.back().active_file != gfxr_file)
+    {
+        // The block is read from an asset file, so it has no offset in the .gfxr file
+        dive_block_data_->AddOriginalBlock(block_index_, std::nullopt);
+        return;
+    }
+
     int64_t offset = gfxr_file->FileTell();
     GFXRECON_ASSERT(offset > 0);
     dive_block_data_->AddOriginalBlock(block_index_, static_cast<uint64_t>(offset));
@@ -41,6 +41,13 @@ class DiveFileProcessor : public FileProcessor
     // overwriting existing file if present
     bool WriteFile(const std::string& name, const std::string& content);
 
+    // Decodes the block at offset in the capture file again and dispatches it to the decoders as
+    // block block_index. Initialize must have been called.
+    bool DecodeBlockAt(uint64_t offset, uint64_t block_index)
+    {
+        return ProcessBlockAt(static_cast<int64_t>(offset), block_index);
+    }
+
  protected:
     bool ProcessFrameDelimiter(const FrameEndMarkerArgs& end_frame) override;
 
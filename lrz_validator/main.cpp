@@ -143,8 +143,6 @@ bool ValidateLRZ(const Dive::CaptureMetadata& meta_data, const std::string& outp
 
 int main(int argc, char** argv)
 {
-    Pm4InfoInit();
-
     // Handle args
     if ((argc != 2) && (argc != 3))
     {
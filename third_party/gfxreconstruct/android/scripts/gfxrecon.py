@@ -21,10 +21,13 @@
 # IN THE SOFTWARE.
 
 import argparse
+import concurrent.futures
 import os
 import sys
 import shlex
 import subprocess
+import threading
+import uuid
 
 argv = sys.argv
 argc = len(sys.argv)
@@ -37,9 +40,9 @@ valid_commands = [
 ]
 
 # Arguments
-# gfxrecon install-apk <file>
-# gfxrecon replay [-p | --push-file <file-on-desktop>] <file-on-device>
-# gfxrecon multiwin-replay [-p | --push-file <file-on-desktop>] <file-on-device>
+# gfxrecon install-apk [-s | --select <device-id> | --all-devices] <file>
+# gfxrecon replay [--all-devices] [-p | --push-file <file-on-desktop>] <file-on-device>
+# gfxrecon multiwin-replay [--all-devices] [-p | --push-file <file-on-desktop>] <file-on-device>
 
 # Application info
 app_name = 'com.lunarg.gfxreconstruct.replay'
@@ -50,19 +53,33 @@ app_category = 'android.intent.category.LAUNCHER'
 
 # ADB commands
 adb_install = 'adb install -g -t -r'
-adb_sdk_version = 'adb shell getprop ro.build.version.sdk'
-adb_stop = 'adb shell am force-stop {}'.format(app_name)
-adb_push = 'adb push'
 adb_devices = 'adb devices'
 
 # Environment variable for android serial number
 android_serial = 'ANDROID_SERIAL'
 
+# GOOGLE: [adb-session] The adb executable, which can be overridden with the ADB environment variable
+# (e.g. to use a fake adb for testing)
+adb_executable = os.getenv('ADB') or 'adb'
+
+# GOOGLE: [adb-session] Device shell commands, run over an AdbDeviceSession instead of 'adb shell'
+shell_sdk_version = 'getprop ro.build.version.sdk'
+shell_stop = 'am force-stop {}'.format(app_name)
+
 class DeviceSelectionException(Exception):
     pass
 
+# GOOGLE: [adb-session] Failure of an adb command on a device
+class AdbCommandException(Exception):
+    pass
+
+def AdbCommand(cmd):
+    # Use the configured adb executable for an 'adb ...' command string
+    args = shlex.split(cmd, posix='win' not in sys.platform)
+    return [adb_executable] + args[1:]
+
 def QueryAvailableDevices():
-    result = subprocess.run(shlex.split(adb_devices, posix='win' not in sys.platform), capture_output=True, check=True)
+    result = subprocess.run(AdbCommand(adb_devices), capture_output=True, check=True)
     devices = result.stdout.decode().strip().splitlines()[1:]
     return [device.split('\t')[0] for device in devices]
 
@@ -77,6 +94,149 @@ def CheckDeviceSelection():
     if selection not in devices:
         raise DeviceSelectionException(f'Selected ({selection}) device not present. Available devices: {devices}')
 
+# GOOGLE: [adb-session] A connection to one device.
+#
+# Running each shell command as its own 'adb shell' costs a full adb client/server round trip and a
+# new device shell every time. The session keeps a single 'adb shell' open per device and sends
+# shell commands to it, writing a batch of commands before reading any of their results. Each
+# command is followed by an echo of a unique marker and its exit status, which delimits its output.
+# Pushes and installs can't go through the shell, so they still run as separate adb processes, but
+# they can run while shell commands are in flight. Their output is passed through, as before.
+class AdbDeviceSession:
+    def __init__(self, serial=None):
+        # With no serial, adb picks the device as usual (ANDROID_SERIAL or the only device)
+        self.serial = serial
+        self.marker = '__gfxrecon_{}__'.format(uuid.uuid4().hex)
+        self.shell = None
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Close()
+
+    def MakeCommand(self, args):
+        serial_args = ['-s', self.serial] if self.serial else []
+        return [adb_executable] + serial_args + args
+
+    def Log(self, *message):
+        if self.serial:
+            print('[{}]'.format(self.serial), *message, flush=True)
+        else:
+            print(*message, flush=True)
+
+    def OpenShell(self):
+        if self.shell is None:
+            self.shell = subprocess.Popen(self.MakeCommand(['shell']), stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, bufsize=1)
+        return self.shell
+
+    def Shell(self, *commands):
+        # Runs the commands in the device shell, in order, and returns their outputs. All of them
+        # are sent before the first result is read, so a failed command doesn't stop the next ones.
+        # The commands don't read stdin, which is the stream of commands itself.
+        with self.lock:
+            shell = self.OpenShell()
+            try:
+                for command in commands:
+                    self.Log('Executing:', command)
+                    shell.stdin.write('{} </dev/null 2>&1; echo "{} $?"\n'.format(command, self.marker))
+                shell.stdin.flush()
+
+                results = []
+                for command in commands:
+                    results.append(self.ReadShellResult(shell, command))
+            except (OSError, ValueError) as error:
+                self.shell = None
+                raise AdbCommandException('adb shell failed: {}'.format(error))
+
+        for command, (status, output) in zip(commands, results):
+            if status != 0:
+                raise AdbCommandException('"{}" failed with status {}: {}'.format(command, status, output.strip()))
+        return [output for _, output in results]
+
+    def ReadShellResult(self, shell, command):
+        output = []
+        for line in shell.stdout:
+            # Some adb versions translate line endings when talking to older devices
+            line = line.rstrip('\r\n')
+            marker_position = line.find(self.marker)
+            if marker_position >= 0:
+                output.append(line[:marker_position])
+                status = int(line[marker_position + len(self.marker):].strip() or -1)
+                return status, '\n'.join(output).strip('\n')
+            output.append(line)
+        self.shell = None
+        raise AdbCommandException('adb shell exited while running "{}"'.format(command))
+
+    def Start(self, args):
+        # Starts a separate adb command, e.g. 'push', that can't be run over the shell
+        cmd = self.MakeCommand(args)
+        self.Log('Executing:', ' '.join(cmd))
+        return subprocess.Popen(cmd)
+
+    def Wait(self, process):
+        if process.wait() != 0:
+            raise AdbCommandException('"{}" failed with status {}'.format(' '.join(process.args), process.returncode))
+
+    def GetSdkVersion(self):
+        return int(self.Shell(shell_sdk_version)[0])
+
+    def Close(self):
+        if self.shell is not None:
+            try:
+                self.shell.stdin.write('exit\n')
+                self.shell.stdin.close()
+            except (OSError, ValueError):
+                pass
+            self.shell.wait()
+            self.shell = None
+
+def GetTargetDevices(args):
+    # The devices to run a command on: all of them for --all-devices, otherwise the selected one
+    if args.all_devices:
+        devices = QueryAvailableDevices()
+        if not devices:
+            raise DeviceSelectionException('No devices detected.')
+        return devices
+
+    selection = getattr(args, 'select', None)
+    if selection:
+        devices = QueryAvailableDevices()
+        if selection not in devices:
+            raise DeviceSelectionException(f'Selected ({selection}) device not present. Available devices: {devices}')
+        return [selection]
+
+    CheckDeviceSelection()
+    return [None]
+
+def RunOnDevices(devices, function):
+    # Runs function(session) for every device in parallel. Returns True if it succeeded on all of
+    # them. With several devices, the status of each one is reported as it completes.
+    def RunOnDevice(serial):
+        with AdbDeviceSession(serial) as session:
+            function(session)
+
+    if len(devices) == 1:
+        try:
+            RunOnDevice(devices[0])
+        except (AdbCommandException, OSError, ValueError) as error:
+            print('Error:', error)
+            return False
+        return True
+
+    succeeded = True
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(devices)) as executor:
+        jobs = {executor.submit(RunOnDevice, serial): serial for serial in devices}
+        for job in concurrent.futures.as_completed(jobs):
+            try:
+                job.result()
+                print('[{}] OK'.format(jobs[job]), flush=True)
+            except (AdbCommandException, OSError, ValueError) as error:
+                print('[{}] FAILED: {}'.format(jobs[job], error), flush=True)
+                succeeded = False
+    return succeeded
+
 def CreateCommandParser():
     parser = argparse.ArgumentParser(description='GFXReconstruct utility launcher for Android.')
     parser.add_argument('command', choices=valid_commands, metavar='command', help='Command to execute. Valid options are [{}]'.format(', '.join(valid_commands)))
@@ -87,11 +247,15 @@ def CreateInstallApkParser():
     parser = argparse.ArgumentParser(prog=os.path.basename(sys.argv[0]) + ' install-apk', description='Install the replay tool.')
     parser.add_argument('file', help='APK file to install')
     parser.add_argument('-s', '--select', metavar='DEVICE_ID', help='Specify the destination device id. Needed if multiple devices are attached.')
+    # GOOGLE: [adb-session] Multi-device install
+    parser.add_argument('--all-devices', action='store_true', default=False, help='Install on all the attached devices in parallel.')
     return parser
 
 def CreateReplayParser():
     parser = argparse.ArgumentParser(prog=os.path.basename(sys.argv[0]) + ' replay', description='Launch the replay tool.')
     parser.add_argument('-p', '--push-file', metavar='LOCAL_FILE', help='Local file to push to the location on device specified by <file>')
+    # GOOGLE: [adb-session] Multi-device replay
+    parser.add_argument('--all-devices', action='store_true', default=False, help='Push the file to and start the replay on all the attached devices in parallel.')
     parser.add_argument('--version', action='store_true', default=False, help='Print version information and exit (forwarded to replay tool)')
     parser.add_argument('--log-level', metavar='LEVEL', help='Specify highest level message to log. Options are: debug, info, warning, error, and fatal. Default is info. (forwarded to replay tool)')
     parser.add_argument('--log-timestamps', action='store_true', help='Output a timestamp in front of each log message. (forwarded to replay tool)')
@@ -347,39 +511,46 @@ def MakeExtrasString(args):
 def InstallApk(install_args):
     install_parser = CreateInstallApkParser()
     args = install_parser.parse_args(install_args)
-    sdk = int(subprocess.check_output(shlex.split(adb_sdk_version)).decode())
-    force_queryable = ' --force-queryable' if sdk >= 30 else ''
-    cmd = adb_install + force_queryable + ' ' + args.file
+    devices = GetTargetDevices(args)
 
-    CheckDeviceSelection()
+    def Install(session):
+        force_queryable = ['--force-queryable'] if session.GetSdkVersion() >= 30 else []
+        cmd = shlex.split(adb_install, posix='win' not in sys.platform)[1:] + force_queryable + [args.file]
+        session.Wait(session.Start(cmd))
 
-    print('Executing:', cmd)
-    subprocess.check_call(shlex.split(cmd, posix='win' not in sys.platform))
+    if not RunOnDevices(devices, Install):
+        sys.exit(1)
 
 def ReplayCommon(replay_args, activity):
     replay_parser = CreateReplayParser()
     args = replay_parser.parse_args(replay_args)
 
     extras = MakeExtrasString(args)
+    devices = GetTargetDevices(args)
 
-    CheckDeviceSelection()
-
-    if extras:
-        if args.push_file:
-            cmd = ' '.join([adb_push, args.push_file, args.file])
-            print('Executing:', cmd)
-            subprocess.check_call(shlex.split(cmd, posix='win' not in sys.platform))
-
-        print('Executing:', adb_stop)
-        subprocess.check_call(shlex.split(adb_stop, posix='win' not in sys.platform))
-
-        adb_start = 'adb shell am start -n {} -a {} -c {}'.format(activity, app_action, app_category)
+    if not extras:
+        return
 
-        print(f'Executing: {adb_start} --es args \'"{extras}"\'')
-        cmd = ' '.join([adb_start, '--es', 'args', '"{}"'.format(extras)])
+    adb_start = 'am start -n {} -a {} -c {}'.format(activity, app_action, app_category)
+    # The device shell removes the quotes, like it did when these were passed to 'adb shell'
+    shell_start = ' '.join([adb_start, '--es', 'args', '"{}"'.format(extras)])
 
-        # Specify posix=False to prevent removal of quotes from adb extras.
-        subprocess.check_call(shlex.split(cmd, posix=False))
+    def ReplayOnDevice(session):
+        # Without a push, the stop and the start are sent to the shell together. Otherwise the
+        # replay tool is stopped while the capture file is pushed, and started once it's there.
+        if args.push_file:
+            push = session.Start(['push', args.push_file, args.file])
+            outputs = session.Shell(shell_stop)
+            session.Wait(push)
+            outputs += session.Shell(shell_start)
+        else:
+            outputs = session.Shell(shell_stop, shell_start)
+        for output in outputs:
+            if output:
+                session.Log(output)
+
+    if not RunOnDevices(devices, ReplayOnDevice):
+        sys.exit(1)
 
 def Replay(replay_args):
     ReplayCommon(replay_args, app_activity)
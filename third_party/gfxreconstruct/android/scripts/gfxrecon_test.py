@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests of gfxrecon.py against a fake adb, which is put first on PATH and set as ADB.
+
+The fake adb serves the devices listed in FAKE_ADB_DEVICES. Its device shell is a local sh, with
+fake 'am' and 'getprop' commands that record each call and the shell they ran in. Run with:
+    python3 gfxrecon_test.py
+"""
+
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+GFXRECON_PY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gfxrecon.py")
+
+FAKE_ADB = textwrap.dedent(
+    """\
+    #!{python}
+    import os
+    import subprocess
+    import sys
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    args = sys.argv[1:]
+    with open(os.path.join(root, "adb.log"), "a") as log:
+        log.write(" ".join(args) + "\\n")
+
+    if args == ["devices"]:
+        print("List of devices attached")
+        for serial in os.environ["FAKE_ADB_DEVICES"].split():
+            print(serial + "\\tdevice")
+        sys.exit(0)
+
+    serial = os.environ["FAKE_ADB_DEVICES"].split()[0]
+    if args[:1] == ["-s"]:
+        serial = args[1]
+        args = args[2:]
+
+    if args[0] == "shell":
+        env = dict(os.environ, FAKE_ADB_SERIAL=serial)
+        env["PATH"] = os.path.join(root, "device") + os.pathsep + env["PATH"]
+        shell = ["sh", "-c", " ".join(args[1:])] if args[1:] else ["sh"]
+        sys.exit(subprocess.call(shell, env=env))
+
+    # push and install
+    print("{{}} {{}}: {{}}".format(serial, args[0], args[-1]))
+    if os.environ.get("FAKE_ADB_FAIL") == args[0]:
+        print("adb: error: {{}} failed".format(args[0]))
+        sys.exit(1)
+    """
+)
+
+# The device commands log the serial, the pid of the shell they run in and their arguments
+FAKE_AM = textwrap.dedent(
+    """\
+    #!/bin/sh
+    echo "$FAKE_ADB_SERIAL $PPID am $*" >> "$FAKE_DEVICE_LOG"
+    [ "$1" = start ] && echo "Starting: Intent"
+    exit ${FAKE_AM_STATUS:-0}
+    """
+)
+
+FAKE_GETPROP = textwrap.dedent(
+    """\
+    #!/bin/sh
+    echo "$FAKE_ADB_SERIAL $PPID getprop $*" >> "$FAKE_DEVICE_LOG"
+    echo "${FAKE_SDK_VERSION:-33}"
+    """
+)
+
+
+def _writeScript(path, content):
+    with open(path, "w") as script:
+        script.write(content)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+@unittest.skipUnless(os.name == "posix", "the fake adb is a POSIX script")
+class GfxreconTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        os.mkdir(os.path.join(self.root, "device"))
+        _writeScript(os.path.join(self.root, "adb"), FAKE_ADB.format(python=sys.executable))
+        _writeScript(os.path.join(self.root, "device", "am"), FAKE_AM)
+        _writeScript(os.path.join(self.root, "device", "getprop"), FAKE_GETPROP)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, *args, devices="A", **env):
+        run_env = dict(os.environ)
+        run_env.pop("ANDROID_SERIAL", None)
+        run_env.update(env)
+        run_env["ADB"] = os.path.join(self.root, "adb")
+        run_env["PATH"] = self.root + os.pathsep + run_env["PATH"]
+        run_env["FAKE_ADB_DEVICES"] = devices
+        run_env["FAKE_DEVICE_LOG"] = os.path.join(self.root, "device.log")
+        return subprocess.run(
+            [sys.executable, GFXRECON_PY] + list(args),
+            env=run_env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            timeout=60,
+        )
+
+    def _readLog(self, name):
+        path = os.path.join(self.root, name)
+        if not os.path.exists(path):
+            return []
+        with open(path) as log:
+            return [line.split() for line in log.read().splitlines()]
+
+    def _adbCommands(self):
+        # The adb calls other than the device queries, which can happen in any order
+        return sorted(args for args in self._readLog("adb.log") if args != ["devices"])
+
+    def _adbCalls(self, serial, command):
+        return [args for args in self._readLog("adb.log") if args[:3] == ["-s", serial, command]]
+
+    def _deviceCalls(self, serial):
+        return [args[1:] for args in self._readLog("device.log") if args[0] == serial]
+
+    def testReplayStopsAndStartsOverOneShell(self):
+        result = self._run("replay", "--all-devices", "/sdcard/capture.gfxr", devices="A B")
+        self.assertEqual(result.returncode, 0, result.stdout)
+
+        for serial in ["A", "B"]:
+            # A single 'adb shell' without a command, that runs both device commands
+            self.assertEqual(self._adbCalls(serial, "shell"), [["-s", serial, "shell"]])
+            calls = self._deviceCalls(serial)
+            self.assertEqual([call[1:3] for call in calls], [["am", "force-stop"], ["am", "start"]])
+            self.assertEqual(calls[0][0], calls[1][0])
+            self.assertEqual(calls[1][-1], "/sdcard/capture.gfxr")
+            self.assertIn("[{}] Starting: Intent".format(serial), result.stdout)
+            self.assertIn("[{}] OK".format(serial), result.stdout)
+
+    def testReplayWithPush(self):
+        result = self._run("replay", "-p", "capture.gfxr", "/sdcard/capture.gfxr")
+        self.assertEqual(result.returncode, 0, result.stdout)
+
+        self.assertEqual(len(self._adbCalls("A", "shell")), 0)
+        self.assertEqual(
+            self._adbCommands(), [["push", "capture.gfxr", "/sdcard/capture.gfxr"], ["shell"]]
+        )
+        calls = self._deviceCalls("A")
+        self.assertEqual([call[1:3] for call in calls], [["am", "force-stop"], ["am", "start"]])
+        self.assertEqual(calls[0][0], calls[1][0])
+
+        # The output of adb push is passed through
+        self.assertIn("A push: /sdcard/capture.gfxr", result.stdout)
+
+    def testReplayFailures(self):
+        result = self._run("replay", "/sdcard/capture.gfxr", FAKE_AM_STATUS="2")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("failed with status 2", result.stdout)
+
+        result = self._run(
+            "replay", "--all-devices", "-p", "capture.gfxr", "/sdcard/capture.gfxr",
+            devices="A B", FAKE_ADB_FAIL="push"
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("adb: error: push failed", result.stdout)
+        self.assertIn("[A] FAILED", result.stdout)
+        self.assertIn("[B] FAILED", result.stdout)
+
+    def testInstallApk(self):
+        result = self._run("install-apk", "replay.apk")
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertEqual(
+            self._adbCommands(),
+            [["install", "-g", "-t", "-r", "--force-queryable", "replay.apk"], ["shell"]],
+        )
+        self.assertEqual([call[1:] for call in self._deviceCalls("A")],
+                         [["getprop", "ro.build.version.sdk"]])
+        # The output of adb install is passed through
+        self.assertIn("A install: replay.apk", result.stdout)
+
+        result = self._run("install-apk", "replay.apk", FAKE_SDK_VERSION="29")
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertEqual(self._readLog("adb.log")[-1], ["install", "-g", "-t", "-r", "replay.apk"])
+
+    def testInstallApkFailures(self):
+        # Every failure is reported without a traceback, for a single device as for several
+        for devices, error in [("A", "Error:"), ("A B", "[A] FAILED")]:
+            result = self._run("install-apk", "--all-devices", "replay.apk", devices=devices,
+                               FAKE_SDK_VERSION="unknown")
+            self.assertEqual(result.returncode, 1)
+            self.assertIn(error, result.stdout)
+            self.assertNotIn("Traceback", result.stdout)
+
+            result = self._run("install-apk", "--all-devices", "replay.apk", devices=devices,
+                               FAKE_ADB_FAIL="install")
+            self.assertEqual(result.returncode, 1)
+            self.assertIn(error, result.stdout)
+            self.assertIn("adb: error: install failed", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
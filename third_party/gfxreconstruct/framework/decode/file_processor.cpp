@@ -360,6 +360,45 @@ bool FileProcessor::ProcessBlocks()
     return success;
 }
 
+// GOOGLE: [lazy-decode] Decode a single block of the capture file again
+bool FileProcessor::ProcessBlockAt(int64_t offset, uint64_t block_index)
+{
+    if (file_stack_.empty())
+    {
+        return false;
+    }
+
+    // Blocks are always read from the capture file itself, never from an asset file it references
+    FileInputStreamPtr capture_file = file_stack_.front().active_file;
+    if (!SeekActiveFile(capture_file, offset, util::platform::FileSeekSet))
+    {
+        return false;
+    }
+
+    BlockBuffer  block_buffer;
+    BlockParser& block_parser = GetBlockParser();
+    if (block_parser.ReadBlockBuffer(capture_file, block_buffer) != kErrorNone)
+    {
+        return false;
+    }
+
+    for (auto decoder : decoders_)
+    {
+        decoder->SetCurrentBlockIndex(block_index);
+    }
+    block_parser.SetBlockIndex(block_index);
+
+    ParsedBlock parsed_block = block_parser.ParseBlock(block_buffer);
+    if (!parsed_block.IsVisitable() || !parsed_block.Decompress(block_parser))
+    {
+        return false;
+    }
+
+    DispatchVisitor dispatch_visitor(decoders_, annotation_handler_);
+    std::visit(dispatch_visitor, parsed_block.GetArgs());
+    return true;
+}
+
 // While ReadBlockBuffer both reads the block header and the block body, checks for
 // the correct sizing of the block payload are done by the caller
 bool FileProcessor::ReadBlockBuffer(BlockParser& parser, BlockBuffer& block_buffer)
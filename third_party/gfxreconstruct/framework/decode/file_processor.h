@@ -476,6 +476,11 @@ class FileProcessor
     uint64_t     GetFirstFrame() const { return first_frame_; }
     virtual void StoreBlockInfo() {}
 
+    // GOOGLE: [lazy-decode] Decode a single block of the capture file again, e.g. to decode the full parameters of a
+    // call lazily. The block at offset in the capture file is dispatched to the decoders as block block_index, without
+    // affecting the frame or block state of the processor.
+    bool ProcessBlockAt(int64_t offset, uint64_t block_index);
+
     bool run_without_decoders_ = false;
 };
 
@@ -0,0 +1,188 @@
+/*
+ Copyright 2026 Google LLC
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+ http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#include <catch2/catch.hpp>
+#include "decode/vulkan_replay_dump_resources_writer.h"
+#include "util/logging.h"
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <mutex>
+#include <stdexcept>
+#include <thread>
+#include <vector>
+
+using gfxrecon::decode::VulkanDumpResourcesWriter;
+using DumpedData = VulkanDumpResourcesWriter::DumpedData;
+
+TEST_CASE("VulkanDumpResourcesWriter - synchronous tasks run right away", "[dump_resources]")
+{
+    gfxrecon::util::Log::Init(gfxrecon::util::Log::kErrorSeverity);
+
+    VulkanDumpResourcesWriter writer(0);
+    REQUIRE_FALSE(writer.IsAsync());
+
+    std::vector<uint32_t> order;
+    for (uint32_t i = 0; i < 4; ++i)
+    {
+        REQUIRE(writer.Submit(VulkanDumpResourcesWriter::Stage::kWrite, DumpedData(i), [&order, i](const DumpedData&) {
+            order.push_back(i);
+            return true;
+        }));
+        REQUIRE(order.size() == i + 1);
+    }
+    REQUIRE(order == std::vector<uint32_t>{ 0, 1, 2, 3 });
+    REQUIRE(writer.Finish());
+}
+
+TEST_CASE("VulkanDumpResourcesWriter - synchronous failures are returned", "[dump_resources]")
+{
+    gfxrecon::util::Log::Init(gfxrecon::util::Log::kErrorSeverity);
+
+    VulkanDumpResourcesWriter writer(0);
+    REQUIRE_FALSE(writer.Submit(
+        VulkanDumpResourcesWriter::Stage::kWrite, DumpedData(16), [](const DumpedData&) { return false; }));
+    REQUIRE(writer.Submit(
+        VulkanDumpResourcesWriter::Stage::kEncode, DumpedData(16), [](const DumpedData&) { return true; }));
+    REQUIRE_FALSE(writer.Finish());
+
+    // The failures are only reported once
+    REQUIRE(writer.Finish());
+}
+
+TEST_CASE("VulkanDumpResourcesWriter - a single worker runs the tasks in submission order", "[dump_resources]")
+{
+    gfxrecon::util::Log::Init(gfxrecon::util::Log::kErrorSeverity);
+
+    constexpr uint32_t kNumTasks = 64;
+
+    // The queue holds a single task at a time, so most submissions wait for the worker
+    VulkanDumpResourcesWriter writer(1, 16);
+    REQUIRE(writer.IsAsync());
+
+    std::mutex            mutex;
+    std::vector<uint32_t> order;
+    for (uint32_t i = 0; i < kNumTasks; ++i)
+    {
+        REQUIRE(writer.Submit(VulkanDumpResourcesWriter::Stage::kWrite,
+                              DumpedData(16, static_cast<uint8_t>(i)),
+                              [&, i](const DumpedData& data) {
+                                  std::lock_guard<std::mutex> lock(mutex);
+                                  order.push_back(data[0] == static_cast<uint8_t>(i) ? i : UINT32_MAX);
+                                  return true;
+                              }));
+    }
+    REQUIRE(writer.Finish());
+
+    std::vector<uint32_t> expected_order;
+    for (uint32_t i = 0; i < kNumTasks; ++i)
+    {
+        expected_order.push_back(i);
+    }
+    REQUIRE(order == expected_order);
+}
+
+TEST_CASE("VulkanDumpResourcesWriter - workers write a copy of the data", "[dump_resources]")
+{
+    gfxrecon::util::Log::Init(gfxrecon::util::Log::kErrorSeverity);
+
+    VulkanDumpResourcesWriter writer(2);
+
+    std::atomic<bool> release{ false };
+    std::atomic<bool> data_unchanged{ false };
+    DumpedData        data(32, 0xab);
+    REQUIRE(writer.Submit(VulkanDumpResourcesWriter::Stage::kWrite, data, [&](const DumpedData& task_data) {
+        while (!release)
+        {
+            std::this_thread::yield();
+        }
+        data_unchanged = (task_data == DumpedData(32, 0xab));
+        return true;
+    }));
+
+    // Replay reuses its read back buffer as soon as the task is submitted
+    data.assign(data.size(), 0);
+    release = true;
+    REQUIRE(writer.Finish());
+    REQUIRE(data_unchanged);
+}
+
+TEST_CASE("VulkanDumpResourcesWriter - worker failures are returned by Finish", "[dump_resources]")
+{
+    gfxrecon::util::Log::Init(gfxrecon::util::Log::kErrorSeverity);
+
+    VulkanDumpResourcesWriter writer(2);
+
+    // A worker failure cannot be returned by Submit, which does not wait for the task
+    for (uint32_t i = 0; i < 8; ++i)
+    {
+        REQUIRE(writer.Submit(
+            VulkanDumpResourcesWriter::Stage::kEncode, DumpedData(8), [i](const DumpedData&) { return i != 5; }));
+    }
+    REQUIRE_FALSE(writer.Finish());
+
+    REQUIRE(writer.Submit(
+        VulkanDumpResourcesWriter::Stage::kEncode, DumpedData(8), [](const DumpedData&) { return true; }));
+    REQUIRE(writer.Finish());
+}
+
+TEST_CASE("VulkanDumpResourcesWriter - destruction waits for the pending tasks", "[dump_resources]")
+{
+    gfxrecon::util::Log::Init(gfxrecon::util::Log::kErrorSeverity);
+
+    constexpr uint32_t kNumTasks = 16;
+
+    std::atomic<uint32_t> completed_tasks{ 0 };
+    {
+        VulkanDumpResourcesWriter writer(2);
+        for (uint32_t i = 0; i < kNumTasks; ++i)
+        {
+            writer.Submit(VulkanDumpResourcesWriter::Stage::kWrite, DumpedData(64), [&](const DumpedData&) {
+                std::this_thread::sleep_for(std::chrono::milliseconds(2));
+                ++completed_tasks;
+                return true;
+            });
+        }
+    }
+    REQUIRE(completed_tasks == kNumTasks);
+}
+
+TEST_CASE("VulkanDumpResourcesWriter - a task that throws counts as failed", "[dump_resources]")
+{
+    gfxrecon::util::Log::Init(gfxrecon::util::Log::kErrorSeverity);
+
+    auto throwing_task = [](const DumpedData&) -> bool { throw std::runtime_error("encoder failure"); };
+
+    SECTION("Without worker threads")
+    {
+        VulkanDumpResourcesWriter writer(0);
+        REQUIRE_FALSE(writer.Submit(VulkanDumpResourcesWriter::Stage::kEncode, DumpedData(8), throwing_task));
+        REQUIRE_FALSE(writer.Finish());
+    }
+
+    SECTION("With worker threads")
+    {
+        VulkanDumpResourcesWriter writer(2, 16);
+        for (uint32_t i = 0; i < 4; ++i)
+        {
+            REQUIRE(writer.Submit(VulkanDumpResourcesWriter::Stage::kEncode, DumpedData(16), throwing_task));
+        }
+
+        // The tasks that threw are still released, so Finish returns
+        REQUIRE_FALSE(writer.Finish());
+        REQUIRE(writer.Submit(
+            VulkanDumpResourcesWriter::Stage::kWrite, DumpedData(16), [](const DumpedData&) { return true; }));
+        REQUIRE(writer.Finish());
+    }
+}
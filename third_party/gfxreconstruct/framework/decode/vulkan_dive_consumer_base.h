@@ -24,6 +24,7 @@ limitations under the License.
 #include "generated/generated_vulkan_consumer.h"
 #include "vulkan/vulkan.h"
 #include "util/json_util.h"
+#include "util/dive_args_encoding.h"
 #include "util/dive_function_data.h"
 
 #include <cstdint>
@@ -42,6 +43,11 @@ class VulkanExportDiveConsumerBase : public VulkanConsumer
 
     void Initialize(AnnotationHandler* writer);
 
+    /// When set, the pointer and struct args of most vkCmd* commands are not converted to JSON. The
+    /// AnnotationHandler gets the scalar args only, and the rest has to be decoded again from the
+    /// block of the command when needed.
+    void SetDeferDiveArgs(bool defer) { defer_dive_args_ = defer; }
+
     void Process_vkCmdBuildAccelerationStructuresIndirectKHR(
         const ApiCallInfo&                                                         call_info,
         format::HandleId                                                           commandBuffer,
@@ -121,8 +127,15 @@ class VulkanExportDiveConsumerBase : public VulkanConsumer
         format::HandleId                                                   commandBuffer,
         StructPointerDecoder<Decoded_VkPushDescriptorSetWithTemplateInfo>* pPushDescriptorSetWithTemplateInfo) override;
                                       
-    void WriteBlockEnd(util::DiveFunctionData function_data) { writer_->WriteBlockEnd(function_data); }
+    void WriteBlockEnd(const util::DiveFunctionData& function_data) { writer_->WriteBlockEnd(function_data); }
 
+    /// Returns the encoder for the args of the next command, emptied of the previous command's args.
+    /// Commands whose pointer and struct args are always needed pass may_defer = false.
+    util::DiveArgsEncoder& BeginDiveArgs(bool may_defer = false)
+    {
+        dive_args_.Reset(may_defer && defer_dive_args_);
+        return dive_args_;
+    }
 
     /// A field not present in binary format which identifies the index of each
     /// command within its command buffer.
@@ -143,6 +156,8 @@ class VulkanExportDiveConsumerBase : public VulkanConsumer
   private:
     std::unordered_map<format::HandleId, uint32_t> rec_cmd_index_;
     AnnotationHandler* writer_{ nullptr };
+    util::DiveArgsEncoder                          dive_args_;
+    bool                                           defer_dive_args_{ false };
 };
 
 GFXRECON_END_NAMESPACE(decode)
@@ -108,11 +108,34 @@ bool DefaultVulkanDumpResourcesDelegate::DumpResource(const VulkanDelegateDumpRe
     return false;
 }
 
-static bool DumpBufferToFile(DumpedBuffer&           dumped_buffer,
-                             const std::string&      filename,
-                             const DumpedHostData&   data,
-                             const util::Compressor* compressor)
+static bool DumpBufferToFile(DumpedBuffer&              dumped_buffer,
+                             const std::string&         filename,
+                             const DumpedHostData&      data,
+                             const util::Compressor*    compressor,
+                             VulkanDumpResourcesWriter& writer)
 {
+    // GOOGLE: [dump-resources-threads] The compressed size is part of the output json, so only uncompressed buffers
+    // can be written after replay moved on
+    if (compressor == nullptr)
+    {
+        const bool submitted =
+            writer.Submit(VulkanDumpResourcesWriter::Stage::kWrite, data, [filename](const DumpedHostData& data) {
+                if (!util::bufferwriter::WriteBuffer(filename, data.data(), data.size()))
+                {
+                    GFXRECON_LOG_ERROR("Error writing file %s", filename.c_str());
+                    return false;
+                }
+                return true;
+            });
+        if (!submitted)
+        {
+            return false;
+        }
+
+        dumped_buffer.filename = filename;
+        return true;
+    }
+
     const size_t bytes_written = util::bufferwriter::WriteBuffer(filename, data.data(), data.size(), compressor);
 
     if (!bytes_written)
@@ -209,7 +232,8 @@ bool DefaultVulkanDumpResourcesDelegate::DumpBufferToFile(const VulkanDelegateDu
     const std::string filename =
         std::invoke(filename_generator, *this, *dumped_resource, delegate_context.before_command);
 
-    return gfxrecon::decode::DumpBufferToFile(*dumped_buffer, filename, buffer_data.data, delegate_context.compressor);
+    return gfxrecon::decode::DumpBufferToFile(
+        *dumped_buffer, filename, buffer_data.data, delegate_context.compressor, writer_);
 }
 
 static constexpr util::imagewriter::DataFormats VkFormatToImageWriterDataFormat(VkFormat              format,
@@ -339,52 +363,44 @@ bool DefaultVulkanDumpResourcesDelegate::DumpImageToFile(DumpedResourceBase*
                 VkFormatToImageWriterDataFormat(dumped_image.dumped_format, sub_res.aspect);
             assert(image_writer_format != util::imagewriter::DataFormats::kFormat_UNSPECIFIED);
 
-            const uint32_t texel_size = vkuFormatElementSizeWithAspect(dumped_image.dumped_format, sub_res.aspect);
-            const uint32_t stride     = texel_size * sub_res.scaled_extent.width;
-
-            if (output_image_format == kFormatBMP)
-            {
-                if (options_.dump_resources_dump_separate_alpha)
-                {
-                    util::imagewriter::WriteBmpImageSeparateAlpha(filename,
-                                                                  sub_res.scaled_extent.width,
-                                                                  sub_res.scaled_extent.height,
-                                                                  static_cast<const void*>(image_dumped_data[i].data()),
-                                                                  stride,
-                                                                  image_writer_format);
-                }
-                else
-                {
-                    util::imagewriter::WriteBmpImage(filename,
-                                                     sub_res.scaled_extent.width,
-                                                     sub_res.scaled_extent.height,
-                                                     static_cast<const void*>(image_dumped_data[i].data()),
-                                                     stride,
-                                                     image_writer_format,
-                                                     vkuFormatHasAlpha(image_info->format));
-                }
-            }
-            else if (output_image_format == KFormatPNG)
+            const uint32_t texel_size     = vkuFormatElementSizeWithAspect(dumped_image.dumped_format, sub_res.aspect);
+            const uint32_t stride         = texel_size * sub_res.scaled_extent.width;
+            const uint32_t width          = sub_res.scaled_extent.width;
+            const uint32_t height         = sub_res.scaled_extent.height;
+            const bool     has_alpha      = vkuFormatHasAlpha(image_info->format);
+            const bool     separate_alpha = options_.dump_resources_dump_separate_alpha;
+
+            // GOOGLE: [dump-resources-threads] Encoding is the costly part of dumping an image, so it is done by the
+            // writer. Everything the task uses is captured by value.
+            const bool submitted = writer_.Submit(
+                VulkanDumpResourcesWriter::Stage::kEncode, image_dumped_data[i], [=](const DumpedHostData& data) {
+                    const void* pixels = static_cast<const void*>(data.data());
+                    if (output_image_format == kFormatBMP)
+                    {
+                        if (separate_alpha)
+                        {
+                            return util::imagewriter::WriteBmpImageSeparateAlpha(
+                                filename, width, height, pixels, stride, image_writer_format);
+                        }
+                        return util::imagewriter::WriteBmpImage(
+                            filename, width, height, pixels, stride, image_writer_format, has_alpha);
+                    }
+                    else if (output_image_format == KFormatPNG)
+                    {
+                        if (separate_alpha)
+                        {
+                            return util::imagewriter::WritePngImageSeparateAlpha(
+                                filename, width, height, pixels, stride, image_writer_format);
+                        }
+                        return util::imagewriter::WritePngImage(
+                            filename, width, height, pixels, stride, image_writer_format, has_alpha);
+                    }
+                    return true;
+                });
+            if (!submitted)
             {
-                if (options_.dump_resources_dump_separate_alpha)
-                {
-                    util::imagewriter::WritePngImageSeparateAlpha(filename,
-                                                                  sub_res.scaled_extent.width,
-                                                                  sub_res.scaled_extent.height,
-                                                                  static_cast<const void*>(image_dumped_data[i].data()),
-                                                                  stride,
-                                                                  image_writer_format);
-                }
-                else
-                {
-                    util::imagewriter::WritePngImage(filename,
-                                                     sub_res.scaled_extent.width,
-                                                     sub_res.scaled_extent.height,
-                                                     static_cast<const void*>(image_dumped_data[i].data()),
-                                                     stride,
-                                                     image_writer_format,
-                                                     vkuFormatHasAlpha(image_info->format));
-                }
+                GFXRECON_LOG_ERROR("Failed writing file %s", filename.c_str());
+                return false;
             }
         }
         else
@@ -397,6 +413,29 @@ bool DefaultVulkanDumpResourcesDelegate::DumpImageToFile(DumpedResourceBase*
             }
 
             sub_res.size = image_dumped_data[i].size();
+
+            // GOOGLE: [dump-resources-threads] The compressed size is part of the output json, so only uncompressed
+            // images can be written after replay moved on
+            if (compressor == nullptr)
+            {
+                const bool submitted =
+                    writer_.Submit(VulkanDumpResourcesWriter::Stage::kWrite,
+                                   image_dumped_data[i],
+                                   [filename](const DumpedHostData& data) {
+                                       if (!util::bufferwriter::WriteBuffer(filename, data.data(), data.size()))
+                                       {
+                                           GFXRECON_LOG_ERROR("Failed writing file %s", filename.c_str());
+                                           return false;
+                                       }
+                                       return true;
+                                   });
+                if (!submitted)
+                {
+                    return false;
+                }
+                continue;
+            }
+
             const size_t bytes_written =
                 util::bufferwriter::WriteBuffer(filename,
                                                 static_cast<const void*>(image_dumped_data[i].data()),
@@ -409,10 +448,7 @@ bool DefaultVulkanDumpResourcesDelegate::DumpImageToFile(DumpedResourceBase*
                 return false;
             }
 
-            if (compressor != nullptr)
-            {
-                sub_res.compressed_size = bytes_written;
-            }
+            sub_res.compressed_size = bytes_written;
         }
     }
 
@@ -498,7 +534,7 @@ bool DefaultVulkanDumpResourcesDelegate::DumpTLASToFile(const DumpedResourceBase
                                                               before_command);
 
         gfxrecon::decode::DumpBufferToFile(
-            dumped_as.serialized_buffer, filename, dumped_as_data.serialized_data, compressor);
+            dumped_as.serialized_buffer, filename, dumped_as_data.serialized_data, compressor, writer_);
     }
 
     // Dump instance buffers
@@ -523,8 +559,11 @@ bool DefaultVulkanDumpResourcesDelegate::DumpTLASToFile(const DumpedResourceBase
                                                                   dumped_resource.ppl_stage,
                                                                   before_command,
                                                                   static_cast<uint32_t>(i));
-            gfxrecon::decode::DumpBufferToFile(
-                instance_buffer->instance_buffer, filename, instance_buffer_host_data->instance_buffer, compressor);
+            gfxrecon::decode::DumpBufferToFile(instance_buffer->instance_buffer,
+                                               filename,
+                                               instance_buffer_host_data->instance_buffer,
+                                               compressor,
+                                               writer_);
         }
     }
 
@@ -574,7 +613,7 @@ bool DefaultVulkanDumpResourcesDelegate::DumpBLASToFile(const DumpedResourceBase
                                                               before_command);
 
         gfxrecon::decode::DumpBufferToFile(
-            dumped_as.serialized_buffer, filename, dumped_as_data.serialized_data, compressor);
+            dumped_as.serialized_buffer, filename, dumped_as_data.serialized_data, compressor, writer_);
     }
 
     if (!dumped_as.dump_build_input_buffers)
@@ -606,7 +645,7 @@ bool DefaultVulkanDumpResourcesDelegate::DumpBLASToFile(const DumpedResourceBase
                                                                       before_command,
                                                                       static_cast<uint32_t>(i));
                 gfxrecon::decode::DumpBufferToFile(
-                    triangles->vertex_buffer, filename, triangles_data->vertex_buffer, compressor);
+                    triangles->vertex_buffer, filename, triangles_data->vertex_buffer, compressor, writer_);
             }
 
             // Index buffer
@@ -619,7 +658,7 @@ bool DefaultVulkanDumpResourcesDelegate::DumpBLASToFile(const DumpedResourceBase
                                                                       before_command,
                                                                       static_cast<uint32_t>(i));
                 gfxrecon::decode::DumpBufferToFile(
-                    triangles->index_buffer, filename, triangles_data->index_buffer, compressor);
+                    triangles->index_buffer, filename, triangles_data->index_buffer, compressor, writer_);
             }
 
             // Transform buffer
@@ -632,7 +671,7 @@ bool DefaultVulkanDumpResourcesDelegate::DumpBLASToFile(const DumpedResourceBase
                                                                       before_command,
                                                                       static_cast<uint32_t>(i));
                 gfxrecon::decode::DumpBufferToFile(
-                    triangles->transform_buffer, filename, triangles_data->transform_buffer, compressor);
+                    triangles->transform_buffer, filename, triangles_data->transform_buffer, compressor, writer_);
             }
         }
         // AABBs
@@ -651,7 +690,8 @@ bool DefaultVulkanDumpResourcesDelegate::DumpBLASToFile(const DumpedResourceBase
                                                                       dumped_resource.ppl_stage,
                                                                       before_command,
                                                                       static_cast<uint32_t>(i));
-                gfxrecon::decode::DumpBufferToFile(aabb->aabb_buffer, filename, aabb_data->aabb_buffer, compressor);
+                gfxrecon::decode::DumpBufferToFile(
+                    aabb->aabb_buffer, filename, aabb_data->aabb_buffer, compressor, writer_);
             }
         }
     }
@@ -2013,8 +2053,11 @@ bool DefaultVulkanDumpResourcesDelegate::DumpTransferCommandToFile(
         GFXRECON_ASSERT(dumped_init_buffer != nullptr);
         const std::string filename =
             GenerateTransferToBufferRegionFilename(*delegate_context.dumped_resource, false, NO_INDEX);
-        gfxrecon::decode::DumpBufferToFile(
-            dumped_init_buffer->dumped_buffer, filename, init_buffer_host_data->data, delegate_context.compressor);
+        gfxrecon::decode::DumpBufferToFile(dumped_init_buffer->dumped_buffer,
+                                           filename,
+                                           init_buffer_host_data->data,
+                                           delegate_context.compressor,
+                                           writer_);
     }
     else if (const auto* init_image_host_data =
                  std::get_if<VulkanDelegateImageDumpedData>(&dumped_transfer_host_data->dumped_data))
@@ -2052,7 +2095,8 @@ bool DefaultVulkanDumpResourcesDelegate::DumpTransferCommandToFile(
                 gfxrecon::decode::DumpBufferToFile(dumped_copy_buffer->regions[i].dumped_buffer,
                                                    filename,
                                                    region_host_data,
-                                                   delegate_context.compressor);
+                                                   delegate_context.compressor,
+                                                   writer_);
             }
         }
         else
@@ -2073,7 +2117,8 @@ bool DefaultVulkanDumpResourcesDelegate::DumpTransferCommandToFile(
                 gfxrecon::decode::DumpBufferToFile(dumped_copy_image_to_buffer->regions[i].dumped_buffer,
                                                    filename,
                                                    region_host_data,
-                                                   delegate_context.compressor);
+                                                   delegate_context.compressor,
+                                                   writer_);
             }
         }
     }
@@ -27,6 +27,7 @@
 #include "decode/vulkan_replay_dump_resources_compute_ray_tracing.h"
 #include "decode/vulkan_replay_dump_resources_transfer.h"
 #include "decode/vulkan_replay_dump_resources_json.h"
+#include "decode/vulkan_replay_dump_resources_writer.h"
 #include "format/format.h"
 #include "util/compressor.h"
 #include "util/logging.h"
@@ -212,7 +213,7 @@ class DefaultVulkanDumpResourcesDelegate : public VulkanDumpResourcesDelegate
                                        const std::string          capture_filename) :
         VulkanDumpResourcesDelegate(options, capture_filename),
         dump_json_(options), options_(options), object_info_table_(object_info_table),
-        capture_filename_(capture_filename)
+        capture_filename_(capture_filename), writer_(options.dump_resources_threads)
     {}
     virtual ~DefaultVulkanDumpResourcesDelegate() {}
 
@@ -229,7 +230,12 @@ class DefaultVulkanDumpResourcesDelegate : public VulkanDumpResourcesDelegate
 
     virtual void DumpEnd() override { dump_json_.BlockEnd(); }
 
-    virtual void Close() override { dump_json_.Close(); }
+    virtual void Close() override
+    {
+        // GOOGLE: [dump-resources-threads] Wait for the resources still being written
+        writer_.Finish();
+        dump_json_.Close();
+    }
 
   private:
     // Images
@@ -387,6 +393,9 @@ class DefaultVulkanDumpResourcesDelegate : public VulkanDumpResourcesDelegate
     const VulkanReplayOptions&    options_;
     CommonObjectInfoTable&        object_info_table_;
     const std::string             capture_filename_;
+
+    // GOOGLE: [dump-resources-threads]
+    VulkanDumpResourcesWriter writer_;
 };
 
 GFXRECON_END_NAMESPACE(gfxrecon)
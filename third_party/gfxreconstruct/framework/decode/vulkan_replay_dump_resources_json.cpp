@@ -65,6 +65,8 @@ VulkanReplayDumpResourcesJson::VulkanReplayDumpResourcesJson(const VulkanReplayO
         options.dump_resources_dump_build_AS_input_buffers;
     dr_options[kVDROptionBinaryFileCompressionType] =
         format::GetCompressionTypeName(options.dump_resources_binary_file_compression_type);
+    // GOOGLE: [dump-resources-threads]
+    dr_options[kVDROptionDumpThreads] = options.dump_resources_threads;
 };
 
 bool VulkanReplayDumpResourcesJson::InitializeFile(const std::string& filename)
@@ -46,6 +46,8 @@ static const char* kVDROptionJsonOutputPerCommand      = "JsonOutputPerCommand";
 static const char* kVDROptionBinaryFileCompressionType = "BinaryFileCompressionType";
 static const char* kVDROptionDumpBuildAccelerationStructuresInputBuffers =
     "DumpBuildAccelerationStructuresInputBuffers";
+// GOOGLE: [dump-resources-threads]
+static const char* kVDROptionDumpThreads = "DumpThreads";
 
 static const char* ImageFormatToString(gfxrecon::util::ScreenshotFormat format)
 {
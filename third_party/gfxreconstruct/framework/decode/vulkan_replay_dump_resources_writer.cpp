@@ -0,0 +1,204 @@
+/*
+ Copyright 2026 Google LLC
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+ http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#include "decode/vulkan_replay_dump_resources_writer.h"
+#include "util/logging.h"
+
+#include <algorithm>
+#include <cinttypes>
+#include <exception>
+#include <memory>
+#include <utility>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+static const char* StageName(VulkanDumpResourcesWriter::Stage stage)
+{
+    switch (stage)
+    {
+        case VulkanDumpResourcesWriter::Stage::kEncode:
+            return "encode";
+        case VulkanDumpResourcesWriter::Stage::kWrite:
+            return "write";
+        default:
+            return "unknown";
+    }
+}
+
+static double ToSeconds(std::chrono::steady_clock::duration duration)
+{
+    return std::chrono::duration<double>(duration).count();
+}
+
+static double ToMiB(uint64_t bytes)
+{
+    return static_cast<double>(bytes) / (1024.0 * 1024.0);
+}
+
+VulkanDumpResourcesWriter::VulkanDumpResourcesWriter(uint32_t num_threads, size_t max_pending_bytes) :
+    max_pending_bytes_(max_pending_bytes), thread_pool_(num_threads)
+{}
+
+VulkanDumpResourcesWriter::~VulkanDumpResourcesWriter()
+{
+    Finish();
+}
+
+bool VulkanDumpResourcesWriter::Submit(Stage stage, const DumpedData& data, WriteTask task)
+{
+    if (!started_)
+    {
+        start_time_ = Clock::now();
+        started_    = true;
+    }
+
+    if (!IsAsync())
+    {
+        return RunTask(stage, data, task);
+    }
+
+    const size_t size = data.size();
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+        // A resource larger than the queue is still accepted once the queue is empty
+        if (pending_bytes_ > 0 && pending_bytes_ + size > max_pending_bytes_)
+        {
+            const Clock::time_point wait_start = Clock::now();
+            condition_.wait(
+                lock, [this, size] { return pending_bytes_ == 0 || pending_bytes_ + size <= max_pending_bytes_; });
+            replay_wait_time_ += Clock::now() - wait_start;
+        }
+        pending_bytes_ += size;
+        ++pending_tasks_;
+        peak_pending_bytes_ = std::max(peak_pending_bytes_, pending_bytes_);
+    }
+
+    auto data_copy = std::make_shared<DumpedData>(data);
+    thread_pool_.post([this, stage, data_copy, task = std::move(task)]() {
+        RunTask(stage, *data_copy, task);
+
+        // Release the data before the replay thread is allowed to queue more
+        const size_t data_size = data_copy->size();
+        DumpedData().swap(*data_copy);
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            pending_bytes_ -= data_size;
+            --pending_tasks_;
+        }
+        condition_.notify_all();
+    });
+    return true;
+}
+
+bool VulkanDumpResourcesWriter::RunTask(Stage stage, const DumpedData& data, const WriteTask& task)
+{
+    const Clock::time_point task_start = Clock::now();
+    bool                    success    = false;
+    // A task that throws is counted as failed, so that the pending task it was accounted as is still released
+    try
+    {
+        success = task(data);
+    }
+    catch (const std::exception& error)
+    {
+        GFXRECON_LOG_ERROR("Dump resources: %s task failed: %s", StageName(stage), error.what());
+    }
+    catch (...)
+    {
+        GFXRECON_LOG_ERROR("Dump resources: %s task failed with an unknown exception", StageName(stage));
+    }
+    const Clock::duration task_time = Clock::now() - task_start;
+
+    std::lock_guard<std::mutex> lock(mutex_);
+    StageStats&                 stats = stage_stats_[static_cast<uint32_t>(stage)];
+    ++stats.tasks;
+    stats.bytes += data.size();
+    stats.busy_time += task_time;
+    if (!success)
+    {
+        ++stats.failed_tasks;
+    }
+    return success;
+}
+
+bool VulkanDumpResourcesWriter::Finish()
+{
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+        condition_.wait(lock, [this] { return pending_tasks_ == 0; });
+    }
+
+    if (started_)
+    {
+        LogStats();
+        started_ = false;
+    }
+
+    bool success = true;
+    for (StageStats& stats : stage_stats_)
+    {
+        success = success && (stats.failed_tasks == 0);
+        stats   = StageStats();
+    }
+    replay_wait_time_   = Clock::duration(0);
+    peak_pending_bytes_ = 0;
+    return success;
+}
+
+void VulkanDumpResourcesWriter::LogStats() const
+{
+    const double elapsed = ToSeconds(Clock::now() - start_time_);
+
+    GFXRECON_LOG_INFO(
+        "Dump resources: %zu worker thread(s), %.2f s since the first resource", thread_pool_.numthreads(), elapsed);
+    uint64_t total_bytes = 0;
+    for (uint32_t i = 0; i < static_cast<uint32_t>(Stage::kNumStages); ++i)
+    {
+        const StageStats& stats = stage_stats_[i];
+        total_bytes += stats.bytes;
+        if (stats.tasks == 0)
+        {
+            continue;
+        }
+
+        // Throughput of a single thread working on the stage
+        const double busy_time = ToSeconds(stats.busy_time);
+        GFXRECON_LOG_INFO("  %-6s: %" PRIu64 " resource(s), %.2f MiB in %.2f s busy (%.2f MiB/s per thread)",
+                          StageName(static_cast<Stage>(i)),
+                          stats.tasks,
+                          ToMiB(stats.bytes),
+                          busy_time,
+                          busy_time > 0.0 ? ToMiB(stats.bytes) / busy_time : 0.0);
+        if (stats.failed_tasks > 0)
+        {
+            GFXRECON_LOG_WARNING("  %-6s: %" PRIu64 " resource(s) failed to be written",
+                                 StageName(static_cast<Stage>(i)),
+                                 stats.failed_tasks);
+        }
+    }
+
+    // Rate at which replay read back the resources, including the time it was blocked on the queue
+    GFXRECON_LOG_INFO(
+        "  total : %.2f MiB (%.2f MiB/s)", ToMiB(total_bytes), elapsed > 0.0 ? ToMiB(total_bytes) / elapsed : 0.0);
+    if (IsAsync())
+    {
+        GFXRECON_LOG_INFO("  queue : peak %.2f MiB of %.2f MiB, replay blocked for %.2f s",
+                          ToMiB(peak_pending_bytes_),
+                          ToMiB(max_pending_bytes_),
+                          ToSeconds(replay_wait_time_));
+    }
+}
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -0,0 +1,106 @@
+/*
+ Copyright 2026 Google LLC
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+ http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#ifndef GFXRECON_VULKAN_REPLAY_DUMP_RESOURCES_WRITER_H
+#define GFXRECON_VULKAN_REPLAY_DUMP_RESOURCES_WRITER_H
+
+#include "util/defines.h"
+#include "util/threadpool.h"
+
+#include <chrono>
+#include <condition_variable>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <mutex>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+// Encodes and writes the resources read back by dump resources.
+//
+// Without worker threads, every resource is written by the replay thread as soon as it has been read back, as
+// before. With worker threads, the read back data is copied into a bounded queue and encoded and written by a pool
+// of workers while replay continues. The replay thread only blocks when the queue already holds max_pending_bytes,
+// so that a capture which reads back faster than it can be written does not run out of memory.
+//
+// The time spent and the bytes processed by each stage are logged by Finish().
+class VulkanDumpResourcesWriter
+{
+  public:
+    enum class Stage : uint32_t
+    {
+        // Conversion to an image file format (BMP, PNG) and write
+        kEncode = 0,
+        // Write of raw data
+        kWrite,
+        kNumStages
+    };
+
+    using DumpedData = std::vector<uint8_t>;
+    using WriteTask  = std::function<bool(const DumpedData& data)>;
+
+    static constexpr size_t kDefaultMaxPendingBytes = 256 * 1024 * 1024;
+
+    VulkanDumpResourcesWriter(uint32_t num_threads, size_t max_pending_bytes = kDefaultMaxPendingBytes);
+
+    ~VulkanDumpResourcesWriter();
+
+    bool IsAsync() const { return thread_pool_.numthreads() > 0; }
+
+    // Runs task on data, either right away or on a worker thread with a copy of data. The task must not reference
+    // anything that does not outlive it. A task that throws counts as failed. Returns false if the task ran right
+    // away and failed; the failures of the tasks run by a worker are returned by Finish().
+    bool Submit(Stage stage, const DumpedData& data, WriteTask task);
+
+    // Waits for all the submitted tasks and logs the throughput of each stage. Returns false if any task submitted
+    // since the previous call failed.
+    bool Finish();
+
+  private:
+    using Clock = std::chrono::steady_clock;
+
+    struct StageStats
+    {
+        uint64_t        tasks        = 0;
+        uint64_t        failed_tasks = 0;
+        uint64_t        bytes        = 0;
+        Clock::duration busy_time{ 0 };
+    };
+
+    bool RunTask(Stage stage, const DumpedData& data, const WriteTask& task);
+
+    void LogStats() const;
+
+    size_t max_pending_bytes_;
+
+    std::mutex              mutex_;
+    std::condition_variable condition_;
+    size_t                  pending_bytes_{ 0 };
+    size_t                  pending_tasks_{ 0 };
+    size_t                  peak_pending_bytes_{ 0 };
+
+    StageStats        stage_stats_[static_cast<uint32_t>(Stage::kNumStages)];
+    Clock::duration   replay_wait_time_{ 0 };
+    Clock::time_point start_time_;
+    bool              started_{ false };
+
+    // Last, so that the workers are joined before anything they use is destroyed
+    util::ThreadPool thread_pool_;
+};
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_VULKAN_REPLAY_DUMP_RESOURCES_WRITER_H
@@ -160,6 +160,10 @@ struct VulkanReplayOptions : public ReplayOptions
 
     format::CompressionType dump_resources_binary_file_compression_type{ format::CompressionType::kNone };
 
+    // GOOGLE: [dump-resources-threads] Number of threads encoding and writing dumped resources, or 0 to write them
+    // from the replay thread
+    uint32_t dump_resources_threads{ 0 };
+
     bool preload_measurement_range{ false };
 
     std::string load_pipeline_cache_filename;
@@ -0,0 +1,144 @@
+#!/usr/bin/python3 -i
+#
+# Copyright 2026 Google LLC
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent cache of parsed Windows SDK headers.
+
+Running CppHeaderParser over the SDK headers is the largest fixed cost of every generate_dx12.py
+run. The cache stores each parsed Dx12CppHeader, keyed by a hash of the header content, the
+CppHeaderParser sources and version, the Dx12CppHeader preprocessing and the Python version. Any
+change to an input changes the key, so stale entries are never used; they are simply left behind.
+
+The headers are pickled rather than converted with CppHeader.toJSON: toJSON strips the 'parent'
+links that Dx12BaseGenerator.get_value_info uses to name nested structs, and turns the TagStr
+values into plain strings, which the generators tell apart from integer array sizes.
+"""
+
+import copyreg
+import gc
+import hashlib
+import os
+import pickle
+import sys
+
+from CppHeaderParser import CppHeaderParser
+# Imported the same way as by generate_dx12.py, so that the parser is only patched once
+from dx12_generators import dx12_CppHeaderParser
+from dx12_generators.dx12_CppHeaderParser import Dx12CppHeader
+
+# Default cache location, next to the generators
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.header_cache'
+)
+
+# Bump when the layout of the cached data changes
+CACHE_VERSION = 1
+
+
+def _make_tag_str(value, location):
+    return CppHeaderParser.TagStr(value, location=location)
+
+
+def _reduce_tag_str(tag_str):
+    # TagStr.__new__ requires the location, which the default str pickling does not pass
+    return _make_tag_str, (str(tag_str), tag_str.location)
+
+
+copyreg.pickle(CppHeaderParser.TagStr, _reduce_tag_str)
+
+
+def _parser_fingerprint():
+    """Returns the hash of the parser sources, computed once per run"""
+    global _parser_hash
+    if _parser_hash is None:
+        key = hashlib.sha256()
+        key.update(str(CACHE_VERSION).encode('utf-8'))
+        key.update(sys.version.encode('utf-8'))
+        key.update(str(CppHeaderParser.version).encode('utf-8'))
+        parser_dir = os.path.dirname(os.path.abspath(CppHeaderParser.__file__))
+        for path in [
+            os.path.join(parser_dir, 'CppHeaderParser.py'),
+            os.path.join(parser_dir, 'lexer.py'),
+            os.path.abspath(dx12_CppHeaderParser.__file__)
+        ]:
+            with open(path, 'rb') as f:
+                key.update(f.read())
+        _parser_hash = key.digest()
+    return _parser_hash
+
+
+_parser_hash = None
+
+
+def header_cache_key(header_file_name):
+    """Returns the cache key for the header parsed by the current parser"""
+    key = hashlib.sha256(_parser_fingerprint())
+    with open(header_file_name, 'rb') as f:
+        key.update(f.read())
+    return key.hexdigest()
+
+
+def load_cached_header(key, cache_dir=DEFAULT_CACHE_DIR):
+    """Returns the header stored for the key, or None if nothing was stored for the key"""
+    path = os.path.join(cache_dir, key + '.pickle')
+    if not os.path.isfile(path):
+        return None
+
+    # The parsed header is a large graph of small objects, so the cyclic collector would otherwise
+    # run many times while it is rebuilt
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError):
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def store_cached_header(key, header, cache_dir=DEFAULT_CACHE_DIR):
+    """Stores a parsed header for the key. Failing to store is not an error; the header will be
+    parsed again on the next run.
+    """
+    path = os.path.join(cache_dir, key + '.pickle')
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic, so that concurrent runs never read a partially written entry
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError,
+            RecursionError) as error:
+        print(
+            'Warning: could not cache the parsed header:', error,
+            file=sys.stderr
+        )
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_dx12_cpp_header(header_file_name, cache_dir=DEFAULT_CACHE_DIR):
+    """Returns the Dx12CppHeader for the header file, parsing it only if it is not in the cache.
+    A cache_dir of None disables the cache.
+    """
+    if cache_dir is None:
+        return Dx12CppHeader(header_file_name)
+
+    key = header_cache_key(header_file_name)
+    header = load_cached_header(key, cache_dir)
+    if header is None:
+        header = Dx12CppHeader(header_file_name)
+        store_cached_header(key, header, cache_dir)
+    return header
@@ -20,6 +20,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import argparse
 import os
 import sys
 
@@ -91,6 +92,12 @@ WINAPI_SOURCE_LIST = [
 ]
 
 if __name__ == '__main__':
+    # GOOGLE: [dx12-header-cache] Options for the cache of parsed headers
+    parser = argparse.ArgumentParser(description='Generate the DX12 source files from the Windows and Agility SDK headers.')
+    parser.add_argument('--no-header-cache', dest='header_cache', action='store_false', help='Always parse the headers, instead of reusing previously parsed ones')
+    parser.add_argument('--header-cache-dir', help='Directory storing the parsed headers')
+    args = parser.parse_args()
+
     env = os.environ
     env['PYTHONPATH'] = os.pathsep.join(sys.path)
 
@@ -117,7 +124,12 @@ if __name__ == '__main__':
     sys.path.append(LIB_CPPHEADERPARSER_DIR)
 
     from gencode import GenCode
-    from dx12_generators.dx12_CppHeaderParser import Dx12CppHeader, Dx12CppClass
+    from dx12_generators.dx12_CppHeaderParser import Dx12CppClass
+    from dx12_header_cache import load_dx12_cpp_header, DEFAULT_CACHE_DIR
+
+    header_cache_dir = None
+    if args.header_cache:
+        header_cache_dir = args.header_cache_dir or DEFAULT_CACHE_DIR
 
     header_dict = {}
     # Deal with DX12 first, and then DXGI. It will include <dxgiformat.h> before include dxgi headers.
@@ -128,7 +140,7 @@ if __name__ == '__main__':
         source_file = os.path.join(SCRIPT_DIR, '..', '..', 'external', 'AgilitySDK', 'include', source)
 
         print('Parsing', source_file)
-        header_dict[source[source.find('\\') + 1:]] = Dx12CppHeader(source_file)
+        header_dict[source[source.find('\\') + 1:]] = load_dx12_cpp_header(source_file, header_cache_dir)
 
     for source in WINDOWS_SDK_SOURCE_LIST:
         source_file = os.path.join(
@@ -136,14 +148,14 @@ if __name__ == '__main__':
         )
         print('Parsing', source_file)
         header_dict[source[source.find('\\') + 1:]
-                    ] = Dx12CppHeader(source_file)
+                    ] = load_dx12_cpp_header(source_file, header_cache_dir)
 
     for source in WINAPI_SOURCE_LIST:
         source_file = os.path.join(
             WINDOWS_SDK_DIR + 'Include\\' + WINDOWS_SDK_VERSION, source[0]
         )
         print('Parsing', source_file)
-        header = Dx12CppHeader(source_file)
+        header = load_dx12_cpp_header(source_file, header_cache_dir)
         header1 = Dx12CppClass()
 
         for k, v in header.classes.items():
@@ -24,9 +24,11 @@
 '''
 
 import argparse
+import multiprocessing
 import os
 import sys
 import subprocess
+import time
 
 SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
 KHRONOS_REGISTRY_DIR = os.path.normpath(
@@ -95,6 +97,74 @@ generate_targets = [
     'generated_vulkan_stype_util.h',
 ]
 
+# Set by generate_in_process() before the workers are forked. The workers inherit them, so the
+# parsed registry is shared copy-on-write instead of being parsed again for every target.
+_gencode = None
+_registry = None
+_gencode_args = None
+
+
+def _generate_target(target):
+    '''Generate one target from the registry inherited from the parent process'''
+    start = time.perf_counter()
+    args = _gencode.make_arg_parser().parse_args(_gencode_args + [target])
+    result = _gencode.gen_target(args)
+    if result is None:
+        raise Exception(f'Error: no generator for {target}')
+    gen, options = result
+    _gencode.bind_registry(_registry, gen, options)
+    _registry.apiGen()
+    return target, time.perf_counter() - start
+
+
+def generate_in_process(targets, gencode_args, jobs):
+    '''Parse the registry once, then generate the targets in a pool of forked processes.
+    Registry.apiGen() leaves the registry modified, so every target gets a freshly forked worker
+    (maxtasksperchild=1) with a pristine copy of the parsed registry.
+    '''
+    global _gencode, _registry, _gencode_args
+    sys.path[:0] = [
+        KHRONOS_REGISTRY_DIR,
+        KHRONOS_GENERATOR_DIR,
+        GENERATOR_DIR,
+        VK_HEADERS_DIR,
+    ]
+    import gencode
+    _gencode = gencode
+    _gencode_args = gencode_args
+
+    start = time.perf_counter()
+    args = gencode.make_arg_parser().parse_args(gencode_args + [targets[0]])
+    gen, options = gencode.gen_target(args)
+    _registry = gencode.load_registry(gen, options, args)
+    print(f'Parsed registry in {time.perf_counter() - start:.2f}s')
+
+    timings = {}
+    context = multiprocessing.get_context('fork')
+    with context.Pool(jobs, maxtasksperchild=1) as pool:
+        for target, elapsed in pool.imap_unordered(_generate_target, targets):
+            print(f'Generated {target} in {elapsed:.2f}s')
+            timings[target] = elapsed
+    return timings
+
+
+def generate_with_subprocesses(targets, gencode_args, env):
+    '''Generate the targets one at a time, running gencode.py in a new process for each'''
+    timings = {}
+    for target in targets:
+        print('Generating', target)
+        start = time.perf_counter()
+        subprocess.call(
+            [sys.executable, os.path.join(GENERATOR_DIR, 'gencode.py')] +
+            gencode_args + [target],
+            shell=False,
+            env=env,
+            cwd=SCRIPT_DIR,
+        )
+        timings[target] = time.perf_counter() - start
+    return timings
+
+
 if __name__ == '__main__':
     arg_parser = argparse.ArgumentParser(description=__doc__)
     arg_parser.add_argument(
@@ -120,6 +190,25 @@ if __name__ == '__main__':
             ]
         )
     )
+    arg_parser.add_argument(
+        '-j',
+        '--jobs',
+        dest='jobs',
+        type=int,
+        default=os.cpu_count(),
+        help='Number of targets to generate in parallel (default: number of CPUs).'
+    )
+    arg_parser.add_argument(
+        '--subprocess',
+        dest='subprocess',
+        action='store_true',
+        help='\n'.join(
+            [
+                'Run gencode.py in a separate process for each target, one target at a time, parsing the registry for each of them.',
+                'This is always used on platforms that cannot fork.'
+            ]
+        )
+    )
     args = arg_parser.parse_args()
     registry_dir = KHRONOS_REGISTRY_DIR
     if args.registry_dir is not None:
@@ -148,34 +237,40 @@ if __name__ == '__main__':
             VK_HEADERS_DIR,
         ]
     )
-    for target in generate_targets:
-        print('Generating', target)
-        gencode_args = [
-            sys.executable,
-            os.path.join(GENERATOR_DIR, 'gencode.py'),
-            '-o',
-            SCRIPT_DIR,
-            '-configs',
-            GENERATOR_DIR,
-            '-registry',
-            registry_path,
-            '-video',
-            video_path,
-        ]
-        if args.headers_dir is not None:
-            if not os.path.isdir(args.headers_dir):
-                raise Exception(
-                    'Error: extra headers dir', args.headers_dir,
-                    'is not a directory'
-                )
-            gencode_args.extend(
-                ['-headers-dir',
-                 os.path.abspath(args.headers_dir)]
+    gencode_args = [
+        '-o',
+        SCRIPT_DIR,
+        '-configs',
+        GENERATOR_DIR,
+        '-registry',
+        registry_path,
+        '-video',
+        video_path,
+    ]
+    if args.headers_dir is not None:
+        if not os.path.isdir(args.headers_dir):
+            raise Exception(
+                'Error: extra headers dir', args.headers_dir,
+                'is not a directory'
             )
-        gencode_args.append(target)
-        subprocess.call(
-            gencode_args,
-            shell=False,
-            env=env,
-            cwd=SCRIPT_DIR,
+        gencode_args.extend(
+            ['-headers-dir',
+             os.path.abspath(args.headers_dir)]
         )
+
+    # Some targets are listed more than once; parallel workers must not write the same file
+    targets = list(dict.fromkeys(generate_targets))
+    start = time.perf_counter()
+    if args.subprocess or 'fork' not in multiprocessing.get_all_start_methods():
+        timings = generate_with_subprocesses(targets, gencode_args, env)
+    else:
+        os.chdir(SCRIPT_DIR)
+        timings = generate_in_process(targets, gencode_args, max(1, args.jobs))
+    total = time.perf_counter() - start
+
+    slowest = max(timings, key=timings.get)
+    print(
+        f'Generated {len(timings)} targets in {total:.2f}s '
+        f'(sum of targets {sum(timings.values()):.2f}s, '
+        f'slowest {slowest} {timings[slowest]:.2f}s)'
+    )
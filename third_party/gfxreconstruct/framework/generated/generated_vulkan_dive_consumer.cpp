@@ -146,6 +146,14 @@ void VulkanExportDiveConsumer::Process_vkGetDeviceQueue(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkQueueSubmit[] = {
+    { "queue", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "submitCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pSubmits", 0, nullptr },
+    { "fence", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkQueueSubmit = { "vkQueueSubmit", format::ApiCallId::ApiCall_vkQueueSubmit, kDiveArgs_vkQueueSubmit, std::size(kDiveArgs_vkQueueSubmit) };
+
 void VulkanExportDiveConsumer::Process_vkQueueSubmit(
     const ApiCallInfo&                          call_info,
     VkResult                                    returnValue,
@@ -154,14 +162,14 @@ void VulkanExportDiveConsumer::Process_vkQueueSubmit(
     StructPointerDecoder<Decoded_VkSubmitInfo>* pSubmits,
     format::HandleId                            fence)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["queue"], queue, json_options);
-    FieldToJson(args["submitCount"], submitCount, json_options);
-    FieldToJson(args["pSubmits"], pSubmits, json_options);
-    HandleToJson(args["fence"], fence, json_options);
-    util::DiveFunctionData function_data("vkQueueSubmit", 0, call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs();
+    dive_args.Write(queue);
+    dive_args.Write(submitCount);
+    FieldToJson(dive_args.BeginJson(), pSubmits, json_options);
+    dive_args.EndJson();
+    dive_args.Write(fence);
+    util::DiveFunctionData function_data(kDiveSchema_vkQueueSubmit, 0, call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -786,31 +794,40 @@ void VulkanExportDiveConsumer::Process_vkFreeCommandBuffers(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkBeginCommandBuffer[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pBeginInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkBeginCommandBuffer = { "vkBeginCommandBuffer", format::ApiCallId::ApiCall_vkBeginCommandBuffer, kDiveArgs_vkBeginCommandBuffer, std::size(kDiveArgs_vkBeginCommandBuffer) };
+
 void VulkanExportDiveConsumer::Process_vkBeginCommandBuffer(
     const ApiCallInfo&                          call_info,
     VkResult                                    returnValue,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCommandBufferBeginInfo>* pBeginInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pBeginInfo"], pBeginInfo, json_options);
-    util::DiveFunctionData function_data("vkBeginCommandBuffer", 0, call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs();
+    dive_args.Write(commandBuffer);
+    FieldToJson(dive_args.BeginJson(), pBeginInfo, json_options);
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkBeginCommandBuffer, 0, call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkEndCommandBuffer[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkEndCommandBuffer = { "vkEndCommandBuffer", format::ApiCallId::ApiCall_vkEndCommandBuffer, kDiveArgs_vkEndCommandBuffer, std::size(kDiveArgs_vkEndCommandBuffer) };
+
 void VulkanExportDiveConsumer::Process_vkEndCommandBuffer(
     const ApiCallInfo&                          call_info,
     VkResult                                    returnValue,
     format::HandleId                            commandBuffer)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    util::DiveFunctionData function_data("vkEndCommandBuffer", 0, call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs();
+    dive_args.Write(commandBuffer);
+    util::DiveFunctionData function_data(kDiveSchema_vkEndCommandBuffer, 0, call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -822,22 +839,35 @@ void VulkanExportDiveConsumer::Process_vkResetCommandBuffer(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindPipeline[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineBindPoint", sizeof(VkPipelineBindPoint), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPipelineBindPoint>(data), options); } },
+    { "pipeline", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindPipeline = { "vkCmdBindPipeline", format::ApiCallId::ApiCall_vkCmdBindPipeline, kDiveArgs_vkCmdBindPipeline, std::size(kDiveArgs_vkCmdBindPipeline) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindPipeline(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkPipelineBindPoint                         pipelineBindPoint,
     format::HandleId                            pipeline)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineBindPoint"], pipelineBindPoint, json_options);
-    HandleToJson(args["pipeline"], pipeline, json_options);
-    util::DiveFunctionData function_data("vkCmdBindPipeline", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineBindPoint);
+    dive_args.Write(pipeline);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindPipeline, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetViewport[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstViewport", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "viewportCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pViewports", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetViewport = { "vkCmdSetViewport", format::ApiCallId::ApiCall_vkCmdSetViewport, kDiveArgs_vkCmdSetViewport, std::size(kDiveArgs_vkCmdSetViewport) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetViewport(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -845,17 +875,25 @@ void VulkanExportDiveConsumer::Process_vkCmdSetViewport(
     uint32_t                                    viewportCount,
     StructPointerDecoder<Decoded_VkViewport>*   pViewports)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstViewport"], firstViewport, json_options);
-    FieldToJson(args["viewportCount"], viewportCount, json_options);
-    FieldToJson(args["pViewports"], pViewports, json_options);
-    util::DiveFunctionData function_data("vkCmdSetViewport", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs();
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstViewport);
+    dive_args.Write(viewportCount);
+    FieldToJson(dive_args.BeginJson(), pViewports, json_options);
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetViewport, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetScissor[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstScissor", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "scissorCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pScissors", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetScissor = { "vkCmdSetScissor", format::ApiCallId::ApiCall_vkCmdSetScissor, kDiveArgs_vkCmdSetScissor, std::size(kDiveArgs_vkCmdSetScissor) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetScissor(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -863,31 +901,43 @@ void VulkanExportDiveConsumer::Process_vkCmdSetScissor(
     uint32_t                                    scissorCount,
     StructPointerDecoder<Decoded_VkRect2D>*     pScissors)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstScissor"], firstScissor, json_options);
-    FieldToJson(args["scissorCount"], scissorCount, json_options);
-    FieldToJson(args["pScissors"], pScissors, json_options);
-    util::DiveFunctionData function_data("vkCmdSetScissor", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs();
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstScissor);
+    dive_args.Write(scissorCount);
+    FieldToJson(dive_args.BeginJson(), pScissors, json_options);
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetScissor, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetLineWidth[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "lineWidth", sizeof(float), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<float>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetLineWidth = { "vkCmdSetLineWidth", format::ApiCallId::ApiCall_vkCmdSetLineWidth, kDiveArgs_vkCmdSetLineWidth, std::size(kDiveArgs_vkCmdSetLineWidth) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetLineWidth(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     float                                       lineWidth)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["lineWidth"], lineWidth, json_options);
-    util::DiveFunctionData function_data("vkCmdSetLineWidth", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(lineWidth);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetLineWidth, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthBias[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthBiasConstantFactor", sizeof(float), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<float>(data), options); } },
+    { "depthBiasClamp", sizeof(float), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<float>(data), options); } },
+    { "depthBiasSlopeFactor", sizeof(float), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<float>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthBias = { "vkCmdSetDepthBias", format::ApiCallId::ApiCall_vkCmdSetDepthBias, kDiveArgs_vkCmdSetDepthBias, std::size(kDiveArgs_vkCmdSetDepthBias) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthBias(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -895,95 +945,134 @@ void VulkanExportDiveConsumer::Process_vkCmdSetDepthBias(
     float                                       depthBiasClamp,
     float                                       depthBiasSlopeFactor)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["depthBiasConstantFactor"], depthBiasConstantFactor, json_options);
-    FieldToJson(args["depthBiasClamp"], depthBiasClamp, json_options);
-    FieldToJson(args["depthBiasSlopeFactor"], depthBiasSlopeFactor, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthBias", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthBiasConstantFactor);
+    dive_args.Write(depthBiasClamp);
+    dive_args.Write(depthBiasSlopeFactor);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthBias, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetBlendConstants[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "blendConstants", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetBlendConstants = { "vkCmdSetBlendConstants", format::ApiCallId::ApiCall_vkCmdSetBlendConstants, kDiveArgs_vkCmdSetBlendConstants, std::size(kDiveArgs_vkCmdSetBlendConstants) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetBlendConstants(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     PointerDecoder<float>*                      blendConstants)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["blendConstants"], blendConstants, json_options);
-    util::DiveFunctionData function_data("vkCmdSetBlendConstants", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), blendConstants, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetBlendConstants, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthBounds[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "minDepthBounds", sizeof(float), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<float>(data), options); } },
+    { "maxDepthBounds", sizeof(float), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<float>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthBounds = { "vkCmdSetDepthBounds", format::ApiCallId::ApiCall_vkCmdSetDepthBounds, kDiveArgs_vkCmdSetDepthBounds, std::size(kDiveArgs_vkCmdSetDepthBounds) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthBounds(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     float                                       minDepthBounds,
     float                                       maxDepthBounds)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["minDepthBounds"], minDepthBounds, json_options);
-    FieldToJson(args["maxDepthBounds"], maxDepthBounds, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthBounds", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(minDepthBounds);
+    dive_args.Write(maxDepthBounds);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthBounds, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetStencilCompareMask[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "faceMask", sizeof(VkStencilFaceFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkStencilFaceFlags_t(), jdata, util::ReadDiveArg<VkStencilFaceFlags>(data), options); } },
+    { "compareMask", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetStencilCompareMask = { "vkCmdSetStencilCompareMask", format::ApiCallId::ApiCall_vkCmdSetStencilCompareMask, kDiveArgs_vkCmdSetStencilCompareMask, std::size(kDiveArgs_vkCmdSetStencilCompareMask) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetStencilCompareMask(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkStencilFaceFlags                          faceMask,
     uint32_t                                    compareMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkStencilFaceFlags_t(), args["faceMask"], faceMask, json_options);
-    FieldToJson(args["compareMask"], compareMask, json_options);
-    util::DiveFunctionData function_data("vkCmdSetStencilCompareMask", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(faceMask);
+    dive_args.Write(compareMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetStencilCompareMask, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetStencilWriteMask[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "faceMask", sizeof(VkStencilFaceFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkStencilFaceFlags_t(), jdata, util::ReadDiveArg<VkStencilFaceFlags>(data), options); } },
+    { "writeMask", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetStencilWriteMask = { "vkCmdSetStencilWriteMask", format::ApiCallId::ApiCall_vkCmdSetStencilWriteMask, kDiveArgs_vkCmdSetStencilWriteMask, std::size(kDiveArgs_vkCmdSetStencilWriteMask) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetStencilWriteMask(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkStencilFaceFlags                          faceMask,
     uint32_t                                    writeMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkStencilFaceFlags_t(), args["faceMask"], faceMask, json_options);
-    FieldToJson(args["writeMask"], writeMask, json_options);
-    util::DiveFunctionData function_data("vkCmdSetStencilWriteMask", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(faceMask);
+    dive_args.Write(writeMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetStencilWriteMask, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetStencilReference[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "faceMask", sizeof(VkStencilFaceFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkStencilFaceFlags_t(), jdata, util::ReadDiveArg<VkStencilFaceFlags>(data), options); } },
+    { "reference", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetStencilReference = { "vkCmdSetStencilReference", format::ApiCallId::ApiCall_vkCmdSetStencilReference, kDiveArgs_vkCmdSetStencilReference, std::size(kDiveArgs_vkCmdSetStencilReference) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetStencilReference(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkStencilFaceFlags                          faceMask,
     uint32_t                                    reference)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkStencilFaceFlags_t(), args["faceMask"], faceMask, json_options);
-    FieldToJson(args["reference"], reference, json_options);
-    util::DiveFunctionData function_data("vkCmdSetStencilReference", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(faceMask);
+    dive_args.Write(reference);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetStencilReference, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindDescriptorSets[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineBindPoint", sizeof(VkPipelineBindPoint), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPipelineBindPoint>(data), options); } },
+    { "layout", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstSet", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "descriptorSetCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pDescriptorSets", 0, nullptr },
+    { "dynamicOffsetCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pDynamicOffsets", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindDescriptorSets = { "vkCmdBindDescriptorSets", format::ApiCallId::ApiCall_vkCmdBindDescriptorSets, kDiveArgs_vkCmdBindDescriptorSets, std::size(kDiveArgs_vkCmdBindDescriptorSets) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindDescriptorSets(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -995,20 +1084,35 @@ void VulkanExportDiveConsumer::Process_vkCmdBindDescriptorSets(
     uint32_t                                    dynamicOffsetCount,
     PointerDecoder<uint32_t>*                   pDynamicOffsets)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineBindPoint"], pipelineBindPoint, json_options);
-    HandleToJson(args["layout"], layout, json_options);
-    FieldToJson(args["firstSet"], firstSet, json_options);
-    FieldToJson(args["descriptorSetCount"], descriptorSetCount, json_options);
-    HandleToJson(args["pDescriptorSets"], pDescriptorSets, json_options);
-    FieldToJson(args["dynamicOffsetCount"], dynamicOffsetCount, json_options);
-    FieldToJson(args["pDynamicOffsets"], pDynamicOffsets, json_options);
-    util::DiveFunctionData function_data("vkCmdBindDescriptorSets", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineBindPoint);
+    dive_args.Write(layout);
+    dive_args.Write(firstSet);
+    dive_args.Write(descriptorSetCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pDescriptorSets, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(dynamicOffsetCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDynamicOffsets, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindDescriptorSets, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdBindIndexBuffer[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "indexType", sizeof(VkIndexType), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkIndexType>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindIndexBuffer = { "vkCmdBindIndexBuffer", format::ApiCallId::ApiCall_vkCmdBindIndexBuffer, kDiveArgs_vkCmdBindIndexBuffer, std::size(kDiveArgs_vkCmdBindIndexBuffer) };
 
 void VulkanExportDiveConsumer::Process_vkCmdBindIndexBuffer(
     const ApiCallInfo&                          call_info,
@@ -1017,17 +1121,24 @@ void VulkanExportDiveConsumer::Process_vkCmdBindIndexBuffer(
     VkDeviceSize                                offset,
     VkIndexType                                 indexType)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    FieldToJson(args["indexType"], indexType, json_options);
-    util::DiveFunctionData function_data("vkCmdBindIndexBuffer", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(indexType);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindIndexBuffer, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindVertexBuffers[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstBinding", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "bindingCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pBuffers", 0, nullptr },
+    { "pOffsets", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindVertexBuffers = { "vkCmdBindVertexBuffers", format::ApiCallId::ApiCall_vkCmdBindVertexBuffers, kDiveArgs_vkCmdBindVertexBuffers, std::size(kDiveArgs_vkCmdBindVertexBuffers) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindVertexBuffers(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1036,17 +1147,33 @@ void VulkanExportDiveConsumer::Process_vkCmdBindVertexBuffers(
     HandlePointerDecoder<VkBuffer>*             pBuffers,
     PointerDecoder<VkDeviceSize>*               pOffsets)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstBinding"], firstBinding, json_options);
-    FieldToJson(args["bindingCount"], bindingCount, json_options);
-    HandleToJson(args["pBuffers"], pBuffers, json_options);
-    FieldToJson(args["pOffsets"], pOffsets, json_options);
-    util::DiveFunctionData function_data("vkCmdBindVertexBuffers", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstBinding);
+    dive_args.Write(bindingCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pBuffers, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pOffsets, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindVertexBuffers, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdDraw[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "vertexCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "instanceCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "firstVertex", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "firstInstance", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDraw = { "vkCmdDraw", format::ApiCallId::ApiCall_vkCmdDraw, kDiveArgs_vkCmdDraw, std::size(kDiveArgs_vkCmdDraw) };
 
 void VulkanExportDiveConsumer::Process_vkCmdDraw(
     const ApiCallInfo&                          call_info,
@@ -1056,18 +1183,26 @@ void VulkanExportDiveConsumer::Process_vkCmdDraw(
     uint32_t                                    firstVertex,
     uint32_t                                    firstInstance)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["vertexCount"], vertexCount, json_options);
-    FieldToJson(args["instanceCount"], instanceCount, json_options);
-    FieldToJson(args["firstVertex"], firstVertex, json_options);
-    FieldToJson(args["firstInstance"], firstInstance, json_options);
-    util::DiveFunctionData function_data("vkCmdDraw", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(vertexCount);
+    dive_args.Write(instanceCount);
+    dive_args.Write(firstVertex);
+    dive_args.Write(firstInstance);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDraw, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndexed[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "indexCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "instanceCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "firstIndex", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "vertexOffset", sizeof(int32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<int32_t>(data), options); } },
+    { "firstInstance", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndexed = { "vkCmdDrawIndexed", format::ApiCallId::ApiCall_vkCmdDrawIndexed, kDiveArgs_vkCmdDrawIndexed, std::size(kDiveArgs_vkCmdDrawIndexed) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndexed(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1077,19 +1212,26 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndexed(
     int32_t                                     vertexOffset,
     uint32_t                                    firstInstance)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["indexCount"], indexCount, json_options);
-    FieldToJson(args["instanceCount"], instanceCount, json_options);
-    FieldToJson(args["firstIndex"], firstIndex, json_options);
-    FieldToJson(args["vertexOffset"], vertexOffset, json_options);
-    FieldToJson(args["firstInstance"], firstInstance, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndexed", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(indexCount);
+    dive_args.Write(instanceCount);
+    dive_args.Write(firstIndex);
+    dive_args.Write(vertexOffset);
+    dive_args.Write(firstInstance);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndexed, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndirect[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "drawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndirect = { "vkCmdDrawIndirect", format::ApiCallId::ApiCall_vkCmdDrawIndirect, kDiveArgs_vkCmdDrawIndirect, std::size(kDiveArgs_vkCmdDrawIndirect) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndirect(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1098,18 +1240,25 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndirect(
     uint32_t                                    drawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    FieldToJson(args["drawCount"], drawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndirect", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(drawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndirect, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndexedIndirect[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "drawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndexedIndirect = { "vkCmdDrawIndexedIndirect", format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirect, kDiveArgs_vkCmdDrawIndexedIndirect, std::size(kDiveArgs_vkCmdDrawIndexedIndirect) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndexedIndirect(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1118,18 +1267,24 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndexedIndirect(
     uint32_t                                    drawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    FieldToJson(args["drawCount"], drawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndexedIndirect", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(drawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndexedIndirect, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDispatch[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "groupCountX", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountY", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountZ", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDispatch = { "vkCmdDispatch", format::ApiCallId::ApiCall_vkCmdDispatch, kDiveArgs_vkCmdDispatch, std::size(kDiveArgs_vkCmdDispatch) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDispatch(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1137,33 +1292,45 @@ void VulkanExportDiveConsumer::Process_vkCmdDispatch(
     uint32_t                                    groupCountY,
     uint32_t                                    groupCountZ)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["groupCountX"], groupCountX, json_options);
-    FieldToJson(args["groupCountY"], groupCountY, json_options);
-    FieldToJson(args["groupCountZ"], groupCountZ, json_options);
-    util::DiveFunctionData function_data("vkCmdDispatch", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(groupCountX);
+    dive_args.Write(groupCountY);
+    dive_args.Write(groupCountZ);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDispatch, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDispatchIndirect[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDispatchIndirect = { "vkCmdDispatchIndirect", format::ApiCallId::ApiCall_vkCmdDispatchIndirect, kDiveArgs_vkCmdDispatchIndirect, std::size(kDiveArgs_vkCmdDispatchIndirect) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDispatchIndirect(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            buffer,
     VkDeviceSize                                offset)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    util::DiveFunctionData function_data("vkCmdDispatchIndirect", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDispatchIndirect, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyBuffer[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "regionCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRegions", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyBuffer = { "vkCmdCopyBuffer", format::ApiCallId::ApiCall_vkCmdCopyBuffer, kDiveArgs_vkCmdCopyBuffer, std::size(kDiveArgs_vkCmdCopyBuffer) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyBuffer(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1172,18 +1339,32 @@ void VulkanExportDiveConsumer::Process_vkCmdCopyBuffer(
     uint32_t                                    regionCount,
     StructPointerDecoder<Decoded_VkBufferCopy>* pRegions)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["srcBuffer"], srcBuffer, json_options);
-    HandleToJson(args["dstBuffer"], dstBuffer, json_options);
-    FieldToJson(args["regionCount"], regionCount, json_options);
-    FieldToJson(args["pRegions"], pRegions, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyBuffer", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(srcBuffer);
+    dive_args.Write(dstBuffer);
+    dive_args.Write(regionCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRegions, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyBuffer, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyImage[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcImage", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcImageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "dstImage", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstImageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "regionCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRegions", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyImage = { "vkCmdCopyImage", format::ApiCallId::ApiCall_vkCmdCopyImage, kDiveArgs_vkCmdCopyImage, std::size(kDiveArgs_vkCmdCopyImage) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyImage(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1194,19 +1375,34 @@ void VulkanExportDiveConsumer::Process_vkCmdCopyImage(
     uint32_t                                    regionCount,
     StructPointerDecoder<Decoded_VkImageCopy>*  pRegions)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["srcImage"], srcImage, json_options);
-    FieldToJson(args["srcImageLayout"], srcImageLayout, json_options);
-    HandleToJson(args["dstImage"], dstImage, json_options);
-    FieldToJson(args["dstImageLayout"], dstImageLayout, json_options);
-    FieldToJson(args["regionCount"], regionCount, json_options);
-    FieldToJson(args["pRegions"], pRegions, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyImage", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(srcImage);
+    dive_args.Write(srcImageLayout);
+    dive_args.Write(dstImage);
+    dive_args.Write(dstImageLayout);
+    dive_args.Write(regionCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRegions, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyImage, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdBlitImage[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcImage", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcImageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "dstImage", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstImageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "regionCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRegions", 0, nullptr },
+    { "filter", sizeof(VkFilter), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkFilter>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBlitImage = { "vkCmdBlitImage", format::ApiCallId::ApiCall_vkCmdBlitImage, kDiveArgs_vkCmdBlitImage, std::size(kDiveArgs_vkCmdBlitImage) };
 
 void VulkanExportDiveConsumer::Process_vkCmdBlitImage(
     const ApiCallInfo&                          call_info,
@@ -1219,20 +1415,33 @@ void VulkanExportDiveConsumer::Process_vkCmdBlitImage(
     StructPointerDecoder<Decoded_VkImageBlit>*  pRegions,
     VkFilter                                    filter)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["srcImage"], srcImage, json_options);
-    FieldToJson(args["srcImageLayout"], srcImageLayout, json_options);
-    HandleToJson(args["dstImage"], dstImage, json_options);
-    FieldToJson(args["dstImageLayout"], dstImageLayout, json_options);
-    FieldToJson(args["regionCount"], regionCount, json_options);
-    FieldToJson(args["pRegions"], pRegions, json_options);
-    FieldToJson(args["filter"], filter, json_options);
-    util::DiveFunctionData function_data("vkCmdBlitImage", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(srcImage);
+    dive_args.Write(srcImageLayout);
+    dive_args.Write(dstImage);
+    dive_args.Write(dstImageLayout);
+    dive_args.Write(regionCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRegions, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(filter);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBlitImage, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyBufferToImage[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstImage", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstImageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "regionCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRegions", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyBufferToImage = { "vkCmdCopyBufferToImage", format::ApiCallId::ApiCall_vkCmdCopyBufferToImage, kDiveArgs_vkCmdCopyBufferToImage, std::size(kDiveArgs_vkCmdCopyBufferToImage) };
 
 void VulkanExportDiveConsumer::Process_vkCmdCopyBufferToImage(
     const ApiCallInfo&                          call_info,
@@ -1243,19 +1452,32 @@ void VulkanExportDiveConsumer::Process_vkCmdCopyBufferToImage(
     uint32_t                                    regionCount,
     StructPointerDecoder<Decoded_VkBufferImageCopy>* pRegions)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["srcBuffer"], srcBuffer, json_options);
-    HandleToJson(args["dstImage"], dstImage, json_options);
-    FieldToJson(args["dstImageLayout"], dstImageLayout, json_options);
-    FieldToJson(args["regionCount"], regionCount, json_options);
-    FieldToJson(args["pRegions"], pRegions, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyBufferToImage", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(srcBuffer);
+    dive_args.Write(dstImage);
+    dive_args.Write(dstImageLayout);
+    dive_args.Write(regionCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRegions, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyBufferToImage, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyImageToBuffer[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcImage", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcImageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "dstBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "regionCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRegions", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyImageToBuffer = { "vkCmdCopyImageToBuffer", format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer, kDiveArgs_vkCmdCopyImageToBuffer, std::size(kDiveArgs_vkCmdCopyImageToBuffer) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyImageToBuffer(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1265,19 +1487,31 @@ void VulkanExportDiveConsumer::Process_vkCmdCopyImageToBuffer(
     uint32_t                                    regionCount,
     StructPointerDecoder<Decoded_VkBufferImageCopy>* pRegions)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["srcImage"], srcImage, json_options);
-    FieldToJson(args["srcImageLayout"], srcImageLayout, json_options);
-    HandleToJson(args["dstBuffer"], dstBuffer, json_options);
-    FieldToJson(args["regionCount"], regionCount, json_options);
-    FieldToJson(args["pRegions"], pRegions, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyImageToBuffer", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(srcImage);
+    dive_args.Write(srcImageLayout);
+    dive_args.Write(dstBuffer);
+    dive_args.Write(regionCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRegions, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyImageToBuffer, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdUpdateBuffer[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "dataSize", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "pData", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdUpdateBuffer = { "vkCmdUpdateBuffer", format::ApiCallId::ApiCall_vkCmdUpdateBuffer, kDiveArgs_vkCmdUpdateBuffer, std::size(kDiveArgs_vkCmdUpdateBuffer) };
+
 void VulkanExportDiveConsumer::Process_vkCmdUpdateBuffer(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1286,18 +1520,30 @@ void VulkanExportDiveConsumer::Process_vkCmdUpdateBuffer(
     VkDeviceSize                                dataSize,
     PointerDecoder<uint8_t>*                    pData)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["dstBuffer"], dstBuffer, json_options);
-    FieldToJson(args["dstOffset"], dstOffset, json_options);
-    FieldToJson(args["dataSize"], dataSize, json_options);
-    FieldToJson(args["pData"], pData, json_options);
-    util::DiveFunctionData function_data("vkCmdUpdateBuffer", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(dstBuffer);
+    dive_args.Write(dstOffset);
+    dive_args.Write(dataSize);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pData, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdUpdateBuffer, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdFillBuffer[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "size", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "data", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdFillBuffer = { "vkCmdFillBuffer", format::ApiCallId::ApiCall_vkCmdFillBuffer, kDiveArgs_vkCmdFillBuffer, std::size(kDiveArgs_vkCmdFillBuffer) };
+
 void VulkanExportDiveConsumer::Process_vkCmdFillBuffer(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1306,18 +1552,26 @@ void VulkanExportDiveConsumer::Process_vkCmdFillBuffer(
     VkDeviceSize                                size,
     uint32_t                                    data)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["dstBuffer"], dstBuffer, json_options);
-    FieldToJson(args["dstOffset"], dstOffset, json_options);
-    FieldToJson(args["size"], size, json_options);
-    FieldToJson(args["data"], data, json_options);
-    util::DiveFunctionData function_data("vkCmdFillBuffer", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(dstBuffer);
+    dive_args.Write(dstOffset);
+    dive_args.Write(size);
+    dive_args.Write(data);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdFillBuffer, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdClearColorImage[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "image", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "imageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "pColor", 0, nullptr },
+    { "rangeCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRanges", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdClearColorImage = { "vkCmdClearColorImage", format::ApiCallId::ApiCall_vkCmdClearColorImage, kDiveArgs_vkCmdClearColorImage, std::size(kDiveArgs_vkCmdClearColorImage) };
+
 void VulkanExportDiveConsumer::Process_vkCmdClearColorImage(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1327,18 +1581,35 @@ void VulkanExportDiveConsumer::Process_vkCmdClearColorImage(
     uint32_t                                    rangeCount,
     StructPointerDecoder<Decoded_VkImageSubresourceRange>* pRanges)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["image"], image, json_options);
-    FieldToJson(args["imageLayout"], imageLayout, json_options);
-    FieldToJson(args["pColor"], pColor, json_options);
-    FieldToJson(args["rangeCount"], rangeCount, json_options);
-    FieldToJson(args["pRanges"], pRanges, json_options);
-    util::DiveFunctionData function_data("vkCmdClearColorImage", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(image);
+    dive_args.Write(imageLayout);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pColor, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(rangeCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRanges, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdClearColorImage, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdClearDepthStencilImage[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "image", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "imageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "pDepthStencil", 0, nullptr },
+    { "rangeCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRanges", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdClearDepthStencilImage = { "vkCmdClearDepthStencilImage", format::ApiCallId::ApiCall_vkCmdClearDepthStencilImage, kDiveArgs_vkCmdClearDepthStencilImage, std::size(kDiveArgs_vkCmdClearDepthStencilImage) };
 
 void VulkanExportDiveConsumer::Process_vkCmdClearDepthStencilImage(
     const ApiCallInfo&                          call_info,
@@ -1349,18 +1620,34 @@ void VulkanExportDiveConsumer::Process_vkCmdClearDepthStencilImage(
     uint32_t                                    rangeCount,
     StructPointerDecoder<Decoded_VkImageSubresourceRange>* pRanges)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["image"], image, json_options);
-    FieldToJson(args["imageLayout"], imageLayout, json_options);
-    FieldToJson(args["pDepthStencil"], pDepthStencil, json_options);
-    FieldToJson(args["rangeCount"], rangeCount, json_options);
-    FieldToJson(args["pRanges"], pRanges, json_options);
-    util::DiveFunctionData function_data("vkCmdClearDepthStencilImage", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(image);
+    dive_args.Write(imageLayout);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDepthStencil, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(rangeCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRanges, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdClearDepthStencilImage, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdClearAttachments[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "attachmentCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pAttachments", 0, nullptr },
+    { "rectCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRects", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdClearAttachments = { "vkCmdClearAttachments", format::ApiCallId::ApiCall_vkCmdClearAttachments, kDiveArgs_vkCmdClearAttachments, std::size(kDiveArgs_vkCmdClearAttachments) };
 
 void VulkanExportDiveConsumer::Process_vkCmdClearAttachments(
     const ApiCallInfo&                          call_info,
@@ -1370,17 +1657,35 @@ void VulkanExportDiveConsumer::Process_vkCmdClearAttachments(
     uint32_t                                    rectCount,
     StructPointerDecoder<Decoded_VkClearRect>*  pRects)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["attachmentCount"], attachmentCount, json_options);
-    FieldToJson(args["pAttachments"], pAttachments, json_options);
-    FieldToJson(args["rectCount"], rectCount, json_options);
-    FieldToJson(args["pRects"], pRects, json_options);
-    util::DiveFunctionData function_data("vkCmdClearAttachments", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(attachmentCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pAttachments, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(rectCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRects, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdClearAttachments, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdResolveImage[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcImage", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcImageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "dstImage", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstImageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+    { "regionCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pRegions", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdResolveImage = { "vkCmdResolveImage", format::ApiCallId::ApiCall_vkCmdResolveImage, kDiveArgs_vkCmdResolveImage, std::size(kDiveArgs_vkCmdResolveImage) };
 
 void VulkanExportDiveConsumer::Process_vkCmdResolveImage(
     const ApiCallInfo&                          call_info,
@@ -1392,51 +1697,79 @@ void VulkanExportDiveConsumer::Process_vkCmdResolveImage(
     uint32_t                                    regionCount,
     StructPointerDecoder<Decoded_VkImageResolve>* pRegions)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["srcImage"], srcImage, json_options);
-    FieldToJson(args["srcImageLayout"], srcImageLayout, json_options);
-    HandleToJson(args["dstImage"], dstImage, json_options);
-    FieldToJson(args["dstImageLayout"], dstImageLayout, json_options);
-    FieldToJson(args["regionCount"], regionCount, json_options);
-    FieldToJson(args["pRegions"], pRegions, json_options);
-    util::DiveFunctionData function_data("vkCmdResolveImage", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(srcImage);
+    dive_args.Write(srcImageLayout);
+    dive_args.Write(dstImage);
+    dive_args.Write(dstImageLayout);
+    dive_args.Write(regionCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRegions, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdResolveImage, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetEvent[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "event", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stageMask", sizeof(VkPipelineStageFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetEvent = { "vkCmdSetEvent", format::ApiCallId::ApiCall_vkCmdSetEvent, kDiveArgs_vkCmdSetEvent, std::size(kDiveArgs_vkCmdSetEvent) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetEvent(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            event,
     VkPipelineStageFlags                        stageMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["event"], event, json_options);
-    FieldToJson(VkPipelineStageFlags_t(), args["stageMask"], stageMask, json_options);
-    util::DiveFunctionData function_data("vkCmdSetEvent", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(event);
+    dive_args.Write(stageMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetEvent, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdResetEvent[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "event", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stageMask", sizeof(VkPipelineStageFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdResetEvent = { "vkCmdResetEvent", format::ApiCallId::ApiCall_vkCmdResetEvent, kDiveArgs_vkCmdResetEvent, std::size(kDiveArgs_vkCmdResetEvent) };
+
 void VulkanExportDiveConsumer::Process_vkCmdResetEvent(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            event,
     VkPipelineStageFlags                        stageMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["event"], event, json_options);
-    FieldToJson(VkPipelineStageFlags_t(), args["stageMask"], stageMask, json_options);
-    util::DiveFunctionData function_data("vkCmdResetEvent", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(event);
+    dive_args.Write(stageMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdResetEvent, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdWaitEvents[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "eventCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pEvents", 0, nullptr },
+    { "srcStageMask", sizeof(VkPipelineStageFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags>(data), options); } },
+    { "dstStageMask", sizeof(VkPipelineStageFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags>(data), options); } },
+    { "memoryBarrierCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pMemoryBarriers", 0, nullptr },
+    { "bufferMemoryBarrierCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pBufferMemoryBarriers", 0, nullptr },
+    { "imageMemoryBarrierCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pImageMemoryBarriers", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWaitEvents = { "vkCmdWaitEvents", format::ApiCallId::ApiCall_vkCmdWaitEvents, kDiveArgs_vkCmdWaitEvents, std::size(kDiveArgs_vkCmdWaitEvents) };
 
 void VulkanExportDiveConsumer::Process_vkCmdWaitEvents(
     const ApiCallInfo&                          call_info,
@@ -1452,23 +1785,52 @@ void VulkanExportDiveConsumer::Process_vkCmdWaitEvents(
     uint32_t                                    imageMemoryBarrierCount,
     StructPointerDecoder<Decoded_VkImageMemoryBarrier>* pImageMemoryBarriers)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["eventCount"], eventCount, json_options);
-    HandleToJson(args["pEvents"], pEvents, json_options);
-    FieldToJson(VkPipelineStageFlags_t(), args["srcStageMask"], srcStageMask, json_options);
-    FieldToJson(VkPipelineStageFlags_t(), args["dstStageMask"], dstStageMask, json_options);
-    FieldToJson(args["memoryBarrierCount"], memoryBarrierCount, json_options);
-    FieldToJson(args["pMemoryBarriers"], pMemoryBarriers, json_options);
-    FieldToJson(args["bufferMemoryBarrierCount"], bufferMemoryBarrierCount, json_options);
-    FieldToJson(args["pBufferMemoryBarriers"], pBufferMemoryBarriers, json_options);
-    FieldToJson(args["imageMemoryBarrierCount"], imageMemoryBarrierCount, json_options);
-    FieldToJson(args["pImageMemoryBarriers"], pImageMemoryBarriers, json_options);
-    util::DiveFunctionData function_data("vkCmdWaitEvents", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(eventCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pEvents, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(srcStageMask);
+    dive_args.Write(dstStageMask);
+    dive_args.Write(memoryBarrierCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pMemoryBarriers, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(bufferMemoryBarrierCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBufferMemoryBarriers, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(imageMemoryBarrierCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pImageMemoryBarriers, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWaitEvents, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdPipelineBarrier[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "srcStageMask", sizeof(VkPipelineStageFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags>(data), options); } },
+    { "dstStageMask", sizeof(VkPipelineStageFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags>(data), options); } },
+    { "dependencyFlags", sizeof(VkDependencyFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkDependencyFlags_t(), jdata, util::ReadDiveArg<VkDependencyFlags>(data), options); } },
+    { "memoryBarrierCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pMemoryBarriers", 0, nullptr },
+    { "bufferMemoryBarrierCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pBufferMemoryBarriers", 0, nullptr },
+    { "imageMemoryBarrierCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pImageMemoryBarriers", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPipelineBarrier = { "vkCmdPipelineBarrier", format::ApiCallId::ApiCall_vkCmdPipelineBarrier, kDiveArgs_vkCmdPipelineBarrier, std::size(kDiveArgs_vkCmdPipelineBarrier) };
 
 void VulkanExportDiveConsumer::Process_vkCmdPipelineBarrier(
     const ApiCallInfo&                          call_info,
@@ -1483,22 +1845,41 @@ void VulkanExportDiveConsumer::Process_vkCmdPipelineBarrier(
     uint32_t                                    imageMemoryBarrierCount,
     StructPointerDecoder<Decoded_VkImageMemoryBarrier>* pImageMemoryBarriers)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkPipelineStageFlags_t(), args["srcStageMask"], srcStageMask, json_options);
-    FieldToJson(VkPipelineStageFlags_t(), args["dstStageMask"], dstStageMask, json_options);
-    FieldToJson(VkDependencyFlags_t(), args["dependencyFlags"], dependencyFlags, json_options);
-    FieldToJson(args["memoryBarrierCount"], memoryBarrierCount, json_options);
-    FieldToJson(args["pMemoryBarriers"], pMemoryBarriers, json_options);
-    FieldToJson(args["bufferMemoryBarrierCount"], bufferMemoryBarrierCount, json_options);
-    FieldToJson(args["pBufferMemoryBarriers"], pBufferMemoryBarriers, json_options);
-    FieldToJson(args["imageMemoryBarrierCount"], imageMemoryBarrierCount, json_options);
-    FieldToJson(args["pImageMemoryBarriers"], pImageMemoryBarriers, json_options);
-    util::DiveFunctionData function_data("vkCmdPipelineBarrier", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(srcStageMask);
+    dive_args.Write(dstStageMask);
+    dive_args.Write(dependencyFlags);
+    dive_args.Write(memoryBarrierCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pMemoryBarriers, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(bufferMemoryBarrierCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBufferMemoryBarriers, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(imageMemoryBarrierCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pImageMemoryBarriers, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPipelineBarrier, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginQuery[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "query", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "flags", sizeof(VkQueryControlFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkQueryControlFlags_t(), jdata, util::ReadDiveArg<VkQueryControlFlags>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginQuery = { "vkCmdBeginQuery", format::ApiCallId::ApiCall_vkCmdBeginQuery, kDiveArgs_vkCmdBeginQuery, std::size(kDiveArgs_vkCmdBeginQuery) };
 
 void VulkanExportDiveConsumer::Process_vkCmdBeginQuery(
     const ApiCallInfo&                          call_info,
@@ -1507,33 +1888,44 @@ void VulkanExportDiveConsumer::Process_vkCmdBeginQuery(
     uint32_t                                    query,
     VkQueryControlFlags                         flags)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["query"], query, json_options);
-    FieldToJson(VkQueryControlFlags_t(), args["flags"], flags, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginQuery", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(queryPool);
+    dive_args.Write(query);
+    dive_args.Write(flags);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginQuery, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndQuery[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "query", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndQuery = { "vkCmdEndQuery", format::ApiCallId::ApiCall_vkCmdEndQuery, kDiveArgs_vkCmdEndQuery, std::size(kDiveArgs_vkCmdEndQuery) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndQuery(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            queryPool,
     uint32_t                                    query)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["query"], query, json_options);
-    util::DiveFunctionData function_data("vkCmdEndQuery", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(queryPool);
+    dive_args.Write(query);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndQuery, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdResetQueryPool[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstQuery", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "queryCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdResetQueryPool = { "vkCmdResetQueryPool", format::ApiCallId::ApiCall_vkCmdResetQueryPool, kDiveArgs_vkCmdResetQueryPool, std::size(kDiveArgs_vkCmdResetQueryPool) };
+
 void VulkanExportDiveConsumer::Process_vkCmdResetQueryPool(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1541,17 +1933,23 @@ void VulkanExportDiveConsumer::Process_vkCmdResetQueryPool(
     uint32_t                                    firstQuery,
     uint32_t                                    queryCount)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["firstQuery"], firstQuery, json_options);
-    FieldToJson(args["queryCount"], queryCount, json_options);
-    util::DiveFunctionData function_data("vkCmdResetQueryPool", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(queryPool);
+    dive_args.Write(firstQuery);
+    dive_args.Write(queryCount);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdResetQueryPool, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWriteTimestamp[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineStage", sizeof(VkPipelineStageFlagBits), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPipelineStageFlagBits>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "query", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWriteTimestamp = { "vkCmdWriteTimestamp", format::ApiCallId::ApiCall_vkCmdWriteTimestamp, kDiveArgs_vkCmdWriteTimestamp, std::size(kDiveArgs_vkCmdWriteTimestamp) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWriteTimestamp(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1559,17 +1957,27 @@ void VulkanExportDiveConsumer::Process_vkCmdWriteTimestamp(
     format::HandleId                            queryPool,
     uint32_t                                    query)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineStage"], pipelineStage, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["query"], query, json_options);
-    util::DiveFunctionData function_data("vkCmdWriteTimestamp", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineStage);
+    dive_args.Write(queryPool);
+    dive_args.Write(query);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWriteTimestamp, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyQueryPoolResults[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstQuery", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "queryCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "dstBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "stride", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "flags", sizeof(VkQueryResultFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkQueryResultFlags_t(), jdata, util::ReadDiveArg<VkQueryResultFlags>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyQueryPoolResults = { "vkCmdCopyQueryPoolResults", format::ApiCallId::ApiCall_vkCmdCopyQueryPoolResults, kDiveArgs_vkCmdCopyQueryPoolResults, std::size(kDiveArgs_vkCmdCopyQueryPoolResults) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyQueryPoolResults(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1581,76 +1989,101 @@ void VulkanExportDiveConsumer::Process_vkCmdCopyQueryPoolResults(
     VkDeviceSize                                stride,
     VkQueryResultFlags                          flags)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["firstQuery"], firstQuery, json_options);
-    FieldToJson(args["queryCount"], queryCount, json_options);
-    HandleToJson(args["dstBuffer"], dstBuffer, json_options);
-    FieldToJson(args["dstOffset"], dstOffset, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    FieldToJson(VkQueryResultFlags_t(), args["flags"], flags, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyQueryPoolResults", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(queryPool);
+    dive_args.Write(firstQuery);
+    dive_args.Write(queryCount);
+    dive_args.Write(dstBuffer);
+    dive_args.Write(dstOffset);
+    dive_args.Write(stride);
+    dive_args.Write(flags);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyQueryPoolResults, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginRenderPass[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pRenderPassBegin", 0, nullptr },
+    { "contents", sizeof(VkSubpassContents), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkSubpassContents>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginRenderPass = { "vkCmdBeginRenderPass", format::ApiCallId::ApiCall_vkCmdBeginRenderPass, kDiveArgs_vkCmdBeginRenderPass, std::size(kDiveArgs_vkCmdBeginRenderPass) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginRenderPass(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderPassBeginInfo>* pRenderPassBegin,
     VkSubpassContents                           contents)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pRenderPassBegin"], pRenderPassBegin, json_options);
-    FieldToJson(args["contents"], contents, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginRenderPass", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRenderPassBegin, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(contents);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginRenderPass, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdNextSubpass[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "contents", sizeof(VkSubpassContents), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkSubpassContents>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdNextSubpass = { "vkCmdNextSubpass", format::ApiCallId::ApiCall_vkCmdNextSubpass, kDiveArgs_vkCmdNextSubpass, std::size(kDiveArgs_vkCmdNextSubpass) };
+
 void VulkanExportDiveConsumer::Process_vkCmdNextSubpass(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkSubpassContents                           contents)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["contents"], contents, json_options);
-    util::DiveFunctionData function_data("vkCmdNextSubpass", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(contents);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdNextSubpass, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndRenderPass[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndRenderPass = { "vkCmdEndRenderPass", format::ApiCallId::ApiCall_vkCmdEndRenderPass, kDiveArgs_vkCmdEndRenderPass, std::size(kDiveArgs_vkCmdEndRenderPass) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndRenderPass(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    util::DiveFunctionData function_data("vkCmdEndRenderPass", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndRenderPass, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdExecuteCommands[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "commandBufferCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pCommandBuffers", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdExecuteCommands = { "vkCmdExecuteCommands", format::ApiCallId::ApiCall_vkCmdExecuteCommands, kDiveArgs_vkCmdExecuteCommands, std::size(kDiveArgs_vkCmdExecuteCommands) };
+
 void VulkanExportDiveConsumer::Process_vkCmdExecuteCommands(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    commandBufferCount,
     HandlePointerDecoder<VkCommandBuffer>*      pCommandBuffers)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["commandBufferCount"], commandBufferCount, json_options);
-    HandleToJson(args["pCommandBuffers"], pCommandBuffers, json_options);
-    util::DiveFunctionData function_data("vkCmdExecuteCommands", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(commandBufferCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pCommandBuffers, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdExecuteCommands, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -1682,20 +2115,35 @@ void VulkanExportDiveConsumer::Process_vkGetDeviceGroupPeerMemoryFeatures(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDeviceMask[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "deviceMask", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDeviceMask = { "vkCmdSetDeviceMask", format::ApiCallId::ApiCall_vkCmdSetDeviceMask, kDiveArgs_vkCmdSetDeviceMask, std::size(kDiveArgs_vkCmdSetDeviceMask) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDeviceMask(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    deviceMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["deviceMask"], deviceMask, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDeviceMask", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(deviceMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDeviceMask, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDispatchBase[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "baseGroupX", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "baseGroupY", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "baseGroupZ", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountX", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountY", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountZ", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDispatchBase = { "vkCmdDispatchBase", format::ApiCallId::ApiCall_vkCmdDispatchBase, kDiveArgs_vkCmdDispatchBase, std::size(kDiveArgs_vkCmdDispatchBase) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDispatchBase(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1706,17 +2154,15 @@ void VulkanExportDiveConsumer::Process_vkCmdDispatchBase(
     uint32_t                                    groupCountY,
     uint32_t                                    groupCountZ)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["baseGroupX"], baseGroupX, json_options);
-    FieldToJson(args["baseGroupY"], baseGroupY, json_options);
-    FieldToJson(args["baseGroupZ"], baseGroupZ, json_options);
-    FieldToJson(args["groupCountX"], groupCountX, json_options);
-    FieldToJson(args["groupCountY"], groupCountY, json_options);
-    FieldToJson(args["groupCountZ"], groupCountZ, json_options);
-    util::DiveFunctionData function_data("vkCmdDispatchBase", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(baseGroupX);
+    dive_args.Write(baseGroupY);
+    dive_args.Write(baseGroupZ);
+    dive_args.Write(groupCountX);
+    dive_args.Write(groupCountY);
+    dive_args.Write(groupCountZ);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDispatchBase, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -1893,6 +2339,17 @@ void VulkanExportDiveConsumer::Process_vkGetDescriptorSetLayoutSupport(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndirectCount[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "countBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "countBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "maxDrawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndirectCount = { "vkCmdDrawIndirectCount", format::ApiCallId::ApiCall_vkCmdDrawIndirectCount, kDiveArgs_vkCmdDrawIndirectCount, std::size(kDiveArgs_vkCmdDrawIndirectCount) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndirectCount(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -1903,19 +2360,28 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndirectCount(
     uint32_t                                    maxDrawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    HandleToJson(args["countBuffer"], countBuffer, json_options);
-    FieldToJson(args["countBufferOffset"], countBufferOffset, json_options);
-    FieldToJson(args["maxDrawCount"], maxDrawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndirectCount", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(countBuffer);
+    dive_args.Write(countBufferOffset);
+    dive_args.Write(maxDrawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndirectCount, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndexedIndirectCount[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "countBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "countBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "maxDrawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndexedIndirectCount = { "vkCmdDrawIndexedIndirectCount", format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCount, kDiveArgs_vkCmdDrawIndexedIndirectCount, std::size(kDiveArgs_vkCmdDrawIndexedIndirectCount) };
 
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndexedIndirectCount(
     const ApiCallInfo&                          call_info,
@@ -1927,17 +2393,15 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndexedIndirectCount(
     uint32_t                                    maxDrawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    HandleToJson(args["countBuffer"], countBuffer, json_options);
-    FieldToJson(args["countBufferOffset"], countBufferOffset, json_options);
-    FieldToJson(args["maxDrawCount"], maxDrawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndexedIndirectCount", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(countBuffer);
+    dive_args.Write(countBufferOffset);
+    dive_args.Write(maxDrawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndexedIndirectCount, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -1951,49 +2415,86 @@ void VulkanExportDiveConsumer::Process_vkCreateRenderPass2(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginRenderPass2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pRenderPassBegin", 0, nullptr },
+    { "pSubpassBeginInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginRenderPass2 = { "vkCmdBeginRenderPass2", format::ApiCallId::ApiCall_vkCmdBeginRenderPass2, kDiveArgs_vkCmdBeginRenderPass2, std::size(kDiveArgs_vkCmdBeginRenderPass2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginRenderPass2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderPassBeginInfo>* pRenderPassBegin,
     StructPointerDecoder<Decoded_VkSubpassBeginInfo>* pSubpassBeginInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pRenderPassBegin"], pRenderPassBegin, json_options);
-    FieldToJson(args["pSubpassBeginInfo"], pSubpassBeginInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginRenderPass2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRenderPassBegin, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSubpassBeginInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginRenderPass2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdNextSubpass2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pSubpassBeginInfo", 0, nullptr },
+    { "pSubpassEndInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdNextSubpass2 = { "vkCmdNextSubpass2", format::ApiCallId::ApiCall_vkCmdNextSubpass2, kDiveArgs_vkCmdNextSubpass2, std::size(kDiveArgs_vkCmdNextSubpass2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdNextSubpass2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkSubpassBeginInfo>* pSubpassBeginInfo,
     StructPointerDecoder<Decoded_VkSubpassEndInfo>* pSubpassEndInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pSubpassBeginInfo"], pSubpassBeginInfo, json_options);
-    FieldToJson(args["pSubpassEndInfo"], pSubpassEndInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdNextSubpass2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSubpassBeginInfo, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSubpassEndInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdNextSubpass2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndRenderPass2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pSubpassEndInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndRenderPass2 = { "vkCmdEndRenderPass2", format::ApiCallId::ApiCall_vkCmdEndRenderPass2, kDiveArgs_vkCmdEndRenderPass2, std::size(kDiveArgs_vkCmdEndRenderPass2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndRenderPass2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkSubpassEndInfo>* pSubpassEndInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pSubpassEndInfo"], pSubpassEndInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdEndRenderPass2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSubpassEndInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndRenderPass2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -2104,38 +2605,61 @@ void VulkanExportDiveConsumer::Process_vkGetPrivateData(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetEvent2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "event", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pDependencyInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetEvent2 = { "vkCmdSetEvent2", format::ApiCallId::ApiCall_vkCmdSetEvent2, kDiveArgs_vkCmdSetEvent2, std::size(kDiveArgs_vkCmdSetEvent2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetEvent2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            event,
     StructPointerDecoder<Decoded_VkDependencyInfo>* pDependencyInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["event"], event, json_options);
-    FieldToJson(args["pDependencyInfo"], pDependencyInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetEvent2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(event);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDependencyInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetEvent2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdResetEvent2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "event", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stageMask", sizeof(VkPipelineStageFlags2), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags2_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags2>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdResetEvent2 = { "vkCmdResetEvent2", format::ApiCallId::ApiCall_vkCmdResetEvent2, kDiveArgs_vkCmdResetEvent2, std::size(kDiveArgs_vkCmdResetEvent2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdResetEvent2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            event,
     VkPipelineStageFlags2                       stageMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["event"], event, json_options);
-    FieldToJson(VkPipelineStageFlags2_t(), args["stageMask"], stageMask, json_options);
-    util::DiveFunctionData function_data("vkCmdResetEvent2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(event);
+    dive_args.Write(stageMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdResetEvent2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWaitEvents2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "eventCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pEvents", 0, nullptr },
+    { "pDependencyInfos", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWaitEvents2 = { "vkCmdWaitEvents2", format::ApiCallId::ApiCall_vkCmdWaitEvents2, kDiveArgs_vkCmdWaitEvents2, std::size(kDiveArgs_vkCmdWaitEvents2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWaitEvents2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -2143,31 +2667,55 @@ void VulkanExportDiveConsumer::Process_vkCmdWaitEvents2(
     HandlePointerDecoder<VkEvent>*              pEvents,
     StructPointerDecoder<Decoded_VkDependencyInfo>* pDependencyInfos)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["eventCount"], eventCount, json_options);
-    HandleToJson(args["pEvents"], pEvents, json_options);
-    FieldToJson(args["pDependencyInfos"], pDependencyInfos, json_options);
-    util::DiveFunctionData function_data("vkCmdWaitEvents2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(eventCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pEvents, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDependencyInfos, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWaitEvents2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPipelineBarrier2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pDependencyInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPipelineBarrier2 = { "vkCmdPipelineBarrier2", format::ApiCallId::ApiCall_vkCmdPipelineBarrier2, kDiveArgs_vkCmdPipelineBarrier2, std::size(kDiveArgs_vkCmdPipelineBarrier2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPipelineBarrier2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkDependencyInfo>* pDependencyInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pDependencyInfo"], pDependencyInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdPipelineBarrier2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDependencyInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPipelineBarrier2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWriteTimestamp2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stage", sizeof(VkPipelineStageFlags2), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags2_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags2>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "query", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWriteTimestamp2 = { "vkCmdWriteTimestamp2", format::ApiCallId::ApiCall_vkCmdWriteTimestamp2, kDiveArgs_vkCmdWriteTimestamp2, std::size(kDiveArgs_vkCmdWriteTimestamp2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWriteTimestamp2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -2175,17 +2723,23 @@ void VulkanExportDiveConsumer::Process_vkCmdWriteTimestamp2(
     format::HandleId                            queryPool,
     uint32_t                                    query)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkPipelineStageFlags2_t(), args["stage"], stage, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["query"], query, json_options);
-    util::DiveFunctionData function_data("vkCmdWriteTimestamp2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(stage);
+    dive_args.Write(queryPool);
+    dive_args.Write(query);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWriteTimestamp2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkQueueSubmit2[] = {
+    { "queue", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "submitCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pSubmits", 0, nullptr },
+    { "fence", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkQueueSubmit2 = { "vkQueueSubmit2", format::ApiCallId::ApiCall_vkQueueSubmit2, kDiveArgs_vkQueueSubmit2, std::size(kDiveArgs_vkQueueSubmit2) };
+
 void VulkanExportDiveConsumer::Process_vkQueueSubmit2(
     const ApiCallInfo&                          call_info,
     VkResult                                    returnValue,
@@ -2194,201 +2748,310 @@ void VulkanExportDiveConsumer::Process_vkQueueSubmit2(
     StructPointerDecoder<Decoded_VkSubmitInfo2>* pSubmits,
     format::HandleId                            fence)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["queue"], queue, json_options);
-    FieldToJson(args["submitCount"], submitCount, json_options);
-    FieldToJson(args["pSubmits"], pSubmits, json_options);
-    HandleToJson(args["fence"], fence, json_options);
-    util::DiveFunctionData function_data("vkQueueSubmit2", 0, call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs();
+    dive_args.Write(queue);
+    dive_args.Write(submitCount);
+    FieldToJson(dive_args.BeginJson(), pSubmits, json_options);
+    dive_args.EndJson();
+    dive_args.Write(fence);
+    util::DiveFunctionData function_data(kDiveSchema_vkQueueSubmit2, 0, call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyBuffer2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCopyBufferInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyBuffer2 = { "vkCmdCopyBuffer2", format::ApiCallId::ApiCall_vkCmdCopyBuffer2, kDiveArgs_vkCmdCopyBuffer2, std::size(kDiveArgs_vkCmdCopyBuffer2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyBuffer2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyBufferInfo2>* pCopyBufferInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCopyBufferInfo"], pCopyBufferInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyBuffer2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCopyBufferInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyBuffer2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyImage2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCopyImageInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyImage2 = { "vkCmdCopyImage2", format::ApiCallId::ApiCall_vkCmdCopyImage2, kDiveArgs_vkCmdCopyImage2, std::size(kDiveArgs_vkCmdCopyImage2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyImage2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyImageInfo2>* pCopyImageInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCopyImageInfo"], pCopyImageInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyImage2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCopyImageInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyImage2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyBufferToImage2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCopyBufferToImageInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyBufferToImage2 = { "vkCmdCopyBufferToImage2", format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2, kDiveArgs_vkCmdCopyBufferToImage2, std::size(kDiveArgs_vkCmdCopyBufferToImage2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyBufferToImage2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyBufferToImageInfo2>* pCopyBufferToImageInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCopyBufferToImageInfo"], pCopyBufferToImageInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyBufferToImage2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCopyBufferToImageInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyBufferToImage2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyImageToBuffer2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCopyImageToBufferInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyImageToBuffer2 = { "vkCmdCopyImageToBuffer2", format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2, kDiveArgs_vkCmdCopyImageToBuffer2, std::size(kDiveArgs_vkCmdCopyImageToBuffer2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyImageToBuffer2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyImageToBufferInfo2>* pCopyImageToBufferInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCopyImageToBufferInfo"], pCopyImageToBufferInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyImageToBuffer2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCopyImageToBufferInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyImageToBuffer2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBlitImage2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pBlitImageInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBlitImage2 = { "vkCmdBlitImage2", format::ApiCallId::ApiCall_vkCmdBlitImage2, kDiveArgs_vkCmdBlitImage2, std::size(kDiveArgs_vkCmdBlitImage2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBlitImage2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkBlitImageInfo2>* pBlitImageInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pBlitImageInfo"], pBlitImageInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBlitImage2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBlitImageInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBlitImage2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdResolveImage2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pResolveImageInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdResolveImage2 = { "vkCmdResolveImage2", format::ApiCallId::ApiCall_vkCmdResolveImage2, kDiveArgs_vkCmdResolveImage2, std::size(kDiveArgs_vkCmdResolveImage2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdResolveImage2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkResolveImageInfo2>* pResolveImageInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pResolveImageInfo"], pResolveImageInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdResolveImage2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pResolveImageInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdResolveImage2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginRendering[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pRenderingInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginRendering = { "vkCmdBeginRendering", format::ApiCallId::ApiCall_vkCmdBeginRendering, kDiveArgs_vkCmdBeginRendering, std::size(kDiveArgs_vkCmdBeginRendering) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginRendering(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderingInfo>* pRenderingInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pRenderingInfo"], pRenderingInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginRendering", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRenderingInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginRendering, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndRendering[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndRendering = { "vkCmdEndRendering", format::ApiCallId::ApiCall_vkCmdEndRendering, kDiveArgs_vkCmdEndRendering, std::size(kDiveArgs_vkCmdEndRendering) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndRendering(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    util::DiveFunctionData function_data("vkCmdEndRendering", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndRendering, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCullMode[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "cullMode", sizeof(VkCullModeFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkCullModeFlags_t(), jdata, util::ReadDiveArg<VkCullModeFlags>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCullMode = { "vkCmdSetCullMode", format::ApiCallId::ApiCall_vkCmdSetCullMode, kDiveArgs_vkCmdSetCullMode, std::size(kDiveArgs_vkCmdSetCullMode) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCullMode(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkCullModeFlags                             cullMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkCullModeFlags_t(), args["cullMode"], cullMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCullMode", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(cullMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCullMode, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetFrontFace[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "frontFace", sizeof(VkFrontFace), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkFrontFace>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetFrontFace = { "vkCmdSetFrontFace", format::ApiCallId::ApiCall_vkCmdSetFrontFace, kDiveArgs_vkCmdSetFrontFace, std::size(kDiveArgs_vkCmdSetFrontFace) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetFrontFace(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkFrontFace                                 frontFace)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["frontFace"], frontFace, json_options);
-    util::DiveFunctionData function_data("vkCmdSetFrontFace", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(frontFace);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetFrontFace, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPrimitiveTopology[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "primitiveTopology", sizeof(VkPrimitiveTopology), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPrimitiveTopology>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPrimitiveTopology = { "vkCmdSetPrimitiveTopology", format::ApiCallId::ApiCall_vkCmdSetPrimitiveTopology, kDiveArgs_vkCmdSetPrimitiveTopology, std::size(kDiveArgs_vkCmdSetPrimitiveTopology) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPrimitiveTopology(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkPrimitiveTopology                         primitiveTopology)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["primitiveTopology"], primitiveTopology, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPrimitiveTopology", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(primitiveTopology);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPrimitiveTopology, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetViewportWithCount[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "viewportCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pViewports", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetViewportWithCount = { "vkCmdSetViewportWithCount", format::ApiCallId::ApiCall_vkCmdSetViewportWithCount, kDiveArgs_vkCmdSetViewportWithCount, std::size(kDiveArgs_vkCmdSetViewportWithCount) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetViewportWithCount(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    viewportCount,
     StructPointerDecoder<Decoded_VkViewport>*   pViewports)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["viewportCount"], viewportCount, json_options);
-    FieldToJson(args["pViewports"], pViewports, json_options);
-    util::DiveFunctionData function_data("vkCmdSetViewportWithCount", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(viewportCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pViewports, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetViewportWithCount, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetScissorWithCount[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "scissorCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pScissors", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetScissorWithCount = { "vkCmdSetScissorWithCount", format::ApiCallId::ApiCall_vkCmdSetScissorWithCount, kDiveArgs_vkCmdSetScissorWithCount, std::size(kDiveArgs_vkCmdSetScissorWithCount) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetScissorWithCount(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    scissorCount,
     StructPointerDecoder<Decoded_VkRect2D>*     pScissors)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["scissorCount"], scissorCount, json_options);
-    FieldToJson(args["pScissors"], pScissors, json_options);
-    util::DiveFunctionData function_data("vkCmdSetScissorWithCount", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(scissorCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pScissors, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetScissorWithCount, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindVertexBuffers2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstBinding", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "bindingCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pBuffers", 0, nullptr },
+    { "pOffsets", 0, nullptr },
+    { "pSizes", 0, nullptr },
+    { "pStrides", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindVertexBuffers2 = { "vkCmdBindVertexBuffers2", format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2, kDiveArgs_vkCmdBindVertexBuffers2, std::size(kDiveArgs_vkCmdBindVertexBuffers2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindVertexBuffers2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -2399,90 +3062,135 @@ void VulkanExportDiveConsumer::Process_vkCmdBindVertexBuffers2(
     PointerDecoder<VkDeviceSize>*               pSizes,
     PointerDecoder<VkDeviceSize>*               pStrides)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstBinding"], firstBinding, json_options);
-    FieldToJson(args["bindingCount"], bindingCount, json_options);
-    HandleToJson(args["pBuffers"], pBuffers, json_options);
-    FieldToJson(args["pOffsets"], pOffsets, json_options);
-    FieldToJson(args["pSizes"], pSizes, json_options);
-    FieldToJson(args["pStrides"], pStrides, json_options);
-    util::DiveFunctionData function_data("vkCmdBindVertexBuffers2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstBinding);
+    dive_args.Write(bindingCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pBuffers, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pOffsets, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSizes, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pStrides, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindVertexBuffers2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthTestEnable[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthTestEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthTestEnable = { "vkCmdSetDepthTestEnable", format::ApiCallId::ApiCall_vkCmdSetDepthTestEnable, kDiveArgs_vkCmdSetDepthTestEnable, std::size(kDiveArgs_vkCmdSetDepthTestEnable) };
 
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthTestEnable(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthTestEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthTestEnable"], depthTestEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthTestEnable", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthTestEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthTestEnable, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthWriteEnable[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthWriteEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthWriteEnable = { "vkCmdSetDepthWriteEnable", format::ApiCallId::ApiCall_vkCmdSetDepthWriteEnable, kDiveArgs_vkCmdSetDepthWriteEnable, std::size(kDiveArgs_vkCmdSetDepthWriteEnable) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthWriteEnable(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthWriteEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthWriteEnable"], depthWriteEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthWriteEnable", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthWriteEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthWriteEnable, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthCompareOp[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthCompareOp", sizeof(VkCompareOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkCompareOp>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthCompareOp = { "vkCmdSetDepthCompareOp", format::ApiCallId::ApiCall_vkCmdSetDepthCompareOp, kDiveArgs_vkCmdSetDepthCompareOp, std::size(kDiveArgs_vkCmdSetDepthCompareOp) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthCompareOp(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkCompareOp                                 depthCompareOp)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["depthCompareOp"], depthCompareOp, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthCompareOp", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthCompareOp);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthCompareOp, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthBoundsTestEnable[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthBoundsTestEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthBoundsTestEnable = { "vkCmdSetDepthBoundsTestEnable", format::ApiCallId::ApiCall_vkCmdSetDepthBoundsTestEnable, kDiveArgs_vkCmdSetDepthBoundsTestEnable, std::size(kDiveArgs_vkCmdSetDepthBoundsTestEnable) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthBoundsTestEnable(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthBoundsTestEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthBoundsTestEnable"], depthBoundsTestEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthBoundsTestEnable", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthBoundsTestEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthBoundsTestEnable, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetStencilTestEnable[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stencilTestEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetStencilTestEnable = { "vkCmdSetStencilTestEnable", format::ApiCallId::ApiCall_vkCmdSetStencilTestEnable, kDiveArgs_vkCmdSetStencilTestEnable, std::size(kDiveArgs_vkCmdSetStencilTestEnable) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetStencilTestEnable(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    stencilTestEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["stencilTestEnable"], stencilTestEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetStencilTestEnable", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(stencilTestEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetStencilTestEnable, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetStencilOp[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "faceMask", sizeof(VkStencilFaceFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkStencilFaceFlags_t(), jdata, util::ReadDiveArg<VkStencilFaceFlags>(data), options); } },
+    { "failOp", sizeof(VkStencilOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkStencilOp>(data), options); } },
+    { "passOp", sizeof(VkStencilOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkStencilOp>(data), options); } },
+    { "depthFailOp", sizeof(VkStencilOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkStencilOp>(data), options); } },
+    { "compareOp", sizeof(VkCompareOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkCompareOp>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetStencilOp = { "vkCmdSetStencilOp", format::ApiCallId::ApiCall_vkCmdSetStencilOp, kDiveArgs_vkCmdSetStencilOp, std::size(kDiveArgs_vkCmdSetStencilOp) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetStencilOp(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -2492,58 +3200,68 @@ void VulkanExportDiveConsumer::Process_vkCmdSetStencilOp(
     VkStencilOp                                 depthFailOp,
     VkCompareOp                                 compareOp)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkStencilFaceFlags_t(), args["faceMask"], faceMask, json_options);
-    FieldToJson(args["failOp"], failOp, json_options);
-    FieldToJson(args["passOp"], passOp, json_options);
-    FieldToJson(args["depthFailOp"], depthFailOp, json_options);
-    FieldToJson(args["compareOp"], compareOp, json_options);
-    util::DiveFunctionData function_data("vkCmdSetStencilOp", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(faceMask);
+    dive_args.Write(failOp);
+    dive_args.Write(passOp);
+    dive_args.Write(depthFailOp);
+    dive_args.Write(compareOp);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetStencilOp, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRasterizerDiscardEnable[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "rasterizerDiscardEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRasterizerDiscardEnable = { "vkCmdSetRasterizerDiscardEnable", format::ApiCallId::ApiCall_vkCmdSetRasterizerDiscardEnable, kDiveArgs_vkCmdSetRasterizerDiscardEnable, std::size(kDiveArgs_vkCmdSetRasterizerDiscardEnable) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRasterizerDiscardEnable(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    rasterizerDiscardEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["rasterizerDiscardEnable"], rasterizerDiscardEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRasterizerDiscardEnable", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(rasterizerDiscardEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRasterizerDiscardEnable, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthBiasEnable[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthBiasEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthBiasEnable = { "vkCmdSetDepthBiasEnable", format::ApiCallId::ApiCall_vkCmdSetDepthBiasEnable, kDiveArgs_vkCmdSetDepthBiasEnable, std::size(kDiveArgs_vkCmdSetDepthBiasEnable) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthBiasEnable(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthBiasEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthBiasEnable"], depthBiasEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthBiasEnable", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthBiasEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthBiasEnable, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPrimitiveRestartEnable[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "primitiveRestartEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPrimitiveRestartEnable = { "vkCmdSetPrimitiveRestartEnable", format::ApiCallId::ApiCall_vkCmdSetPrimitiveRestartEnable, kDiveArgs_vkCmdSetPrimitiveRestartEnable, std::size(kDiveArgs_vkCmdSetPrimitiveRestartEnable) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPrimitiveRestartEnable(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    primitiveRestartEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["primitiveRestartEnable"], primitiveRestartEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPrimitiveRestartEnable", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(primitiveRestartEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPrimitiveRestartEnable, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -2572,19 +3290,24 @@ void VulkanExportDiveConsumer::Process_vkGetDeviceImageSparseMemoryRequirements(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetLineStipple[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "lineStippleFactor", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "lineStipplePattern", sizeof(uint16_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint16_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetLineStipple = { "vkCmdSetLineStipple", format::ApiCallId::ApiCall_vkCmdSetLineStipple, kDiveArgs_vkCmdSetLineStipple, std::size(kDiveArgs_vkCmdSetLineStipple) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetLineStipple(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    lineStippleFactor,
     uint16_t                                    lineStipplePattern)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["lineStippleFactor"], lineStippleFactor, json_options);
-    FieldToJson(args["lineStipplePattern"], lineStipplePattern, json_options);
-    util::DiveFunctionData function_data("vkCmdSetLineStipple", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(lineStippleFactor);
+    dive_args.Write(lineStipplePattern);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetLineStipple, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -2605,6 +3328,15 @@ void VulkanExportDiveConsumer::Process_vkUnmapMemory2(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindIndexBuffer2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "size", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "indexType", sizeof(VkIndexType), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkIndexType>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindIndexBuffer2 = { "vkCmdBindIndexBuffer2", format::ApiCallId::ApiCall_vkCmdBindIndexBuffer2, kDiveArgs_vkCmdBindIndexBuffer2, std::size(kDiveArgs_vkCmdBindIndexBuffer2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindIndexBuffer2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -2613,15 +3345,13 @@ void VulkanExportDiveConsumer::Process_vkCmdBindIndexBuffer2(
     VkDeviceSize                                size,
     VkIndexType                                 indexType)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    FieldToJson(args["size"], size, json_options);
-    FieldToJson(args["indexType"], indexType, json_options);
-    util::DiveFunctionData function_data("vkCmdBindIndexBuffer2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(size);
+    dive_args.Write(indexType);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindIndexBuffer2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -2650,6 +3380,16 @@ void VulkanExportDiveConsumer::Process_vkGetImageSubresourceLayout2(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPushDescriptorSet[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineBindPoint", sizeof(VkPipelineBindPoint), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPipelineBindPoint>(data), options); } },
+    { "layout", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "set", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "descriptorWriteCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pDescriptorWrites", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPushDescriptorSet = { "vkCmdPushDescriptorSet", format::ApiCallId::ApiCall_vkCmdPushDescriptorSet, kDiveArgs_vkCmdPushDescriptorSet, std::size(kDiveArgs_vkCmdPushDescriptorSet) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPushDescriptorSet(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -2659,86 +3399,134 @@ void VulkanExportDiveConsumer::Process_vkCmdPushDescriptorSet(
     uint32_t                                    descriptorWriteCount,
     StructPointerDecoder<Decoded_VkWriteDescriptorSet>* pDescriptorWrites)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineBindPoint"], pipelineBindPoint, json_options);
-    HandleToJson(args["layout"], layout, json_options);
-    FieldToJson(args["set"], set, json_options);
-    FieldToJson(args["descriptorWriteCount"], descriptorWriteCount, json_options);
-    FieldToJson(args["pDescriptorWrites"], pDescriptorWrites, json_options);
-    util::DiveFunctionData function_data("vkCmdPushDescriptorSet", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineBindPoint);
+    dive_args.Write(layout);
+    dive_args.Write(set);
+    dive_args.Write(descriptorWriteCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDescriptorWrites, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPushDescriptorSet, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRenderingAttachmentLocations[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pLocationInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRenderingAttachmentLocations = { "vkCmdSetRenderingAttachmentLocations", format::ApiCallId::ApiCall_vkCmdSetRenderingAttachmentLocations, kDiveArgs_vkCmdSetRenderingAttachmentLocations, std::size(kDiveArgs_vkCmdSetRenderingAttachmentLocations) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRenderingAttachmentLocations(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderingAttachmentLocationInfo>* pLocationInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pLocationInfo"], pLocationInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRenderingAttachmentLocations", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pLocationInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRenderingAttachmentLocations, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRenderingInputAttachmentIndices[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInputAttachmentIndexInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRenderingInputAttachmentIndices = { "vkCmdSetRenderingInputAttachmentIndices", format::ApiCallId::ApiCall_vkCmdSetRenderingInputAttachmentIndices, kDiveArgs_vkCmdSetRenderingInputAttachmentIndices, std::size(kDiveArgs_vkCmdSetRenderingInputAttachmentIndices) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRenderingInputAttachmentIndices(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderingInputAttachmentIndexInfo>* pInputAttachmentIndexInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInputAttachmentIndexInfo"], pInputAttachmentIndexInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRenderingInputAttachmentIndices", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInputAttachmentIndexInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRenderingInputAttachmentIndices, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindDescriptorSets2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pBindDescriptorSetsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindDescriptorSets2 = { "vkCmdBindDescriptorSets2", format::ApiCallId::ApiCall_vkCmdBindDescriptorSets2, kDiveArgs_vkCmdBindDescriptorSets2, std::size(kDiveArgs_vkCmdBindDescriptorSets2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindDescriptorSets2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkBindDescriptorSetsInfo>* pBindDescriptorSetsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pBindDescriptorSetsInfo"], pBindDescriptorSetsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBindDescriptorSets2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBindDescriptorSetsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindDescriptorSets2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPushConstants2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pPushConstantsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPushConstants2 = { "vkCmdPushConstants2", format::ApiCallId::ApiCall_vkCmdPushConstants2, kDiveArgs_vkCmdPushConstants2, std::size(kDiveArgs_vkCmdPushConstants2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPushConstants2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPushConstantsInfo>* pPushConstantsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pPushConstantsInfo"], pPushConstantsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdPushConstants2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pPushConstantsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPushConstants2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPushDescriptorSet2[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pPushDescriptorSetInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPushDescriptorSet2 = { "vkCmdPushDescriptorSet2", format::ApiCallId::ApiCall_vkCmdPushDescriptorSet2, kDiveArgs_vkCmdPushDescriptorSet2, std::size(kDiveArgs_vkCmdPushDescriptorSet2) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPushDescriptorSet2(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPushDescriptorSetInfo>* pPushDescriptorSetInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pPushDescriptorSetInfo"], pPushDescriptorSetInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdPushDescriptorSet2", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pPushDescriptorSetInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPushDescriptorSet2, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -3157,85 +3945,133 @@ void VulkanExportDiveConsumer::Process_vkDestroyVideoSessionParametersKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginVideoCodingKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pBeginInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginVideoCodingKHR = { "vkCmdBeginVideoCodingKHR", format::ApiCallId::ApiCall_vkCmdBeginVideoCodingKHR, kDiveArgs_vkCmdBeginVideoCodingKHR, std::size(kDiveArgs_vkCmdBeginVideoCodingKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginVideoCodingKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkVideoBeginCodingInfoKHR>* pBeginInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pBeginInfo"], pBeginInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginVideoCodingKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBeginInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginVideoCodingKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndVideoCodingKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pEndCodingInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndVideoCodingKHR = { "vkCmdEndVideoCodingKHR", format::ApiCallId::ApiCall_vkCmdEndVideoCodingKHR, kDiveArgs_vkCmdEndVideoCodingKHR, std::size(kDiveArgs_vkCmdEndVideoCodingKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndVideoCodingKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkVideoEndCodingInfoKHR>* pEndCodingInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pEndCodingInfo"], pEndCodingInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdEndVideoCodingKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pEndCodingInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndVideoCodingKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdControlVideoCodingKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCodingControlInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdControlVideoCodingKHR = { "vkCmdControlVideoCodingKHR", format::ApiCallId::ApiCall_vkCmdControlVideoCodingKHR, kDiveArgs_vkCmdControlVideoCodingKHR, std::size(kDiveArgs_vkCmdControlVideoCodingKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdControlVideoCodingKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkVideoCodingControlInfoKHR>* pCodingControlInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCodingControlInfo"], pCodingControlInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdControlVideoCodingKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCodingControlInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdControlVideoCodingKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDecodeVideoKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pDecodeInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDecodeVideoKHR = { "vkCmdDecodeVideoKHR", format::ApiCallId::ApiCall_vkCmdDecodeVideoKHR, kDiveArgs_vkCmdDecodeVideoKHR, std::size(kDiveArgs_vkCmdDecodeVideoKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDecodeVideoKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkVideoDecodeInfoKHR>* pDecodeInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pDecodeInfo"], pDecodeInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdDecodeVideoKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDecodeInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDecodeVideoKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginRenderingKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pRenderingInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginRenderingKHR = { "vkCmdBeginRenderingKHR", format::ApiCallId::ApiCall_vkCmdBeginRenderingKHR, kDiveArgs_vkCmdBeginRenderingKHR, std::size(kDiveArgs_vkCmdBeginRenderingKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginRenderingKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderingInfo>* pRenderingInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pRenderingInfo"], pRenderingInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginRenderingKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRenderingInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginRenderingKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndRenderingKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndRenderingKHR = { "vkCmdEndRenderingKHR", format::ApiCallId::ApiCall_vkCmdEndRenderingKHR, kDiveArgs_vkCmdEndRenderingKHR, std::size(kDiveArgs_vkCmdEndRenderingKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndRenderingKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    util::DiveFunctionData function_data("vkCmdEndRenderingKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndRenderingKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -3304,20 +4140,35 @@ void VulkanExportDiveConsumer::Process_vkGetDeviceGroupPeerMemoryFeaturesKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDeviceMaskKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "deviceMask", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDeviceMaskKHR = { "vkCmdSetDeviceMaskKHR", format::ApiCallId::ApiCall_vkCmdSetDeviceMaskKHR, kDiveArgs_vkCmdSetDeviceMaskKHR, std::size(kDiveArgs_vkCmdSetDeviceMaskKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDeviceMaskKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    deviceMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["deviceMask"], deviceMask, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDeviceMaskKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(deviceMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDeviceMaskKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDispatchBaseKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "baseGroupX", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "baseGroupY", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "baseGroupZ", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountX", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountY", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountZ", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDispatchBaseKHR = { "vkCmdDispatchBaseKHR", format::ApiCallId::ApiCall_vkCmdDispatchBaseKHR, kDiveArgs_vkCmdDispatchBaseKHR, std::size(kDiveArgs_vkCmdDispatchBaseKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDispatchBaseKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -3328,17 +4179,15 @@ void VulkanExportDiveConsumer::Process_vkCmdDispatchBaseKHR(
     uint32_t                                    groupCountY,
     uint32_t                                    groupCountZ)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["baseGroupX"], baseGroupX, json_options);
-    FieldToJson(args["baseGroupY"], baseGroupY, json_options);
-    FieldToJson(args["baseGroupZ"], baseGroupZ, json_options);
-    FieldToJson(args["groupCountX"], groupCountX, json_options);
-    FieldToJson(args["groupCountY"], groupCountY, json_options);
-    FieldToJson(args["groupCountZ"], groupCountZ, json_options);
-    util::DiveFunctionData function_data("vkCmdDispatchBaseKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(baseGroupX);
+    dive_args.Write(baseGroupY);
+    dive_args.Write(baseGroupZ);
+    dive_args.Write(groupCountX);
+    dive_args.Write(groupCountY);
+    dive_args.Write(groupCountZ);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDispatchBaseKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -3447,6 +4296,16 @@ void VulkanExportDiveConsumer::Process_vkGetSemaphoreFdKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPushDescriptorSetKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineBindPoint", sizeof(VkPipelineBindPoint), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPipelineBindPoint>(data), options); } },
+    { "layout", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "set", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "descriptorWriteCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pDescriptorWrites", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPushDescriptorSetKHR = { "vkCmdPushDescriptorSetKHR", format::ApiCallId::ApiCall_vkCmdPushDescriptorSetKHR, kDiveArgs_vkCmdPushDescriptorSetKHR, std::size(kDiveArgs_vkCmdPushDescriptorSetKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPushDescriptorSetKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -3456,16 +4315,19 @@ void VulkanExportDiveConsumer::Process_vkCmdPushDescriptorSetKHR(
     uint32_t                                    descriptorWriteCount,
     StructPointerDecoder<Decoded_VkWriteDescriptorSet>* pDescriptorWrites)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineBindPoint"], pipelineBindPoint, json_options);
-    HandleToJson(args["layout"], layout, json_options);
-    FieldToJson(args["set"], set, json_options);
-    FieldToJson(args["descriptorWriteCount"], descriptorWriteCount, json_options);
-    FieldToJson(args["pDescriptorWrites"], pDescriptorWrites, json_options);
-    util::DiveFunctionData function_data("vkCmdPushDescriptorSetKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineBindPoint);
+    dive_args.Write(layout);
+    dive_args.Write(set);
+    dive_args.Write(descriptorWriteCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDescriptorWrites, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPushDescriptorSetKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -3497,49 +4359,86 @@ void VulkanExportDiveConsumer::Process_vkCreateRenderPass2KHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginRenderPass2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pRenderPassBegin", 0, nullptr },
+    { "pSubpassBeginInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginRenderPass2KHR = { "vkCmdBeginRenderPass2KHR", format::ApiCallId::ApiCall_vkCmdBeginRenderPass2KHR, kDiveArgs_vkCmdBeginRenderPass2KHR, std::size(kDiveArgs_vkCmdBeginRenderPass2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginRenderPass2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderPassBeginInfo>* pRenderPassBegin,
     StructPointerDecoder<Decoded_VkSubpassBeginInfo>* pSubpassBeginInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pRenderPassBegin"], pRenderPassBegin, json_options);
-    FieldToJson(args["pSubpassBeginInfo"], pSubpassBeginInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginRenderPass2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRenderPassBegin, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSubpassBeginInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginRenderPass2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdNextSubpass2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pSubpassBeginInfo", 0, nullptr },
+    { "pSubpassEndInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdNextSubpass2KHR = { "vkCmdNextSubpass2KHR", format::ApiCallId::ApiCall_vkCmdNextSubpass2KHR, kDiveArgs_vkCmdNextSubpass2KHR, std::size(kDiveArgs_vkCmdNextSubpass2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdNextSubpass2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkSubpassBeginInfo>* pSubpassBeginInfo,
     StructPointerDecoder<Decoded_VkSubpassEndInfo>* pSubpassEndInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pSubpassBeginInfo"], pSubpassBeginInfo, json_options);
-    FieldToJson(args["pSubpassEndInfo"], pSubpassEndInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdNextSubpass2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSubpassBeginInfo, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSubpassEndInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdNextSubpass2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndRenderPass2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pSubpassEndInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndRenderPass2KHR = { "vkCmdEndRenderPass2KHR", format::ApiCallId::ApiCall_vkCmdEndRenderPass2KHR, kDiveArgs_vkCmdEndRenderPass2KHR, std::size(kDiveArgs_vkCmdEndRenderPass2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndRenderPass2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkSubpassEndInfo>* pSubpassEndInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pSubpassEndInfo"], pSubpassEndInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdEndRenderPass2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSubpassEndInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndRenderPass2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -3751,6 +4650,17 @@ void VulkanExportDiveConsumer::Process_vkGetDescriptorSetLayoutSupportKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndirectCountKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "countBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "countBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "maxDrawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndirectCountKHR = { "vkCmdDrawIndirectCountKHR", format::ApiCallId::ApiCall_vkCmdDrawIndirectCountKHR, kDiveArgs_vkCmdDrawIndirectCountKHR, std::size(kDiveArgs_vkCmdDrawIndirectCountKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndirectCountKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -3761,19 +4671,28 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndirectCountKHR(
     uint32_t                                    maxDrawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    HandleToJson(args["countBuffer"], countBuffer, json_options);
-    FieldToJson(args["countBufferOffset"], countBufferOffset, json_options);
-    FieldToJson(args["maxDrawCount"], maxDrawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndirectCountKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(countBuffer);
+    dive_args.Write(countBufferOffset);
+    dive_args.Write(maxDrawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndirectCountKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndexedIndirectCountKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "countBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "countBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "maxDrawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndexedIndirectCountKHR = { "vkCmdDrawIndexedIndirectCountKHR", format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountKHR, kDiveArgs_vkCmdDrawIndexedIndirectCountKHR, std::size(kDiveArgs_vkCmdDrawIndexedIndirectCountKHR) };
 
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndexedIndirectCountKHR(
     const ApiCallInfo&                          call_info,
@@ -3785,17 +4704,15 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndexedIndirectCountKHR(
     uint32_t                                    maxDrawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    HandleToJson(args["countBuffer"], countBuffer, json_options);
-    FieldToJson(args["countBufferOffset"], countBufferOffset, json_options);
-    FieldToJson(args["maxDrawCount"], maxDrawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndexedIndirectCountKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(countBuffer);
+    dive_args.Write(countBufferOffset);
+    dive_args.Write(maxDrawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndexedIndirectCountKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -3834,47 +4751,79 @@ void VulkanExportDiveConsumer::Process_vkGetPhysicalDeviceFragmentShadingRatesKH
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetFragmentShadingRateKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pFragmentSize", 0, nullptr },
+    { "combinerOps", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetFragmentShadingRateKHR = { "vkCmdSetFragmentShadingRateKHR", format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateKHR, kDiveArgs_vkCmdSetFragmentShadingRateKHR, std::size(kDiveArgs_vkCmdSetFragmentShadingRateKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetFragmentShadingRateKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkExtent2D>*   pFragmentSize,
     PointerDecoder<VkFragmentShadingRateCombinerOpKHR>* combinerOps)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pFragmentSize"], pFragmentSize, json_options);
-    FieldToJson(args["combinerOps"], combinerOps, json_options);
-    util::DiveFunctionData function_data("vkCmdSetFragmentShadingRateKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pFragmentSize, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), combinerOps, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetFragmentShadingRateKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRenderingAttachmentLocationsKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pLocationInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRenderingAttachmentLocationsKHR = { "vkCmdSetRenderingAttachmentLocationsKHR", format::ApiCallId::ApiCall_vkCmdSetRenderingAttachmentLocationsKHR, kDiveArgs_vkCmdSetRenderingAttachmentLocationsKHR, std::size(kDiveArgs_vkCmdSetRenderingAttachmentLocationsKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRenderingAttachmentLocationsKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderingAttachmentLocationInfo>* pLocationInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pLocationInfo"], pLocationInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRenderingAttachmentLocationsKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pLocationInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRenderingAttachmentLocationsKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRenderingInputAttachmentIndicesKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInputAttachmentIndexInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRenderingInputAttachmentIndicesKHR = { "vkCmdSetRenderingInputAttachmentIndicesKHR", format::ApiCallId::ApiCall_vkCmdSetRenderingInputAttachmentIndicesKHR, kDiveArgs_vkCmdSetRenderingInputAttachmentIndicesKHR, std::size(kDiveArgs_vkCmdSetRenderingInputAttachmentIndicesKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRenderingInputAttachmentIndicesKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderingInputAttachmentIndexInfo>* pInputAttachmentIndexInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInputAttachmentIndexInfo"], pInputAttachmentIndexInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRenderingInputAttachmentIndicesKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInputAttachmentIndexInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRenderingInputAttachmentIndicesKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -4020,52 +4969,84 @@ void VulkanExportDiveConsumer::Process_vkGetEncodedVideoSessionParametersKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEncodeVideoKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pEncodeInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEncodeVideoKHR = { "vkCmdEncodeVideoKHR", format::ApiCallId::ApiCall_vkCmdEncodeVideoKHR, kDiveArgs_vkCmdEncodeVideoKHR, std::size(kDiveArgs_vkCmdEncodeVideoKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEncodeVideoKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkVideoEncodeInfoKHR>* pEncodeInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pEncodeInfo"], pEncodeInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdEncodeVideoKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pEncodeInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEncodeVideoKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetEvent2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "event", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pDependencyInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetEvent2KHR = { "vkCmdSetEvent2KHR", format::ApiCallId::ApiCall_vkCmdSetEvent2KHR, kDiveArgs_vkCmdSetEvent2KHR, std::size(kDiveArgs_vkCmdSetEvent2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetEvent2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            event,
     StructPointerDecoder<Decoded_VkDependencyInfo>* pDependencyInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["event"], event, json_options);
-    FieldToJson(args["pDependencyInfo"], pDependencyInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetEvent2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(event);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDependencyInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetEvent2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdResetEvent2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "event", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stageMask", sizeof(VkPipelineStageFlags2), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags2_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags2>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdResetEvent2KHR = { "vkCmdResetEvent2KHR", format::ApiCallId::ApiCall_vkCmdResetEvent2KHR, kDiveArgs_vkCmdResetEvent2KHR, std::size(kDiveArgs_vkCmdResetEvent2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdResetEvent2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            event,
     VkPipelineStageFlags2                       stageMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["event"], event, json_options);
-    FieldToJson(VkPipelineStageFlags2_t(), args["stageMask"], stageMask, json_options);
-    util::DiveFunctionData function_data("vkCmdResetEvent2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(event);
+    dive_args.Write(stageMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdResetEvent2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWaitEvents2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "eventCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pEvents", 0, nullptr },
+    { "pDependencyInfos", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWaitEvents2KHR = { "vkCmdWaitEvents2KHR", format::ApiCallId::ApiCall_vkCmdWaitEvents2KHR, kDiveArgs_vkCmdWaitEvents2KHR, std::size(kDiveArgs_vkCmdWaitEvents2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWaitEvents2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4073,31 +5054,55 @@ void VulkanExportDiveConsumer::Process_vkCmdWaitEvents2KHR(
     HandlePointerDecoder<VkEvent>*              pEvents,
     StructPointerDecoder<Decoded_VkDependencyInfo>* pDependencyInfos)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["eventCount"], eventCount, json_options);
-    HandleToJson(args["pEvents"], pEvents, json_options);
-    FieldToJson(args["pDependencyInfos"], pDependencyInfos, json_options);
-    util::DiveFunctionData function_data("vkCmdWaitEvents2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(eventCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pEvents, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDependencyInfos, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWaitEvents2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPipelineBarrier2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pDependencyInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPipelineBarrier2KHR = { "vkCmdPipelineBarrier2KHR", format::ApiCallId::ApiCall_vkCmdPipelineBarrier2KHR, kDiveArgs_vkCmdPipelineBarrier2KHR, std::size(kDiveArgs_vkCmdPipelineBarrier2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPipelineBarrier2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkDependencyInfo>* pDependencyInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pDependencyInfo"], pDependencyInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdPipelineBarrier2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDependencyInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPipelineBarrier2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWriteTimestamp2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stage", sizeof(VkPipelineStageFlags2), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags2_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags2>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "query", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWriteTimestamp2KHR = { "vkCmdWriteTimestamp2KHR", format::ApiCallId::ApiCall_vkCmdWriteTimestamp2KHR, kDiveArgs_vkCmdWriteTimestamp2KHR, std::size(kDiveArgs_vkCmdWriteTimestamp2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWriteTimestamp2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4105,17 +5110,23 @@ void VulkanExportDiveConsumer::Process_vkCmdWriteTimestamp2KHR(
     format::HandleId                            queryPool,
     uint32_t                                    query)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkPipelineStageFlags2_t(), args["stage"], stage, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["query"], query, json_options);
-    util::DiveFunctionData function_data("vkCmdWriteTimestamp2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(stage);
+    dive_args.Write(queryPool);
+    dive_args.Write(query);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWriteTimestamp2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkQueueSubmit2KHR[] = {
+    { "queue", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "submitCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pSubmits", 0, nullptr },
+    { "fence", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkQueueSubmit2KHR = { "vkQueueSubmit2KHR", format::ApiCallId::ApiCall_vkQueueSubmit2KHR, kDiveArgs_vkQueueSubmit2KHR, std::size(kDiveArgs_vkQueueSubmit2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkQueueSubmit2KHR(
     const ApiCallInfo&                          call_info,
     VkResult                                    returnValue,
@@ -4124,112 +5135,170 @@ void VulkanExportDiveConsumer::Process_vkQueueSubmit2KHR(
     StructPointerDecoder<Decoded_VkSubmitInfo2>* pSubmits,
     format::HandleId                            fence)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["queue"], queue, json_options);
-    FieldToJson(args["submitCount"], submitCount, json_options);
-    FieldToJson(args["pSubmits"], pSubmits, json_options);
-    HandleToJson(args["fence"], fence, json_options);
-    util::DiveFunctionData function_data("vkQueueSubmit2KHR", 0, call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs();
+    dive_args.Write(queue);
+    dive_args.Write(submitCount);
+    FieldToJson(dive_args.BeginJson(), pSubmits, json_options);
+    dive_args.EndJson();
+    dive_args.Write(fence);
+    util::DiveFunctionData function_data(kDiveSchema_vkQueueSubmit2KHR, 0, call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyBuffer2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCopyBufferInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyBuffer2KHR = { "vkCmdCopyBuffer2KHR", format::ApiCallId::ApiCall_vkCmdCopyBuffer2KHR, kDiveArgs_vkCmdCopyBuffer2KHR, std::size(kDiveArgs_vkCmdCopyBuffer2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyBuffer2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyBufferInfo2>* pCopyBufferInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCopyBufferInfo"], pCopyBufferInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyBuffer2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCopyBufferInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyBuffer2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyImage2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCopyImageInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyImage2KHR = { "vkCmdCopyImage2KHR", format::ApiCallId::ApiCall_vkCmdCopyImage2KHR, kDiveArgs_vkCmdCopyImage2KHR, std::size(kDiveArgs_vkCmdCopyImage2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyImage2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyImageInfo2>* pCopyImageInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCopyImageInfo"], pCopyImageInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyImage2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCopyImageInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyImage2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyBufferToImage2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCopyBufferToImageInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyBufferToImage2KHR = { "vkCmdCopyBufferToImage2KHR", format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2KHR, kDiveArgs_vkCmdCopyBufferToImage2KHR, std::size(kDiveArgs_vkCmdCopyBufferToImage2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyBufferToImage2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyBufferToImageInfo2>* pCopyBufferToImageInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCopyBufferToImageInfo"], pCopyBufferToImageInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyBufferToImage2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCopyBufferToImageInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyBufferToImage2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyImageToBuffer2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCopyImageToBufferInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyImageToBuffer2KHR = { "vkCmdCopyImageToBuffer2KHR", format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2KHR, kDiveArgs_vkCmdCopyImageToBuffer2KHR, std::size(kDiveArgs_vkCmdCopyImageToBuffer2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyImageToBuffer2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyImageToBufferInfo2>* pCopyImageToBufferInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCopyImageToBufferInfo"], pCopyImageToBufferInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyImageToBuffer2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCopyImageToBufferInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyImageToBuffer2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBlitImage2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pBlitImageInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBlitImage2KHR = { "vkCmdBlitImage2KHR", format::ApiCallId::ApiCall_vkCmdBlitImage2KHR, kDiveArgs_vkCmdBlitImage2KHR, std::size(kDiveArgs_vkCmdBlitImage2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBlitImage2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkBlitImageInfo2>* pBlitImageInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pBlitImageInfo"], pBlitImageInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBlitImage2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBlitImageInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBlitImage2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdResolveImage2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pResolveImageInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdResolveImage2KHR = { "vkCmdResolveImage2KHR", format::ApiCallId::ApiCall_vkCmdResolveImage2KHR, kDiveArgs_vkCmdResolveImage2KHR, std::size(kDiveArgs_vkCmdResolveImage2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdResolveImage2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkResolveImageInfo2>* pResolveImageInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pResolveImageInfo"], pResolveImageInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdResolveImage2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pResolveImageInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdResolveImage2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdTraceRaysIndirect2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "indirectDeviceAddress", sizeof(VkDeviceAddress), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJsonAsHex(jdata, util::ReadDiveArg<VkDeviceAddress>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdTraceRaysIndirect2KHR = { "vkCmdTraceRaysIndirect2KHR", format::ApiCallId::ApiCall_vkCmdTraceRaysIndirect2KHR, kDiveArgs_vkCmdTraceRaysIndirect2KHR, std::size(kDiveArgs_vkCmdTraceRaysIndirect2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdTraceRaysIndirect2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkDeviceAddress                             indirectDeviceAddress)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJsonAsHex(args["indirectDeviceAddress"], indirectDeviceAddress, json_options);
-    util::DiveFunctionData function_data("vkCmdTraceRaysIndirect2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(indirectDeviceAddress);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdTraceRaysIndirect2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -4258,6 +5327,15 @@ void VulkanExportDiveConsumer::Process_vkGetDeviceImageSparseMemoryRequirementsK
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindIndexBuffer2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "size", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "indexType", sizeof(VkIndexType), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkIndexType>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindIndexBuffer2KHR = { "vkCmdBindIndexBuffer2KHR", format::ApiCallId::ApiCall_vkCmdBindIndexBuffer2KHR, kDiveArgs_vkCmdBindIndexBuffer2KHR, std::size(kDiveArgs_vkCmdBindIndexBuffer2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindIndexBuffer2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4266,15 +5344,13 @@ void VulkanExportDiveConsumer::Process_vkCmdBindIndexBuffer2KHR(
     VkDeviceSize                                size,
     VkIndexType                                 indexType)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    FieldToJson(args["size"], size, json_options);
-    FieldToJson(args["indexType"], indexType, json_options);
-    util::DiveFunctionData function_data("vkCmdBindIndexBuffer2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(size);
+    dive_args.Write(indexType);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindIndexBuffer2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -4376,19 +5452,24 @@ void VulkanExportDiveConsumer::Process_vkGetPhysicalDeviceCooperativeMatrixPrope
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetLineStippleKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "lineStippleFactor", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "lineStipplePattern", sizeof(uint16_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint16_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetLineStippleKHR = { "vkCmdSetLineStippleKHR", format::ApiCallId::ApiCall_vkCmdSetLineStippleKHR, kDiveArgs_vkCmdSetLineStippleKHR, std::size(kDiveArgs_vkCmdSetLineStippleKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetLineStippleKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    lineStippleFactor,
     uint16_t                                    lineStipplePattern)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["lineStippleFactor"], lineStippleFactor, json_options);
-    FieldToJson(args["lineStipplePattern"], lineStipplePattern, json_options);
-    util::DiveFunctionData function_data("vkCmdSetLineStippleKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(lineStippleFactor);
+    dive_args.Write(lineStipplePattern);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetLineStippleKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -4412,73 +5493,118 @@ void VulkanExportDiveConsumer::Process_vkGetCalibratedTimestampsKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindDescriptorSets2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pBindDescriptorSetsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindDescriptorSets2KHR = { "vkCmdBindDescriptorSets2KHR", format::ApiCallId::ApiCall_vkCmdBindDescriptorSets2KHR, kDiveArgs_vkCmdBindDescriptorSets2KHR, std::size(kDiveArgs_vkCmdBindDescriptorSets2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindDescriptorSets2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkBindDescriptorSetsInfo>* pBindDescriptorSetsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pBindDescriptorSetsInfo"], pBindDescriptorSetsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBindDescriptorSets2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBindDescriptorSetsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindDescriptorSets2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPushConstants2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pPushConstantsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPushConstants2KHR = { "vkCmdPushConstants2KHR", format::ApiCallId::ApiCall_vkCmdPushConstants2KHR, kDiveArgs_vkCmdPushConstants2KHR, std::size(kDiveArgs_vkCmdPushConstants2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPushConstants2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPushConstantsInfo>* pPushConstantsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pPushConstantsInfo"], pPushConstantsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdPushConstants2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pPushConstantsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPushConstants2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPushDescriptorSet2KHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pPushDescriptorSetInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPushDescriptorSet2KHR = { "vkCmdPushDescriptorSet2KHR", format::ApiCallId::ApiCall_vkCmdPushDescriptorSet2KHR, kDiveArgs_vkCmdPushDescriptorSet2KHR, std::size(kDiveArgs_vkCmdPushDescriptorSet2KHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPushDescriptorSet2KHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPushDescriptorSetInfo>* pPushDescriptorSetInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pPushDescriptorSetInfo"], pPushDescriptorSetInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdPushDescriptorSet2KHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pPushDescriptorSetInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPushDescriptorSet2KHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDescriptorBufferOffsets2EXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pSetDescriptorBufferOffsetsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDescriptorBufferOffsets2EXT = { "vkCmdSetDescriptorBufferOffsets2EXT", format::ApiCallId::ApiCall_vkCmdSetDescriptorBufferOffsets2EXT, kDiveArgs_vkCmdSetDescriptorBufferOffsets2EXT, std::size(kDiveArgs_vkCmdSetDescriptorBufferOffsets2EXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDescriptorBufferOffsets2EXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkSetDescriptorBufferOffsetsInfoEXT>* pSetDescriptorBufferOffsetsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pSetDescriptorBufferOffsetsInfo"], pSetDescriptorBufferOffsetsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDescriptorBufferOffsets2EXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSetDescriptorBufferOffsetsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDescriptorBufferOffsets2EXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pBindDescriptorBufferEmbeddedSamplersInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT = { "vkCmdBindDescriptorBufferEmbeddedSamplers2EXT", format::ApiCallId::ApiCall_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT, kDiveArgs_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT, std::size(kDiveArgs_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkBindDescriptorBufferEmbeddedSamplersInfoEXT>* pBindDescriptorBufferEmbeddedSamplersInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pBindDescriptorBufferEmbeddedSamplersInfo"], pBindDescriptorBufferEmbeddedSamplersInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBindDescriptorBufferEmbeddedSamplers2EXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBindDescriptorBufferEmbeddedSamplersInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -4537,46 +5663,77 @@ void VulkanExportDiveConsumer::Process_vkDebugMarkerSetObjectNameEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDebugMarkerBeginEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pMarkerInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDebugMarkerBeginEXT = { "vkCmdDebugMarkerBeginEXT", format::ApiCallId::ApiCall_vkCmdDebugMarkerBeginEXT, kDiveArgs_vkCmdDebugMarkerBeginEXT, std::size(kDiveArgs_vkCmdDebugMarkerBeginEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDebugMarkerBeginEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkDebugMarkerMarkerInfoEXT>* pMarkerInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pMarkerInfo"], pMarkerInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdDebugMarkerBeginEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pMarkerInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDebugMarkerBeginEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDebugMarkerEndEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDebugMarkerEndEXT = { "vkCmdDebugMarkerEndEXT", format::ApiCallId::ApiCall_vkCmdDebugMarkerEndEXT, kDiveArgs_vkCmdDebugMarkerEndEXT, std::size(kDiveArgs_vkCmdDebugMarkerEndEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDebugMarkerEndEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    util::DiveFunctionData function_data("vkCmdDebugMarkerEndEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDebugMarkerEndEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDebugMarkerInsertEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pMarkerInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDebugMarkerInsertEXT = { "vkCmdDebugMarkerInsertEXT", format::ApiCallId::ApiCall_vkCmdDebugMarkerInsertEXT, kDiveArgs_vkCmdDebugMarkerInsertEXT, std::size(kDiveArgs_vkCmdDebugMarkerInsertEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDebugMarkerInsertEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkDebugMarkerMarkerInfoEXT>* pMarkerInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pMarkerInfo"], pMarkerInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdDebugMarkerInsertEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pMarkerInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDebugMarkerInsertEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindTransformFeedbackBuffersEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstBinding", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "bindingCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pBuffers", 0, nullptr },
+    { "pOffsets", 0, nullptr },
+    { "pSizes", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindTransformFeedbackBuffersEXT = { "vkCmdBindTransformFeedbackBuffersEXT", format::ApiCallId::ApiCall_vkCmdBindTransformFeedbackBuffersEXT, kDiveArgs_vkCmdBindTransformFeedbackBuffersEXT, std::size(kDiveArgs_vkCmdBindTransformFeedbackBuffersEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindTransformFeedbackBuffersEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4586,18 +5743,38 @@ void VulkanExportDiveConsumer::Process_vkCmdBindTransformFeedbackBuffersEXT(
     PointerDecoder<VkDeviceSize>*               pOffsets,
     PointerDecoder<VkDeviceSize>*               pSizes)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstBinding"], firstBinding, json_options);
-    FieldToJson(args["bindingCount"], bindingCount, json_options);
-    HandleToJson(args["pBuffers"], pBuffers, json_options);
-    FieldToJson(args["pOffsets"], pOffsets, json_options);
-    FieldToJson(args["pSizes"], pSizes, json_options);
-    util::DiveFunctionData function_data("vkCmdBindTransformFeedbackBuffersEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstBinding);
+    dive_args.Write(bindingCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pBuffers, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pOffsets, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSizes, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindTransformFeedbackBuffersEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginTransformFeedbackEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstCounterBuffer", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "counterBufferCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pCounterBuffers", 0, nullptr },
+    { "pCounterBufferOffsets", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginTransformFeedbackEXT = { "vkCmdBeginTransformFeedbackEXT", format::ApiCallId::ApiCall_vkCmdBeginTransformFeedbackEXT, kDiveArgs_vkCmdBeginTransformFeedbackEXT, std::size(kDiveArgs_vkCmdBeginTransformFeedbackEXT) };
 
 void VulkanExportDiveConsumer::Process_vkCmdBeginTransformFeedbackEXT(
     const ApiCallInfo&                          call_info,
@@ -4607,17 +5784,33 @@ void VulkanExportDiveConsumer::Process_vkCmdBeginTransformFeedbackEXT(
     HandlePointerDecoder<VkBuffer>*             pCounterBuffers,
     PointerDecoder<VkDeviceSize>*               pCounterBufferOffsets)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstCounterBuffer"], firstCounterBuffer, json_options);
-    FieldToJson(args["counterBufferCount"], counterBufferCount, json_options);
-    HandleToJson(args["pCounterBuffers"], pCounterBuffers, json_options);
-    FieldToJson(args["pCounterBufferOffsets"], pCounterBufferOffsets, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginTransformFeedbackEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstCounterBuffer);
+    dive_args.Write(counterBufferCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pCounterBuffers, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCounterBufferOffsets, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginTransformFeedbackEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdEndTransformFeedbackEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstCounterBuffer", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "counterBufferCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pCounterBuffers", 0, nullptr },
+    { "pCounterBufferOffsets", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndTransformFeedbackEXT = { "vkCmdEndTransformFeedbackEXT", format::ApiCallId::ApiCall_vkCmdEndTransformFeedbackEXT, kDiveArgs_vkCmdEndTransformFeedbackEXT, std::size(kDiveArgs_vkCmdEndTransformFeedbackEXT) };
 
 void VulkanExportDiveConsumer::Process_vkCmdEndTransformFeedbackEXT(
     const ApiCallInfo&                          call_info,
@@ -4627,17 +5820,33 @@ void VulkanExportDiveConsumer::Process_vkCmdEndTransformFeedbackEXT(
     HandlePointerDecoder<VkBuffer>*             pCounterBuffers,
     PointerDecoder<VkDeviceSize>*               pCounterBufferOffsets)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstCounterBuffer"], firstCounterBuffer, json_options);
-    FieldToJson(args["counterBufferCount"], counterBufferCount, json_options);
-    HandleToJson(args["pCounterBuffers"], pCounterBuffers, json_options);
-    FieldToJson(args["pCounterBufferOffsets"], pCounterBufferOffsets, json_options);
-    util::DiveFunctionData function_data("vkCmdEndTransformFeedbackEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstCounterBuffer);
+    dive_args.Write(counterBufferCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pCounterBuffers, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCounterBufferOffsets, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndTransformFeedbackEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginQueryIndexedEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "query", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "flags", sizeof(VkQueryControlFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkQueryControlFlags_t(), jdata, util::ReadDiveArg<VkQueryControlFlags>(data), options); } },
+    { "index", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginQueryIndexedEXT = { "vkCmdBeginQueryIndexedEXT", format::ApiCallId::ApiCall_vkCmdBeginQueryIndexedEXT, kDiveArgs_vkCmdBeginQueryIndexedEXT, std::size(kDiveArgs_vkCmdBeginQueryIndexedEXT) };
 
 void VulkanExportDiveConsumer::Process_vkCmdBeginQueryIndexedEXT(
     const ApiCallInfo&                          call_info,
@@ -4647,18 +5856,24 @@ void VulkanExportDiveConsumer::Process_vkCmdBeginQueryIndexedEXT(
     VkQueryControlFlags                         flags,
     uint32_t                                    index)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["query"], query, json_options);
-    FieldToJson(VkQueryControlFlags_t(), args["flags"], flags, json_options);
-    FieldToJson(args["index"], index, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginQueryIndexedEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(queryPool);
+    dive_args.Write(query);
+    dive_args.Write(flags);
+    dive_args.Write(index);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginQueryIndexedEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndQueryIndexedEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "query", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "index", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndQueryIndexedEXT = { "vkCmdEndQueryIndexedEXT", format::ApiCallId::ApiCall_vkCmdEndQueryIndexedEXT, kDiveArgs_vkCmdEndQueryIndexedEXT, std::size(kDiveArgs_vkCmdEndQueryIndexedEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndQueryIndexedEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4666,17 +5881,26 @@ void VulkanExportDiveConsumer::Process_vkCmdEndQueryIndexedEXT(
     uint32_t                                    query,
     uint32_t                                    index)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["query"], query, json_options);
-    FieldToJson(args["index"], index, json_options);
-    util::DiveFunctionData function_data("vkCmdEndQueryIndexedEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(queryPool);
+    dive_args.Write(query);
+    dive_args.Write(index);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndQueryIndexedEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndirectByteCountEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "instanceCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "firstInstance", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "counterBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "counterBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "counterOffset", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "vertexStride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndirectByteCountEXT = { "vkCmdDrawIndirectByteCountEXT", format::ApiCallId::ApiCall_vkCmdDrawIndirectByteCountEXT, kDiveArgs_vkCmdDrawIndirectByteCountEXT, std::size(kDiveArgs_vkCmdDrawIndirectByteCountEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndirectByteCountEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4687,17 +5911,15 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndirectByteCountEXT(
     uint32_t                                    counterOffset,
     uint32_t                                    vertexStride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["instanceCount"], instanceCount, json_options);
-    FieldToJson(args["firstInstance"], firstInstance, json_options);
-    HandleToJson(args["counterBuffer"], counterBuffer, json_options);
-    FieldToJson(args["counterBufferOffset"], counterBufferOffset, json_options);
-    FieldToJson(args["counterOffset"], counterOffset, json_options);
-    FieldToJson(args["vertexStride"], vertexStride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndirectByteCountEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(instanceCount);
+    dive_args.Write(firstInstance);
+    dive_args.Write(counterBuffer);
+    dive_args.Write(counterBufferOffset);
+    dive_args.Write(counterOffset);
+    dive_args.Write(vertexStride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndirectByteCountEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -4726,6 +5948,17 @@ void VulkanExportDiveConsumer::Process_vkGetImageViewAddressNVX(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndirectCountAMD[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "countBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "countBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "maxDrawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndirectCountAMD = { "vkCmdDrawIndirectCountAMD", format::ApiCallId::ApiCall_vkCmdDrawIndirectCountAMD, kDiveArgs_vkCmdDrawIndirectCountAMD, std::size(kDiveArgs_vkCmdDrawIndirectCountAMD) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndirectCountAMD(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4736,19 +5969,28 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndirectCountAMD(
     uint32_t                                    maxDrawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    HandleToJson(args["countBuffer"], countBuffer, json_options);
-    FieldToJson(args["countBufferOffset"], countBufferOffset, json_options);
-    FieldToJson(args["maxDrawCount"], maxDrawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndirectCountAMD", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(countBuffer);
+    dive_args.Write(countBufferOffset);
+    dive_args.Write(maxDrawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndirectCountAMD, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawIndexedIndirectCountAMD[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "countBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "countBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "maxDrawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawIndexedIndirectCountAMD = { "vkCmdDrawIndexedIndirectCountAMD", format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountAMD, kDiveArgs_vkCmdDrawIndexedIndirectCountAMD, std::size(kDiveArgs_vkCmdDrawIndexedIndirectCountAMD) };
 
 void VulkanExportDiveConsumer::Process_vkCmdDrawIndexedIndirectCountAMD(
     const ApiCallInfo&                          call_info,
@@ -4760,17 +6002,15 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawIndexedIndirectCountAMD(
     uint32_t                                    maxDrawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    HandleToJson(args["countBuffer"], countBuffer, json_options);
-    FieldToJson(args["countBufferOffset"], countBufferOffset, json_options);
-    FieldToJson(args["maxDrawCount"], maxDrawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawIndexedIndirectCountAMD", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(countBuffer);
+    dive_args.Write(countBufferOffset);
+    dive_args.Write(maxDrawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawIndexedIndirectCountAMD, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -4830,32 +6070,52 @@ void VulkanExportDiveConsumer::Process_vkCreateViSurfaceNN(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginConditionalRenderingEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pConditionalRenderingBegin", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginConditionalRenderingEXT = { "vkCmdBeginConditionalRenderingEXT", format::ApiCallId::ApiCall_vkCmdBeginConditionalRenderingEXT, kDiveArgs_vkCmdBeginConditionalRenderingEXT, std::size(kDiveArgs_vkCmdBeginConditionalRenderingEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginConditionalRenderingEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkConditionalRenderingBeginInfoEXT>* pConditionalRenderingBegin)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pConditionalRenderingBegin"], pConditionalRenderingBegin, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginConditionalRenderingEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pConditionalRenderingBegin, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginConditionalRenderingEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndConditionalRenderingEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndConditionalRenderingEXT = { "vkCmdEndConditionalRenderingEXT", format::ApiCallId::ApiCall_vkCmdEndConditionalRenderingEXT, kDiveArgs_vkCmdEndConditionalRenderingEXT, std::size(kDiveArgs_vkCmdEndConditionalRenderingEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndConditionalRenderingEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    util::DiveFunctionData function_data("vkCmdEndConditionalRenderingEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndConditionalRenderingEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetViewportWScalingNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstViewport", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "viewportCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pViewportWScalings", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetViewportWScalingNV = { "vkCmdSetViewportWScalingNV", format::ApiCallId::ApiCall_vkCmdSetViewportWScalingNV, kDiveArgs_vkCmdSetViewportWScalingNV, std::size(kDiveArgs_vkCmdSetViewportWScalingNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetViewportWScalingNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4863,14 +6123,17 @@ void VulkanExportDiveConsumer::Process_vkCmdSetViewportWScalingNV(
     uint32_t                                    viewportCount,
     StructPointerDecoder<Decoded_VkViewportWScalingNV>* pViewportWScalings)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstViewport"], firstViewport, json_options);
-    FieldToJson(args["viewportCount"], viewportCount, json_options);
-    FieldToJson(args["pViewportWScalings"], pViewportWScalings, json_options);
-    util::DiveFunctionData function_data("vkCmdSetViewportWScalingNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstViewport);
+    dive_args.Write(viewportCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pViewportWScalings, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetViewportWScalingNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -4969,6 +6232,14 @@ void VulkanExportDiveConsumer::Process_vkGetPastPresentationTimingGOOGLE(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDiscardRectangleEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstDiscardRectangle", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "discardRectangleCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pDiscardRectangles", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDiscardRectangleEXT = { "vkCmdSetDiscardRectangleEXT", format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleEXT, kDiveArgs_vkCmdSetDiscardRectangleEXT, std::size(kDiveArgs_vkCmdSetDiscardRectangleEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDiscardRectangleEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -4976,42 +6247,53 @@ void VulkanExportDiveConsumer::Process_vkCmdSetDiscardRectangleEXT(
     uint32_t                                    discardRectangleCount,
     StructPointerDecoder<Decoded_VkRect2D>*     pDiscardRectangles)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstDiscardRectangle"], firstDiscardRectangle, json_options);
-    FieldToJson(args["discardRectangleCount"], discardRectangleCount, json_options);
-    FieldToJson(args["pDiscardRectangles"], pDiscardRectangles, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDiscardRectangleEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstDiscardRectangle);
+    dive_args.Write(discardRectangleCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDiscardRectangles, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDiscardRectangleEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDiscardRectangleEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "discardRectangleEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDiscardRectangleEnableEXT = { "vkCmdSetDiscardRectangleEnableEXT", format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleEnableEXT, kDiveArgs_vkCmdSetDiscardRectangleEnableEXT, std::size(kDiveArgs_vkCmdSetDiscardRectangleEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDiscardRectangleEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    discardRectangleEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["discardRectangleEnable"], discardRectangleEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDiscardRectangleEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(discardRectangleEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDiscardRectangleEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDiscardRectangleModeEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "discardRectangleMode", sizeof(VkDiscardRectangleModeEXT), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDiscardRectangleModeEXT>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDiscardRectangleModeEXT = { "vkCmdSetDiscardRectangleModeEXT", format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleModeEXT, kDiveArgs_vkCmdSetDiscardRectangleModeEXT, std::size(kDiveArgs_vkCmdSetDiscardRectangleModeEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDiscardRectangleModeEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkDiscardRectangleModeEXT                   discardRectangleMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["discardRectangleMode"], discardRectangleMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDiscardRectangleModeEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(discardRectangleMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDiscardRectangleModeEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5080,43 +6362,61 @@ void VulkanExportDiveConsumer::Process_vkQueueInsertDebugUtilsLabelEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginDebugUtilsLabelEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pLabelInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginDebugUtilsLabelEXT = { "vkCmdBeginDebugUtilsLabelEXT", format::ApiCallId::ApiCall_vkCmdBeginDebugUtilsLabelEXT, kDiveArgs_vkCmdBeginDebugUtilsLabelEXT, std::size(kDiveArgs_vkCmdBeginDebugUtilsLabelEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginDebugUtilsLabelEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkDebugUtilsLabelEXT>* pLabelInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pLabelInfo"], pLabelInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginDebugUtilsLabelEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs();
+    dive_args.Write(commandBuffer);
+    FieldToJson(dive_args.BeginJson(), pLabelInfo, json_options);
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginDebugUtilsLabelEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndDebugUtilsLabelEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndDebugUtilsLabelEXT = { "vkCmdEndDebugUtilsLabelEXT", format::ApiCallId::ApiCall_vkCmdEndDebugUtilsLabelEXT, kDiveArgs_vkCmdEndDebugUtilsLabelEXT, std::size(kDiveArgs_vkCmdEndDebugUtilsLabelEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndDebugUtilsLabelEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    util::DiveFunctionData function_data("vkCmdEndDebugUtilsLabelEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndDebugUtilsLabelEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdInsertDebugUtilsLabelEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pLabelInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdInsertDebugUtilsLabelEXT = { "vkCmdInsertDebugUtilsLabelEXT", format::ApiCallId::ApiCall_vkCmdInsertDebugUtilsLabelEXT, kDiveArgs_vkCmdInsertDebugUtilsLabelEXT, std::size(kDiveArgs_vkCmdInsertDebugUtilsLabelEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdInsertDebugUtilsLabelEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkDebugUtilsLabelEXT>* pLabelInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pLabelInfo"], pLabelInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdInsertDebugUtilsLabelEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pLabelInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdInsertDebugUtilsLabelEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5165,17 +6465,26 @@ void VulkanExportDiveConsumer::Process_vkGetMemoryAndroidHardwareBufferANDROID(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetSampleLocationsEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pSampleLocationsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetSampleLocationsEXT = { "vkCmdSetSampleLocationsEXT", format::ApiCallId::ApiCall_vkCmdSetSampleLocationsEXT, kDiveArgs_vkCmdSetSampleLocationsEXT, std::size(kDiveArgs_vkCmdSetSampleLocationsEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetSampleLocationsEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkSampleLocationsInfoEXT>* pSampleLocationsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pSampleLocationsInfo"], pSampleLocationsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetSampleLocationsEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSampleLocationsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetSampleLocationsEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5234,22 +6543,35 @@ void VulkanExportDiveConsumer::Process_vkGetValidationCacheDataEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindShadingRateImageNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "imageView", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "imageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindShadingRateImageNV = { "vkCmdBindShadingRateImageNV", format::ApiCallId::ApiCall_vkCmdBindShadingRateImageNV, kDiveArgs_vkCmdBindShadingRateImageNV, std::size(kDiveArgs_vkCmdBindShadingRateImageNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindShadingRateImageNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            imageView,
     VkImageLayout                               imageLayout)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["imageView"], imageView, json_options);
-    FieldToJson(args["imageLayout"], imageLayout, json_options);
-    util::DiveFunctionData function_data("vkCmdBindShadingRateImageNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(imageView);
+    dive_args.Write(imageLayout);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindShadingRateImageNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetViewportShadingRatePaletteNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstViewport", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "viewportCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pShadingRatePalettes", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetViewportShadingRatePaletteNV = { "vkCmdSetViewportShadingRatePaletteNV", format::ApiCallId::ApiCall_vkCmdSetViewportShadingRatePaletteNV, kDiveArgs_vkCmdSetViewportShadingRatePaletteNV, std::size(kDiveArgs_vkCmdSetViewportShadingRatePaletteNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetViewportShadingRatePaletteNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5257,17 +6579,28 @@ void VulkanExportDiveConsumer::Process_vkCmdSetViewportShadingRatePaletteNV(
     uint32_t                                    viewportCount,
     StructPointerDecoder<Decoded_VkShadingRatePaletteNV>* pShadingRatePalettes)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstViewport"], firstViewport, json_options);
-    FieldToJson(args["viewportCount"], viewportCount, json_options);
-    FieldToJson(args["pShadingRatePalettes"], pShadingRatePalettes, json_options);
-    util::DiveFunctionData function_data("vkCmdSetViewportShadingRatePaletteNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstViewport);
+    dive_args.Write(viewportCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pShadingRatePalettes, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetViewportShadingRatePaletteNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCoarseSampleOrderNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "sampleOrderType", sizeof(VkCoarseSampleOrderTypeNV), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkCoarseSampleOrderTypeNV>(data), options); } },
+    { "customSampleOrderCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pCustomSampleOrders", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCoarseSampleOrderNV = { "vkCmdSetCoarseSampleOrderNV", format::ApiCallId::ApiCall_vkCmdSetCoarseSampleOrderNV, kDiveArgs_vkCmdSetCoarseSampleOrderNV, std::size(kDiveArgs_vkCmdSetCoarseSampleOrderNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCoarseSampleOrderNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5275,14 +6608,17 @@ void VulkanExportDiveConsumer::Process_vkCmdSetCoarseSampleOrderNV(
     uint32_t                                    customSampleOrderCount,
     StructPointerDecoder<Decoded_VkCoarseSampleOrderCustomNV>* pCustomSampleOrders)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["sampleOrderType"], sampleOrderType, json_options);
-    FieldToJson(args["customSampleOrderCount"], customSampleOrderCount, json_options);
-    FieldToJson(args["pCustomSampleOrders"], pCustomSampleOrders, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCoarseSampleOrderNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(sampleOrderType);
+    dive_args.Write(customSampleOrderCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCustomSampleOrders, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCoarseSampleOrderNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5321,6 +6657,19 @@ void VulkanExportDiveConsumer::Process_vkBindAccelerationStructureMemoryNV(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBuildAccelerationStructureNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInfo", 0, nullptr },
+    { "instanceData", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "instanceOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "update", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+    { "dst", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "src", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "scratch", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "scratchOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBuildAccelerationStructureNV = { "vkCmdBuildAccelerationStructureNV", format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructureNV, kDiveArgs_vkCmdBuildAccelerationStructureNV, std::size(kDiveArgs_vkCmdBuildAccelerationStructureNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBuildAccelerationStructureNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5333,21 +6682,32 @@ void VulkanExportDiveConsumer::Process_vkCmdBuildAccelerationStructureNV(
     format::HandleId                            scratch,
     VkDeviceSize                                scratchOffset)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInfo"], pInfo, json_options);
-    HandleToJson(args["instanceData"], instanceData, json_options);
-    FieldToJson(args["instanceOffset"], instanceOffset, json_options);
-    Bool32ToJson(args["update"], update, json_options);
-    HandleToJson(args["dst"], dst, json_options);
-    HandleToJson(args["src"], src, json_options);
-    HandleToJson(args["scratch"], scratch, json_options);
-    FieldToJson(args["scratchOffset"], scratchOffset, json_options);
-    util::DiveFunctionData function_data("vkCmdBuildAccelerationStructureNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfo, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(instanceData);
+    dive_args.Write(instanceOffset);
+    dive_args.Write(update);
+    dive_args.Write(dst);
+    dive_args.Write(src);
+    dive_args.Write(scratch);
+    dive_args.Write(scratchOffset);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBuildAccelerationStructureNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyAccelerationStructureNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dst", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "src", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "mode", sizeof(VkCopyAccelerationStructureModeKHR), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkCopyAccelerationStructureModeKHR>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyAccelerationStructureNV = { "vkCmdCopyAccelerationStructureNV", format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureNV, kDiveArgs_vkCmdCopyAccelerationStructureNV, std::size(kDiveArgs_vkCmdCopyAccelerationStructureNV) };
 
 void VulkanExportDiveConsumer::Process_vkCmdCopyAccelerationStructureNV(
     const ApiCallInfo&                          call_info,
@@ -5356,16 +6716,33 @@ void VulkanExportDiveConsumer::Process_vkCmdCopyAccelerationStructureNV(
     format::HandleId                            src,
     VkCopyAccelerationStructureModeKHR          mode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["dst"], dst, json_options);
-    HandleToJson(args["src"], src, json_options);
-    FieldToJson(args["mode"], mode, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyAccelerationStructureNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(dst);
+    dive_args.Write(src);
+    dive_args.Write(mode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyAccelerationStructureNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdTraceRaysNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "raygenShaderBindingTableBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "raygenShaderBindingOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "missShaderBindingTableBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "missShaderBindingOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "missShaderBindingStride", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "hitShaderBindingTableBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "hitShaderBindingOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "hitShaderBindingStride", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "callableShaderBindingTableBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "callableShaderBindingOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "callableShaderBindingStride", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "width", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "height", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "depth", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdTraceRaysNV = { "vkCmdTraceRaysNV", format::ApiCallId::ApiCall_vkCmdTraceRaysNV, kDiveArgs_vkCmdTraceRaysNV, std::size(kDiveArgs_vkCmdTraceRaysNV) };
 
 void VulkanExportDiveConsumer::Process_vkCmdTraceRaysNV(
     const ApiCallInfo&                          call_info,
@@ -5385,25 +6762,23 @@ void VulkanExportDiveConsumer::Process_vkCmdTraceRaysNV(
     uint32_t                                    height,
     uint32_t                                    depth)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["raygenShaderBindingTableBuffer"], raygenShaderBindingTableBuffer, json_options);
-    FieldToJson(args["raygenShaderBindingOffset"], raygenShaderBindingOffset, json_options);
-    HandleToJson(args["missShaderBindingTableBuffer"], missShaderBindingTableBuffer, json_options);
-    FieldToJson(args["missShaderBindingOffset"], missShaderBindingOffset, json_options);
-    FieldToJson(args["missShaderBindingStride"], missShaderBindingStride, json_options);
-    HandleToJson(args["hitShaderBindingTableBuffer"], hitShaderBindingTableBuffer, json_options);
-    FieldToJson(args["hitShaderBindingOffset"], hitShaderBindingOffset, json_options);
-    FieldToJson(args["hitShaderBindingStride"], hitShaderBindingStride, json_options);
-    HandleToJson(args["callableShaderBindingTableBuffer"], callableShaderBindingTableBuffer, json_options);
-    FieldToJson(args["callableShaderBindingOffset"], callableShaderBindingOffset, json_options);
-    FieldToJson(args["callableShaderBindingStride"], callableShaderBindingStride, json_options);
-    FieldToJson(args["width"], width, json_options);
-    FieldToJson(args["height"], height, json_options);
-    FieldToJson(args["depth"], depth, json_options);
-    util::DiveFunctionData function_data("vkCmdTraceRaysNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(raygenShaderBindingTableBuffer);
+    dive_args.Write(raygenShaderBindingOffset);
+    dive_args.Write(missShaderBindingTableBuffer);
+    dive_args.Write(missShaderBindingOffset);
+    dive_args.Write(missShaderBindingStride);
+    dive_args.Write(hitShaderBindingTableBuffer);
+    dive_args.Write(hitShaderBindingOffset);
+    dive_args.Write(hitShaderBindingStride);
+    dive_args.Write(callableShaderBindingTableBuffer);
+    dive_args.Write(callableShaderBindingOffset);
+    dive_args.Write(callableShaderBindingStride);
+    dive_args.Write(width);
+    dive_args.Write(height);
+    dive_args.Write(depth);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdTraceRaysNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5453,6 +6828,16 @@ void VulkanExportDiveConsumer::Process_vkGetAccelerationStructureHandleNV(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWriteAccelerationStructuresPropertiesNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "accelerationStructureCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pAccelerationStructures", 0, nullptr },
+    { "queryType", sizeof(VkQueryType), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkQueryType>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstQuery", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWriteAccelerationStructuresPropertiesNV = { "vkCmdWriteAccelerationStructuresPropertiesNV", format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesNV, kDiveArgs_vkCmdWriteAccelerationStructuresPropertiesNV, std::size(kDiveArgs_vkCmdWriteAccelerationStructuresPropertiesNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWriteAccelerationStructuresPropertiesNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5462,16 +6847,19 @@ void VulkanExportDiveConsumer::Process_vkCmdWriteAccelerationStructuresPropertie
     format::HandleId                            queryPool,
     uint32_t                                    firstQuery)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["accelerationStructureCount"], accelerationStructureCount, json_options);
-    HandleToJson(args["pAccelerationStructures"], pAccelerationStructures, json_options);
-    FieldToJson(args["queryType"], queryType, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["firstQuery"], firstQuery, json_options);
-    util::DiveFunctionData function_data("vkCmdWriteAccelerationStructuresPropertiesNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(accelerationStructureCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pAccelerationStructures, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(queryType);
+    dive_args.Write(queryPool);
+    dive_args.Write(firstQuery);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWriteAccelerationStructuresPropertiesNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5494,6 +6882,15 @@ void VulkanExportDiveConsumer::Process_vkGetMemoryHostPointerPropertiesEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWriteBufferMarkerAMD[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineStage", sizeof(VkPipelineStageFlagBits), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPipelineStageFlagBits>(data), options); } },
+    { "dstBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "marker", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWriteBufferMarkerAMD = { "vkCmdWriteBufferMarkerAMD", format::ApiCallId::ApiCall_vkCmdWriteBufferMarkerAMD, kDiveArgs_vkCmdWriteBufferMarkerAMD, std::size(kDiveArgs_vkCmdWriteBufferMarkerAMD) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWriteBufferMarkerAMD(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5502,18 +6899,25 @@ void VulkanExportDiveConsumer::Process_vkCmdWriteBufferMarkerAMD(
     VkDeviceSize                                dstOffset,
     uint32_t                                    marker)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineStage"], pipelineStage, json_options);
-    HandleToJson(args["dstBuffer"], dstBuffer, json_options);
-    FieldToJson(args["dstOffset"], dstOffset, json_options);
-    FieldToJson(args["marker"], marker, json_options);
-    util::DiveFunctionData function_data("vkCmdWriteBufferMarkerAMD", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineStage);
+    dive_args.Write(dstBuffer);
+    dive_args.Write(dstOffset);
+    dive_args.Write(marker);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWriteBufferMarkerAMD, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWriteBufferMarker2AMD[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stage", sizeof(VkPipelineStageFlags2), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkPipelineStageFlags2_t(), jdata, util::ReadDiveArg<VkPipelineStageFlags2>(data), options); } },
+    { "dstBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "dstOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "marker", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWriteBufferMarker2AMD = { "vkCmdWriteBufferMarker2AMD", format::ApiCallId::ApiCall_vkCmdWriteBufferMarker2AMD, kDiveArgs_vkCmdWriteBufferMarker2AMD, std::size(kDiveArgs_vkCmdWriteBufferMarker2AMD) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWriteBufferMarker2AMD(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5522,15 +6926,13 @@ void VulkanExportDiveConsumer::Process_vkCmdWriteBufferMarker2AMD(
     VkDeviceSize                                dstOffset,
     uint32_t                                    marker)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkPipelineStageFlags2_t(), args["stage"], stage, json_options);
-    HandleToJson(args["dstBuffer"], dstBuffer, json_options);
-    FieldToJson(args["dstOffset"], dstOffset, json_options);
-    FieldToJson(args["marker"], marker, json_options);
-    util::DiveFunctionData function_data("vkCmdWriteBufferMarker2AMD", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(stage);
+    dive_args.Write(dstBuffer);
+    dive_args.Write(dstOffset);
+    dive_args.Write(marker);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWriteBufferMarker2AMD, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5554,22 +6956,36 @@ void VulkanExportDiveConsumer::Process_vkGetCalibratedTimestampsEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawMeshTasksNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "taskCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "firstTask", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawMeshTasksNV = { "vkCmdDrawMeshTasksNV", format::ApiCallId::ApiCall_vkCmdDrawMeshTasksNV, kDiveArgs_vkCmdDrawMeshTasksNV, std::size(kDiveArgs_vkCmdDrawMeshTasksNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    taskCount,
     uint32_t                                    firstTask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["taskCount"], taskCount, json_options);
-    FieldToJson(args["firstTask"], firstTask, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawMeshTasksNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(taskCount);
+    dive_args.Write(firstTask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawMeshTasksNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawMeshTasksIndirectNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "drawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawMeshTasksIndirectNV = { "vkCmdDrawMeshTasksIndirectNV", format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectNV, kDiveArgs_vkCmdDrawMeshTasksIndirectNV, std::size(kDiveArgs_vkCmdDrawMeshTasksIndirectNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksIndirectNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5578,18 +6994,27 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksIndirectNV(
     uint32_t                                    drawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    FieldToJson(args["drawCount"], drawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawMeshTasksIndirectNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(drawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawMeshTasksIndirectNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawMeshTasksIndirectCountNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "countBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "countBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "maxDrawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawMeshTasksIndirectCountNV = { "vkCmdDrawMeshTasksIndirectCountNV", format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountNV, kDiveArgs_vkCmdDrawMeshTasksIndirectCountNV, std::size(kDiveArgs_vkCmdDrawMeshTasksIndirectCountNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksIndirectCountNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5600,20 +7025,26 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksIndirectCountNV(
     uint32_t                                    maxDrawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    HandleToJson(args["countBuffer"], countBuffer, json_options);
-    FieldToJson(args["countBufferOffset"], countBufferOffset, json_options);
-    FieldToJson(args["maxDrawCount"], maxDrawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawMeshTasksIndirectCountNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(countBuffer);
+    dive_args.Write(countBufferOffset);
+    dive_args.Write(maxDrawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawMeshTasksIndirectCountNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetExclusiveScissorEnableNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstExclusiveScissor", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "exclusiveScissorCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pExclusiveScissorEnables", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetExclusiveScissorEnableNV = { "vkCmdSetExclusiveScissorEnableNV", format::ApiCallId::ApiCall_vkCmdSetExclusiveScissorEnableNV, kDiveArgs_vkCmdSetExclusiveScissorEnableNV, std::size(kDiveArgs_vkCmdSetExclusiveScissorEnableNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetExclusiveScissorEnableNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5621,17 +7052,28 @@ void VulkanExportDiveConsumer::Process_vkCmdSetExclusiveScissorEnableNV(
     uint32_t                                    exclusiveScissorCount,
     PointerDecoder<VkBool32>*                   pExclusiveScissorEnables)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstExclusiveScissor"], firstExclusiveScissor, json_options);
-    FieldToJson(args["exclusiveScissorCount"], exclusiveScissorCount, json_options);
-    Bool32ToJson(args["pExclusiveScissorEnables"], pExclusiveScissorEnables, json_options);
-    util::DiveFunctionData function_data("vkCmdSetExclusiveScissorEnableNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstExclusiveScissor);
+    dive_args.Write(exclusiveScissorCount);
+    if (!dive_args.DeferJson())
+    {
+        Bool32ToJson(dive_args.BeginJson(), pExclusiveScissorEnables, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetExclusiveScissorEnableNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetExclusiveScissorNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstExclusiveScissor", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "exclusiveScissorCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pExclusiveScissors", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetExclusiveScissorNV = { "vkCmdSetExclusiveScissorNV", format::ApiCallId::ApiCall_vkCmdSetExclusiveScissorNV, kDiveArgs_vkCmdSetExclusiveScissorNV, std::size(kDiveArgs_vkCmdSetExclusiveScissorNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetExclusiveScissorNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5639,28 +7081,35 @@ void VulkanExportDiveConsumer::Process_vkCmdSetExclusiveScissorNV(
     uint32_t                                    exclusiveScissorCount,
     StructPointerDecoder<Decoded_VkRect2D>*     pExclusiveScissors)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstExclusiveScissor"], firstExclusiveScissor, json_options);
-    FieldToJson(args["exclusiveScissorCount"], exclusiveScissorCount, json_options);
-    FieldToJson(args["pExclusiveScissors"], pExclusiveScissors, json_options);
-    util::DiveFunctionData function_data("vkCmdSetExclusiveScissorNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstExclusiveScissor);
+    dive_args.Write(exclusiveScissorCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pExclusiveScissors, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetExclusiveScissorNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCheckpointNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pCheckpointMarker", sizeof(uint64_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint64_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCheckpointNV = { "vkCmdSetCheckpointNV", format::ApiCallId::ApiCall_vkCmdSetCheckpointNV, kDiveArgs_vkCmdSetCheckpointNV, std::size(kDiveArgs_vkCmdSetCheckpointNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCheckpointNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint64_t                                    pCheckpointMarker)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pCheckpointMarker"], pCheckpointMarker, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCheckpointNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pCheckpointMarker);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCheckpointNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5694,48 +7143,75 @@ void VulkanExportDiveConsumer::Process_vkUninitializePerformanceApiINTEL(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPerformanceMarkerINTEL[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pMarkerInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPerformanceMarkerINTEL = { "vkCmdSetPerformanceMarkerINTEL", format::ApiCallId::ApiCall_vkCmdSetPerformanceMarkerINTEL, kDiveArgs_vkCmdSetPerformanceMarkerINTEL, std::size(kDiveArgs_vkCmdSetPerformanceMarkerINTEL) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPerformanceMarkerINTEL(
     const ApiCallInfo&                          call_info,
     VkResult                                    returnValue,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPerformanceMarkerInfoINTEL>* pMarkerInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pMarkerInfo"], pMarkerInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPerformanceMarkerINTEL", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pMarkerInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPerformanceMarkerINTEL, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPerformanceStreamMarkerINTEL[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pMarkerInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPerformanceStreamMarkerINTEL = { "vkCmdSetPerformanceStreamMarkerINTEL", format::ApiCallId::ApiCall_vkCmdSetPerformanceStreamMarkerINTEL, kDiveArgs_vkCmdSetPerformanceStreamMarkerINTEL, std::size(kDiveArgs_vkCmdSetPerformanceStreamMarkerINTEL) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPerformanceStreamMarkerINTEL(
     const ApiCallInfo&                          call_info,
     VkResult                                    returnValue,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPerformanceStreamMarkerInfoINTEL>* pMarkerInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pMarkerInfo"], pMarkerInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPerformanceStreamMarkerINTEL", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pMarkerInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPerformanceStreamMarkerINTEL, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPerformanceOverrideINTEL[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pOverrideInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPerformanceOverrideINTEL = { "vkCmdSetPerformanceOverrideINTEL", format::ApiCallId::ApiCall_vkCmdSetPerformanceOverrideINTEL, kDiveArgs_vkCmdSetPerformanceOverrideINTEL, std::size(kDiveArgs_vkCmdSetPerformanceOverrideINTEL) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPerformanceOverrideINTEL(
     const ApiCallInfo&                          call_info,
     VkResult                                    returnValue,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPerformanceOverrideInfoINTEL>* pOverrideInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pOverrideInfo"], pOverrideInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPerformanceOverrideINTEL", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pOverrideInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPerformanceOverrideINTEL, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5881,19 +7357,24 @@ void VulkanExportDiveConsumer::Process_vkCreateHeadlessSurfaceEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetLineStippleEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "lineStippleFactor", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "lineStipplePattern", sizeof(uint16_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint16_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetLineStippleEXT = { "vkCmdSetLineStippleEXT", format::ApiCallId::ApiCall_vkCmdSetLineStippleEXT, kDiveArgs_vkCmdSetLineStippleEXT, std::size(kDiveArgs_vkCmdSetLineStippleEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetLineStippleEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    lineStippleFactor,
     uint16_t                                    lineStipplePattern)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["lineStippleFactor"], lineStippleFactor, json_options);
-    FieldToJson(args["lineStipplePattern"], lineStipplePattern, json_options);
-    util::DiveFunctionData function_data("vkCmdSetLineStippleEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(lineStippleFactor);
+    dive_args.Write(lineStipplePattern);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetLineStippleEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -5906,80 +7387,123 @@ void VulkanExportDiveConsumer::Process_vkResetQueryPoolEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCullModeEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "cullMode", sizeof(VkCullModeFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkCullModeFlags_t(), jdata, util::ReadDiveArg<VkCullModeFlags>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCullModeEXT = { "vkCmdSetCullModeEXT", format::ApiCallId::ApiCall_vkCmdSetCullModeEXT, kDiveArgs_vkCmdSetCullModeEXT, std::size(kDiveArgs_vkCmdSetCullModeEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCullModeEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkCullModeFlags                             cullMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkCullModeFlags_t(), args["cullMode"], cullMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCullModeEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(cullMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCullModeEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetFrontFaceEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "frontFace", sizeof(VkFrontFace), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkFrontFace>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetFrontFaceEXT = { "vkCmdSetFrontFaceEXT", format::ApiCallId::ApiCall_vkCmdSetFrontFaceEXT, kDiveArgs_vkCmdSetFrontFaceEXT, std::size(kDiveArgs_vkCmdSetFrontFaceEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetFrontFaceEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkFrontFace                                 frontFace)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["frontFace"], frontFace, json_options);
-    util::DiveFunctionData function_data("vkCmdSetFrontFaceEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(frontFace);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetFrontFaceEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPrimitiveTopologyEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "primitiveTopology", sizeof(VkPrimitiveTopology), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPrimitiveTopology>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPrimitiveTopologyEXT = { "vkCmdSetPrimitiveTopologyEXT", format::ApiCallId::ApiCall_vkCmdSetPrimitiveTopologyEXT, kDiveArgs_vkCmdSetPrimitiveTopologyEXT, std::size(kDiveArgs_vkCmdSetPrimitiveTopologyEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPrimitiveTopologyEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkPrimitiveTopology                         primitiveTopology)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["primitiveTopology"], primitiveTopology, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPrimitiveTopologyEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(primitiveTopology);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPrimitiveTopologyEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetViewportWithCountEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "viewportCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pViewports", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetViewportWithCountEXT = { "vkCmdSetViewportWithCountEXT", format::ApiCallId::ApiCall_vkCmdSetViewportWithCountEXT, kDiveArgs_vkCmdSetViewportWithCountEXT, std::size(kDiveArgs_vkCmdSetViewportWithCountEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetViewportWithCountEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    viewportCount,
     StructPointerDecoder<Decoded_VkViewport>*   pViewports)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["viewportCount"], viewportCount, json_options);
-    FieldToJson(args["pViewports"], pViewports, json_options);
-    util::DiveFunctionData function_data("vkCmdSetViewportWithCountEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(viewportCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pViewports, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetViewportWithCountEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetScissorWithCountEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "scissorCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pScissors", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetScissorWithCountEXT = { "vkCmdSetScissorWithCountEXT", format::ApiCallId::ApiCall_vkCmdSetScissorWithCountEXT, kDiveArgs_vkCmdSetScissorWithCountEXT, std::size(kDiveArgs_vkCmdSetScissorWithCountEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetScissorWithCountEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    scissorCount,
     StructPointerDecoder<Decoded_VkRect2D>*     pScissors)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["scissorCount"], scissorCount, json_options);
-    FieldToJson(args["pScissors"], pScissors, json_options);
-    util::DiveFunctionData function_data("vkCmdSetScissorWithCountEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(scissorCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pScissors, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetScissorWithCountEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindVertexBuffers2EXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstBinding", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "bindingCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pBuffers", 0, nullptr },
+    { "pOffsets", 0, nullptr },
+    { "pSizes", 0, nullptr },
+    { "pStrides", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindVertexBuffers2EXT = { "vkCmdBindVertexBuffers2EXT", format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2EXT, kDiveArgs_vkCmdBindVertexBuffers2EXT, std::size(kDiveArgs_vkCmdBindVertexBuffers2EXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindVertexBuffers2EXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -5990,90 +7514,135 @@ void VulkanExportDiveConsumer::Process_vkCmdBindVertexBuffers2EXT(
     PointerDecoder<VkDeviceSize>*               pSizes,
     PointerDecoder<VkDeviceSize>*               pStrides)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstBinding"], firstBinding, json_options);
-    FieldToJson(args["bindingCount"], bindingCount, json_options);
-    HandleToJson(args["pBuffers"], pBuffers, json_options);
-    FieldToJson(args["pOffsets"], pOffsets, json_options);
-    FieldToJson(args["pSizes"], pSizes, json_options);
-    FieldToJson(args["pStrides"], pStrides, json_options);
-    util::DiveFunctionData function_data("vkCmdBindVertexBuffers2EXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstBinding);
+    dive_args.Write(bindingCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pBuffers, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pOffsets, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSizes, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pStrides, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindVertexBuffers2EXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthTestEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthTestEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthTestEnableEXT = { "vkCmdSetDepthTestEnableEXT", format::ApiCallId::ApiCall_vkCmdSetDepthTestEnableEXT, kDiveArgs_vkCmdSetDepthTestEnableEXT, std::size(kDiveArgs_vkCmdSetDepthTestEnableEXT) };
 
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthTestEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthTestEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthTestEnable"], depthTestEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthTestEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthTestEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthTestEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthWriteEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthWriteEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthWriteEnableEXT = { "vkCmdSetDepthWriteEnableEXT", format::ApiCallId::ApiCall_vkCmdSetDepthWriteEnableEXT, kDiveArgs_vkCmdSetDepthWriteEnableEXT, std::size(kDiveArgs_vkCmdSetDepthWriteEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthWriteEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthWriteEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthWriteEnable"], depthWriteEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthWriteEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthWriteEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthWriteEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthCompareOpEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthCompareOp", sizeof(VkCompareOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkCompareOp>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthCompareOpEXT = { "vkCmdSetDepthCompareOpEXT", format::ApiCallId::ApiCall_vkCmdSetDepthCompareOpEXT, kDiveArgs_vkCmdSetDepthCompareOpEXT, std::size(kDiveArgs_vkCmdSetDepthCompareOpEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthCompareOpEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkCompareOp                                 depthCompareOp)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["depthCompareOp"], depthCompareOp, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthCompareOpEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthCompareOp);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthCompareOpEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthBoundsTestEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthBoundsTestEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthBoundsTestEnableEXT = { "vkCmdSetDepthBoundsTestEnableEXT", format::ApiCallId::ApiCall_vkCmdSetDepthBoundsTestEnableEXT, kDiveArgs_vkCmdSetDepthBoundsTestEnableEXT, std::size(kDiveArgs_vkCmdSetDepthBoundsTestEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthBoundsTestEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthBoundsTestEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthBoundsTestEnable"], depthBoundsTestEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthBoundsTestEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthBoundsTestEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthBoundsTestEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetStencilTestEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stencilTestEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetStencilTestEnableEXT = { "vkCmdSetStencilTestEnableEXT", format::ApiCallId::ApiCall_vkCmdSetStencilTestEnableEXT, kDiveArgs_vkCmdSetStencilTestEnableEXT, std::size(kDiveArgs_vkCmdSetStencilTestEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetStencilTestEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    stencilTestEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["stencilTestEnable"], stencilTestEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetStencilTestEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(stencilTestEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetStencilTestEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetStencilOpEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "faceMask", sizeof(VkStencilFaceFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkStencilFaceFlags_t(), jdata, util::ReadDiveArg<VkStencilFaceFlags>(data), options); } },
+    { "failOp", sizeof(VkStencilOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkStencilOp>(data), options); } },
+    { "passOp", sizeof(VkStencilOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkStencilOp>(data), options); } },
+    { "depthFailOp", sizeof(VkStencilOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkStencilOp>(data), options); } },
+    { "compareOp", sizeof(VkCompareOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkCompareOp>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetStencilOpEXT = { "vkCmdSetStencilOpEXT", format::ApiCallId::ApiCall_vkCmdSetStencilOpEXT, kDiveArgs_vkCmdSetStencilOpEXT, std::size(kDiveArgs_vkCmdSetStencilOpEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetStencilOpEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -6083,16 +7652,14 @@ void VulkanExportDiveConsumer::Process_vkCmdSetStencilOpEXT(
     VkStencilOp                                 depthFailOp,
     VkCompareOp                                 compareOp)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkStencilFaceFlags_t(), args["faceMask"], faceMask, json_options);
-    FieldToJson(args["failOp"], failOp, json_options);
-    FieldToJson(args["passOp"], passOp, json_options);
-    FieldToJson(args["depthFailOp"], depthFailOp, json_options);
-    FieldToJson(args["compareOp"], compareOp, json_options);
-    util::DiveFunctionData function_data("vkCmdSetStencilOpEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(faceMask);
+    dive_args.Write(failOp);
+    dive_args.Write(passOp);
+    dive_args.Write(depthFailOp);
+    dive_args.Write(compareOp);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetStencilOpEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6154,36 +7721,63 @@ void VulkanExportDiveConsumer::Process_vkGetGeneratedCommandsMemoryRequirementsN
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPreprocessGeneratedCommandsNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pGeneratedCommandsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPreprocessGeneratedCommandsNV = { "vkCmdPreprocessGeneratedCommandsNV", format::ApiCallId::ApiCall_vkCmdPreprocessGeneratedCommandsNV, kDiveArgs_vkCmdPreprocessGeneratedCommandsNV, std::size(kDiveArgs_vkCmdPreprocessGeneratedCommandsNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPreprocessGeneratedCommandsNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkGeneratedCommandsInfoNV>* pGeneratedCommandsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pGeneratedCommandsInfo"], pGeneratedCommandsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdPreprocessGeneratedCommandsNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pGeneratedCommandsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPreprocessGeneratedCommandsNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdExecuteGeneratedCommandsNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "isPreprocessed", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+    { "pGeneratedCommandsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdExecuteGeneratedCommandsNV = { "vkCmdExecuteGeneratedCommandsNV", format::ApiCallId::ApiCall_vkCmdExecuteGeneratedCommandsNV, kDiveArgs_vkCmdExecuteGeneratedCommandsNV, std::size(kDiveArgs_vkCmdExecuteGeneratedCommandsNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdExecuteGeneratedCommandsNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    isPreprocessed,
     StructPointerDecoder<Decoded_VkGeneratedCommandsInfoNV>* pGeneratedCommandsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["isPreprocessed"], isPreprocessed, json_options);
-    FieldToJson(args["pGeneratedCommandsInfo"], pGeneratedCommandsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdExecuteGeneratedCommandsNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(isPreprocessed);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pGeneratedCommandsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdExecuteGeneratedCommandsNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindPipelineShaderGroupNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineBindPoint", sizeof(VkPipelineBindPoint), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPipelineBindPoint>(data), options); } },
+    { "pipeline", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "groupIndex", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindPipelineShaderGroupNV = { "vkCmdBindPipelineShaderGroupNV", format::ApiCallId::ApiCall_vkCmdBindPipelineShaderGroupNV, kDiveArgs_vkCmdBindPipelineShaderGroupNV, std::size(kDiveArgs_vkCmdBindPipelineShaderGroupNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindPipelineShaderGroupNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -6191,14 +7785,12 @@ void VulkanExportDiveConsumer::Process_vkCmdBindPipelineShaderGroupNV(
     format::HandleId                            pipeline,
     uint32_t                                    groupIndex)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineBindPoint"], pipelineBindPoint, json_options);
-    HandleToJson(args["pipeline"], pipeline, json_options);
-    FieldToJson(args["groupIndex"], groupIndex, json_options);
-    util::DiveFunctionData function_data("vkCmdBindPipelineShaderGroupNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineBindPoint);
+    dive_args.Write(pipeline);
+    dive_args.Write(groupIndex);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindPipelineShaderGroupNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6220,17 +7812,26 @@ void VulkanExportDiveConsumer::Process_vkDestroyIndirectCommandsLayoutNV(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthBias2EXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pDepthBiasInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthBias2EXT = { "vkCmdSetDepthBias2EXT", format::ApiCallId::ApiCall_vkCmdSetDepthBias2EXT, kDiveArgs_vkCmdSetDepthBias2EXT, std::size(kDiveArgs_vkCmdSetDepthBias2EXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthBias2EXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkDepthBiasInfoEXT>* pDepthBiasInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pDepthBiasInfo"], pDepthBiasInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthBias2EXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDepthBiasInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthBias2EXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6292,61 +7893,98 @@ void VulkanExportDiveConsumer::Process_vkGetPrivateDataEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDispatchTileQCOM[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pDispatchTileInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDispatchTileQCOM = { "vkCmdDispatchTileQCOM", format::ApiCallId::ApiCall_vkCmdDispatchTileQCOM, kDiveArgs_vkCmdDispatchTileQCOM, std::size(kDiveArgs_vkCmdDispatchTileQCOM) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDispatchTileQCOM(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkDispatchTileInfoQCOM>* pDispatchTileInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pDispatchTileInfo"], pDispatchTileInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdDispatchTileQCOM", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDispatchTileInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDispatchTileQCOM, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBeginPerTileExecutionQCOM[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pPerTileBeginInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBeginPerTileExecutionQCOM = { "vkCmdBeginPerTileExecutionQCOM", format::ApiCallId::ApiCall_vkCmdBeginPerTileExecutionQCOM, kDiveArgs_vkCmdBeginPerTileExecutionQCOM, std::size(kDiveArgs_vkCmdBeginPerTileExecutionQCOM) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBeginPerTileExecutionQCOM(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPerTileBeginInfoQCOM>* pPerTileBeginInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pPerTileBeginInfo"], pPerTileBeginInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBeginPerTileExecutionQCOM", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pPerTileBeginInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBeginPerTileExecutionQCOM, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndPerTileExecutionQCOM[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pPerTileEndInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndPerTileExecutionQCOM = { "vkCmdEndPerTileExecutionQCOM", format::ApiCallId::ApiCall_vkCmdEndPerTileExecutionQCOM, kDiveArgs_vkCmdEndPerTileExecutionQCOM, std::size(kDiveArgs_vkCmdEndPerTileExecutionQCOM) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndPerTileExecutionQCOM(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkPerTileEndInfoQCOM>* pPerTileEndInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pPerTileEndInfo"], pPerTileEndInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdEndPerTileExecutionQCOM", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pPerTileEndInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndPerTileExecutionQCOM, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetFragmentShadingRateEnumNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "shadingRate", sizeof(VkFragmentShadingRateNV), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkFragmentShadingRateNV>(data), options); } },
+    { "combinerOps", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetFragmentShadingRateEnumNV = { "vkCmdSetFragmentShadingRateEnumNV", format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateEnumNV, kDiveArgs_vkCmdSetFragmentShadingRateEnumNV, std::size(kDiveArgs_vkCmdSetFragmentShadingRateEnumNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetFragmentShadingRateEnumNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkFragmentShadingRateNV                     shadingRate,
     PointerDecoder<VkFragmentShadingRateCombinerOpKHR>* combinerOps)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["shadingRate"], shadingRate, json_options);
-    FieldToJson(args["combinerOps"], combinerOps, json_options);
-    util::DiveFunctionData function_data("vkCmdSetFragmentShadingRateEnumNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(shadingRate);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), combinerOps, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetFragmentShadingRateEnumNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6395,6 +8033,15 @@ void VulkanExportDiveConsumer::Process_vkGetPhysicalDeviceDirectFBPresentationSu
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetVertexInputEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "vertexBindingDescriptionCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pVertexBindingDescriptions", 0, nullptr },
+    { "vertexAttributeDescriptionCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pVertexAttributeDescriptions", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetVertexInputEXT = { "vkCmdSetVertexInputEXT", format::ApiCallId::ApiCall_vkCmdSetVertexInputEXT, kDiveArgs_vkCmdSetVertexInputEXT, std::size(kDiveArgs_vkCmdSetVertexInputEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetVertexInputEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -6403,15 +8050,22 @@ void VulkanExportDiveConsumer::Process_vkCmdSetVertexInputEXT(
     uint32_t                                    vertexAttributeDescriptionCount,
     StructPointerDecoder<Decoded_VkVertexInputAttributeDescription2EXT>* pVertexAttributeDescriptions)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["vertexBindingDescriptionCount"], vertexBindingDescriptionCount, json_options);
-    FieldToJson(args["pVertexBindingDescriptions"], pVertexBindingDescriptions, json_options);
-    FieldToJson(args["vertexAttributeDescriptionCount"], vertexAttributeDescriptionCount, json_options);
-    FieldToJson(args["pVertexAttributeDescriptions"], pVertexAttributeDescriptions, json_options);
-    util::DiveFunctionData function_data("vkCmdSetVertexInputEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(vertexBindingDescriptionCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pVertexBindingDescriptions, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(vertexAttributeDescriptionCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pVertexAttributeDescriptions, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetVertexInputEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6451,19 +8105,24 @@ void VulkanExportDiveConsumer::Process_vkGetSemaphoreZirconHandleFUCHSIA(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindInvocationMaskHUAWEI[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "imageView", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "imageLayout", sizeof(VkImageLayout), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkImageLayout>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindInvocationMaskHUAWEI = { "vkCmdBindInvocationMaskHUAWEI", format::ApiCallId::ApiCall_vkCmdBindInvocationMaskHUAWEI, kDiveArgs_vkCmdBindInvocationMaskHUAWEI, std::size(kDiveArgs_vkCmdBindInvocationMaskHUAWEI) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindInvocationMaskHUAWEI(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            imageView,
     VkImageLayout                               imageLayout)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["imageView"], imageView, json_options);
-    FieldToJson(args["imageLayout"], imageLayout, json_options);
-    util::DiveFunctionData function_data("vkCmdBindInvocationMaskHUAWEI", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(imageView);
+    dive_args.Write(imageLayout);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindInvocationMaskHUAWEI, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6476,73 +8135,93 @@ void VulkanExportDiveConsumer::Process_vkGetMemoryRemoteAddressNV(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPatchControlPointsEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "patchControlPoints", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPatchControlPointsEXT = { "vkCmdSetPatchControlPointsEXT", format::ApiCallId::ApiCall_vkCmdSetPatchControlPointsEXT, kDiveArgs_vkCmdSetPatchControlPointsEXT, std::size(kDiveArgs_vkCmdSetPatchControlPointsEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPatchControlPointsEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    patchControlPoints)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["patchControlPoints"], patchControlPoints, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPatchControlPointsEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(patchControlPoints);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPatchControlPointsEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRasterizerDiscardEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "rasterizerDiscardEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRasterizerDiscardEnableEXT = { "vkCmdSetRasterizerDiscardEnableEXT", format::ApiCallId::ApiCall_vkCmdSetRasterizerDiscardEnableEXT, kDiveArgs_vkCmdSetRasterizerDiscardEnableEXT, std::size(kDiveArgs_vkCmdSetRasterizerDiscardEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRasterizerDiscardEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    rasterizerDiscardEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["rasterizerDiscardEnable"], rasterizerDiscardEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRasterizerDiscardEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(rasterizerDiscardEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRasterizerDiscardEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthBiasEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthBiasEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthBiasEnableEXT = { "vkCmdSetDepthBiasEnableEXT", format::ApiCallId::ApiCall_vkCmdSetDepthBiasEnableEXT, kDiveArgs_vkCmdSetDepthBiasEnableEXT, std::size(kDiveArgs_vkCmdSetDepthBiasEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthBiasEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthBiasEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthBiasEnable"], depthBiasEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthBiasEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthBiasEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthBiasEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetLogicOpEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "logicOp", sizeof(VkLogicOp), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkLogicOp>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetLogicOpEXT = { "vkCmdSetLogicOpEXT", format::ApiCallId::ApiCall_vkCmdSetLogicOpEXT, kDiveArgs_vkCmdSetLogicOpEXT, std::size(kDiveArgs_vkCmdSetLogicOpEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetLogicOpEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkLogicOp                                   logicOp)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["logicOp"], logicOp, json_options);
-    util::DiveFunctionData function_data("vkCmdSetLogicOpEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(logicOp);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetLogicOpEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPrimitiveRestartEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "primitiveRestartEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPrimitiveRestartEnableEXT = { "vkCmdSetPrimitiveRestartEnableEXT", format::ApiCallId::ApiCall_vkCmdSetPrimitiveRestartEnableEXT, kDiveArgs_vkCmdSetPrimitiveRestartEnableEXT, std::size(kDiveArgs_vkCmdSetPrimitiveRestartEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPrimitiveRestartEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    primitiveRestartEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["primitiveRestartEnable"], primitiveRestartEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPrimitiveRestartEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(primitiveRestartEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPrimitiveRestartEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6565,22 +8244,42 @@ void VulkanExportDiveConsumer::Process_vkGetPhysicalDeviceScreenPresentationSupp
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetColorWriteEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "attachmentCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pColorWriteEnables", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetColorWriteEnableEXT = { "vkCmdSetColorWriteEnableEXT", format::ApiCallId::ApiCall_vkCmdSetColorWriteEnableEXT, kDiveArgs_vkCmdSetColorWriteEnableEXT, std::size(kDiveArgs_vkCmdSetColorWriteEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetColorWriteEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    attachmentCount,
     PointerDecoder<VkBool32>*                   pColorWriteEnables)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["attachmentCount"], attachmentCount, json_options);
-    Bool32ToJson(args["pColorWriteEnables"], pColorWriteEnables, json_options);
-    util::DiveFunctionData function_data("vkCmdSetColorWriteEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(attachmentCount);
+    if (!dive_args.DeferJson())
+    {
+        Bool32ToJson(dive_args.BeginJson(), pColorWriteEnables, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetColorWriteEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawMultiEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "drawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pVertexInfo", 0, nullptr },
+    { "instanceCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "firstInstance", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawMultiEXT = { "vkCmdDrawMultiEXT", format::ApiCallId::ApiCall_vkCmdDrawMultiEXT, kDiveArgs_vkCmdDrawMultiEXT, std::size(kDiveArgs_vkCmdDrawMultiEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawMultiEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -6590,18 +8289,32 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawMultiEXT(
     uint32_t                                    firstInstance,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["drawCount"], drawCount, json_options);
-    FieldToJson(args["pVertexInfo"], pVertexInfo, json_options);
-    FieldToJson(args["instanceCount"], instanceCount, json_options);
-    FieldToJson(args["firstInstance"], firstInstance, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawMultiEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
-    WriteBlockEnd(function_data);
-}
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(drawCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pVertexInfo, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(instanceCount);
+    dive_args.Write(firstInstance);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawMultiEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
+    WriteBlockEnd(function_data);
+}
+
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawMultiIndexedEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "drawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pIndexInfo", 0, nullptr },
+    { "instanceCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "firstInstance", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pVertexOffset", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawMultiIndexedEXT = { "vkCmdDrawMultiIndexedEXT", format::ApiCallId::ApiCall_vkCmdDrawMultiIndexedEXT, kDiveArgs_vkCmdDrawMultiIndexedEXT, std::size(kDiveArgs_vkCmdDrawMultiIndexedEXT) };
 
 void VulkanExportDiveConsumer::Process_vkCmdDrawMultiIndexedEXT(
     const ApiCallInfo&                          call_info,
@@ -6613,17 +8326,24 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawMultiIndexedEXT(
     uint32_t                                    stride,
     PointerDecoder<int32_t>*                    pVertexOffset)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["drawCount"], drawCount, json_options);
-    FieldToJson(args["pIndexInfo"], pIndexInfo, json_options);
-    FieldToJson(args["instanceCount"], instanceCount, json_options);
-    FieldToJson(args["firstInstance"], firstInstance, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    FieldToJson(args["pVertexOffset"], pVertexOffset, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawMultiIndexedEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(drawCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pIndexInfo, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(instanceCount);
+    dive_args.Write(firstInstance);
+    dive_args.Write(stride);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pVertexOffset, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawMultiIndexedEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6645,19 +8365,29 @@ void VulkanExportDiveConsumer::Process_vkDestroyMicromapEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBuildMicromapsEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "infoCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pInfos", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBuildMicromapsEXT = { "vkCmdBuildMicromapsEXT", format::ApiCallId::ApiCall_vkCmdBuildMicromapsEXT, kDiveArgs_vkCmdBuildMicromapsEXT, std::size(kDiveArgs_vkCmdBuildMicromapsEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBuildMicromapsEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    infoCount,
     StructPointerDecoder<Decoded_VkMicromapBuildInfoEXT>* pInfos)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["infoCount"], infoCount, json_options);
-    FieldToJson(args["pInfos"], pInfos, json_options);
-    util::DiveFunctionData function_data("vkCmdBuildMicromapsEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(infoCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfos, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBuildMicromapsEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6711,48 +8441,85 @@ void VulkanExportDiveConsumer::Process_vkWriteMicromapsPropertiesEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyMicromapEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyMicromapEXT = { "vkCmdCopyMicromapEXT", format::ApiCallId::ApiCall_vkCmdCopyMicromapEXT, kDiveArgs_vkCmdCopyMicromapEXT, std::size(kDiveArgs_vkCmdCopyMicromapEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyMicromapEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyMicromapInfoEXT>* pInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInfo"], pInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyMicromapEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyMicromapEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyMicromapToMemoryEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyMicromapToMemoryEXT = { "vkCmdCopyMicromapToMemoryEXT", format::ApiCallId::ApiCall_vkCmdCopyMicromapToMemoryEXT, kDiveArgs_vkCmdCopyMicromapToMemoryEXT, std::size(kDiveArgs_vkCmdCopyMicromapToMemoryEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyMicromapToMemoryEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyMicromapToMemoryInfoEXT>* pInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInfo"], pInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyMicromapToMemoryEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyMicromapToMemoryEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyMemoryToMicromapEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyMemoryToMicromapEXT = { "vkCmdCopyMemoryToMicromapEXT", format::ApiCallId::ApiCall_vkCmdCopyMemoryToMicromapEXT, kDiveArgs_vkCmdCopyMemoryToMicromapEXT, std::size(kDiveArgs_vkCmdCopyMemoryToMicromapEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyMemoryToMicromapEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyMemoryToMicromapInfoEXT>* pInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInfo"], pInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyMemoryToMicromapEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyMemoryToMicromapEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWriteMicromapsPropertiesEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "micromapCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pMicromaps", 0, nullptr },
+    { "queryType", sizeof(VkQueryType), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkQueryType>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstQuery", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWriteMicromapsPropertiesEXT = { "vkCmdWriteMicromapsPropertiesEXT", format::ApiCallId::ApiCall_vkCmdWriteMicromapsPropertiesEXT, kDiveArgs_vkCmdWriteMicromapsPropertiesEXT, std::size(kDiveArgs_vkCmdWriteMicromapsPropertiesEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWriteMicromapsPropertiesEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -6762,16 +8529,19 @@ void VulkanExportDiveConsumer::Process_vkCmdWriteMicromapsPropertiesEXT(
     format::HandleId                            queryPool,
     uint32_t                                    firstQuery)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["micromapCount"], micromapCount, json_options);
-    HandleToJson(args["pMicromaps"], pMicromaps, json_options);
-    FieldToJson(args["queryType"], queryType, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["firstQuery"], firstQuery, json_options);
-    util::DiveFunctionData function_data("vkCmdWriteMicromapsPropertiesEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(micromapCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pMicromaps, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(queryType);
+    dive_args.Write(queryPool);
+    dive_args.Write(firstQuery);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWriteMicromapsPropertiesEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6792,6 +8562,14 @@ void VulkanExportDiveConsumer::Process_vkGetMicromapBuildSizesEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawClusterHUAWEI[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "groupCountX", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountY", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountZ", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawClusterHUAWEI = { "vkCmdDrawClusterHUAWEI", format::ApiCallId::ApiCall_vkCmdDrawClusterHUAWEI, kDiveArgs_vkCmdDrawClusterHUAWEI, std::size(kDiveArgs_vkCmdDrawClusterHUAWEI) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawClusterHUAWEI(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -6799,30 +8577,33 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawClusterHUAWEI(
     uint32_t                                    groupCountY,
     uint32_t                                    groupCountZ)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["groupCountX"], groupCountX, json_options);
-    FieldToJson(args["groupCountY"], groupCountY, json_options);
-    FieldToJson(args["groupCountZ"], groupCountZ, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawClusterHUAWEI", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(groupCountX);
+    dive_args.Write(groupCountY);
+    dive_args.Write(groupCountZ);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawClusterHUAWEI, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawClusterIndirectHUAWEI[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawClusterIndirectHUAWEI = { "vkCmdDrawClusterIndirectHUAWEI", format::ApiCallId::ApiCall_vkCmdDrawClusterIndirectHUAWEI, kDiveArgs_vkCmdDrawClusterIndirectHUAWEI, std::size(kDiveArgs_vkCmdDrawClusterIndirectHUAWEI) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawClusterIndirectHUAWEI(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            buffer,
     VkDeviceSize                                offset)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawClusterIndirectHUAWEI", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawClusterIndirectHUAWEI, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6858,19 +8639,24 @@ void VulkanExportDiveConsumer::Process_vkGetPipelineIndirectMemoryRequirementsNV
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdUpdatePipelineIndirectBufferNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineBindPoint", sizeof(VkPipelineBindPoint), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPipelineBindPoint>(data), options); } },
+    { "pipeline", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdUpdatePipelineIndirectBufferNV = { "vkCmdUpdatePipelineIndirectBufferNV", format::ApiCallId::ApiCall_vkCmdUpdatePipelineIndirectBufferNV, kDiveArgs_vkCmdUpdatePipelineIndirectBufferNV, std::size(kDiveArgs_vkCmdUpdatePipelineIndirectBufferNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdUpdatePipelineIndirectBufferNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkPipelineBindPoint                         pipelineBindPoint,
     format::HandleId                            pipeline)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineBindPoint"], pipelineBindPoint, json_options);
-    HandleToJson(args["pipeline"], pipeline, json_options);
-    util::DiveFunctionData function_data("vkCmdUpdatePipelineIndirectBufferNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineBindPoint);
+    dive_args.Write(pipeline);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdUpdatePipelineIndirectBufferNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -6882,106 +8668,148 @@ void VulkanExportDiveConsumer::Process_vkGetPipelineIndirectDeviceAddressNV(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthClampEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthClampEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthClampEnableEXT = { "vkCmdSetDepthClampEnableEXT", format::ApiCallId::ApiCall_vkCmdSetDepthClampEnableEXT, kDiveArgs_vkCmdSetDepthClampEnableEXT, std::size(kDiveArgs_vkCmdSetDepthClampEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthClampEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthClampEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthClampEnable"], depthClampEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthClampEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthClampEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthClampEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetPolygonModeEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "polygonMode", sizeof(VkPolygonMode), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkPolygonMode>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetPolygonModeEXT = { "vkCmdSetPolygonModeEXT", format::ApiCallId::ApiCall_vkCmdSetPolygonModeEXT, kDiveArgs_vkCmdSetPolygonModeEXT, std::size(kDiveArgs_vkCmdSetPolygonModeEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetPolygonModeEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkPolygonMode                               polygonMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["polygonMode"], polygonMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetPolygonModeEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(polygonMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetPolygonModeEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRasterizationSamplesEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "rasterizationSamples", sizeof(VkSampleCountFlagBits), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkSampleCountFlagBits>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRasterizationSamplesEXT = { "vkCmdSetRasterizationSamplesEXT", format::ApiCallId::ApiCall_vkCmdSetRasterizationSamplesEXT, kDiveArgs_vkCmdSetRasterizationSamplesEXT, std::size(kDiveArgs_vkCmdSetRasterizationSamplesEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRasterizationSamplesEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkSampleCountFlagBits                       rasterizationSamples)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["rasterizationSamples"], rasterizationSamples, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRasterizationSamplesEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(rasterizationSamples);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRasterizationSamplesEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetSampleMaskEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "samples", sizeof(VkSampleCountFlagBits), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkSampleCountFlagBits>(data), options); } },
+    { "pSampleMask", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetSampleMaskEXT = { "vkCmdSetSampleMaskEXT", format::ApiCallId::ApiCall_vkCmdSetSampleMaskEXT, kDiveArgs_vkCmdSetSampleMaskEXT, std::size(kDiveArgs_vkCmdSetSampleMaskEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetSampleMaskEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkSampleCountFlagBits                       samples,
     PointerDecoder<VkSampleMask>*               pSampleMask)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["samples"], samples, json_options);
-    FieldToJson(args["pSampleMask"], pSampleMask, json_options);
-    util::DiveFunctionData function_data("vkCmdSetSampleMaskEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(samples);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pSampleMask, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetSampleMaskEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetAlphaToCoverageEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "alphaToCoverageEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetAlphaToCoverageEnableEXT = { "vkCmdSetAlphaToCoverageEnableEXT", format::ApiCallId::ApiCall_vkCmdSetAlphaToCoverageEnableEXT, kDiveArgs_vkCmdSetAlphaToCoverageEnableEXT, std::size(kDiveArgs_vkCmdSetAlphaToCoverageEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetAlphaToCoverageEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    alphaToCoverageEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["alphaToCoverageEnable"], alphaToCoverageEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetAlphaToCoverageEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(alphaToCoverageEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetAlphaToCoverageEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetAlphaToOneEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "alphaToOneEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetAlphaToOneEnableEXT = { "vkCmdSetAlphaToOneEnableEXT", format::ApiCallId::ApiCall_vkCmdSetAlphaToOneEnableEXT, kDiveArgs_vkCmdSetAlphaToOneEnableEXT, std::size(kDiveArgs_vkCmdSetAlphaToOneEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetAlphaToOneEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    alphaToOneEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["alphaToOneEnable"], alphaToOneEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetAlphaToOneEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(alphaToOneEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetAlphaToOneEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetLogicOpEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "logicOpEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetLogicOpEnableEXT = { "vkCmdSetLogicOpEnableEXT", format::ApiCallId::ApiCall_vkCmdSetLogicOpEnableEXT, kDiveArgs_vkCmdSetLogicOpEnableEXT, std::size(kDiveArgs_vkCmdSetLogicOpEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetLogicOpEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    logicOpEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["logicOpEnable"], logicOpEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetLogicOpEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(logicOpEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetLogicOpEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetColorBlendEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstAttachment", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "attachmentCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pColorBlendEnables", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetColorBlendEnableEXT = { "vkCmdSetColorBlendEnableEXT", format::ApiCallId::ApiCall_vkCmdSetColorBlendEnableEXT, kDiveArgs_vkCmdSetColorBlendEnableEXT, std::size(kDiveArgs_vkCmdSetColorBlendEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetColorBlendEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -6989,17 +8817,28 @@ void VulkanExportDiveConsumer::Process_vkCmdSetColorBlendEnableEXT(
     uint32_t                                    attachmentCount,
     PointerDecoder<VkBool32>*                   pColorBlendEnables)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstAttachment"], firstAttachment, json_options);
-    FieldToJson(args["attachmentCount"], attachmentCount, json_options);
-    Bool32ToJson(args["pColorBlendEnables"], pColorBlendEnables, json_options);
-    util::DiveFunctionData function_data("vkCmdSetColorBlendEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstAttachment);
+    dive_args.Write(attachmentCount);
+    if (!dive_args.DeferJson())
+    {
+        Bool32ToJson(dive_args.BeginJson(), pColorBlendEnables, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetColorBlendEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetColorBlendEquationEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstAttachment", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "attachmentCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pColorBlendEquations", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetColorBlendEquationEXT = { "vkCmdSetColorBlendEquationEXT", format::ApiCallId::ApiCall_vkCmdSetColorBlendEquationEXT, kDiveArgs_vkCmdSetColorBlendEquationEXT, std::size(kDiveArgs_vkCmdSetColorBlendEquationEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetColorBlendEquationEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7007,17 +8846,28 @@ void VulkanExportDiveConsumer::Process_vkCmdSetColorBlendEquationEXT(
     uint32_t                                    attachmentCount,
     StructPointerDecoder<Decoded_VkColorBlendEquationEXT>* pColorBlendEquations)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstAttachment"], firstAttachment, json_options);
-    FieldToJson(args["attachmentCount"], attachmentCount, json_options);
-    FieldToJson(args["pColorBlendEquations"], pColorBlendEquations, json_options);
-    util::DiveFunctionData function_data("vkCmdSetColorBlendEquationEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstAttachment);
+    dive_args.Write(attachmentCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pColorBlendEquations, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetColorBlendEquationEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetColorWriteMaskEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstAttachment", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "attachmentCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pColorWriteMasks", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetColorWriteMaskEXT = { "vkCmdSetColorWriteMaskEXT", format::ApiCallId::ApiCall_vkCmdSetColorWriteMaskEXT, kDiveArgs_vkCmdSetColorWriteMaskEXT, std::size(kDiveArgs_vkCmdSetColorWriteMaskEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetColorWriteMaskEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7025,101 +8875,136 @@ void VulkanExportDiveConsumer::Process_vkCmdSetColorWriteMaskEXT(
     uint32_t                                    attachmentCount,
     PointerDecoder<VkColorComponentFlags>*      pColorWriteMasks)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstAttachment"], firstAttachment, json_options);
-    FieldToJson(args["attachmentCount"], attachmentCount, json_options);
-    FieldToJson(args["pColorWriteMasks"], pColorWriteMasks, json_options);
-    util::DiveFunctionData function_data("vkCmdSetColorWriteMaskEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstAttachment);
+    dive_args.Write(attachmentCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pColorWriteMasks, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetColorWriteMaskEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetTessellationDomainOriginEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "domainOrigin", sizeof(VkTessellationDomainOrigin), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkTessellationDomainOrigin>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetTessellationDomainOriginEXT = { "vkCmdSetTessellationDomainOriginEXT", format::ApiCallId::ApiCall_vkCmdSetTessellationDomainOriginEXT, kDiveArgs_vkCmdSetTessellationDomainOriginEXT, std::size(kDiveArgs_vkCmdSetTessellationDomainOriginEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetTessellationDomainOriginEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkTessellationDomainOrigin                  domainOrigin)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["domainOrigin"], domainOrigin, json_options);
-    util::DiveFunctionData function_data("vkCmdSetTessellationDomainOriginEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(domainOrigin);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetTessellationDomainOriginEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRasterizationStreamEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "rasterizationStream", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRasterizationStreamEXT = { "vkCmdSetRasterizationStreamEXT", format::ApiCallId::ApiCall_vkCmdSetRasterizationStreamEXT, kDiveArgs_vkCmdSetRasterizationStreamEXT, std::size(kDiveArgs_vkCmdSetRasterizationStreamEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRasterizationStreamEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    rasterizationStream)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["rasterizationStream"], rasterizationStream, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRasterizationStreamEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(rasterizationStream);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRasterizationStreamEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetConservativeRasterizationModeEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "conservativeRasterizationMode", sizeof(VkConservativeRasterizationModeEXT), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkConservativeRasterizationModeEXT>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetConservativeRasterizationModeEXT = { "vkCmdSetConservativeRasterizationModeEXT", format::ApiCallId::ApiCall_vkCmdSetConservativeRasterizationModeEXT, kDiveArgs_vkCmdSetConservativeRasterizationModeEXT, std::size(kDiveArgs_vkCmdSetConservativeRasterizationModeEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetConservativeRasterizationModeEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkConservativeRasterizationModeEXT          conservativeRasterizationMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["conservativeRasterizationMode"], conservativeRasterizationMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetConservativeRasterizationModeEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(conservativeRasterizationMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetConservativeRasterizationModeEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetExtraPrimitiveOverestimationSizeEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "extraPrimitiveOverestimationSize", sizeof(float), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<float>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetExtraPrimitiveOverestimationSizeEXT = { "vkCmdSetExtraPrimitiveOverestimationSizeEXT", format::ApiCallId::ApiCall_vkCmdSetExtraPrimitiveOverestimationSizeEXT, kDiveArgs_vkCmdSetExtraPrimitiveOverestimationSizeEXT, std::size(kDiveArgs_vkCmdSetExtraPrimitiveOverestimationSizeEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetExtraPrimitiveOverestimationSizeEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     float                                       extraPrimitiveOverestimationSize)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["extraPrimitiveOverestimationSize"], extraPrimitiveOverestimationSize, json_options);
-    util::DiveFunctionData function_data("vkCmdSetExtraPrimitiveOverestimationSizeEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(extraPrimitiveOverestimationSize);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetExtraPrimitiveOverestimationSizeEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthClipEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthClipEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthClipEnableEXT = { "vkCmdSetDepthClipEnableEXT", format::ApiCallId::ApiCall_vkCmdSetDepthClipEnableEXT, kDiveArgs_vkCmdSetDepthClipEnableEXT, std::size(kDiveArgs_vkCmdSetDepthClipEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthClipEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    depthClipEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["depthClipEnable"], depthClipEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthClipEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthClipEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthClipEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetSampleLocationsEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "sampleLocationsEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetSampleLocationsEnableEXT = { "vkCmdSetSampleLocationsEnableEXT", format::ApiCallId::ApiCall_vkCmdSetSampleLocationsEnableEXT, kDiveArgs_vkCmdSetSampleLocationsEnableEXT, std::size(kDiveArgs_vkCmdSetSampleLocationsEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetSampleLocationsEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    sampleLocationsEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["sampleLocationsEnable"], sampleLocationsEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetSampleLocationsEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(sampleLocationsEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetSampleLocationsEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetColorBlendAdvancedEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstAttachment", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "attachmentCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pColorBlendAdvanced", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetColorBlendAdvancedEXT = { "vkCmdSetColorBlendAdvancedEXT", format::ApiCallId::ApiCall_vkCmdSetColorBlendAdvancedEXT, kDiveArgs_vkCmdSetColorBlendAdvancedEXT, std::size(kDiveArgs_vkCmdSetColorBlendAdvancedEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetColorBlendAdvancedEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7127,87 +9012,118 @@ void VulkanExportDiveConsumer::Process_vkCmdSetColorBlendAdvancedEXT(
     uint32_t                                    attachmentCount,
     StructPointerDecoder<Decoded_VkColorBlendAdvancedEXT>* pColorBlendAdvanced)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstAttachment"], firstAttachment, json_options);
-    FieldToJson(args["attachmentCount"], attachmentCount, json_options);
-    FieldToJson(args["pColorBlendAdvanced"], pColorBlendAdvanced, json_options);
-    util::DiveFunctionData function_data("vkCmdSetColorBlendAdvancedEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstAttachment);
+    dive_args.Write(attachmentCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pColorBlendAdvanced, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetColorBlendAdvancedEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetProvokingVertexModeEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "provokingVertexMode", sizeof(VkProvokingVertexModeEXT), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkProvokingVertexModeEXT>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetProvokingVertexModeEXT = { "vkCmdSetProvokingVertexModeEXT", format::ApiCallId::ApiCall_vkCmdSetProvokingVertexModeEXT, kDiveArgs_vkCmdSetProvokingVertexModeEXT, std::size(kDiveArgs_vkCmdSetProvokingVertexModeEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetProvokingVertexModeEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkProvokingVertexModeEXT                    provokingVertexMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["provokingVertexMode"], provokingVertexMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetProvokingVertexModeEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(provokingVertexMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetProvokingVertexModeEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetLineRasterizationModeEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "lineRasterizationMode", sizeof(VkLineRasterizationModeEXT), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkLineRasterizationModeEXT>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetLineRasterizationModeEXT = { "vkCmdSetLineRasterizationModeEXT", format::ApiCallId::ApiCall_vkCmdSetLineRasterizationModeEXT, kDiveArgs_vkCmdSetLineRasterizationModeEXT, std::size(kDiveArgs_vkCmdSetLineRasterizationModeEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetLineRasterizationModeEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkLineRasterizationModeEXT                  lineRasterizationMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["lineRasterizationMode"], lineRasterizationMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetLineRasterizationModeEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(lineRasterizationMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetLineRasterizationModeEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetLineStippleEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stippledLineEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetLineStippleEnableEXT = { "vkCmdSetLineStippleEnableEXT", format::ApiCallId::ApiCall_vkCmdSetLineStippleEnableEXT, kDiveArgs_vkCmdSetLineStippleEnableEXT, std::size(kDiveArgs_vkCmdSetLineStippleEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetLineStippleEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    stippledLineEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["stippledLineEnable"], stippledLineEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetLineStippleEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(stippledLineEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetLineStippleEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthClipNegativeOneToOneEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "negativeOneToOne", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthClipNegativeOneToOneEXT = { "vkCmdSetDepthClipNegativeOneToOneEXT", format::ApiCallId::ApiCall_vkCmdSetDepthClipNegativeOneToOneEXT, kDiveArgs_vkCmdSetDepthClipNegativeOneToOneEXT, std::size(kDiveArgs_vkCmdSetDepthClipNegativeOneToOneEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthClipNegativeOneToOneEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    negativeOneToOne)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["negativeOneToOne"], negativeOneToOne, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthClipNegativeOneToOneEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(negativeOneToOne);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthClipNegativeOneToOneEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetViewportWScalingEnableNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "viewportWScalingEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetViewportWScalingEnableNV = { "vkCmdSetViewportWScalingEnableNV", format::ApiCallId::ApiCall_vkCmdSetViewportWScalingEnableNV, kDiveArgs_vkCmdSetViewportWScalingEnableNV, std::size(kDiveArgs_vkCmdSetViewportWScalingEnableNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetViewportWScalingEnableNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    viewportWScalingEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["viewportWScalingEnable"], viewportWScalingEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetViewportWScalingEnableNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(viewportWScalingEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetViewportWScalingEnableNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetViewportSwizzleNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstViewport", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "viewportCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pViewportSwizzles", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetViewportSwizzleNV = { "vkCmdSetViewportSwizzleNV", format::ApiCallId::ApiCall_vkCmdSetViewportSwizzleNV, kDiveArgs_vkCmdSetViewportSwizzleNV, std::size(kDiveArgs_vkCmdSetViewportSwizzleNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetViewportSwizzleNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7215,128 +9131,169 @@ void VulkanExportDiveConsumer::Process_vkCmdSetViewportSwizzleNV(
     uint32_t                                    viewportCount,
     StructPointerDecoder<Decoded_VkViewportSwizzleNV>* pViewportSwizzles)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["firstViewport"], firstViewport, json_options);
-    FieldToJson(args["viewportCount"], viewportCount, json_options);
-    FieldToJson(args["pViewportSwizzles"], pViewportSwizzles, json_options);
-    util::DiveFunctionData function_data("vkCmdSetViewportSwizzleNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(firstViewport);
+    dive_args.Write(viewportCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pViewportSwizzles, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetViewportSwizzleNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCoverageToColorEnableNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "coverageToColorEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCoverageToColorEnableNV = { "vkCmdSetCoverageToColorEnableNV", format::ApiCallId::ApiCall_vkCmdSetCoverageToColorEnableNV, kDiveArgs_vkCmdSetCoverageToColorEnableNV, std::size(kDiveArgs_vkCmdSetCoverageToColorEnableNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCoverageToColorEnableNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    coverageToColorEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["coverageToColorEnable"], coverageToColorEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCoverageToColorEnableNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(coverageToColorEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCoverageToColorEnableNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCoverageToColorLocationNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "coverageToColorLocation", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCoverageToColorLocationNV = { "vkCmdSetCoverageToColorLocationNV", format::ApiCallId::ApiCall_vkCmdSetCoverageToColorLocationNV, kDiveArgs_vkCmdSetCoverageToColorLocationNV, std::size(kDiveArgs_vkCmdSetCoverageToColorLocationNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCoverageToColorLocationNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    coverageToColorLocation)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["coverageToColorLocation"], coverageToColorLocation, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCoverageToColorLocationNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(coverageToColorLocation);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCoverageToColorLocationNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCoverageModulationModeNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "coverageModulationMode", sizeof(VkCoverageModulationModeNV), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkCoverageModulationModeNV>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCoverageModulationModeNV = { "vkCmdSetCoverageModulationModeNV", format::ApiCallId::ApiCall_vkCmdSetCoverageModulationModeNV, kDiveArgs_vkCmdSetCoverageModulationModeNV, std::size(kDiveArgs_vkCmdSetCoverageModulationModeNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCoverageModulationModeNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkCoverageModulationModeNV                  coverageModulationMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["coverageModulationMode"], coverageModulationMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCoverageModulationModeNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(coverageModulationMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCoverageModulationModeNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCoverageModulationTableEnableNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "coverageModulationTableEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCoverageModulationTableEnableNV = { "vkCmdSetCoverageModulationTableEnableNV", format::ApiCallId::ApiCall_vkCmdSetCoverageModulationTableEnableNV, kDiveArgs_vkCmdSetCoverageModulationTableEnableNV, std::size(kDiveArgs_vkCmdSetCoverageModulationTableEnableNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCoverageModulationTableEnableNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    coverageModulationTableEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["coverageModulationTableEnable"], coverageModulationTableEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCoverageModulationTableEnableNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(coverageModulationTableEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCoverageModulationTableEnableNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCoverageModulationTableNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "coverageModulationTableCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pCoverageModulationTable", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCoverageModulationTableNV = { "vkCmdSetCoverageModulationTableNV", format::ApiCallId::ApiCall_vkCmdSetCoverageModulationTableNV, kDiveArgs_vkCmdSetCoverageModulationTableNV, std::size(kDiveArgs_vkCmdSetCoverageModulationTableNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCoverageModulationTableNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    coverageModulationTableCount,
     PointerDecoder<float>*                      pCoverageModulationTable)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["coverageModulationTableCount"], coverageModulationTableCount, json_options);
-    FieldToJson(args["pCoverageModulationTable"], pCoverageModulationTable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCoverageModulationTableNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(coverageModulationTableCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCoverageModulationTable, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCoverageModulationTableNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetShadingRateImageEnableNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "shadingRateImageEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetShadingRateImageEnableNV = { "vkCmdSetShadingRateImageEnableNV", format::ApiCallId::ApiCall_vkCmdSetShadingRateImageEnableNV, kDiveArgs_vkCmdSetShadingRateImageEnableNV, std::size(kDiveArgs_vkCmdSetShadingRateImageEnableNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetShadingRateImageEnableNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    shadingRateImageEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["shadingRateImageEnable"], shadingRateImageEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetShadingRateImageEnableNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(shadingRateImageEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetShadingRateImageEnableNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRepresentativeFragmentTestEnableNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "representativeFragmentTestEnable", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRepresentativeFragmentTestEnableNV = { "vkCmdSetRepresentativeFragmentTestEnableNV", format::ApiCallId::ApiCall_vkCmdSetRepresentativeFragmentTestEnableNV, kDiveArgs_vkCmdSetRepresentativeFragmentTestEnableNV, std::size(kDiveArgs_vkCmdSetRepresentativeFragmentTestEnableNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRepresentativeFragmentTestEnableNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    representativeFragmentTestEnable)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["representativeFragmentTestEnable"], representativeFragmentTestEnable, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRepresentativeFragmentTestEnableNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(representativeFragmentTestEnable);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRepresentativeFragmentTestEnableNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetCoverageReductionModeNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "coverageReductionMode", sizeof(VkCoverageReductionModeNV), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkCoverageReductionModeNV>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetCoverageReductionModeNV = { "vkCmdSetCoverageReductionModeNV", format::ApiCallId::ApiCall_vkCmdSetCoverageReductionModeNV, kDiveArgs_vkCmdSetCoverageReductionModeNV, std::size(kDiveArgs_vkCmdSetCoverageReductionModeNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetCoverageReductionModeNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkCoverageReductionModeNV                   coverageReductionMode)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["coverageReductionMode"], coverageReductionMode, json_options);
-    util::DiveFunctionData function_data("vkCmdSetCoverageReductionModeNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(coverageReductionMode);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetCoverageReductionModeNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7395,19 +9352,29 @@ void VulkanExportDiveConsumer::Process_vkBindOpticalFlowSessionImageNV(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdOpticalFlowExecuteNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "session", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pExecuteInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdOpticalFlowExecuteNV = { "vkCmdOpticalFlowExecuteNV", format::ApiCallId::ApiCall_vkCmdOpticalFlowExecuteNV, kDiveArgs_vkCmdOpticalFlowExecuteNV, std::size(kDiveArgs_vkCmdOpticalFlowExecuteNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdOpticalFlowExecuteNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     format::HandleId                            session,
     StructPointerDecoder<Decoded_VkOpticalFlowExecuteInfoNV>* pExecuteInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["session"], session, json_options);
-    FieldToJson(args["pExecuteInfo"], pExecuteInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdOpticalFlowExecuteNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(session);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pExecuteInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdOpticalFlowExecuteNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7447,6 +9414,14 @@ void VulkanExportDiveConsumer::Process_vkGetShaderBinaryDataEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindShadersEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "stageCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pStages", 0, nullptr },
+    { "pShaders", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindShadersEXT = { "vkCmdBindShadersEXT", format::ApiCallId::ApiCall_vkCmdBindShadersEXT, kDiveArgs_vkCmdBindShadersEXT, std::size(kDiveArgs_vkCmdBindShadersEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindShadersEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7454,30 +9429,47 @@ void VulkanExportDiveConsumer::Process_vkCmdBindShadersEXT(
     PointerDecoder<VkShaderStageFlagBits>*      pStages,
     HandlePointerDecoder<VkShaderEXT>*          pShaders)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["stageCount"], stageCount, json_options);
-    FieldToJson(args["pStages"], pStages, json_options);
-    HandleToJson(args["pShaders"], pShaders, json_options);
-    util::DiveFunctionData function_data("vkCmdBindShadersEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(stageCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pStages, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pShaders, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindShadersEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetDepthClampRangeEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "depthClampMode", sizeof(VkDepthClampModeEXT), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDepthClampModeEXT>(data), options); } },
+    { "pDepthClampRange", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetDepthClampRangeEXT = { "vkCmdSetDepthClampRangeEXT", format::ApiCallId::ApiCall_vkCmdSetDepthClampRangeEXT, kDiveArgs_vkCmdSetDepthClampRangeEXT, std::size(kDiveArgs_vkCmdSetDepthClampRangeEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetDepthClampRangeEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkDepthClampModeEXT                         depthClampMode,
     StructPointerDecoder<Decoded_VkDepthClampRangeEXT>* pDepthClampRange)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["depthClampMode"], depthClampMode, json_options);
-    FieldToJson(args["pDepthClampRange"], pDepthClampRange, json_options);
-    util::DiveFunctionData function_data("vkCmdSetDepthClampRangeEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(depthClampMode);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pDepthClampRange, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetDepthClampRangeEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7517,19 +9509,29 @@ void VulkanExportDiveConsumer::Process_vkConvertCooperativeVectorMatrixNV(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdConvertCooperativeVectorMatrixNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "infoCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pInfos", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdConvertCooperativeVectorMatrixNV = { "vkCmdConvertCooperativeVectorMatrixNV", format::ApiCallId::ApiCall_vkCmdConvertCooperativeVectorMatrixNV, kDiveArgs_vkCmdConvertCooperativeVectorMatrixNV, std::size(kDiveArgs_vkCmdConvertCooperativeVectorMatrixNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdConvertCooperativeVectorMatrixNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    infoCount,
     StructPointerDecoder<Decoded_VkConvertCooperativeVectorMatrixInfoNV>* pInfos)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["infoCount"], infoCount, json_options);
-    FieldToJson(args["pInfos"], pInfos, json_options);
-    util::DiveFunctionData function_data("vkCmdConvertCooperativeVectorMatrixNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(infoCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfos, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdConvertCooperativeVectorMatrixNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7574,31 +9576,44 @@ void VulkanExportDiveConsumer::Process_vkQueueNotifyOutOfBandNV(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetAttachmentFeedbackLoopEnableEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "aspectMask", sizeof(VkImageAspectFlags), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(VkImageAspectFlags_t(), jdata, util::ReadDiveArg<VkImageAspectFlags>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetAttachmentFeedbackLoopEnableEXT = { "vkCmdSetAttachmentFeedbackLoopEnableEXT", format::ApiCallId::ApiCall_vkCmdSetAttachmentFeedbackLoopEnableEXT, kDiveArgs_vkCmdSetAttachmentFeedbackLoopEnableEXT, std::size(kDiveArgs_vkCmdSetAttachmentFeedbackLoopEnableEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetAttachmentFeedbackLoopEnableEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkImageAspectFlags                          aspectMask)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(VkImageAspectFlags_t(), args["aspectMask"], aspectMask, json_options);
-    util::DiveFunctionData function_data("vkCmdSetAttachmentFeedbackLoopEnableEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(aspectMask);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetAttachmentFeedbackLoopEnableEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBindTileMemoryQCOM[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pTileMemoryBindInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBindTileMemoryQCOM = { "vkCmdBindTileMemoryQCOM", format::ApiCallId::ApiCall_vkCmdBindTileMemoryQCOM, kDiveArgs_vkCmdBindTileMemoryQCOM, std::size(kDiveArgs_vkCmdBindTileMemoryQCOM) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBindTileMemoryQCOM(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkTileMemoryBindInfoQCOM>* pTileMemoryBindInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pTileMemoryBindInfo"], pTileMemoryBindInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBindTileMemoryQCOM", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pTileMemoryBindInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBindTileMemoryQCOM, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7610,17 +9625,26 @@ void VulkanExportDiveConsumer::Process_vkGetPartitionedAccelerationStructuresBui
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBuildPartitionedAccelerationStructuresNV[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pBuildInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBuildPartitionedAccelerationStructuresNV = { "vkCmdBuildPartitionedAccelerationStructuresNV", format::ApiCallId::ApiCall_vkCmdBuildPartitionedAccelerationStructuresNV, kDiveArgs_vkCmdBuildPartitionedAccelerationStructuresNV, std::size(kDiveArgs_vkCmdBuildPartitionedAccelerationStructuresNV) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBuildPartitionedAccelerationStructuresNV(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkBuildPartitionedAccelerationStructureInfoNV>* pBuildInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pBuildInfo"], pBuildInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdBuildPartitionedAccelerationStructuresNV", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pBuildInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBuildPartitionedAccelerationStructuresNV, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7632,35 +9656,55 @@ void VulkanExportDiveConsumer::Process_vkGetGeneratedCommandsMemoryRequirementsE
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdPreprocessGeneratedCommandsEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pGeneratedCommandsInfo", 0, nullptr },
+    { "stateCommandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdPreprocessGeneratedCommandsEXT = { "vkCmdPreprocessGeneratedCommandsEXT", format::ApiCallId::ApiCall_vkCmdPreprocessGeneratedCommandsEXT, kDiveArgs_vkCmdPreprocessGeneratedCommandsEXT, std::size(kDiveArgs_vkCmdPreprocessGeneratedCommandsEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdPreprocessGeneratedCommandsEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkGeneratedCommandsInfoEXT>* pGeneratedCommandsInfo,
     format::HandleId                            stateCommandBuffer)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pGeneratedCommandsInfo"], pGeneratedCommandsInfo, json_options);
-    HandleToJson(args["stateCommandBuffer"], stateCommandBuffer, json_options);
-    util::DiveFunctionData function_data("vkCmdPreprocessGeneratedCommandsEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pGeneratedCommandsInfo, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(stateCommandBuffer);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdPreprocessGeneratedCommandsEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdExecuteGeneratedCommandsEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "isPreprocessed", sizeof(VkBool32), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { Bool32ToJson(jdata, util::ReadDiveArg<VkBool32>(data), options); } },
+    { "pGeneratedCommandsInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdExecuteGeneratedCommandsEXT = { "vkCmdExecuteGeneratedCommandsEXT", format::ApiCallId::ApiCall_vkCmdExecuteGeneratedCommandsEXT, kDiveArgs_vkCmdExecuteGeneratedCommandsEXT, std::size(kDiveArgs_vkCmdExecuteGeneratedCommandsEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdExecuteGeneratedCommandsEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     VkBool32                                    isPreprocessed,
     StructPointerDecoder<Decoded_VkGeneratedCommandsInfoEXT>* pGeneratedCommandsInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    Bool32ToJson(args["isPreprocessed"], isPreprocessed, json_options);
-    FieldToJson(args["pGeneratedCommandsInfo"], pGeneratedCommandsInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdExecuteGeneratedCommandsEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(isPreprocessed);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pGeneratedCommandsInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdExecuteGeneratedCommandsEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7746,17 +9790,26 @@ void VulkanExportDiveConsumer::Process_vkGetMemoryMetalHandlePropertiesEXT(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdEndRendering2EXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pRenderingEndInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdEndRendering2EXT = { "vkCmdEndRendering2EXT", format::ApiCallId::ApiCall_vkCmdEndRendering2EXT, kDiveArgs_vkCmdEndRendering2EXT, std::size(kDiveArgs_vkCmdEndRendering2EXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdEndRendering2EXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkRenderingEndInfoEXT>* pRenderingEndInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pRenderingEndInfo"], pRenderingEndInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdEndRendering2EXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRenderingEndInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdEndRendering2EXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7778,6 +9831,14 @@ void VulkanExportDiveConsumer::Process_vkDestroyAccelerationStructureKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdBuildAccelerationStructuresKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "infoCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pInfos", 0, nullptr },
+    { "ppBuildRangeInfos", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdBuildAccelerationStructuresKHR = { "vkCmdBuildAccelerationStructuresKHR", format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresKHR, kDiveArgs_vkCmdBuildAccelerationStructuresKHR, std::size(kDiveArgs_vkCmdBuildAccelerationStructuresKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdBuildAccelerationStructuresKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7785,14 +9846,21 @@ void VulkanExportDiveConsumer::Process_vkCmdBuildAccelerationStructuresKHR(
     StructPointerDecoder<Decoded_VkAccelerationStructureBuildGeometryInfoKHR>* pInfos,
     StructPointerDecoder<Decoded_VkAccelerationStructureBuildRangeInfoKHR*>* ppBuildRangeInfos)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["infoCount"], infoCount, json_options);
-    FieldToJson(args["pInfos"], pInfos, json_options);
-    FieldToJson(args["ppBuildRangeInfos"], ppBuildRangeInfos, json_options);
-    util::DiveFunctionData function_data("vkCmdBuildAccelerationStructuresKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(infoCount);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfos, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), ppBuildRangeInfos, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdBuildAccelerationStructuresKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7827,45 +9895,72 @@ void VulkanExportDiveConsumer::Process_vkWriteAccelerationStructuresPropertiesKH
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyAccelerationStructureKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyAccelerationStructureKHR = { "vkCmdCopyAccelerationStructureKHR", format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureKHR, kDiveArgs_vkCmdCopyAccelerationStructureKHR, std::size(kDiveArgs_vkCmdCopyAccelerationStructureKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyAccelerationStructureKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyAccelerationStructureInfoKHR>* pInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInfo"], pInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyAccelerationStructureKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyAccelerationStructureKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyAccelerationStructureToMemoryKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyAccelerationStructureToMemoryKHR = { "vkCmdCopyAccelerationStructureToMemoryKHR", format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureToMemoryKHR, kDiveArgs_vkCmdCopyAccelerationStructureToMemoryKHR, std::size(kDiveArgs_vkCmdCopyAccelerationStructureToMemoryKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyAccelerationStructureToMemoryKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyAccelerationStructureToMemoryInfoKHR>* pInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInfo"], pInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyAccelerationStructureToMemoryKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyAccelerationStructureToMemoryKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdCopyMemoryToAccelerationStructureKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pInfo", 0, nullptr },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdCopyMemoryToAccelerationStructureKHR = { "vkCmdCopyMemoryToAccelerationStructureKHR", format::ApiCallId::ApiCall_vkCmdCopyMemoryToAccelerationStructureKHR, kDiveArgs_vkCmdCopyMemoryToAccelerationStructureKHR, std::size(kDiveArgs_vkCmdCopyMemoryToAccelerationStructureKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdCopyMemoryToAccelerationStructureKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     StructPointerDecoder<Decoded_VkCopyMemoryToAccelerationStructureInfoKHR>* pInfo)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pInfo"], pInfo, json_options);
-    util::DiveFunctionData function_data("vkCmdCopyMemoryToAccelerationStructureKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pInfo, json_options);
+    }
+    dive_args.EndJson();
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdCopyMemoryToAccelerationStructureKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7877,6 +9972,16 @@ void VulkanExportDiveConsumer::Process_vkGetAccelerationStructureDeviceAddressKH
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdWriteAccelerationStructuresPropertiesKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "accelerationStructureCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "pAccelerationStructures", 0, nullptr },
+    { "queryType", sizeof(VkQueryType), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkQueryType>(data), options); } },
+    { "queryPool", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "firstQuery", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdWriteAccelerationStructuresPropertiesKHR = { "vkCmdWriteAccelerationStructuresPropertiesKHR", format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesKHR, kDiveArgs_vkCmdWriteAccelerationStructuresPropertiesKHR, std::size(kDiveArgs_vkCmdWriteAccelerationStructuresPropertiesKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdWriteAccelerationStructuresPropertiesKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7886,16 +9991,19 @@ void VulkanExportDiveConsumer::Process_vkCmdWriteAccelerationStructuresPropertie
     format::HandleId                            queryPool,
     uint32_t                                    firstQuery)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["accelerationStructureCount"], accelerationStructureCount, json_options);
-    HandleToJson(args["pAccelerationStructures"], pAccelerationStructures, json_options);
-    FieldToJson(args["queryType"], queryType, json_options);
-    HandleToJson(args["queryPool"], queryPool, json_options);
-    FieldToJson(args["firstQuery"], firstQuery, json_options);
-    util::DiveFunctionData function_data("vkCmdWriteAccelerationStructuresPropertiesKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(accelerationStructureCount);
+    if (!dive_args.DeferJson())
+    {
+        HandleToJson(dive_args.BeginJson(), pAccelerationStructures, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(queryType);
+    dive_args.Write(queryPool);
+    dive_args.Write(firstQuery);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdWriteAccelerationStructuresPropertiesKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7917,6 +10025,18 @@ void VulkanExportDiveConsumer::Process_vkGetAccelerationStructureBuildSizesKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdTraceRaysKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pRaygenShaderBindingTable", 0, nullptr },
+    { "pMissShaderBindingTable", 0, nullptr },
+    { "pHitShaderBindingTable", 0, nullptr },
+    { "pCallableShaderBindingTable", 0, nullptr },
+    { "width", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "height", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "depth", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdTraceRaysKHR = { "vkCmdTraceRaysKHR", format::ApiCallId::ApiCall_vkCmdTraceRaysKHR, kDiveArgs_vkCmdTraceRaysKHR, std::size(kDiveArgs_vkCmdTraceRaysKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdTraceRaysKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7928,18 +10048,33 @@ void VulkanExportDiveConsumer::Process_vkCmdTraceRaysKHR(
     uint32_t                                    height,
     uint32_t                                    depth)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pRaygenShaderBindingTable"], pRaygenShaderBindingTable, json_options);
-    FieldToJson(args["pMissShaderBindingTable"], pMissShaderBindingTable, json_options);
-    FieldToJson(args["pHitShaderBindingTable"], pHitShaderBindingTable, json_options);
-    FieldToJson(args["pCallableShaderBindingTable"], pCallableShaderBindingTable, json_options);
-    FieldToJson(args["width"], width, json_options);
-    FieldToJson(args["height"], height, json_options);
-    FieldToJson(args["depth"], depth, json_options);
-    util::DiveFunctionData function_data("vkCmdTraceRaysKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRaygenShaderBindingTable, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pMissShaderBindingTable, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pHitShaderBindingTable, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCallableShaderBindingTable, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(width);
+    dive_args.Write(height);
+    dive_args.Write(depth);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdTraceRaysKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -7968,6 +10103,16 @@ void VulkanExportDiveConsumer::Process_vkGetRayTracingCaptureReplayShaderGroupHa
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdTraceRaysIndirectKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pRaygenShaderBindingTable", 0, nullptr },
+    { "pMissShaderBindingTable", 0, nullptr },
+    { "pHitShaderBindingTable", 0, nullptr },
+    { "pCallableShaderBindingTable", 0, nullptr },
+    { "indirectDeviceAddress", sizeof(VkDeviceAddress), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJsonAsHex(jdata, util::ReadDiveArg<VkDeviceAddress>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdTraceRaysIndirectKHR = { "vkCmdTraceRaysIndirectKHR", format::ApiCallId::ApiCall_vkCmdTraceRaysIndirectKHR, kDiveArgs_vkCmdTraceRaysIndirectKHR, std::size(kDiveArgs_vkCmdTraceRaysIndirectKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdTraceRaysIndirectKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -7977,16 +10122,31 @@ void VulkanExportDiveConsumer::Process_vkCmdTraceRaysIndirectKHR(
     StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pCallableShaderBindingTable,
     VkDeviceAddress                             indirectDeviceAddress)
 {
-    nlohmann::ordered_json dive_data;
     const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pRaygenShaderBindingTable"], pRaygenShaderBindingTable, json_options);
-    FieldToJson(args["pMissShaderBindingTable"], pMissShaderBindingTable, json_options);
-    FieldToJson(args["pHitShaderBindingTable"], pHitShaderBindingTable, json_options);
-    FieldToJson(args["pCallableShaderBindingTable"], pCallableShaderBindingTable, json_options);
-    FieldToJsonAsHex(args["indirectDeviceAddress"], indirectDeviceAddress, json_options);
-    util::DiveFunctionData function_data("vkCmdTraceRaysIndirectKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pRaygenShaderBindingTable, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pMissShaderBindingTable, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pHitShaderBindingTable, json_options);
+    }
+    dive_args.EndJson();
+    if (!dive_args.DeferJson())
+    {
+        FieldToJson(dive_args.BeginJson(), pCallableShaderBindingTable, json_options);
+    }
+    dive_args.EndJson();
+    dive_args.Write(indirectDeviceAddress);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdTraceRaysIndirectKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
@@ -8000,20 +10160,32 @@ void VulkanExportDiveConsumer::Process_vkGetRayTracingShaderGroupStackSizeKHR(
 {
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdSetRayTracingPipelineStackSizeKHR[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "pipelineStackSize", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdSetRayTracingPipelineStackSizeKHR = { "vkCmdSetRayTracingPipelineStackSizeKHR", format::ApiCallId::ApiCall_vkCmdSetRayTracingPipelineStackSizeKHR, kDiveArgs_vkCmdSetRayTracingPipelineStackSizeKHR, std::size(kDiveArgs_vkCmdSetRayTracingPipelineStackSizeKHR) };
+
 void VulkanExportDiveConsumer::Process_vkCmdSetRayTracingPipelineStackSizeKHR(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
     uint32_t                                    pipelineStackSize)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["pipelineStackSize"], pipelineStackSize, json_options);
-    util::DiveFunctionData function_data("vkCmdSetRayTracingPipelineStackSizeKHR", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(pipelineStackSize);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdSetRayTracingPipelineStackSizeKHR, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawMeshTasksEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "groupCountX", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountY", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "groupCountZ", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawMeshTasksEXT = { "vkCmdDrawMeshTasksEXT", format::ApiCallId::ApiCall_vkCmdDrawMeshTasksEXT, kDiveArgs_vkCmdDrawMeshTasksEXT, std::size(kDiveArgs_vkCmdDrawMeshTasksEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -8021,17 +10193,24 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksEXT(
     uint32_t                                    groupCountY,
     uint32_t                                    groupCountZ)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    FieldToJson(args["groupCountX"], groupCountX, json_options);
-    FieldToJson(args["groupCountY"], groupCountY, json_options);
-    FieldToJson(args["groupCountZ"], groupCountZ, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawMeshTasksEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(groupCountX);
+    dive_args.Write(groupCountY);
+    dive_args.Write(groupCountZ);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawMeshTasksEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawMeshTasksIndirectEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "drawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawMeshTasksIndirectEXT = { "vkCmdDrawMeshTasksIndirectEXT", format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectEXT, kDiveArgs_vkCmdDrawMeshTasksIndirectEXT, std::size(kDiveArgs_vkCmdDrawMeshTasksIndirectEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksIndirectEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -8040,18 +10219,27 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksIndirectEXT(
     uint32_t                                    drawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    FieldToJson(args["drawCount"], drawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawMeshTasksIndirectEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(drawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawMeshTasksIndirectEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 
+static const util::DiveArgSchema kDiveArgs_vkCmdDrawMeshTasksIndirectCountEXT[] = {
+    { "commandBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "buffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "offset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "countBuffer", sizeof(format::HandleId), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { HandleToJson(jdata, util::ReadDiveArg<format::HandleId>(data), options); } },
+    { "countBufferOffset", sizeof(VkDeviceSize), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<VkDeviceSize>(data), options); } },
+    { "maxDrawCount", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+    { "stride", sizeof(uint32_t), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) { FieldToJson(jdata, util::ReadDiveArg<uint32_t>(data), options); } },
+};
+static const util::DiveCommandSchema kDiveSchema_vkCmdDrawMeshTasksIndirectCountEXT = { "vkCmdDrawMeshTasksIndirectCountEXT", format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountEXT, kDiveArgs_vkCmdDrawMeshTasksIndirectCountEXT, std::size(kDiveArgs_vkCmdDrawMeshTasksIndirectCountEXT) };
+
 void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksIndirectCountEXT(
     const ApiCallInfo&                          call_info,
     format::HandleId                            commandBuffer,
@@ -8062,17 +10250,15 @@ void VulkanExportDiveConsumer::Process_vkCmdDrawMeshTasksIndirectCountEXT(
     uint32_t                                    maxDrawCount,
     uint32_t                                    stride)
 {
-    nlohmann::ordered_json dive_data;
-    const JsonOptions json_options;
-    auto& args = dive_data["args"];
-    HandleToJson(args["commandBuffer"], commandBuffer, json_options);
-    HandleToJson(args["buffer"], buffer, json_options);
-    FieldToJson(args["offset"], offset, json_options);
-    HandleToJson(args["countBuffer"], countBuffer, json_options);
-    FieldToJson(args["countBufferOffset"], countBufferOffset, json_options);
-    FieldToJson(args["maxDrawCount"], maxDrawCount, json_options);
-    FieldToJson(args["stride"], stride, json_options);
-    util::DiveFunctionData function_data("vkCmdDrawMeshTasksIndirectCountEXT", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);
+    util::DiveArgsEncoder& dive_args = BeginDiveArgs(true);
+    dive_args.Write(commandBuffer);
+    dive_args.Write(buffer);
+    dive_args.Write(offset);
+    dive_args.Write(countBuffer);
+    dive_args.Write(countBufferOffset);
+    dive_args.Write(maxDrawCount);
+    dive_args.Write(stride);
+    util::DiveFunctionData function_data(kDiveSchema_vkCmdDrawMeshTasksIndirectCountEXT, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);
     WriteBlockEnd(function_data);
 }
 GFXRECON_END_NAMESPACE(decode)
@@ -19,6 +19,13 @@ class KhronosExportDiveConsumerBodyGenerator():
     """KhronosExportDiveConsumerBodyGenerator
     Generates C++ member definitions for the KhronosExportDiveConsumer class responsible for
     displaying decoded Khronos API call parameter data in dive.
+
+    The arguments of the commands displayed in dive are not converted to JSON while the capture is
+    loaded. Each such command gets a static schema table describing its arguments, and its Process_
+    function writes the arguments into a util::DiveArgsEncoder: scalars as raw bytes, pointers and
+    structs as CBOR encoded JSON. The schema converts the arguments to JSON when dive asks for them.
+    When the consumer defers args, the pointer and struct arguments of command buffer commands are not
+    converted at all and are decoded again from the capture file on demand.
     """
     def is_command_buffer_cmd(self, command):
         if 'vkCmd' in command:
@@ -50,8 +57,12 @@ class KhronosExportDiveConsumerBodyGenerator():
             info = self.all_cmd_params[cmd]
             return_type = info[0]
             values = info[2]
+            # Only include full processing for vulkan commands and vkQueueSubmits since those are what are displayed in dive.
+            is_dive_cmd = self.is_command_buffer_cmd(cmd) or cmd in self.queueSubmit
 
             cmddef = '\n'
+            if is_dive_cmd:
+                cmddef += self.make_dive_arg_schema(cmd, values) + '\n'
             cmddef += self.make_consumer_func_decl(
                 return_type, export_prefix + cmd, values
             ) + '\n'
@@ -60,19 +71,10 @@ class KhronosExportDiveConsumerBodyGenerator():
                 {
                 '''
             )
-            # Only include full processing for vulkan commands and vkQueueSubmits since those are what are displayed in dive.
-            if self.is_command_buffer_cmd(cmd) or cmd in self.queueSubmit:
-                cmddef += '\n'
-                cmddef += format_cpp_code(
-                    '''
-                        nlohmann::ordered_json dive_data;
-                        const JsonOptions json_options;
-                    ''', 1
-                )
             cmddef += '\n'
             # Only include this for vulkan commands since those are what are displayed in dive.
             cmddef += self.make_consumer_func_body(return_type, cmd, values)
-            if self.is_command_buffer_cmd(cmd) or cmd in self.queueSubmit:
+            if is_dive_cmd:
                 cmddef += format_cpp_code(
                 '''
                     WriteBlockEnd(function_data);
@@ -91,6 +93,12 @@ class KhronosExportDiveConsumerBodyGenerator():
         """Method may be overriden"""
         return False
 
+    def may_defer_args(self, command):
+        """Method may be overridden.
+        Indicates that the pointer and struct arguments of the command can be left out of the
+        first pass over a capture."""
+        return self.is_command_buffer_cmd(command) and command not in self.queueSubmit
+
     def decode_as_handle(self, value):
         """Method may be overridden.
         Indicates that the given type should be decoded as a handle."""
@@ -100,46 +108,93 @@ class KhronosExportDiveConsumerBodyGenerator():
         """Method may be overriden"""
         return False
 
+    def is_encoded_as_scalar(self, value):
+        """Indicates that the argument is stored as raw bytes rather than as CBOR encoded JSON."""
+        return 'Decoder' not in self.make_decoded_param_type(value)
+
+    def make_to_dive(self, name, value):
+        """Return the expression converting an argument to JSON, with {target}, {value} and
+        {options} left to be formatted in.
+        """
+        # Default to letting the right function overload to be resolved based on argument types,
+        # including enums, strings ints, floats etc.:
+        # Note there are overloads for scalars and pointers/arrays.
+        to_dive = 'FieldToJson({target}, {value}, {options})'
+
+        # Special cases:
+        if self.is_boolean_type(value.base_type):
+            to_dive = 'Bool32ToJson({target}, {value}, {options})'
+        elif value.name == 'ppData' or self.decode_as_hex(value):
+            to_dive = 'FieldToJsonAsHex({target}, {value}, {options})'
+        elif self.decode_as_handle(value):
+            to_dive = 'HandleToJson({target}, {value}, {options})'
+        elif self.is_flags(value.base_type):
+            flagsEnumType = value.base_type
+            if value.base_type in self.flags_type_aliases:
+                flagsEnumType = self.flags_type_aliases[value.base_type]
+            if not (value.is_pointer or value.is_array):
+                to_dive = 'FieldToJson(' + flagsEnumType + '_t(), {target}, {value}, {options})'
+            else:
+                # Default to outputting as the raw type but warn:
+                print(
+                    "Missing conversion of pointers to",
+                    flagsEnumType,
+                    "in",
+                    name,
+                    file=sys.stderr
+                )
+        return to_dive
+
+    def make_dive_arg_schema(self, name, values):
+        """Return the static schema tables describing how the arguments of a command are encoded."""
+        args_table = 'kDiveArgs_{}'.format(name)
+        schema = 'static const util::DiveArgSchema {}[] = {{\n'.format(args_table)
+        for value in values:
+            if self.is_encoded_as_scalar(value):
+                param_type = self.make_decoded_param_type(value)
+                to_dive = self.make_to_dive(name, value).format(
+                    target='jdata',
+                    value='util::ReadDiveArg<{}>(data)'.format(param_type),
+                    options='options'
+                )
+                schema += '    {{ "{0}", sizeof({1}), [](nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options) {{ {2}; }} }},\n'.format(
+                    value.name, param_type, to_dive
+                )
+            else:
+                schema += '    {{ "{}", 0, nullptr }},\n'.format(value.name)
+        schema += '};\n'
+        schema += 'static const util::DiveCommandSchema kDiveSchema_{0} = {{ "{0}", format::ApiCallId::ApiCall_{0}, {1}, std::size({1}) }};\n'.format(
+            name, args_table
+        )
+        return schema
+
     def make_consumer_func_body(self, return_type, name, values):
         """Return ExportDiveConsumer class member function definition."""
         body = ''
 
         if (len(values) > 0 and self.is_command_buffer_cmd(name)) or name in self.queueSubmit:
-            body += f'    auto& args = dive_data["args"];\n'
+            if not all(self.is_encoded_as_scalar(value) for value in values):
+                body += '    const JsonOptions json_options;\n'
+            may_defer = self.may_defer_args(name)
+            body += '    util::DiveArgsEncoder& dive_args = BeginDiveArgs({});\n'.format(
+                'true' if may_defer else ''
+            )
             # Handle function arguments
             for value in values:
-                flagsEnumType = value.base_type
-
-                # Default to letting the right function overload to be resolved based on argument types,
-                # including enums, strings ints, floats etc.:
-                # Note there are overloads for scalars and pointers/arrays.
-                to_dive = 'FieldToJson(args["{0}"], {0}, json_options)'
-
-                # Special cases:
-                if self.is_boolean_type(value.base_type):
-                    to_dive = 'Bool32ToJson(args["{0}"], {0}, json_options)'
-                elif value.name == 'ppData' or self.decode_as_hex(value):
-                    to_dive = 'FieldToJsonAsHex(args["{0}"], {0}, json_options)'
-                elif self.decode_as_handle(value):
-                    to_dive = 'HandleToJson(args["{0}"], {0}, json_options)'
-                elif self.is_flags(value.base_type):
-                    if value.base_type in self.flags_type_aliases:
-                        flagsEnumType = self.flags_type_aliases[value.base_type
-                                                                ]
-                    if not (value.is_pointer or value.is_array):
-                        to_dive = 'FieldToJson({2}_t(), args["{0}"], {0}, json_options)'
+                if self.is_encoded_as_scalar(value):
+                    body += '    dive_args.Write({});\n'.format(value.name)
+                else:
+                    to_dive = self.make_to_dive(name, value).format(
+                        target='dive_args.BeginJson()',
+                        value=value.name,
+                        options='json_options'
+                    )
+                    if may_defer:
+                        body += '    if (!dive_args.DeferJson())\n'
+                        body += '    {\n'
+                        body += '        {0};\n'.format(to_dive)
+                        body += '    }\n'
                     else:
-                        # Default to outputting as the raw type but warn:
-                        print(
-                            "Missing conversion of pointers to",
-                            flagsEnumType,
-                            "in",
-                            name,
-                            file=sys.stderr
-                        )
-
-                to_dive = to_dive.format(
-                    value.name, value.base_type, flagsEnumType
-                )
-                body += '    {0};\n'.format(to_dive)
+                        body += '    {0};\n'.format(to_dive)
+                    body += '    dive_args.EndJson();\n'
         return body
@@ -0,0 +1,123 @@
+#!/usr/bin/python3 -i
+#
+# Copyright 2026 Google LLC
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent cache of parsed Khronos registries.
+
+Parsing the registry XML and building the Registry API model (Registry.loadElementTree) is the
+largest fixed cost of every gencode.py run. The cache stores the loaded Registry object, without
+its generator, keyed by a hash of every input it was built from: the registry XML files, the
+registry scripts, the gencode.py script doing the loading and the Python version. Any change to an
+input changes the key, so stale entries are never used; they are simply left behind.
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import sys
+
+# Default cache location, next to the generators
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.registry_cache'
+)
+
+# Bump when the layout of the cached data changes
+CACHE_VERSION = 1
+
+
+def registry_cache_key(input_files, extra_values=()):
+    """Returns the cache key for a registry built from the given files and values"""
+    key = hashlib.sha256()
+    key.update(str(CACHE_VERSION).encode('utf-8'))
+    key.update(sys.version.encode('utf-8'))
+    for path in input_files:
+        key.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            key.update(f.read())
+    for value in extra_values:
+        key.update(str(value).encode('utf-8'))
+    return key.hexdigest()
+
+
+def bind_registry(reg, gen, options):
+    """Bind a loaded registry to a generator and its options, the same way the Registry
+    constructor does
+    """
+    reg.gen = gen
+    reg.genOpts = options
+    gen.registry = reg
+    gen.genOpts = options
+    options.registry = reg
+
+
+def load_cached_registry(key, gen, options, cache_dir=DEFAULT_CACHE_DIR):
+    """Returns (registry, extra_data) stored for the key, with the registry bound to the given
+    generator, or None if nothing was stored for the key
+    """
+    path = os.path.join(cache_dir, key + '.pickle')
+    if not os.path.isfile(path):
+        return None
+
+    # The model is a large graph of small objects, so the cyclic collector would otherwise run
+    # many times while it is rebuilt
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError):
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    reg = data['registry']
+    bind_registry(reg, gen, options)
+    return reg, data['extra']
+
+
+def store_cached_registry(
+    key, reg, extra_data=None, cache_dir=DEFAULT_CACHE_DIR
+):
+    """Stores a loaded registry and any extra data (e.g. other parsed XML) for the key. Failing to
+    store is not an error; the registry will be parsed again on the next run.
+    """
+    # The generator and its options hold open files and are specific to one target
+    gen, options = reg.gen, reg.genOpts
+    reg.gen = None
+    reg.genOpts = None
+    path = os.path.join(cache_dir, key + '.pickle')
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(
+                {
+                    'registry': reg,
+                    'extra': extra_data
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        # Atomic, so that concurrent runs never read a partially written entry
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError,
+            RecursionError) as error:
+        print(
+            'Warning: could not cache the parsed registry:', error,
+            file=sys.stderr
+        )
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    finally:
+        bind_registry(reg, gen, options)
@@ -46,6 +46,7 @@ import sys
 import time
 from reg import Registry, etree
 from generator import write
+from khronos_registry_cache import registry_cache_key, load_cached_registry, store_cached_registry, DEFAULT_CACHE_DIR
 
 # Utility items
 from openxr_dispatch_table_generator import OpenXrDispatchTableGenerator, OpenXrDispatchTableGeneratorOptions
@@ -783,6 +784,55 @@ def gen_target(args):
         return None
 
 
+def load_registry(gen, options, args):
+    """Parse the registry (args.registry) into a Registry object bound to the given generator.
+
+    Unless args.registry_cache is False, the parsed registry is stored in, and reused from, a
+    persistent cache keyed by the hashes of the inputs it is built from.
+    """
+    # The config XML files are merged in directory order. Only the cache key sorts them, so that
+    # it does not depend on that order.
+    config_xmls = [
+        os.path.join(args.configs, filename)
+        for filename in os.listdir(args.configs) if filename.endswith('.xml')
+    ]
+    if args.registry_cache:
+        cache_key = registry_cache_key(
+            [
+                args.registry, *sorted(config_xmls),
+                sys.modules[Registry.__module__].__file__, __file__
+            ], [options.apiname]
+        )
+        start_timer(args.time)
+        cached = load_cached_registry(
+            cache_key, gen, options, args.registry_cache_dir
+        )
+        end_timer(args.time, '* Time to load cached registry =')
+        if cached is not None:
+            return cached[0]
+
+    reg = Registry(gen, options)
+
+    ## @note We parse xr.xml to an in-memory element tree and then extract the info we need
+    ## from that into the Registry object once per output file we generate rather than once
+    ## per run of the top-level generation script.
+    start_timer(args.time)
+    tree = etree.parse(args.registry)
+    end_timer(args.time, '* Time to make ElementTree =')
+
+    # Extend the xr.xml tree with XML files from the config dir
+    for config_xml in config_xmls:
+        extend_xml(tree, config_xml)
+
+    start_timer(args.time)
+    reg.loadElementTree(tree)
+    end_timer(args.time, '* Time to parse ElementTree =')
+
+    if args.registry_cache:
+        store_cached_registry(cache_key, reg, None, args.registry_cache_dir)
+    return reg
+
+
 # -feature name
 # -extension name
 # For both, "name" may be a single name, or a space-separated list
@@ -839,6 +889,19 @@ if __name__ == '__main__':
             ]
         )
     )
+    parser.add_argument(
+        '-no-registry-cache',
+        dest='registry_cache',
+        action='store_false',
+        help='Always parse the registry, instead of reusing a previously parsed one'
+    )
+    parser.add_argument(
+        '-registry-cache-dir',
+        dest='registry_cache_dir',
+        action='store',
+        default=DEFAULT_CACHE_DIR,
+        help='Directory storing the parsed registries'
+    )
     parser.add_argument('-time', action='store_true', help='Enable timing')
     parser.add_argument(
         '-validate', action='store_true', help='Enable group validation'
@@ -890,23 +953,7 @@ if __name__ == '__main__':
 
     (gen, options) = gen_target(args)
 
-    reg = Registry(gen, options)
-
-    ## @note We parse vk.xml to an in-memory element tree and then extract the info we need
-    ## from that into the Registry object once per output file we generate rather than once
-    ## per run of the top-level generation script.
-    start_timer(args.time)
-    tree = etree.parse(args.registry)
-    end_timer(args.time, '* Time to make ElementTree =')
-
-    # Extend the xr.xml tree with XML files from the config dir
-    for filename in os.listdir(args.configs):
-        if filename.endswith('.xml'):
-            extend_xml(tree, os.path.join(args.configs, filename))
-
-    start_timer(args.time)
-    reg.loadElementTree(tree)
-    end_timer(args.time, '* Time to parse ElementTree =')
+    reg = load_registry(gen, options, args)
 
     if (args.validate):
         reg.validateGroups()
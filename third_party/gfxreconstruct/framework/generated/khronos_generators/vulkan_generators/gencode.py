@@ -46,6 +46,8 @@ import sys
 import time
 from registry.reg import Registry, etree
 from generator import write
+from khronos_registry_cache import registry_cache_key, load_cached_registry, store_cached_registry
+from khronos_registry_cache import bind_registry as bind_loaded_registry, DEFAULT_CACHE_DIR
 
 # API Call Decoders
 from vulkan_decoder_body_generator import VulkanDecoderBodyGenerator, VulkanDecoderBodyGeneratorOptions
@@ -131,6 +133,10 @@ def end_timer(timeit, msg):
         start_time = None
 
 
+# Error/warning and diagnostic files, replaced by the command line options when run as a script
+err_warn = sys.stderr
+diag = None
+
 # JSON files for customizing code generation
 default_blacklists = 'blacklists.json'
 default_platform_types = 'platform_types.json'
@@ -1038,11 +1044,90 @@ def gen_target(args):
         return None
 
 
+def load_registry(gen, options, args):
+    """Parse the registry (args.registry and args.video) into a Registry object bound to the given
+    generator. The returned object can be bound to another target's generator with bind_registry(),
+    so that generate_vulkan.py can parse the registry once and share it across all targets.
+
+    Unless args.registry_cache is False, the parsed registry is stored in, and reused from, a
+    persistent cache keyed by the hashes of the inputs it is built from.
+    """
+    # The config XML files are merged in directory order. Only the cache key sorts them, so that
+    # it does not depend on that order.
+    config_xmls = [
+        os.path.join(args.configs, filename)
+        for filename in os.listdir(args.configs) if filename.endswith('.xml')
+    ]
+    if args.registry_cache:
+        cache_key = registry_cache_key(
+            [
+                args.registry, args.video, *sorted(config_xmls),
+                sys.modules[Registry.__module__].__file__, __file__
+            ], [options.apiname]
+        )
+        start_timer(args.time)
+        cached = load_cached_registry(
+            cache_key, gen, options, args.registry_cache_dir
+        )
+        end_timer(args.time, '* Time to load cached registry =')
+        if cached is not None:
+            reg, gen.VIDEO_TREE = cached
+            return reg
+
+    reg = Registry(gen, options)
+
+    ## @note We parse vk.xml to an in-memory element tree and then extract the info we need
+    ## from that into the Registry object once per output file we generate rather than once
+    ## per run of the top-level generation script.
+    start_timer(args.time)
+    tree = etree.parse(args.registry)
+    gen.VIDEO_TREE = etree.parse(args.video)
+    end_timer(args.time, '* Time to make ElementTree =')
+
+    # Apply any temporary patches to the xml to allow correct code generation
+    # from it. These should be reviewed and removed when the xml is fixed upstream.
+    start_timer(args.time)
+    # There are no current patches needed, but here is an example of how to patch the XML
+    # after parsing to add a missing single attribute:
+    # Workaround 1.3.264 VkFrameBoundaryEXT.pTag lacking len field:
+    # <https://github.com/KhronosGroup/Vulkan-Docs/pull/2240>
+    # if ptag_member := tree.find('types/type[@name="VkFrameBoundaryEXT"]/member[name="pTag"]'):
+    #    ptag_member.set('len', 'tagSize')
+    end_timer(args.time, '* Time to patch ElementTree =')
+
+    # Extend the vk.xml tree with XML files from the config dir
+    for config_xml in config_xmls:
+        extend_xml(tree, config_xml)
+
+    start_timer(args.time)
+    reg.loadElementTree(tree)
+    end_timer(args.time, '* Time to parse ElementTree =')
+
+    if args.registry_cache:
+        store_cached_registry(
+            cache_key, reg, gen.VIDEO_TREE, args.registry_cache_dir
+        )
+    return reg
+
+
+def bind_registry(reg, gen, options):
+    """Bind an already loaded registry to the generator and options of another target, the same
+    way the Registry constructor does. Registry.apiGen() marks the features it generates as
+    required/declared and never resets them, so a registry must only be used for one target;
+    generate_vulkan.py forks a fresh copy of it for every target.
+    """
+    gen.VIDEO_TREE = reg.gen.VIDEO_TREE
+    bind_loaded_registry(reg, gen, options)
+
+
 # -feature name
 # -extension name
 # For both, "name" may be a single name, or a space-separated list
 # of names, or a regular expression.
-if __name__ == '__main__':
+def make_arg_parser():
+    """Returns the parser for the command line arguments of this script. generate_vulkan.py uses it
+    to build the arguments of each target when it generates them without running this script.
+    """
     parser = argparse.ArgumentParser()
 
     parser.add_argument('-debug', action='store_true', help='Enable debugging')
@@ -1094,6 +1179,19 @@ if __name__ == '__main__':
             ]
         )
     )
+    parser.add_argument(
+        '-no-registry-cache',
+        dest='registry_cache',
+        action='store_false',
+        help='Always parse the registry, instead of reusing a previously parsed one'
+    )
+    parser.add_argument(
+        '-registry-cache-dir',
+        dest='registry_cache_dir',
+        action='store',
+        default=DEFAULT_CACHE_DIR,
+        help='Directory storing the parsed registries'
+    )
     parser.add_argument('-time', action='store_true', help='Enable timing')
     parser.add_argument(
         '-validate', action='store_true', help='Enable group validation'
@@ -1130,7 +1228,11 @@ if __name__ == '__main__':
         'Specify directory containing JSON configuration files for generators'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+if __name__ == '__main__':
+    args = make_arg_parser().parse_args()
 
     # create error/warning & diagnostic files
     if (args.errfile):
@@ -1144,36 +1246,7 @@ if __name__ == '__main__':
         diag = None
 
     (gen, options) = gen_target(args)
-
-    reg = Registry(gen, options)
-
-    ## @note We parse vk.xml to an in-memory element tree and then extract the info we need
-    ## from that into the Registry object once per output file we generate rather than once
-    ## per run of the top-level generation script.
-    start_timer(args.time)
-    tree = etree.parse(args.registry)
-    gen.VIDEO_TREE = etree.parse(args.video)
-    end_timer(args.time, '* Time to make ElementTree =')
-
-    # Apply any temporary patches to the xml to allow correct code generation
-    # from it. These should be reviewed and removed when the xml is fixed upstream.
-    start_timer(args.time)
-    # There are no current patches needed, but here is an example of how to patch the XML
-    # after parsing to add a missing single attribute:
-    # Workaround 1.3.264 VkFrameBoundaryEXT.pTag lacking len field:
-    # <https://github.com/KhronosGroup/Vulkan-Docs/pull/2240>
-    # if ptag_member := tree.find('types/type[@name="VkFrameBoundaryEXT"]/member[name="pTag"]'):
-    #    ptag_member.set('len', 'tagSize')
-    end_timer(args.time, '* Time to patch ElementTree =')
-
-    # Extend the vk.xml tree with XML files from the config dir
-    for filename in os.listdir(args.configs):
-        if filename.endswith('.xml'):
-            extend_xml(tree, os.path.join(args.configs, filename))
-
-    start_timer(args.time)
-    reg.loadElementTree(tree)
-    end_timer(args.time, '* Time to parse ElementTree =')
+    reg = load_registry(gen, options, args)
 
     if (args.validate):
         reg.validateGroups()
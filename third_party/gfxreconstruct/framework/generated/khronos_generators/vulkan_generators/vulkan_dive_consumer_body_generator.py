@@ -92,6 +92,14 @@ class VulkanExportDiveConsumerBodyGenerator(VulkanBaseGenerator, KhronosExportDi
             "vkBeginCommandBuffer",
             "vkEndCommandBuffer"
             }
+
+        # Commands whose pointer and struct args are used to build the command hierarchy, so they
+        # are never deferred
+        self.neverDeferArgs = {
+            'vkCmdBeginDebugUtilsLabelEXT',
+            'vkCmdSetScissor',
+            'vkCmdSetViewport',
+        }
     def endFile(self):
         """Method override."""
         # TODO: Each code generator is passed a blacklist like framework\generated\vulkan_generators\blacklists.json
@@ -115,6 +123,13 @@ class VulkanExportDiveConsumerBodyGenerator(VulkanBaseGenerator, KhronosExportDi
         """Method override"""
         return command in self.customImplementationRequired
 
+    def may_defer_args(self, command):
+        """Method override"""
+        return (
+            KhronosExportDiveConsumerBodyGenerator.may_defer_args(self, command)
+            and command not in self.neverDeferArgs
+        )
+
     def decode_as_handle(self, value):
         """Method override
         Indicates that the given type should be decoded as a handle."""
@@ -134,8 +149,8 @@ class VulkanExportDiveConsumerBodyGenerator(VulkanBaseGenerator, KhronosExportDi
         body = ''
         body += KhronosExportDiveConsumerBodyGenerator.make_consumer_func_body(self, return_type, name, values)
         if KhronosExportDiveConsumerBodyGenerator.is_command_buffer_cmd(self, name):
-            body += f'    util::DiveFunctionData function_data("{name}", UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, args);\n'
+            body += f'    util::DiveFunctionData function_data(kDiveSchema_{name}, UpdateAndGetCommandBufferRecordIndex(commandBuffer), call_info.index, dive_args);\n'
         elif name in self.queueSubmit:
             # cmd_buffer_index is 0. The submit index is determined when processing the submits on the Dive side of things.
-            body += f'    util::DiveFunctionData function_data("{name}", 0, call_info.index, args);\n'
+            body += f'    util::DiveFunctionData function_data(kDiveSchema_{name}, 0, call_info.index, dive_args);\n'
         return body
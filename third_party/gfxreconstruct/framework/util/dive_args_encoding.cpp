@@ -0,0 +1,184 @@
+/*
+ Copyright 2026 Google LLC
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+ http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#include "util/dive_args_encoding.h"
+
+#include <algorithm>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+
+nlohmann::ordered_json& DiveArgsEncoder::BeginJson()
+{
+    m_json = nullptr;
+    return m_json;
+}
+
+void DiveArgsEncoder::EndJson()
+{
+    if (m_defer_json)
+    {
+        Write(kDeferredJsonSize);
+        return;
+    }
+
+    // Reserve the size prefix and patch it once the CBOR has been appended
+    const size_t size_offset = m_data.size();
+    m_data.resize(size_offset + sizeof(uint32_t));
+    nlohmann::ordered_json::to_cbor(m_json, m_data);
+
+    const uint32_t cbor_size = static_cast<uint32_t>(m_data.size() - size_offset - sizeof(uint32_t));
+    std::memcpy(m_data.data() + size_offset, &cbor_size, sizeof(cbor_size));
+}
+
+DiveEncodedArgs::DiveEncodedArgs(const DiveCommandSchema* schema, const uint8_t* data, size_t size) :
+    m_schema(schema), m_data(data), m_size(size)
+{}
+
+size_t DiveEncodedArgs::EncodedSize(const DiveArgSchema& arg, const uint8_t* data)
+{
+    if (arg.size != 0)
+    {
+        return arg.size;
+    }
+    const uint32_t cbor_size = ReadDiveArg<uint32_t>(data);
+    return sizeof(uint32_t) + (cbor_size == kDeferredJsonSize ? 0 : cbor_size);
+}
+
+void DiveEncodedArgs::DecodeArg(const DiveArgSchema&    arg,
+                                const uint8_t*          data,
+                                const JsonOptions&      options,
+                                nlohmann::ordered_json& jdata)
+{
+    if (arg.to_json != nullptr)
+    {
+        arg.to_json(jdata, data, options);
+    }
+    else if (const uint32_t cbor_size = ReadDiveArg<uint32_t>(data); cbor_size != kDeferredJsonSize)
+    {
+        const uint8_t* cbor = data + sizeof(uint32_t);
+        jdata               = nlohmann::ordered_json::from_cbor(cbor, cbor + cbor_size);
+    }
+}
+
+nlohmann::ordered_json DiveEncodedArgs::ToJson(const JsonOptions& options) const
+{
+    nlohmann::ordered_json args;
+    if (m_schema == nullptr)
+    {
+        return args;
+    }
+
+    const uint8_t* data = m_data;
+    const uint8_t* end  = m_data + m_size;
+    for (size_t i = 0; i < m_schema->arg_count && data < end; ++i)
+    {
+        const DiveArgSchema& arg = m_schema->args[i];
+        if (arg.to_json != nullptr || ReadDiveArg<uint32_t>(data) != kDeferredJsonSize)
+        {
+            DecodeArg(arg, data, options, args[arg.name]);
+        }
+        data += EncodedSize(arg, data);
+    }
+    return args;
+}
+
+nlohmann::ordered_json DiveEncodedArgs::ArgToJson(std::string_view name, const JsonOptions& options) const
+{
+    nlohmann::ordered_json jdata;
+    const DiveArgSchema*   arg  = nullptr;
+    const uint8_t*         data = FindArg(name, &arg);
+    if (data != nullptr)
+    {
+        DecodeArg(*arg, data, options, jdata);
+    }
+    return jdata;
+}
+
+bool DiveEncodedArgs::HasDeferredArgs() const
+{
+    if (m_schema == nullptr)
+    {
+        return false;
+    }
+
+    const uint8_t* data = m_data;
+    const uint8_t* end  = m_data + m_size;
+    for (size_t i = 0; i < m_schema->arg_count && data < end; ++i)
+    {
+        const DiveArgSchema& arg = m_schema->args[i];
+        if (arg.to_json == nullptr && ReadDiveArg<uint32_t>(data) == kDeferredJsonSize)
+        {
+            return true;
+        }
+        data += EncodedSize(arg, data);
+    }
+    return false;
+}
+
+const uint8_t* DiveEncodedArgs::FindArg(std::string_view name, const DiveArgSchema** arg_schema) const
+{
+    if (m_schema == nullptr)
+    {
+        return nullptr;
+    }
+
+    const uint8_t* data = m_data;
+    const uint8_t* end  = m_data + m_size;
+    for (size_t i = 0; i < m_schema->arg_count && data < end; ++i)
+    {
+        const DiveArgSchema& arg = m_schema->args[i];
+        if (name == arg.name)
+        {
+            *arg_schema = &arg;
+            return data;
+        }
+        data += EncodedSize(arg, data);
+    }
+    return nullptr;
+}
+
+const uint8_t* DiveEncodedArgs::FindScalar(std::string_view name, uint32_t* size) const
+{
+    const DiveArgSchema* arg  = nullptr;
+    const uint8_t*       data = FindArg(name, &arg);
+    if (data == nullptr || arg->to_json == nullptr)
+    {
+        return nullptr;
+    }
+    *size = arg->size;
+    return data;
+}
+
+const uint8_t* DiveArgsArena::Store(const uint8_t* data, size_t size)
+{
+    if (m_chunks.empty() || (m_chunk_capacity - m_chunk_used) < size)
+    {
+        // Anything larger than a chunk gets a chunk of its own
+        m_chunk_capacity = std::max(m_chunk_size, size);
+        m_chunk_used     = 0;
+        m_chunks.push_back(std::unique_ptr<uint8_t[]>(new uint8_t[m_chunk_capacity]));
+    }
+
+    uint8_t* stored = m_chunks.back().get() + m_chunk_used;
+    if (size > 0)
+    {
+        std::memcpy(stored, data, size);
+    }
+    m_chunk_used += size;
+    m_stored_size += size;
+    return stored;
+}
+
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
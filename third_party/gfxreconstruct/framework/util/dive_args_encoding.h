@@ -0,0 +1,199 @@
+/*
+ Copyright 2026 Google LLC
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+ http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+*/
+
+#ifndef DIVE_ARGS_ENCODING_H
+#define DIVE_ARGS_ENCODING_H
+
+#include "util/defines.h"
+#include "util/json_util.h"
+#include "../../external/nlohmann-json/include/nlohmann/json.hpp"
+
+#include <cstdint>
+#include <cstring>
+#include <iterator>
+#include <memory>
+#include <string_view>
+#include <type_traits>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+
+// Compact encoding of the arguments of a vulkan command for the VulkanExportDiveConsumer.
+//
+// Building an nlohmann::ordered_json object for every command of a capture dominates the cost of
+// loading a capture in Dive, while only the few commands selected in the UI ever need it. The
+// generated consumer instead writes each argument into a flat byte buffer described by a static,
+// per command DiveCommandSchema:
+//  - Scalar arguments (handles, enums, flags, integers, floats) are stored as their raw bytes.
+//  - Pointer and struct arguments are converted to JSON as before and stored as CBOR, prefixed by
+//    their 32 bit size. When the consumer defers them, only a kDeferredJsonSize marker is stored and
+//    the argument has to be decoded again from the capture file when it is needed.
+// The schema knows how to turn each argument back into the JSON the consumer used to produce, so
+// the JSON for a command is only built when it is requested.
+
+// Converts the raw bytes of a scalar argument to JSON
+using DiveArgToJson = void (*)(nlohmann::ordered_json& jdata, const uint8_t* data, const JsonOptions& options);
+
+// Size prefix of a pointer or struct argument that was not encoded
+constexpr uint32_t kDeferredJsonSize = UINT32_MAX;
+
+struct DiveArgSchema
+{
+    const char* name;
+    // Size in bytes of a scalar argument, or 0 for an argument stored as CBOR
+    uint32_t size;
+    // Conversion of a scalar argument to JSON, or nullptr for an argument stored as CBOR
+    DiveArgToJson to_json;
+};
+
+struct DiveCommandSchema
+{
+    const char*          name;
+    format::ApiCallId    call_id;
+    const DiveArgSchema* args;
+    size_t               arg_count;
+};
+
+// Reads a scalar argument from its (possibly unaligned) encoded bytes
+template <typename T>
+T ReadDiveArg(const uint8_t* data)
+{
+    static_assert(std::is_trivially_copyable_v<T>, "Only scalar arguments are stored as raw bytes");
+    T value;
+    std::memcpy(&value, data, sizeof(T));
+    return value;
+}
+
+// Writes the arguments of one command. The consumer owns a single encoder and resets it for every
+// command, so encoding does not allocate once the buffers have grown to the largest command.
+class DiveArgsEncoder
+{
+  public:
+    // Empties the encoder for the next command. If defer_json is set, the pointer and struct arguments
+    // of the command are not encoded.
+    void Reset(bool defer_json = false)
+    {
+        m_data.clear();
+        m_defer_json = defer_json;
+    }
+
+    // Whether the next pointer or struct argument should be skipped rather than converted to JSON
+    bool DeferJson() const { return m_defer_json; }
+
+    template <typename T>
+    void Write(const T& value)
+    {
+        static_assert(std::is_trivially_copyable_v<T>, "Only scalar arguments are stored as raw bytes");
+        const size_t offset = m_data.size();
+        m_data.resize(offset + sizeof(T));
+        std::memcpy(m_data.data() + offset, &value, sizeof(T));
+    }
+
+    // Returns an empty JSON value to convert the next pointer or struct argument into. The argument
+    // is encoded by the following call to EndJson, or only marked as deferred if DeferJson() is set.
+    nlohmann::ordered_json& BeginJson();
+    void                    EndJson();
+
+    const uint8_t* GetData() const { return m_data.data(); }
+    size_t         GetSize() const { return m_data.size(); }
+
+  private:
+    std::vector<uint8_t>   m_data;
+    nlohmann::ordered_json m_json;
+    bool                   m_defer_json = false;
+};
+
+// Non-owning view of the encoded arguments of one command
+class DiveEncodedArgs
+{
+  public:
+    DiveEncodedArgs() = default;
+    DiveEncodedArgs(const DiveCommandSchema* schema, const uint8_t* data, size_t size);
+
+    bool                     IsValid() const { return m_schema != nullptr; }
+    const DiveCommandSchema* GetSchema() const { return m_schema; }
+    const uint8_t*           GetData() const { return m_data; }
+    size_t                   GetSize() const { return m_size; }
+
+    // Decodes all the arguments into the same JSON object the consumer used to build eagerly. Deferred
+    // arguments are left out.
+    nlohmann::ordered_json ToJson(const JsonOptions& options = JsonOptions()) const;
+
+    // Decodes only the named argument, or returns null if the command has no argument of that name or
+    // the argument was deferred
+    nlohmann::ordered_json ArgToJson(std::string_view name, const JsonOptions& options = JsonOptions()) const;
+
+    // Whether some pointer or struct arguments were deferred rather than encoded
+    bool HasDeferredArgs() const;
+
+    // Returns the encoded bytes of the named scalar argument and sets size to their number, or
+    // returns nullptr if the command has no scalar argument of that name
+    const uint8_t* FindScalar(std::string_view name, uint32_t* size) const;
+
+    template <typename T>
+    bool GetScalar(std::string_view name, T* value) const
+    {
+        uint32_t       size = 0;
+        const uint8_t* data = FindScalar(name, &size);
+        if (data == nullptr || size != sizeof(T))
+        {
+            return false;
+        }
+        *value = ReadDiveArg<T>(data);
+        return true;
+    }
+
+  private:
+    // Returns the number of bytes used by the argument at data
+    static size_t EncodedSize(const DiveArgSchema& arg, const uint8_t* data);
+
+    // Returns the encoded bytes of the named argument and its schema, or nullptr if the command has
+    // no argument of that name
+    const uint8_t* FindArg(std::string_view name, const DiveArgSchema** arg_schema) const;
+
+    static void
+    DecodeArg(const DiveArgSchema& arg, const uint8_t* data, const JsonOptions& options, nlohmann::ordered_json& jdata);
+
+    const DiveCommandSchema* m_schema = nullptr;
+    const uint8_t*           m_data   = nullptr;
+    size_t                   m_size   = 0;
+};
+
+// Append-only storage for the encoded arguments of all the commands of a capture. Data is kept in
+// large chunks that are never reallocated, so stored pointers stay valid for the lifetime of the
+// arena, including after it has been moved.
+class DiveArgsArena
+{
+  public:
+    static constexpr size_t kDefaultChunkSize = 1 << 20;
+
+    explicit DiveArgsArena(size_t chunk_size = kDefaultChunkSize) : m_chunk_size(chunk_size) {}
+
+    // Copies size bytes of data into the arena and returns the stored copy
+    const uint8_t* Store(const uint8_t* data, size_t size);
+
+    // Total number of bytes stored
+    size_t GetStoredSize() const { return m_stored_size; }
+
+  private:
+    std::vector<std::unique_ptr<uint8_t[]>> m_chunks;
+    size_t                                  m_chunk_size;
+    size_t                                  m_chunk_used     = 0;
+    size_t                                  m_chunk_capacity = 0;
+    size_t                                  m_stored_size    = 0;
+};
+
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
+#endif // DIVE_ARGS_ENCODING_H
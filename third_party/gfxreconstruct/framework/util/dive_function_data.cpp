@@ -18,6 +18,8 @@ GFXRECON_BEGIN_NAMESPACE(util)
 
 DiveFunctionData::DiveFunctionData(const std::string& name, uint32_t cmd_buffer_index, uint64_t block_index, const nlohmann::ordered_json& args) : m_name(name), m_cmd_buffer_index(cmd_buffer_index), m_block_index(block_index), m_args(args){}
 
+DiveFunctionData::DiveFunctionData(const DiveCommandSchema& schema, uint32_t cmd_buffer_index, uint64_t block_index, const DiveArgsEncoder& args) : m_name(schema.name), m_cmd_buffer_index(cmd_buffer_index), m_block_index(block_index), m_encoded_args(&schema, args.GetData(), args.GetSize()){}
+
 const std::string& DiveFunctionData::GetFunctionName() const {
     return m_name;
 }
@@ -27,9 +29,32 @@ uint32_t DiveFunctionData::GetCmdBufferIndex() const {
 uint64_t DiveFunctionData::GetBlockIndex() const{
     return m_block_index;
 }
+format::ApiCallId DiveFunctionData::GetCallId() const{
+    return m_encoded_args.IsValid() ? m_encoded_args.GetSchema()->call_id : format::ApiCallId::ApiCall_Unknown;
+}
 const nlohmann::ordered_json DiveFunctionData::GetArgs() const {
+    if (m_encoded_args.IsValid()) {
+        return m_encoded_args.ToJson();
+    }
     return m_args;
 }
+bool DiveFunctionData::HasEncodedArgs() const {
+    return m_encoded_args.IsValid();
+}
+const DiveEncodedArgs& DiveFunctionData::GetEncodedArgs() const {
+    return m_encoded_args;
+}
+bool DiveFunctionData::GetUInt64Arg(std::string_view name, uint64_t* value) const {
+    if (m_encoded_args.IsValid()) {
+        return m_encoded_args.GetScalar(name, value);
+    }
+    auto it = m_args.find(name);
+    if (it == m_args.end() || !it->is_number_integer()) {
+        return false;
+    }
+    *value = it->get<uint64_t>();
+    return true;
+}
 
 GFXRECON_END_NAMESPACE(util)
 GFXRECON_END_NAMESPACE(gfxrecon)
@@ -15,27 +15,40 @@
 #define DIVE_FUNCTION_DATA_H
 
 #include "util/defines.h"
+#include "util/dive_args_encoding.h"
 #include "../../external/nlohmann-json/include/nlohmann/json.hpp"
 #include <cstdint>
 #include <string>
+#include <string_view>
 
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(util)
 
 // The DiveFunctionData is used by the VulkanExportDiveConsumer to store the name, command buffer index, block index, and args for
-// a vulkan command.
+// a vulkan command. The args are either a JSON object or, for the generated consumer, the compact
+// encoding described in dive_args_encoding.h. Encoded args are only referenced, so they must be
+// copied by the AnnotationHandler if they are needed after WriteBlockEnd returns.
 class DiveFunctionData
 {
   public:
     DiveFunctionData(const std::string& name, uint32_t cmd_buffer_index, uint64_t block_index, const nlohmann::ordered_json& args);
+    DiveFunctionData(const DiveCommandSchema& schema, uint32_t cmd_buffer_index, uint64_t block_index, const DiveArgsEncoder& args);
 
     const std::string& GetFunctionName() const;
     uint32_t GetCmdBufferIndex() const;
     uint64_t GetBlockIndex() const;
+    // Returns the id of the command, or ApiCall_Unknown if its args are not encoded
+    format::ApiCallId GetCallId() const;
+    // Returns the args as JSON, decoding them if they are encoded
     const nlohmann::ordered_json GetArgs() const;
+    bool HasEncodedArgs() const;
+    const DiveEncodedArgs& GetEncodedArgs() const;
+    // Reads a handle or other 64 bit scalar argument without building the JSON for the args
+    bool GetUInt64Arg(std::string_view name, uint64_t* value) const;
 private:
     nlohmann::ordered_json m_args;
+    DiveEncodedArgs m_encoded_args;
     uint64_t m_block_index;
     std::string m_name;
     uint32_t m_cmd_buffer_index;
@@ -83,8 +83,9 @@ const uint32_t kImageBpp    = 4;  // Expecting 4 bytes per pixel for 32-bit BGRA
 const uint16_t kBmpBitCountNoAlpha = 24; // Expecting 24-bit BGR bitmap data.
 const uint32_t kImageBppNoAlpha    = 3;  // Expecting 3 bytes per pixel for 32-bit BGRA bitmap data; alpha removed.
 
-static size_t               temporary_buffer_size = 0;
-static std::vector<uint8_t> temporary_buffer;
+// GOOGLE: [dump-resources-threads] Per thread, so that images can be written from several threads at once
+static thread_local size_t               temporary_buffer_size = 0;
+static thread_local std::vector<uint8_t> temporary_buffer;
 
 #define CheckFwriteRetVal(_val_, _file_)                                                              \
     {                                                                                                 \
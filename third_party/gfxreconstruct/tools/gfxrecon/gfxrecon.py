@@ -28,12 +28,21 @@
 #     gfxrecon.py [capture|compress|convert|extract|info|optimize|replay] [<args>]
 #
 #         args is a command-specific argument list
+#
+#     gfxrecon.py batch [<options>] [compress|convert|extract|info|optimize] <file>... [-- <args>]
+#
+#         Runs the command once per capture file, see CreateBatchParser
 
 import argparse
+import concurrent.futures
+import functools
+import glob
+import json
 import os
 import sys
 import subprocess
 import platform
+import time
 
 if sys.version_info < (3, 7):
     print("Error: Python 3.7 or later is required; you're using:", sys.version)
@@ -57,6 +66,16 @@ deprecated_commands = [
     'capture'  # alias for `capture-vulkan`
 ]
 
+# GOOGLE: [batch] Commands that process a single capture file and can be run by the batch command
+batch_command = 'batch'
+batch_commands = [
+    'compress',
+    'convert',
+    'extract',
+    'info',
+    'optimize'
+]
+
 def IsWindows():
    return (sys.platform == 'win32' or sys.platform == 'cygwin')
 
@@ -77,7 +96,10 @@ def IsWindows():
 #
 # If an executable/python script is not found, or a python interpreter for a python script is
 # not found, prints an error message and exits.
+#
+# GOOGLE: [batch] The search is only done once per command. The returned list must not be modified.
 
+@functools.lru_cache(maxsize=None)
 def GetExecutable(cmd):
 
     def IsExe(fpath):
@@ -138,14 +160,161 @@ def CreateCommandParser():
     parser = argparse.ArgumentParser(description='GFXReconstruct utility launcher.')
     parser.add_argument(
         'command',
-        choices=(valid_commands + deprecated_commands),
+        choices=(valid_commands + deprecated_commands + [batch_command]),
         type=str.lower,
         metavar='command',
         help='Command to execute. Valid options are [{}]'.format(
-            ', '.join(valid_commands)))
+            ', '.join(valid_commands + [batch_command])))
     parser.add_argument('args', nargs=argparse.REMAINDER, help='Command-specific argument list. Specify -h after command name for command help.')
     return parser
 
+# GOOGLE: [batch] Run a command over many capture files
+def CreateBatchParser():
+    parser = argparse.ArgumentParser(
+        prog=os.path.basename(__file__) + ' ' + batch_command,
+        description='Run a gfxrecon command once for each capture file, with up to JOBS commands '
+        'running at the same time. The result of each command is written to stdout as a line of '
+        'JSON as soon as it completes, in completion order.',
+        epilog='The command-specific arguments follow "--". The placeholders {file} (the capture '
+        'file), {stem} (the capture file without its extension) and {name} (the capture file name '
+        'without its directory and extension) are replaced in each argument; if none of the '
+        'arguments contains {file}, the capture file is appended as the last argument. For example: '
+        '%(prog)s optimize "captures/*.gfxr" -- {file} {stem}.optimized.gfxr')
+    parser.add_argument(
+        'command',
+        choices=batch_commands,
+        type=str.lower,
+        metavar='command',
+        help='Command to execute. Valid options are [{}]'.format(', '.join(batch_commands)))
+    parser.add_argument(
+        'files',
+        nargs='*',
+        metavar='file',
+        help='Capture files or glob patterns (** matches any number of directories)')
+    parser.add_argument(
+        '-f', '--file-list',
+        metavar='LIST',
+        help='Read additional capture files from LIST, one per line, or from stdin if LIST is -')
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Maximum number of commands to run at the same time (default: %(default)s)')
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        metavar='SECONDS',
+        help='Stop commands that run longer than SECONDS and report them as failed')
+    parser.add_argument(
+        '--no-output',
+        action='store_true',
+        help='Do not capture the stdout and stderr of the commands in the results')
+    return parser
+
+def ExpandBatchFiles(patterns, file_list):
+    """Returns the capture files matching the patterns and listed in file_list, in order and without
+    duplicates. Patterns that match nothing are kept as is, so that the command reports them.
+    """
+    names = list(patterns)
+    if file_list == '-':
+        names += [line.strip() for line in sys.stdin]
+    elif file_list:
+        with open(file_list) as f:
+            names += [line.strip() for line in f]
+
+    files = []
+    seen = set()
+    for name in names:
+        if not name:
+            continue
+        matches = sorted(glob.glob(name, recursive=True)) if glob.has_magic(name) else [name]
+        for match in matches or [name]:
+            if match not in seen:
+                seen.add(match)
+                files.append(match)
+    return files
+
+def GetBatchArgs(args, file):
+    """Returns the command-specific arguments for one capture file"""
+    stem = os.path.splitext(file)[0]
+    placeholders = [('{file}', file), ('{stem}', stem), ('{name}', os.path.basename(stem))]
+    result = []
+    for arg in args:
+        for placeholder, value in placeholders:
+            arg = arg.replace(placeholder, value)
+        result.append(arg)
+    if not any('{file}' in arg for arg in args):
+        result.append(file)
+    return result
+
+def RunBatchJob(exe, args, file, timeout, capture_output):
+    cmd = exe + GetBatchArgs(args, file)
+    result = {'file': file, 'args': cmd}
+    start = time.monotonic()
+    try:
+        completed = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if capture_output else subprocess.DEVNULL,
+            stderr=subprocess.PIPE if capture_output else subprocess.DEVNULL,
+            timeout=timeout,
+            universal_newlines=True,
+            errors='replace')
+        result['returncode'] = completed.returncode
+        if capture_output:
+            result['stdout'] = completed.stdout
+            result['stderr'] = completed.stderr
+    except subprocess.TimeoutExpired:
+        result['returncode'] = None
+        result['error'] = 'timed out after {} seconds'.format(timeout)
+    except OSError as error:
+        result['returncode'] = None
+        result['error'] = str(error)
+    result['seconds'] = round(time.monotonic() - start, 3)
+    return result
+
+def RunBatch(argv):
+    """Runs the batch command with its arguments in argv and returns the exit code: 0 if the command
+    succeeded for every capture file, 1 otherwise.
+    """
+    if '--' in argv:
+        separator = argv.index('--')
+        batch_argv, args = argv[:separator], argv[separator + 1:]
+    else:
+        batch_argv, args = argv, []
+
+    parser = CreateBatchParser()
+    batch = parser.parse_intermixed_args(batch_argv)
+    if batch.jobs < 1:
+        parser.error('the number of jobs must be at least 1')
+
+    files = ExpandBatchFiles(batch.files, batch.file_list)
+    if not files:
+        parser.error('no capture files given')
+
+    # Resolve the executable once, not once per file
+    exe = GetExecutable(batch.command)
+
+    failed = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=batch.jobs) as executor:
+        # Subprocesses do the work, so threads are enough to keep all the workers busy
+        jobs = [
+            executor.submit(RunBatchJob, exe, args, file, batch.timeout, not batch.no_output)
+            for file in files
+        ]
+        try:
+            for job in concurrent.futures.as_completed(jobs):
+                result = job.result()
+                if result['returncode'] != 0:
+                    failed += 1
+                print(json.dumps(result), flush=True)
+        except KeyboardInterrupt:
+            for job in jobs:
+                job.cancel()
+            raise
+
+    return 0 if failed == 0 else 1
+
 if __name__ == '__main__':
 
     # We don't support running under Cygwin Python
@@ -164,6 +333,9 @@ if __name__ == '__main__':
         command.command = 'capture-vulkan'
 
     extras = sys.argv[2::]
+    if command.command == batch_command:
+        sys.exit(RunBatch(extras))
+
     cmd = GetExecutable(command.command)
     result = subprocess.run(cmd + extras)
     sys.exit(result.returncode)
@@ -312,6 +312,11 @@ static void ExtractVulkanDumpResourcesParameters(const nlohmann::ordered_json
             {
                 vulkan_replay_options.dump_resources_dump_build_AS_input_buffers = *vdr_option;
             }
+            else if (!util::platform::StringCompareNoCase(option_name.c_str(), gfxrecon::decode::kVDROptionDumpThreads))
+            {
+                // GOOGLE: [dump-resources-threads]
+                vulkan_replay_options.dump_resources_threads = *vdr_option;
+            }
             else
             {
                 GFXRECON_LOG_WARNING("Unrecognized VDR option detected in input json: %s", option_name.c_str())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+#
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: MIT
+
+'''Compares the throughput of the streaming and the token based trace parsers.
+
+The traces are decompressed into memory first, so that only the parsing and
+the construction of the calls is measured.
+
+Usage:
+    ./bench_parse.py [-r REPEAT] [--check] foo.gtrace [bar.gtrace.gz ...]
+'''
+
+
+import argparse
+import io
+import sys
+import time
+
+import format
+import model
+import parse
+
+
+def make_counting_parser(base):
+
+    class CountingParser(base):
+
+        def __init__(self, fp, options, state, calls=None):
+            base.__init__(self, fp, options, state)
+            self.num_calls = 0
+            self.calls = calls
+
+        def handle_call(self, call):
+            self.num_calls += 1
+            if self.calls is not None:
+                self.calls.append(call)
+
+    return CountingParser
+
+
+PARSERS = (
+    ('token', make_counting_parser(parse.TokenTraceParser)),
+    ('streaming', make_counting_parser(parse.TraceParser)),
+)
+
+
+def run_parser(klass, data, options, calls=None):
+    parser = klass(io.StringIO(data), options, model.TraceStateData(), calls)
+    start = time.perf_counter()
+    parser.parse()
+    return parser.num_calls, time.perf_counter() - start
+
+
+def format_calls(calls, options):
+    stream = io.StringIO()
+    printer = model.PrettyPrinter(format.Formatter(stream), options)
+    for call in calls:
+        call.visit(printer)
+    return stream.getvalue()
+
+
+def check_parsers(data, options):
+    '''Checks that all the parsers build the same calls.'''
+    outputs = []
+    for name, klass in PARSERS:
+        calls = []
+        run_parser(klass, data, options, calls)
+        outputs.append((name, format_calls(calls, options)))
+    ref_name, ref_output = outputs[0]
+    for name, output in outputs[1:]:
+        if output != ref_output:
+            print(f"  MISMATCH: {name} and {ref_name} parsers disagree")
+            return False
+    print("  all parsers agree")
+    return True
+
+
+def main():
+    optparser = argparse.ArgumentParser(
+        description="Benchmark the Gallium trace parsers")
+    optparser.add_argument("filename", action="extend", nargs="+",
+        type=str, metavar="filename", help="Gallium trace filename (plain or .gz, .bz2)")
+    optparser.add_argument("-r", "--repeat", type=int, default=1,
+        help="parse each trace this many times, and keep the best time")
+    optparser.add_argument("-c", "--check", action="store_true",
+        help="also check that the parsers produce the same calls")
+    args = optparser.parse_args()
+
+    options = parse.ParseOptions()
+    options.plain = True
+    options.named_ptrs = True
+
+    ok = True
+    for fname in args.filename:
+        with parse.open_trace(fname) as stream:
+            data = stream.read()
+        print(f"{fname}: {len(data) / (1024 * 1024):.1f} MiB")
+
+        results = {}
+        for name, klass in PARSERS:
+            num_calls, best = run_parser(klass, data, options)
+            for i in range(1, args.repeat):
+                best = min(best, run_parser(klass, data, options)[1])
+            results[name] = best
+            print(f"  {name:>9}: {num_calls} calls in {best:.2f} s, "
+                  f"{num_calls / best:.0f} calls/s, {len(data) / (1024 * 1024) / best:.1f} MiB/s")
+        print(f"  speedup: {results['token'] / results['streaming']:.2f}x")
+
+        if args.check:
+            ok = check_parsers(data, options) and ok
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -34,6 +34,9 @@ import binascii
 import re
 import copy
 import argparse
+import os
+import pickle
+from array import array
 
 import model
 import format
@@ -836,6 +839,169 @@ class Interpreter(parser.SimpleTraceDumper):
     def verbosity(self, level):
         return self.options.verbosity >= level
 
+    def max_draw_no(self):
+        draw_nos = [obj._draw_no for obj in self.objects.values() if isinstance(obj, Context)]
+        return max(draw_nos, default=0)
+
+    def save_checkpoint(self, fp):
+        '''Pickle the state of the interpretation so far.'''
+        pickler = CheckpointPickler(fp, self)
+        pickler.dump((self.objects, self.globl, self.state, self.last_call_no))
+
+    def load_checkpoint(self, fp):
+        '''Restore a state pickled by save_checkpoint().'''
+        unpickler = CheckpointUnpickler(fp, self)
+        self.objects, self.globl, self.state, self.last_call_no = unpickler.load()
+
+
+class CheckpointPickler(pickle.Pickler):
+    '''Pickler of the interpreter state, without the interpreter itself, which
+    the dispatchers refer to.'''
+
+    def __init__(self, fp, interpreter):
+        pickle.Pickler.__init__(self, fp, pickle.HIGHEST_PROTOCOL)
+        self.interpreter = interpreter
+
+    def persistent_id(self, obj):
+        if obj is self.interpreter:
+            return 'interpreter'
+        return None
+
+
+class CheckpointUnpickler(pickle.Unpickler):
+
+    def __init__(self, fp, interpreter):
+        pickle.Unpickler.__init__(self, fp)
+        self.interpreter = interpreter
+
+    def persistent_load(self, pid):
+        assert pid == 'interpreter'
+        return self.interpreter
+
+
+class IndexingInterpreter(Interpreter):
+    '''Interpreter that records the offset of every call and periodic
+    checkpoints of its state into a StateIndex.'''
+
+    def __init__(self, stream, options, formatter, state, index):
+        Interpreter.__init__(self, stream, options, formatter, state)
+        self.index = index
+
+    def handle_call(self, call):
+        Interpreter.handle_call(self, call)
+        self.index.add_call(self)
+
+
+class StateIndex:
+    '''Sidecar index of a trace, saved next to it as <trace>.stateindex.
+
+    Holds the byte offset of every call of the trace, and a checkpoint of the
+    interpreter state after every checkpoint_interval calls, so that the state
+    at a late call or draw can be dumped by resuming from the nearest
+    checkpoint, instead of interpreting the whole trace again.
+
+    The checkpoints are pickled one after the other, followed by the header
+    with the call offsets and the checkpoint table, and by the offset of the
+    header, so that only the checkpoint that is needed has to be loaded.
+    '''
+
+    VERSION = 1
+
+    def __init__(self, trace_filename):
+        self.trace_filename = trace_filename
+        self.filename = trace_filename + '.stateindex'
+        self.offsets = array('Q')
+        # (call index, call no, max draw no, offset, size) of each checkpoint
+        self.checkpoints = []
+        self.interval = None
+        self._fp = None
+
+    def _source(self):
+        stat = os.stat(self.trace_filename)
+        return stat.st_size, stat.st_mtime_ns
+
+    def load(self):
+        '''Load the header of the index, if it exists and matches the trace.'''
+        try:
+            with open(self.filename, 'rb') as fp:
+                fp.seek(-8, os.SEEK_END)
+                header_offset, = struct.unpack('<Q', fp.read(8))
+                fp.seek(header_offset)
+                header = pickle.load(fp)
+        except (OSError, EOFError, ValueError, struct.error, pickle.UnpicklingError):
+            return False
+        if header.get('version') != self.VERSION or header.get('source') != self._source():
+            return False
+        self.offsets = header['offsets']
+        self.checkpoints = header['checkpoints']
+        self.interval = header['interval']
+        return True
+
+    def build(self, options):
+        '''Interpret the whole trace once, recording the index.'''
+        sys.stderr.write('building %s ...\n' % self.filename)
+
+        # Don't dump nor print anything while building
+        build_options = copy.copy(options)
+        build_options.call = 0xffffffff
+        build_options.draw = 0xffffffff
+        build_options.verbosity = 0
+
+        self.interval = options.checkpoint_interval
+        self.offsets = array('Q')
+        self.checkpoints = []
+        source = self._source()
+        tmp_filename = self.filename + '.tmp'
+        try:
+            with open(tmp_filename, 'wb') as self._fp:
+                stream = parser.open_trace(self.trace_filename)
+                formatter = format.Formatter(sys.stderr)
+                interpreter = IndexingInterpreter(stream, build_options, formatter, model.TraceStateData(), self)
+                interpreter.parse()
+
+                header_offset = self._fp.tell()
+                pickle.dump({
+                    'version': self.VERSION,
+                    'source': source,
+                    'interval': self.interval,
+                    'offsets': self.offsets,
+                    'checkpoints': self.checkpoints,
+                }, self._fp, pickle.HIGHEST_PROTOCOL)
+                self._fp.write(struct.pack('<Q', header_offset))
+            os.replace(tmp_filename, self.filename)
+        finally:
+            self._fp = None
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+
+        sys.stderr.write('indexed %u calls, %u checkpoints\n' % (len(self.offsets), len(self.checkpoints)))
+
+    def add_call(self, interpreter):
+        self.offsets.append(interpreter.call_offset)
+        if len(self.offsets) % self.interval == 0:
+            offset = self._fp.tell()
+            interpreter.save_checkpoint(self._fp)
+            self.checkpoints.append((len(self.offsets) - 1, interpreter.last_call_no, interpreter.max_draw_no(),
+                                     offset, self._fp.tell() - offset))
+
+    def find_checkpoint(self, call_no, draw_no):
+        '''Latest checkpoint from which the state at the first draw with a call
+        number of at least call_no, or with a draw number of at least draw_no,
+        can still be reached.'''
+        best = None
+        for checkpoint in self.checkpoints:
+            index, last_call_no, max_draw_no, offset, size = checkpoint
+            if last_call_no >= call_no or max_draw_no >= draw_no:
+                break
+            best = checkpoint
+        return best
+
+    def load_checkpoint(self, checkpoint, interpreter):
+        index, last_call_no, max_draw_no, offset, size = checkpoint
+        with open(self.filename, 'rb') as fp:
+            fp.seek(offset)
+            interpreter.load_checkpoint(fp)
+
 
 class DumpStateOptions(parser.ParseOptions):
 
@@ -845,6 +1011,8 @@ class DumpStateOptions(parser.ParseOptions):
         self.verbosity = None
         self.call = None
         self.draw = None
+        self.index = False
+        self.checkpoint_interval = None
 
         parser.ParseOptions.__init__(self, args)
 
@@ -862,11 +1030,36 @@ class Main(parser.Main):
         optparser.add_argument("-q", "--quiet", action="store_const", const=0, dest="verbosity", help="no messages")
         optparser.add_argument("-c", "--call", action="store", type=int, dest="call", default=0xffffffff, help="dump on this call")
         optparser.add_argument("-d", "--draw", action="store", type=int, dest="draw", default=0xffffffff, help="dump on this draw")
+        optparser.add_argument("-i", "--index", action="store_true", dest="index", help="resume from the nearest state checkpoint of the <trace>.stateindex file, building it first if needed")
+        optparser.add_argument("-j", "--jobs", action="store", type=int, dest="jobs", default=1, metavar="N", help="process up to N traces in parallel, 0 for one per CPU (default: %(default)s)")
+        optparser.add_argument("--checkpoint-interval", action="store", type=int, dest="checkpoint_interval", default=10000, metavar="N", help="checkpoint the state every N calls when building the index (default: %(default)s)")
         return optparser
 
     def make_options(self, args):
         return DumpStateOptions(args)
 
+    def process_file(self, fname, options):
+        if not options.index:
+            parser.Main.process_file(self, fname, options)
+            return
+
+        index = StateIndex(fname)
+        if not index.load() or index.interval != options.checkpoint_interval:
+            index.build(options)
+
+        stream = parser.open_trace(fname, seekable=True)
+        formatter = format.Formatter(sys.stderr)
+        interpreter = Interpreter(stream, options, formatter, model.TraceStateData())
+        checkpoint = index.find_checkpoint(options.call, options.draw)
+        if checkpoint is not None:
+            call_index = checkpoint[0]
+            if call_index + 1 == len(index.offsets):
+                # No call after the checkpoint
+                return
+            index.load_checkpoint(checkpoint, interpreter)
+            interpreter.seek_call(index.offsets[call_index + 1])
+        interpreter.parse()
+
     def process_arg(self, stream, options):
         formatter = format.Formatter(sys.stderr)
         parser = Interpreter(stream, options, formatter, model.TraceStateData())
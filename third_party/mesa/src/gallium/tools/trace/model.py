@@ -65,6 +65,8 @@ class TraceStateData:
 
 
 class Node:
+
+    __slots__ = ()
     
     def visit(self, visitor):
         raise NotImplementedError
@@ -81,6 +83,8 @@ class Node:
 
 
 class Literal(Node):
+
+    __slots__ = ('value',)
     
     def __init__(self, value):
         self.value = value
@@ -93,6 +97,8 @@ class Literal(Node):
 
 
 class Blob(Node):
+
+    __slots__ = ('value',)
     
     def __init__(self, value):
         self.value = binascii.a2b_hex(value)
@@ -108,9 +114,11 @@ class Blob(Node):
 
 
 class NamedConstant(Node):
+
+    __slots__ = ('name',)
     
     def __init__(self, name):
-        self.name = name
+        self.name = sys.intern(name)
 
     def visit(self, visitor):
         visitor.visit_named_constant(self)
@@ -120,6 +128,8 @@ class NamedConstant(Node):
     
 
 class Array(Node):
+
+    __slots__ = ('elements',)
     
     def __init__(self, elements):
         self.elements = elements
@@ -135,9 +145,11 @@ class Array(Node):
 
 
 class Struct(Node):
+
+    __slots__ = ('name', 'members')
     
     def __init__(self, name, members):
-        self.name = name
+        self.name = sys.intern(name)
         self.members = members        
 
     def visit(self, visitor):
@@ -152,9 +164,13 @@ class Struct(Node):
 
 class Pointer(Node):
 
+    __slots__ = ('address', 'state')
+
     ptr_ignore_list = ["ret", "elem"]
 
     def __init__(self, state, address, pname):
+        # The same addresses come up again and again in a trace
+        address = sys.intern(address)
         self.address = address
         self.state = state
 
@@ -196,14 +212,17 @@ class Pointer(Node):
 
 
 class Call:
+
+    __slots__ = ('no', 'klass', 'method', 'args', 'ret', 'time', 'hashvalue', 'is_junk')
     
     def __init__(self, no, klass, method, args, ret, time):
         self.no = no
-        self.klass = klass
-        self.method = method
+        self.klass = sys.intern(klass) if klass is not None else None
+        self.method = sys.intern(method)
         self.args = args
         self.ret = ret
         self.time = time
+        self.is_junk = False
 
         # Calculate hashvalue "cached" into a variable
         self.hashvalue = hash(self.klass) ^ hash(self.method)
@@ -220,6 +239,35 @@ class Call:
         return self.hashvalue == other.hashvalue
 
 
+# Literals and named constants are never modified once parsed, so the ones
+# with the same value are shared between all the calls of a trace, up to a
+# limit so that a trace full of unique values does not grow the table forever.
+_shared_nodes = {}
+_max_shared_nodes = 64*1024
+
+
+def _shared_node(klass, value):
+    # Keyed on the type too, as 1 == True
+    key = (klass, type(value), value)
+    node = _shared_nodes.get(key)
+    if node is None:
+        node = klass(value)
+        if len(_shared_nodes) < _max_shared_nodes:
+            _shared_nodes[key] = node
+    return node
+
+
+def shared_literal(value):
+    # Floats are not shared, as 0.0 == -0.0
+    if isinstance(value, float):
+        return Literal(value)
+    return _shared_node(Literal, value)
+
+
+def shared_named_constant(name):
+    return _shared_node(NamedConstant, name)
+
+
 class Trace:
     
     def __init__(self, calls):
@@ -28,7 +28,12 @@
 
 
 import io
+import os
 import sys
+import queue
+import shutil
+import tempfile
+import threading
 import xml.parsers.expat as xpat
 import argparse
 
@@ -206,7 +211,12 @@ class XmlParser:
         return data
 
 
-class TraceParser(XmlParser):
+class TokenTraceParser(XmlParser):
+    """Token based trace parser.
+
+    This was the trace parser before the streaming TraceParser. It is kept
+    as a reference for bench_parse.py.
+    """
 
     def __init__(self, fp, options, state):
         XmlParser.__init__(self, fp)
@@ -372,6 +382,267 @@ class TraceParser(XmlParser):
         pass
     
     
+# Elements of the values, and the elements allowed inside of each element
+VALUE_ELEMENTS = frozenset(('null', 'bool', 'int', 'uint', 'float', 'string', 'enum', 'array', 'struct', 'ptr', 'bytes'))
+TRACE_CHILDREN = {
+    None: frozenset(('trace',)),
+    'trace': frozenset(('call',)),
+    'call': frozenset(('arg', 'ret', 'call', 'time')),
+    'arg': VALUE_ELEMENTS,
+    'ret': VALUE_ELEMENTS,
+    'time': VALUE_ELEMENTS,
+    'elem': VALUE_ELEMENTS,
+    'member': VALUE_ELEMENTS,
+    'array': frozenset(('elem',)),
+    'struct': frozenset(('member',)),
+}
+
+
+class TraceParser:
+    """Streaming trace parser.
+
+    Builds the model objects straight from the expat callbacks, without an
+    intermediate list of XML tokens, and passes each top level call to
+    handle_call() as soon as its end tag has been parsed. The byte offset of
+    that call in the trace is in call_offset, so that a later parse can
+    start from it with seek_call().
+    """
+
+    read_size = 4*1024*1024
+
+    def __init__(self, fp, options, state):
+        self.fp = fp
+        self.last_call_no = 0
+        self.state = state
+        self.options = options
+        self.call_offset = None
+
+        self._parser = xpat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.buffer_size = self.read_size
+        self._parser.StartElementHandler = self._handle_element_start
+        self._parser.EndElementHandler = self._handle_element_end
+        self._parser.CharacterDataHandler = self._handle_character_data
+
+        self._start_handlers = {
+            'trace': self._start_trace,
+            'call': self._start_call,
+            'arg': self._start_named,
+            'member': self._start_named,
+            'ret': self._start_ret,
+            'time': self._start_time,
+            'elem': self._start_elem,
+            'array': self._start_container,
+            'struct': self._start_struct,
+        }
+        for name in VALUE_ELEMENTS.difference(self._start_handlers):
+            self._start_handlers[name] = self._start_text
+        self._end_handlers = {
+            'trace': self._end_trace,
+            'call': self._end_call,
+            'arg': self._end_arg,
+            'member': self._end_member,
+            'ret': self._end_ret,
+            'time': self._end_time,
+            'elem': self._end_elem,
+            'array': self._end_array,
+            'struct': self._end_struct,
+            'null': self._end_null,
+            'bool': self._end_int,
+            'int': self._end_int,
+            'uint': self._end_int,
+            'float': self._end_float,
+            'enum': self._end_enum,
+            'string': self._end_string,
+            'bytes': self._end_bytes,
+            'ptr': self._end_ptr,
+        }
+
+        # Elements allowed inside of each open element
+        self._children = [TRACE_CHILDREN[None]]
+        # Values of the open calls, arrays, structs and value holders
+        self._values = []
+        # Pointer names, from the innermost arg, member, ret, time or elem
+        self._names = []
+        # [no, klass, method, ret, time] of the open calls
+        self._calls = []
+        self._struct_names = []
+        self._text = ''
+        self._trace_found = False
+        # Byte offset in the trace of the start of the data given to expat
+        self._offset_base = 0
+
+    def parse(self):
+        while self.parse_chunk():
+            pass
+
+    def seek_call(self, offset):
+        '''Makes the parse start at the top level call at the given byte
+        offset of the trace, as found in call_offset by an earlier parse.'''
+        assert not self._trace_found
+        self.fp.seek(offset)
+        prefix = '<trace>'
+        self._offset_base = offset - len(prefix)
+        self._parser.Parse(prefix, False)
+
+    def parse_chunk(self):
+        '''Parses the next read_size characters of the trace, calling
+        handle_call() for the calls completed by them. Returns False once the
+        whole trace has been parsed.'''
+        data = self.fp.read(self.read_size)
+        final = len(data) < self.read_size
+        data = data.rstrip('\0')
+        try:
+            self._parser.Parse(data, final)
+        except xpat.ExpatError as e:
+            #if e.code == xpat.errors.XML_ERROR_NO_ELEMENTS:
+            if e.code == 3:
+                pass
+            else:
+                raise e
+        if not final:
+            return True
+
+        # Like with the token based parser, a trace cut short between two
+        # calls is fine
+        if not self._trace_found:
+            raise TokenMismatch(XmlToken(ELEMENT_START, 'trace'), self._token(EOF, None))
+        if self._calls:
+            raise TokenMismatch(XmlToken(ELEMENT_END, 'call'), self._token(EOF, None))
+        return False
+
+    def _token(self, type, name_or_data):
+        return XmlToken(type, name_or_data, None, self._parser.CurrentLineNumber, self._parser.CurrentColumnNumber)
+
+    def _handle_element_start(self, name, attrs):
+        if name not in self._children[-1]:
+            expected = " or ".join(sorted(self._children[-1])) or "end of element"
+            raise TokenMismatch(expected, self._token(ELEMENT_START, name))
+        self._children.append(TRACE_CHILDREN.get(name, ()))
+        self._start_handlers[name](attrs)
+
+    def _handle_element_end(self, name):
+        self._children.pop()
+        self._end_handlers[name]()
+
+    def _handle_character_data(self, data):
+        self._text += data
+
+    def _start_trace(self, attrs):
+        self._trace_found = True
+
+    def _end_trace(self):
+        pass
+
+    def _start_call(self, attrs):
+        try:
+            no = int(attrs['no'])
+        except KeyError as e:
+            self.last_call_no += 1
+            no = self.last_call_no
+        else:
+            self.last_call_no = no
+        if not self._calls:
+            self.call_offset = self._offset_base + self._parser.CurrentByteIndex
+        self._calls.append([no, attrs['class'], attrs['method'], None, None])
+        self._values.append([])
+
+    def _end_call(self):
+        no, klass, method, ret, time = self._calls.pop()
+        args = tuple(self._values.pop())
+        call = Call(no, klass, method, args, ret, time)
+        # Nested function calls are ignored
+        if not self._calls:
+            call.is_junk = trace_call_ignore(call)
+            self.handle_call(call)
+
+    def _start_named(self, attrs):
+        self._names.append(sys.intern(attrs['name']))
+        self._values.append([])
+
+    def _end_arg(self):
+        value = self._pop_value('arg')
+        self._values[-1].append((self._names.pop(), value))
+
+    def _end_member(self):
+        value = self._pop_value('member')
+        self._values[-1].append((self._names.pop(), value))
+
+    def _start_ret(self, attrs):
+        self._names.append('ret')
+        self._values.append([])
+
+    def _end_ret(self):
+        self._names.pop()
+        self._calls[-1][3] = self._pop_value('ret')
+
+    def _start_time(self, attrs):
+        self._names.append('time')
+        self._values.append([])
+
+    def _end_time(self):
+        self._names.pop()
+        self._calls[-1][4] = self._pop_value('time')
+
+    def _start_elem(self, attrs):
+        self._names.append('elem')
+        self._values.append([])
+
+    def _end_elem(self):
+        self._names.pop()
+        value = self._pop_value('elem')
+        self._values[-1].append(value)
+
+    def _pop_value(self, name):
+        values = self._values.pop()
+        if len(values) != 1:
+            expected = " or ".join(sorted(VALUE_ELEMENTS))
+            raise TokenMismatch(expected, self._token(ELEMENT_END, name))
+        return values[0]
+
+    def _start_container(self, attrs):
+        self._values.append([])
+
+    def _end_array(self):
+        elems = tuple(self._values.pop())
+        self._values[-1].append(Array(elems))
+
+    def _start_struct(self, attrs):
+        self._struct_names.append(attrs['name'])
+        self._values.append([])
+
+    def _end_struct(self):
+        members = tuple(self._values.pop())
+        self._values[-1].append(Struct(self._struct_names.pop(), members))
+
+    def _start_text(self, attrs):
+        self._text = ''
+
+    def _end_null(self):
+        self._values[-1].append(shared_literal(None))
+
+    def _end_int(self):
+        self._values[-1].append(shared_literal(int(self._text)))
+
+    def _end_float(self):
+        self._values[-1].append(Literal(float(self._text)))
+
+    def _end_enum(self):
+        self._values[-1].append(shared_named_constant(self._text.strip()))
+
+    def _end_string(self):
+        self._values[-1].append(shared_literal(self._text.strip()))
+
+    def _end_bytes(self):
+        self._values[-1].append(Blob(self._text.strip()))
+
+    def _end_ptr(self):
+        self._values[-1].append(Pointer(self.state, self._text.strip(), self._names[-1]))
+
+    def handle_call(self, call):
+        pass
+
+
 class SimpleTraceDumper(TraceParser):
     
     def __init__(self, fp, options, formatter, state):
@@ -413,6 +684,120 @@ class ParseOptions(ModelOptions):
         ModelOptions.__init__(self, args)
 
 
+def cpu_count():
+    '''Number of CPUs this process can run on.'''
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class ThreadedReader(io.RawIOBase):
+    '''Reads a file on a separate thread, into a bounded queue of blocks.
+
+    zlib and bz2 release the GIL while decompressing, so this lets a
+    compressed trace be decompressed while the previous blocks are parsed.
+    '''
+
+    block_size = 1024*1024
+    max_blocks = 16
+
+    def __init__(self, fp):
+        io.RawIOBase.__init__(self)
+        self._fp = fp
+        self._queue = queue.Queue(self.max_blocks)
+        self._block = memoryview(b'')
+        self._eof = False
+        self._stop = False
+        self._thread = threading.Thread(target=self._read_blocks, daemon=True)
+        self._thread.start()
+
+    def _read_blocks(self):
+        try:
+            while not self._stop:
+                block = self._fp.read(self.block_size)
+                self._put(block)
+                if not block:
+                    break
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item):
+        while not self._stop:
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._block:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._block = memoryview(item)
+        size = min(len(b), len(self._block))
+        b[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._stop = True
+            self._thread.join()
+            self._fp.close()
+        io.RawIOBase.close(self)
+
+
+def open_trace(fname, seekable=False):
+    '''Opens a plain, .gz or .bz2 trace as a text stream.
+
+    Compressed traces are decompressed on a separate thread, unless the
+    stream needs to be seekable or there is no other CPU to run it on.'''
+    if fname.endswith('.gz'):
+        from gzip import GzipFile
+        fp = GzipFile(fname, 'rb')
+    elif fname.endswith('.bz2'):
+        from bz2 import BZ2File
+        fp = BZ2File(fname, 'rb')
+    else:
+        return open(fname, 'rt')
+
+    if not seekable and cpu_count() > 1:
+        fp = io.BufferedReader(ThreadedReader(fp), ThreadedReader.block_size)
+    return io.TextIOWrapper(fp)
+
+
+def process_file_job(main, fname, options, output_fname):
+    '''Processes one trace in a worker process of Main, with the standard
+    output going to output_fname. Returns the exit status.'''
+    status = 0
+    with open(output_fname, 'wt') as output:
+        sys.stdout = output
+        try:
+            main.process_file(fname, options)
+        except SystemExit as e:
+            if e.code is None:
+                status = 0
+            elif isinstance(e.code, int):
+                status = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                status = 1
+        finally:
+            sys.stdout.flush()
+            sys.stdout = sys.__stdout__
+    return status
+
+
 class Main:
     '''Common main class for all retrace command line utilities.''' 
 
@@ -424,21 +809,50 @@ class Main:
         args = optparser.parse_args()
         options = self.make_options(args)
 
+        jobs = args.jobs if args.jobs > 0 else cpu_count()
+        if jobs > 1 and len(args.filename) > 1:
+            sys.exit(self.process_files(args.filename, options, jobs))
+
         for fname in args.filename:
-            try:
-                if fname.endswith('.gz'):
-                    from gzip import GzipFile
-                    stream = io.TextIOWrapper(GzipFile(fname, 'rb'))
-                elif fname.endswith('.bz2'):
-                    from bz2 import BZ2File
-                    stream = io.TextIOWrapper(BZ2File(fname, 'rb'))
-                else:
-                    stream = open(fname, 'rt')
-            except Exception as e:
-                print("ERROR: {}".format(str(e)))
-                sys.exit(1)
+            self.process_file(fname, options)
+
+    def process_files(self, fnames, options, jobs):
+        '''Processes the traces in a pool of worker processes, and writes their
+        outputs in the order of the traces. Returns the exit status.'''
+        from concurrent.futures import ProcessPoolExecutor
+
+        status = 0
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             ProcessPoolExecutor(min(jobs, len(fnames))) as executor:
+            futures = []
+            for i, fname in enumerate(fnames):
+                output_fname = os.path.join(tmpdir, '{}.out'.format(i))
+                future = executor.submit(process_file_job, self, fname, options, output_fname)
+                futures.append((fname, output_fname, future))
+
+            for fname, output_fname, future in futures:
+                try:
+                    file_status = future.result()
+                except Exception as e:
+                    print("ERROR: {}: {}".format(fname, str(e)), file=sys.stderr)
+                    file_status = 1
+                if os.path.exists(output_fname):
+                    with open(output_fname, 'rt') as output:
+                        shutil.copyfileobj(output, sys.stdout)
+                    sys.stdout.flush()
+                    os.remove(output_fname)
+                status = status or file_status
+
+        return status
+
+    def process_file(self, fname, options):
+        try:
+            stream = open_trace(fname)
+        except Exception as e:
+            print("ERROR: {}".format(str(e)))
+            sys.exit(1)
 
-            self.process_arg(stream, options)
+        self.process_arg(stream, options)
 
     def make_options(self, args):
         return ParseOptions(args)
@@ -476,6 +890,10 @@ class Main:
             action="store_const", const=True, default=False,
             dest="ignore_junk", help="filter out/ignore junk calls (see below)")
 
+        optparser.add_argument("-j", "--jobs",
+            action="store", type=int, default=1, metavar="N",
+            dest="jobs", help="process up to N traces in parallel, 0 for one per CPU (default: %(default)s)")
+
         return optparser
 
     def process_arg(self, stream, options):
@@ -34,6 +34,9 @@ import functools
 import argparse
 import difflib
 import subprocess
+import bisect
+import collections
+from array import array
 
 assert sys.version_info >= (3, 6), 'Python >= 3.6 required'
 
@@ -110,11 +113,34 @@ class PKKArgumentParser(argparse.ArgumentParser):
 class PKKTraceParser(TraceParser):
     def __init__(self, stream, options, state):
         TraceParser.__init__(self, stream, options, state)
-        self.call_stack = []
+        self.call_stack = collections.deque()
 
     def handle_call(self, call):
         self.call_stack.append(call)
 
+    def calls(self):
+        # Only the calls of one chunk of the trace are kept in memory
+        more = True
+        while True:
+            while self.call_stack:
+                yield self.call_stack.popleft()
+            if not more:
+                return
+            more = self.parse_chunk()
+
+
+class PKKTraceHasher(TraceParser):
+    def __init__(self, stream, options, state, junk):
+        TraceParser.__init__(self, stream, options, state)
+        self.hashes = array("q")
+        self.junk = junk
+
+    def handle_call(self, call):
+        value = hash(call)
+        self.hashes.append(value)
+        if call.is_junk:
+            self.junk.add(value)
+
 
 class PKKPrettyPrinter(PrettyPrinter):
     def __init__(self, options):
@@ -229,25 +255,178 @@ class PKKPrettyPrinter(PrettyPrinter):
             node.time.visit(self)
 
 
-def pkk_parse_trace(filename, options, state):
-    pkk_info(f"Parsing {filename} ...")
+def pkk_open_trace(filename):
     try:
-        if filename.endswith(".gz"):
-            from gzip import GzipFile
-            stream = io.TextIOWrapper(GzipFile(filename, "rb"))
-        elif filename.endswith(".bz2"):
-            from bz2 import BZ2File
-            stream = io.TextIOWrapper(BZ2File(filename, "rb"))
-        else:
-            stream = open(filename, "rt")
-
+        return open_trace(filename)
     except OSError as e:
         pkk_fatal(str(e))
 
-    parser = PKKTraceParser(stream, options, state)
+
+def pkk_hash_trace(filename, options, junk):
+    pkk_info(f"Parsing {filename} ...")
+    parser = PKKTraceHasher(pkk_open_trace(filename), options, TraceStateData(), junk)
     parser.parse()
 
-    return parser.call_stack
+    return parser.hashes
+
+
+def pkk_parse_trace(filename, options):
+    # Parsed again from the start, so that the pointer names and the call
+    # hashes are the same as in pkk_hash_trace()
+    parser = PKKTraceParser(pkk_open_trace(filename), options, TraceStateData())
+
+    return parser.calls()
+
+
+def pkk_skip_calls(calls, count):
+    for i in range(count):
+        next(calls)
+
+
+###
+### Diff engine
+###
+# Gaps between anchors with fewer than this many pairs of calls
+# are diffed call by call with difflib
+PKK_FINE_DIFF_LIMIT = 1024*1024
+
+
+def pkk_find_anchors(hashes1, lo1, hi1, hashes2, lo2, hi2, junk):
+    # Calls that occur exactly once in both ranges, as in patience diff. If
+    # there are none, the calls that occur the same, smallest number of times
+    # in both ranges, paired in order of occurrence, so that traces that
+    # repeat the same frame over and over still have anchors.
+    counts1 = collections.Counter(hashes1[lo1:hi1])
+    counts2 = collections.Counter(hashes2[lo2:hi2])
+    count = None
+    for value, count1 in counts1.items():
+        if counts2.get(value) == count1 and value not in junk:
+            if count is None or count1 < count:
+                count = count1
+                if count == 1:
+                    break
+    if count is None:
+        return [], None
+
+    candidates = set(value for value, count1 in counts1.items()
+                     if count1 == count and counts2.get(value) == count and value not in junk)
+    if count == 1:
+        positions2 = dict(zip(hashes2[lo2:hi2], range(lo2, hi2)))
+        pairs = [(i, positions2[value]) for i, value in enumerate(hashes1[lo1:hi1], lo1) if value in candidates]
+    else:
+        positions2 = {value: collections.deque() for value in candidates}
+        for j, value in enumerate(hashes2[lo2:hi2], lo2):
+            if value in positions2:
+                positions2[value].append(j)
+        pairs = [(i, positions2[value].popleft()) for i, value in enumerate(hashes1[lo1:hi1], lo1) if value in candidates]
+
+    # Usually the anchors are already in the same order in both traces
+    positions = [j for i, j in pairs]
+    if positions == sorted(positions):
+        return pairs, count
+
+    # Otherwise, longest increasing subsequence of the positions
+    # in trace #2, by patience sorting
+    tails = []
+    tail_pairs = []
+    previous = [None] * len(pairs)
+    for index, (i, j) in enumerate(pairs):
+        pile = bisect.bisect_left(tails, j)
+        if pile > 0:
+            previous[index] = tail_pairs[pile - 1]
+        if pile == len(tails):
+            tails.append(j)
+            tail_pairs.append(index)
+        else:
+            tails[pile] = j
+            tail_pairs[pile] = index
+
+    anchors = []
+    index = tail_pairs[-1]
+    while index is not None:
+        anchors.append(pairs[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors, count
+
+
+def pkk_matching_blocks(hashes1, hashes2, junk):
+    blocks = []
+    ranges = [(0, len(hashes1), 0, len(hashes2))]
+    while ranges:
+        lo1, hi1, lo2, hi2 = ranges.pop()
+
+        # Common head and tail
+        start1 = lo1
+        start2 = lo2
+        while lo1 < hi1 and lo2 < hi2 and hashes1[lo1] == hashes2[lo2]:
+            lo1 += 1
+            lo2 += 1
+        if lo1 > start1:
+            blocks.append((start1, start2, lo1 - start1))
+
+        end1 = hi1
+        while lo1 < hi1 and lo2 < hi2 and hashes1[hi1 - 1] == hashes2[hi2 - 1]:
+            hi1 -= 1
+            hi2 -= 1
+        if hi1 < end1:
+            blocks.append((hi1, hi2, end1 - hi1))
+
+        if lo1 == hi1 or lo2 == hi2:
+            continue
+
+        small = (hi1 - lo1) * (hi2 - lo2) <= PKK_FINE_DIFF_LIMIT
+        anchors, count = pkk_find_anchors(hashes1, lo1, hi1, hashes2, lo2, hi2, junk)
+        if anchors and (count == 1 or not small):
+            for i, j in anchors:
+                if lo1 < i or lo2 < j:
+                    ranges.append((lo1, i, lo2, j))
+                    blocks.append((i, j, 1))
+                else:
+                    # Next to the previous anchor
+                    start1, start2, n = blocks.pop()
+                    blocks.append((start1, start2, n + 1))
+                lo1 = i + 1
+                lo2 = j + 1
+            ranges.append((lo1, hi1, lo2, hi2))
+        elif small:
+            sequence = difflib.SequenceMatcher(lambda x : x in junk,
+                hashes1[lo1:hi1], hashes2[lo2:hi2], autojunk=False)
+            for i, j, n in sequence.get_matching_blocks():
+                if n > 0:
+                    blocks.append((lo1 + i, lo2 + j, n))
+        # Otherwise the whole range is shown as replaced
+
+    return sorted(blocks)
+
+
+def pkk_diff_opcodes(hashes1, hashes2, junk):
+    # Same opcodes as difflib.SequenceMatcher.get_opcodes(), but aligns
+    # the traces on anchor calls first, so that only the gaps between
+    # anchors need a fine grained diff
+    blocks = pkk_matching_blocks(hashes1, hashes2, junk)
+    blocks.append((len(hashes1), len(hashes2), 0))
+
+    opcodes = []
+    ncall1 = ncall2 = 0
+    for i, j, n in blocks:
+        if ncall1 < i and ncall2 < j:
+            opcodes.append(("replace", ncall1, i, ncall2, j))
+        elif ncall1 < i:
+            opcodes.append(("delete", ncall1, i, ncall2, j))
+        elif ncall2 < j:
+            opcodes.append(("insert", ncall1, i, ncall2, j))
+        if n > 0:
+            if opcodes and opcodes[-1][0] == "equal":
+                # Merge adjacent blocks
+                tag, start1, end1, start2, end2 = opcodes.pop()
+                opcodes.append(("equal", start1, i + n, start2, j + n))
+            else:
+                opcodes.append(("equal", i, i + n, j, j + n))
+        ncall1 = i + n
+        ncall2 = j + n
+
+    return opcodes
 
 
 def pkk_get_line(data, nline):
@@ -336,16 +515,14 @@ if __name__ == "__main__":
 
     options = optparser.parse_args()
 
-    ### Parse input files
-    stack1 = pkk_parse_trace(options.filename1, options, TraceStateData())
-    stack2 = pkk_parse_trace(options.filename2, options, TraceStateData())
+    ### Parse input files, keeping only the hash of each call
+    junk = set()
+    hashes1 = pkk_hash_trace(options.filename1, options, junk)
+    hashes2 = pkk_hash_trace(options.filename2, options, junk)
 
     ### Perform diffing
     pkk_info("Matching trace sequences ...")
-    sequence = difflib.SequenceMatcher(lambda x : x.is_junk, stack1, stack2, autojunk=False)
-
-    pkk_info("Sequencing diff ...")
-    opcodes = sequence.get_opcodes()
+    opcodes = pkk_diff_opcodes(hashes1, hashes2, junk)
     if len(opcodes) == 1 and opcodes[0][0] == "equal":
         print("The files are identical.")
         sys.exit(0)
@@ -362,6 +539,10 @@ if __name__ == "__main__":
 
         printer = PKKPrettyPrinter(options)
 
+        ### Parse the traces again, in step with the output
+        stack1 = pkk_parse_trace(options.filename1, options)
+        stack2 = pkk_parse_trace(options.filename2, options)
+
         prevtag = ""
         for tag, start1, end1, start2, end2 in opcodes:
             if tag == "equal":
@@ -369,6 +550,8 @@ if __name__ == "__main__":
                 if options.suppress_common:
                     if tag != prevtag:
                         pkk_output(outpipe, "[...]")
+                    pkk_skip_calls(stack1, end1 - start1)
+                    pkk_skip_calls(stack2, end2 - start2)
                     continue
 
                 sep = "|"
@@ -406,9 +589,10 @@ if __name__ == "__main__":
             while True:
                 # Get line data
                 if ncall1 < end1:
-                    if not options.ignore_junk or not stack1[ncall1].is_junk:
+                    call1 = next(stack1)
+                    if not options.ignore_junk or not call1.is_junk:
                         printer.entry_start(show_args)
-                        stack1[ncall1].visit(printer)
+                        call1.visit(printer)
                         data1 = printer.entry_get()
                     else:
                         data1 = []
@@ -418,9 +602,10 @@ if __name__ == "__main__":
                     last1 = True
 
                 if ncall2 < end2:
-                    if not options.ignore_junk or not stack2[ncall2].is_junk:
+                    call2 = next(stack2)
+                    if not options.ignore_junk or not call2.is_junk:
                         printer.entry_start(show_args)
-                        stack2[ncall2].visit(printer)
+                        call2.visit(printer)
                         data2 = printer.entry_get()
                     else:
                         data2 = []
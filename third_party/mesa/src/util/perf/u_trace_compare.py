@@ -25,15 +25,32 @@
 #    --event-start start_render_pass \
 #    --event-end end_render_pass
 #
+# The csv files of each workload and alias are parsed once and cached next
+# to them in a columnar trace_<name>_<alias>.cache.npz, which is rebuilt
+# whenever one of the csv files changes. Pass --no-cache to always parse the
+# csv files. Workloads are parsed by --jobs processes in parallel.
+#
 
 
 import argparse
-from collections import namedtuple
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from typing import Optional
 import os
-import statistics
 import csv
 
+import numpy as np
+
+# Bump when the layout of the cache changes
+CACHE_VERSION = 1
+
+# Separates the params of an event in the cache
+PARAM_SEPARATOR = '\x1f'
+
+# The args needed to parse a workload, which unlike args can be sent to another process
+ParseOptions = namedtuple('ParseOptions', ['results', 'loops_merged', 'event_start', 'event_end', 'cache'])
+
 @dataclass
 class GPUEventAggregate:
     idx: int
@@ -70,6 +87,8 @@ class GPUEventDiff:
     alias_a: str
     alias_b: str
 
+    mean_a: float
+    mean_b: float
     measurements_a: list[int]
     measurements_b: list[int]
 
@@ -97,100 +116,259 @@ class GPUEventDiff:
         return result
 
 
-def parse_with_alias(args, workload_name: str, alias: str) -> list[GPUEventAggregate]:
-    ParsedEvent = namedtuple('ParsedEvent', ['timestamp', 'name', 'params'])
-    events_aggregate: list[GPUEventAggregate] = []
-    loop_idx = 0
-    while True:
-        frames = [[]]
-        last_frame = 0
+def trace_file_name(results: str, workload_name: str, alias: str, loop_idx: int) -> str:
+    return f"{results}/{workload_name}/trace_{workload_name}_{alias}_{loop_idx}.csv"
+
+
+def cache_file_name(results: str, workload_name: str, alias: str) -> str:
+    return f"{results}/{workload_name}/trace_{workload_name}_{alias}.cache.npz"
 
-        file_name = f"{args.results}/{workload_name}/trace_{workload_name}_{alias}_{loop_idx}.csv"
-        try:
-            with open(file_name, 'r') as input_csv:
-                reader = csv.reader(input_csv, delimiter=',', skipinitialspace=True)
-                for row in reader:
-                    if len(row) < 4 or not row[0].isdigit():
-                        continue
-                    frame = int(row[0])
-                    if frame != last_frame:
-                        frames.append([])
-                        last_frame = frame
-                    timestamp = row[2]
-                    event_name = row[3]
-                    params = {}
-                    for param in row[4:]:
-                        try:
-                            key, value = param.split('=', 1)
-                        except ValueError:
-                            break
-                        params[key] = value
-
-                    frames[-1].append(ParsedEvent(timestamp, event_name, params))
 
+def trace_sources(results: str, workload_name: str, alias: str) -> list[tuple[str, int, int]]:
+    """Returns the name, size and modification time of the csv file of every loop."""
+    sources = []
+    while True:
+        file_name = trace_file_name(results, workload_name, alias, len(sources))
+        try:
+            stat = os.stat(file_name)
         except FileNotFoundError:
-            if loop_idx == 0:
-                print(f"\tZero results found for workload '{workload_name}' and alias '{alias}' (\"{file_name}\")")
             break
+        sources.append((os.path.basename(file_name), stat.st_size, stat.st_mtime_ns))
+    return sources
+
+
+def read_trace_columns(results: str, workload_name: str, sources) -> dict[str, np.ndarray]:
+    """Parses the csv files of all loops into columns.
+
+    Event names and params are interned, each row only stores their index
+    in the names and params columns. The rows of loop i are the rows
+    loop_offsets[i] to loop_offsets[i + 1].
+    """
+    frames: list[int] = []
+    timestamps: list[int] = []
+    names: list[int] = []
+    params: list[int] = []
+    loop_offsets = [0]
+    name_index: dict[str, int] = {}
+    params_index: dict[str, int] = {}
+
+    for source_name, _, _ in sources:
+        with open(f"{results}/{workload_name}/{source_name}", 'r') as input_csv:
+            reader = csv.reader(input_csv, delimiter=',', skipinitialspace=True)
+            for row in reader:
+                if len(row) < 4 or not row[0].isdigit():
+                    continue
+                frames.append(int(row[0]))
+                timestamps.append(int(row[2]))
+                names.append(name_index.setdefault(row[3], len(name_index)))
+
+                event_params = []
+                for param in row[4:]:
+                    # Params end with the first one that isn't a key=value pair
+                    if '=' not in param:
+                        break
+                    event_params.append(param)
+                event_params = PARAM_SEPARATOR.join(event_params)
+                params.append(params_index.setdefault(event_params, len(params_index)))
+        loop_offsets.append(len(frames))
+
+    return {
+        'version': np.array(CACHE_VERSION),
+        'source_names': np.array([source[0] for source in sources], dtype=str),
+        'source_sizes': np.array([source[1] for source in sources], dtype=np.int64),
+        'source_mtimes': np.array([source[2] for source in sources], dtype=np.int64),
+        'loop_offsets': np.array(loop_offsets, dtype=np.int64),
+        'frame': np.array(frames, dtype=np.int64),
+        'timestamp': np.array(timestamps, dtype=np.int64),
+        'name': np.array(names, dtype=np.int32),
+        'params': np.array(params, dtype=np.int32),
+        'names': np.array(list(name_index), dtype=str),
+        'param_strings': np.array(list(params_index), dtype=str),
+    }
+
+
+def load_cached_columns(file_name: str, sources) -> Optional[dict[str, np.ndarray]]:
+    """Returns the cached columns, or None if they are missing or out of date."""
+    try:
+        with np.load(file_name, allow_pickle=False) as cache:
+            columns = dict(cache)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if (columns.get('version') != CACHE_VERSION or
+            columns['source_names'].tolist() != [source[0] for source in sources] or
+            columns['source_sizes'].tolist() != [source[1] for source in sources] or
+            columns['source_mtimes'].tolist() != [source[2] for source in sources]):
+        return None
+    return columns
+
+
+def store_cached_columns(file_name: str, columns: dict[str, np.ndarray]) -> None:
+    tmp_file_name = f"{file_name}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file_name, 'wb') as cache:
+            np.savez(cache, **columns)
+        # Atomic, so that a concurrent run never reads a partial cache
+        os.replace(tmp_file_name, file_name)
+    except OSError as ex:
+        print(f"\tCould not cache results in \"{file_name}\": {ex}")
+        if os.path.exists(tmp_file_name):
+            os.remove(tmp_file_name)
+
+
+def load_trace_columns(options: ParseOptions, workload_name: str, alias: str) -> Optional[dict[str, np.ndarray]]:
+    sources = trace_sources(options.results, workload_name, alias)
+    if not sources:
+        return None
+    if not options.cache:
+        return read_trace_columns(options.results, workload_name, sources)
+
+    file_name = cache_file_name(options.results, workload_name, alias)
+    columns = load_cached_columns(file_name, sources)
+    if columns is None:
+        columns = read_trace_columns(options.results, workload_name, sources)
+        store_cached_columns(file_name, columns)
+    return columns
+
+
+def decode_params(params: str) -> dict:
+    if not params:
+        return {}
+    return dict(param.split('=', 1) for param in params.split(PARAM_SEPARATOR))
+
+
+def aggregate_events(options: ParseOptions, workload_name: str, columns) -> list[GPUEventAggregate]:
+    events_aggregate: list[GPUEventAggregate] = []
 
-        if args.loops_merged:
-            del frames[0]
-            # The last frame could be partially lost
-            del frames[-1]
+    names = columns['names'].tolist()
+    start_code = names.index(options.event_start) if options.event_start in names else -1
+    end_code = names.index(options.event_end) if options.event_end in names else -1
+    param_strings = columns['param_strings']
+    loop_offsets = columns['loop_offsets']
+
+    # With merged loops, the frames of the first loop are compared
+    loop_count = 1 if options.loops_merged else len(loop_offsets) - 1
+    for loop_idx in range(loop_count):
+        begin, end = loop_offsets[loop_idx], loop_offsets[loop_idx + 1]
+        frame = columns['frame'][begin:end]
+        name = columns['name'][begin:end]
+
+        # A new frame starts at every change of the frame number, rows
+        # before the first change belong to an initial frame 0
+        frame_changes = frame != np.concatenate(([0], frame[:-1]))
+        segment = np.cumsum(frame_changes)
+        segment_count = int(segment[-1]) + 1 if len(segment) else 1
+
+        is_start = name == start_code
+        is_end = name == end_code
+        rows = is_start | is_end
+        if options.loops_merged:
+            # Skip the initial frame, the last frame could be partially lost
+            rows &= (segment >= 1) & (segment < segment_count - 1)
+
+        # Only the start and end events matter, visited frame by frame from
+        # the last frame
+        rows = np.flatnonzero(rows)
+        rows = rows[np.argsort(-segment[rows], kind='stable')]
 
         event_idx = 0
-        for target_frame in reversed(frames):
-            if args.loops_merged:
-                # We compare frames from a single run
-                event_idx = 0
-
-            start_time_ns = 0
-            new = False
-            for event in target_frame:
-                if event.name == args.event_start:
-                    # Events should be created only once
-                    if event_idx == len(events_aggregate):
-                        agg = GPUEventAggregate(event_idx, [], workload_name, event.name, event.params)
-                        events_aggregate.append(agg)
-                        new = True
-                    start_time_ns = int(event.timestamp)
-                if event.name == args.event_end:
-                    agg = events_aggregate[event_idx]
-                    if new:
-                        agg.description = agg.description | event.params
-                    new = False
-
-                    duration = int(event.timestamp) - start_time_ns
-                    agg.measurements.append(duration)
-
-                    event_idx += 1
-
-        if args.loops_merged:
-            break
+        current_segment = -1
+        start_time_ns = 0
+        new = False
+        for row_segment, row_is_start, row_is_end, timestamp, params in zip(
+                segment[rows].tolist(), is_start[rows].tolist(), is_end[rows].tolist(),
+                columns['timestamp'][begin:end][rows].tolist(), columns['params'][begin:end][rows].tolist()):
+            if row_segment != current_segment:
+                current_segment = row_segment
+                if options.loops_merged:
+                    # We compare frames from a single run
+                    event_idx = 0
+                start_time_ns = 0
+                new = False
+
+            if row_is_start:
+                # Events should be created only once
+                if event_idx == len(events_aggregate):
+                    agg = GPUEventAggregate(event_idx, [], workload_name, options.event_start,
+                                            decode_params(str(param_strings[params])))
+                    events_aggregate.append(agg)
+                    new = True
+                start_time_ns = timestamp
+            if row_is_end:
+                agg = events_aggregate[event_idx]
+                if new:
+                    agg.description = agg.description | decode_params(str(param_strings[params]))
+                new = False
+
+                duration = timestamp - start_time_ns
+                agg.measurements.append(duration)
+
+                event_idx += 1
+
+    return events_aggregate
+
 
-        loop_idx += 1
+def parse_workload(options: ParseOptions, workload_name: str, alias: str) -> list[GPUEventAggregate]:
+    columns = load_trace_columns(options, workload_name, alias)
+    if columns is None:
+        file_name = trace_file_name(options.results, workload_name, alias, 0)
+        print(f"\tZero results found for workload '{workload_name}' and alias '{alias}' (\"{file_name}\")")
+        events_aggregate = []
+    else:
+        events_aggregate = aggregate_events(options, workload_name, columns)
 
     assert (len(events_aggregate) != 0)
+    return events_aggregate
+
 
+def parse_options(args) -> ParseOptions:
+    return ParseOptions(args.results, args.loops_merged, args.event_start, args.event_end, not args.no_cache)
+
+
+def filter_events(args, events_aggregate: list[GPUEventAggregate]) -> list[GPUEventAggregate]:
     if args.filter_func:
         events_aggregate = list(filter(lambda e: args.filter_func(e.description), events_aggregate))
-
     return events_aggregate
 
 
-def parse_all_with_alias(args, alias: str) -> list[GPUEventAggregate]:
-    events_aggregate: list[GPUEventAggregate] = []
-
-    for dir_name in os.listdir(args.results):
-        f = os.path.join(args.results, dir_name)
-        if os.path.isdir(f):
+def parse_with_alias(args, workload_name: str, alias: str) -> list[GPUEventAggregate]:
+    return filter_events(args, parse_workload(parse_options(args), workload_name, alias))
+
+
+def parse_all_with_aliases(args, aliases: list[str]) -> list[list[GPUEventAggregate]]:
+    """Parses all workloads for each alias, in parallel."""
+    workload_names = [dir_name for dir_name in os.listdir(args.results)
+                      if os.path.isdir(os.path.join(args.results, dir_name))]
+    work = [(workload_name, alias) for alias in aliases for workload_name in workload_names]
+
+    options = parse_options(args)
+    if args.jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(work))) as executor:
+            futures = [executor.submit(parse_workload, options, workload_name, alias)
+                       for workload_name, alias in work]
+            results = []
+            for (workload_name, alias), future in zip(work, futures):
+                try:
+                    results.append(future.result())
+                except Exception as ex:
+                    print(f"Invalid csv for '{workload_name}'/'{alias}'")
+                    raise ex
+    else:
+        results = []
+        for workload_name, alias in work:
             try:
-                events_aggregate.extend(parse_with_alias(args, dir_name, alias))
+                results.append(parse_workload(options, workload_name, alias))
             except Exception as ex:
-                print(f"Invalid csv for '{dir_name}'/'{alias}'")
+                print(f"Invalid csv for '{workload_name}'/'{alias}'")
                 raise ex
 
-    return events_aggregate
+    events_per_alias = []
+    for alias_idx in range(len(aliases)):
+        events_aggregate: list[GPUEventAggregate] = []
+        for events in results[alias_idx * len(workload_names):(alias_idx + 1) * len(workload_names)]:
+            events_aggregate.extend(filter_events(args, events))
+        events_per_alias.append(events_aggregate)
+    return events_per_alias
 
 
 def print_diffs_plain(args, diffs: list[GPUEventDiff]) -> None:
@@ -200,22 +378,22 @@ def print_diffs_plain(args, diffs: list[GPUEventDiff]) -> None:
     helped = list(filter(lambda d: d.result_significant and d.mean_diff_pct < -0.5, diffs))
     hurt = list(filter(lambda d: d.result_significant and d.mean_diff_pct > 0.5, diffs))
 
-    helped_total_a = sum(statistics.mean(d.measurements_a) for d in helped)
-    helped_total_b = sum(statistics.mean(d.measurements_b) for d in helped)
+    helped_total_a = sum(d.mean_a for d in helped)
+    helped_total_b = sum(d.mean_b for d in helped)
     if helped_total_a > 0:
         win_in_helped_pct = (helped_total_b - helped_total_a) / helped_total_a * 100.0
     else:
         win_in_helped_pct = 0
 
-    hurt_total_a = sum(statistics.mean(d.measurements_a) for d in hurt)
-    hurt_total_b = sum(statistics.mean(d.measurements_b) for d in hurt)
+    hurt_total_a = sum(d.mean_a for d in hurt)
+    hurt_total_b = sum(d.mean_b for d in hurt)
     if hurt_total_a > 0:
         loss_in_hurt_pct = (hurt_total_b - hurt_total_a) / hurt_total_a * 100.0
     else:
         loss_in_hurt_pct = 0
 
-    total_a = sum(statistics.mean(d.measurements_a) for d in diffs)
-    total_b = sum(statistics.mean(d.measurements_b) for d in diffs)
+    total_a = sum(d.mean_a for d in diffs)
+    total_b = sum(d.mean_b for d in diffs)
     total_win_pct = (total_b - total_a) / total_a * 100.0
 
     print("ALL:")
@@ -261,8 +439,8 @@ def print_diffs_csv(args, diffs: list[GPUEventDiff]) -> None:
         csv_writer = csv.writer(csvfile, delimiter='\t', dialect='unix')
         csv_writer.writerow(field_names)
         for diff in diffs:
-            mean_a = int(statistics.mean(diff.measurements_a))
-            mean_b = int(statistics.mean(diff.measurements_b))
+            mean_a = int(diff.mean_a)
+            mean_b = int(diff.mean_b)
             row = [diff.workload_name, diff.event_idx, diff.event_name, mean_a, mean_b,
                    int(diff.mean_diff), diff.ks_statistic, round(diff.pvalue, 4)]
             # Add description_a values
@@ -277,32 +455,59 @@ def print_diffs_csv(args, diffs: list[GPUEventDiff]) -> None:
             csv_writer.writerow(row)
 
 
-def compare(args) -> None:
+def compare_measurements(events_a: list[GPUEventAggregate], events_b: list[GPUEventAggregate]):
+    """Returns the means of the measurements of a and b and their KS statistic and p-value, for all events.
+
+    Events with the same number of measurements are stacked into matrices,
+    so that each batch is handled by a single call.
+    """
     from scipy.stats import ks_2samp
 
-    events_a = parse_all_with_alias(args, args.alias_a)
-    events_b = parse_all_with_alias(args, args.alias_b)
+    count = len(events_a)
+    mean_a = np.empty(count)
+    mean_b = np.empty(count)
+    ks_statistic = np.empty(count)
+    pvalue = np.empty(count)
 
-    assert (len(events_a) == len(events_b))
+    batches = defaultdict(list)
+    for i, (event_a, event_b) in enumerate(zip(events_a, events_b)):
+        batches[(len(event_a.measurements), len(event_b.measurements))].append(i)
 
-    diffs: list[GPUEventDiff] = []
-    for event_a, event_b in zip(events_a, events_b):
-        # GPU cannot randomly become much faster, only slower, so as
-        # a trivial way to combat uncertainty - remove only the longest measurement.
-        # DISABLED for now since it makes more difficult to find renderpass
-        # event_a.measurements.remove(max(event_a.measurements))
-        # event_b.measurements.remove(max(event_b.measurements))
+    for batch in batches.values():
+        measurements_a = np.array([events_a[i].measurements for i in batch], dtype=np.float64)
+        measurements_b = np.array([events_b[i].measurements for i in batch], dtype=np.float64)
 
-        mean_a = statistics.mean(event_a.measurements)
-        mean_b = statistics.mean(event_b.measurements)
+        mean_a[batch] = measurements_a.mean(axis=1)
+        mean_b[batch] = measurements_b.mean(axis=1)
 
         # We don't expect enough measurements to apply statistical methods
         # suitable for normal distributions.
         # Kolmogorov–Smirnov test gives us a simple metric to understand
         # whether measurements belong to different distributions,
         # if yes - we could meaningfully compare them.
-        ks_stats = ks_2samp(event_a.measurements, event_b.measurements)
+        ks_stats = ks_2samp(measurements_a, measurements_b, axis=1)
+        ks_statistic[batch] = ks_stats.statistic
+        pvalue[batch] = ks_stats.pvalue
+
+    return mean_a.tolist(), mean_b.tolist(), ks_statistic.tolist(), pvalue.tolist()
+
+
+def compare(args) -> None:
+    events_a, events_b = parse_all_with_aliases(args, [args.alias_a, args.alias_b])
 
+    assert (len(events_a) == len(events_b))
+
+    # GPU cannot randomly become much faster, only slower, so as
+    # a trivial way to combat uncertainty - remove only the longest measurement.
+    # DISABLED for now since it makes more difficult to find renderpass
+    # event_a.measurements.remove(max(event_a.measurements))
+    # event_b.measurements.remove(max(event_b.measurements))
+
+    means_a, means_b, ks_statistics, pvalues = compare_measurements(events_a, events_b)
+
+    diffs: list[GPUEventDiff] = []
+    for event_a, event_b, mean_a, mean_b, ks_statistic, pvalue in zip(
+            events_a, events_b, means_a, means_b, ks_statistics, pvalues):
         diff = GPUEventDiff(
             event_idx=event_a.idx,
             mean_diff=mean_b - mean_a,
@@ -315,10 +520,12 @@ def compare(args) -> None:
             description_diff_b=dict(),
             alias_a=args.alias_a,
             alias_b=args.alias_b,
-            ks_statistic=ks_stats.statistic,
-            pvalue=ks_stats.pvalue,
+            ks_statistic=ks_statistic,
+            pvalue=pvalue,
             # TODO: This threshold is a random guess, is it good enough?
-            result_significant=ks_stats.pvalue < 0.10 and ks_stats.statistic > 0.8,
+            result_significant=pvalue < 0.10 and ks_statistic > 0.8,
+            mean_a=mean_a,
+            mean_b=mean_b,
             measurements_a=event_a.measurements,
             measurements_b=event_b.measurements,
         )
@@ -353,6 +560,9 @@ def main() -> None:
     compare_args.add_argument('--event-end', type=str, required=True, help="E.g. end_render_pass")
     compare_args.add_argument('--csv', type=str, required=False, help="CSV file to write the output.")
     compare_args.add_argument('--filter', type=str, required=False, help="Lambda function for filtering events.")
+    compare_args.add_argument('--jobs', type=int, default=os.cpu_count(),
+                              help="Number of processes parsing workloads in parallel.")
+    compare_args.add_argument('--no-cache', action='store_true', help="Always parse the csv files.")
     compare_args.set_defaults(func=compare)
 
     info_args = sub.add_parser('details', help='Get info about tracepoints in a specific results log.')
@@ -361,6 +571,7 @@ def main() -> None:
     info_args.add_argument('--alias', type=str, required=True, help="")
     info_args.add_argument('--event-start', type=str, required=True, help="E.g. start_render_pass")
     info_args.add_argument('--event-end', type=str, required=True, help="E.g. end_render_pass")
+    info_args.add_argument('--no-cache', action='store_true', help="Always parse the csv files.")
     info_args.set_defaults(func=details)
 
     args = parser.parse_args()
@@ -28,8 +28,6 @@
 
 int main(int argc, char** argv)
 {
-    Pm4InfoInit();
-
     // Handle args
     if ((argc != 2) && (argc != 3))
     {
@@ -25,6 +25,7 @@
 #include <iostream>
 #include <string>
 
+#include "dive_core/data_core.h"
 #include "dive_core/gfxr_vulkan_command_hierarchy.h"
 #include "gfxr_vulkan_command_arguments_filter_proxy_model.h"
 #include "gfxr_vulkan_command_filter_proxy_model.h"
@@ -36,10 +37,10 @@
 // GfxrVulkanCommandArgumentsTabView
 // =================================================================================================
 GfxrVulkanCommandArgumentsTabView::GfxrVulkanCommandArgumentsTabView(
-    const Dive::CommandHierarchy& vulkan_command_hierarchy,
-    GfxrVulkanCommandArgumentsFilterProxyModel* proxy_model,
+    Dive::DataCore& data_core, GfxrVulkanCommandArgumentsFilterProxyModel* proxy_model,
     GfxrVulkanCommandModel* command_hierarchy_model, QWidget* parent)
-    : m_vulkan_command_hierarchy(vulkan_command_hierarchy),
+    : m_data_core(data_core),
+      m_vulkan_command_hierarchy(data_core.GetCommandHierarchy()),
       m_arg_proxy_model(proxy_model),
       m_command_hierarchy_model(command_hierarchy_model)
 {
@@ -116,6 +117,18 @@ void GfxrVulkanCommandArgumentsTabView::OnSelectionChanged(const QModelIndex& in
         }
     }
 
+    // The arg nodes of a vulkan command are only created once it is selected
+    uint64_t num_arg_nodes = m_data_core.CreateGfxrCommandArgNodes(
+        source_index.internalId(), [&](uint64_t first_child_index, uint64_t num_children) {
+            m_command_hierarchy_model->BeginInsertRows(
+                source_index, static_cast<int>(first_child_index),
+                static_cast<int>(first_child_index + num_children - 1));
+        });
+    if (num_arg_nodes != 0)
+    {
+        m_command_hierarchy_model->EndInsertRows();
+    }
+
     // Always use the source_index, regardless of whether a proxy was involved.
     m_arg_proxy_model->SetTargetParentSourceIndex(source_index);
 
@@ -30,6 +30,7 @@ class GfxrVulkanCommandModel;
 namespace Dive
 {
 class CommandHierarchy;
+class DataCore;
 class Topology;
 };  // namespace Dive
 
@@ -39,7 +40,7 @@ class GfxrVulkanCommandArgumentsTabView : public QFrame
     Q_OBJECT
 
  public:
-    GfxrVulkanCommandArgumentsTabView(const Dive::CommandHierarchy& vulkan_command_hierarchy,
+    GfxrVulkanCommandArgumentsTabView(Dive::DataCore& data_core,
                                       GfxrVulkanCommandArgumentsFilterProxyModel* proxy_model,
                                       GfxrVulkanCommandModel* command_hierarchy_model,
                                       QWidget* parent = nullptr);
@@ -65,6 +66,7 @@ class GfxrVulkanCommandArgumentsTabView : public QFrame
     QPushButton* m_search_trigger_button;
     SearchBar* m_search_bar = nullptr;
 
+    Dive::DataCore& m_data_core;
     const Dive::CommandHierarchy& m_vulkan_command_hierarchy;
     GfxrVulkanCommandArgumentsFilterProxyModel* m_arg_proxy_model;
     GfxrVulkanCommandModel* m_command_hierarchy_model;
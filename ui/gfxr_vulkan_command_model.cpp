@@ -53,6 +53,15 @@ void GfxrVulkanCommandModel::BeginResetModel() { emit beginResetModel(); }
 //--------------------------------------------------------------------------------------------------
 void GfxrVulkanCommandModel::EndResetModel() { emit endResetModel(); }
 
+//--------------------------------------------------------------------------------------------------
+void GfxrVulkanCommandModel::BeginInsertRows(const QModelIndex& parent, int first, int last)
+{
+    beginInsertRows(parent, first, last);
+}
+
+//--------------------------------------------------------------------------------------------------
+void GfxrVulkanCommandModel::EndInsertRows() { endInsertRows(); }
+
 //--------------------------------------------------------------------------------------------------
 void GfxrVulkanCommandModel::SetTopologyToView(const Dive::Topology* topology_ptr)
 {
@@ -38,6 +38,8 @@ class GfxrVulkanCommandModel : public QAbstractItemModel
     void Reset();
     void BeginResetModel();
     void EndResetModel();
+    void BeginInsertRows(const QModelIndex& parent, int first, int last);
+    void EndInsertRows();
     void SetTopologyToView(const Dive::Topology* topology_ptr);
 
     QVariant data(const QModelIndex& index, int role) const override;
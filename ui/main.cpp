@@ -208,9 +208,6 @@ int DiveGuiMain(int argc, char** argv)
     splash_screen->setPixmap(QPixmap(":/images/dive.png"));
     splash_screen->show();
 
-    // Initialize packet info query data structures needed for parsing
-    Pm4InfoInit();
-
     QScopedPointer<MainWindow> main_window{new MainWindow(app->GetController())};
 
     if (auto scenario = absl::GetFlag(FLAGS_test_scenario); !scenario.empty())
@@ -456,7 +456,7 @@ MainWindow::MainWindow(ApplicationController& controller) : m_controller(control
 
         m_perf_counter_tab_view = new PerfCounterTabView(*m_perf_counter_model, this);
         m_gfxr_vulkan_command_arguments_tab_view = new GfxrVulkanCommandArgumentsTabView(
-            m_data_core->GetCommandHierarchy(), m_gfxr_vulkan_commands_arguments_filter_proxy_model,
+            *m_data_core, m_gfxr_vulkan_commands_arguments_filter_proxy_model,
             m_gfxr_vulkan_command_hierarchy_model);
         m_gpu_timing_tab_view =
             new GpuTimingTabView(*m_gpu_timing_model, m_data_core->GetCommandHierarchy(), this);